@@ -24,11 +24,19 @@ st.set_page_config(
 # ── Imports de capas ─────────────────────────────────────────
 from components.theme import apply_theme, get_colors
 from components.cards import role_badge
+from components.assets import logo_html
+from components.perfil_importes import modo_perfil, panel_importes
 from ms_data.sheets import (
     _autenticar, _rol_actual, puede, invalidar_cache,
     cargar_plantas, cargar_plantas_config, cargar_tecnicos,
     cargar_asignaciones, cargar_fallas, cargar_mediciones, cargar_usuarios,
 )
+from ms_data.contadores import construir_contadores, contadores_fallas
+from ms_data.foto_strings import construir_foto
+from ms_data.particiones import construir_particiones
+from ms_data.trazas import trazado
+from ms_data.permisos import fijar_acceso, olvidar_acceso, acotar
+from ms_data.carga import CargaProgresiva
 
 # ── Aplicar tema (CSS dinámico) ───────────────────────────────
 apply_theme()
@@ -52,32 +60,85 @@ for k, v in _defaults.items():
 # ══════════════════════════════════════════════════════════════
 # CARGA DE DATOS
 # ══════════════════════════════════════════════════════════════
+TAREAS_CARGA = {
+    'df_plantas':      cargar_plantas,
+    'df_usuarios':     cargar_usuarios,
+    'df_config':       cargar_plantas_config,
+    'df_tecnicos':     cargar_tecnicos,
+    'df_asignaciones': cargar_asignaciones,
+    'df_fallas':       cargar_fallas,
+    'df_mediciones':   cargar_mediciones,
+}
+# La estructura (sidebar, navegación) se dibuja apenas llegan estas dos
+TABLAS_CRITICAS = ('df_plantas', 'df_usuarios')
+NOMBRES_TABLA = {'df_plantas': 'Plantas', 'df_usuarios': 'Usuarios', 'df_config': 'Config',
+                 'df_tecnicos': 'Técnicos', 'df_asignaciones': 'Asignaciones',
+                 'df_fallas': 'Fallas', 'df_mediciones': 'Mediciones'}
+# Alcance por planta (ms_data/permisos.py): las vistas solo reciben estas filas
+COL_PLANTA = {'df_plantas': 'ID', 'df_config': 'Planta_ID', 'df_asignaciones': 'Planta_ID',
+              'df_fallas': 'Planta_ID', 'df_mediciones': 'Planta_ID'}
+
+
+@trazado('app.cargar_datos')
 def _cargar_datos(limpiar_cache=False):
-    """Carga todas las hojas en paralelo — reduce tiempo de ~10s a ~2s."""
-    import concurrent.futures
+    """
+    Lanza la carga progresiva de todas las hojas (ms_data/carga.py) y espera
+    solo las críticas; el resto se aplica en reruns posteriores. Con
+    limpiar_cache (Sincronizar) se conservan los datos actuales hasta que
+    llegue cada tabla nueva; en un login nuevo se parte de tablas vacías.
+    """
     if limpiar_cache:
         invalidar_cache()
+    else:
+        for key in TAREAS_CARGA:
+            st.session_state[key] = pd.DataFrame()
+        _reconstruir_derivados(('df_fallas', 'df_mediciones'))
+
+    carga = CargaProgresiva(TAREAS_CARGA, prioritarias=TABLAS_CRITICAS)
+    st.session_state._carga = carga
+    carga.esperar(TABLAS_CRITICAS, timeout=30)
+    _aplicar_carga()
+    st.session_state.datos_cargados = True
 
-    tareas = {
-        'df_plantas':      cargar_plantas,
-        'df_config':       cargar_plantas_config,
-        'df_tecnicos':     cargar_tecnicos,
-        'df_asignaciones': cargar_asignaciones,
-        'df_fallas':       cargar_fallas,
-        'df_mediciones':   cargar_mediciones,
-        'df_usuarios':     cargar_usuarios,
-    }
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=7) as executor:
-        futuros = {key: executor.submit(fn) for key, fn in tareas.items()}
-        for key, futuro in futuros.items():
-            try:
-                st.session_state[key] = futuro.result(timeout=30)
-            except Exception:
-                import pandas as pd
-                st.session_state[key] = pd.DataFrame()
 
-    st.session_state.datos_cargados = True
+def _reconstruir_derivados(claves):
+    if 'df_fallas' in claves:
+        construir_contadores(st.session_state.df_fallas)
+    if 'df_mediciones' in claves:
+        construir_foto(st.session_state.df_mediciones)
+    if 'df_fallas' in claves or 'df_mediciones' in claves:
+        construir_particiones(st.session_state.df_fallas, st.session_state.df_mediciones)
+    # Versión de datos: invalida los modelos de vista por planta (vistas/planta/modelo.py)
+    st.session_state.version_datos = st.session_state.get('version_datos', 0) + 1
+
+
+def _aplicar_carga() -> bool:
+    """Pasa a session_state las tablas llegadas desde el último rerun."""
+    carga = st.session_state.get('_carga')
+    listos = carga.recoger() if carga is not None else {}
+    for key, df in listos.items():
+        st.session_state[key] = acotar(df, col=COL_PLANTA[key]) if key in COL_PLANTA else df
+    if listos:
+        _reconstruir_derivados(listos)
+    return bool(listos)
+
+
+@st.fragment(run_every=1)
+def _estado_carga():
+    """Estado por tabla mientras haya cargas en curso; al llegar una, rerun completo."""
+    carga = st.session_state.get('_carga')
+    if carga is None:
+        return
+    if carga.hay_listos():
+        st.rerun()
+    iconos = {'cargando': '⏳', 'reintentando': '🔁', 'fallida': '❌', 'lista': '✅'}
+    filas = []
+    for key, e in carga.resumen().items():
+        detalle = f" · {e['ms']} ms" if e['ms'] is not None else ''
+        if e['estado'] == 'reintentando':
+            detalle = f" · intento {e['intentos'] + 1}"
+        filas.append(f"{iconos.get(e['estado'], '·')} {NOMBRES_TABLA.get(key, key)}{detalle}")
+    st.caption("  \n".join(filas))
 
 
 # ══════════════════════════════════════════════════════════════
@@ -85,6 +146,7 @@ def _cargar_datos(limpiar_cache=False):
 # ══════════════════════════════════════════════════════════════
 def _pagina_login():
     c = get_colors()
+    logo = logo_html(96, 10, '0 4px 16px rgba(0,0,0,0.18)')
     st.markdown(f"""
     <style>
     .login-wrap {{
@@ -103,10 +165,7 @@ def _pagina_login():
     </style>
     <div class="login-wrap">
       <div class="login-logo">
-        <img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAasAAAGrCAYAAAB+EbhtAAEAAElEQVR4nOz917MsV5beCf62cBHq6HMVNBIJkUAKpC6ZpSiarG52kdUcm27rfpgx639jnud9nsbYRiNpZJMzVcUqlphiMStFZaVCSiREQiZwcfXRocPd995rHrZ7RJxzL1JUJZAQscyAc0+ckO4e+9trrW99H6xiFatYxSpWsYpVrGIVq1jFKlaxilWsYhWrWMUqVrGKVaxiFatYxSpWsYpVrGIVq1jFKlaxilWsYhWrWMUqVrGKVaxiFatYxSpWsYpVrGIVq1jFKlaxilWsYhWrWMUqVrGKVbynQ/2i38AqVvFOi1uHE/EIWsAjqCDxp3gCEJxDdPy7aIVBIRoMGqVAqfi1UkAQQYkiIBAEUeC9nz9vQGOUQpRCA14Em2iUUiilMEajtUFrhdbx9q12vvreruJ9F6uLfhXv+Tjsl+KcwzlHCIGiKBARQggROLwnhBD/UxpEIQo0CrRCCWCIP7VglAat6r/H35XRaCLAWGvR9WsHQAWFkzAHveZ9hBDwEiBEMBMfCMT3Iiqg1AKg4n8GpRRJksxfx1pLmqYkSUKSJGznevWdXsV7MlYX9ireE3GrH6QsIiD1+328BJwvqaoK59wckEQEEQFYAoHToGBNCjAHJaOZgxFaSIwFDVoplNYYrVEm3l8pNQctAFFAUHgJNRgJWusIki7ggocguOARH8HLI/P32QBqCAEJan57/AwRErW2GGMwxqC1ppO1I4hlCVmWkWUJearY6qjV930V79pYXbyreNdFA0yjyZTxaMJoOmE6LSjLMmYtogji5ot6BKO4qGvNPDPRWqO1mi/yxsTMxWiNFtDKoDQ1kEWQoc54ICw9R3yeOejV71PVYNKATggg4lHKRFBaBiE8wYOTgKiYkRECLgSob4+ZGYTKUXkhOEfpAuI8HjUvSwYPqFB/JkVmE/JWSjvPSLOEtU6bLE/otHLOr9vVGrCKd0WsLtRVvKPjaOxlMpkxGI4YDEaMJzMG4wmu8pTO46qARyHoeTZjjAVkDh7GGKzVGJOg6/qc0jG7ajKqCDix9JenKUoCWts5SGmj5iAVwU5OZ2YmPpcWTpXtmgghEDwIHu8EJ2Ep01OI+PqnMCnLutel6zKh1D2v+Dl9A8jO40KIP72ACEGEaeUWWVmowDuUBmsEqxVKPHme0e20WOu26bZbdDodOt02eWrY7qardWEV77hYXZSreMfFj26cyHg04bg/YDAYMJrMKEtHWVS4IFiT4lEgsUyntKmBJV7O1lpi5mPqjKoGGzSqzqwgzAHK6gRt64xKa4wENMtZE7HMhjqVaUEEvdNlxKY8FzDK1mVAIYial/mUUnV5T06V9URqEBONF8F7wXuPcy6WCV0Er+Bi9oVoZOl+3gvOe6rg43FRCkLsyTWgJQSMitmeBIcSj1KKPE/pdru08oTtjQ6tLKXX69HptDi33lqtE6v4hcfqIlzFLzRuDoIMx1NOTk44PDphOBxxMhjFHo/ERR3RLBMMtI4Zi8LMF+UITDFtMqkiZlaRnRfBCgwGCFht5iBjjMLq5FTPKdUGqxZlQQClpAYzNQclvdTvasAKAsYoJFIJ5yxAL8wzJO99DRbqVG8KNAHBBUXlF4QQCQqPgI8gJi5mk8FTlxKpszQIRHLGWfKIiMTSIuCcmx//pn/X/EQFEgPWalpZTruTs97rsr25ztbmBr2OZitf9b5W8fbH6qJbxdsel2+NZDCcsndwzOHxCYPRhFlR4VzAByHLWnFxlgg+DSBYvSj1Nbef+o8IQloHRIONaRVGyaIvpSJwKVWz/M70nqzWmBrgEm0WZUKzlGk1Jca6RHiWoBFrgTJ/nxJYKvfFx87LdE5OMxJRYDSV8/gqZlQNGMXyIYgTAurUczrvCS4SNZSKoBjCcr8s4BtShlZIjVwiEsuoS8STqioAQRNB2hpFnljaeUKeWO65+wJr7TabG10ubierNWQVb0usLrRVvOWxP3DSHwy5ubfPzb0j+icDZoVnPCuoXEApjbGRfq1VCiyyqGUgaDKn0/2iBWjpOuNJUoUyEYxEgXi3ADxjIrX8VNkuglNmE4xVCGUs/Sl9KmtqMrSmL7UoE56+n69zmEXWwqlSX1VV82Mj4fav4Hg6wUkkVvh55lX3vQR8FfASs6rm8QEhOIk9LlEEpRd0/CVGYfCxTCr17JeIEJbKkR5BKUMQib2xqsQHh5IQQV8D4lhrt9jeWGdne5PtzU3WN3rccz5brSereMtidXGt4i2Ja0cie4cH7N3ap9/vM5pMGQ0nDMYTgqglgMoiVdzoWMbysVzXlPW0XoAREMtUpwgOS30japaelvkwbfMwrTWJiRRvEZmDi4gQxM3vY4zC2IDSHq1sLB/qCGLNY4yJZUirNMrGkiFGY5VGtCJN8lPltSb7iaW+MCdUhMC8J3W6XOfrXlS8zblFSc8HwZgE5xxlER8HkQUoopCgcG5B1ljOrJr35F38GbOvML9PQ4cPmHmPLYgDH9+3QjBKqIpZZEUKWK1o5y3W1rpsrW/Q7WTcffc5NtbabK2tZr5W8fOL1cW0ip9bvHbzWA6PhrxxY8Dx8ZiTkxNms1lcdGvCgtEJNovZk4jEvhN1BiSR8ZbZbE43b/pGDSCJeJLELhEbFpkWxAtaKVX3n2KPqim9zbM0EwEnsdm8PLjInISsZREqoKGs21PlRmvtXHFClDqlQBGoX1dOlyzn4FWzAQU/J0icmp1SAV8WkcoeAs45qtJT1j0skficcU6rns86BUrxmC6DVRPNcZrNZvH2+m8RROuSoShcMAQx9XO6qLwhUcEDIEttPKeVw7kKqR9vtcHqwMULu/Q6GZvrG5w7t8OjD3ZX68wq/t6xuohW8feKKweVHBwccf3mLW7cuMX+0Yj+xFFWETTa7Rxr0/nO3Vo779k0sZyxGKUhuAX5wdr5LFQDWos+E/N+0jxEkaedU6SL5cxMRDC2YQ6q+XtpFnsnnsqXeF9RVdV8qLjJbqrgGQwGc6BZKE9EIgUoiplfIoNQ/7sGVBVI03SJUm/n6hMROCFPk5jhmeZnvJ8yCVprxuNx/fgFA9KLx/tACJ4QBJZKgCEE1By4wpzgoZbLk3U2J2i82AhWPpwB07qU6NypHuE8M/MBJZ7ZZExiDVliWF/vcP7cLud2Ntjd3eTR+3urNWcVf6dYXTir+JniYCQSBG7tj7n8xnWuXtvn4OiY0XiGq6JcUd5ZixTrEIiNeo2xOqoqGEsIix5SHKIN80VXE9DGo3VYAFj9XwSrmM2cerxeAr5g0KqFSFxMm8xJRKhqGvd4MqMoCqbTgslkwng2ZTqdMqsHiwejMc45iiL+XlUVrgqUriKEgLV2TkoIsphvIoCIimVMzHz+qlnUIWY3TelumWm4nIVlaUJiNWmSk+UJaZaR5zlZlpEkCefOnSNJEvI8J82zWnZJkyQZxgrOVWjlTwG0hIXEk9bUYLVcAvR1BqVwHlwAJYIXWXqeyM5sqPfLBI5lUDMoEI8rZpTVDCWBNDOc293knrsucOncJttb62xtdtnqrpiFq/jpYnWhrOKnjpeuj+TW3jGvvX6Dm7eOuHnzhFkZMDZDmQxVyxOJErIsZgMhBBSRCq0EfHBkNlnKihoiA1hl0SaAKqIwbOSdz1l9qqaWxyxDx57SGYYgWIJLKArHZDJhMBoxGU44HvQ5OTlhOB4xHIyZlQXT8YyiKucZky8cpQ9olc5JCbGEGF8jLPefFIBGaECnJn+IRotaAqJmoW+I44FToU7/rqQG7LOfy0RihDGGNE1J05RWq0Wr1aLdbtFd67G2tkannbKzu0mSKFq13FKSJGgU0oCTOAiLHhlLQNb08xa/x88SYEHyqG/3c5A6C1qq7rlVGB1JLOVsRPAV7TxBhYp77rrAA/ffzfmdbdY3uqz1MrbaK+BaxZvH6uJYxY+Nq/1CDg9OuHL1Fi+9eoVr1/eZFgHICDpFqQytU0SZev5JsKYCXCxfJbpeKAVrNEliIptOxzKUUoKpy2Vx3kkQ4xeCscpE7T1tsTZFq5gtNUPB3gtFUTAcjjk+PmY4GnOwP2AyLRkOhwwnY6pZxazJkIKnKCqCAh0UDRlPVAQaAEWCXuo5idLz4yE1cIli3m+LsbiPEs4AKKeyv6YcF//tl26rwUoiVaS5X1NubML7pTkpvRC0TRKDNoF2ntDupGyur7GxscH6+jobvTV6a11arRZ5noI0vS4/LweiBC2Byk3RDfW+VuFohpi996D1PMuKDMUlKr4IZViUeTWxDyfO4V1JcBVZYihmE4wKnNvZ5v777uO+u+/i0l3bPLC7AqxV3DlWF8YqboujUuRkJNy8eZNXXr3Myy+9xs1bBwQseWsNLwbBICYFZSPdXC/KdKlxEGYLQoMASCxtpelcNcFqU4OUXuotCV6BTqKauLUpCoP3QuUCznmOjk4YjwqOT/qcnAwYDEZMJpNYyisdZRV7TIWrlkpuZrHc60UmBMu5TsyKGnU/JRo59Q3RS5BBVGgHlu+k1FwRkPj1ah4RThE+4j38qePe9JGMsvHVaosSXYvbzt+F1ohaCOMuvzbKo5VgVTjVF0uzhE6rTZpa1jd6rK/3OL+zy+bmJu12G2Nr1Xgc4mcI1RyMqKWstIo9stF0Mn+/AEEW5cYAFKJxQfCViyXfGhQRjwpCVZRoBY0qoYRAJ8+4++67ueeuczz6wO6KlLGK22J1QaxiHnsjkVt7fS5f6fPyj97gtddeYzwtMCYBZRCl0TZBiBTtKPvQgFSzoIHFk9SDuHF2qul1xBJTauJi3BAmmnmmhhSRtXuUVcyYxuMpg+GI4+M+J8cjxuMJx/0hZRmYTgqKosT5pdITgjIBUQsRW9GqprHHkpb3NRPvtqs/8vkSFct2qrYKuU3lAWJGJkvZ1FJCEG8N8+eLcRq8lp9ruRQoQWHqbKaZE2t+NjfGLEjNn+0UTR5PqlNCcKdo8UoLmU1Ikngc8jyl3WrRauW0Wi3W19fZ3d1lc73DxkZOmuh47uqS4DK9vqH/L55/AWxBaSTNcF7mjyEIqvm8IWZgJopfzS1bXFWR5znrnYzNTuCD91/ggQfv4/z5c1zaXmVbq1iB1SqAy0ciJycDXn3lMs88/ypHJ47R2FFVFWnd2Je6ZwPgG+VxFWWFGkUIalWHXBk0C5afPrPWxNvMvHxlajBzzlF5xd7BkOF4xsnJCSfHA0ajCePJrFZWrxBlQCxK6Ugr1xH8RBReHDoVREV9v2aWaHnOqAGWM90jQKMJKBx6GUw4LUcUlrIyAEMsJzaVvqbktwxIcub5TsfyO2ky0dOvMS9JAj5UpxiOqqbOzz+DB12XKAMRLEJ9PNCK2WQciSdLVcwsy1hb69Jrt9jc7LDWabO1vcn6+vo8I2t6ZrMiZlYhOILz+OCWskWYOE9Qi4Fn1dDqfcyiFJqqqlBBSJIEa1O895Rlia8maD+g09Ksd3tcuus8D3/wAe696wIPXloNHb+fY3Xy38dx5UTk1R/d4oUXX+HmrUP6/RFHxxMwHfKsS5ZleIk7X+99PZ8UKeViYr8JLZHNVs87aRSttIX4hclgpKEnc9p6YrMaWAJVVTGptQFPTgaMRwWHJ9M5QaKoYqnMGIMyttYD1PPFL0oHqjn7DhWo/AyMwiodF816sVThNFjdMVRAUcESJJ2+f5jPOjV/W2RA4Q7Z2k8CquVYWIosP//Zfxtj8GdYeIu/a5Rb0PZFhVqbMJYNRYWFWaRezGzNn0MLidFkaUq7ndPtdtlc67G5tcH25gbdbpc8jVYrsXQo+NDQ+0tEhNJFhY4477VQmA8hGlEaHee03BJ1HkAri9UB8TN8NcFVFWmq2VjrsruzyUMfeIBHH36Ahy+tho3fj7E66e/DeOMoyPPPv8IPX36NW7f67B8OGU8K2q012t11KhezlKaMkySRVQZQVDNSa6KTra5Le4a5kgSACqaeETLzeZxo5y6UzlOWjsl4xvHxMUcnfQb9IaPRiMlkRlEJ7dZ6FH71tWOvjiW7EBa9m5jlLQZ1RS/+3Qi1Lks1xfclwII6DqBOleviT6FCLWdKzeP16SFadQqDIuuRZm5LnQWpJZJGUG8CmM3c1xmG4FnAMvqUMsW8vKhity1RWe0+7E+VCJv3b4zBNRJM+Jj5qqg6H+n+SfwMziN4EqNptXPWuh3yluWuC+dpt3K63TadVoa1mgV8BJBqDkLee1xYAtRanQStQKKD8mJTEwG2KKb1JiCgEYKvcOWUXrfN3Zd2ePyxh7jr4g733tVhq7UqEb5fYnWi30fx4uUDuXrtFj986TKvXb7O4fGEJN/AJG28N4Ct+zx+XtqL2nHMB3qTJEGWbNeVAq3q7KpevSsfMDbFGEMIUJWO8WzKYDBiOJqwd+uQ8Swy+GbTkkDNaEvSKCVUxYXLaFC1HqCnlhuSRtVczRXQG3v42FMRUtMhLC2QVjUsP6nnjBa9JE1UdUeFeQ/qrFyf5jQ4NQw+dYbcoKMAx1yf7+yzNNFkZrcxBpdLd2oxe7ZMAIEFWDYIoTDz96+VxPexPPukTwvtOueiA7IxKKswRFV3cZ7KC0a3o4xtzUbUOLQCg6B0dA9rtxI2el3W1zqsrXXZWOvOLUZMqDAqEKiFcpv3Ufcky7KMz1/3ETF63rsqygqddBClqIoSCZ5EK7ybobwnsYFq1ucD99/Fkx95hEceuY/H7lkNGr8fYnWS3wfx+o2pXH7jGs88/yIvvnKZWSGIJOi0jagE7w3WRmZfVRakGbgqsvnSrIUm6s3Fxnx7LsTasPeWBWVFgbEJhasYDsccHR1xdNxnMBjRPxkwGE8iMy8o0LFvZWyCUoYQQlwsa+29ZeUEpRTaRvZgFRYuwAEfF9X5kLDFkOFcXHyB+WAw80FlgIA+U52bExaWmzmACnUmdqrcFubg1QjbUi/QLjRPfEYlngUNfH7bqXms+A4iw29xnwV4LsqE856VUihRePEQIIiPmc7SZxO9NBwswlIadKpb1hBclGrF1wpSkz8CSqr6+DmsBoVHSdRhzBNLr9djY2ONtXabuy9tkyWm7kfZCIQi88+t6/PrZYm4oWLvzyvDaOpJs3acfytLUmtIjKYsxlTFhHamCX6K0RUXz23y2KMP8sTjH+TSpS120lWm9V6N1Yl9D8drJyI/ePplfvDMC+zdOmY6E2IFLGYwOrGR5Sd+sQDqQKrVnOGFsWQ2AW3n2nOxhFPv1M1ixx4zHMX1m7c47g84ODig3x9SliXN+hxEagr3UnmuGahVClEah9zx8zT3WVZmaIgNDTtPswAFtfSY+IDF4+4UTb6ldP0+z9zXsAwsYQFecvp+obYQaTK25b6MiMwFd5ff2/JMV2T4vfl7bRQ5AIIKqFATXUQTVEMkaajyy6+xtAm48+EFFIpk8do1WGkV5huTIA4VhBD8KeDU2qBVYGd7nY21Djs7O2xurkdqvDH17FZAnI+MQpoSoKs3E57KQRUMgfh3EQEfFTYUAZQH74CAq2YEcbRbCRfP7fLEE0/wkSc+wOMXV4D1XozVSX0PxutDkR889zpPf/95rl+7xWjiqEqwNXGiWf9ENTv4pf6TElSQmvkVF61Yfqt7QvXcDjXglM4xmczo9/scHx8zGk/YP+pTlCVFUZzqRUCtzWeSMxnH8tBtBJ5mMV22hm/mnuYL+232GjEzWWgInon50G9NJK+p6ZEgIfXvCxX2+SK/1LvSUpsXLpXdmsW6IVo452Kv7Sy4NVK3eqksWWsKNo7CUtujCAtAOgtozXE8q37RxEIiSZ963DJYNQf7ToQQjZmXOpmXdxsG6CI7bUC42RxoHR2aq2JClid0Wjm9Xo/1jR5bWxtsbW6w1uki3mGsAu8iA9BVNQmn3qwEhfM1gaQR/MUTarkrAG0Wg8hSz9Plec7udpvf+KXHeOKRu3nwwtpqfXsPxepkvofi1onIt59+gR++dpVXXrvK3t4BRmdkaZeqFMCQZ22UiYsKhCh3ZDTGLnpOhAUxoul9NCBlbFrr5lUMB2OO+iecnPQ5PjlhOBzW6hA6KgIuCdTGBbqxYT+tjXfbiqmXS1+LhVpL0z06y5pbAjsAe/sifgocw+mMLP4M88wkliGXSAFLuncLdYp6WFaWBnvDgljhRc6wCRdDwfP3sTRHFZA5ZV0pc5r2fuYzLLKqO3999dn5LzkNWsvH7Q52WvPzEcFpsaGpD96CYDI/f83rRTC2icZ7R6hiuTaxmm63zebGGp1Oh92tTTrdNt12KyrY+2qeYYUQ0EmKC74myoQ5CAbnTzFMm59a69gHc54817QTz7137fDhDz/CJz/2GHdvrjKt90KsTuJ7IK4di1y5OuD5517i2Rde4vL1W2AsRtuY1agUY2KmpLSlqoq5FJIxGm1CDVSRYadVXit3CyaxJDYjIBRFxbQo6B/1GYxHHB4ecXwyYDKZ4L2Pi4rR6Dojg9sZcXdkwcnpjEEbdWaEtvl7LXVUyyQtnms5MwsErSIBZHnutrlvTeU+8wZO/3anpEwWyuWpTWiUKCKAnZZMOtsj0mfeRwRDfebYLH3+M869Dbvw1GcRXR8DfdtzqLNsQ3mT494QNs78SQJ1RrUwpxTxt5U05yVZaTYPEZSjuaNACHU52WO0xlqNNYput81Gb42dnS021tfJskjG0QSCCnhZDCDPPy/MrUq0tjjnotVJUJH0I3HwOE0tezevsLneYWuzy7337PLkEw/zoUfu5Z6dlavxuzlWJ+9dHs++VsnXn3qGp59+kYOjEc4HnASyVo7W9fAlhiyLHlFlWZKkBpM0SubRs0jw0YpDp1jTQqkkKktYg3fCyXDA3t4+R8fHHB+eUHlHWTpK7xZ9CyIlebmJLyKL4dAlKvnphXop65Hmf4vMg7kw7GnViTlhQS31vACnhKDVAiROlcuWQOy2MlpNhw+WxuKjed7F3FXAldWpxy/AaAlc3uTzzd/nGYBe/AxYA9QAGCn6NSAtl0Rro0dEL455fcwabcHbXpM7RzgDeM35jI9bgFUjDzWfi2rGApZ8uQCKKupCJsYumJchkjOQ2H9KjCVvpWz01lhf77GxscHGeo+8nVOUw3my5r1HXONJtsj4AVxZIRLB3zlHVb+uSMBaTVWOCG7M+d0eH378QT7+sUd5+AMX2clWmda7MVYn7V0az70xlOdffIOnn36ZF1++xngaSJIOIlEUVuuFLUfjYQQBZSDNkho4FguksiaqoScpSnK8p5Y7GnN81Ofo5Jh+f8ikmOFmLpbPdFQ/N0oTELwLBImTUNosFCwasJqXr8JZkDhDMgh+UW471VdZ6lnV2UKjfr5QeFB4VYNaTXBoZnYWKFXv2OcludMKEonKkPnAap1N4OuHB6zWLARoI9FimbnovV9a7Buyx3Imped/WzZ+bECxLCZo3FL2FJmTighMITBftKXWOVzgZbToUJw+xmeB6hQxhduzs9PHpO5RLYHVMtGlGf5t/oZK6tubt1TPe4VY1jNK43yF+AgqrVaL9V6H9fV12u2UrXPr2ERhbXyeUC1Kj1pZiqIgSRIIjRlmMndSVtoyq6IfGcFjjUdJCcy4++IOH3rkfj77iY9w6VyPnc4KtN5NsTpZ77K4MRR56dWbfPkrT/H0sy9TOYsybYoKjM1p5R1w0TQQFRcDkdiozvOUdq/NrJjOFxytI6CpWhYpiGY6dozHU46OTjg6Ooq9KFdFgDAajYkyRl5Oadct3GndHUkBTf+roaY3sVzKUiraqS9iGYiWxGcb9fOlxyulaqfepL5vU0gMtWdWDZaNjf0S2w2WsMwvCAxNWa7ZAGijGA9H8TnFzx+7AKJwZjFvBnhZ6v81ZdK6fDb/uFHuqZ3ncwJHfN5ao7DWZ2yyKaX0fHYpfi4F4jHzku7tMVeZXzo6Z0OrJeBZEt6dn58zxI/bXqN2GRb8ElMwql0oHdl93rv5HFfTC7TWkqSKu++5SJ6ndLtd2u32GcNODT7MqwbOuTk7stEtnBQzWu02VRmV97WGdp6SAJqKjzz+EI89fB8fe+IDPHTRrNbAd0msTtS7KL71/IF889vP8Ozzr3I8mDGeebxKQCVom6CMxZWedpIRqshYS1NLlluCCrXzbUGn05nvVE2SYk3UZptMZowmU46OBvQHI06OjpmVFVYbkiyt+0U1ZbwWIZ2XjJqFtQbIUBsdAmcyB+5gPniaABB7SvVC3vT49aJPI9KA1JmMTMeF3KqURbawDFRREaHJMlFhKeNaAJZNoiK4MYYkteRpRquVkWUZNtG0szzKDWkV+zDWRisUZed6e8uMxSj4Gmnazgem02lUka8qZqWjmlVMywJfRvLAeDyF2mbD1zJFrp4z9kJkaWqDVnYOWnEAVyHiicvvaWWOUyB1B5BZ7lsZJRAaC5HTQPWTQikV1Ufmvy/9EmoAq5VETH1NVFWBc7GEl2cJzpV0u122t7fZ3t5mba1LmqbxKUI8h1rr+YyWtfXgeJ3RVsFTVRUhQJrlJEnGdDzDFTOy1OCKIRfPrfPhx+7j4x/+IB/8wHnOr68knN7psTpB74J4/aaXH750ha99/Xs889wrYNqISVHaEkyUrAlN/0QpOkmHMG9QC8YodLKwcE+ShGbOVZmUEGAwGHHr5j6Hh8dMi1nccUtNpW5Ya3WmEMKd1B6WwGEp41jeiS/3OpZ/P70Gxn6ONXFxKlwUPNVJFKutvCNN04Uw7bKckjJRrcLVoq001Oqanq9kvpCnmSVNLWliSBIbm/4bG6z3WuzsdElSaLfb9Hodet0u7XZOnucYo2nnadRI1FErMTIeo818o7e3zLwTYe4F5QNMJpNoYTIrGc+mFJOC4WRMMSmYlYHjwwmzWUW/32fQHzGdTpnMCkbjCaPJDK0tRemoKo+TgDUJ2kbSRqO3GA0qE5SKivTNBkFqEK68B/Q8y3XBgyiMVmgcEhb0fQlqsbkxp5mKp0I15UK9JOy7xH6s/9pkbHrpGlhcO3rezzPG1Irwkfq+ubFBnkdFeaWpPbYqNAsleOfcQmkEG61KQmRYaqLfl5uNMaokUSW7Wy0+9cnH+NyvfooPnF8J5b6TY3Vy3sGxPxJ5/Y1DvvI33+Nr3/w+47GwsX2J0axEaYtYTVAO0Z5ANZcf0lXUd7PaoMyipNWIvSZJBtpQVZ6TkwF7t444PjqhLANohQtRyPX2HssiW4A7ARUsg9VZqvQpdtupHfvpLKuqPEYnKLugejeg5yUCUaMZ2Cy2zRCzVopEAolRJMZijCJNUzrdFpvrXTqdFjvbm3S7Hba2YlO/1crIWxmtNCPNIEk8Wgs2iXYmjW18VIsXimKKNioKwqrFXJdVFsyCCm8wUb0hKHw9N+SDzGWovI+ZUwNkzgW8Ax9SnIPppGAym1KWFUVVMZkVzKYleweHTCczTobR9Xg4HjEaTRgOh0xmFVnepXKhzi7qnp2tyQ61eaVzLoJCDfYu+OhyrMHqsLTZYb4xabyxiqK48wU7BysIStDztLj+cwMidb+vuWqWS6hxyitbGD0SqwO9tS6b62t0uhG88jzFJgbnSnxV0Myvaa3xMxfp/8rEHibLc2uB4CuUlBgqEuNo55p77zrHpz75UT7+0Q9yz8aql/VOjNVJeYfGK7ecPPXN7/ONb/2A69f6oFtAzqQQbJITjEKpQNAO0QVKB7RxKAxacuKXfiHwGstwsUk/mcyYTAv6/SHHRwOGwzFl6UAMWiu0VfhTxoB39m16s8b8XDtviS6+DFRne1anhVsViU6WbOUXKgnWWnRiCVVFFeLfmtcwVpFlGe3UsL2Ws7nWYnd7h416tqe31mV7s0e32yaxmiSxZFlClkRGpNJxiFcpwSYL8sX8naqmTBgis1JLrWgh87/rGqmiFYegJBJPRKRWiBdcIA7CNgSOoGBOVVe4AI13WHxcvD0ocF4ikCcpZekYTyZMJrPo+TUaMhgMGE8cV68eMRzHQe3JbDoHSlcFKh9IkgRXD2sro0Fi6UxcJIgE7+YU+9gvqktuTu54/jhzjMJ8LmvZz+sUbp1+2HJ2JRoJNpJ3JNqheF+hNWR5SpIY1jc6Mdva3CDLFmMEUVlDkanWfIA8qEAQweFx3hPEYa2lnE3RBLSC2XgEQXjoAw/w8Q8/xG/82mM8fLG1WhvfYbE6Ie+wuDYJ8uwzb/D9p1/ge999lqPjKWm6RpqvoVQLlKWoSzSiAyiH0vE/berdJS1CiItd4xkVvDCdxp36/t4xw+GYQX+I90KSZCQ2w/tA6UqUVXPAifGzgdVpJhm3gVWclVnINDWMu/mzigJpnG5jCasopvMGurGxV5TnOb1el7Vej7WNHtubW2ystdjsWbbWWmzvbNFtd9CaaH2hFTYxtLI0vicf+3paonK8rbOPxfBvBDJDzJzmtHsfm/pK1+SS+lg1m4PU2No/itrKI/aaIvAI1sahV+8a+wwW5oUhMHPVKYp/kMi8FAXBg4stpXkZtOmLlWVJUYGXnP6w4ODggKPDY/r9PkcnfY4OTxiMJxRFMXdT9rUTMEbPM++mnDZnHdY9Ra2in1WjDXlb3AZWZ/58G1jVih6NLFUN3EicCTQ1W9W5mt23JJjcamdsrPXY3Nxkrc60tNbgIZEMmn6fdoAQVIUTRxBBqyjmqyX2G7UkVJUDD1YXPPbwJp/65MN85pMf41JvlWW9U2J1It5B8ezVkXz/By/xl3/5NUajOMekbYbSKZUTRCXYJIvurapRAw9oE9WwjQK0ovIKbdJ6VxwXl/7JkMN64ZqMi5oOvgQ2S6oH4bb5oybuBE5Lf5Uf//hl6nNTsom/L4ZNDQrvSnztjRTLb2ATQ6/dotvtsrHeo93O2dreZHt7k43eGnknp9tqk7cN7cSTWLDW1H2RmIXZ2ovLVSVaQ2o1SWKwZvFeQGFNHhdQUUsZl5rPDDXEAK1P6wVqpVAGrDZz+aTImoQq+AhKS8zARkV+TloJAYdHpAIdj0dVNVR4M1fvUErhg9S9nYUSu3eC8yC6ReVVBKO6vDgrSmazkqJ0XL58hf5wxOHhMYfHR4xHU2aVw7uoXi9YnMSysbUpWpulLDCWL+szXR+yMzR5ebPrh/mxWjxsmZcYb7c2nR+fMO+dgamvmbnShYY8z9lYX48l3Y0Nuq0u5awC72IJlgqlApgIcqLBFVUckMdEUkrQSDD4KuCqEWky49x2zsc/+gS/8suf5GMPrnpZ74RYnYR3QOxNRL77/Tf42je+ywsvXebwuCRvraONiWrn1pC3WjjnGIxHdLtriHh0YwmhY8lv3texGmUswcNoNOLo6ITj4z7TyaxeIGP/YdGULudMKq01zJ13T2+Fl3X67hQNWDUlxNt6ViwZKTbv1XucqxalPg0Gj9VClqR0Oi3W1rtsb29y4dwuGxtrbG2ux8wqS8myZD4vpgkYC5GLESncWkfVhCQxZEmKsUTChonzPtpECrvU3k8SFHneieVUlkuoCrOE1c0x1waUxN6V1tGUkPrTRhGHGgBCJMKICM4vVMhDCATUqd+dlCgdQS72lpqsLoKgURYfZF7em894BYUTQFmCqLov5nGVUHqHd1Fzz5iEyaxgMBhxdNyPIwrHcUzheDjhZFxQ+gh+8RyaORhGgk5Wf8Y3A6uGOn8ahBbXkaqvl9vNJmOvcwHei00CtwkLzzc4StNut9ne2mFjc531Xitm0ypWCKQuGTczdwvCSOxlORdwFRhjydMUoytm4z7WVDzy0D187tc+yac/eTc7K++sX2isDv4vOK6diHztGy/zV5//Cpev3CTJ19Gmx2hSghbanRwnJZPpmCQxbG1tMJvFrEOLRqOxpLFfEqKNe6U8kyr6Rx0f9xkORlRVHJhMkkU/KIiLZRUbF9tG4saYdGnGZxFnqctvlmf52/yaTpcBfajm/44LEqRpSp7ntDLDWmbZ3uxx4cIFtrc3Wet1abUyEgtKw1qnjQ8VEkoMscQXgU5hkpgVaK3n9HOj6yxIa5TytLIMpZoMSUhM7IdliY1Ne+9jT6oGdKP0qbJlauNQtVULHyylo6Cr0lJT7xcg1ABJY5VROj+npcdjEI9D6V3MwmZx4xCWwKhhYjoJuMItbOLr2aPlY+1wC8q7BJA60xOLoJnNinrWy+IDOOcZTWacnJxw3J9wMCo47I/Yu3XAyckJ02nczGhla4JFNX+teKLvnElFMGp6V3eIO4GVCjg/xtTnRNcbp4ZwIUEhIaCVmQsiOxdBPktbtNqGu+7ZIm8ltPMOSZKgg4qEER/7Y4nNFuQTGzdgVVUREKxJGZ4UdFoZMEPckEvnuvzyZz/Er/3yR/ngPe3VmvkLitWB/wXG135wU/7yv32NF166ynQKlTf4YFA2R9vYL3E4tA7oJJajvK9q7bUo7GpI0DpFhwhWXgLXD2/RHw/p9/sURRE9noyZ9zaiPUPjIhvAqJriXLP0JI5P3hmsbl+YoqbbQhFBQu0Gu6QQoeYDoHFhiQoXEaTa7ZzNzU22dzbZ6PW4a3edbiej1WrFjEURFy8NUlPXCQ6FRBBSep61RWaergV6DUapSL6whjSzJEkEryQxtLKENLUkNeMvTSLrL2tblIKt/O0v/xxOvFSzCEBRQqiazxNVpad0Fa50tWKD4Kow/3fM0jyiHJU4XOVjqbBWyHchkjxs0iIEKEqPqwKio5JG5QLTyuNUwmBSMBgM6vLxEbf2Djg4OGIymeFj+vYmIrgLYLoNouTNtjdL15pyoIqYGUEkRTih8T5LbEbwnqqMbMamnDfXEdQemznWN7rsbu+yvr5OaltxtqtWvFChtjoJIVYV8LFXSbQoyZINiqLC6IrUVJSzY/Kk5BMff5Rf/5WP86tP3rNaN38BsTrov4C4UYh85WvP8aUvPcUbbxzhXEoIOUgSqbeqROn4BVL1HM8yGKRJVi9OtbGgSinLkkF/yHA84uatw6WFJMyp6000PQUzP/2nSRNNLb9ZABrJn0bY1BiD99GWQVRkVCkTGXQSDEa3CZVHJPYVfKjwVYlNDFlmSBNF3krY2Fjj3Pkdzm1vs7beJU0tWglr3VZtaa5q1l2tttG8jxCb5DGbsli10KhDHFkrDvamqSWzzWBvQqudkaaWtV57TmnfXcvftd+BG7fGUhQlRVExm5ZMp1OKqqRSwqxycyKFSDw2LmhCEHyIA8S+tuQSFTcXcdhYmFazWvU8xH5X6RkMxxwe9OmPRty8ccTxSZ/BMDINXZ2dKW3JkqjKbxuprTqrDCHMr6M5nf7ULFp9jgkYXauONPN9QlTuqCNuqNSd+64qUFUzkiSh1+2yubnJ5uZmTbTRsZflXJyTM3FDJUu9MVGGgKL0Di2xHyzeIWFGninWOin/7Hf/AY8/9iCPXFiVBd/OWB3stzFulSJ7B2P+2xe+zvd+8BKvvXYTq7to02M68ShSemsdfBhhbFj0dmoaM6IQHYEkSZK5XcdwNOH4OJInpmWJhCQSqlUjZROWGHmL5riZE7Oby6DpDZzWemukjZYXF6UaO4xGDaImTaDBxT5AQ2qwiSK1ht5ai41el/MXt2jnGb21dizvGYUxGptEZe5iWpIYS5aYevgW6lFTlBLSxCA+zAkZWZLSarVot7vkqSGxgbyV0Ou262HelCxP2e6+P1QKXr5yJLOyYjwtmEwmzGYl08mMybSiLB02zWM/TRpBXV3Pe9UakkktICsqljLRVD7OfU0Lx9HxkMPjAXv7x5wMBoyGMwajSRx/QNFttedafcC8XNfY2y9T3xeD5q7usVVkxsZrFuYUwmUB40UP9OzpjNdvlmWx11fLMnW7bTY3N9nZ3qLT6UT/q1AR3GL8wdSVBY8QRKik7hUqE/t+vsIqaGeabsvy2U99hF//1Y/z5AMr8sXbFasD/TbGV57Zkz/+07/ihy9dZjINlCWYpEWadFAqQULMJJSOA75z+nLDOLPJvNEeRFEUFYPBgMNav885T0BjTK2N12RTwS9lVgtFbS23gxQqENQyNbnW2JPoR9UoX3sXCLXsjbWm7h04vCtJLSgik6/Tzul0Wmyu9Th3fped7XU6nRaprc328AQXd7VJasiSnFDG8o5RRGq+OJSuSKwisZEckaeadiun3U7ptDLa7RatVossTem2Y69iayVUyt7AS1FUTMYzxtMZxazk4PiEsnRMp1PKplRYA5cLEJSh8rWcFvG8OwlUzuO8gLFMZyXDyYTBcDwnahwfHzMezTg5GUWCSpNZNRU+uzyQvMimlLZE9X8QH0hOqcDXg8Z3PJN3LiuaZk4vxL6U1SZeg1sbkU261gMV6spCvYmr7UcET6iJP41Ys4hQliUq+Jj1+RlWlTz+6P387j/6TX7z05fe99fZ2xGrg/w2xNVjka8/9UO+9OVv8YPnXsFJSpZ3wRhcFUsiWZaBChRFQavVomFRqbmBYVR0UMpQVp7hcMjR0QmDwYCyquJ9lUKUwXs5BVaLXeppf6DI3lsCqvo+Xs2gNguMt98BsFhYU4TAYuHB08k96+stLly4wIXdHbq9NlabeUkuS/XcLkIpRVIPLgdxiIdEpZFZp+IcmTVCq21Z7+W0O5ZOO6HTzdlc79Drtri4vnKE/VnixqGX0XjMyckgDhKPJ0ymBdPplFkJhYu9U+cj3T5mG3WPh1ow1+ioguI9VeUZTyecHPcZDCYcHAziwPnxMVVVkaY51loq7ymKgjzPWYgeL/QKG/p/M48eB3uXlfEjYeMnsVJdFeYDzY1ZpJLY9zRWc+HceTqdFr1ejzy19YzarJ4rkzlLFeIGsdmIiavisHiowBdomXHp/Dq//iuf5Ld+65e4b2e1OXorY3Vw3+J4+bqTv/yrr/HXX/gme4cT0mwd0RlFFVUCstwCDucLtInqCIJFQqSKz4d6axWBqvTc2t9jOi0YT6a16WEEsxACpXPzAdIm1Jm5lzlYsQRSc88kh5MiKjDUJRqlTL21jWBVFY48z0nTWIYsiwpjDBsbG2xttrhwvk2va9nY2GCt24lDsnHbHMkSREqxrvtfttF5q0oqV5Jnhnae0G23aHdSOt2ctbU2Wxs9Ot2MXrfFduvd22t6J8XRwMt0OmUwiOAyGJbc2B9TVorZbEbhHM77udq7V5rCeRrpXy+16rtWVKVnVlWMx47RaMz+/j57e3scnwwoy5JGi1DZhQhvo1u42OxoxNdDyLVzc4zbwerOfmWx7zT/dzOEvkT2yZI0yjdtbrLWjVm4ENmCulZg8TVQa7VQfI+ZpqecTem0UoIbMxsfs7XR4Zc+8wk+97lf5TMfWrEF36pYHdi3MJ56/kj+7M+/yNe+/gOmZUKabVKWoNNWfY+AsVEmSRuPMg6Uxld23vBuqLWzabQ7GE8nnJwM4qNlQV1uvuzN4OgyWC25HZ0KcxaoqOVpWJQBF4C16FlVhZsTLTqtjPX1dXZ2dtje3mKtm3JuJ8PocvEcEt9DWmvslZNxLGcieF+hBNLM0mt3aLcsuztdOt2Erc0N1ta6tFotzvXS1bX6NsTRwMvN/QGjccnR0RGHx32GwzGj2Yxi5imcxyQ5LgguaASFNkkcPg8eHxSli4BSliVHJ8fcuH6Lg4NDJrMpEhQnJye1k3WCMnqeZQGo2uJFye2lwLOx7MB8ikCkknpmzZ2ak9Nzd2ePUVEBZX1jjY2NDTqdVvRlCwEzdyqOWaRS5tQcnNYwHByRJZr1XsZsMqQsxjz50Y/w27/9KT796fs5n6+yrJ93rA7oWxCHM5G/+uIP+MLnv8obV/YZT0Foo3UXhyEEIctzlA4U5QhtHK22RSiZzQqyZA1MiiI2d2ezGcPxhNFoFEVERc13pc0XCJiLvzpXLqmkszAynMdi57ocjdVEQJZUs5sSTfQ5UkriDIry5Llld2eLixcvsLO7RauVYajw5ZDUKrI0xdpaozB4fFVQVQVZ3bvIEktiNJ28xfpGj93tHdY32qytWVqZZme9u7o+f4Fx7WAkx/0B/ZMRBydRR7I/KpkVjlkRKB0onRKIosjOR4WOzlqP8XRCUVRoa0mSjPF4zJWr17l+8yaj4SSyFWcNo7SeY2NRZn5zmvvZRSvclmFVfmEho+sxhkYmq5Hsomb/pWlCr9djbW2NbqdDag12rrSi5oAlIlHB3XtQgrgKJCq+I9FUMs8SOm3hf/r93+CRh+/myfvPra7fn2OsDubPOW4ei3zha8/x+S9+jR888wJa5eStTUJI8SpBmwRrU8pyhlJClmuU9pTVOM6IpDlIBhJr6ePphMFgxGg0oqpqpQdt5hnVsmyRd1GpwKana/q3m5y/GVhF9hcqwSNxNkXV1hq6FnnVgYsXdtna7nLxwi7rGx1Sq1DKo43CGqFtNeIdrowipFYTrThMJHC0EkurlbC9ucH53R3OnzvH/ZdW5ZN3cuwNZ3J4NOS4P+WNN25ydDKmP5jhPHhnYlmbBJOnFGUZN1P1depdoHSeWenwXjg6PuHw6IRbt/Y5GYzqbCUK5jYMxfko8alrtL5EzpS19VJPNgCNUzEsOQ4ohVmizkfmapj3plqtnK2tLTbWe6TEOUBFpLFLiO8pSmYFvAvYxKCCp3IF4l30MxPB+zE7W5bf+tyn+c3P/TJP3LMqV/+8YnUgf47x+o1C/uA//yV/+ldP4cni1KtYBEPAEothi7q9UlHNQaTC1Bp40cupxXAUFQVGo1EcgFyadZKlGt98voiFZcfZ/rM6A0pzlqGLJnXGmGgTDhTOo006l7FRSkAJ7dyyu7PJ7u4mmxtdOm1Lp51hk4DGo1RNU9caVZUoqZvciUYDVkOvm7O21uXBe++mt9Zic2Od3TW7ugbfZXFrIHLcn3H12i0uX7nO4cGQ6ayosyuJ1QMFSkdCUFXPayljybIWk2nFYDRmOi046Q+5fv0mh0cniBB9y2q6uK89t5rrNSrXB3T9HRKioSW1n5UxjWHlGeHlM8Qi7+M1r4mknqbvm2UZeWq4a3eTLE2wdiFrJTpmeyEE0HHOkLDsfBzFhxOrcOWITsvyiY89xu/+48/xy0+sr67xn0OsDuLPKb78ravyN1/+Kt/5wQvsnUAgi4CgFwgyt7NIIzA09XOtbe2uC6WrGPQnzIqK6WTCrCjil1gvS+qc+TKeNULUp3tUZ8GqUbFI6p2v0gs6u4hQVFVk6SUJ670OGxvrbG322NpcZ63bIs8MShxIhaJCqKLKmomSR+3Egndoo1jrdtjZ3eKuC7tcvHCejc02O91VPf+9EEdTkcGgYv8wZklXrl7n1v4RojLG05KydCht587Ggo0lP5VQVFGjsnSewWDC8ckJ+/vH7O3vMylmmMSSmDgvKJ65+7DCoEShazf65b5UCC6qqdvkVEamznwfGmAx9fxiI/9lrSUxkFlhY63D2toG2iZ1mT2WKEUEbZIarOKoSVTCiHR8qzQaQ3AT8lR47JG7+Ue//Wn++889tLrm/56xOoA/h/j8N2/JH/7Rn/DCi68yGDuS1i6BNGYlurY1aIQ1a825hTW7jirTnugzNZlxeHQUSw5VM+ux2F3G4eA3s+yo48zs61mwaqi4SnwcLq6/+M45fChpt1PanSyy+zY2a5Bqk1qDkkCeJpTFFCWOPEto53GI0wcHwdNKFVvra1y6eJ6LF8+ze26bu1a03vd0HE4q2d8/5PBoyEuv3KQ/nDEaTqIOIgovhspB5QN53o1ivhi8KLyPskpHRwOu3rjO8eCY8axgNp5ReSHRFrSdC/Oepq4HlIlViUbzstETXI5lqTDn3KnyeaPiLhKtGsVN6HU7rPXWaXXaZFlWq8839jERGEWWxKObTFAsUkXxZFcOsWbKE4/cxT/8B5/lVz7zGBfXzep78HeM1YH7e8T+WOTrT73Bn/zpX/H8iz9C2xzRKUKOYGuQEpSqm7L1Dq9p8mqTolSctRqPpwz6Y0aTMVVohiYXTeJlUJJwpgx4Nn4CWCVJQlUVUDObRAJBHEmSkOeWCxc22N5aZ2trizxPSYwhMbWye/AoCSRWk1uDSEU1nYIK7OxsceH8Dndf2Ob8uW0eefCdWf5wciQCJGrrju+vkhsi3NmzSaFqiVoz/335Z9yBW6jpAgGwavsdeRzeqri8V8jB0Zjr125y48Ytjo5PmMwcggGb4VygCooopBtln7RNAc1kNmUwHrF/cMCNGzc5OR7F+SedzIeWG7eAhlwkKpwSGg53JA8uy43VzMMl8d8G6JCA1Q7BY3VCu91mfX2dXq83L5UHt+SiTBwxCSGgaoYkztQlQcGoKaE64eL5Dv/gt3+Ff/g7n+XujfeHksrPO1YH7e8YRzORv/zrH/Kf/uBPubU/JmttUAZQJIve0bxeHkkK8cYom2SMAZVQVZ7+YMRgMGQymeCcI8nTUxP+zcBvE8sCs3cEqzNNq7NgFYKLZUATjQ+dn2GtZXc3gszGRs5aN8oUSf0lTIwhSy2JAiVx1kSFiiwzbK+vc/78LvfdezcXzm/zwN3vjKZykAMBR6DEUxIo8BRkaDwFgQpHRaDESYX4qN7h/JRlpfgm5uxKpeZKHtHqPspMaTSKNpZdoBWV8DG1Z7NBE5VFFOZ9AWDXD70cHh5za++QG3v7UZ5pOCEEzbT0GJNhk5zKx6FjrS0OqLxjMivp94fs7x+yv3fEcDTDe5n3wRAdh5VDwIVIPMKAVbGc/mauxHObkKXv11yALASEQGqjB5zUva12u81ar0O326WV5eDd/OkaohPE14wCH21GoxEaT6ulCeUE78c8cO9Fnnjsfn7/9/4pD19aVRp+1lgdsL9DXL4V5E//6xf54pe+zbX9IUm6QaUypjNPq9NGBQfKvenjrUmj+23lGI/H9AdDxuNxVFJPNLdfxurOoMSdwUrOyNCcnVkJoc6ktKbVzuj1WmxsrrG1tUWv26KbW6ypPZTExwxMCUYCSipSo0iMsLnR48H77+aRhz/Ahz6w+bZeS04OBEqkBiFXg4/gmM76UNuhV25G5cYUfoYPU4JMGY6OCFT4UOL8DO9LSl8ivooDoaE8A1QLq4u50oJeMDGNtmij0MqgVZvUnEdJjrUpSZKRJi3SNCexLbRK6HW3MTrHqBxNjiJFk2BJAYupx7X1ewjQLt+cycuvXebqtVscHA04PhlSlIJJMoKY6MMlKjoqawMqjnhMpwXHR0Nu7R9xdDhgPJ0xmc6A6LtmTLTFCSEgOvaMTplc17Es5ryQgZrPZpy6r/e+NnpUsdznPdZqNtfWWVvrkicpphGYDoFl+XkvIdqyaBUlnJxHgsMqhdUBi+N3fvOX+e3f/AyfeWI1mvGzxOpg/Yzx6vWx/PUXv8Z/+sO/4GQkbJ9/gNEURlPA5LTbOeIHaFXV1HA9lyxqlKNDgPF4zHA8YjabUboqKk/U1urOVfNS3jIYLXaLP74M+OZgFb+s1lq0gXYelc93d7fZ3FrHWkPwFd2shSX22rSinifxZAbSFDa6GQ89dC+PP/IAH7z37ZE68nJLAmM8EypOqBhRuCOmsyOmxRHjYoArxzg/Yjo9IsgM56toAREqvLgo8aR81KFTzYBo7SlFrQ+35GY8D1nyrZqrzy+DlkHraP+ulAIf5jvuKE1lMTpD6xRFitUtEtsmS9fJ0i5Z2qWV92i1umR2l555BC0bGJVgSN9ToHX9WOTlVy9z4+YBN/aOORkMmcwqUFH3snQBnWRUvnZCVhbvFIPRlP39Y46OhxwcHlEUBUVVSyKZhdJFnOkLpzhG/sxQ/KJicfttAnivalUYBeLxZUkQRytNokxTu0Oe52Rp7I2pZbDCM6lGtDptrMkpGvFgMVGL0Je0UsUvffrD/NN/9Cv80pO998y5fatjdaB+hvju8/vyF3/1Rf72699lUoDJNhiMHU5SemvbTEshiCezBQqHwcz19URHPT1RmsFgRL/fZzgc4sWhbZSeabaEIfjTNfjatE8Jc1HQxn/1jhmX6Lm1wqmov9BZlnLh3A4XLpyj28mw1mAT6i+nkEkatdR0qFl/Jd2W4q67drn3rh0effgBtjY77Pbemtp7kCsiTPAUVEyYVP05KJVhwP7BG3gZU/kBpetTuEmdNVUoKVBqilCixMd5MRUro7o2WyyXyzj1BkKWSjl2vrgtfJYUer6BblTDl0GrcWpGVSgzQ3Co2ktKY1A6xagEpbK4GKo4SyfBEnzMpKzJsWqHlnmMTJ+j3e7S7azTaW/QydZJ6WDJgQxIUerdO3R65cDLa5ff4OVXXuf6zUOcj6XVaemxSYdKFC5UsUQYdD3PpXBBcfX6NY6PxhweDimKAqfLmBFLM1a8ZCeyBCRNdtVQ1RuCxbJBplIKm2ZUVRFFcE3cakbdyoDR0G636Xbb9NqdOIYyT9AMgYqspRkOhxSVp93qYW3ObOoQF6WeDBXVrM+nnnyY//lf/hM++9GVtuVPE6uD9FPGD1718m//w3/mG9/6AZXXaJujbHRerUJkKFmTYhM91xZr7BCMSQiiKEtHUZbcurU3d41tpuMXihEBHUL0hqq/dNJ8qYDGlE8nlkTHRdP72vVUg9UWRRJf3zeOvB5jYsmv3W5z4cI51tfarPW6GCO1qrlHcIhTJCEnVQajHYn17G5nPPTQJT70yL088dDFt+SaKeWmCBXCAUfuO0yrqwxHx4wnR8zKPpWb4PyIqi7diUSdtmXKvfcecRWpVggOJO6plW4yqdiMt1ksw5auwoeapVmDlg5CC42EgISo5tEIBDfjbcsbCdVYozR9Sl2BnqC0x2AQpWqNu/onsacSs7QzHk1ACCnKbBN8gsKSJe2YedkNWukmnXSX3Y0Hadlz5JxHsQ70UO/S7OvK3kjeeOMm167ucevmMYcnU0rJCdpQUVD5kjIIKItSkZI+nU6ZTWD/puf6zT2OJ5fxqgRlqXw8zqrOahspp1jSBgi1eoXUm49m0DjCHBC/C/WgcTMYP9+0SGQTtmqZsV6vV5uhSj0jqVCFw2gQFXAITkKk3kt8T1YnlJMhlikfe/wB/vk/+3X+8a8++K48f29nrA7QTxFf+OYt+ZM//xI/fPEqpbfMCh/r6qaZ4agn5Bv7jVq4VSmDsRatNbNZyckgZlOxxCFzbT+/dBq0BExoSBkmCoY2C/IcvJoZk5puG2JGpo3CKIOb1UOSNi6mSkHesmxvRxp6u93CGkVqLEgFIQ71JqkhtQluUpJbzdZmh0ceuouPfORBnnz0/M/1WnFyVQIjKk4YVQcc929yfLLHeHaNQr2OkwOqahYzJFOgtAO1GKAWEYIXwIIYEEsIsQTni6IuYaq5IG8s/cXXnhbT2IHSGmXq0l2DNgF0tVD38KjoUo+uBVL13GdMYaIjMfVxjp+MJI0LlarPWWMiSIgeYL7eRESsqsk3KhAX0AA22tFr0Rgd+1lSJSjpkqgeyq3Rzi6y0bmHXuse1tr30G2fJ2cToUUVLJm5M9PxnRp7h05eevE1Xn7lOjcOCw5O+szCgLzXwto2w2lJWXoSm2FMRlUYxgPL0ckxt05e5WR4wGDsKKpoWy8C+DhkP2fThqhFmdT8o0XS1cwqWiBgVNy4NbHs7dZECAFrLb1ej16vR5qm8ZrwQlulsXyoKjwOr+PG0weFiKGaeVp5hp8OMGrGZz/+IP/0n/wyH//oB9lpr4gXbxa3DySs4lR89el9+aM/+jxPfesZZpUlb6+DTqiv/cgB08l8kj0EQeno0RO9cGA6LRiOJgwHYyaTGUme188eF1JzVpGiXgjfLJrGrgpxgVTNTr9uNCstcbJfQbfbYWuzx/pGh16vSytPCa6knbVItKGqwJiMLMtQoqnKAbvbKQ9/4AIf/vAj3H/POS6s/3xEZEu5Lo49xu51rk3/kJPxqwzGV5nMDqncqHZr1ZSFi+UbFaIpo26jTbQ7j9YnFYEKpQPBO0Q0SArBIHiSVjSbVEHNyzu+6YEAmW3F46WjGWUIrn4eifNAkqJ1qzYN1CiisLBWWWSsVQLKYJRFK4upB0wNKm4sQgZKITU4SW03jwiB6FWGckjwoDxBKkKoiNZ/M4wZI4wRpfA4QvB4JoiMmIVDsqTHaHqFG8Pvo+mRpxt02ztsrO+y1r6He7qfpJJXRJHjScjUz3ej8VbEue2oZHL1lsjzP7zGG7ducuX6SxyPBlQl5LZLkgpFIVSFQYKh3fKkrZz2xj3sHeSY/QHD0YzpdFqPhtSZlRd88GgNNtEEiZvBRcSepNTuxMBpmad5KTgClrWW0pcUswrFBIWh04nO06mp1wYf1dupiRiCjnNlLups4hSonLIo+NZ3X2Q0HDAaTt6OQ/2ujXf8RfyLjC88dVX+4A//gldevUXhEqal4IMlabXiIqgUSi+GdrXUzVyt0MaACOPJhMFgwGQyIYRYjnB1iUE4rZoO1Arlgabo12RVYYki2zSMbSOHBAghUq9DwCqDMZp2J2Vne5OdnU26nRZWR3O7zGZMRmOM0qx1u4hUlMWM7e1NHrz/HB/78CUuXejwgUt/t9JSkD2BgkhXKCj8gP7kBiej1xnPrtAfv4LjJqXs42UIqsTUPSWtMoJrIcEuGuGqLttIGXtBKi7yi53uopQTteii4ruIqn0nNYoERYpSCa4KaGx9fzVXCDHGgGnhJMekOWnSxtoEdIrRGYltY3RKt7WGxqBVgtUJiU5q+R4DyiJ040xRfWZEfAQiiTv28biP4AhS4twMH2Y4X0Slb8YE3ScwxvsKHwq8j/cNUqGUULgiDnXXpWddu0cbnZCbHXJ/D+vt+9ndvoftzXvpqfNo1oEWHvum82XvpPjRTZFXXnuBZ194ges3Z1RVQsDgKoMKazhf4jgBHfDKMJ4Fjo4nHA9H3LpxncpHHUJExZ7hfIxEaqLNEljVJcDmnCkC+szYwpuNizTl4CzLoiBur4cNAS0BryrQtZOBKII3hKCxKqeclhgFndxQTPcpyxM+8bFH+N3/7jf4H377kXf8+flFxOqgvEn81ddvyR/8wZ/x3e89jzYdkrxHFQzKxD6VLEkUNaywRCdgNF55quApJnHAcTwe45zD6KQeyD09cHq2zLAsD9M0iGNSoPG1PIzWGqvq5nCI/RiDqll+GesbHXZ2N+l2MhITOYmWBKNSDBkqKLwrCW5K3nLcd98uH/v4wzz6wbt55K6/O0PJy4E43mAkb9AfXqM/usykvMqkusGsPKDyA7wvUDpEN2BjkEb2xnu8d/X8lz9NL0aDGEQMRqeLnpEOoIo66yoAjasMEpK4o3YKvAJJsbTRqoNRXRK1RmLXSM0muV2vGXlr0bm5laNSS5q0sDaNAq06xZJjSOuRYIshxWDPeILZH0t8aGa/wEW1BCpcPf8VQsCLYzAZ44OjcmNmxZBpdULpTijDCV4GnIxu4EIfryaYxOFkwqwY4VyBxrDZ3kEqi/It8nSLrfUHObf9KOc2PkSHuwlskKp3h7vtD6/05ZkfvsFzz/2I/YNxHA2wm3hfMPN7TKopLrQQ3aJymnExY3ByxP7RPkeHA5wLpGk2dyj23qGt4rbMCr2wIz4jlHs2GrkyY+IwcFmWKKXodDqsdbp08ozUaqzViIm6gRE4E5SksQrgheAEowLWOkIYk2bCzlrO//z7/wP//J98QAEc9Eeych+IsToIZ2J/JPLVb17mj//kr3n2+ZextoMLUdfM5nlt631Wqy8ygZLaosMjDMbRLbUsZ/Xf1VxD7Oxj4czOrQYrCSqWkZrme9OzqunVKni8i+SK1Gparajbd/78Dt1ORqebkxgB8SivMJJgsJQjR6fdppUnbKwnPPzIeT7+qYf4yIM/245b5EBgBhSUjBmOj5mU+1w/fIaZu86kuMrM3SCYfXQywiY+0vNNjqsU5UzhfVR61/Vci9ISewYSS4Ixu4rGf01mJKFZXHQUIg0zQohZlwSNUVtYFbMgrVIS1SaxXTKzTmLXWO/eRao3yJJNWskGqd0k0S2saaG0ZeYrlNG131ez41akv4BympNDcQwpQ2Q+luEIpwaMp3v0x9cZTW8xnBwynZ1QuQkwQ+sJwc0Qr7GmRZ5ukyc7ZPYilnM88oFfJjXnaNldUrNO8g5nFV4dVPLqa9d57tkrXH3jmBvXjkmyBJVOcEEoXYvKZ1SAr2cI+8MTjo+GDAYjBqMJZVlhTBSr9bWlxyLOglUsD79ZzGXPWHyvGyV3ay3b6xtkWULeslit8MHhXUCpBK1SfKHJ0jZVVVHOCoyNvnbOz8BPePSBu/i93/0tfuO3HmR75Ys1j9WBWIqbfZHvPX2Zf/vv/5IXX75GwNBb22IyKxClSfOM8XRKmiVzFXStlxY1idIx43LGZDZmMp7NZYy01vHiLEsSY+daZacufBECDTsNlsuDfgnMjKqHIGtWU2o13XaLtbU12q2E3XMbKB17Wogn1YrEWEzQBOfITILVgYceuptf+9Un+eDD22y1lRqU+7KW7v7Ya2I2uiVJqglqQlAnlBwwqd7gePwjjvo/YjA5ZDIZEVQJelz/N4mZj6k/Q0igLsPF7Kgu61EgIiSqjQq1Sv2pNSP+ErUMY6YVvEFCjqaF0R2M6qHCOq1kI1K+W9u08g1a2RatbJtU9QhkaEnRKq8zIwvEDDV4jU3fmcw6kUMRSqRW3fDMKNyAWTFiOhswHg8ZVzcYFC8yLW8wnQ0pq3Gk9QePMRZr2ujQZnP9Pi7uPsG5rQ/Ryx4k5RyJemuYnj+veO7KibzwwnW+991nGAxGzIoSY9t4aTOaBmbOz2euolV9YDiasLd/yPHxCR6h1copqhkQlggWui4FqsjIfRPlkvm9tZ5bi8wV4cOCMZhlGXme0etkZKlF18xfLTYSgbzC2hwJsSXgfUVRTlDKs9bLCNMRd53r8Hv//Hf4X3738Xf0OXk7Y3Ug6tifiDz11Gv80R9/ge8/8waYdhTODAImTt6IFrI8BR37EADWplidIAGqSihKx0H/mNDMbpyZnAfwtaV9A1ZQDyU2YGUakKrvf2rafgFCSkGeWnqdNhvr0UCunSegHGlqsaKoyoLgI527nVoyA9vbHX75s0/yqU88yu7GT965ldW+KF1idQBKKvoMJtfZP3mFw8HLjGY/YhpuUoZ9gsxQZBHErcQyHVFrzTceXCpFpBnEjHTvWM4rIwvP5ygStF6Y8C1sUTQSNFq1YjlPb5Elu7Szc3Ra58iSbba798RMSnXRZEBCIAESrPrxYPxui7I8EqUD1mjAU/gjJuoKM7fPtDhhONrjePAGx/1rTIsDghQYFXuDVm+QJ+dZ7zzIzubDnN/5IGvJJay6+x1zjCo5lIIblAjB382O3VTffuG6fOvbT/P8s69RlBZte4xnQuEDaZZRBc+0mEVVJJ1SOs/B4RH7+/sMJ2NsGll/c7CqgQpi31nEn1oYz4JVowu4LC7dZFbGWsrSkWUZ3U5Ot52SJtGOBB+rJVonSDCULipdJElC5UuKcopWgUx5Qjnk4Q9c5Pf+2T/gt379YXZXLMH3Nxtwf3IkxvTYyhL1jacu86//9R9x+coxQXeWJug1Rim0jbYEXqJaOYBSghDFNcvSMR7NmEwLXDjttDu38AinfXUWmUOtptDcvZadUapu/FOrTYtHKw3aI6LIU8vGWo/trQ3WOm2S1KJR5Ekr+mAFaKUtEFBuxu6FHo8+fIlPf+YxNjbSnwqoJsVNETNE1ICT6jrj2TVuHb3IpLxKf3KNSbmHlyFBFzXogDADYwjKELxErTZlUEqjlSXUjqtGgU0StM6irA0aMEgAY0EbD3i8EyDB6nWs3iLVF8iTi3Tz++m176GTnydPt0l1j0zd9b76Uqfpjy/djsI1mW3tM5reZDS5TuH2ODz6EaPJPmU1pNR7HI2POBp9l2tH66x37+Kg/EPpJg+Qcjf6F1gidHJNJrzCK9f/hsOTPvdf/B0APvnoJXU0E3n24df5wpef4vXXj9EqJ1MJs8mUgCc1GhJD5QVsws7WNlpbzPEBJ/0+KEHVfSeUwrnY8zXW4lwc7ofTepAQN1jaLJi6Yd5n1gQRQuVBW6ZFhXMO53K21nq0WimiY3/LV3H+Ms0sXoTCTXAhoKzCaE0QsK0uz790lel//HPMWYO692m8r77Yd4r9QuRv/uaH/Nmff5XnnrvGybAkb/fwajH4ialZdwbA1UrqEinIKFwFs5ljNq0oK49X+jRYcUabjEXpL8aSIrQCtJ3748wbueLAh1jWSxPy1LK5vsbO9ibtLCV4h1FCnmbMJiWpsdHdVyryRHjgvl0+9clHePxD93L3uYXQ7LQ4klZ2+4IXiQBTSg45Hr/GweBVjgevMi6uMCmu41Vs9ntVoqzMWYkQCL6o33e2VPJb8vMysYyiCXN7kgjkFq0SyqnG6KwuW+WkSYd2vst69x7a2SXWuw9g2SVVF7Bskr7Dey7vhJjJkQgDAgM8RxwNLnNw/DqD0Q1G4wNmxQBjA+12j/X2JdrZJTa7j7K19kF6yUfmx3cwPpK1zlvPJnSyJyez57h69C3e2Ps6/cGEu8//Bp965F/QVQ/PX//FN4byrW+9zFe++jR7+wM6a5sEfD0fZwiiqbxiWjkq5wkIN/f3GI5GjCejqIpvM4xOomySamjtYc5GXQaqZsC4ibNixx5FYlu44CH4WKLPUzrtnCzLSGwc6pewUKbxoWH4xnWgnIxp5SkJFuUKHn7gPP/in/0Wv/ePPvC+vs7f1x8e4EtPX5N/9X/8Z7733R9h7AaBhGAEloRKAVCCqADKLYBKK6rKMZ0UzGYuzt+g48Dwj4k3E6VtQurSgpprmMUvjlEam2jO7WxGxl8nJ89SNIHgKrQSUpPiikgLSFPHhd01Hn30bp78yCM8+fhP7sVMy1tSyi2CPaJw+xwNXmb/+DlOxq8zq/Yow5Ags6gjqjXaEGeKaNh7Dmt9LHtICpKgQ8JcHUAJ2vio8FD7EIkH5zwSDJoNrLtIK72LXuc83fZFOvl5Wul52nkkBFg6Ufz1Xara8IsMJwcieAIlipJKRgzHexweXeW4f51peYug96ncEKNbbPTu5dzW42yvPcFG9um37XifzJ6WK0f/jZevf55h8RrTqWe99SS/8Zn/G1vm02RL535/IPLd71/la1/9Aa9dvo6ogFeasgqUQWGTNiZpMa0co8kYr+Dw+IjDw0Nms1nUbjRJrZIfpblkKbNqvq9NX2oZrODMsDC6VqwhsgqDwyho5ym9tTadVpyx9KGKowoh1L52aq62IeJxpSdVOVI6lJ/wkQ/dzb/8F7/B7/72w+/ba/59XQb8/Ldel3/37/8LTz/7KqVYLBZtLIEKoxuFgUXEi9agdaSKu8ozm82YzSqqykclBa0g+DkBI8abX9zN8zZepCHeIVrC1+6nVRU1yTrdFuvdLtuba7RbGamG4EpEAnmWQPCUswlWNGudlAceuMTHn3yYJ564n7t23tw+flYeirYzUGM8r7J38B360zc4OrlMf3SFUvbRdoJKSzIdCA2hJMT3Hb/EGqU9SmmsikZ5wUcRVwlxEdAGtBZ8KOrsMqAlhdAmMT1a7R0yc5H17DE62T1srF2im10kYRP9LqFav9PDqp07ZNGHstt9gpkfUvgb7J98j/74NQaDE/qDA8aj73HQOuHKwRflwvbjbzl7cOhelZff+BI3R9+iP30Z25rSznKmo8tcufFdzLm7Tt1/dy1+0Z76bl+efu5FnvrWdyiDRyeGRBlKXzEdz/DK0m7nuODZ2lgnMZr+cMR4NInjJEphrSXUYxNnN5XLZKizt8//jaKqKrQ1saRHLA/OSoeeRjX/PE+hfv6Ie02POqDQ2KyFkorJyNFJc7I859kXL5P82Rf4/Ddel9/57P3vy+/C+/JDAzz1/In82//wx3zhS99GTBebrTGZVZjEYmsZJTUXom1Ya6A1eEqqqmA6K5nNZhRVQxyIrL8gC6mWZdv5hiNwurFbh1an1NE18bWUUlhtyFspW+vrrK91SSykRpNZhUbAl4iPg46WwGavzUef+ACf/exHeOLhjR97jovyppjkkIIbHI1foD95iZsH32NS7DGcDKNRZBIHZoNaNJJDXbZoBl2VFnSdbfkqoLxGEUt58cvo0LrCWIfz0zhjpXokskum72ej8wjb64/Saz1AJ70Lo9aw2qLfBQOs77Uo5DUp3DGzYsC0OObo5ApHxzeo3IQ0zbh0/hHO7zzCevrgz3UT4eRQpuzx+o3v8Nyrf0Fln6PU1zAJpEmP8XHOZuvD/OoT/zub+WMk5Ldl11duiXz9qad5+pnneeXVKyjbQtkW/VGBw9BeW2M8nRF07FONRiP6J0NGowm+DHhRkVFYP99pU8dwRxCD04DlfFlbxyRzgNNEFqu1mm6nTWo1qTWgAsEz940LaFzwpGnObOxQQdHKLeX0hFZW8shDF/nf/+//kkcf3WYrfX+RLt6XmdUPXpjJv////jl/+7fPILpD3l5nWgWwCpMqdF3SCnUpTut68FMU3gdmZUlZVkyLgqpyBDF1/0ovsdaW1BVUw/rTZ/7GaVff+t8aja8qQhDa7cj02+j16LRz0sTQShPKYoJ4QRmhLGZUxZSdnS0euO8Cn/3EI3zwoUvcd7H1phezd3uizQTPGxy7F7m6/z1uHjzDYPI6Sh0hakaSaJTJAI0PFYRGOHehhxitMSL1mwDBC1JFeRmtogVHCI7KFSiBJMnQqks7u8BW5wOstR+imz1EN/8AnfQ+0ncQE01mRxKV8Ou5G+dqEdSYPSMS/V6Cqk+pjhIk4pn3IXUsKcf/FBgTn0cbYvoeTTjRsdFfa/qg0tszoLcrMvXA/LWD7Mn2xlUONl7i4PhlJrMjbuz/kPGkz2bvhIPhD2StcxepjqAxKw8l/ztQ/53sSUWf4+GrXN77KsfF86TpISSBwjlcmBJ0YDS5zmD6Km27gbH33vY895yPC/gXvnFFsuwbvPTqG4ynFUmaoVCMxv0ohYbCaqHViszVNE0Z9ccMRhOszeb09TtVQW53Gj490G8b7UpxKIkb3kBkAvpKUJMCn8U1JbEWJYHayAujFIJmNq1IkmjCOhpPMTqhdIrvfO8V/v1//HP+5f/0j3/WQ/yuj3fMwvB2xYs/cvJv/t2f8IUvfYcbByPWd85TiGdSFdiWwepAZpLakyjae1ibAgpXD/WOZ1EKp/JNo7R2L1UWhUT5oEbORfRceLapK86JsaqxmjALUwqlUBLmZIn19XU213vkeRbtCnSgnaX4coq46DOllWd7Y50nHn+cjzxxH7/0kTe3HJjNXhfMCWW4zmD2GofDl7l19DxHo9dxDEgzhXL1MK6u0EYQSqpQxKHHJKtLfKo+PlE3T8Lp4cggUXhWa6KIoiS0svN083vp2AfrTOpD9Fr30dIP/cKuQykOBO/AF1AWUI0hFDAbwWQMkxEUMyjHhOkUqWYUkyEqVFAb88VRgkWD3MsyYcagjAZt0DYhqIRWqws2wdgcbAa2BWkLsvpnZzP+TC0kKZgUrIUkQ2W/mD5dkD2pOKKSPieDGxwc3qDfH5DYDjub97OzdR+99kWSO5QZf1KUckuECXv9K/zoxld49eCPcekbYFzdO7K4SqGqhJY6x2b6KJ987Pe5e/33f+xrvXDVyVe//m2+/d3nuHk0xIvFEUtzXkm934gkqar0DPsT+oMxM+dxgVOZ1FmSBdwuuxT/EbC6Jk4IIBaUPXUfhZCnmm7eIrcWqzUEQbmo8i9pyng6wRhFlqTMZiXiPNYoxI0h9PlH/+CT/P4//3U++6F73jdr+Hs2s7oTy+3VqyJ/8Zdf44tf+Q5FsGztXqIQYVbOSPOMLDUU5RgMi2ZnnQwFwLlAUZXMpkXcRCsDVmNEE2rTNwHMUrYkWojZVUMwMNHnCI1CzXtbivqnRHuQbqfN5uYmG701ksTGAWABLYrB0RGdjiW3oFXgwu4mn3jyI3zqk49w//k7lwYqdyRKHWP0Pn3/KtePvseVm08zmF5B7ACdF1iZ4oLQSXepCo8PFVKTIZT2BCmpfEWatBDRuBIkCGZeKtE1PT1BvCEEg9YJqenSaV3g3M6HOLf1YXrZY1h1D62lHfzbEVIcxkxpOoDpCMZ9eOGruNEJ41Gf6fCEMO3j9m8g0xHlbIIrJjETcgVSFeALtHiUVARfgY+CtJEQE+L5NPXXShRB1edcW9AWpROCGJRN0CZFmQyjU5K0TZa1CFkb2TyP5D3ybodWt0veXcd0e9DZQF77mtDbApNBkoHNUflbXyptKOyV3JKL67skZo1OvkfwFUXR5/U3XqTXmzAs96SX/vQ9rUL2JTBmyj77w2e5cuspxuENehue0bDEB02nk+GqkjIMSZKUobvM4fAVRtUr0k0WGx0fDsToBVg+erdV105ELlw4x99+7du88tp1QiVom2GVxZs4xC8COrOwrjFZyt7BYa3Qrgh+uSICSoUlXcFG4HYht6WIPlxx7CRmT8JpZ+IQfJzJVLF3i9VYoged8x43mdLrthlPRwzGJ6z11qkqzWQ0Za27RjXzfPFvv0t3LeGlm315+ML6+wKw3hcfEuDGicgf/PF3+Lf/4Y8YTQNe2UX5RTc6c5GtZnS9qwoKZWLJoPKO6WTGtJjFzKE+co1tR1CAaCJsLYRoY6hY4sES6t5WY11glUao8N5hrCJJDO1WxvbGBr1eL/aCUCRWo4LgZmOyBDLradnAwx+4xG//xmf4xIffXAooyC0puMbJ+PnYkzp8hll1k0lxQOFHoAqUdWhToURjpUcIEr2jVIWyHm1rHb4gVIXH6BaWKDhbldHKWxlPaltQ5djQJdebbLTu4tzGB9lae5h25z5sep5MvfUUXJntC7MpTIcw7MPRHv74Jn5wxOTwOroY4ad9qsmAcjKMLsOuRIUKKcYYFc0u4/9CPK9SsxmbTXRt7dGMKMxLRtqeKh/NxYoVdSnZz/2zGhFVT7Q8EaVxQaNsgjUJJs8xaZu0vYZprRPyNtnmBVpb58ku3Qu7F5cysQySLip/66n8QfZFMQMpGQyPuHVySL8oUNpy97lL9LJtOtm9P/F9lHJLSo546fqXePH1P2MmrzCTQ7ypILSIu8ISVIUwQUlCLhc51/0EHzz/P3L/uV+hZe77ia/zzEuH8uWvfI9vfOtZ0B2OxwUhWHSaUREQHZUap0WURzs6PKHfH0eFFGVjFqZCXWmoEFnY+OiaRKS8xUnAZg39/exAO3EzqhQEhxLI05R23iLLMkyjkVlWsZelfKThi4vVGLFoiUK7uQl088Bv//qT/G//1/+eD1x4a4xQ30nxns2slmOvL/KXf/0in//SNzgZV+i0FUFGayQ6DgHU9tQKH6IenaqH/0pXUVax7FffBTgDVPEJ4iUqtdGbWtBSI5jVd1PxSVRQ0b9IItuvlaW02inbm+uxfCae1GYQBFcUpFrR62a42TFGVfzKL3+cf/oPP8e5HzPcW8jLMuFFBrMXuX74HW4dPovTR3FGSpdY4yIln0idDQHEj8FYTKJBJ4iyKFSk4oqQpQpfBqpqhlYZxqQon+CDwhUduuklNlv3srvxEOc3HmItf5DEnEOpn7yo/H1C+reEcgw3Xsd/66/p791ifHCD8ngfGR2iJifYckjqZpgwRbsZJlTkoUQR+0xKSSzLEKeylVr2Papfpy75zRmfqpmji39X+MU1Mr99ycDvNiHVurxUl49EBXSorS0KhYQ4YF2ZjGByRkkX1V5H9zaRzjpmbYvu7iW2LlyCnQvIzR8I6RrkLVT7rdEz1EtKIFJeF6+6pGGMKM+tvWuM8wn7Rzdkd+vHSziVjLl69AxXb32fUfkjpuEGJlGIqzd48QsUr1HtkQBTd8y4uMkkXCboDyKyJz/JNfnDD2+r7z1zIBfPXeS/feHrWNth/2hIWZR017cYTKdMJjO2dnc4GRyzublJmrY5OR4yLTw2iQLWzhf1pnZpISD+Hn3OTAQzxZJTdy0G0Hz/xcdrC3AhMCsLAkKaplht4rNKzQ7WAS+e6I6mEG1IVc54OmV4Muab33yJe+/6HnsnIj9uHXgvxPsCrL7z/Wv82V/8V5794cvYtIdWFlRt/U4srSGxliw160dbg1YK56K7b1mWeL8kj/TjXlBsNN+rv2Tz+yqHYGOGItEqW4tgDOSthF4vp9vL6fYSxAeUCFIGNJpUZVhVosOU++5Z47d+80k+/YlH31ToMsiBzHidveHXOOh/j+PhSwyLa5T+GAmzaGZoarmjmoYuwYIIwbhIz9cmCsf6WJ5QYqLRoNaYEIEOcTin0X6NXvt+NnuR1ddp3c3a2iXa7CJ0fqwS+d815OiyMD6Ck5uwdxX+y/+L4ugWJ4fXqaYjqsmIajZAuwoTShIqEqmwRtAqykApDRgVeQ71ILg435yw6HEES3qN1Dh29uMsRIfNKYrzchP+zCNO9UHifYNoTJpH6mgIGOcJzhOCIyEgviC4MVIc4frXmAWYklC0OpQb2yRr67Qv3YdZ2yLdvoA88yfC5jno7UJrE/UW6B6qdMEI7MuR7HbuQntoZ28OVGO3J4nR9P0rXN37Gvv97xKkRJEAviaqVPMyGpJA6NA4AJ+M9rly8/t0Wlvcv2nwcl3MT2AmPvnhHbV3LNLbWOevv/wVJtND2mnOeHoEIWVzbZdyDInuYFNDYl3cnw1HuCogjbmqSmjMHAGCxE2NaI9Wp3uWcDvlfbkP5r1n6j1V7Syu0gytklhSRuLsoUj04KoXLOc9Kiisyrj8xjX+9E8/T6+V/N1O3rso3tNIDPCV79yUf/Pv/4Rvf/cFvG5TBYPUdOqmnqNCvHCaOafG/kNEKMqSoigoXAW1Ojhn5qdO7bwlSgbF8POJeKUa6rrCKBtLjEqRWk2eJXQ6Ob21Fp1WClJhlCXVLYyyuGmFCjPObXe4dKnFb37uI3z4w/exlZk796fkdZmEVznoP8ON/e9z0H+OWdgjSR1ZrnG+BAIBV5MiiAoT5IhWCDMCHpFamy/EUobBkKDxzkFQJMpik3U062TJRS6e+zAXz32UlnkIzSbQOjW8+dOGK/dFJ/o2WrKMj4TJEIaHcHANufYqsxuv4w6vUfVv4oZH+NkIwwyNj0QVDYkSlPboEJmJxsZNRCCeE19vXBqfMO2lLvkZFuWccMrWvrm9Ue5Y2pIsjSDcOW4vES4iiKKsFzKrNSbEso+SgKlBMlShdjlOCaKovIr6kWgqkzA2Fml3ydbPkW6cJ9u5m9b5+8nO3Qfru7B1F5gM1f3FCdfO5KqM3AFv7H2dH17+/3A0fpEkNSgjeBkTantlpZK6glGfAxESkzIdOlLZ5L6Ln+DxB36He3qfwqoP/dSf56lnD+Xzf/M3PPP8y8yqFKFHUeUIGUEHSl9GRX/xjEYjDo+PmZUlRif4oFHKRjyVxh9LUMpHENOm7mGefs3m/kp8PH9yetC4lWWkNiPXOSghKEeQCi8uXl+i0Vhc6bGi6OQWX/Yppgc8+dGH+d/+19/jH//a29sHfjvjPZlZHQy97PSMevmGyP/7X/2ffO2b30V0h26ny3QwqZ1a1XwwT9X4o4RIxTaGyjnKsqIsqzqjqm09lnbUt5WHoKYe12QKXd+gBFmSU6m8j86yxpLlKd1Oi24vJ09ttD6vFdV16rEWvAxpZ57HH7ufz/3qk3zs0dsBwMuhaComvM6re/+Jo/GLHPVfp/RH2Lygm6R4ryjKkiRNECqUCIgjxPQimtRh8CFEqrryGBUw2kS7d3GYmiDiqw6JvYed/EPsbD5Cr3uRXq9Hps9RsUn296Cg2yXld5lcFfqHsH8Dvvgf4dZlqr2rVIN9Rse3mIxPCFKgE4lzLKmjowI2lIgPtZ1KzFJRYKzCBV9nSgaUmYOLFU3AE6u/t++O5+ed2omYujzVnPZaiPjHQxVo0/QyJJZXT70Q6CpEqjsuKtWLr91t6/5ZGpW3kAlaQ5YksfwkQimxoFmVfaq9PWZ7LyM/6pB0dsjWzmG6u3TP30d75y7kpS8JF+6DpBXFGIN+W8gaAJ4x1w++zUuvfZ6j6Ys4dYiv2qQqjcdA6q+RRGsNJLoDKxU3HDat8G6P48nz3DzZodPepJArkqmfjh336Se21XOXjyVLNc8+9waD0QwTojSTsgmhAsFjE0W3m+PpMhhOcZXgvIoCANiYeRsQSgJxvtJQk424M/UdHee4lEjsl9c97dI5vBNsK0fVrgKxXyr1dzV+tDzJKWcF00lFmuYo0+PZFy7z5//1a3zxOzflNz9x4T0JWO9JsNrpGXX5WOQ//Me/4m+++h2U7SBk7B8e01nfoqzcj00pfQhUwUdLD+8i0KhY/moiKG5faABoatk61n2avgZhXrRWEhfNVpbQylLyVkpmE0BwVUWqLIlRVMWIalxyfqfDpz/+OL/2Kx/lsQdvZ/4U/qoo9uiH17l2+G2uHXyFaXWd0k2wFnQSL/oQHEE8lSuIWV90mzXGQsiQoPEh7mbjbFhNw/WeUHqCtyjVItUX2Ozez876xzi//WHWe/eT2g6BCsgRaf+dz51MDuJGur8PN69RffkvKa++SnHjNaqbryODfZgdYXFYE9jILCGzeKsoCYh3zMqSBF+XWgRVazs2WbGqGV5aqfnQ99zPSBkCRX2uGsmdZSp6nK2K59TPbw8qxN2JCEHF26PNfVx4l382fTC1JHgcVLw/KPJWQ3WO812xBASN1LGyGnEB7yEKd1coVSEh/t7OsvgeQsC7Ej8d4qYHuKPLFKbD9PVtzPou7Yv30blwP3bjInZjB3YvIOVNUelbu9gVsid9/wK3jp/mcPQcko4xiaKczVBBsM3mMXikLrcJCupZx8qNsWmFTitG5Ru8cfO7GL3BgxfP/0zv4/H7NtXlQy+d9t/y7W+/wNHJlNlkjGadxBq813hXYBPN9uY61qYcH0/xTghiamNUhdIqujXfpvl5ewmwuS2ERXm5kW8KPuBCIC1LtLZYE+KGV1TtXBwZp4hglaYoCpQyZJ11hqMjvvn9F1DW8KNrIg/e9d7rX70nwWqvFPlPf/gd/uTP/pr9ozHbu/cwHBdUzmNNQuUWWQ4sdj/RBl0og6P0Did1cWc+ZxFnpk6Vce7w+lI31GMPVuICp8K8LJBnGXme08k75GlCatK4uw+18oPWWGNIs8DOxXU+84lH+M1f+yR3n0tvuwBFbgrc4PWjr/HKlb9FsptU6jo6m9HKUiRoyqKicjNU4khbQllNEAKIQasUTQshrQkWHpuAVZGSq/EEX6JE00536KQfZKP1SbbXPsr21mO0sm0kTnth/x5qEzI7FPoTeP01eOn7yI1X2bv2OqODG/jxPpRDWnpGOxGytbhwhxCiy24oCE5jrUFZg1M5QVuMqc+bcoTg5x5gqc1imS/UpZrgazq6jplSEk6lR7J0loMKcc3ktJKBUk2mtHxuGnJF7GnUex5CTXEXJbE1BaBVHEJXCnFV/KlVXZ70iA6RaKA10+CRRKGSWmGlUeX2EvsoBRgEo4Xc6HoUo8RT4ZlSzgZMp9fY23uZ8MN16OywtnuJi/d9EHvvBwiXvyJq8xx0NlHm599rnPojrlx/hr3+D1DZCWmS4pUmzSq0DvNMd1HJEBqeLRDRXVWImRFCxcHwNczN79PJ7qOQ1yT7GUYi7tuOpfQ/+v89L1/6m68w6FkOBxVOaVxd5VBBoU1CJ+/guxatHFUplK4i1ICqTHSJjvePz92UjVUNYoueZzzPAak5JM3cVn18XEmiPRLFyuYMYxUiq7QqZ2RpK14jeEoviM057Bd8+/sv8l//6uu89PJUHv7gm4sCvBvjPQlWX/jyq3z+C9/g4GRK3t7kuD/G2BZbO+v0+0OyVs4iA1pMqrsQL6hpWTSaBfOdUbMjPrUYvek7qHfeSwrODVBpFHme02116bTaJLr2uglRVgkNyguVG3HPA5v89m9+ks9+8hHOrZ3eKRXjW+LYY1Q+wxsH3+Da/neZyXXEHaGTESFUECQaDBpTA4rDB0eS2mghX1lC/cEUoabJVwSJ79disdKCoMnSHXY3PsK5rU+x0f0kmb2P9O+5kElxJAwP4fgAnvoSxcs/YvT6D5H9V6hOblKUE1oWrAkEphhxWKWYFVOMAZ1YrKaG1KZcJhjditYtVSDUGaRowWqFsQmhPh9G13R0HYexrcSNhddEcJBo5GcwEaTqQmmjoK8wdRmwKfnEcy+i6qxIx+OqDI36Y/O7iI9sVPHxdlXfT0m9aMUZvyBS9xFNHC43FuUcSseSbQiCr6KdjSUhUZokFZR3SHB4X9FszOKiaMjTFtqVWF/gZmOq8SHD/R9RXn4Wu3EOuXg3m/d/kPUHHkb2vytk65BsoFp/f3LGcfG6HAye5ZXL32Rv+Ar5WomXFOc8OtF12c+g0fUsoyZIzFh1velLrMKLxyohbVk8JYeDy7x281tonTCTF8X4TRL701+f//y/+5D6ylMvyZ/8xZeYlhXDqUPEkRqNFygmBQHDxtoaihkTUxAmJVXUd4/HNxJ77xhvlmFBQ7CptQKNpvIlYNGi5906kXrwPMSqkIQSbTSlk9imSHJCcNw6GPIHf/SXrHdaHPZFttffOxnWew6svv7MLfl//D//FbcOCkTleJWQ5S2KyjOZzMhabZpGbVRpAKXr+QYJdb+m7kcpHe1Blp6/ybTuJGgJIOLrwdiozC4oqioO2LaynF67x1pnnV67i/gATkjTBF9WFK4kzwyumPLkEw/yud/4ME9+9L7bgErkQIQ3GIy+x9VrT3Ewfgmnj9G6iuYIza4cj/OTOOehQ/TCEot4RXAB5RN0vZAKM1AzjAEhxagMG3JSdtjoPsa5zY+z3fsYeet+UD1S83dfuKTaF0bHcPlZuPwy7rmn2XvxOcqjPVI1JglHZHpGnpr6s2i01VDLOiW2A4Q4kCsKLaHWcoyNDhNm1CsdQQXEBAIBEUcIcdFrmJpRljcuNy4AdTYzn6NTISoRLFmgxLJwzM6DarL0Jer6qdOlljKzemNEYM5Prh9UF/yi1uM8q2uytzpjCwoVPKkkEBQ66EgOEl2PS6iav1iA8igd5wQdjSJUfZ0HMFpoSYkKAVGzuK8aHlANLzO7+gx7z3yF/vYF1u79IBsPfQTueQQZvCJkG6js7yEFpae8evUrzOQ1UBVlAcbaSOOuKtKkLsuKJsQDTyAajRoTMFYoXDQv9UHX9dOAVhMOhs8yfrFP7yMp5zuP/8xv7UOP3sXa5j/h3/2nL3Pl5oj9gxFat8iyLhiYFQ7nCjqtFKUdQRRh5nDOQRVZiomOrLzGkBGYV2YW1eTbD98cuJQQ5ZkcsyquRanRpLpmHKqAtYYgVf29bliokShkbc7hyYT/8udf4OJd53728/MOjvcUWP3g1b7863/3RxwfT5kVIJIiweJULPGhTE0XjSU6XZeJhFg98RKi6WLDEmSRPZ29vH68ArMnhGjgpghoJSRpVmdTXVppzng4otfp0spTxsMBidFs9NpUsyG//itP8plPPcZHPrLDTvc0UHn3qhT+GfaOv8f1g29wMnmJUh9DEjA6xRqh8AWoWky3VpWI4GxqZYmA0Vl0PVZCVU3xvsAmgSztMuprtNqhk15it/M4lzY+w/bah9H2p2db3SmkuiaUfYoffInxay8y+eFz+KuXMSd7JLMBm8aTZUKlxoh2MXMxJvYtagXrOYNTIunFEHtRWkJcvCVgiKaNgVi2C0Sdx6DCvCQragEEoR4A9nOQ0BEemtVFL4CKehMSIjTO+5ZNbyFSvqh/qjv+VHMNwTv/vaFEx/cRe1kL25g4A6ZFYQhoFEaoS0Uah8cZmX+WICoq3CNROaUuD6gQAUApF8uhNXkjD4Y1ppTDEcPRAbeu/4gbLz5N795H2H3wY2SXHkROXhbSDqr904nYFuGGGGWY+CmXbz1Ff/oys3AT0YEo15XUmVQZs8oQwaq58hWqVlGJx99qRVAJIpZmCasYxYqAcrx87cuou4Ugr4n+GUqC22sddTAZy//l9/8hf/QnX2I67CMijMcDgmqx3u5RBIcXh+QaURZtcmazgsoFkKS+HgSUv833SjU/f8w7ipthRyBm/kFFLXYvi/MXxIOqvw/zGlA8UoJmWgovvHqFf/N//me++cyRfObD7w0x6PcMWF3ri/yr/+M/8+WvfI9RkVGpDG1SREXn2XjxB8SrxQVT18S9BFzwOF/reSmzQKpTp/kMQ6zZFctiMWuapsF5vPMYJaSJpZXndPMW7TRDKk87zdBB8MUUgydUE9pZzsOPP8LnfuUJHn5o8xRQObkhXi6zN/gS+ydPczT8If3Ra5COsVbjVaBysfTjGNc02gKlU3TIEEkQnyKiSY1CpPz/s/ffX7JlV34n9tnnnHvDpH2+3qt6ZVGoQhmgCiiYBhrNRhty2rA5MxpJv+gH6U/RT6O1ZlFaSxqJi1qURFLNEcnuaZpmNxpoeFPee1/P+8yXPiLuveds/bDPvRGZL19VAWwABa45tV5FZkTkteeevfd3f/d3UzdjfGgIobEoMBXUO30W+3dyaO4hbln8IoeHDzEobkfCz19cquMzytUzTJ76Js2lU6y++RrV5XPU1y4yiBPmCijnalwzpqki0uuhrkd02kVG6qsMuWW4BGeLtHpCDAQt8bl5nroJ6possmtRjHNCFKZRU/Z2U47AdNfZ7XZCpjmFbExkb/RENjaajRG7588Nr7rr+7teEfBiVDhJHQQkOXJzGg0aUlPOMOLI9JCdExovNA58RqG9KoXSdbjW1BaBZ8WMIseGyeOTo1cl5kgUUlNO1tk6v8nWlXOM3ngFnT/MPY99HX/3Q+iV15QDtyDF/lG26opCZBxr1E9YH7/PqYuPs7HzAZFNQnA4Kbtr6ykht+ewa2y5uCCKOHP62lyhU8vHmni0R6mITKiYcOrSFqD4OxZo9JIG+fiEkcPDOQF49s1VXV54mhdeeItY2zysx9tZ7SZROkV6AU/Oe2pNU2cY0KlFtXmOtBGWdmvOhx+DQcSWghSUJrccUnGmcjH7vez4aBeQO4aLBxhvrfHCS2/y7e89zjsXo957fP8yl1+n8V+EsVqZqH7n+2/z199+nFEVaJLHFyXeF5k0QaarJ2KszRY5QZzlqZqYqJKVfybRTCfFHphde7rxfu9uGSAtD7CjxBe+oN/rM9cfUPgSkjVRHBQFTTWhiSOCi8zNeR749G38yR//Ng9/avfEUr2kI97lytpTXNt4kQtXXkDdOm6gRkMXqJuGJk5QrXCurftpGW1tMaNBCaEQmphIWpGi5bWcDnEs4jnOXcf/HoeGD3O4/yAid/78RmrrqrJ9CV59gtU3nmP1jRcYXzzFfJpQTLboaUWZS96iNhAaXPAkHyyScNFUHVxrTLIxcOSEs8UMZOWHpHZPo49E31LLs3HKZQRWV5kXkdz6xRyZdh/7yWW1hiqh7GaF2oe2+EvuTdRZJfl5XsmGauopSc4pTpP0ESWhChpS50OpQhIPLnv4zrQjJSkugXhFUs6F5UU+SQu1OZIIKo5eEUgxkVKkJ0rPB0iJ5vpZdlau8u7liyzd+wb+7oc48oXfQseruh/l3Yj8Fd4HNuvLXFh5gStrrzCRVXzZUEpBiomYKlptSWLMzkHMObwpvqFEo3AnJaUAWpj+nrNkkfgJIjXjesx7558kpTk+c1ePsV7R/s9YlP7Y/Qfltfe2NNUN77x/iasrI3a2t+gNFkwT0gtBhLIoGPZB1TFODVXd5GDHIv52fdgtfvsh2e6ZqN+LEFXQZPC2c4ITN1PGkNMOOJwaY1KA7XGDOo/3A77z/SdZXFpgZax6MwGBX5fxX4SxeuHly/zzP/0LVtYbQpjHeY8XsQczKV58F5LXGnFeMCq3tbuoUyImNVkhka44tBsd2NwuUva7ebZC21W0HalpcChlKBj0egwGA/rlgAKH1pH5xQGba9cJLjIolbkhfOHR+/kH/+BLuwxVnVZUZJ315iUuXHuci6s/YWv8Ho3foCwDTuaYTKBOEecdoUioU1Is8anfHbMt0A3eqy3maUQIGQKtBzSjA/T9HRw98CiHFx/h4NLnWQg/v36fji4pV07DM9+keec1Rh+8QbrwLgvb11hgTCiFVCSD+IhMmgiaKEKgVxTWEhyy4ZcMCxlcBFmLLyuERIHkIzWN0RdcInklOgFkprgXWsFRI0Dk+hadiZLUZaipsu/vquqcgn6zho3uSGGKW90ky/6xLp6bGq3Zt9UiRCtituOZynyZoTL0MeKagiL5bFwVXKKR2G1XFWJWbdHkTVhXLaGvEhj3AnVdUzcRlxrmUHqpQZoJg3rEdmy48vIzbFy4RFhc4sDR/Snjk2hqIULNyuYHnLn4BJN0BimaXNTcoDS4KDhXZsKKJ6WIOM3PVT7J1NYjOZxKLlj3+BxZuC7qrXF9z9b6eU5ffRIXlNuOXGdH39SSw/s2n7zZePCeeXn17Q39zvee5qlnX6OqFeciMSXrOkCgcIIrAo4an8aIGEsQZJqzYnck3nVh2GdY1lFytC8QzbFokCyT63KEnTqij9MW3bH1aaeeEIKRj06dvcYPfvQcD37mgY972p/Y8WtvrF47s6n/5J/9O1594316/eNUMViDxBgz3OEIzuGceeVeWhqs6XJFVYtCnCezLZC02/jcCDJL9/+9zdgEq9PqFYF+v0+/7NEvB5ShQJqEkhhvb+GlQdKY4aDHFz9/P7/3u1/i8/cvCMDO+IoOeiMaznFt803OXHmCS9efZRzfh2ILH5RGHKmpaSrwwRGCRSN1lQihRHVWTNX6XonkqCs2NI3HxTm83sJi/14Ozn+OW49+mcPDhzuF7Z916PXLSrUOL3yP9Q9eY+31l4nnTjHcXGGu2aYXIqEvjLQ2z94HxAW0hJQaYqoZNxVFyICGQo5TEQLkyMFiF8saqUskBxBJzhbw6H2X/jHhz9ZYmfnzs8ecFw7LVVs0KhlXk32Mhh2YzMyAfN9n58hHOLD7Ne+bHbPOUpcuy+QIAYO2RTpjlYit0AheHT5CkEgikcSKhC0Rb9dHk+lAumTsR4kxG+2ASs1Ea6R0lIMCF5U0mlBtV7gRpOiYG8wjkx0W50qWl+ag59lvDMIJGek5jaywsvE2a9sfUAzHxBQRUZQJ4mucWM2bU49QUjGhPTPt1EAETVbW4X0AtXNov2ffjRlHiJQLnnFzhncvbrO1cwW9a507Fr5Co9f0ZzFYD316UV58fVXrVPH0s29yZWWF0FuE6ExWyTnEOwrn6ZfeygPUcpqtsWprqboSmQ+JrAzuy8ZKzWD5zIiMObmeZycdIKiKzz9GgaLfpyxLRjtbFL1F3n33Av/6X/8lT760oV/53M3bB33Sx6+1sTq3OtI//Td/xeNPPEOvt0TdeJzvozqBZBRi7wVHsoaBknDeIqGkTfcwt7Uqqvn2d0n8vKObGKtWPkmS7vqkDAX9ss+gZ0bKqUMSeLFJPNre5MjhBZYXF3jwM7fx93/vyzz6GTMQm5OrSlxnNLnCZv0GF1af4drm89RcpBhAKJfYGddoFCASSvAhkiQSa0dTFXgXMPkkk6gxxfAGqzeCwJCmHuL1JAfmH+T4wcc4tPgQc+XJn8tQ6caqsnKe6o2n4fIHXHrmu6RrZxhtXKNHhRvaIjKJhr/3Q4+mbqhGExpRXAmuNAhPQyRIY4WyroXoCoM4LNGYWZZgRc2OJMbAVEmWp1LrD+ZmYFmH5IjMWHIdk89lMWE3XUKm5ixfihs8YYvqkkzhwOlU+Rg5iQ/91Mg/SbTTrHRqC50jy1+pNflMOdISgZQsD+tUcVKDT3kxN3WSKCEn5B0qecETxZPAR5xU3TyWbAhiVKrYIGIiF8PBgH5Y5MzaiGr+KHd97iHkzjs/9ITqxnF1501WNl5HZZOiUCQlIhVQ4XyDC2pamHUPFXJXaoP8tG1uKQ5cCerwWhjJQRMka19jYaI5KU1yJobrVtgZX+XSxnU4vU19TDl5+OsffnP2GY88cFBefXddNTmeeeFt1jchEkyIOhmN3hTZE/2eJ4pQ1bqbku4cjeZ+bx/mrEie36pEFbyYPJwoNElJSSm9ghr5wiWb17ZWGcmmig2p8TSN0OvPszPa4OnnXuXB++5hZVP10MKvJxz4a22snn7uDb713Se5vlHjiyUkhpx8z1UtzuVGgBBjlSeCQxVqzXQI53ESUDEacJMSfkpDyqNdvKZU1F21U75lagmiSn/g6PecQXUYQy01ikPxmugPevjU8LkH7ueP/vDrfObuvgCM9aqWbDLSs1y+8iKnrzzO+uhtGncZ9SOSOppxIPg5mqZBiag3aaSmqnHOMxguWqM68YhEXI6oINO204CmOkjf38mhhUc4fvgxDi0+wMB/5ueLplY3lIvvUb39DKdefpyNd1/iSLVOOdkkuIpe3+G8UsfKqNniqZqK4ALDfjDIThLJm1ZhowZXGRrmkEzBd0ImQ6hJEWWyhfqEy96oE5eVRXK0q4KT1FZB0SpROGfGQCSRJNk+ZEqOsRNr/+pGX0Xav599r6UeY2SImxH9VMxw3vxzMybWG0s6PTmjpmfBYTEj7NXmuWRfW8GYkE4zY8yMu/UVMOclae7unBTvEqhpJpIXW1Uo8SYc5CLeCc4r1DAeN+yMJqSDx5ADtzF/z/1w+Baob76M7NTXuHDtBa5vv4WGHRqtCKEkNZYz9c4hrkZTpNEGjRB6waLXtNsOtufQ5CafJgRNJqaYXp9XR6OOWFeo26Y359HmKqcuPUU16tPrHWKtOq3L5c/WAeChTy3JG6ei+mKOH/7wJZyYK1RpxCS9GkJhDkWdPJqSCRALXSmJpJaGvycSVbdnLpHzUln5RAy6bstrXNak9F2pgjOnA3suSuepmwn94YCqShTlAqPJFn/znSc4dsuhn+W0P1Hj19ZY/fClq/rP//TfcfrCDuIXcb4kVTXSJJKPuXbGYD7Bk4Llbup8w1Ws9To6LZkUEQrvsDggh+06VdO2JHiyBdBZ0psUyesrwRWURULchMHSHFpBPYnM9wq0rqgnYxb6fcogfONrX+K3/94jU0M1uaxxfJHYv8Zb5/6MtZ3XuV5dpGYD5yY4n0kASUEn2UDmWhQxAVAVpa4nkOZt6fI7KGOCr3BS4OISqT7KQvEgxw/+Jrce/E2W5h75+XNT58+oPv1trr/yI+pzr3Nw7RQHdlZwPkKpOC8mwRQbqzsLVmSrTmic5YWQHFHlJpXemd6aGYm2yj+33JCYDUjK8N00IrK6MlvaDPKNFoFIGz0LqWVnZZkkS2S3Ob02mW9GMLnYGZHWWrVGK2WiwxTOm8rYmmyS/1BjZfu++edmbNuozXVs+K7itHttASFj/Nl7WV5KA6nNsaXshee8l0tt9JfySTlUhCgJlzxIidY1HkfwpvohERwFIz9kwy1xz9f+gHD350jM4+f2F8Sd6Bk9v/Ujrm+/wiSeI/TMYUwxgMxlR3KEpmjZmFCAFkCFU8spG/9FUSwaiwl6vQFOhNQYhcP+J7Sdt3uhsBy09khNQ9QJoT/i+uR1nnjl/8tn7rzE+Z2n9NDgHvo/AyR47JDjv/mj32RnveblN95j7eJlwrDPoF+yU0+omwmJQOH74B1aNMbQxYxrFBDvDTGADsY0gkQ+B3WkHM2Kt/sZqe2+BZsjtZrzZh6dUKhD1eVyBsW52shbDQz6y8RGqBJcXKn503/7LZ58fVO/8sDCr1109WtprF4/0+i/+rNv8uwL71LHPqHsM6mVwpvkjsaUPWeZJirNLlmuPsN9HYwzs+jYr60nbvU2mlsATBPn7ffUFltJeBcofcA75cChOba3tuj7HnODOSab23hJLM31IG3xja//Br/19c/yuYeMJru1dUl9WGF94zXOn3+cs+s/YcwlmthkPTuPJkUl5n2apx3xGPxhubZWq67wgVhXSKH0ep46era3PD05zPLgs9x55HdY7n/u5zZUunFOeed1rn3rX7L11ovI5XcYjK4xaDYQmVALaDauXfmRuO56xbC7fkmywZpe+2xUWoPgFKXJWP60TQtdcW9LfHD585xzbF9djjuy0dJ2sc9w4t4ckrqcjxQ6yGaqSJI3bd/sjgNydEcbXbWG58bX1rR1Oac9r7uPx+jlM7uxyK3TipsxUhZaWS1Wm9tTS9x54nRxzNtrjbs6yafiSc6TNOCCR9IIbTJV3ntSXdC4IYfuvp/i6O1UcwfplTdXbt9M57h8/RXWtz6gZoNCPVDY06MexaB3wXqmaVZ88e1NYNoDjBxD2qm2vcdmax0drYB0qhOaQFyJOFM3aRihcplE4s2zDePqKuHkb1LrWS0+pvjtwQWR1U3Vf/jHXyUMlJ2frrOyOWLSVAZne08RSprKZTCmxLkMy2lj9jQTf1To5JNa1qrL98fPOFazPfHsjgPReH8xO9iNal4J1PahiV52ZpumIcYSdX3GdcPllW3+6q9/wOtnxvrA7f1fK4P1a2esVrdU//03n+cnP32a8xevsnz4BBqtL0yv6BlOnJWMRXym47ZJy2yXZmikszBDu1i0zME28nKdUcv/U0u+GzMn4p0nuMIYOCEQJyWleGJVE0NN6Zepx+sMD8Ejn/s0f/APH+KBu6aejSvX2ahf5/z1b/PB5ceZuOuoRLzv450x4GIzQXyDD9EWYXG4VJinSsCeDqs/KmKFSxUpRZqqoG4WCe44Bxe/xm2Hv8Yti48ykE//zBNV11eUldPw1LfZeOVxtl9/lrB9lWFo8L1E1S8JoUeqdkwlwreeY15kslpIt8C2xshnpl1H620jWPtdW4Ph2s/EaovIhqozYG2ktFcxvcVrmVqNmfc7x6Y92ha6manrao/L4MX279r9uun0oPv15tfxJuon0wPevYH2eumuHRiUN5Xsmd3Bnv3knFd3XLF9vw3zdGrsRCEmQhmo64jWSj9AVM8oFMThEnc++AgcPwm9uQ89jfWts1y5dorxZBtXtrlHT9tlV3NxK9rLuUnFcol0NP1dMOCMUTeNTiGl3dfSqSM2IFpC7gsl0gA1jW6hUrM+WuP01Q2UNW6/5UtM9A3tyceDwQ/mfM8Lb6/pZFzz06deY9wUVAjjyYTg+nhRfIDCC67JBJimXVyyI5bVczQZCuC0NVrmQpjq/P6HZHOQTrlCxerIXesMJSWEgpS8UelFKMtA0prVtXX+9vs/5raTyx/ndD9R49fOWD3z/Cn+9rs/4eKVdQbDJcpiyKiuDM12jvFkh6IodhV56uwkh6lEycx2rc5j+rOaC5wjqi59btvLWmWm2FbgnVD6QBEKgvfU48SwnCe5CmqhkMRwruCB+4/wj/7kazxw1y2yObmqkgSVa6yNX+D8tR9w6frTxOISZShRStACkZBZRRGRGtdGCeSchAY70LwSeVFUJ5QhMG7mqCdzhOIObjn8RW6/5Xc4XDx4Q/uOmFbVu49R5f72K6y/8EM23/wp7up7DHcus9gHXwZ2Us1ELZFvNW27WZLtwi65rqdtTmkNIFtDg7129UpMo6bWUDkyPJjviJsakdbA7FbDz/uZKdKcwn1ZFX2Wzdn+6KbtO3YL1rZRX8oO0Z6oTLjhvb3D7a3T2jN2RQuQveXZz+1+q5MZtuDMyE7V1GZr+2Y+9rbsQjsav31L8yKY4VWJUADBszMRxuUcveMn4c574cARxB256Ymuxtf17TP/jo3ti0iIhFAS8wOouc+bnYdgrTAcaLwhP7j3urTR1CzDbtb4R7UMnUUw3k5dfTYEFZERrqzYqt/lvfMbXFu5yF23XGWteV6Xw+c/9MZV8Yoqjp4/LI9+elmeeW1NE/DsC+8zqjy9sMDOaIQPOReqUIij5wLqTZC2STOIj1opiaQWMdAceVv0JUo3P2fvoIrBnwGZxpsWiBo5JoHLZTguWzBfOFLyaONZWdvhu99/ih+/cF6//uitvzbR1a+VsXrvnOr/4//1b3jq+TdopE/ZX2RSRVKCwntLuDqXcwrTsv5Mcu5qUVrPdbrw7DZcXY8i55hpep8/tYfAJpbghK43lZdghYJ9T6oipS6iOqEIG3zxC7fzh//gET53r02OYSkkLnB25ce8d/6vub7zKimsIb4xunGTIJnkjHPOJh+F5dC0mR6rtl1vW306JVHTpAUCJxmW93Jg6QscP/QYB4r76cmNShQfZaj0/dc0vvwMl/7Tv2R85nUGOxeY03X6ZYNzkaoa0WiCUKAUiGvFiFKnUt8KtGqnALFbcVqNY27XV+jgvo4s0XqkduM6skS3WrfbmoFP8lcBI2zssmHtXe2Q4N2XIEkbfU9VE/KW8vG1v6ddf99+pB9yRT+MuvxxPiefEzCNLGads0w4cI5ODYLZRT3Dn5aTdd13jMhhBfRJa6JX66eWPDt40sJhlu+6Hw6fgPLmUdVYr+jpaz/lwuXX2Blfopiz1jRNnUssiKBNhktdNlaAGGAn7L5Z0/IQl4NAK7idFYJti7uVBpdh5qQFKToDFl3fCCpUjOttGtcwiRO2tzfZ3tlka7zCxdHf6MH+Z+jJ/uSLvcLNX3xwWZ54+ZyurF7izbdX8W6RURPBTUAbUCtV8U4o8DQJNFlhgkG07f1OMxG7ywScttzCkIkWELC8ZnbsdGb9StqKWeApraGqKD7YvW20wjmhHM7h1PP6W2f4T3/9Y94+F/XTt/16qFv82hirq+uqf/pnP+CZ596gagKhN0fdCClGysKDJuq6wXtvRZMztqVVMVBy6DwTXnd5kTza0FqkXTLaqMUgJkt2G7k54AhOKJ23fJkzleRYTej5kmp7i9JXPPq5E/zRHz7GVz9vD8Gkuayj+hQrO09w9ur3uLLxDNGtUbqCKqm1L1cH5BoUJyQ1+n1MEe+t31Q7WdscjIgS1TGpHUHnOTD3aU7e8g2OHPgNlssHf+YJqWsfKG+9yrW//hesv/4CYfUsy2mLYagog4ALVBppxPJk3lneTCVl2NXcPVtnspFyM5DWDcYrU+09UydhJpISkWyYc9sV2oi4jah8Z+SmfaLaAuBp9KzdAz8bMdlCkbpmirM5NCwy06kR6pS2xd7f9bns3+msu64fAQNOj2vme537TNYObI11+7+UW5y0dlo7YpDmZJkkc9y6/GA2VKI21y3SV5yHRmsL2guhHguxnKO85Q7m734IBgeA8qbHX3GNaxtvs7p5ilo38RI7g1IUPWK9M3MtoIMxaM/LJsds1DSrqZdS6ozVrshKrWuveoMYU1Lq6BECgukIJo046VE3DV4muHKHtcm7vHVmnXG8zJ23XmVF39JDct/Hel7uvfsgf/JHX2W08yNefOED+vMHSalCk3UvQJwhL7l7cIvoRFXI6vtTEVsgc/taW9T2qoY8L/J9tMuW5575HNSq+OQIrkCjkZKcg6g1TWPPVa8oSREm1YQfP/Eyd9x+8uOc5idi/NoYq6dfOM1ff/unnLu8Tn/uEHUqICa8l12TPaWIBMm5KvPIO+OUmV/K1EjZJ25mWciJW6Rb+GY9HoROIcPjKHygcBmfRvGq1JOKctHRXxxx7z1H+KM/erQzVFV9VZt4mg/OfZvza99mlN7HlRXO91A3gNQg3mcqasL7yo6vSVmF2pTSbdlpsGiqjUIE1T6uPML84H5uOfxVThz+MnPuZzNUunNJuXoGnvwWl5/7MTtvP8f89jUOhETZF7YmI3aco3FCCgO8WNo81NYKnOBJLeejHWICsLT9wDKc2TVtzsQRO59cCyS5Bmo2qO2MVI6OXf6bvL0uWmtv2x7HpbUorZGcPT6MTjOFge1q5N81H9pu6ZxOe7bzeuFDLRVTj/pnH/aHNxNAkD3n2/XX0mmE1ap2dJtTS/HHGWPg1QgKqbAC5So6/MIRFm/7NBy/C4o5pNg/Gt/Wy7o6eoa1zXepmlVCP7doSRHnQ+4K4LMzNs0ttoQRaB2K2Yu0GzadzcWhDk1tIbd9FmONiJJ0gtI+K6AEYoSimCfWYyIJLQX8Buv1dd67fJ7row+459Y1zlc/0oPFnQzk9hvOs95a1WL+oGxuX9SFuaEA/M/ffFm3N7/LtbV1tsYNIqHLITWY4xTEgw/WqZrWOZq9gXntSeZIGFAwTU90V8TRlefkELlTsTCNxzxnSSSN5nw76y/QJCU2QhkWWVnb5FvffYK//v77+offuPsTH119Yo3V9saKzi2aQOYbp6L+2b/7Dm++c4Zah5TiqVOiKHo4B81kRK8Qyl6PcTWxoroZQzXNU+Wwmd1e9a7cldGpMiKVoR2bCTYp8n8eR3CewjkKB14SlsdqOLg0TzVe4f77DvDHf/x5HnrYvJdJdUWRy5y99AOubjzFTv0BjazSNCDSowiFeYdRTHRUYqbgGrPH+55h/3EG85dkRbCpAPqQDrF86FFuPfJlbp//CnPy8M9mqEZXlPdfZO2Z73P5hSfob17iKJv0izE0Y2Ij+EFJ5YQmFEjwVoDdNHgxRuREGhMEoTVAeRF3Bve1sCDQRVzOiklQJ1lRJBPYW7y+M0q5FMFlmRk3zQG0zEPrP2b1KG0/KnVWCJtag9UVPelM/ZNOjdhMxGTzwgxVW6ybZvIIZqASBg8nyxtIG+nc+OpzH6ybfa6d87UnYuoCiHbGZldL1SLIllI/ZVh0E9yc9tYg57cTtI0BpXXEMgzoRUkedmoYpZIwf4Ty6O2wcAQpby5qHLnO1fU3WR+dIrkdQlYnaVKDSqAejwm+n5HJOs9jY/e1pSL4KYS/a27O5KzaUpL2510NVLW0XJDkeebq3AbItjEaVXjXw3moY2NGzY3ZjmuM17bYHkfuu2ObcDyylt7TZbdbeqyYPyjVzoqWw6mA7//qDz4r/+n7r+k//Wf/hp2xzR/nrF5NYspojSdkpi7sFk/Wdv60oF82dNNWNey7ZtksyRJxeQ7EbBgTKSvRi+1XhToqSU3rsQwLvPza+3zn+49z6oLqnSc+Itn6Kx6fWGPVGqrVLdX/3188zvd+/BQuzKGxJJKLfVMiRqu9aZrGdAC9pxYlOXvoxDnEebvpagugyxFWK2DaQkTk16iW7NyV7c1ejxOB2hiAkr3S4EHrBk1jiiLgtOHWY4v8/u89wh987REBiLqqjiucvfoDPrj0lzTuHMgE1QHe9yxOShFXCBozlk+N0oA4xJm4aFVVFEFo4gTcyAphqz7EIfP9u1hY+gy33PJVDg8+S48TP9M114vvKi/9iMs/+HPSxfcYrF6h14wR19A4B72C5JSJq0kuNwxMzuoBRFA3oJEGdZG2B9GUWWcGBDUIp4XhUhsJuLxQSbKFpTVyXWTTwm7T39vyGiRHNtBFYm3KsruForvqo8S19mq6UKMzHrpkIzaT09K8nf0CIxVF1RLrPp+vGQ/tjOi0jqoFA3TX99rXG0KzpLuMFXuMleVis1fdRqn542m3YtrM7fTvO6HVbAicg2QRe1l4titIroebO8D8sbvo3fEZ6C3ddP5M9KpeH7/Ce6eeZlxfxgd7Pn0wZyOlGudC7oDictRjxCG7tCZ51sTWmZRdUWJKZtC8LyjE535djswosG3EEtEexARSIzIi0VDHCUoAFwiub45RyrWWYrJfiQkxbnBt8xW2Xr/O5cun+PRtv8Va9ab29CiD3jSanDVU7Xj4wRP8b/83v8e/+jc/Zn0btne2SSKEYgAuUFeR8bgi9PqgKUeEARVMBUMVp8kisD2jjYj3y4UmNwM7i6UFmibl65yfsxRJmhXqVXBln+2dTQb9JZ587jVu+8tv3/S+flLGJ9ZYtePZF07zV9/6IW+9e5be3FHK0COmKWThslFRJ+ByTyLxdCvlDAw4653s+v+sxzLDxJIMBapagagT65s0HAwZbY6YGw4YliXbG1cpfWRpcYBWIxYHBf/oj3+HLz92B9erK9ovEqP4Hpeu/IirG0+R/FlUNlAtcZh6hrGvTEKmFQmasobsiMRBKxWlVFacLCVJF/Ac5+D857n91q8zN7iXPscpfoaCR33/dR099becffbbDK68QbF1hbJqKIoCnNCoN9QlZGkZGkRrBI+nQHBZPJbsVebttpFTi0c5bMGXbIhcey9bJYkcPWVL4XJENVs310a+FunY/oSUI5zZha41RBnec55W+cLmQ8qwIVkxQ3bX53UR19RYTnNkbU4sq2JkqMpZfDaNyqUlMEj32ra1z5Q8iwyAlM/BIrw2UsoRz8zcbOul3EwJgMvvCym3sdduhk9tmwAm7pw3RNuB1oxnyt2JI1p7nM/GaniU/rE7Ye4w0r95VFWxytrmKRqu2fx2EYdH226/0lLWBdRDW+zd5v805Pdn66vaQ52iIbb4Jrz3RtiYia7MqStwmjUWJWBAXAJp6IrRgCTB7Jw6M2SawCVgm53mDGcuVzTVNvGObe4+9hiql1Q+pN3IHUcPyHsX1/XKSuI/fetxrq+us3jgEKPJmO1Jw2Bumf5wjp2qztG5y/PZ8lTqwDvJXUDzvYNuvrXv7Rp5/rZIQPIQG2nTxVk6K8PHWCWmDyVVFVE8UgxZWbvK40+9yPcfP6vf+OrHqzn7VYxPtLFa2VL9x//jn3Pq7BVcMcSFgrppPU9jnDnIcy9juGKU3uQ9OBO+7HILHXto953f6ym3NQ9gauB5vcCRsugmBIdJ4qSK0ilOazyB+YWCb/y9R/jqlx/ktgOSo6pX9MzGT3j7wl+Q/HmQCYkCJ708QUcgVVZWEERKA2u0ZUrluhoaRBLKBHGVPXdNj364jYNzX+Tkod/l+PAx3M/QvwdAX3lS1777Z1x59SfEK28TZA3XjHBFHykclQSaZA+DV8slOZJ54RIRaVBnLC8RQXxrXNiVk5qNpKSLkFrPP0NzYgas/fs2supyVOTmhy1Lz0r5s22YRkYdZT3f4ZYef4Nn2kZ0riUi2HZ1D6FiNlpp/xkSdWOc1SbC6Zh4Zli7oClN3+9e0e73LpGeIyZmdp1PZ9frXlhwdqHvlFdo9+tmckItvN1ef4Fk1zemiC+GqMxTHLyV/m33wvDgPrPHxkSv6er2i1y48ip1vE7DCCsE9yYR1R6PTM9n9zHac5eY3r8biShuqpsXba455/DeM5lMUBW8a3moDnBoCuCKNpTNOegm378IWTNRtQdaWOQvE3DbjOIHnFtbpdYLbE7e47aDj3G9ekHni1spbqKhec/xJXntrGoi8K1v/S1XV9cY9BeIEbY2VxksHIAkOG2VO0GTNVQUnxO97SXI82b2lt90tLkthRTs+lkLnYjLSI3kHHFSa2VSBOvbt10pr755mu/9+FnOXlE9efSTCQd+oo3Vt77/Oj/8ybM06unPz7GxuYPzPYKzNthOMFkWABIqnqSCumlklYSu1gDyOjMrQHrDA2Ey/FMYUEAjPudEnCaa8YiluTnq8YgmTTiwNKSa1PSLxCOfvZff/90vclu+4ZWe0fNbf8X5lR8Qw2kkbKJxiKQSm4INuAniahNcUEdbfyKtl25HmlfHZBp/bgCpR3C3cvTAo9x5yzc4NPz8z2SodO2s8v6rXPrev+bqiz9lbvsKR0ujuGrw2fNTIk2G9RJBBKdZJZsW0jKvNUrKkazmQmrtclItXdq51njZOU0jrvb7U2hOpI0spMvDJMnSTJ2X3UJae36HzkABM92f24kwJdJILjAm76+Fhk3BIhtFphFVG8kZSrX7cu9iA7bTbtYAQaeQMfu5o80d2TXoPm9xQ2bt4kyonX+VbHC0DRW7bIbQdR72WLTmlHZFdMmeAcdU4DaUnlhFfOgTZZ7+wdvg2J3I8MNqckZsbJ/h6uo7VLpBkgqkRAkkPJosT9fqbhp9XSHJrufRbrJmWHX3vexKTbI2oLELiy7SSgmcRBTLCeUbD1p2xqq7ghpx5DYrGux7FJCdL0JNKCOarnP2+gtcWj3DhcOnuP2WL3H7sccY6Rndj3wB8OBJkVOrqoWr+au//ls2t0YMez1iVFxTU/gAyeHEUbdOFlMdyHZudz617J1lu8e0rCL7Gxke1Sj46Izc0ubhFSZxQigKQuHZqXaQYkBNxfMvv8f3f/TSh+zpVzs+scbq+Tdr/cf/4z/j3OXrNPRJboIKLMwPmYzGpoGlmmEziHlhalufd7mQvDC2gfBeqjrMhMmtsoH6XPme8sJjE91jUZVDKUJGGOKYpoJBqdx370l+53e+wqeyjEnSc3pq7bu8derPqd1bzC0q43EA10MjaNpGdWKHmdQaxEoi0qAqRARVn0uJ8vHg0aoPskS/vI0jy5/ljqN/j6PDz+LkxjbjqivaEG/wBPXye6ovfIv3nvhPbL75PAfrCYddoNrcJi0ItTjQGvHR8nIh4QWCMyMKwXIehjWYgfK5uYVz0wW2NU5kOKOLlGYo5yJM1STa96cRjv1Nu0C3kEja9fc6Xbezj9HCQtlYsRtGap9cg1Do3nftt7t5MmsEdRpZdcvHHrhKuq3uhpdnvtd6y3Z/Zv/eNt46X90FbMeemqpONmpqk9vYqnMGZo/RFsLdoqnTv5V8egJiC10jBTJcxh+6FRb371nVjoottibnGdeXaGQHQuuoJKz3VJGjmmB52DZ0hNzxlwyHtuShmWOeukXMEizaFhzOBYvgNOvwyY5dN83nkoy2Lq1yBkZMghZKbSzCah0oB3WjpGi58ejGTCYXOXX9cdaq84y4zMnDX2BD39CSI/vqC955UOTdcxMtfeLbf/sTzl+8znJ/gegSoxhzDtcRXKARh8ttiZITYpo6E12udPaW7Ql8dOY91QTenDDvTfjYZ2YhCM4lghN84cArk52KYdlH8Lxz6hLf/Nuf8M7pkd57x+ATF119Io3V5Q3V/+nPn+bl196lP7fM2rb121lYWCDGGi/R8jUKUbLmmYTMAMzQn6OLrpQpqwamj3D7VrtwWkuGdpJY4a/SGGSFqaY7lKL07GxtMuyZqvrO9hon7z3O17/2GF97xAyG6gd6eftxLlz5PnU4je9tM45Ckxd8U6CoEK0gupzzMBhANRrbrC2WnPEI0QLPIn1/O0eXHuPuW7/Oof4DKPtDNA1KNdMEDkDPvq+jJ77F+ef+kvG5lzhQXWNZPL3URyQRk0O9mifurT4DEiSlUaXwHkdWzvDW8BEfu5Ybdm1tMTKDIjhnxsc5pvksmVLXwXKLrjUUyIxjMdXyk1y3pV3uyv5uF+TXyTJp97AL0we6/TzBbu2/dgsyfd8+s+/vfX+K4+W7JOwyBDdTstiriHFjdD/VwbN9tHNyZs8zORz7kN2EkZlNtlGl07ZAe9qEEi9da5Bp76hE8o5GA/2lYwyO3g7l/L7n0o61yWVWNk8zSdchtE0TU86XBQTfEUFU6+mp4UwaKe/XIq4btz9rvFpyVedkOtflriBN/0lAU2S6zM1AxNoiAskiK2ny9xIpeoKbp1FlUleoKH4uUesqlza3iOcqLq9c4J7j17n72Jeo9YruBwt+6raenL+W9PDSAf7iP3yL1986g/p5fDmkTh6kQcsS54Qg2dFWM2KpdZK4+Txin8/aJczhTN8xKiIRl/tgJQXvEjFNzHEJAiEQozAaV5w6e4XvffcnN93fr3J8Io3Vk0+d4rs/eILL19aYXzpMKHo0qjRNw/bmBktzAxyGOztV1DmcFySUpJA9fjf1Sqa1Cnu8lHah0lZL0L5DhgFd66a32LHm6ErVWllE6JeeI7ec4Le+/hs8+ui9ACS9qBfXf8IHl/8jW80rzC3WNBrYHjUInlq3rGU7WRNMAPVItFxVciPz/lJbjJw9dTyic8wPP8WxA1/i9iO/y6H+Qzgx2ZsmXlXvHCJTptJekoW+9bRu/vgvuPjs39KcfYlbyoqFoqTe3qKWiuHSHHVTgVers5FEzNCcOs2zXTJiZ3Br9ELjguUKJRHEIB7JYZWbkUQiR6tIZlbSKqjr9PoLHdV8ChFCu4iLb6tMsqHKf9tGQrNkCCDv35bCXfd9hmAxa2Wkve1Tb4bp7NGZovLdC0UnAuV2s7k+bLFpT3H392+ExYCuU43mYq5WvKMzdtnIAx3U16pS2Pfaz6dIgqqaQnhbk9Ve2SKgrmTp8HF6x25F/M3h5VVd0ffPf4tr18/R6E5u65LT+aooAclFxJpqcJN8DNafyyIfUJnMGI3Zaye7IqkQQjby1nPLe3uvZQd3C32rPUg9ezFB207UiVaZH3W2pmhAU4kPJcE1RO+o4shqHF0CV3N1432urFxie2eVOq1w24FH2dF3dCj33nCNbj1sk+Xf//Xr+ld/80POXLzO9a2aWCeqJFBVUAZ8juqSs7Y4tLDnTIqvS2XdpFCvZce2bXJw1ojWi4DW+Zk0Q97UFk0WvTL/XaDoL7G1M+Z73/8R3/nuC/p7v/voJyq6+sQZqwurqv/k//03nLt4jVDMsb49Zn5hmVhH6rpmcX4B0YZWJsaKfwvUeygKKHxW/M76aZLQllnXDt1DP86q06aa7VEcLoH4Bog4iVg6pkTUkVJkaThPmuzQ88qXv/QZfu93H+W2AyKbzUW9uPYU5678kM3xW8RwlfHWOi4Ivd6QqmqIqfX+wIm3VgARSII9aoInZdw+w5AaEJ3DN8dYWniQ24/9NkeG39g1mbxz1Gn7ptdWX/uJrj3xN6w89wN6q6c4kLYYVGPUKb1+gbjAaLyDuIgkh0aILuuZeXBFoHABjaawYU0LnSmGOCHl+hjr9WMN8TojMlO8awaqlTEivz91LJy0XXBbmCt7zA4s15TyA+mzYWkjj2zcZ7T3UhbEnWqoyUxUMt3nrvyAmqGKhiIhOWcpyXdFv21dFBjxJgGx7YvVUbFNOUE6/rvVE7UQlKbWaM4UyIrlXvPEtMvm2yiiPa865zcCTjOEmqGzVunDWIi5ULwTe22hovy7fdk6juQIL3lb5MQPmTDPgQMnYOH4TeeUbWaFrdE5tidXUDdBnKdVV4hoFx3sR/o3I2nnb5fD5NL2M/C7oUGmpSszsHJKaXqZupPc/fusPNN+owhzjEZjGiqKXrDntt4mpURZeGIcEasx1zbe4OW3Nrkwd4oH7v4txvqaappn4G+Ua/qv//ABefO9Wv/jX32H7/34acqRsjVuaKQkqSeJp8Fk4pJIVnHRaeyuVifmxVqjtEOYlnFo62CJkPAkr0hwxCYhaVqH5yVrZOSHIjUJ5wp88FxfX+ONepMfPP4iF1dVjx/8KE/rlzc+ccbqb37wEn/2H/6WSSqRok+BMK4aQq6X0kbxruySrFEc0XvwPaRXIEUWfs2ucVsRPvugOG0XL1ukVHPEpRCjMFcsUo+2KUpBUyQ2FYPQRxrBRU8QRxrXhBT50qMP8yd/9Bh3HPKyoxdV+YBTV/+SUfMmVVoj1RHfD3ifiHHTkDMdAiWqyejqqTaPMhh5IfhAUxkub317hBT7zJV3srj8We6780+Y6z18w7Wbjahmh26fUt55g+3v/gc2X3ycxfWzzOk6+G3EK3WAGuuHY62HG/BZ2V2EkBdokvUIU9QKLTPER4bkXGqJKdrlktpIqs0BtVTvKQabF6DumXCEdpHGoS6CS+Z0+AzRuTZZ3OSouLBFO6sVROJ0PzPFxXnzXV6njcymkVYLl6kZqjIQaXB1pHDgdJ66rmA+5fOVXGuniEvUPtA4qy9zCi6CjwWqBQbsTEBqJJhnH9WhaRqFOZqu+68mnyNrQVzM7wVSanDBoDIfe1kEtUa1aQNWooR2QuRX1+0BQFLO+eQC7amYsF3DuoZNHHrkTvxtD4G7ecO+ia7olfGPubb6DGNdhVKNmp99E7tTNYmZ+aC7lx11ZtzbiHEKU05zbrPwJThibGweiPVAk6zoYjV8RmvXJFZ/qVMtwaSK+JCNpJ/WayaLsoP31PWIUDgCgagN0iRKKVB11jIlCc47RtU6k0nN5s4mO1xlXd/ijsNfZKwXtS83tk65/55CAP4/f/pt/f6Pn+f1t64QysNECtY2awgFw4PzXK+2iC5Cbh7baCI1NQWB0pW4XEoD2anKTlx09nS26hfRKRog9WwySpOsd1gSCl8a1N6YgY+NwfhhuMi2eH7y8lkee+kDVieqB3ufDIP1iTJWP3llTf/03/4NO1WiTsnUGySrPyerRSCBtvCBgHrDXFMRINPVlWQLb4aVWnhJdOpltTXyrRfdLpbeQVNN0FijTSSliIuCBPAoQcBFpd/33HfPnfz+3/8iBw4Ka82b6jjFK+//J3bqt2jkguV7sCRnjNHIIJpzU+o6nClJkxeUBnGeGO3BLosAsWQSPSHdwsGFR7jjxG8z6H2Kgft4NVS6c1p5/TnOf++bjF97lqXRCnNpk4IRSa3yXTWQnMu1vdPFyznZxVwjw6mmoN42UszfNUzW8ntuGjG1UZVFSzmfktfO1EKCtNFXC9/kY3etQyGdEO2sQ+wSlp80yieiOpXR6qK5KYuvY5PNRlG05zW9nC2bOwokp1Z6o4DzFOWASjZRF4mS8MnlOem6mi+CMnV1PaLe2JGuMoq8a3X78kRMgs2uOGUuu+xkaSIRjUSQEYK2oNlybrQWfAbmzBuehov5zKZm2sJDpS3CaiNMi+sDUYeE5dtgeBjx+ztBADUbbG99wGhyjlp3QGuCK+z5nMkRmcFp74HbA2XN0tT3fnYj7DUbYcUYiW5KY88FbB1lfxepBugmUkZXZi7BruOxaxKtsiFjcSLkvJ6lGfBKimN2mitc3aiQi5usb63zmeMLjPSSDm7CzP0//O/+vjz+zGn99nef5Ts/fJHTF68xXDpGb7DA2toG/YUeExcz6GxKGFI4iGZ8gxck5nhUrLkonZQZWXHdIk9b4UNWtqjMHVGmZQwtIzNfiOgEHxZ49e1zfOt7P+Gee2692a3/pY9PlLH63vd/zOOPP0lT50WwS8TnOEgceKHJquNRLInoioJUFjQeg4lyp1bH1IvfDaPsHi2Bwry0Gh9qnNZWJFoHQiZziI4pAgQ/x/Jinz/4h1/ia5+3fNFq85S+fe47XLjyONJfQXxtcJpEmpTQJIgUhonbUkjHctI+ZCKHwSGJXq+HqKMZBQp/KweXPs/Jo7/NLfOP4T5mszi9fk559hmuPvFttl5/Btk+y5htfAmNeoIOkGQyn9E1NH4M3go5vbiplFG+hlazlmG+/IAk0c6bNc/eZQJD6qC/jsDS3U977VplzBg3APWtqryD3JRPnANp7JjI0JkLBtlm+DGRrOuwTNPT7XG2UFQSi4Ta45ilRFsTQiG6LF+DmRBXQGywTruhRMUo9E6U5BLSzGHNYpLR91Nj3cUkZKp+Jg64GnUR8Xn5biOrHAkJucVLXRFCJBWROpqygTo1ZyvFaQpPGqJr6/DKLhfjxe8B3HJE1TlHU29AmDoH9l5AQw8v8ywfuR2GBz50jlX1iOvrl5hUG3jvIRuqvWNWKomZo9tfAzDt+Wz39lraekqJuq5x4inLEu99jp5SZhhms7wnMDCINHXbmtV6bJsdtjVyswog5NZA3pu2ocv98mKjbO9scuFCw1o5ZnNlh4fu+V1qPafFnnY87fjqF++QV95Z01tuP8oPfvoK7566yvboKpI8IfVIUlCrlang8hx3StQGJw7vTKi3haVFTATOXnOph5NMtMjGKDZobAlcICk/Zy3WmOdD1ETVRJ57/lVefP6zrGypHpr/1UdXnxhj9dRrV/X/+N//E65eWUOKRcNUXaaha540zgxW3WTpI++QIkBpnU1dXmTaAsw2Wup6/sieBzOP1qsEW1hCGBNjDVriFQpf4HNuoAjKwfmSr37tQR79/B0AbOobevn6T3n/3PcI/SvUaQvnKhwRMg1dtTAaujO32B4WNYkZnOH2YgKcIZTgSpqJI8VlDi88xKdO/g6H5x/D3aR9wQ3ntHFGeekZznz3L9l56ymWWac3B9W4IfoCxaI2jyCScNRmZCR1OQRpC0iFzpCqI8tVTX/GzRiwtl3JbBfgNjKCznC0/a2m1PVsMCSRQjbkKbealwIh699hLdBtKyFj/JrhxtbgmxPgmIUfsQiqhf9kNxOwjcjMEOXISoVAsEXCJeoUKXzT5bK6CC05hJKgFT551Nvxu3bCSYNKRLy1KkkyY6wySjCtlWnwefsSonnvyYF6ChXLnZLhn9AQEZIWBkem1kG7ofqLFv8UnfaBsl1OaeOiGBNNS1x/ieLgHVAuf+g82xmtsb5xiZh2CD0HoU9TTfafkzOw3o3vzb6/z0O65/uto9M0Dd41lKV15XXOZRTjRkO1S6F9z++zc9DCKNPeVI20FPiuXCLny611j8d7M1hNHDOarHDm0rMUpRBCYEff1uFNGp0+fO+yrFaqBw8v8j//u+/w5tuXkDCfIc4hhfM0otSimXgVs5vbkFRxLhvcLFPm1AqcrbWRdtqWAojP8GeMZsg1GSSqGX7V7FQpjMdjTpy4jWsrV/mbb/+QB++966b345c5PhHG6uzVpP/0n/85H7x/jqIcEmOrcm3hd9uzJ6VEq53mnIPCQ+FxwRF9zj8lg5zsac3Yd47M2geyHdJi4UydJ7RmPF5DYkOQeTyBwgkSE9SBwVzggQcP8t/8d1+m1x+zEt/S1Z0neO3dP6eYuwjuOkGNKNEwRlOCrjq+MFaRr2iLNo2tlXXOcut25wJ15ZDmAAfmH+D2Y1/jyPznCR/XUK1d0PTM9zj9479m/P7zzI3PE3SE1I5BOaAmECWgBQQavKsQ11CqompeufobCxFnk+T7JcyneSqhjahaJYquqJbdxmlvvZXaiksi5UaSDpW80BKBtqVC+763bbqG5GK3ILf3W3NBeIvQ6YxRnObNZv8lo+0ToHKoDCiGQ6rYMBntMJERpTVl7vQHU6H4GPG5/qwThcjGO4nlJsXXpFzyoggxGVLgLNyj1e1zvdwd2im1QqSkoEQkErxtwCQZEw0R1dKgRlLOv+4lFUzHVA6qu2v5JT9reKoUKOaPwvwx4OZ9qzbTqp6++GPWty/SsEVKAQM9Zggj5MWw+1lnPnPcwHxkhrXZeTj7GC+xG5A0EfM/5x2hLIiT2EVMLdlkuu9pqYA5kXTfaaWx2uhvl3EzrwfJkZSRuxq8BxGPDxlZcDVREqcuPc/W6AJ3Hv8ClyY/1lt6X9/32T1Yipy5vq39IvGjn7zE8y+d49LGNhIDRX9ILAqcEyZqTlrKyJKQ8G1aI6cULH+a0wxEg6ZRy+05h3qrG0lihIuczAe04z+pQIwKUrC9HXnyqVd4+kuv3HQO/DLHJ8JYvXvqIk8++SLr6xNCb2CJ1Iyrmk+4W6E4OUGCRVWuLCAYhbotIkVkdwTV4dUtRq1Zlm0aeWmKht0SiU3EaYPztbX+iIFqVNMPwpGDc3zjG5/jnkNeNvWsXl5/mXOXvsOofoPlpQmTahNfzCNxKrwp6hAKVIN5ak5BYl4vcpM18Rg1XdDYJ07mWe5/mjtv/S2Oz3+BIPfsO9n3Dl09rzzzfa48/R2233mWheoaB8qEThpSDb7o0Yjvop3obEo7F3NbEqVxgTY/REtm8CZEKxm57DT03J7XVv8tL76z+aPZ+9O1sW37XNEyukyEGMhsOUu4SxtS5JwYeeEhG0Sr9equAlN8BFoiDTKltVuNVqYtZ+hSMukAb5GhRkH8Em75M/SDY7T+FpPRFQpRvAYkiwxrpvbbSm2J+xZfS7nIFR/NUAmZWu0tylOFoNngxkxT92gD2ymQijmUAdpEgm7ifSJXbXSEkyYJ3nq9G12bjBa0enw6hcRmlSFcZwyke1E8jcyxfPAklIeQcPPcaJO2WN88z6i5jvOR2mih0EVtM/NyD5Ovu0/7zeEcKbTJpJsxA9s8VUrJcjkhEEKgrt0eeG833Lcf9buLbJMAsTNU02142nyX99LR6K3zgXbOi7iacV0xqbfZunqW9a2L7GyPOT/6Wz3Sf5RynwLi2w/MCcBzr5/XQwde4C+/9RIboy12JiPcYAE/GOCMPoIWiopHSDkHDr4V5FZvTpAqKSNBDpcJZw7xHilKmpaNnKYRdefcAUVRsL62RdlfpBpv8t0fPPWJ0A38lRurU1dV/8Wf/iXnL6whfkhVK76YsoFUQVrMtgU5JBuqfonrFURvbSU0J/qldaXz6Ioduyi/yZNTCWJeSMr4cEqJwvXxyeGlRqKisSBowckTS3ztqw/zuYfvZF1P64TXuXj1e1zbfJb55RE74+sUhbfma3kC5Exsl8QV18YjKcOPuR4le0SifdADLM3dza3Lv8Ut81+h5MOpw9157lzS6vUnWP3pX1BeeIcD9QZ9El48rtc3iE0aggiNcyZL5ew4HUqQVlBVSV2tB921kwxhSiZidMZs5rVrdtjJGWXsvy3cbSOatmDXuXwd8tLlBPHTxURwpibiIt41eeE3Y2QPl+L8lICxyxlvoWNmbNdsNKXtueQcFJJzXg3OOzR4ZHgADv8GLCzSH/aZrLxAM7pE2dT4VAKexilJapLWRsbAg8sRqsslCFmxwBYVO1Av2ZgQzVi6xpyB6BjRI/UO0Fs6jpc5qu2rxO0t0MrIJPmapxwVOMCniBfTh7D1XqFFKKazBE0tnNXmkeyCaMJo1MUS4dAd4D68EHhUrXB96wx13CD0YVIZY8/gs+k+uj3rjChzaxzU7uU0N6oz79F9Zy8BJqWpI6SqVFWFiOTcVSDG1OWldgndimBkYaE1lp1DlctSYjtnu2+4DJPZ2mLQdya6iAApG4TszHnFFQ7vAiO5yvur36R2l7j3+CpjPa39myAkX3jgVnnz1Ip61+eFNy7w+jsX2Ko2kBDwvkdH8BByHZ0gyQqwXbK1L5FTIWLMTusEYPO9TZVQT0DtOtjjkrKDr5msJCT1lOUczhe88toHfPPbP+TU5bHeeaz/KzNYv1JjtbKt+tOnT/Hd7z7B+lZNb3CQSZ3rRVJWpsZ6R+ENwlHUwtnCI2VAgieJ0ZONaSbW8XTmIdnlmUl+dtvIShOiCZcUUo1EY/9pFOu2qSbbPzcI3HfvSX7vd79Av7eJcJFT5/+WlY2n6fU3SLqN956EI8bKoiQKRIK1IlBFxOq2rDsoTCvtGyxBXoDOU6TbOLb8KMcPfIEeJ5GbiGbODq1XdfXUa5x+/sccWj3DcOcac9QUziEpUscG55VQCCoV1t4xZe05e8hscSWL1mtmA87Aec5yLpltYgu+mxojywllkkNrGbp+Yjo1Uk5QmRopoGMC4lzOS2XjSMzFxy3UR1bDqJEUkC5npV0eqWUQtpGVZiNkN72NMFo2VY5yu/ortVviA+odqbcMBz4LB07gdQsdb9BMtlGfMoMqs1JdTaTKu+hbtNcaf9F8XuaQOIyFJUJniFWMoo96Ki2YFAdwc/cxd8v9EIa4K29SN+epqh3KLCUkgrXcSHZvvFOjNZMj587ot5EUJIl5SfP5HlpS3QhAkKRAwyIs3AJ+cNP5tq2renHjaTZ2zlLFDfoukXAEmRGt3SeCYc9ns0ZL2gTpzHc+rN7KpovlqJqm6XQCZ1vet9/fm6u6kXQhHerSshO1LZrWdp6aR9Q05uw6MdKQtvcQLGcUHON6TECR0rO6/T4rqxdZWVnjvtuuslK/rYeK/fNY999pzMt//hev6Hi8zekrW9TBWhY1KsQkJB9QeggVKq177jpj2kWsIp0qhmaaqXMO9QHV2hwqbVr9aMtZaiTW0OvPs76xTd9Bqhrefv8il6+u3fR+/jLGr9RYNcATT73ImfPXcH7IaNJQln2apiJkJYo6Gv4sSUhOaFBC4fG9Ei08Y7WyQ5ex3aYxhkuXVM9jCn1YmKtVY907vcEx9XiMNjVBMkATPdUosXzkIKnaZnGp4L/9r3+b5aUalQu8f/Z7XFj5Ma64gA9KXQcaxaSInPWS0RSsKWKr5i1WuZ9ijaScoPXRIkUF0QHUhziy9Ai3H/oay8WnEZm2ZNC4quL379AKyvbWKmvr1zjoA+MIRKFXeoJTvA9IiCSpSFFx3uNSAc4RxJ7GKBbjibPcUUc1J0/yvKc2L9VGTvZgGyGDzuhNBWDb42tD2zYislzV1Hi0C4gXT11HBv2CumrAJYoejMeWpnQum/lUGRHGWz2Yz8XgMZKLwXMek2muLEnbEn16LlOWoBnRkj5VA35ugf6RE9A/icw/IvH6D/SgE3ZGm+jofaTZQUIiBGGSTOmj8CB1bUiks3otzYucqDcRYAXRaIYlqEn4E4kJRimRigXGnGB++VFYfAjmB4S6YfXKTzkyLGEkRj7B5qoXjLHqKivxED9ti6NdOXTHHnMh+9MxC8Jm4+a9RynpLx2HchmZ/zDhWri+8QG1XqYcuM6br2O0iHHmXtuFtjkwjeSms6LLfX4E7MfMXGxhOPu+tYyPUWmaRAihU2F3rq2lanJbEUeKqeumK2Ikiba8JKXUzWlo5+TuczEtQnM2YmwLvTVHPuYYhmDs1dFkgkueokisjF7mhXevsTO6zun1n+gdS7950+v7v/9vH5bvPHNF//JbT/DT5z9gUlccWjrO9dEYioJRk1ApcRKJ7XXTSB1rXK9Hmr3I0mqvQFKlGAyodpRUNxRdHi6a0+6tMeP29jaD/pDJ9ha9Yo4zF67yP/2bf8+Z62O9/cCvJrr6lRqrJ585wyuvf0CjJfg+pe8xmUwoe1bYqylNvaScZ3E+4HslrigtV6UWVXla/NVNKdHSLoxtCN+S1GzSOk24FNG6xmnW/0uJelyxNFxEXWDt6nWOHQ38r/+73+HgwYrBcIdzl3/K+tZLVPV5hDWQHo2CpoLYiHnJCGhpoXhmBZoeYEO/X1LXFmGBQ5MjNp7SH2CuuIuTR7/CUnk/e3vn3NxQ2Th5x90c+a1/QP30gEnybF+7gOqYeZ/oibU/aCbKYOBJzoN3JG9QXASj6hPxzrxsg+ksErL1NsN4jlxWoJ2x6fK6vr30baQ01QekNU4y8/cZHhTYtTB0DRS8CY8qDrJ4cG3cFKQwGFewnJN5wmKK0y3duc1vtQSGNtrLcFNrVHFqPZecLXAae7jeMfzSHTCwoliZv5+eNMihS3AVJpP3Kdg00e6kbdckellLMUEmVFjezUUzVtQRX5ijQJyQmsaum/cQFhiHQxSLn2F47DFYuBcKxS1cwS8cZ2u0yWIorBVUzkkY/6SBFvZysQtZLYBvi7Szl50zwWQYS9Tyd5axdPjBISiWPvTZrdIO43iNSleJUhss+yHf/7Ao6+cZNzNoMUZCsLYhzqXuvfZvZqOq/SIso6qb02OHPCWA7Pvd7rX9OWYoGVOncQ5RQ38at8GYxOun/wqVxIXt5/XE3Odv+kw/eO8RnPsa/blFvvm957l27j3mjhxnVEUGZZ+YakNxRGkytLewMM/OxCKu7jhFTH0F63AtTnAhQChIdQ0YiuKSQde9oqSuJlBAfzBH02xx7vxV3ngr8NqbH3zcW/R3Pn5lxurMuur/5f/657zx9mnwc4grcaEkTsaILyCalpXz5hlFNa/XFz3K3gBXlqj3JiWjipKjE0m79tMyx4CcvDZvMjiHS0qsGrSqoKlxGtHYkJqapqpxURj0PF/80r18/e/dh3fn2Nh+jwtXv89O9RqaxpAKw8DxiBTmqfrG9qmCVevHDGPVWKt6Mm4eQHvEukTSMovz93Ly8Fc5NPcw7ib1GTcbUhwSnVzR/j1fpO+PsXD408TTzzC68haTtXPMVw2LBIbeJm4tMHaRxkvX+r1IfesoLlVWsDB6t2T4rjVS5jxMX4Fu4bPfZ4gMGR7sUL7cvUVpI5qU8y9tjsLhJBBCQrxJSEWUFBwqgRQ8TTPJkYDLZQq2L7v/mbrbXT3Jx5AXcslQplg+dGpMNee2bCmfxD798lOw8Bnoma6dK24RjRe1PDaBiWN7vIXqCOcnSIhoMlWKJLtp8+QicHUeiQ7nIrQOQBKUQJQ+6odUsoxfuo+FW7+AP/oYUt4lGq8qC3dTLt/FeHSeQVAKiVlqCSDhXXu9d9+XTgUFzUaphcVMKsuJ0DE/EJCS/vDQh3YEBhiNN9iZXKTW66BVhjUz9NtFJu0x5PvAXqO1H9svzSAiN3sEssOD7yIzBSMONA3e9yiKHimRI6yWZh5yjRa7IjPnsjahZkKUc6jOMhWnx2EGr+07156DQYUWjCW8M8IMqY91JzDXpWoiiQmbk3d47VxDrVuc3v62Lvc+z9I+RJbjy7aH599X9eJ4/Pl3WKsmNBPFlYFxFKrapNK0FOrJmMlkkqPFbDwzoqHZadJkzpwrCzRGYlN3ub22V5jL+okpGWnFUzLaEc6ev86TT7zK2euqJw/s4y38gsevzFi98uopXn3jfbbHkXLQp24EYqTs9xDxJKlBBO+MotykiPMlvUEf3+uhhUedJxHzOmT4k2e6eOW1YIqP533bDQOSEqsJqaoIKfvFdaRf9KmbCRK3eej+E/ze732eXu86SU7x7qm/YW3zNaS4mvM/BVGTefPJCu7aBcF2mhfjNpoQNUPoegTfR+MAbeYZFHdw9MAjnFz+EkHu+rkmgvQst6Xrq8qhYxy75za23nuWldefYO3iaZiMmPNGf26koRJnNRwiWcolEJxau5U2Ad3WhVnzMLtGznUdgLtFcSYn1VGTuwiNaf6ki7BaokULKU7rfkTsgYramGSMOBrxJDfHRB2umCdRgTSWx0IhKV5MqqqWqR6d5M7AU1FazQzHmYiRaf8tFWcSXmGRYng/zN2HyvQxEX9cdPuCsrNNqC9QbW2j6SK+CARfWuTU1HYNxAgntpIJXTdhJ0ANGqEoiTKgkQWiP0gsbmHpls9THn4YKW0eiD8iOnpOe0ufYuf6ezRxFSc7xlVRnUKdMjUM0zgnG2JlCrk2FtFbuYRYPjhlmE0KwuAAFDenrAOMJ+tsT67RyI6VGGRNOwSiTrUr9tLFYRrh7De6PNGHxmntdnb/3rICNRcIt3BgyghNezwd8sIUBp6ls1v+58ZosG0Tc2NEZjqMxrBzuKCkSG6q2CI9VsIwoWaw7FjZeJdXT0/YHm9xx8Etrow/0KP9/Z/7z98t8upZ1YMHl/nL7zxOVSea2tN3Ja7oIar4EBAtGY226Q/nOqZnpPVDDHVQ70koRdFDYiJOKqI2GaEQUqqJdUO/CKgmRpMRvaJkYfko43qTnz75Cl957AsfeW9+EeNXYqzOXlf9v//Tf8uFC9coews430dSpGom9Ic9mtqSf7ZohSzc6ChCSdkfoD4QnS0qLTPG4fE5suowcNlNo7W1VTKmrhATKUYkGuW4UFA8wfWJzTaHjyYe++ot3HXPHJFTVPoSF6/9mMRVStfgO12x3FvLWct538FNOTpsddHU4KCyFPPympJUzzPn7+bY8qMcnv8cjv98eRNZOii6eVU5fIj5o3dQHLyLzXdfpDn7JqtXzjLwNTGNqDWg4vFBcKlCYmVJfjEDYMd8Iw15175aSGXP4tJGKiBd6wzpjNRsnVXLJmxFZZWUbIGtUg0+J5RdD/VLJDWIJ6YdxG1AAUEqXFRQY+GJtvVMuxU4AOv0nCOvaWQnMzk0R/QBXx6lXHwAWfjCDWcvcydE197Rnl6iurBNvT1G0iYuFEjOX5hiRcpmo43sYjaWkVQ34JRYlIzjImM9TG94P8tHHqQ4+ij07tq9U3+AMPwUbvgm9XiT4BKuwc47G8WYF12XZvJC7aIrMznDlhSAFbRqko6Y4nyB9ObB9T90ju2MrzKerINUmZmW72+b0M8U+r2Gaqoks/+kmtbv3XzSpdjmUGdhODq90KZOFEWBdwVOguV0WhZdt//2mP2uv22f01wnmw9qNu9mc9vISa0BbD/0iEJQJSbN6iPeJKx86+BZa0gthY3qEq+c/lsuXz/HZ/0lLqc31FXLHOnfqCv40EmRNy+oTibr/OS5d3n/0hr4ORbml9nc2WZSN/T6gb4M8rWfcdDaa5/r0pyABqOyO+9RZ+934gsovbKgSom6miBOKUNgPHK88/YFnnr6VS5cUz1x+JcbXf1KjNXpM+d5+vkXWd/YwfeP0kShKHpU9bZBInnStJX2OCH4grLfo+z3mIgJUibsM1JmxEgLx5mXozLVGcscB3tMvEBTmRcWTUrJ55uIeKpJIumEzzx0O9/4/QeYX7rG9uRd3n3/ByR3DYljVH2uA2sXC2PUtRR7gFZlW2ZrqcR6OjVVQz1O9Nwyxw49xB3Hv8pS+cDH7vR7eax6rH/zyRKdI8zl3lorZ7R3x8PwzrNcf+c5rp96BTdaw8UR/VopSDiM1t6Qdk3ylIkKImo5EWd5LdfCazOwjckcWR6r81hdZuJJjswyC7D9W8k5pF1UYm8020YVDQ6KEnXzzM3fgfdzrG2sU9fXEcYmj+XzcdYRYjK9SLIhbVNX7Tnl6LbNYXUqFvl3dYFGhgyWjsP8iZtef1m+V3TtCR2M10hxE61Poc02qrW1ZOgUPWjNFUhjUBMNlJHkSxrpMdZFmuJ2lg5/nuL2r0B5DNkrqeXnCYM78f2TxOYdkou5cSAogeQ8UYw1SSNmxPKndIu/dpGFUb93Q3cuK+sThkhx7KZzaxKv6Yun/iOTatOUOUQNqtWWZKCdqdmvtunGiGX3rj46vzWFFPeyCtvoqpVeCiHsUrTYu982ymrrsDTnQKeEjtni5r0U+nabBvMa1KjQKESrmUtUxlp1+XjFiBx1qgmFEnrbXBu9xgtvVYyrmvtv/8ZNz/r+EyKvnq206A/Y+u4zvHd+FRcKvLc0SUIRbznRVnTASdfQwYAScahEY24WJUW/T2wS1FVXDqCxRnEEB/1+MOLPpMKrtTB6+cV3eOutCx9xj/7uxy/dWF3dqPRf/ttvcuHSNRIDRB3jqmE4FzINtbb+VPiuwNoFTzkY0O8PCaFkornhX6bdOm9Nxsxfs8TobMsHstRM18dGjDXYTEb4lKm8eeIHAk1Sbjt5K1/92mPcdvuQnfHTXLr+Iy5efpuFJZ/pHCl74y3FG8QZE7FtySBS0XYsFbHCYAGaZocmeoIfcGj5JMePPMSB8v6Plae6uK169vwG77y3xnMfbOqRQ/Pcvnij0QpzU/FROWTtt/XqWT1w22cIr/8Yd/FV3IU38dtX8NWIhppxYa0dvCheNOvfuc6QiLTRz3R3ItO8ic68pz7nFXIEYw0xcwuLrj2Iy1YkL3LO7qAi+H7ARUcqAioFrreEP3o3zJ9g+cpFtrbOMRptU8skN3UBJwmRMO031RIIsqFsnZg2omq/Ywedl0AJUC4zPHgrzH94nRHz9xKONizFinoVquYVnIxwMkQkdEK/Nmxeipi2iYpRbmopCEsnWDj4OXpHPw/F3cg+haPij4qOX9FieIJqUmQCUsS8eQfe0XjrhuuikBskzcBwcRrPOEEjBndlXUVJxgYsih4U5d7d7xqj8QZbOyuMJ9toiFaXl8tFWrGu/Y3TFIrbZaBmtASt4PvDL/uskWqjoVnSRF3XHQzovbdIPFqT1pY5CHTyTO12jFuRI8EuCptCkm2NpAEz7f5k+nxLYcagtpyPyARPQ3J1jnotV+2cUJNwXukN+1Q7wrlrr1HrDi5MuLD1jp6Yn/bGUr2msWoIvVvkoZOlvHA2aUXgmz94iQvXR4T+ApQlVT0haaSQNpJvn8GW/ZpZgfk5dt5T9ns0TaSJDeR2KwqQKiKKDyUkISVPUfQpi8Sp05d4/KfPfPhN+gWMX7qx+uCDK7z00nvUtac3GBpHLk1okgcfSFEJedFqsNC0LDwyGEC/T51FJG3RsUiqddy7SZWyB+OMjq25tqQAfFRCdOgooWOFFBEsmSgI4hrmh4Gv/8YDfOWLd7G++RzX1p7k6upzzC/lffiAamPtp/PkTklRtXYEwfVwmkiuwnovFXnb1rwR7VG4AywOPsMtS4+xOLzvY2n+Xawr/eD0VZ594QPWNuyBvPXEEX7w1nW9/cQyS3NAgkNh/4hLjpwU3b6qC/feCW88BS/8iPGpV6nWL1DXmzRZ4qhkYpXxIjOPKnniK0LCZSV1U2+Q1lyYuoiLHeQqZAFbaXMBeTkTOgPSUscl588mTYOXEnWmADFJE4IEmDsJR+6H4e30rx1k51qkmthiXfptvFOCC9RNJlxkCyRdjk26nAoCXbdhkc5mRSnR/q2wfA/MLe57H9Z0RZflkEg4LDpZUZp10vg6o+01SumbIghZDzDX1plCRqteUdJoySgOiMUJlpYfonfyNyB8GvkwNf3eMq48RHJLNAwJria5lAtCwVOg0qC+ISnW2BMHSREJiMZc12XqEK2zpWI94NSbiC3hwyHAUbzCqL7CuN4xZyMrOqhODdV+J7GfAZvCwV14niG7m0tG3Wyb7YgxEmM0QxUE10ATY8cubkUCurmXkkWGotYv6obtTqPStnh4um/ZtS1xnkZb4W2b+0kSRCWpCWw3GpkfzpOayNraGoUbUM7B5Y3X+NFTW6zd5rm09a4u9BehMTJH6E0Rl0dPOnnrmqo2yn/4zpOsT7bwxYCUwJc9w0lp87UQsEhKxQqFU4aBNTi8BHzhqMSufXAlGgyiTk1tpSFiLUW8FIzG21SjbZ555Q3ePDvS+08OfmlQ4C/dWP3oJ2/y5DPvgsxl8sOY/sAKaX3o4cWRqjEuCHhvbRrm5pCDy+hwjkk0Ty4AuZjJijPF2GNOIajQIExcoC4guTEhNvRqGGqJriXcTkGpfXbGm8igJqYx/cE8zWSbRz51kt//2j3ccmid89ff4vz5Z9gef8DygUWqUQVixb5Ra0SNmGHygwVeHS4VxDShHBRocEzGDc57eiFRVwlplijTPdxy6O9z8uDv05PPfDzob6PmmddOcW61QWWRFANr5yacXb/IbStj7vvULdx5BFY06SFx+xusuSOi9VXlrq/CoYfoX3iX1ZceZ+P08xTVJYr6KuKNXaaUmYVpRBfnGwSjugahi5RiUtRDCn2jDKcm5+myMdJsGBQrGs2/t1I1KRuulIuJ3WDITqYgKw1lX9mONcssQf8eWCwJi7fTnz/C1qXn2dl8i5QuIrpCSjuUvQWaWtvY1+DgFHNXYY8LQmrvm5PM/rKcRZV6hKX7oH8HyP4kg+WZvmHSOyQ6+kB7/cD25YNcvfwUB9JleqwirsKpsUMlFx4n+jTMM26WkP6dHDr6Bfyhr0C6C/EfUfxdTVi45QT19p2k7W2SWyEUE5g0+AQDKU34NIwsRxKFZmKU5NIJznvQCdqkzPq0Wrq6gUlU6Hlirwf9m0eUja7oe2vf4vr4HdTVOFeYVw5QKy5YLc/efFK+WgBTeD8PJVreJwvE9vo9mqahruvOQOwmRexWpAC6JozOOZLCuK5wHvr9EpGSppmYQKyUOO+o64gEj4pj0kxsQe4ZIUN8OXN8MvMqXWNIkZzrS9YMVJwSqWliNcN2d1lkeKrYp0lxLqAji3gK542BnBLOJyq9zCvn/xXF4nUeuOuPOdz7NCI3lqzcd1jknTNJF4Lyb7/5JOc3rjNcPMxWU+F9YQ5JM8JJonSeOjY00VAqFwZU1YhGRswXjjAXCJMesappYkKDQf24khADGtvi+4QrC8reImdXN/iLv/khV6PqEf/LyV39Uo3VT55d0//nP/+fialHdAUxWVO9pKAUaCpJOLwPtEwx1y+R4YBUllReaFqvSMFJVrfO+m4uJz1dFp0kFFZz0haNVjWuhnpU4SYNUSf0fGBuEEjqWF9Z5Y7jh/itr93PrceVaysvcv7icyhrhLJmPNkkJkdwfYskclNAE1gl1zJkGR1XEJuGuqksa1W4DJf08c1xDsw9zPLgwY9tqF65tq7PvfoBo1SSyoKoPWIKTJqGarOivrjGSBsuXQk8dt8tH7otKY5MIYaV83pw/igH7/kUzYWXWT/7PKsX32FY1vTKHq5wJK1odIJPWQUjP3kd27nlo4sVRJZeZx5qupyVayO13HunjXjEkSOf3GY+yyo5DM3Slm3mBzi/BFrAwSUWFw6xsHiMzbMHGa+8xChC36+j0YyDis/F5ZYEj7kNS9TUFQfjrJg7UVCUPYreCcLC3Wh5HOdvTHTvez0Hd4nuvKv9Iw3LxRz1tVdwuo4wQWSEY2JzxAmRHnVaQIe3MDhwP/7oF2DhPsR9DJHiUIJbpOjfSrNzhUlax8mYECKtiC2xQYrs6fuCorDoyqGQGiuGLa3lSZ0aJDRofwBNnzFDtkaO+Q9RrohMGNWXqXSNpI11DRBTJhe4oavBfsy/mzMB7f22sD+E0Bmlvcap3fbNttmq4LQwYQiB1CRSamhrNtt4uiUWxM6pmhZS794mgBkp9pxXSxRSTV17Gfsjsfw2dJT3jiicmajGE1OcChomEK7x0nvfIjHgkft6rOkVXd5Hxebe25089fJ1vXhtjW89+QpXNq8yf+AYO1WD4nM7exMd6BUeJ4WVVuDAe0Q8Uax21ZXBdAebOtdoOYSAiJ/2CcsanOujEZvVDj9+8nn+4L/63X3v5S9i/FKN1U+feoZXXnuTmKwINeVkvrac2yzu6gpPoxHxjsFgQG84xIdA02LNSEeGmKpwSyYCQO0UnOXARCMuOQr1uDRhUm1Q1zsEL8RkdU+jUQVao3XDI5+9j6/9vU+zdPQ6b599m0tX3qNcqCh8oK4rymK+w7LbrrgGEeTJr0LSiC88TXLElCgGNV4aUl0g9WGW+w9z4vBvcHD5jo913S6MVH/y3Ot8cOoyYXCY4bBHo4EmCuM6UjdjVlZqtrdWOVckLl+8wrffuKz33HaUexY+3OuRQ7eKbp5Tbj9CuHSCpaPHkXdeIq6dZ3XnEmWzxaCsKZy1Uo/ZsYjJm9FwDnEm+utlZMbFsasJYpvEV4yF51zI5JhcFJyNX5v89X47136B4kkUFhE5ARehPweUUPSQw3MsukXm546wsbLA1uZrLA6umf5ZMhXxkGFjLzEX37aNFe04R1VBE3sMh0foLd1NsXwXFDfvjrvvGCwz7N3NcH6RZvmzeG2wTsY1YD8DqHjqFCAsEOaOwtwxRG7/eJ6pG4JbZmHxdja23qceCY2r8G6LqAltTBeuSAHRwlrIRiMPkSPamAo0JmKwQuTaNUyailgu0evfxcL8A7afm4xEw9b2JlU17hh/9jz4qWHaczbTfNL+29S0+w9agoT3tsi3sF67r/0KgqdGMcPRSWnqRCwU7wuKoiTWpnAhbSG6eFKy9ScltVYvkiX1Z4/vI4zthxFE9vt5CidOodD2eJSC8URIkzVe/+BvKIoJD935h2zpFZ3fz2B9apk/8F9gW0f84Km32di4ji+G2SB7UhKq2FCUASmEpo7m0EvASd8MszhCX9Eaqh3r4yfZNFjlSl7jDBxhMJijqmrOnb3MKy+/ecO9+EWNX5qxevWDbf0f/vG/4NrKOq5cMihIrb2Dy4uJS7l9tzpqtXC51x/SHwxI3mOpiHjDjW6lwNvqkugsUQpmS0Jy+KSkuiJO1pBQkZJh085BNWkgTfj0Pbfx5S99moWDW6zvvMra1jskWSPpGJx54iEEmsYS9SYj0HTnaOVdyiRW9EMfoaT0gneRelKj9SILxZ3ceey3OH7w8/TkwMe6dm+8fZWzF7ZxfoGogbLfM4OtCdd4mklJ3SjjScN4lNjcusJ25diu5nj6nOrRZbgzN0+rqlUtJLfSCEdEd65ZgqF3FO4aEJaPcfC2B4kfvMyVUy+wvf4+MV6iTIm+jxapSImmQGzZjbnlgA/gghEH2hyUOO2IDq2rEQVbFKRlCqaMr1s+RZz1dLLSLZfzZPk5lQKRE7seWq1Pq5s/wPJwjo2rQ5qdFxEumHyWE4rQ3i+bNslBkzxJF2hkmcrN04RlhvN3URx8FIZ3I+HOnwnaEDksqpeUwSJh0KfbmanDdok/ESh9sPnqpvDOatzRg3744Y6FHBbV95TyGPgjRJZo2Mb5CokTKEzw2aceREh1pFPNFIcGQYqCSapoXEl0gegW0P5xeoNPsXzgUTj4RQg3r7FqqNne3qRupj2r9rL/xMm+hmmWBLHnk13vJ03MOjqzzOA2Ymq3t5/hQgVNJr8UG4OwizCg8UJdjUhJKUJpkUXb3DI3MhPZLeW0a7Mz0ODeurHWWM7+7YcxIE1zUNkv8kxJKYfCxvhdXn13TE/muOeWyNrovC4PdktgHRyKXKpU/7D+IqNxww+eeAPvc++8oqAm0qQaTYoP0FJ3g3OI9oyk4yK+Z06C1oI2npBagkbqSq8jaqr+yeGkIMXAX3/zO7x2akcfvPPD5+7fxfilGasnn3yec+evUCehwGeBxZZemZPvmVHWJIs6fREIvRJXBFMBT/vAAErH/jIZVUgSEOcRhDIW+KS4GlI1oal3CCFSVTXq+xShh6NgUAi/940v88BnDrK2+SLnrnyX9e238eU2TdzGEfF+QNNERAqm6o8W+k/7U9hDFaPV1IgT6rpmtC3MhxPcsvRFbln+MgP/8eC/l840+sRz77Iz7lHOLVCLUGmubXGRwjkKX1DU1inZtPIaLl6vuL5xig8W57nn5BHe3lD99KJIWe7Gv2W4O6GvcVVZugN/6CTHb72HrfMvs3n+RXZW3yelDeadCfMUPhK8QMgQW1KIzhh9rrAEedtjKgvjGlxkAr+q1hIFjeAqM1iuMiPaRdog0uBoshBtCXojRCXFHaLNBeX4gMXlW9h6LxB33qOpVklsIcUI79TYxNGR0gKRQ0hxB35wOwN/K1oepX/gTjh4NxIe/LkevL3yWD/L+ChDNR1L4E7gi7sI/RXQHnW6Am4TEcslkgSnFRIarPEj1l5CsA4FIoyakkaP0+/fz9LBr1AuPQyD24w23ztx02Op4g6j8SYx1tb8VEz0uRMI1mlrj+loc1R73tf933fOaqNiE3EuSycF3xmrpqqA1j2dOdSWrKG2zyYpk7ohhALnCnwRcVWc5o3yc6q5vUpK5Ghuf4MzS6zYWxTc1m61TVX3H20yK82c/979RELPMx6v4ouK9dEpnnr1L6gmEx6550/YnFzVhd6RXfenTPDAXUdZ/40H2by+zkvvXGeiinM9ymJAE4WuzVgAYkIocbmpZ5SGUDi0P0YrD9vkbG+NapzWK+aC7WpcoTgmFbz4whu8+sa7Nznfv9vxSzFWb57a1v/T//mfcfHKdRRrRa6Y8m9OeyBYC/FGElEF1+tTDIb4XplD85lISttXNShQW8qlsW3wjojJKQWwJGGVqGvLhUyqHXzwBFdQNQ1aj7n71kP85tfu4667hTc+eJXLqy8Q3UXKwQ5JbcKLFtSVEgqgVUxva4WYMuK8L2hSRGWMoFSVw6dDHJ57hFsPf5m54uMthm9fV33ymfdY31GSm2NUCWFQEOPErp1ExAVECkopKJwJWG7sXCPGmp3RmI2tCRtbIzY2D/H0mUqPHyg4eRNocEUrFSmn+aydD3T+1juZP3c322dfZvvim6xvncfHLbzuEGRMH4/z4CVApu8m2mYFLkeedTY81gacNqeI5a7I1PK2IatoYZIv0ljOq5OOCQj706olnBBN15RyyPw9HlZeZfXqW6xtnYHxCmWoKYseoVxkOHcHLtyKG3wK5u6E3i1QLEN/CSl+foPzyxgih0XjWZ07tM1cr0+qPmC8fZpxdZG62cLVmywwzi3ezGmrNdFEJeJpZEByC4T525gfPszc8iPIwqPQuw3Zpxh17xhPttmZbJNSpBX2sMXb3fDd6QJ8ExhtvzyTYLnMLLLbRiohhF1RVvv9GyA5fHc8qtA0ViRclqYwUhSRqmqyhJvuFr5WzcGwsB8bcS+Dsdtn/j2l1BE9brwGs38//f3GiKsBF5GiMsKGNjST07x9/nEGvcPcd9tvArAzXtFh34g+B3O95TuXxjra+hyra09z+tqYahQJC/M46TPRaC2QNFK4EjTR9ugSV5J8hfYCfm5Imkwgd0nW1JBck02xQaRF0aNphNFOTc973njjA1a2VQ/N/WKJFr8UY/X6W6d4+73zrKzv4Mol61KroDNekXcY5VIc6gvKYZ/+whxFr+yopCLWeKOTkmn/fPZB8YKGkhQjBYmecwRVJuMarQxyrBTK0EeTJ0ZleWHAF790H7fdKozGb7K+8zrJX8KHEUqVK+F7uddWb7ovsR42SYDkbeHt2oZXiK/R5PDxEAcWHuW2w1/n0ODhj7xeq6q6OoJXXr3Ahaub1DqHuj51SqRoqh64DLG1Tpo4S5QCg14JvgT1TCaRy6tbrF5f5/yFBU4cHvLihagnDjuOlrsn16EZQwUgw7tEa4u05m59mPLM82yefYm4/h5x6xxSrRBjjXeeQrB6KFdQ5/br1twwAIWxw5xF0OoyPJajw9yPPd9Gh8ggY+k7RmJx0i28Mrg5tVvcYdHJVWXp61B+irniHZq195mML6E+UgwPMJw7hh/eCeUx6J8wXcry0CfaQO0d4k+KTs4pgxO4ySWG/VO48Vm2xxeZbL3NhHexVlZDFE9FpPEeV8zjytvolQ/QX3gYv/QIDO5Ehh/fQI/HW0yqbWKa4MXKABqFooO0stHpXND9YL+2aJ7dn7e/J2NtCuaYpgiNpq7Qtwi9DnLb28K+LdIXUYiW76rrSFFIzl0l6rpGREmxsQgx5LajUfeFL/fm1GbPY69hMmmnMPMetA/p/jDinnyXRBrdoeyVTEb2DIdh4tLaa/BOIARhpXlFJ/U2O9VVHZbTKOveW/ry+ulNXd2IfPvx13jn7ArUc4gvQRtSpwGYcCmXMDgHzhFdIJU9q2/dFCQ2aJoYEYmWCu9ydCV4N6Ca1AQKnnv+dX7y+L03uUZ/d+OXYqzeP3WR65sjtsc1BxeG1I2YJnXuoeO8donZRESDI/T6FIM+zhc00gq/tnBfHt0PnrYtenKO5DxNHSk1EkTwUaFqoEqIFPTKeVQKqrEy6JXcf99x/sHvP4YrzvPqG3/NZv0uRW9EKKCqoy3AlTAa1Rw8sExdt23pZ2Z2VngQJ9lrARcU4hCnd3B08fMcW3qU8mMk0yPw6tuXePv0ZSZSUCeDSnv9PtvVNmXwxi7TTFRIWMV8hiAWFhbYHm9STRrEC0V/nlhPuLxesTVqGDcXeezhW1lV1YP7gv4zp1UYbKhxRYsDRzl4+73UHzzP6NJrTC6/yahaASq8NIRuDZp6l6KCpgJTsTYM3ImSnFHbW6Nr7KweSVqijIDzWXOuh4p139Xqmkr5IQZrBiLR+oIePfEITK7b4lrMQe8wTPrI3Ie3v/ikD+lNC8h16y3tpyuEndPsrB8kbTjqeIXYeOpkXFUJCwzmb2U49xnKg18BdzeyvH9PpZuNsV7V01efpG52iKnCqbEAU4TkMis3Ryz7jb2Rxex7e78nYkXKbXQ1+15RFJ1SRac8MbsdSab1KDlvFS0nZYXCmajhFG2sQJtcf2R1kv6GY9lrUG5GGJllLe7+e535ef9znn0Mvfesb24zVx6l1++zsXGFZrRG4d7kmdcaijDktoOfox9uu2E7D9yxIG9eVj13ZZVLl9esdU1RECRYCYWL+JRAK4yhW6LepOvU9fFlJPrGulAnvyvX2kZjdZ2Ym5un8J7Jzgqnzl7i6edevuFY/q7HL9xY/fTZS/pP/8W/Z2Or5tCxE6ytbxGKPkVRQCaPOlFiqkkpkkprVe8GA3zZM0JTMu+6bdHcLYTOW6gqgITcEdOwahc8Q+8JOyM2V1dptnbouR4NjqpSBv0FaznRbPPbv/UFPvWpea5ff5VxfIskq4ivqJPBbAYmFgwHc4zHFc61iguZiq2muC00aEqQagbDHpNqkzQpuf3wY9x6+OuUbrfu33h7VftzN9ZQvHOh5vTFLTbHiVAajb+WGpcVB1JUkgv4VsYpi5KakFGyxm8hEIIjRiUVQkoFqYKNyZgL1yp+8OQHfOM37vpYBgtAvEUf2pzVYniC4paHSRdeY3z5DSbX38ONr1DIFv3Q4HRkNT0UuamfnUPSikiFd5ByLsXumaCuRBjgnBAZETVS+oJEoNHCIrTQQFpH9aqKHPnoYy6y3FRc1fAR7VV+nYfM3yc6uaZhcIzFQ3fC1TuZrH/AtY0zTOod+oNDHDj4KfoHHob+3SDHdhn1jzscyvrGVcaTTcq+R2lyS45yukjP5HNuZM21smPTzzuFmZkx24J+9vtN09A0DVVl/e6KoqAoihw91RZlkZ02EZKak9ukxKSu6YvQ7/dJMs+kGlM3Y5zHIE0xMepELnZvVTX2MSzGILQ1oFXJ+DCIsNvWjHPbEkZamLPtu6ViRLJBv09KwnhsDOQyRMbpKlc2Jrz49t/Qf3iBpf7+OqJLA/iTv/9V1jcbnnz5NHGnwBUFRb9HE7dRckdqseuVxBx8dT0EmF8u2bl2lWoS6bmAd0rT1AaGeFOjn1QN3vS5UBHeee8cr57a0Yd+gUSLX7ixevm1d3n9rVNs7zQMQmJp+SCj0ci05SAvsMb9jy5C8JSDIb4sSN56xirTXBXMTAgFxKIq61FE9pKE4ATqhmY8wjUNIa+MXgKln6epEmlS85XffIj7Pn2Q7fE7XFp9lp3mFK43QkVxWB7G2nyEjO9ql0TO/BA6OEBbWixUk0iKc8z172Chfz/DcDf9sHvB3M9Qvb+l+sPnznN1bcSogUHfOo+SEilVqEaSBCOWKJl4kJPnavCGQWZZB05zry9xxMIjKqxvjBlvV7z4ynn008d/pvsp4WQ2WpfUHbub4eV7KU8/z8alVxhtnmOrWWGuTBRS44imQpEqiIlQKEVpRIs2ddUW56RcvItEXBHNeRGhUeu9JWWAwmEpq+pnO+b/gg1VO6Rn0abWZ5XlA/T693HswCWaNCaUc4T+LVDegZQ/G8txdiQq6jRCqfO/uGstb43VXlHj2XGzSOpnHS2Vve13VxRFLggWUqqo6wllmKMIgaaGqmrohZ4VA7csQqdI0naFAVJGcGYVKm4+ZvNnrSFtjdhHndtN308ejX1DEXR6bArgG5Jsc/ba6xw89wxBDrNaXdCD5W5CzPFFkXdXVP/R3/86o0p45o2L+HLIpJrgnCnT2LoRDeFq14yc85fC4fslriqIsbG+3WK0flWsQW40CkavP8/OzjrvvHeGl17+xRItfqHG6vQF1f/h//anrG/VLBw4ys44EtOY4Dwt2dzmt6XjxXmkKCkXFnBljyjOBGvzoiYzxqpTRYCOBo2Y7lZA6HuP7uww3txGmsrSSSqIKyikIDVjlg4M+f3feZRP3dNjc/QuO/V7uN46hIhosPxKckBhRA4EyElgyeCAuj3eV8K7gmrk6BUnOLr8eQ4vPsRy7+5dE6qaXNSytzuhfXmi+pNnT3Hq3CbblbUfaaLiXCJqRGmsS2mWz4HsRGaKKRINEXSlUcrVimO9U7wzPD+qMK4bSqdsrq0Qq4M/172VcItovaKcXCYcuJ2DKw+ycfldmrW3mWy8RtNcAq0ofSRIRYrRSqcV62mV76OKibA6cUQ3RqUGV+cy64qaRAxDtBDwwXjn/meftpVe0wT099Hd+y9pSLFbAFcnVxWf+2fJf97j3uiYSbWDao1iC/O0y2/bJkP3ombsZQNOF+ppRLVX6eKmaaL2+ylRp9TBgi7XZUnySBOpqorklbIoqauGahKpSqNvOx9yc0a3h2pu9Vbe79lXFzX5Xe91ihkJ6jrSNKmrDdt7TjeyCmcc7va9/E9TiUrCMaGtPbUFsETFsza6wFtnHkdjH/8pmOhV7e1BGj51SOTCRPX85c9w4dIKlzbWTL2izOiMZERGwASdQcXjEvgehGGPUA1oRhVRrVmtIMQGxE/voysD9dixsrbF8y++xcVN1eMfUdv5845fqLF6+fX3efm1d9nYrhgsLlMUE7uZ0TToWvZN1Myk80Lo9enNDUhlIGlWc4YuEoPdRgvMQLW1VUkgiNITIU4mVDsjypgIotQpEsRRVyM8Ez730H08cO8Sk8nbXL76PBO9QvI7OGd9iVS9ET7aJGknDmktRTTrmCnGtTfmmifFgKR5Dsx/huOHP8/S4K4brs1eQwVw6swG75+6yngyhysHKDV1NEHMlBLiHGW/JDbTpK8llXPPrHylYmPFtp5ktVh5Yjpn+UEpPAURdEIofv55JUWGBnVFOXg7i0cfQK+/xfj0IuPV19jePEcpmwxLxWskZGEAS08GlDIn0jVT8WvUma4d7bMbFfXO1BtkCHGAhJsrgu83oq5qIuJvXEV/LYbqqu4nufNxxs8D991sNE3NpNomiUlVqanhskuItiU5zIybF9XeuJgrU4XwDxvt91v2XWt87OeCsjRx3RiFXjlH0yQmk8jAFbgi4F3IRIgsdeQ80HYIlnx+H34erRDubF7tRgO4j8G6AR6d1mlZdDoloEi7+okAJYijGDZc3XofPR8YDHvM9eaZ6Kr29syRIsJvPHo7Fy59mr/6/tPUvgfFgIm2zoC11NFMWvOS9Y8LwQ96+EmPug40VSR4y18lUWIzoewNiDHSpITzBUVY4M13zvHiSxc//Mb9Z4xfqLF69c23Wb2+RRMdG5vb+LKgcI4UK1CfJ4WQ1ERni7KkHM4hRWlECXLCUiy31Xoy09oKe03WvtaEGqWhcBHqSJxUpKrJXUwVycyzwtUsLCi//9v3c/K2yPlLr7Jy/Q3c/BZ4tTqfTNNUUifvnzqD0MIG5k22yX9E0BRoJn2G4TYOLzzC4fkHmf8YaupPv3tBn3n+TVbXGraoEEpC4S0/ppaLMsQsM+m0xfozUSHFzlF1KVNwBTQX4Toc3nlEEsEr9fY6MhCcuxFSe29bdXsCRQ2HhnD0o1QwZrTytL6og/IA7sKtbF96la3R+0z0ImW6ztDXzPdK4lZE6CESTEBVGstheRPQ9DlyVRFiciRXIMUiFAeR3s9OLfc/50L/SRk/r6H6ux5NmjCZbANNF8UrZNTDZWhpCksDHXFqdqh+PJjtZmO2zklVu3yVqV6YSPJwfpnxltX1HVg+ymRSs75+nTooZa/A+4bgSyqsNYaVw+R+ZEwZhlNVjCkxpN2/wWKyy1DNGqsbDNWMUbf3suPWlnHk76mMTUlf23xvyk6xteiQEKnqNS5vvcrrpwOlO8BDdw6Y6DVtxjCXGbNHhnbEP317oleunuel9y4xqhucs2cveUuduAyBem0QIDpFSoMCZaeH1ik77q2INYTCEVNN3TRZeLzkg1OXePrpXxzR4hdmrF57b03/+3/8Lxg3ymBuiUkNqomd0RbDYMQIp8GKg51HvCP0B/QX5iA3x7PmpVkZ2X4073jPHN8r6+O1od7Zotqp2pZS1mPJWS8hH0bcdfIgDz54gEH/Gk08RdIruFDT6/epRzKN3pwRKER2Ry+WonI5dzSl3qoGJC2xvHwPBxc/Q4+PzgmtxKjPv3qGC5fX2Bj1WE87MGkYDEvm5no4J/hcaFvXNdDWltk1taI9aKddodGEYp3l/KIrUBfwjcdJg2iDOGM2Li32dh3Lc6crfeb1a6ytb6LjLY4uzvH069f02PICd5zofeSiKcVx0fqy9gbHuPXwp9m+/gajlZcZX3+bVK0S6xED38e37M/2BmUlECEzlJIjJmhSD3EHKPpHoDz8kdfyfxm/uBFTzaQaZwjQykzMqZsap7bM5GZmaD923f7f+fAxa6xmIxtVj3NQDEtSAWiPueESc0OhqZVJtUWKgnMlIVhZCmpaetYLz56p/Y5j9vdZGLGN7vYjluxfZyW7rsMuBQw1CTgEJBVoCrjcM04VoktM0gTpRTRtcWnjbV4/9VOGgyUePPlllgZ33XBx77+r5B/8zqNcXPku713aQYZzCP3OoUWi9fPL6JFpcgu+17fOGE0i1sma23pwIsTY0Gik9B5RZVJHqnHDmbNXOHel0tuOlh+5Vvys4xdmrN49dZa33j3FyuoGYdinGMyRtMYXCk2dpTUTzhXgPVo4Qr9Pf36eibPw1GWmn0hruaZD2gtNfkCyJ25wasN4a4NmVFFqgWpjKtu+oYnbLM0Jj33xHnrFKufOvcDqmilVRG1IdcRJL0888xTVWfGva4tTU8yXzjwim9tWN6Sp4MD87Zw49BAH5u6gkI+mSCuO48fv5N77e1xeT7x/eYXr29voTmMJ0VopCk9ZFtRNTeEht1SbOU47jgCEVOOAsRei81SuBClzyXIDsebEoWXuuvs2FrKxulipvvLaWX789PNsTBxrmyNiqrm4MOTM2jaHl+b44VubevvRee468FF0d4PpdLKq8wceYn75YZrLL7Fz9RXizvtQrIFuom4nM5Ikq7D3kOQhCRo9MKAXDjFc+DTl8qegt/xRl/J/Gb/AkVKkrifGftV83/IzMtUF3H9q3IyufVPDtCcKueHjruOnM5o6BjhEIqqO0c4ExwBwjMc1Rw4fI/g+Fy6epqom9PqeIgwoioaqqYlJMtoD0kmo7Y4A99LLRaQjVswyFm84506pozvzPddkqoABCZWt/PkCLvUh9Q2edBNUJojUtnYWJc1kxPm1l/n/s/dfP5ZsWZon9tvCzI5y7R4eWl+VsrIyq6qr1ZAFDsF3/lV84CMBggCHJAgQM+QAxAx6WqHZXV2VmZWVOq++NyJuKNfajzSx91582GbHj3t4xM2bmdWi6q7AgZ84ysy2me2111rf+r7FjSVW5i5fGK8kSj0dBHn0/LuM/+YLdkYpFS1QJtKbMUErIQkeUYGqZt5JWxnS7hAmDl/kIAGjDS44Su8QqVA69oKhPUa12drc5Wc//cUbz93van8nzuqLzYn8f/+Xv6ZyiiRrT3nixqMh3XYyLavGTJbEjmBrMGkbm/bI65RahEqEWgeo5gUjkthKw5hcXz9KAkYURgWyomQ0GhJKQemE4M+45ZSvuHf7Fv/tX3yfrPspG0//lmH+jN6KItcpRRUZrKPAWg3FpV5BNlGAFqhXljFAqPPb3kDosbL4NmtL36Cj1790rD7ZO5IvNoZ053u8+61r3CzA/cbhXvQZjyfkowIvinanhzWtOh1QpwYUoML02HTNDaJDvTKTSK0jKsT+NQ94z2Knw4O7Kzy8t85KfZftnPT56NkWL/ZO0UkPrwzpXAfT63HsPEc7p+yelmzsLfLzZyLr83Br+UucVlb3aI23xC7eZX7lHuHoQ473follF8MxyJDIVCH1JKFwJATdA3uFrHefdO37sPztN6rXfm1/t+bkUHaHH+FCMb0P4/rxDDjhJbb5y5svi3P2qsP6LQpWcI4fsAE1hBAIXhDxDAYD2i2DBM9xf5er165xbf4hgyPH6WALZRVZaqiMY6I9PkTttCAh1m3qyGc2DUiTLqNBAcZeL+8jLZQQa2hGX0z3/XbpzmnNStXurJZw0SrOc0FFFGaSJEyKPKpca89ovMOLw/e5dnSf7eJXsqLucJFW7d6cVr/eCnJwlPPvfrkbhX5URPQZZdERlx4XjQZQCi2KJHVUdkLFBBXAmjgmps5iOVeiMZGc2is+f/KSn//y74bc9u/EWR2fwr/9N3/L0fGEJGvjlJBXY1qtNPZSBfDeYRKFo2JSBuaWrtJbXafEgjI1q7qLuXBiPrpZbQVtor4YcYVjVCAEjxFPRxyT3X1aeYkKURpAtzLKvERX0E4z/vx73+PerQUOBp8wlg+YXy2Z+FFEw+gEhQOpEB1iQ2toxfqaLkFVeF9E+GYRu8LTTCPOUOUZqb7CYu87tNOHaPVm+povCpGf/PwFT57tsbx8jRs3brCyCv/rf3yHh/daPH68xebWCeNSUxWB05MSlKEzZ0E5EgPWKipfgXMkVpNlLUg1Hkfux1He3kRexDCBzJVcXenwnYfrXKl1aI5E5C9//ZTt04B01zCZpt1OaLe7aG3wpaeUiuNRxenpPjv7fdbmOvzlB0O5fa3L/dUvcVqdut9p+Lno1Yeki/dwwyfkJ5/gxs9Iwj5tOyRLHNp4cumSyyJJ9x5zN/4U1v4EWg9//wvza/u9rJIxjglia/5H7FnUwdlkG9WHuRBRnF0iZ47mzAmc1YhCnITPsT6cZ4qIJYGmZgven22jETwUE5iUx2RZxtFojy9etPmT9/6Yb711h08/+WuKYhfCmMW2ZTweM8j7LKyscTroo7UgXqBmozCYKVQeIMksBlU3P4eIWPY+SswnUZ+q2e/Zmt00TYjUMHciktFGpQYXHCEAql27a42ogqCr+D0lIBZxipQuKmiMSakyYef0Mb98+j+DnvCnN/73l56/P7qu1b/42w159PKYR3sDRKcYY6O+mU3xCHnd0O+qgkQnZN0exekYbSNpdVUVca0efI2I1hFljFARqETzweMTHm+LPLz2h0UF/p04q48+esLOfp+8iDxXohygIy+ccyQ2qVVgwauAshm2ldXAimQacWkxCLNcW1ECQSmDSs5wBlopUqtRzoMrSULAlQXioAgB50s6ScLoZMSdh0vcuTXPSf9TDk8+xsk+SU3/I6Kx2hBCcRYtwRT1Nx20WpxNcBijUBJwztBJ11mdf4+53n066sEbT9SzSuT9z/v86vMtjg/H7J56Nnb2WF9f4Op6h2vX17h7e51nz8f86v1HvNzaZzKZkLUiSrDdboO2BCdYk2DaKThHfzQk1Rk6sxiTEcTj8wk+d9gCEh14+9497iycXUhPt054uXWI1y207dBdSDE2YKzFkKBSFXPpOAIFx+OK3A0ZlAUHwzY/fDyUq2tdHi58idPqva2k2pG59gp+cIdR+xrF8ccwekrlN6E6wlWKsV4lW3qHuavfh5Vvg72D0rf+oBf+1/bVzUtZ1xjr6B4da8ESmLYcztjrIoo3SWq87vWLoIr61cu+hdaa0hXYNInAHS3sHx7w5ItH/NG7/4xvvv2P+fWv/4pOq02eH9Br93DKc3R6QLfbRaqyPhrFlGy20etSBt20jUwjoYDCzOybBvyrezZzDM04vNqPr4h9nQ1ASqYZndDUpUOtT1a3zSgrBD/mJH/O84MPeG/9n146ngDffHCVv/jzb7D9L39CYUwNuLAobSmqkqzbpQwOY2OJQxkhaWWUxhCqElvzNhoMXoiTsD5bbASdsHc45oc/eXRuu8Edira/H63ZH9xZ7Q9E/g//x/8P/eGo1uvS05WF1RoHdQgtNTOFJm1ltLsddJrg6wam+KcesBn0XyPgF0+0TENSozRBHMW4ZHjYx41yOp0eaMEPHe1OF8sc/6u/+DO+/cfLHA/+A8eDnXpfokP0rjiL4CQlXjgGUZ7Y79CwxGd16O9qKL5AaDPXvcuNq9+l13ozqOIgiDzedXz25AVbu/sY1aEc5xweHjIqSvaOegzLLjdvzTG/3OE7f/SQazcX2d094PDgFPElblTgxrER0qQJrVZED9qsQ+lAe41WPTKrKKsxxbhPL9PcvrbE7XtnoIpnJyJ/+ZPfsPnyhKS7hkkM7SSJgAcvYANpmpHYlCr1+CqhHI8ZVxOG+0P2jvZ5udvi1vU1/nazkitLlnud1zstlVxV4g/FJAvMt27B0jeRwTOKk6cUpy/I8wnJwm16a9/ArH8b2ndQ+v7Xjuo/swnnufimPVaXnJnLkW9njmW26fZ1FETn029nr51PG17urHyIC1qtNWXhMSwxGVc8eflj3rp3ixvr30e+0eWDT/4FS9evMtg/oddpcTo6pioVBkOQyE0YRCMSE+wRkQzaJohEja3zciIR9t4k5V9viovEv+dommTmGKfje/b5hsWn+U7DTD+eDNnY/oKP537KxuDncnPuB6+cnXurVr1/KPL+54/49eM+nXQuktwajxFqMFfsR8UHtLW0e12Kfko+zjEmzr1hZiGvwtl1YFAcn5zy4x/9DQe5yGpNsvv7Oir4O3BWH336gqfPN3ABkqyNbw5MQmzGUxZCTfUfAmIsabtF0mmhjI6ii43WUX1SVeO1a0cWgmBUDD8RH5kpUJRlQTEc4hzgQahQIpgkMBoesbrQ5eFbKyxdGfH8w18zKQ6wLUXlY0ExiEcTiRpjNFXLW2tXI3TiDeQqUMpibX3iKksrvcLS3Dssz72HYeGNY9SfwMutIw5PJthsjnZ3HqUMI6UoxbBzMGHv6BHdjxU3ri/z1ls3+P737jA8vcXOzgGfffIFh8en5HmgN79EYlLKsqSoIE1TjEmY5CUa6LQzyCskn7Cw2Obh/WXmam29AyfyyaenbO2McFXCXNomaaUxqgyCiEP5uHrWRmGVibBXY9BFwhhhMPEMD4ecTCo2Docs9BJ+ujeRKwst7maXO62GuglAqj1RC2/RWtiidbJFmg/JVq+j565CehX86yXWv7b/dNY4q/OTc1NfivWbaHrqqN4UWb22YXbm/6/SNb0BkDE1TVk6ksRGxnUHraRFlkHh9vjo85+w+K1vcvXKWwT5Zzza+BGrizd5sf8p166ss7G9Rae9WIc1zUJbIxLr2FobtDKUIeBcw3hRL5zx57Iwb2LruKjTNUsxdb6BuEkdhqlrjo3LTZ3OoU2CtTFVOZwc8ctP/yOZ6VHISzFVF3uhfvWdFaX+h59syvPNH1MmGXv5EK887XbGpBxDmkYKqRCjpqzdwmQtvO7jRSI7kD9/nmblWsqy5Mmzp+zsV19yrr6a/cGd1c9+9hu+eLFJ4QI2S2hStsFHgT3lYzgbROKJtoas00anCU55vI+8frN2RmAbnVXT/IeKKlhGCRICIZ9QDMckKsWJYTzuYxNFN+1SjAZ861vf4PrtjP3+jzjo/xJlTtDicGWJaauY0lOx2deHpI6uAqgCVCR+RCKs2liL1oGqdEjVY3HuPqsL36at79J+A2/dbinyZFv44sUhgzzQ6s2DtmiT0OrNUXnBJ5a8KBgdF0yKnHw84e6tdW7fWuJPvneF+Xabzc1tNncOKaoSlw8og0J0hkhGq2XjWFWByo1JcSwud3n77hL3b69OQRVb+57Hz/coqpTewhJZ2qGVpUAVI9J6hVdVBaIqpEl1GIVuZWRmCZI2ZZFzVJSc7A4w+8LmwYh3797g077Iu/Nfhhy8UiMH94T5d2iLg6wFOj3n1L62/7wmDcAphOnz5h810KJheAivcT6/vV1Ez0Xz0zTahajkwlUSF1qKonBY04kOVgVabcXTZx9zY/4T7lz7Y75x+5+zc7DP2H/ElaWrHA62me/2cJFjO25F1fuvIx2YMoaAxfsK7yA0CuFTGRv/SmR1Mf3X2EW4+1lacXb+a5zY7PdlBjYfF9NKRZHSoCbsjj7nyc4a7958l7XW25eO8J+8d51ff/M2P/xoC600Dl3zJDo0sX6lELyCJLEk7QxjLb7KIydgc6YuBoASgdv7+4f86pd/2J6rP7izevp8m+3dIwqXRR43UaRJRhnKiM8HxPnIA6chzdpkvQ5YQ+Edvhb3O0etVCfgYrQFWunYUaQ0xlgSFZB8QjWZUOUF1bikm2QoW0YnEyrabeEf/dlDrt/SPN/9GUFv08pAdMBVFbhGjK25+RRIglAzrKuqHq6Asao+sYGq1GSssDz/Fsvz79D+kgbg4QS+eHnIzl5sltatjElRkGSapNUmlI7MWJKWQbkWrprw7PkOezsH7O9c497d66yuzHHt6hzvjeHR0w0eP91icDpBm5iWGA4GdNsdTFlRVQNWVhK++eAW7z1c4aaNSpWPB4W8/9EmT7d2cczRbs1FyXpRdYqT2O8mQpAw5V1Em5rg12AyQ2YzVNZG5QVFUVA5z8bumKLY4eQk5999MpJbKx3WFmD5NZEWgMpelez+2v7Ls1eafBuKpdd99hKbjc4usjfE71weWTH93IXtXPh9rWNU5Z2i004pJgVlUdBZ6JGHgmdbv+H2jQcMwgLf+/b/hl98eILVwvZwm3a7w7CoddSmzf+x5t40/Xrv8U5wXqYli3ifvBotXvzbHOuU4EApzjHHy1QrZ+Z7Z4CTeHz6rC8ruIjyJYokYhyqm/Pi6BM+ffG3dB5cnuW5v6DUJcSCywABAABJREFUXz4q5DePvmAUOohoiiInTVPcdLsaUQGvFGknztPjkxwvEaFoRDEVZuQswgI47Y/5m5/8/NJt/6725maGr2h//dMt2d4+xgWNSbMa2h1PSuOBDSqy/CpQJiHrdci6HcQoKnFnSKIZOyeDNhM6R8VaFcUvywI/GeOLHHFCkmSR2V0C49Ep168tcOOW4eDoF5wOHpF0J5i0QlTskYgXIHgX61JnN05zoTT9+lF23YeS4BUts8Ji523W5r/NnL71xvHZcyKbeyUbGweUlcYkbbSyU+ZmpRStVooyOdZUGCukSQubLJBPUh4/2ucv//LX/OynT9jbq5hfgve+cZM//u67fPOd21xZzkjCmGrcJ4xPMdUJC+mEe2sZb91c4sFiWwHsB5HHT3d48mKLfulwiSZYTRkUZa2mG1V1z5BYSglag9IBbVSUWNAKbS1pq0Onu0BvbolOb4n5hWsMx5qPH+/xw/ef8cOPt/nV84onJ195if21/Rdj5yfQczWWS973SA23jo+aDx1P1KZq3hcdGWBERfXwwKsptOndV7O2NNsOdXJMgjr3CKJwXkiSBOdKQhhirKfIQSeWo9GHPNv7CYPBgE5yne9+439HOVzm+tLbGN+OUUrtM5QOYAJoj7IBbRUu+CiuOk35mSin4RUqaF4/rSpmPf00shI93feLY3x+fONj1rk392ZDfxV0CUnBabXJr5/8FY933mfkdy697775IOXPv3eflXZGS1l85UnT1vT3tdYEo3BKSLptWvM9xOqZhGSkIdCYiE2Yoh8NLgiPHj/nN08Gf7B7/g8aWf3Nz37F05fbZO15gmnX1P0FqbF452I0RZ3Wi5wdmCwjbbWZaEXlA6nW54A08YQ0yJgaKlmnI3SdmNLBQzlBihKpKpKkjas8rpiQ2cDifI9/9k++xYOHCV9sfEB/9JJWb0JZaZzUBd+gAVufqDPHdLZua/i6HCFM8KUi1V3a6TqLvXeYaz9EfwlJ6mACm7uHHJ4OsUkHlaY4CWStqM9TTAra7QwjgrUabRMqCejEgMkQ55lUOY+f77NzfMK156vcvnOVO7fmuXNrnp2dCdvbOxwejtAh0MFze22NP3r7Jm/f6E73bTKGl5sH7PcLVKsLrQxJIlBEtMHYrIllI6N9fWN4X+JciPIfdV1PK0NiUtBRrkG5gJ8UWC0UTnGU5xw9fcHW8RHj8gHPxyJ3ZgAYEvbEK4NVX6f8/muwWfWDy+xiSg5eX5M6S4O9uYZ18bvTaOXsxXOfieTPiqyVMBickhjLXG+Z4UmJEmGQH/HJ479mtfvHrCzcZDF7wDt3/hs+/yJnpRcYHT8h6Lw+4IYPFECjdMD7akZjq2GxafCQb66rzYIi3qgoLLre9lk9cLYNoAG6aB1LEmcilEJR9rG2x8vjz3m6/xG3r/6jS/dlTSv1w5cj+ejpjxjlUNRznFVRoFaZSDQelCNppaSdNmJiCrSBnDQq3o1yexBFFQRrWxyfTPj88cvXjsVXtT+os/ri6TanpwVeujiJ6bosi6qeWRabgYOK2i9lELI0Je3Mxb4prbFZFvVktJlGYlBPmCry2wUVVWittbS0phoNSAicHB5SDod0rMVPHDZNMSHDVSM6i/DOO2uoZAPMFq0aDOdVFI+Lp9hASKKIo4mvCBXU8uwKG1MDSpGkUCmDG2Uk6VWurnyPjr39xrE5EC/Pdwo2NrfrPjKN8z5ekN6hVaCVGfCOTFuUA1ERQiq2JtWVFCtdJsMRhycF/dM9drYPeeutG9y8tkivXfH979wksQltA+0AcxauLJ5Pvz16tMH23ili2oht4bQlJJoyTEi0RrxgdaSU8iKxj4u4vsgSTQhROVRQEATlA0ppNBptFFlP4b0hVSmFg3EuHORj3n/ylIODNr98NpQ/vttTAEpfUU6Ovo64/gu3ODGZmdV8nZ6fSdtN08XT6OgiCpD69frzPtaXVC2c2kjXj8fjc5O51B6wuf9CXbPRmLPtzjhAYwxBBYpiRJpalFhGozHaajSeIBN80ufT53/FjfWHdLjNuzf/t1TFkMebf8lc54TD0SZKexJrKMs8/m6aEVRF4SbxHjYJAD4IKAtSRSCGifWkmrXpldoUENtCbIr3ntKVVN7FYzIarUwUlvShpnWydepU6gxHE2FFB+Vcc38qQnBYY5hM+qjU8PHmL1nsfOu153VtTvHP/ugd/od//QssKalJ8cGR2ugkfQiIikFBSDRpu0VZFCgJWG1RAr4qIk7axuyQ0hbnYG//hL/5mz8cm8UfLA34i0+HsrN7hDIt0AlaN1xbql4hUDOoe7zWiDGYTo+k3SFoU9efzKs9GE1UpUwkrKXJjQaUeIxWFKMhVB7lS5SPFEXOV4gI3XbCd757l+Ulx8uNHzGcfBGRfdNehjCzGrT165rIfVbzdKHr1+PN4VyJd0QE4Pxb9Fr3yNSb2RWG44pPP/2Co/4wpj50TGPSMKOL1CwcYL3GBI0Szvi6tOCN4KzC9Lq05pbJunMMxhUff/QpP//pLzg52OfmesLtVfjWslIPVpW66KgAxkXJYFQwnjiMadPtzWNbWazfSYkjUAbBBUHQWJtibUyNiHcYFZntrRKs9qTGk2hPqgNWe4xR2JYm7SS0eyntXhudZpyMKp5tnfCjX37Kjz/Zns5i9r8Qotav7bewqYzFb4PMu9waDagmQ3JRbLHdbp9TCZ7VjWrYIi4FJgBoRVBN4rDe5ZrGXXRB0BOCLsmrE17svc/m8cfMqRXVVevqrZt/yrXlb9BSS3SyebSk5OOCqixJUktiNGWZXziaxgM3KMgIuJjlK73YTzX7f+/9uYbj2bF4hY0dpguG2TrXWSuBR0kEm1mrmaick2qfnf7nbAx/fenJ6hn48+/e5pt31+laTVWUBOcRX/8+1KwWFpO1aM11EWNrYcvXM9PHtG7C7l6fT574P8hi9A8WWb3/4adsbh5SlnEFopQBcbWnOSsyemIO1KQtOnPztLpzlCpKhBitoSGFhGk/FZhzmYeYF42r+gTN8WmfkOdo71EhRkLOBTQlrZ7m+z+4x/q1wKcvPiAkh/WPJIjyUT+JECP9mm1dpAFVlLWzjQlshaCUJzgBadNr3WZ5/h1a9vqXjs/RacmzjV3EpHUU0qQ2pYbLxxWqloAOTYOhidlJANPQ+nuS1OKLghAcmMBoXFAMT+mkGSf3AteuvPnayPOcqvIEZVCkuEpwozHOj1G6A8FMV1SaCCbROqY7YvpVoaaoJ6KjVRB5zSwVGqUSjAnYxJJag0vaTI4rRqdDjndP6LZ6bE5EbrT/sF3uX9vfrb0ZPq6n4KQ3ObLYQCvnIqLZCdraFOpIbravK9TpONM05XL+der7I/5QQHxSA7V07BvUE4IKKBJOhgMsmzx58TNeTD6W2+1vqIXsDg9u/hmH5RZ+UHA02aZyFVmiSUxM1buyqLMcEOeKpq4t0zJHPMaIELysAVprO3U6s3RNDdgiAjqEiyKQjfMK4QyI0gBeZHoPggkabS3DKjAoT3hx8AGPNm8yLnakc0G14MZcVPb9v/3bTXmy9z556bDa4iQCzZSK804wCpOltOd69O0hUU81oJWeLgtEZEq4a0xGKB3Pnm/z0Sd/GFHGP0hktTsS+fSzx/SHJUiCUrYuvMX+J02tTKkFMQqHQrVaZHPz2FYbQeNRNfQ1hvfTVcXMdpqEg8ysqhDPaHBKKAu0cyhfRSkQVSGhYn4x4ebNBNGbwBGKIZFp0CDTomVtU6La+nzWzcAQ+6oUFkKGZo7MrrE095DF3n3a+s21qpcjkecvjxjkDttq13yIsSu90ViK/WScHVfTryIWpRKmQAcdEF3hZESgpNVtMb+0jE3n2Nud8P4HXyD5xdXfectaHTpZi7LI6R8dcXJwQDEaYonN1bPpFhd8vfqr0xfGwMyqTtUruiC1inFweA8uKLyPN6PVmm6rS6+7SJYt0motMS40xatN/l/bf8E22xc0ravEd8597nWO6mIkcPG9JsqoqgqtYwkhTVOAqdMyxkybcWf5AaeRVlAxwggKJYaYDQmIVDGrI4KYlFGZ0+oZXux+zKMXP2Es+2LVqrq2+B4Pb36PpfZdjF+gbZbotlbQIaWYNMwW9T5HbPMrx/m6iKN5zVo7HcfmWC6Pos6jJGfHP/5mMw82G6mzMaJJdEypYhy7p0/57OXP2Bk8u/S8ALz3YJ2rSxld7cmMxmpdO1WFF4WTgFiNbWckrQyUqkEmdaN2DaIRpaPqtzagEnZ3jvj0s6ev3e5XsT+Is9raPObRo6cUpafVnkfV7jUGxWHqqDAajMYbRdZp1yhAixdTpxUUWs4XHi8No3XM3Xpfkec55WgcnZWPkYlRDufHpAl88xu3mFvos7X7S4KcUpUTztYCaoo+okkdKCGyVmjQPqKAlIppQEkhdAnVIp30LisL7zFnbnzp+Dx7OeazJ3sE1SKvPF5FETOpC3OqRtOYhutMB7wOsa9DaZAEG1JMUBgJ4HOSxJO2BGUCGEtFm+ORZXNriHdvDphv377D7VvXWGgbqskR45N9qsEAisD4eBRTAeKmnfHQkIQqZJruiBell/gIRISnKI3RGVa1UF7ji0CVB3wF4jUaS6JbVJWnquDwYlMOsDUJcvi75pi+tr8TS9SyMsZg7dm1dZnTuWjnIov62nk11dXoQlE38rqpRpXWmiRLsWmCVhbvzpg0AnKmygA02lJ6mqpMokw8VU3vFgU/K6+xrQ5OAv3JARv7P2XIY0o5lEzdUXeufI/ba99hqXsPK0to3wGfEkJUBY7psUBQgaAj2Wz8Gx+z49I41XjMEc3Y1ObOQBpmulBvxrXBQEaGe7kwB56fti++J14QD1YMWWopOObZ4Sc8O/6AU3kkIgevnLSra4Y/evsmXVOQiD9bOOvoiJxEDKBNElrdDiaxdVQL1MKVsQMPvIRYz8YyGlc8e77N1uHvfz//YSKrvQM2NncZ5w7v61VAkBlZjygQKEYIWmHThM78AjZt4bygjImTso/MFKoOP3UT9tZ1qwYGS/O694z6p3jn8JVDh8iY7nzOJO+zuNzm+z94h878iJPTz1HkGKPqaKmOXqYd942mUqhTmJHZXOlGhkMhQSO+RZV3aSe3mevcRvNmhoWDUmRrZ8jhaYlpzVP4xhGFCL1tCtJyBktFq9qh1StHCSgcVgQrCuOEVCVosXinqIIh2JRc4HhUMBm9fn/2nMjykuJb732DH3z/Pd69t05blfT39jjdPuFw55hhf8hkMo7kwLqRQzCRgNgJojWiLOiEoG3MYWtDqFmbjTisClgTnV0wEUocvIAPMYoLjgRY0XWD8iiXXzw+ln/7yy35n//q5/zNx5t82hc5uMSZfW3/eayRkD/vpF5t4PW8Pnq6GClc1hirlKKqKiaTCVUVWcbb7TbWWmZ7tC7fhooOKjQoupnaTrD4kFJUmk5vmYPTY5yMGFXP2dj5FZoIVOhylXs3f8C9a9+hpVaocoMOGZYslgDCq7WiqHknU6HW2cesc24WgCGEqZxIsyBsjn0W/Tf7vdlaX+P4zqbwJkNTt+GUVYwPlEdlwonb4/HBr9iffAG8Krja68Cf/tEDVjqgpURcQHycCxtGedEKnaR053qYNKlTfnH/fOOcFQR0HWEZFAlbW3s8frT/2uvqt7U/SM3q6dOnjIZjjO5QFg6dNMwPZ5+JfRbxYVstOgtzqCSlCAGTWgRN5R02SSMh7YXoqmk+m704q6qif3oaJUScizliEbyrMDZw9doya+sdJsVLlDlGKU+WJFTi6jRz7JEIyqNFauCFBpKYlqtTCI2Jsihpk9l1Fnv3aZl1rHpzM+vmNuwdjtDJHJgWyoJTLkaeKqYtVFwe1mKTINiY6lQBLRXmbJkDHjTtum6mCVIz0qcKaZeotkVU9sp+bIycHJ8IT595Ch9XQPdurHB1fY75XsLz54eURZtxFRgNBlhnCb6inbWmaQt0U79riDyjFEmoV7deBawIOkTofLAVOlEILYLS+LpvpZcpbqz2uL+k6r6vUn7yy8/Y2BEOR4r9sef5yT5Pn5fcu7L8d8Lg/LV9dTMmtic0Nq0dA03dZvrezPcaOR9RMxIYdZq5+UTTmsJM6stLQBxQqmkvYqvVmkYqTRqqURyPe6EhZLFmRYmi1peSpL6vDEKCC1HOvZARebXDp1/8hHsr/5jcHYoCriQPeHh7RH9wxPaxo3T7eE90gueW+OHsr2rgf9Dw+zX716TwmkdRFFMdLKX0q45XCRJiilBri9aRgi6iDM9AazQsInHopudECaSi8EWFTltMbMGT/V9zd+8e69deRS5rA2/d0bx1Z5WND48RqdmHIscUqkZ6CtDpdBgkydTlSZ0GlEgGW7+oCR5skrKzu8f773942SX1lez3dlafvjiS/9P/+X+kqBTzC0vklSXUuVwtNRNFTQQpWuOUQmcZSaeLJIaqcrSMwRCFzIwxBH9WvFd1v0FQMRoBIhtQ0JhCcIOctE4fhCTKCxjR9OY6XLliKdxztvd/g0r7lFWBKx0RcRpQNbgBMTGak8hUoZSdFhfjTniow3EJlrX5t1ide4cWK28cm8NS5Ec/P+Dg5BR0ynhSIAaUVzENKDJznPVf1RRrY0EnOoIGyn/Wp2Ywkd6/clRFQVXkdDqamzdXSdKzfdicFLJ71OeXnz3j2fMBh4cjOp0erXbCnXurPHj7CgtLb7O+XrCzmbO9f8TOyXNKH5CiwLc6tDs90nYLq5NIJDxF/MRxbFbXkQvao02FUNTnMUFpjXOCLyu8G3N1vcudW8vTfTw6GvPk+QG7kxYTejg7h1Mt9oeeo8PnfPFE86//Zke+8WCd21e+dlr/uczoFGMyZudUYIqCk7ov8bwTe9Vm614XwQNKKaqyilGcTfDeM5lMMMbQbnXp9Xo1QKjCS5gi6Zqoo+kDk6BQU6RvnblQcWWVGks+GrO4uMjktM/p+Jhy+Bkvjt7n7fUlWuqOAjiVx3L32hGVn7BxeEKeF6hWiM5XFNA4bgFVTtttRJ05z4vH10RRTX2uAVZUoanJqbq1K/Z7nqtfNVsTidtXgWkLSRROAQGb1CS8XlGWDpMFMI69/lNeHnzCg+53Xzkny/Vk9//6D0/kJx/ukmBwKgNj0eIQH2KztVJR8cEmEUaPQ2OnYrgxpdnMDxqtW5yc9nnybJODgcjq3O9+//7ezuroWPHBh5uULkP8BN3q4pQH52kHoITUZDhjGVcVZqFDurSA66bQqgXLELQIVkWdmNDUiXyUqBYd+5AqXUEQMpPQFsP+7gnpMGA9aGORpGLiKlLdheqIf/7f3GHtxi4fPn6f7twu2hpK70nEgA+gq5jfDpHZ1egScBhdUPoS8R5lhKAqjLWo4ClHsLT+Lgvtd7Hq6hsH/mAAT18+Iy8mtBZWKXOHUQlVCBGkoAK6znEHH7Bak2iFDxMUgSAGT4aELEZ1GjQlZRjQyhKCt1jixa0Rbl7p8b1vXOf2jCjiF1sj/v2PP2T/pEJnCwzHAT05xfuCZ0f7PN075c6tW6zfbHH9dsZkuMCPfjxgOB5zcjxikgtSaYo80JkDUYGsY7CJIp+MaLczrE5wpafVapPnBS6tIHhUkChnIBYpNUYqsI7ugub77yxM93Fna8xRXyhbGUm3Sy/LkKqkKiuKoJm4isHmPptlxf/y4YncvLbAlSW4pr92XP8pTdMhtXMkNqNwDttK4zXqPYm1BF8Qs9hnEhoNUC8uzDTN+kZFCNv0PQlx0RNqyQkvAalqcBOxpj2ZTJhMJnS73Sn4wjlHWbpaH0oQFCIFGI3BRo6LGqWmVdR/865Ea4VUDmsTSjEom/Pz5/+a1fV1cjmUllpRC+qh2hk9kjJMOB5vMVab5HKKTjp4l+CKDK0tSeIJLuBkQpppgk6oquh8krpHylcOqw2tNMNXcfJvzOPjAl9RQ74ViTKIVvgQG5x1YgkBiqJA6doRNqjLKXsEiHJUIQJBPAnKZhRFQaIEk1k++uzn3F/6PqW8kFTdfuX+eevGMtd6scb8ZOJITBdVjjF4KudptRcoxo7WwhLFwRbGuZovUtFq9RhNJlgV8GUBYtAmY1IZPvlii8P+73v9/Z72YuOE4SROrFXwOClAR8r5CARXKLFRqlxZRKfYTgdSS9AKjEbrs1XVFF1CjZBT9Ymor3KlPRIcLp8QJhMoq4gClIATj5NAqErWltuY9JCD0w9QaZ8iTNCJQlszLZCq6YRqUMHElQwRRWi1QksSoy4leHGApdtZpZNdpfslelV7TuTFix3G4zFKGYq8wrsa3acTtLXxIjSCsUJiIlWLK+tGYRX/qulpsiA1fD1ReCkR5anKIdXohJW5hG/cWef60lma5pMDL4+fHjCcZFR6jlJ1aS2to7uLSNrhcFTw8aOn/M1Pf8GvP9yiP4SFFfiLv/gOf/qDP+LunWu0M0Ux7jM8OWTcP6UcTyjHJVSKVtqGYKiKeMFWeY73HgcEm6BtG2vaBAejwZDJ+ASbVty6s3o2Tn0vRyclZWmxWZveYo+VpTmWlueYX1lgbmUJOz9PH8Xjg1N++WSTn36yya8+H/LRiche9XVN6z+VWZuRpb2ZtFtTQzlPFXTRvipW5rL+pNnaT1FEHkrv/TQ12G63I4OK5gzAUAN+MHpayymLHKQCqRDvCR48ijzkHOQveHr4PlBM9+Vq9y11dfEtbqy/S8suIkFHlKsQH0EhgbodJUZuoWYrVyqi6OLYxTRmA1dvjsVzxqfuZ2p2TdR5EeR02VidWV3DqiPKWD+Kr4oEkApHzl7/JbvVxqVjv9pr80//5NsklCQm1g6Nhiy1pGlKFQJiUmynS5qmsRRATaPnfATV1RGktSmVh6IKHB0PefZy5ytdBxft94qsdo5F/i//93/HeJSjbQIXip/UOy4qgsXRCpuldHs9rI11mSYM1pEZsb7AkulBN/nt6LhMLV0PZTGkrAaImqCaXilAaU8rhW9/5x69uYrjwQZJYiidr6lCCtAVyjg8wlkzHyABg8eHqJwZGSKj8mhVaBJ6LM/dYXn+zXpVAMODPZ4++oDTwxGqexNRPWyaMPYlwUqdbowIxlRSUt3CBEvlFT4RQuRBxiAYKhAfJepFUFgqF51VUY5RfsyN1VXevrXC3ZrK6CCI/PTX2zx7vo3zCWnSIRjDfG+O8URoJwrIqCYjDo/6jIafs7t3zPxcj+/+0R2u3Gkxf+UbHB6OePz4Kc+fbTI4GmNNB+ktIBNFp9fD48EKWUshypO1MgqnIzO1GIwkOIFJMQQGzPUSbty8Mh2nlzuH7O4dUvlAL23TbbXJbFxhZsbg04Q0tQyHMB6OOBpPOD4+Zn+/y9HRMrfWl/n0UGShC9daX0daf5dmdRo14uq0b0ydx/ckakac1U1qu+z5bO152qYxU+U6t2i9UMsREaqqqtF0kCQaa82UUEB5jasaerBYEzJWv0Ia29SJUBFx50Lg9PSQR198zMO57XPHfWP1bXK/x8Hx5wwnp5TViKBKMAkowVNFIIPSuCqAMTFyU3UTs9LYNIlz3gVnRR19NhZCwChNVUuhW2un32uc1UXX37DdT8epJjbQSqK6sIrkv/E3PFvbz3m59IShbEpP3Th3z9y73lI/eynyL3/2OVlQOF/FdTIaZTRlGWhpTafXo+z2mAyHEVhSLwY0sZwSCyxRRTlNU/I859GjR/w+9ns5q9MBPHr0mDzP0aYLU1GwgAqx7NcgRioBZQxpK6PT6UW5dJlxRDR558g3FYutNT+WMmil0Aq0VFgdGE36VL6PqAlBCYqGGyuQtR3f+OY1ktZT3OgQawUjMTSPK4+I3olwdDOti0FMSSoJWGUi4CFoVPCI0xi7wtL8PebStS8dm8xAy1qMhvFoTFkm2Pml2C9imxtRE6RCBY9VDkUCOobvgkETMBJQUsT8rxi8CohYEKGsCozxrK/3uHtzgdXu2fZf7Dqebe4zyB2mvYBNu/i6ztVut/EuQiy1gKuEsgrs7B6zsbPLXv+Q+w9u8fDuGu98o8v61W+xvrLA3vYBx4djTFUyGpexbmgtSTf2oI0nY3SagMrw3lKVxHEMFY4J853AtWvz9CKfLodB5Ec/fsTxaEKStem02lhRVJNxPB+i0caStVK0nifLYgrleH+f/f6Y0aRg9+CIlcV5riwv8P6ByJWVWElYUV87rj+0GRJaaRuFZar5BkRaHoUKYVo7gssc1fk6zmUR1xk35+XOrXk9TrwR3t5M6MaYKC+kA1HULrxSGzLGUJUOW9MJRefqY4qtFLb2nvNs5wMG8kzm1F0F0NO31M7wl/Lg6p9wOjxmd/IY9ARtKpQWXIg0S5aoeyUhavdN0Y1akSQJRseUqXMOL+FMhmTGAnVnWD2WDbhplunidY3ZUwKF4GPOEwHctPYVgqCCY2f/BS+3H/Pg2qu1K4Clebhz/Qo7W0Ocj6B07+MCUmmFF+i2O7S6PYZKR83oeh+1bhxXmAYvnXabosr55OPPeXEU5Pay/p3uzd/LWR0cHLG9tUtVuVjMrFcNkqgZqpQ48D6AthmdXpekleHrwbOqbnblDMKJSmPBztarD2VqEpMUiyL4AYPhIWU1wDLBi64doicxHmuHLC2XjCZfIJxQVTnWZvgKspatgRqxjykiHhroOhHd1khIB0PwIToIn5KlV1nsPiD9EnFFgBtr6+qXn+1La+GEz54f8XzvgFJVeGPQRoNVGFLQUXvKSYTUO6Vw1AAPqTD4OrIi9qOhCSpFicYVOcsdw7fevcHD28ss12wQL3ORv/7FS7b2B5i0i0pb6CQjrQvWqU2oQoWSBJMa1FwSUxuVUJaG7f0RR/3HfPF0k29/4wFv3Z3jB9+/xfDkFnvb+zx+tMHO7imj4wKdtujIHKI6lKWilWSIGFAZWieUrmQ8PKIKIxaXWty6vUQK7IvIyQC2j8YMndCZn6fVahFFgsp4r6m6J4c4EXU6nYisMpbRaMBoNGJ0NGH3ZMzG4ZCdQcXNk3nuXeuw70TW7NcO6w9pCkViW1jTQvmk1olqQEivZlXOnr+O4FW/8nmoOQNVvcU6uzIL2AhTJxmjp8o7rLckSYxemnqW90msaVVF3VRcg5aEeI3iUVohwREkYFTCuDjis82/5fath5yGDVnQN2uHdZ33bv9zjvtH9F/2Kf0mQRcYXeFjf3/k1WzqSTW0PEK/LcYkUINHfA2WUoo6wotj20QojbNuUoCRycOdRVYzbQOvjrmKqEdqAIaK40SI2S2lKob5IfvHzzgZbjGRHWlfqL2nGr73rbf5eO8XjH1VowAtXhmUib1u2ISsO4dOEnwlGC0o8VgV+Vt1jRwW5wlBGA7HfPHFM/b3ji67tH4r+72c1ebWHv3hCGUSFBqtGmLLOnxXEEQTNHgNOsvozi2gjaWoBdKMPtuFiOTRMxFVLMqCik2zotAIUjqKyZggJSohMqyIQoWENCu5fTcj6xwzmrxAJ2OCd5gkoZQYWYlIZGUNCYhFxCM61GmMWB9zweND3VOCkOg55tt3mM9uob8Erv5it5BCNB7LH19d5eo9+PVHT3ixfUg/H+OGCq8UJol5YKUtHk1QnoAlSO20JeaaPR5dM8GrkFBWFUFKtJSsLc9z/+4Kd5eT6T5tbDsev9zneOzoLSziRaFUVBHOi0lEDFlLajOUUozzgqry6EThbIsgUJRjXrw4YDwYs7exwp2bV7h/c4lvf2eN5aVFnj3fYHPrkNPhkNPTMTbvYFttTLtLURWYNCG1GWVeMBqc0ElKrq0ucWN1DgOMSni2OWD7aMxEDN1OBwi4qsCqgNJxn734SBSqY6O2KEV7bh6dZqStHlUxoZiM2R+WDJ7vsrO3x/5ei/vrS+wORdZ7XzusP5RpUtKkR5q20VVC8MQopmYm9xIF+y5GUBefv/E16pLBLBr3gjW1qub9EAJVFZnQXeXRiUyjLWstxmqqqsK5cpoKEwLeOYxJ4jZDIEkSKj/g5dFHbBx/xK3u4nSbvc5VJbIn79zaYW+4RXGcM/Db6CTW65VSKBNRyr5pHK5rTk0NrYmqRKK8zhRcUm9jtj7XNGA3qctZnsQ3jV9EaSQRsKIcilB7/kYwMSB6wulom53DZ6wt3XvlF1opvHd/gcUfwW5/gEoyQpLgA1QhZp0qgaTTxbR7VG5QbzmglaGqKmzaQqsEj5BXE4KrGI4KTvvjS8/pb2O/s7PaG4j8d//dv2E8KrA2xWuLTRSFrzBKTVU+GmpAMZqkldGe60WQQ1kR60E6UvOJoHScjFQd4oSaakzqhlwdLFagLCuqyTiie9IEigglNWha7ZLv/ckNkmwPX+yjbI5RID5gFLgqB6ui9ozoegXiCHU/hg6glaob9lLAEipHmi2x1L1LV72ZB3DjWORvP3jB/smQ+fl57ty/yeoa/Nn3H7D2dI69o2O29g44HRbkwxzXaiMZOFRMd1qLSMCIIWBwGKyyBCqo89ah9CgpWV3qcP/2GqvLZ1j1nT2Rf/HrJ+ydjvE6Q9mMEGLHGMqjlI83q3eUocKjKJ3DJC16cz3mtOH4eMBcd5E861HlQz75dJutF/sM3rvL7dtXuXo9YenKPW4crLK1fcCLl/scnh6DLznORyRJQqmH2HYglBOM5Fxd7nD3+iLzWJaVUh/tiXz2ZIfTCaheC1JL5XKMipRN02bEC9DdECITdZK1SdMW3ncpioJ8PCHPc45GY4anewxO+wwGgQ9eelme19xY+Npp/b5myGhlcyS2iybBSbwmm7oyMGWimYp1Uk+qs7UsuZj8etUuc1RN2nH2upj9v3cBT4kvK6y1JElsYtZak6aRjDnWq4rIluGr2iHEmpvSgbIacVK84OPnf8vSw29f2Kcr6nj8kXzr3j5DN2DcPwEp68yQqmtDsS+qAUtYa1HWEBRUwVN6N2XdEImCjdNm4KnzhTRNSJIs1sFcTHcKZ6jKWfOzVSwBTUJM//maCT9KfWiSGAvYitPJLs93PuHO9fdeGecrmVKfnYrcvbrAi/09SonACi9xjlJ1Ta3T6ZH2epTjSSQDqNuVmmvAh9iKJEFhTcKkcDx5ejmw47ex39lZHZ3kPHu5xXBcIqYFur5onI99SsR6lVGKgCJog7YpaatN0BZ0QImeXmihqdTW+JWmryoSJsfIzSKYoPB5SZkXpCGmCINoQs2sbKzj3sMuTn1O5Y+hGtJOO/hQkSQW511swpXYHIhA0AXgISh8zY0XfIXWEj/nUzKzRDe9RqJuvXHSO+xX/OrzF2wfDuh22jzdOuDtB3d56+Ei33znCu/IFX7zfpsXW9vsHBxRVZFhrAwQdIZNFZnN6sg9XhxIlCiJpLeBRAJWBW5eWeDerVVuJNl0n7aPxnzxcpe8UmTtDBITGdxNiMS3ysXFhIpRZGJjGjRoRVHl5JVjrteOi2WXIdYiVYeyGvHZF3s8eb7BjRtLfPfb73DnzhzXb86xsrLEk8cvGI8CR0dHhBLGZcBmJcrAYuK5d3WVW6tLLCul9p3I05fC9u6QYNp05xYwrZTgJ5Hd3dfoLQmEUDc5Thcx9Yq1jr50raPVbrcpJjmuSPFjx24/53jwgtX5Pg9v3/yaNPcPYJlaVc9HfymJbqNIkZqo+vyo6ljUr+2rIgHhDA04azFSiX+TJJly6sEZu0Mz8QPTSKqqKtIsqaU24lyTpillWdYL5DhHNQKGTnKCKvli62P++M7JK/s2l13lrVt/ypOdx+yePsfLKUo7FI5QZ2QSmyDhbJF1GQ8gMHU+syk8LREVOMt0caZV9ZoxVTOvS90D1gBI8KimjxRQWgi6YlQes3v0nNPJPgPZljl17dyA2wBvXV/lw8dPOfRC7qMEiE0yVBkXlKQppt2JqG45c8BpmhKAsixJMxulQ0LCaX/M+7/55KteDmf79Lt+MZ84trb3UDrBJilFUBSTCTrR0zDdVx5tLYXzSJYwt7xIGTzBVShrUD6Gxqru8I4URBpDHAxHRZKlFIXHeKGVdHDjESd7RyRYLC28M4ClLHLSTHH9+jyt3oDcvcRaF1GKEqnzfcixVhGwQBLrHxqUdjUqKEUB3k9I0pQyLzGqh5IWbbPG8vyXs6t/9sUzTiYFpc0oR45RfszOzpAPPmzz9v27PHxrhW998za376zzcnubJy+32TkYIKUBbXBVYH4hJS9GeBKSzEYHWkuJ+LKkpTRXl7t8563brC90ptv+Ylfkr3/+iFElpJ0OJskog8daBVoo3BjExfZBDUEcoXKIjjpeaEPHaLT00Vox30twPsW7LlXVo6gKJm7M860J+ye/4fr6PA/uXOfB/UXu3lpkd7PP7laLrc2XbG7tQxXoLszzzt2r/OCd+9zUMVVpPDx5tIFOehSuRJWOxcTWZJgOpXRcxQGqZqiOlFMKo0E15ML1XWpQWAOtuTZqrkVVtjg+OETRZqvvOP7oC8bldZ4NRO7+Hk2JXxu0W4vM9VaxxxlFKDC2vo5CrE01UdRFi71UjQJtfG2W02+2SViZi6muuhRQRyQNTdFUiNXH/EtjWuvYMBw8riwoquIcCCPLWtgkI2t1zohzrWJSjHHiSK1l7Pq83P2MI/9Mls3d6Q5Zs6JOw4Z8793/lmF1yuebf4Nu9VFWKPKKVhJ7vxQaj0yh9ePxmHHd3NykBJs04XR8fIyCGlorbQxlVVE5R5DI1j7r3JpuAZmWC+vILHI+TVPpkdy3OQcOa4UiHzDxpxycbvDWqnvlfCXAt9+6xd/85gN2NsdkC4tUQUUHBJjEkBeOhdU1jjY3KYucTppQ5RViNE4c3W6X8WRIaqmBLYGNjX22DkWur3z1+/B3dlYbmzscHg4pKiHRgUBcucRoWGoSkDodoFVUBU4TdJpSSdPMFrMIzXUWn/qYCtSAblgrVKQcie6aajJGOYlIPZWitaXT0bS7jofvrCBmE+QIJTV9kmKmd8lMa1Xx5qoQXH3G64imgWHqDBUMmVllrnsDo97MA/jZTiX/6j/+gtx5Km9BdN1QW9Ef5/SHOV9s9Fi70uPBwzt893t3uX77Lh9/8oSnL3bp96N0x/H4hE6vi20vxnpajRry3mFcwVyvzbfeusH9a12Sum1+qxT58KNjPt88oCKpgRgQ4SK+Tg9EYEmIvqse8QguiWNfxd4uX6BqFg1tM9Bpff4ygrQ4HRwxykvy4ojRsGRvZ44rK/Osrcxz/9Y8Wy/nODkeEvwc3XaHa2sdHs6d1dSOj4UXG9scDSzz61eZW+sR8OT5mIVeN6Zm5fylKXU9xNSXE5w5Kz2l2onXW9bp0l2xGGnTP+qzc7gHj1+SmIL9UmQt/dph/a5mVZt20kOrFsEPYh+latgWmubU83T6s5HAZTWX1wVfv0tUFhT4cLb9hhGmcQ6zkhxNXah5XpYVBMWkzHG+z7Ptj3jv9g84Hb6Uhd5ZRmVB31Tb5WN5cPUfcXJyxGH+aySMiPyZZ0watv595xx+ipS+/JhmX79Yq5qmCV/7vdn3mlRn8/7Ze0qpmmFOEB3I/YC945ccVVsMZF/m1Nr0w7eXlHo+ELl3bZVP9zYY+QqlE9pZC6lytIq9lJJkqCTDl+UU+KKUqQk1Qg0a0ZEvUKKD29kr+F3sd3JWRxOR//f/+EMGg3GEW4vFiY81vJkaA0S23qCjFkrS7mDThDxE+WMz7cCO35nWuYhcVcroKUGi1QYTPNVkhBQ5mdZIFWnoQ1CkqdDqFNx/uICYX6MYRFiRNpG6SCkiqWVcpTWT9NmD2LhMdG6ld6RKCF7Tbl1jZf4hiZ7Bhl9iz17usHt4gtUZ7TSjoXlxzlNUJduDgr3hmM2TPgNneVDeYb4D3373AQ9v32Vrc4fNzU2OTk5BOyajI0plyFotfCgxbsxcqri12uatu8usZ2dX8Ob+hM82DjiaBMjSafoBIEhFXflDT1ez9UWuYsQS6VJULMgGj1IhejQtaOtAJyjJMGQsda7hJgVFPuD5iyFbz/ZYWUh558EdHty/wlsPbnBFKbU3EblySeqtLEtECU5cLHo7qXmlNJOyIFGd6TWklNTAF4WuUzW24UJrnNVMWiUAohPac3NY28XTYjAc83J/l1464eaV9psv7q/tjZaoHt32Mka3anUFjdKKQK1vZJri/kwDqzQT+MxLMhOJvdJjdUZYff7z00+dfe/SKO4M4j3rIHwtKFhVsZYS61iNs7KkqYpsK5WiLEq2Tz7mi+2fM3/7KgBVcShJtqIArqUP1eOTD+X4cJfxxheM3SnaprgAhqh3laVtrEkpyioCmLTF1RmCmOKv+0zD+WNL0hTqCDI62QvN0eciqosDEBf4QiQ7YAqwqCXodZxXg3GMy1Oebz/i4c3nLF59VT3izpxS/8//+Ei6n+4w9DU9naofWiFpinaOpN2hmEwISkENmGvS+FMCXjGIaIaDkkefP3v1pP0W9jsxWAQPLzd3GOclSZKirEWpM1bgZmehXrObSPNvWmlk6J4pyJ6T/lBnq7TmeYRb1lBIH0UGpZxgFJiaVj9CaAs6nQlXryk8h4gax+js3CHqeIJrlnWFR3CoEHuepgieWooghs2WdnKDhe5dNK3Xjsl+ENncP6YoFFVJdHwhdrAHA6aVQtai1CknI/j1h8/5V//6R/z1jz7l6LBifc3wvW/f4J/82Xf4sz/+BtfW5vDFKZKf0NaOlpTM2cCdK/N8650bLM0EeR/vO/n4sy1e7p5iO12MSbDGRFYMDYRaVgGZ0cKsHXZT7FYhkvyLoHQaaxJAUBVe5Xg1Jugxokt0EsEyaWcBmy1Suhbbezkff7bBL3/9GUf9CQCXOSoAr6DVTTC6ZDIeMDjtE0ohtbGHp/KCl+Zm1FNHZVCx1YFIAqxqBywNUrKOD8WXBPE4DybL6C4sEzAcD8YMR5M3X9xf2xvN0KLbWcKaFqFha6BZwTeMM6/aRUaK+J1L9K20OpuML743872Ldi6NqM5IY5vns/NNUz/K83xK4eRclMRJbEa3vUBiNY5jPnn2txT6mH7Ymzqqxh4ufku9e+cH3Fp5l0wtISFBm6xuCtZTcEdZljF1aV4lrL0YdTbfA3DujEZq9rOXjcn512tMpSgaKqZGwSLW9hRoRRFy9o+32D9+PmWcv2jXlxdY6HawOkY24qra1Qa0MZC0yLq9GjsQ20qkbkcS8aClpmWMbPj94YQvnr68dFtfZr9bZHVa8vzFFvmkwraSuLpSJgISIrQv5o2bRl1jSdoddJripe7NUGraBtBwXU1VcesQq9FzUtpiEHwxIh8dEcox2hqCytDKIrbCpiVXrkN7vs+4OkV0QRQtbCDxkbVYICJWmrQgHiSpNXBgKhFC1K7RtOgmN2iba9g3SNcf92HncEDhFMHbmE/Xggs5AY/SGkyCUgniE4rKU0085eSA/tEpz58t8vDeVa5fX2D96g3WVhdZXOjivbC6tIoOFW1TcevqIt+7f8art5+L/PUvNvn08TanE0g686Q2weizicPRXMgR/RhmnVUcIXSAoD0imqDakSGbEpGKIB7E1Y69QFSJEFemWXuJ0O0x6h9zNJowfHpIbzFjoxK5mVzurEwGOq1ATdCSUY6GnEhFd87Sm+tQhJp5QJtYU6yd0XSvYwJ+OqlB0zIRdcKMBecm5D4hL8CH2JReeYkpzdr2vMjWPhz3c5wEVpY63Fn7uqH4TdZRK+rD4/9eWmkPRWz4VqGJbGNmQi46LMUUMaiUIvimTCDIxc/JK69eMjG/Cr44966KezMLXADQ01X/mXRHCLGRNepUKbSKpNvtLEHUiP3BYzZPHnNzaf7S8Xjrxrc5Hf0TTofH7IyfIbZAa4VpQB+1FEijs9Xs0WzyrtnPsyZgi3MlzoWp6CnU9EkidaQ0c/zqDHFJ7UiixH1MnJumHFNb5QFl8MozqQYcn25RMrz0+NaX51hdWuDpYBgbfo3GVHV5RScoC53eHH2b4F3dFCw1ibAEmkshZqwMk0nF3u7hpdv6MvudnNXxSZ+jwxMa0a2mQOq9R1SIE2UdyguQJAlpu4VJLKUXlDagiJyAYYZ5vH4yTV/VaYWIMnRU1YhifIxSETKrhGktStsJ129lTIoXOE5RukQpy3m461k6QilHUA4tCqa9TaEGWiiMTgkh0MnmmevcwrD0xjF5vnnMwfGQUSGoxCLaoHTAaouX2BwdZ14DOsFqi80UuJLtg2P2D/fYPdrj7t4V3r53g6vrPW7feAfx0Esgs7B+SaQyHMHzF8f0+wGVJThX0mu167qOwkuMSHz9VS+RsT0IaHStvwNKBbRELRrHWZ+XIsoDEBxWKVBCOzVUBFRwBGPQnYREeoyPA/3RKU83jrl17fKLH2BpLePhO7cp9C4bOyOO9w5I2h0kzFHkFd1uNzoiHetRUZwy1A6qTqPEUsTUhcVrTaPEIVVOYlKUMbhKan62SBfT3D27lcgnT/t88mSb46FDac3KSpej4RU+PvSyNq9Ze42z/Yduc91FOu05kiTDUUaEm46Q5iaymaLUL9RbXld/ORctzERWX2Zv6t+adVbRUZ5FVrMM6I0gZFk4lPKIM7Q7GZUbojsVj7feZ23p7Uu3v2huqcfHfyXPd15wONkjLwd02slU96vp/wq1I75sX2PG8wxY0SAAmzrblHbqNcd/8XWhouETVbNlDiLS0AdqwlyPaMdxf5eT8e6lx7e60OLq6grhyRFat0gsiKv3S0eu1Vavh0lSxBUx/Tg7zvqs1GNMQlHmHJ30ebYlcvf6V7u/frfI6uiE4XCMNSlIrUsjEQWIjjIdU2ZgrbBpOiWanEhEndUSk/UJrHn96l03KpLiNtyBWjQhlIRiRJEPSJRD+Yj2McqjtMOmBbfuLjPKP8FkYzQh1l2UnkZyOkTiRaVLhAqtHKJSxKVoMQQ9BgTvBGtb+NIz11tmvnedTL+eYX2zFPlX/7+PGY4dXll8qPCVm6YvNQkiHk2sBRkTIulvCLHjPlnAOcfmUeDg5CVbm8/58z9+j+++d4tbX8J3NylgOBKcj/IdxsTGaQJRMVTXeWpiZIk0HfMGUCCqXonVqCQ8XnsEiybFhCy6CyUoHApP6QpEXFy/icXYDGkrtEsQabHbL3m5fTnF8n4Z79i7b11DtXsk6R7u8RFVMJQTxcnpCWEVspZBZSlJajEqio9EeGxdzxBdc07qulk4rimNBFQosIbY92dAI7RaKfNzLbJOrDsenpZ8/PlzPnt+AK0FknaH050+R/0BO1146+YaO7nI1a/5Bl+xTjJHtztHq9VhWA1qaqAzgU6UcDFldT4NeJ64+uJnXzcpMy3gv86R1WAhkbpmdpHhoY6o/Pm0ZAT01OxAIWAAVxQ45QnK8XzvEx7c2eRIKllWZ0AhcQeCUfR94P7NXXbyD9nq70RwhbU47ymKot5n9QpdUpCGdb6OqrQhMZaqTv81KdZQR6a/TToUQJTU6NkEHY+GSNId2dGVsmDAVRWpDhwd77K3v8WkOpR2cj7VebWn1P/1b8fSbr2k0AolgcTGrJMzcR5pdzsoYwgqsubrunTTHJ+X6BOssfgKdnf32dz86kwWX7lmdZSL7OwdcnI6xLlA6ap6ZSV1ztdi6vqqKAjaQJqiWy20jSmYKeZfzgqxMnMyzk6mihGKUigfoMyhzAm+rFcscfbKUk1vTnHvXpcs7UMo6wv7bFWhlJrCyBqE4mxofPY8IN5hlUWFLu10jW77jHj1MpvksHVwTCUGlXYxWQYqNsNpMRgSrCS1cqcgvkLpCmMkFkO1jl3idMgry8bOCds7+5Tj32JlGSBRgPMUE4fRGQHBKcEFX6f86jTtWeKBphB7tuqqud4kMkMriZGWEmoZFYV4jXdRLdgkKWkrgURwKnKdORTeJ0zGgd39EzZG/pUDMAkcFNHJrq3P8f0/fcD3/uibrMx3sC6npQzDkwGjfs5kUlGV9SpTFF5D0LFnLxhFaFimARUUWuIRproFFeSjIcP+EeX4lE6mubIyz/JiwpGIjF3FxEGhUkw2j0p6TERxmle8PJjwweNd/vaDl/z02Ug2Jr8DLO3vsWWs0k7WaJt2ZJSRWppeq3ie6tFqkGyzj6bP6OID3lyLedP/Z1+fOkZMvVg05xxj4wA88XlVCxw27OjKaJQ1nI6HVMFzPDjgqP+crb1PCOTntqfsqpJKsWDX1P1r3+b22jdYal3DSIKxiiAuLux0TXhQi70Cdd0n8hciBi010MOqaT/W7Hx4dpBvWjvV98LM8CilUPoMdSlipmPi63nodHTEYX+XCn/Zj3J7rc3VuYxeq4UWjbatCMZSgjJA2o7IQBGYyZQ1+yuhrj8bS1CavcMjNnf33nAcl9tXjqych6dPt+mPC1QyjzGRGilI7GlIdYb2gqYON21Krg3txSWC0rWnr3uwtdRpuHgOjDL15BhRJJKC06CdxwZh/8UmXaWZOE+a9SgqiwtCGoTluQwddjEcooxB6Qy0jrUjooS8SBGb4gIxHYepc69lnPgUaFEY63GVx3KbufZDbDL32vE4dCK/fnzA7sExk9DFV7bO4ceaUfAgEdg/zdc7KTFJXN14H52j1obMJIjOkDDH0YBINvsldnUJri9nvNyYAEtUY4vXFSoJpFkbYxKCi8JwRmu8r2+4utDqAmiVYG2KUSl4T0JSR1E51C4B0QQS0AZt2oyLnKwTaVdwEtFhlSfxnhaWTFJEny/abh6J7OzBxy8H7I9PkFRYX7/G2+91eHj/bbaenfDk6QZHEzg5HJOPHXMLDpMGlA60e23a7SxKneuExCYRxegiK4dRgUQZlGvRarUZl+B8QTcDnY+4tXqNlo0l0Z3TIwbOo5IWWdZlZf0KhU8piwnHJyX9U83mOOflySE3ByU/3xe5ugQ3v+YbxLDCnSvf49GzvyTRgcoJlQ94ZcGoaTq54ckDzkVLIZxFGMZEkmolgjiHdw7xFyfp82nEWQaL2Qm9gUl7CWesDhcQc6quI8VInJm/Yfr/UgKmneGkpJUIyCGHJx8zCZuvjIVOlxXAnd676pP9fynH2zscqU9wMmAw6qMTi0oMk3FFYuZiD6p2ka/UKBQpziXYdpc0FaoqZzQaRbRgjRgkMFPHmwWp1Mc+HVw9XfSHEAiSg40STBF7lGDEULnIRG9bBldOkKRi+3CTYF+VIAG41oVbc5rhYWDsDL6V4HVUgxACThvmV6/TPzyhbRWVm2XpIM4rgKuimkVQwt7RV4+svrKzynM4OupTFhViPFHqIs79tq5VRbSxxOY0q2OkYZM47dVM30DNd1c3sc1YXBnF+kQUJ4RQFqiqgtLFlT5QBcFa0MpzdW0ezR5KRihp4J7RUcBZATI0uaRG5VM1f2I/lyiFEYWSFGtWyOw6Rr8eBViFipPTAUUJlajokKXu/ZG6HoSur6joNlWNiERUDJubdCcg3hBMh/6wYnf3y0/oSlep//DTLXm522b7tKQsx7iBIxhPu3S0Ou0pSF8QfJBa96eOs3xzvjwSAsF7jNJApGY6I3NRtSS4jiukYCJwIwBi8GUgFAEpPZ6CbmsZW6OaDqqhPH50yA9/+oKR7/DZ1gtOilNoea4eHnH32i1urq7w9sNF7t9f5G9+tcuz7T1OTo4ZjU5pdVM6vTaVh/4gZ2FujkiS4tAhila2khi5iosQYR8iJUxZljAZsmShk6asKaU2RWQ8jmjBVrvHwsICC3OGSnVxvkWnYxj1S/LJKdunI04mQzb397l9dYFfHeZydTnj2j9gEEZXraqnJz+Uhe4q/aOnWG1xxHS7l/Cl6Rrv/bmIqmmUTZJY6ynycjrhnndGZ2wQF6OrKSpREQFSbwiGm+Dk7G+Y/o3Xt0ZpjXaOEBxFVXBw9ILtvc/eeFzrvfu8c+sH/PzZBsOiX6OZPfiATiwoC15wrowNyjh85Ul0QitpITKmKN20HvuqvW5kZ1DYTV0eVZdBokyINCToUi8SIJYIjMf5CcPilNPy+NJfX+zAtcU2T48r0qQVafCMRzGJciBJC0nTeB5DbDCO820980zptSIauXKB7d09dkci693f/j76ys5q0C842D/CuRBVN0OICBDUVFxsurMolNG02+34nvqSKLa2iN6r/xPib5d5EVN/ZYlWTX68Ro0lFbfvXkPYQGRmsN70+69/N4pFSkI3W6XTWmHuDSjAIhd2tk/ICyLFinWIjlIBTHu64tcbyH5QBhAkSERONekQFEprEtXm9KTP8cnldZ+L9uDda+Qm8MnTPfaPK46OPGUVqIohyuWx9SGzJK05VNohd7GfRONAHFocmgqrFNZqPFVciCmmvUyx1hXwdU1SaiBKY86XFOUEJRPabbiyuoQ18SI9nQgfPH7J8xcO3V6B1KIloXCO7Z1DRscFR2t97l29xvxCix/82To39pbY2jxkc/uAg4Mhk8GY+cUFut0WLlHoLAp8uuDwOt4UWltEeZRxODy+VrHFexZWVphbWK73FUbDQFkI3VaLXsuQGICCVip0raZrAnk7oSw9w+GQk+0Tjgdjdo9z7t5Y5zcnIlcXYP0fqNPq9eZZW7rFy/0PMNZTUdVRgK+jgDcDH84BB0RmkHD6UpDB7HfeZLN9W6+iBF/flDtrIdQgscahakV/eMze4QsOwoas1kzsF63bWuDm9bd4fHSTwfEhVo8jAMUrsiQluNig770nzSxSEvs4O5o0g9x5ytJdMkmed1Jf1lismn1v/jWL0RrooLSKaMEaMBXE0x8cc3yyf+nvtjuwtrYKzzZj7Rhdt5DEedpaS6vVIk8srii/dHzLsuT58+cMh1/+2Vn76s5qMOL4+Dj2TiUJwZmpBktTRDTaxJ4eFJpIN9KkBGYvthiFXAg9Va2cqaSOUMCEQD6eIC426drU1onEgFYVaVJw/docwQ9QuoZac/6kXtbXddHie1ExWEuLbvsK3ezN2lWDYcX2Tp+qiFEkEHmz6uiquXW8EjS6Tkg2C7+Gsjf2OwlR3tuaQD4aU1WX9z7M2pEXWTZK7YjIyu2rHJ1U/OyHn3J4NCZ3FboAxIKOQbtXnjRpI0FFyn8JKPEEAlZLDZt1NbJO1UCMMI1SI5O+Q/BEmYUYTfuywLsR7cTx4O41blzvYYBDEXn/8Ta7JzmlbTO/MEe7Y0mqFs4X5Hlk9ihe7nByPKTVUnzv+99idSVlfe0aN25c4+NPXrCzfUA5HuGLnPFI0+6kzM23aXVStNLkNWzWGsGpisJXOGnHSF5rlpeX6dW9aZMc+n2HK4S5+ZTMCuJGiOQoBUY7enOKuYUOLvRon3Y5Oj5lUglbRyUnwx2uLM1xtL7I5wORpQ6smX9YTqtj5llZuoOWeSTkKHK0NXguTyVdvBdn61RnYoqhrnuniMg5brymjtNQuc3+1uw2Zn/3sn34MoclxMlbB6L2qtYYoynyMQenG+T+9bDrTF1TW5Ofyd3r32Gv/5LK97HKUUrNdRlKUM1iOra4GKNptS2iHWVZRh2o38Eu691SqmGmjyKyURQxOioXAomps0niGY5OODrZ41SOZEEtn7uWV4xS/9P7A1G8iCRSdR8VEqH02irSVoJJND5vpJdmQC34s+hKFGXp2NneY5J/NSaLr+ysTvqnnA6GKKJOSwT3NAq2dTiuDYHYB2O0ImvHNFoIAUwk/dHTwX190kCjMCIYEcrxqMbvxxA/bkYh5LR7FZ25krI6Rbc8U/HGGbsI3pi1Vy7woNGqw1zrOq10lTfZ8fGE0+MSCWnsq1BRHbNR5/S1O1J1N25o0oM0aQ3qfpWY8jASaGlYXF/i+vWrl27zSEROhrDxfJcf//Qz/urTLdnYHdKe6/GNVcNC95s8e7rNs6fH7B3lDE8gWE3SVpAE9Lyg6i50bdLaqRaUwUHweJWBRFZ6XZ+JGBWHyE4fXN3spCPIxQWKfIyEMb1uwrsPr7K6FPe1BB69OOSkNKh2F9VOkUSR2RYt3SJrdbEmpyocJ3mB6+eM/uo3rK2ucP/+TW5ch7XV2+ztXeXly222tnfpDyaM+5ZiPM/y2gqdXoYoV6dYFUErvPOUhaOqPF2lWVrskSTReX6+BcPBBAmaTpaSpQpj4pIrTUB8DjryZCixtOfarLe6THJwRcVgOGS0dczB/jE7a/Pcu77I81xkLoPlfyCRliVlqXuHbnadojxCtEeoMLqGa8pFpzFTN0KdRex1rjwEoaozJdSToTa1CrDEBVRVVYhvyMHqe7m502eSMSKCFn2ejbz5vJylyl6X5WmcoYjgXJzPynLE9v5nvNz5iJOwKYv6xqXfnmtd587V7/L5s/fJB3s4VaEkSr47X2B1bBh2FahgaXUykhQm5Yh8UhIJaBvg01n67OJxRHuVAQTOUqJxctY05IGqRmlX3hEFaGOK0Booygn90QGByx3IylKPbtvSn3iC2BrFGM+bsYokS7BJQhEC1pp6nOv0KudBFy7AaDRhPPo7jqwOD44YDkYRuhjihIxqpBvOWCe8CNpEzq203aqL+ZGkMtaz1IzDOm9BBDEKoyOgWnlHMR6hRDAqiWg35yMlvc5ZWdUY26cIQ7SqIhVI/VuXIYkurvLOoW5Eociwpstc9zotvfTasdifiPzVT58wmShQbbQmak/R1Ko4B8V1dUN0/KMQU9epRBBxWFFY5ciM5xtv3eHhw/PAjj0vsrk74Ye/2GFjY4+NF5t4X9FbaGFamrXr67z77tusXclYWLrNvYe3ef6s4KOPnrO9e0TpKrQx5K4ELdg0JWun6EzVOloQ8HWoH8EvnqYbPSA61NIPMTUrwRDKipCXuHxMZj3X1pdZW0pZVkrticjuCeweF1S6jU0zJuKZb7fBhQhmSRPopFSZI68mVEE4OB5xcjzktD/gwcPb3LzR5e7dlPUrdzg5ucMnnz7m4KDPcDBgpyzozPXI2intbooxKW2bgZSEIqAcdDsJa0vdOkaMfYKToiLN2mSttAaThKi/EzxeQONwXuoVaI9Ou0u7BfmoIrOWKp+QT4Y8fbnH7t4ea2sL3Lp5hSe5yIN/EHD3lPnuLa4sPuR493FUsfYOZeyUYfVL01UX6lCNFUUx5e1r6llNijCEEOuQnN3L57dTZymaG/DCdr9sLRGBwkLlXeznqxffGDidbLKx/ynv3Pzz135/Tt1QO+ETubb8NieTp4zcBBV8LXbaOJaIqs1MQpa2CcGR50MqH7A2hddEp68bx3OvNa/rM0Tk2XqhiaRiW4/U87bWUIWC/uQQfwHx2Fi3A3O9Ftt5iXhXT26aECpECSY16Cw5I+6c7l+TlQERTaNPWJaO/f2v1hz8lZzV4VDk//Hf/9vIot6cSBphsQCGWuY5IDqKC9ospdVu41Skz0cncbJrgpiLFxQqAitqyRETQnRWoxGpD9OIzruSJNMkaeDm7TYqOcZKBcqhdSRyfbU58PU2u1rRKiFLFuh1rtBWK6+9ussK9vdPqZxFqQSUI4QKrZN6uz5O6kCEhBNpOnTU+9I1rBOpUCFgjaaXwu0rbd65s8ys0u3zgci//+vP2No55WgQOO0X5JOELOuSD6A4ztnvH3PQf8LcfMqdW9d5cL/DH1/JuLL+Ns+fbLH58oS93VNkDGXwFMmEUKXYTtSTCqobFUmkIK54DVHCHJQOiFR1v0dsKJag8BWEKmAksDzf5q27V5lrx/H2FXz2eIfcRaopaSXozFK6HFwFYlFisTbFttokqk3ayvCjkuHxKdv7BwzHI549nePq+gp3bq1y4yok+iHH/QE72/vs7B8wPNlnPG5T5POUY0foGcoyUA0VaVCszXVYW4nMFLsicjI8oKQgy7ooG9GZ4hVeJZROodMWIh6jk1jHU4IJOQowiaeXGqQ3R1mknJyesn96xM5wl+2R49aVNd4/FLk6D1f+HjcVZ2pVncpLub72Ds8OfohXh7hQoVUEN112y11MVc3KZcw6rCDgXJS00Trql8VHEhUEOJPciDWtMPPbMgVXnOfcA9HnsyrNHHQxwnLOISFgTFqj6hQ201ThlIPTZ4yqy4EIjfXUOvdv/BH7p59THPUp/AlBuSmprQ4REZ1lLYwxjIshRVFNkYrRyb4+4ySvCQmbhbHSMo1Oo8qUR8QRgq/bTs/qcQEBKwRVMsoPyd3Jpb/dSmG+l8HuEFSCURF47xsgnFXoxEY9vhABWmf75WOQVx+T0QlFXvHyxdYbx/GifSVnVTronw5BIhyyyYlOo5NQD1gIiEkwNoaGSdbC16tzZIYRmJnFT63BQl0XQddtqz6gfIUvcsQHFBptEkJVYYwiyzxXrliS7BQRF5Evuk678ds5qllTymB0m9TM0UleH1VB1KA6GU6oxSsIFEhwNZW/qhk24mdDjTRSUounScN8HgEAGkdiLN008E//5C2+d2/h3BW5s1/y/ofPGZQaUT1UukSnHXP7LlSIdZwOCw4+22FuMePFzhHPNld4cPs6t6+2uXvrOrsvr/P5Zxs8f77LYOIZliXVOODEoL1FZwlGAypC3eNNoc76s0QDUcoAbVHeoBzoILSNYWWhy+0bq1ytET4S4OnTHZy0KNG0jcZkCl9VWAkkKrKf1KIlscclsbQXDWiPKz2ucmxs7nG4f8x4kHPr5lXW1ixXr8xx99Ycj75Y4skXLzgZjJkMTimGQjW0qGCoRimZrlhud7hbO/7ST+gPB5RVRdbVKBMJWG2aoEyL4EqMTQi+QAQMGnE5hXNYNK00BTQ+xOtwKVvG9LqcDMfsDSqOTl9Sjtbxt9987fx9sAV1S/1m419Jqhep1D6FnzCF+r7BmvpUk65qoiuoU3ja1Cm4WhC1Bl2kNeIsy7IporCxaeoLLnWUv72F2okFbKIpi0Dl4+Lc+xOORhvsHD3j0L+Qed0luWQx21PLarP4UNbm77N//JKRPwUVf29Sxh5Ooy02S1BaKMZVLGtojauifNLvYzGVqjjH0xiaKNShdIIyUeg2wvgDQZVMqj6Tqk8p+5LOMLADpCl0OxajAi4ImCjdE1OJAWzsTxNjUdNzERuRG7FIqaMxrS15OWFn/+ArHddXclZF7tjY2iYvK2wyV9N2aEJNuR+bzNS0LhWCZ3VhPjKn11xZnsiSrYgnR9VHobSacoqJSQjiCYVjqddj9/FTjDis0rU+Vk6WZThXgUyYX2wzKbcJeog2rpYAqSMZifnx8+mC2fOgpsXChkPQO8v8yhpavZmh+3gwYlKU2CTDCRhzdq82hU2hLm+KoelCD42WTZriXUmmPL4cIyje/uZ97qx3zm3n+Ujkhz/dpJR2ZHZWLZzScVWkDaJimkKZDomaZ1CMOTg9ZWPzlBfPDnl4e5Xb15dYX+3yT/7iJm/vLPHZ400++HibwluKSeQNzMcDbFvT6UCSprgqRn5JklD6HAkhon4mJVo0VgxKJYzGh7SM48aVZW7MzNFbOyUKS+mEtJMhOhCkQksFAt5XIAGtLCF4go83tIijs9StG3srIMUXjqdP99l4ts+Nm1d4eP8G6zfgm28vcX19iRebO7zY2KR/coobKqpcYdQcV9YWeHBtfbpPo/6I/mCEbbUJOhINtxLNpCrxWGzWwZc5mhQVBMGhCaRGMMohwRHQKJ0iSpGmbXo2RWwLOyk52t3ni40DpByz50Su/D3vy1pevMXtG+/wq0efY9stQo3GfTUdNJOiqlN0ypxNpk0dCgVhhukBoiMqimLKBtHtdtFak2UZ7XZ7qklVFEXt4M7AVOcQiK6OwMx5ktvm/RDCdD+MifLsoiP5dcBjbeDwZJONnUe8s/79CEt/jXXsMt96+I95/PRDUrWPMY7T0z5zvQXyiac7N4e1mnExpCw8wSuUicrC7iLobGp1BVlfmM+aGpzEujIiJInFKhtFKKfaWaoGSMV6bpoE2p0OeV6SJB36owNKP44K0BcsTaDXSzHKY1Tk2fQ+YJOMvCppActX1jl+vkFSA+Maiqu4c3WbEiA1KnLQn7A/EFn7LTXmvpKzGuUFg/5wJgpqHjE3iQp1Gq/+iNFom0wh641TiBcs1InPeqAjgWVQUUwtemFBqoqQ50hV4F3UnRKjI0RZCZ2uodUtSZIRRahRRfUNMXtCZ59fzFufy2WLxeo5WukyiX2zsxqNSyalJ0RZ3bjamzmqc2AOFc5qpiEyfVRlTmpAXEFKyb07d3h4d53lTmu6g4dO5FefjHmxcUTpDE5rggl4Bd7UIGFVN1qLAVEYurQ7CcpXHBxPOD76lCfPLG8/XOf+nWusrl7heytvc/vB22ztjPjooxfsHx2TT0qSTkIxcMwvzpGlC/VioqKVJJQhoRgUzC/MU0wc+WhMmEwIZc7Kepc718+Qk4fjSn78/h6DYYFTLYxSJEaBNFBkUMHXRfKIPpyeDyJIQltD1ktI0zY+Lwm5w1clL17ucHo6YOXlArfvXOP2HVhdu8riQouXz1+QHw+RRDPfXeD+9Susds/Ia4eDCZNxhdJtkrSDNgnomN6sxFEUQzpiYq8dglHUUP1Iktvc7KgqRlc6Ug21sgStLWVvnkF/yO7xiK39y/P/f59svnOFK4sPmG/doO+fAyGyNbzm81+G1qs/9cZtTiaTKdS9UQA2xtDpdBARJuPiHIqw2W7z2dK7SxkilFJoZaIAaE3n1ZhTAaUc2hQcj7c5lR3W1KuyGo0tmetqa/KBPLj9x/z6yQtEJmQ2An6SJIu/6SIbe/Cx/1QkqkD8jmIYQBzDxFqUOiPnlVAHA5ynvmrSqSF4XKgo/ZBJeYr0XnWWWkHLahRRyLYBYCkd4ptGoUyCTlIoYoLwzBq8eDSFwTvh9GTI6CvcIl/JWQ0GI45OTiMHFOcvyAbXLypCF4OKqxNTC4lFeYqm9TayXkgQpj26Z8MCirpJVkHlCWWOkurcxdUAOubnUzqdEqUGKKloSCkvopEuq19NyRZnb6BgsHqebmeVTL/eWR0GkR//apO8cphU1WKQYG0LCTFibMATMJMXD0LwDp1YqiLHZAorFQu9hG88uM7dGwvntnNwBJ8+3mRz7wRpQjdTxihNK7zSoJKIkkRhgiKjRfAGJ4rClQxyxSAv6ZfHPNv1LC/s8e6797hxo8vqjS7z87fY2Tpl88Uxp/0RE4RiMETSWLcpFCStJMJTrcVNPKGoUN5htaPTzXjrzg3+0e1seiZf7hzxfGOfce7QXU1qDYkN+Coqjeqm/h3qxkXtMSHBK4tSLSQo0J40AdsSQlsoJ4LPE/Jx4Kg/YP/giJ3tPQ4ObrB+dZGFuTlWvvUuC1mKrqBt4Z3181fX4cGY0RhoZyRJC9BUVYU3JSpRWNHYSrC1OECzGIhjHWuxzvs4qamADQ6D0DKKFE2RGYaiOR7mHJwM2BlVcrUb+eQOCpGhg2Chm/796NFa0FfUB/v/kyz2bjE42gfcuagK6nG8gFo7e232b3xvdqq8zKmVZRkdS1VNFYAbx5VYi+5aghNKV8VzW0cWIcQoLa2h8Q3l0qyTFIlpKyFMUc7x3lU1wtmxf/KcvaNnrKysU8ihZK+pa/eydd65+wM+ff5jinKAVY68iIs9CBTlhKIoCCGm7EQihx9TaaPLndbFiGr2tdhcHZv3gwuRB1EiJRba12WYGtQSu60iuw8VuRvSHx/B8qvOygDtzGAVFCGWWSTSDsUPaIVKLEnWxZWnU2aisxMudXSlUcbgC+Hw8JjR8LeHr3+1yGqcMx7lTNV3Z8Ltpj5zrjO9BlhgdJ2OM5zpfzS8Cq+a1NIQiTJIPsKXY3RwNUGirbugPQqh20tJkhNc6OO9Q5uzFcP0914DtLjoqOJzRWIW6bavcDFvO2tlBQeHp0xyh+hYuPSVkNiEmAiZOTYV6rpPZMiwCnAFlgDOMd8zvHV3nbs3V7jeOZvADgqRn396ys5xn0JiY6HSgmiHUoGgTazRqSgEoGu0pA4O76PUSae7QHtukbLMORkV7J8ekhrH/knO3VurPLh3g2vXe9y91WNzfYmtrSM2Dk55trHJpH/M4vISSZoSqgpHhihLJR5xHiOeUI5ZWrDcvHq+RvNyr8/+yRhMh6zVIkvi6s6VJaJTRGpdHeqUUJ2q1Si0yaaF8xCEYAI6NaQ6RRKNskK7mzIZ5ZyMBvzy/Y/ofp5w9doat2+s8eBbKT11OYy8017A2mMqbdDKYnUSEabBgVQYZTEqOi204JUi6Cit4ompZa8ieW6QujcoCDpE/krxBQpD6aByEmm1gGd7Q/ng8wOOygoSYf3K0htlVP5rssXOdZbn7rFz/Ah0iafisnv7sraRyzIfXPK52c835AMNMtA5NwVh5MrQy7poS4zMs2yqC9U4rjNoN+fSgCINz2FzSiKZtg+1tAgKhed4sMnO0XMerHyXjNdTsc3rK+rF6CO5deVdTp5v4WSMUhIb772nLCrKwiEh9ls1+6G+JLK6GIGeQ1fWEWdVO6q4Fqzn6dkhrRGTPiiCKLQKlC5nOO7jL0lvGqDdiTXt+DuR57BpH/AKtLbYNMXNONGpCOfMaxH0YTjtDxl9BX25r+SsxuM8IgEVSIPhr5tzp0CLJq1HdFZZlp2l5nQkQw1KphRAplm+1iZogoAKsYW2zAvKyRgdKoKX2hk1Fuh1UrQuCH6IR7CqYdF4dQ6Y7Zif/f+553Vk1UqW3zgWo4lj7+CUvCjRrZIgNq7cfC1nUScDVTMRQ/08kGYZVT6hZRVGKtaXV/jeew+5unS+sPpit+KTLzY5LTy6046NxbppNjaYevJUQaGURwUPhAiN1zoi9lQdAdsWRido38Kg2Nyu2NzY4OXTMXduLvDew+vcuNvh7sMOG5s3aacpG5vPUH6Ey0d4ZRHXBZ3R7SyQFwX4gqo44crqHW6sn1FSPeqL/Psff0y/UJh2C2stsck7rqxEDF6i9lGzvhNlIru+CMrnUehNFHgVb6jIgoNqQ5pUGA22m6D7LSbDktMx5M/HDI63uba8wLs3FIeVyMoFZ3DrxlXW10dsnzoG/T69zNKeSzEqMA4VXspYOE7q6oWK+xn3lyg4KBGVivga+RQQ8fhQURQ5pVekFyLqZ1v7vP/0gGOn8QmsHPXZX57nl5sDubHUY73zX6/Tmutc58rK22wc/Jqjoh9X8OpVZ/WmReP5xWWTTH/1u3Cecimm+yTC5lVNBlCGqdyGtXEOStN0CuoYDofRKdQliVlEslKqJmzXsf42nSM0gbhQHhdH7B19wSiMSPWbSQMys8g79/+ML7Y+Yjw+ojWXonTAV46qBO9qBV8lFxbwb3BYr4motI6AIRCCOEI4639tPqt0o/0Wa94qRBo1pTWVFIzyAT686qw00O1k2DoYoE4xelF4IhFwanRsRSFmTvw5sM0sACaSDxRFxWg4fuP4zdpXi6xGo1q5Ul2aVm5QKM0JtiYlyVKUtohzU/lxpRrmhjNH1Qgexq9HpIpBU5UVvixjcBZnZlBgrMIaQ7fXQukSz6R2mAYRd84Bzg7Sxf+/GlkZUrtAZubfOBbjvKJ/mscLWDweQas2iowgE+oEEkpFQi7NGdGmlgDeYzOhm1huXVvl7s05rsz05+yMRP7Dr17yZHufoTN14T9O0knde6J9hlENH2EV5TFwMeKiBql4IZhIT5VaC6ZNqByBhLIQXm6dsrO9ye7uNm89WOXh/bvcvAFLvbfYP77Ly81nPHvxnIOTU8qJw5gu1djhqgmZKum1NffvXOHWTJH0+dYpe31H7g0ZGiMBqtiIaLWJC5YQHVhQ7ly7qAbweZQFsVHYc0ZOLqJB0xax/UGRzVnSdkI1gXzi6Y/HbO7uc//GFa5eErV0u3D/wS2OP3nOzuY2YTTEryzQWWyR9DJMS1FWHj3N7ZvpZEWIKRXlI8N7XBQAYlBG452nIuA9aNuI70WBzB/+9EMOR56y3WEchPzUMR7tsbd3yM7iMr/ecLK8bujZ//oaixfVDfXx4V/L0tY1DkdPUTrW9y4CHJq/l2U93mQXPzOL/LvYowVEUEEdTVlrY4an7tOy1rKwsBAjm7JRbziLtqJ+25nTEPFAEiPpOvp3jDg62eTwZJ/F5Xtv3Hcd2lxff4/1lQccjj8jSQVXTWpovgYsSnuglhTCnqvf/jbWzF3GGEzKedZ20ShtCFKdobCn46UJqpmXFD548mI8RWGeG3OEdpaS1BqEDXxe1dRxIKAttq7HzX6z2dbMqKCVpaocJ/3T3/o4v2LNalA35JmZVOB5m42wlK3FxFQEXSg9I4JGE1ZPp6j6PQ1ax2YLpeoCZEWmBadjpOK9xySxBtJuWbQqqUJV9341wJPX3wQXC6vNyW4iq1a2QPKG8B4iuGIwnAARBRlCglYp4mLUgwrTi0PHjU3HxjlHq53STeD+jau8/eA213rnJ6hPvjjm8+fb9IuSynbxPmBQKB9pWiBDqQ5aGaK2aYkRhegSrxSV8jQoy0RH2ivvPaEqsUqRtS2S9RAqjg/7fPzkmBc7OR9/OuLh9evcv7XE/TsJN268xfXry3z26AUbW0PyIoIOlpeXadkJd6/Pc319cbrfT3f78i9+8YKDgaciJTV2OrYNajRIjApjA3Vdv0RiwZaAxWNVAaEiaINWmsblBzImo5xOp4fJDEmqMUpTTnLK/QNGgyEffvIpa/OGQyeycgGNt2aV+qgSOcqvIpWjOK043jkhH7Xors9hFzK8BtGCBYx4DAoTfGTTF8F4wRpFFQAMvkZZVUZwKkHpQCu1ZEmKMSAVVEFD2iZbXKfV6+DdBDc6YXdwysnRNlvHY25ObnHvRoujQmQ5+6/LYV1ZvsPV9TtsnX7A0MfUzuvqxa9LBV5ml703C3mffTRmLvRhqTISx2obARadTmcqex+RrtGxeR8Xd7GtRE2RgYEGsBXRzEqVHPV3OTw85O6yZ+yOpGOXLz1fa51ltV09k9s33+XF8Y/R9og8H+GdQkIXrSxaj6e9UVq/CQ14+fjMOqsk0eR5DCqQZCbNqep6lY6cpCJIiPN0g9zzviIv84jSfWU7gVZ69ntx/q/BdfWErm1UD7/ULom0y8JxdHTyWx/rV3JWw1FFkQcEGycYFdBKg54pUkokOFQS+2aCsfj6+GJRfQqJOzuOxmnU//feo0NEnIS8JBQxBehDQILH40lTwdoJrTQBPISYbPNulmA1cL7zr/Hu08D4XHQVu98tiZknofvGsZgMKyajnFBpSif4BiIfAjqNaLEmBA/ElJxSUWI6uIKV+R4Lmefdu2s8vH2e1f3Jsci/+dEjNg8G6KQDylIFITUJ4sD5GHmKVjVYpU5/oPBiqHxAJRadaMQLriqiDo2ypImpUUeByk1I0pTewhrGJIxHBV+8OOVkf8CLF21u3Fni4Vu3efDWCosLK1x9tks59lxZW+PqlQRXVlxbT7g1M7GOJo6trSNGkwzRKcbEhkrRkfTYobAonKqjTaLOj5Z64SIxag4IIdQ8jyqJvTd19N1pz2ONrWsQFe0swaQqSpYUhu29Iza3Dnn39sor5+1QRMbAt96Z40r3PbaeHfL/Z++/ni3ZsvNe7DdNZi6zvS9fdarqnNMO3U0ABGgkknHj3hs39Kh/R3+AnqQIPSviPuiNDFKXuhINJAokARANdKPtseXd9nb5lZlzzqGHmbnW2qZOVTUBshvU6OioffZeJnNm5hzuG9+3+3Kb7vERw3KA6rVYuL4eh6NVZDOIjjRShEUV6diCVxJ55ELQcYQgKMQHUgONVJFmCmWgLKGQDI+imSRsbTUZDS0hKQlG4fojjnpjek9es7Nn+daNJZ4cj2RlscHKbwn0fU3dVr/Y/2fyau5LeqcneD0GogJBpB7zVOJqk+b8rJ5aLag5G4G/zYld5AOs/51A3SPubYJ+QyA4QQePaEWe5+jE0khSbJZiSSfwd1d6ilERgWBiUKrqzaLRUlcDAoPxKd3hLp4e+G/eK4zPuLXxCcvNm+TKMyh6eAlg0lhO1lVJvCLoRsJkBvXqhsb03C+WAa02sfrlYy3CqNgnjzIjpnre4idOyJxqYIs4yjI/l7nOfFkswyuFxxNU7EuqSvZJK1CJQWVJNbc1zd7i+zUoBxJLqU5i37/X/RvoWZ2MRP5P/5d/hVYLaBuiPESF4tK6QIJDvEXrBCsR7pvOtRirOBhmKkbeRpLgqyntWkumLm2GqiqYGI32JS00Z2d9jGhGo5y0MVfRLBkoOzQXTlhZyfBujHcam8QZDS3VaSlfp1nEGq0GqftCgjaCDwVKG1CGIheaus3i/HVKOd8/umhuSKXDqch0SikthgNHa67B2J1hE48yFagCDcriPPgyZzERWqHHf/e7v8O37m8wG0W/HIn8p8/OeHw4ZOgjbDt1VTSpErx4golAFWEAAkKIzAEVHVIkAI2sIjUZcKyLu1jKIAYXSdoArUiyiKDMmgniLZ3CMzoNvOi84us3B3z7/k3ubK3wdz7eZGMOvinq975JPgpYozBWoW2OqIATj9dxTs4L1RMS2d+NRE0jEwKihIKIKI1uLTK0K1+RZ2qh9APQiixREXyhYynRJmB0RpatcXJ2dXQagF4JTQX3rsHW3Co7i5rnr15z1CvJuzk7eQfbzFhoa3TLYm3M63z1VGuTUeJRicb7iu1ACTp3tBVkjUAjKZhbiPeQS2BQZiSppakdi2rMxqLDzs8x6mUcHad0On0GecmwcOz1jlhdXuT2tYzPhiJrTdj6LSgNbjV+h+tzzzkqXnNcPMM7SIwFGSGhjF2SoFCSoUQTdLzeQbuqV12PYMA3Ug6pKXffrE033SmAoi5veAQfPBPaPe/Jx8WkRJgkCWnWoNHUFGkey4SuAJejpAqaqhkcbTRCzlcv/yM/+M4PaMun37guG41r6tnpX8m3bv1v+NGvjlA6QyVdfDjFJg1UaFIWgRSLVyGeX4WWFkVETZ87zwgoiRDyQJIktFoNtNaMRqMJGa7SoQK7AMYCFhflkNEqVjqstZGJwnuU0gxHXQp3ObPaMIn6s1MRk7UYMcYnFoKrnt9YEndasAsZJAKFqyoqllB6jIkwdydDNCnapCidsH/4fsoS8AHOqnBxKLj0UBObQojlPaka+ypi+o1SEQhhE8RqQiX+ZUVhAkxH7y5chAryrhGsBlMKOsiEwDZUwI7IqeDJ0iHG9ogS9nEDV1IntvUNO4NGqSO32sszO4sV02JlMqxq0dLXvnFz+Pj+Gn/373yHn372iOc7OyTNFRp2iTIvac0nE7VUEdAYEEtqEjJjkMEhmzfWubuxwMry+U3otO/5+sUOB6c9ylJidB6i0yHUwtR1A7SsroNUM0BVxFRlmRda1JOftIGITKyf56o5mwhUU+gueIZFTn44xLkXHO/t8v07m3z6/asJPGtbWWzw6f2H/PL5DoPBGbaxCEOHpJoka5CXDq08VuuYKdXXUyQGF8oRTAUgCRqCRUvNlBIVjEX7OLWhJCpUE+l9gqvZuSNv5egCKvbRcSmP3/T56vkuwRvW5tf46PYCP/jdZW7fX+YXnx/y6MUu436PYb9PeSYU800WFxpkmSFJLcYonJQE0RgVS7M2SUltglcFZT4EERKlSGwEZQwLGDshBIdVnlTG2HKMVRmL7SZpY572wpizk1M6gzGn48DJXpf90z47BwvcXlvki47I+txvNrv75uIn6idP/l/yqPsn6GIfVGSZ8S5W9hOdUZYewszYy7nyUAwmpaJ/fpt9aNnwoilTzRcRBR9DCJEGqRoUbjQaaGtIkowgDUo3oMgd47GndAEjijzk5OGIbr7PUvu77/zOuWyZldYd5rLr9IZvCCaAcWBs1fu0aBUlboSZweoamCZTiroJwKRmqU+SipTBV0oNNRNQPYgbg4C4QLpK12Sy9rpO36r++lsz2uqYvBK89iiJn2xCzJ68CoQqOhYVqhlNhSKpvjOfZFdBhKIUhqP3J7N9f2dVwHBYyVYkNffdLNJk2kz1IhgToxVtTOVgJkHO+QW4gAac/b3IlHJFqSriUlEQWikhTTXWVjROM+8LoWr41f+fmfCOfZzzctthIsUcU3GbvF1ssbZmE/7JP3rId39wlx/99Kc8fbbDyckhRcgYjTIcmlQZUhtnoHxRIjisLVlqt/jk7l1u3G6eW5GXx15++miHk/0jpChpmBQbHLl38VipCYPNZMnqf4NMmaz1pLH9FuLOej04T3cTRxA0znusEZIsJSDsngw5PTymqS0vTkXuLr99w7y1ptQ//7OOUOb4UY5xgbKfo5uWLJtHRFfCjyoGFsrhlSAqqkBK1etT6FhaUJW8AVGKRJSf1uFDQKlIreRLgVKDExJbsDCvZ0FT/ORxV/7yZ085GhSc9AtGo5JXtsNxZ4sHD9ZYWk349Pvr3Pt0nSdfvWZ754CdwwEH/SbD8Qpzy/M05qDZUOByUmPJyCI02MV+bBSz07jcY00LaxM0MBpBXvQIErPNNGtAKfgiSrekqWF5qU2WQHs0xnZyOmddOqc9xt0jTg9bHKwtce/aOi/HInd+g4lyb1y/y/rJA45H+4zdPsrG0r0AXllKp7BKVWWiOpCs+CfraobIBFV8tV0+/fdxUrPvm6V8cq5ie69KVt5HeHxqE7TRpGla9ZZsZGF3Oa70jMdjDg72uHvv3d/dbi6ysXGN1aUtDkctRBpYG3lMnQoYayJm+C39qrhPTr/He49WakJDBRFYUpblpTm3d9l0Bq4qo15VBqTGzqmqbHn5KtT7yPT5hClpxPQ1URgyykn1+312O16uLZp3HvR7O6uyLBkMBm9tks6aiMRmZmInFEuT1pEI9TxW/MXFE44wTqUEH1yF1gnT9wI1W0bWBJt6ghRURB7vezpE8sup7lW8XjaSZZq3NAlnj1PDnTmlTkRkcfn3Gf09xxdfvuRHP/mSg35JGRJSpUiTgLgxZShppAlL7YQffnqHTz+9dukzj07GfPn1C3wZaBiDMRrxJbgIoUX7WEoRmVJTSQVekSnT/LQBfb6Wf34NuXK9FAGjHdYkiGmDbpOPhwy6gb2TnBc7g3euzUd3Fniyvcir10PccEjhNaZoMKJAtKI5l0XnRKWLVWWGSlfHqoh1exGiyEo1pEmc8jfEKJKKn1KrBHxJKA14aKaazY0VWhVr1aP9IH/2lz/nyc4xPm3jdQNvW4wDPN/e56D7mo3NVW7duc/NLfjD373F9voKX704ZPd0yNloQG88pDGXsDjfZL6ZkLUsJslQZYi0PBKHTpMkI4xL0rRBaqLMSDEu8WGMkETskNextEmCKyOTQTBCs2VptudpzS3QmW/R7WQMul2Oznocn3Y4Ou2ze7LOn++KrC/BSuM3Dzm40Fzl4a3fY//kNTudYzAjIrRfIcESROFN5ahU7PXGPredCaI+zN7PUb399ReXcDgcopQiMRZjiWrk2pKmKVlmcKUGX1KGkv2DbfI7/Xd+Z1utqv3yc9lYu8Wrs1V6voc1bhLBa63woRoKnjmcq8Zr6v82JgIatNYTR+W9VL6qHiPSFxx/nVFdMctWicW+vVd4HpQ2AaZVjt9qhbYzIIzZj64RtZXoo64EageDwYRF/1323s7KOcdoNKqQfvXCzZ6ImiBEAiESNVo7w3RcQR2DYIyiwk+ce39cCJmkvKEsKMYj8B6CjymyxAKXiKPRVCRp5JuDgJcwc3HrrCr2jZDq4kmN7JktAaoK1KKxpoG5YrFn7fnOkTx+/Iyv94fiPCzPaR7OZ2q7L3L7+jX+/OdfMyoC5CWucJS5Q6mUlbVlrm8u8fvfu8utC8wKz3bH8hdf7rB7NGBcKgIJBBdLdSKVVIJUHSc/ufj1mSJ6ElFNb051yVHNsnYoItKuLgdEuGvkygtaCF5RBkOw80gmnI6Fr1/s8aYncvMb+Lzu3IAf/nAT73vs749QZRukSYkmaVpKSnRaoBOHTqNKLErhq81KhyhPIuJjWWjCVaYmjfPokE2MSIMmlArlFAlRTHF1aZWkOsLOMOeoN6AwMLc6j07nCWIIhVCOB5wOhnRfHXBwong6v8Df/e4aa1tt/nCrzXEHHr/c5umLbXqHfVw3p1xYoFww+CVLmih0GpGxKigoITEZzaxJrRFYlMMIT/YKNIxGOQ1taagMSSAER5Cc4CpnnjbRCxmtbJVeu8XxySlnZ11en/Q5HjteHfe4c32Du5stdoPINf2b47Daakvtytfy+NnnHB48IrgBxho8IEQYeZAxNQI0mq2YyGP5yr/1bN62CdY2BU6dt7cvz2xGdZEYtyxzSidoHaU7Il2TJbGWkEauvbPuCcPR6Vs/f9badoXNtTss7mzRPz0AN4p8mcFF8mR8FdVPgSZxL5w6CKjZexKSNEObBO+EInd4d2FcoNodpqsx/f152qvYGnkvn18JSb7N6uFsT2TkiC+NTgqIoyBhepzD4fBvxlmNxwVa2yjLXgshwvkNsCrraTulWgo+bixa1aWqy5FN3QOLFlBa4UNJ6fLqswNBHFrFQxZKsmbApiUhFEic8IvQ98nnzCIApzZxUmomSwwKo1KSJCOpJD7eZqedgn/1r/49Nmvw+3/we/ze734MwI05pXb6Ihubv0sIQAG+dlZGs7CUcuctJbQ///nn/PJFh6GzFF5iVlVR+Zsk9mxK73HBoxPLhJ2+iobissXy6OzNeNW5T0p+1WsuzsMoceAF5xOc0dikiU09veEpr9/scnR48xvXR4AHD9axpsmTJ8fs7PQ4PR0y7o0JLoWxx2aKpK3JMOg00hnVXGZKx5iiHmkI9flU18uFgBcwFcIzhEAoYyZmjWFprs18S+Mkov8+ezKgQJPNz5PNt2kuLJOXUPSjYKNTLYqy5OC4z+FRn3xccH1ziTt3W9y7BZvrN7i5usLTF/scnHTpHB7ROTOcnTVZW19meXGBNEkRGeGcI9MNGmlGouPd58o8dg00VY8hRQXwVWBtkqoc7R2+9BhrMUAjTaLmWLtNe3HIcadHfzjmbO+YQV5wfNzkwfVljoLI2m+Qw7qmPlH/n6//b3Jw8EsO+x28lIiRCMnW9X7gqwy6VkioxlWIg+8XpYNm7d09q2/edd9239c/18+HEPcIEaF0AedylHJIw0zESAd5j87wiKEcSUutfeM1mFPX1Bcn/19ZXbzJ9tFj3LhEZTEQUzqywqAVhFlE8/nzrX9OkoQkSRARijynKIoouaIV31xCvfyZU4uyP2/fO96SldbD/Bq0MWDi+gWRmWxsGhCEEEcDfBCGgzH5+N2K6PCBZcDxeMo6OB0Anv5cOx1RGmUSTJLGSXAf+yg1318tfa0EzMWoR0XWQasiDFhciRDrs+diKB1IM49NS4SyOoZpNFItL5NarNSQA1/F5376OonDeVolZLaB1d+MBHz24pTjE01Rjjk8/iuePzvh3/75kWyurTLuw4OtD9s4vjzoyP/8T/+YN2cpki5iLHGQrz4lZQjiyH1ETyXEhLHuGWoBpeqhxguaParKLGeChIulXFXtDEoT9chcATbFmAYkGcamFEEh3hN8yXh49dT5SSFyNoAvX3Wx7Tab1+eYX5pj6dker9/sc3Y2pNvvIXmKcw2ktISRwTTAZgptBbQg1Iz5cbpf9PReq/c1qciOBXDek7sc7x1WBzaXV1mdBwLkBk57Q4YuYJotvIJBMUSpjLSdkTYSWqUlH+aM+kJROL7e2We312H/bJmPbmxxZwu+dbfJ5sJd9o7OouDiWZ9ht8+JV7gcWo2U8XgYkVrW0UzVhPvvjz7fkxCqgXBtMEmGFA4XHCIeUSVKO6w2GFXx2diI9tIY0sYczdYcjbkFOt0+Z2dnjErHi+09pOiztfjwQ263/yJ2//r3OOt+xeDxHmdFDpknUFQI4nrotBq9qBxVbBgE3KWe1QRkfeFbLm7o759RTctS09Ja/TwEH58DXe9vOpncjwFhnJfgwKicnj/hpLPDR+vvx8i60Nrk+vpDvn7+S0ZhHIFQKuo9ReFTWz3X6konBZwj8c3znLwsYlVJq2865SsWoT7/aq0qAFqdEFxes7o6U70PPUFww/meVYDK4U6TBS9VwFlhGEIIjEajv/7MyvvzYIcphdA0fZ/8TU3TwanFOaPIWhHhk1NwRUXDo5j5DEGIDdB4frEhP23QCTYt0XaEVNo2kdfr/AzX9CJMLV742R6XrjbGJPLFqcvZ2Kw55hmVTUaF0Ms9w1+84vMv9rh94yN++P2P3ndJJ3Z01KM3LBG9iJcU7+M8UrwxBKvi+gelSdMGMkmp61OoSwVRWWtW9nv2nCdtQpFzfcDJTVb7BGsI9bXxAVfm+PGQphY2F+doXkg8T0SkO4Jfvezx5MU2b/ZOCQjf+vZHfPrpFp98Z4v7n2xydjrk6eNtnjzZo3TghkIxttiRJW0nNOYSkiyKt8V7oNLDEVXj70FHhZygawn7gBePkxwhR6uCpQXNtUypQxHJPXT6OaORsLjcJEmaKNtAsOCjtEqis8iYQUCPS4pxSS8vefxym/3dA/avrfPxR9e4sQU3byxx68YSj54d8+TFLp1Bj8PBEJMabKpRqkQJpHp6D/pCEK8Ro9DKMhrlZEqRWYvgKShjKUhFRFgRQBuNCgHvcpR4Wo0mWdZgaaFBu9Vg0OtyMjzjtNfntDe8klrqv6Zdm7vFg1u/y7NXX9Adn6EZ4xhTkgMqKoUHy0TVN95s1bvffyj217EpgOCKCs9splWX0QTq3k8sYUV5jKEfoulw0t1H3iIHf9GayQLry3dppSs4f4pWAtqhdC1GWX/fZWxA/XPtqIAJU8e0DxRRgkCFDr5cBrzk0ERPemdxn37/zGpSrlQxG9ZVD6tW2rj8IVMARnBM+mzvYx/grPyk8SgwAUrMHsT0+BXKWLRNCR4aWZOiiI5OpB4GnYFOM83MphBlRT4eIyIYrfGlx5rpfIWxQqMlCENCKGhkCYPRkEajVS12LD3K5AHQ02NUniRJKN2QJMnwPqak45GnfW2xolu52g5ykf/Hv35DqeYYh4C2hjeHx1jr6Qx3Oe6e8e9/vCv/+Pe/Gfo+a8uL6yy2ljk+8KTzDQpVMi7yiirGMK4oroyxjAuPTSLCJiqhhorGymF1nCVTVQlNfCSCnZT8Js1cXfWqZh4IEcRHsMbIFSRNgzUmZlNFTkMKVlqwudzk+59Mp/W/2i3k3/zHp7w+6tEZlfQGDp9noAKdv3rMs9evePBgk/sfXefWrTbXb37M8mqLg70BL1+ckBcaigZ56dGlZmwczcU2NjUoFeeYgnIkxuB1LAFqaylKRys11QxXThnGOMlZaguba/E+WVdKPR6KnJ4NQLVR0kb7FuItNUehhBJwaFMy19Y0WxlZqegPRriRoe/hs1dHvNg/4eHtTR7eXWN9Cf7B31nlo+urfPn4JbuHXc7yMUWhmWsmpNpzY2tK1xVK6HXHtK6tUpYeVRHnuhCVrTEerTRKLKhIVhyIIwaZjgTFwY2JMuWW6+tzHEtBV8drd9rtEW59Mz3Yf2lrqFW1m/9KPr3z9xk87nEyfgytEps4ilJQuoExaVW6DmgVJuAhJAIaJswn1eZbR+2lm1WhvbyZzzb4z2+uV2doEwcVqt2oelYkBBAqaI+KM2HV+733JFrwUjB2Z+T03mtdVs0t9bj/l7KycJOzw1e4PEAan9M6Yyr8Zbqj2bL9ysoKeZ7T7/cnDPQ1urF+bfVD1a659GEYY3CVozAmBTEEFNYkJG8BmClVUTkBGI0xyYTz1WpL8AVJktBoNOh6JqhlH4QkiUrqMYONpeAsaVD6nNHo/QaD39tZ1TDPdyJvZHrBlVJ4NfXtNfwy3gymQnjVn1fRx9flxMm0e/xrXS5URDoVrRUmKUE7gp4BHFyq9dazVeevmNSzYTNIQEWC1ukUQnuFeYH+qGDsAk4bjLG4NEOU4jTPUWeef/effsZffn4of/c7b2dtnzXjPdbl2LxApW18kAlFlTiHCx5rDcamCJ7gHag4j66Is0daKQhR40srOwHBnD9nmdzUSikuJpCTtTc6cpcph8WAL1DlkMXUcGN1bvL6/Y7Ijz5/xVcvDtkflBTK4rzFqoRUK0qBvcMRp50nvHy1y0cfXefW9Wt8+zs3+eRj+OijnJfPD3j2fIfT4yGhWMBkDbw4srkG7WYDawzeRx0gUPEhSVIsUayz9LGU5nxOEUbY1LIwP71+Z92SPAdUigRDcLHsgvI1VANUjGyVBKwo5hoNEp1QNCO7/2gw5HQ85ouXuxyedHh4c5Nra3NsbsDa+h2evSz46ukLhiJsra1wb6PNxgx5hgkaXwZc4UiSLDJdiBB0iAz8RvCi8aWOLC2NBHARWIPHVtWToG0sYKuUREuM9SWWVy5vb/91bVAeSztZVU86P5Lto2d09/ZAD8jLIVonEGKAqCTWApR2iPc4CehK2HLWaqf1Ici/d732sqO7UImY/IdGqtIWVAO0RseAQ8Z0+vsMypP3Pq7F9gZbq3fYOfucMhlVbB+Rzy/4CoQwgwCsJU7SNKXRaEyyqavOb/Y86gztUmY1AShNMQbUfDL67ZlVWb4d1h4/dcbZEz/zKpsEAzKVbXkf+yCAxdsWaGo1r1Jk8kWfp0+52qbNzklTs7LaQZo6e50BciRGkaQedITGRiSgecuYwtXHMKlVh1hb1dpiTRaH2N5ihYf+qIujjKSlCCEJKKsZlCNkrGj1M57uv1+kBfCt2y31R//hscy1tnmyd0whGeNS4QuwSYJJMxJrcdX4QLvdrvqD1QNVp/sSe3EoO9OrYvK3WehrLKvWUeQsSlCjTWTbCFKSGUG5EanO2Vpa5v6t6S7cLeDN8ZCjQWAkTUyjRauRYXwAVxJ8C+cyBqcjOicFJ8dHvFkfc+/uGjdvrHDvQcbm5i22rrV5+fyAbqfgtNPH+DajTk456NOea9KaayIGxt6T5yXaZIDGlYHgoyJPCFFba211lfl2dKjHIvKnv9ihN8oJOkZ2ijLKbitiFoObLJNGo8VEJGszo6U9RfCYDAZdRWdQ0N3rc3g2Zqlt+OT+dR7cW+DWzZTVlY9JLCzOQcPGrG5y9ylFKOMYRpqmiHgCCucjAwzUpdgM0VGCRelIeGwBg8fomHEEDV5FZkVFvYnXpaPfHKv7oA8W/1D9v7/8v8re6VNOhgeozGBshne64qZT1ZB6iCzdEet0ZetlImYwU86e/G0SmF5dqprtaV163yXIdrVvKX9pPxEFPkCWJPjc4aXguLNHf/T+zmpD3VV//Pifyucv23ixsUcXAj5olKskUPzsLCiAwtqEZrPFaDSiLKMMUExE1fT41TTAf5vVwerFdVDKYm16JfQc4qxtGd4O3gIqCrhKOiSE6ue65TB1ZnV1zntPeQXL+1X2Qc4qenhVlclmN8OpBQVB6agSrHWkZapvJKkhjJe5Ac+BJ1Qc9I16LPGiGSLTdYyvDcZE2LoQp6Lj/lNlVhMl4yk3WNUphYq/Wzg/GIyoSBVlGjXFw9Xr4MH5HKWjDLsLAbEKk9mY4RkYlsLLvSOenYl8tPR+fYT/4R89VP/6T76WveOfctbtokJKkjVJjKLIS0a5JbEZ7UYzpneKiBzSdcnzfPJYO6T651m7/DDHNYgs4YIykf3eioKiwPgRK62E65sLXL++MPmW/c6I/bMhY59iWwskWUKjkWJ1ScgBl2BoEJpQDAccH3U4PNzl4PCE7d1lbt9a587tFb7/vRXu3FrhzesuT57vcHQ6pCxKysIzDGN8OcRkGbbVYnFukVHuUNUD7QuP5CWuGNMwsLG6gjWR+XnkYfegw2DsUUkTrRVWe0IYV0CNWaivAUlj6TGEiGxSkFjNfLtBI0kZtoVyXNIf9Okcdzgd9nizt8C9rVU+vrfGw7mrr/X8XIPFhTaFivLsWSNFSGKTWYTgS7QGYywWcKp6wCVULAEOU5Whppcuji1MGbbf5y77L2etbFoqfnj3h+wcf8XZ4+ckaFzpqtK/qSJ5R6j0w5TSBCfIzBjKdHN8Wy/l6pM/D7R6+3sub9pTwEYE8eiaVzsehVJYa8nzAm2E4eiUUdmnJycyr64mtL1oqyvXaWTzDHIVHaKJpU9UQvBhAkAIIQ4MZ1lGlmWEEO+hc8zqs722MNN++iarwEuqAjOJRLBLdFZXu4VRPgVYnMMtYKLqREVUridJSi0dNaMSPMEcxBK8d5HP9X3sAzOralXfYUpFEltmGX+r6FHV0dHMay/eSxqDCpGMkYreaWLVLJfWkGYKVGxsxmghiVmSuvoGngUZXPo9Gq1SVITivfXcxNf9gwrMEARl4waPD2ir6Xa7HB0l9N6i1XIyzmWlkV06km99+xa59jx6dcrTVwccH5/gy4TENkE3MGJQqoErIyFnqL2ThklIJRV10Uw2NS0LXKhpw4wzjzRYSsX3am1RBHw+oiEFm2sLbG0uT963PRT5jz/f4WRQILpBmiQkBEwoCGWsXZvE4J0HDFm7RdrIcOUC/X7OV191ef7shIcfXePjj2+zsqL59vcW+OiTBb76/Iw32wds7+ww6vYIRYuk3Y7aOU4hOjIKKAm4PFAMxoyHOXOLbebnl1FEZOL+AE57jlEJWUrMrFRAMcLoSOkUxBKZqC2ELD58qQPtEW9QARKtSBsJSeoZNQMhSSjGC4xLxbO9IWdHA9zI87Ijcmfx8h22tTHPvTvXeHx6ysuXz7mxcZ12ltJupiSJRdlqrsd7BINJACLlmJLYNKnRVV7F2bcSE2fFxFfB3G+ubTTu8N2H/4DT/hteH/6CoLqgS7SN5Khe1CT+MpMy1LTiUs1oUBPTXn6yr0IBX/V7zv/3BNxx/veTfy99R7WpGl1VjwLKCkXoMxp33gMwPrWl+RXWljfo7H9NWQXrRqcoUrwfRgLlKpDOkpT59hyiokzTZAi9LhW+89suJwezPbAQQuS31JER4zwwbmpFUcS1qYJkCZGgOm651ViSVihbYQuCAjP9vqolGAOTCo1dM+O/j31wz0pdCWu8vBiztBtB6llqKiBF/HcWth5U1cicQNz0JHKIm26dWkZggdaaJI2lKpFAEDCzBJcTh1U5nkrSZIryIdLyT44/ZosKTfiGzEpCSTEeIz5gaMTemw4EbygLR8sktNMWawsLZPZqp3eVowK4u9pSJyLyne/CT3/+hM8+f8Tx2ZhB7hmXI4rc42RI1p5HxFBzM4tI5cOroGCm0Xo+MpVLN+pkveKfEeLIAIQYWATHXLPBta11VtZXJu856eccdEaUwWDTFpm2pGpEgqfER8ViXVHZGBMphiTDlxmuyMkHwuHxMWX5hqPTE25sLfLpp3e5tmz4ez9cYufGEs+eLfB6d4+zXp9Br0evN6SQlIXlDUzSwCpFPijI+zlWDEvteZYW0rqxyekABoUw9oqEBMQSgsfoOJSuqNdMT0YBPLWwdayrx3llBRqM9mRaQGWUWQKlwQ803c4pj56/Zmn+6sb0vXWl/vx1Ka8/7/Di+WvKoWdlfpn1lUWWVhrYxILxVelHYSveNjVTloqTSZoCi9MQVErQloqB7UMZdv6LWkutqSN5LN1Pdjk83icETyl98C5S1UkU2ASFMgptkgj4mZz/tHwdQoiBYWUXe02z9j79rYvlsPg+YDL2Er+fumCjYmWpLqVhAqEsOeueUFx/f567LGmzuXmN54cmUj6FAFL1p0Lcm7TWE5YKYwzjIoIRLvZ4Zp/xuipVn0H8V879lzp3s0QSWglgbEKWZW8tA0aS3KjvNfmuOhCut20iwEV0fTznGTQm6107rsqvvI99gLNiWip6x2vr5v4U1j5zoMS5oItT6rM9qykKKH7vRXBEfXLGCkIJKhC8oGyMlOpR0qm9PVM6v3FrRBvCFdor0y9XSOnRLsGSolSDIAFxYH3KXDrHw82MHzy4w2p6NcfgiRPZ2YHDnTNarRZHZ/uoRFi7fY2BwNIc/MMfPuA7D27z8vUxn331mle7J/THhlwMvvSIJjKra4kS3tToblUpFV88t+rGkelDfLH2HOVG4uu89xgnNGzC0lKTra0tthZTBRGq/qMv9tg/6eEwpEpjQkkqY9JSsFkTLxCcI7EKZQRFgfc5QQJZljK3sEqznxKKEbv7PY4Oexwe5izOZXz/0/usLMHf+7tbfHSwxRePXvL01S6dYUDbhLOTDkoPyZIGRZ4TxiXtZou15XUW2rGvg4KDk2OKEPBkKL0AKtJXKVERMqwSIEbIogRMGdvMPjoLDLGRriLpqcbSMpbllqUYjglFSUgTumQcnPX5qyen/IdnQb53U7GSnl/ca9cs18/WOeyN6ffGhLKHy2EwGtBa8bTaloZO0VohwaFwKHzctCOoHq8TvEoIBiRpILaBokQry7uZ1f7rWpMV7lz/AQ/uPOPp7pihzylCgfeC0ilaNfDkuKCwEmqPMbmHjTGTnyc02DOKwuczpMuLMft3VeWhF3O0yfNQVX/O/bUSZAyKSbncmFiCL8KY07PDikT2/cxi2drYqvpTkRHeYKMaesX6kyTReVhrGY1GDMfnHdVFqP30HKb72VU2G7BPe2IREt/IWlc6q+NC5J//eC+iD3W7WsPzGVEs8ZlL75+sa9WimQWveOS9goq4Zu9p8QRnWA8k1nL1VarBKjKwqykhIPpcFhUj93pKXc+8r/r06vPjwC/E76IiRYwOyqMxk1F3kYiEE6k/N4q/BxRK4uYevWiUKZiyAZ8/+LiQ39BArLRt0BqRDKUsCYEgHpMo1tqWH35ym9/99jrrK+c3rBcnI/ns0QH/9F9+zcFBn4ODI1qtBiedI+aW2zw4czzo3+DBVsZcBt+9kan9UuT23Wu83unw5aPXfPH1CwbFGEKC6AS0ndTUsapSWDb1KlbrHtn1kIp/z0tVza16XtWQX9CVArFVyHiMloJWKqwsJKwsThVAex6OOgNGeU6WzdHILIkWEm1i6S+oKKmgBa0N3heVamtKe67JaDAiazTJmg1yFVDBU/iCveMRO7vH9Ho9blxf487tm6yswh/+4R3u3L/Dl4/e8OzlHsPekDJobFpAMUDKDs1mi3nrJ8QuAnR6XXxwGGWwSSBJskgQIJG5oj7v2AQWxEokBJZpyWnS5fQeozQ2MYz7Q1IjJM0E1UoRgaPOkCe7x6ACd5fuX7pvWgbu39ok0QlPvnxDPsrpnxYMBtAcGpZXF1icgywzmFTHoQsJ9dgqJroujIr7pjYGYxK0RGLf1d9gNnaI3HiH4ZX84ON/xPHxC/x4SOnHoH28J7VAMAhC4fIobaPthOJIaw3B4UUoypzao0wLYQpqaaCKO7S2t22Gs5WHc85uBqEgVMJmk9UNaGPj3HaSxRJtcPQGXYK836wVgKXJ+sItMrVCyi5BR/YVmUiRROh3s9kkhEC3252Ms8yWKWePfdKjjozP1TdVyuRMWUFCxRITCJjIwowWQ6papGYOpS6q/UIeYFgqxl4RKmekiOA3wcUKk6q+QyyIivRRxDJ7XS27yuQdckzTNXtPG+Rx5sk7QXTA2gS0QSTWO6VClomO8opJatAmwlITbQghSiQo4jp6TV3EiqUMqeeGQHlDajPyoo9KQsxmJImwVhPpWIx2pCbDSIoPfdJMx8HQ2X4YFTu5jiwB1E5Mx/kAHzxaVxe/IrVNTUr6DWjA3OcUytH3BUEF2o2M8fgI8X1uX1/ke/eb/O//x81LG8cXxwP513/+iB/9+AnarOODwbkmR2cF2AVGQ8vpL/b52efbfOveBp883OTLnkhuYH0TVtcWubZpeHCnzdOnh7x8dcppd8jYG4LNsK0GLnic1ngDAY1RCitRKTixCi2O4B1alUTUlSAqOj3RGYKZ/B8K2oxp25yPb904x8pxfAK7ux2SSlcrhCFJa45hbrEhpnmTYCpEleK0qmMX4zHWakpfoBNFM2mRtlN8UVIUY7xu8uR0wIvOiJ89OeL62hqfPLjJjWvwD/7gJt/6+CZff7nL5198TTHqcG11jnbS5ObGPN+9s0hLQe7hrAfFOKd3skdqF2glbbwrKTCkWVLpr0VnIEqDBqfibFpmYz9MCQQnGCXYaqA9lIK1Cb7KeLROKE1JSCyllHRHXUZlJPs9GpWy1kzUGydSALfmFKu35vn26sfs7HV5+vKE10c9DrYVp2cJa6slC8sN2iuKLGuSmAz8EONLtIpDw+PgEGfRvqTZSLATxvDffFvXt1VfdmT0/RP+7Of/C53uCUma4xnjxBNMSgiBNAVd9VFcCV45Em2wWpMaIW0YvIAPZRQ+9RYJFiGiYJV21KVD4FIwHWSmHF6XGMO0RzRNDCKrDSFFtESAi3KRMioISCRRVlrT7XbIPwS+rlbU7vgrubv6fY6ePEFnYxyxjOh9SbOV0Wy38BIYjobkZTEpg74tDxGJhNBexzEg4zVaqjRBRZkhr6Obd6Ega2h8OUKRQuFotJZYSm+woC7vX2UC2z1HaKygdIZBSFwEACkELzZiFFSC0gmgsYmm9GMS3aR0DpvYmFToKvgqBa0SRuP3G7z4gMxKXUjZogrou7nOL9RXaxgjgIrJ6EWopZKKBBEHuMlNhNIIDq0iWktVOlHx+CKLelBVtieaSVys4ixNRCSCiI2sCGLPRVT1DfxNhc6gIC8KGq0G/VFgPB7SSABdsDov/P4PLjNYHIvIz56dsn0wZBxaKCyiMrAOVIqoKOw3yhVqrPjV4z3e7B/y1eNFPrq7xicfXeP6Ety+PsfSXIsffOceP/vFK375+Qv2jwec9Lp0TzokjTa60WJcOHSSRo49JQQJkY1Zx3JKEF/1Q3SlgBsffCpwRfAGHYREl2ytzrGxNlVCPRCRv/jVGWf9Mc4ZlA0YHVFT3iQoY1FSTscvz/XMZmvqCqma6VoZyFQU3RSHk4Rx7hgPAuPRIZ1Oh1vXlrhze5PNNcvq37/GzWtr9LonbCw3ubbWYC6FlrWspEodi8h+CYf7x+T9IdduX2eunVIER5Im5N6hdIh9cgNKWUQ0vlIsnlQRhFjMj2Ji1OAiVQVpQaLIpfMaLwYXojZSvx9ZuKVheToW+er5GWWZs5CAkcCtG9dYWmyydWOTr18O+OrlAcdnI3bfvGHvwLJ59wYLbYudUyRZijGgcGgdaBqFtZBpj/ElKvhvAq/+xtmcuq62Bz+Vwzs7dMeHnOUvUNahlaNwJUmSTKTla0SeCg4vAfEK5QNJRX6sdYZJFM4ZXKkoykDhhDSZ5aRjsn9MnZGebvwz92dEJsbfBxXQFTnABEpf6T2hwrlyuoiidDnjsvtBa5GpJZZb10h1G+d7OJ8jNkqSxBEHiXRKeT6Zf4r8f988DlQH7LN9pHN/p1LiJhLNag1GWdp2gXZj+fIbgO4YurkwlljJ0VSI2SBYBFTs98YsanZk6WoPETPIq2dg32YfJGsfv+SiqN/lv//n2mwdduKo6u+euQlr81QNu8kNdNURnm/Kzt5sMPuZ3+x+JVRADx/VeTU5WsasLrX45KOb/P4n85e+vDuC5y8O2N49QkiJstVlhIhrDTLV1SE4Os7R7Qw53B+zvzNm92XOR3fX+ehOm40VzTCH/+0/vM0n39vgy69f89Ofv+T1zgBlMo7OhujWPCIBb2MU472jNEJiEqyyKNoRuxMqCisJGF2gGEeapdACN6Y1l3Dvzi0e3lydZlUdeP76Dd3+GJO0SFJbZdj1wx/7LLPRq8z8fJXVPYnYDzWIh5ETAobR2PGqc8zh/hFnnQEP7t9hdSXjzkcJidmkmcCtCySuEqBtoWFbBJ9QFIZhrilDSTavcRRYHXudGovyAUJGKklVKikIqhYADKgQSTonA+raVIAAYtbvNHiF8hacmpTynYcXb3J+/MtXDIcjFpoZiQpsnwhb16+zsgEPP22zsHGPvf1TDvdec3B8yvFroZ828csWNuaw8wZrLLFkGcAZVD4kjHooKfB+mWMRWf0tSbFWWjf47sd/n5PhPj9/NKAcnmKagpFhLMFLVumzVYP7uqQMMRrHgxtHKjdrE5RJSBKFMQGbxueozN1kL5jdP3QNmlEVLREVjCLUZbUoWR8D1qlpubyfeu9xSmFiU4BhPqQ7+DBnZYxhZWUVa1K8E8oQSFNLI2tgbZSnrzUEbUUK7px7pyrEu0wpBSFKdBgdMy+tLe3WPHOt+Svf0+3BYDCaOneZ9rhRJpbSMRcyj7c5ql/PR3xYz2qmNjqZU6ocxVUQ9F/XainnwHlHxTs2vvo1l+08WvGiqUoITqlvHniL3wHNZptivEeaJLQahlQ5vv3wHr//g8vy1kdO5Gdfn/L06R79fonOWrFXIiHKb3uASNaaJBowpLZNcB5XCm92x+ztPOPx49d8+skmDx+sc/fuEioRmi34h3/3IXfu3OPHf/mIszPYORjwfO84jowmgsosSZaglKYMgisgTSInm1EarR06+Aqc4eJKuSFaxmwuL3Dv9o3puQSRn3xxyOFJHycKYxO0jSVT5wpC8HgPpmLAn67vNMK9CJmt/z65zqoSvksbaDJMw1AOMobDY5482+Xg6JT19XV+8Dsf8fBGzHX2XClbNplcOF3C2jx8eu8OO7sdut0BpJFxPfexk1erZPlQol1seFs0yhgKKap4JzDptsPkQRTx6Hp4QTRKDDpYlBeUWLK0CcBgCK+2T3i936X0mu7Qgcs56u+wetBj48Y1bt5a4NYNuHVjmaNdy872Idu7nrPOCfvdIeNOg8HGEgtLC8zNzZGmSXUr66iaHDwE9zfMpvfXa021qQayJ9978E84Oe3w8ujn+FLRTAM++FhSUrGWrFTUPAPBhwDYyELiBV0GjHGYRGOsIknrwX5D8NPZ0BoaXd9/NZfe7P+nyOOAMlM1ibr/JTMrHEJUgBAiGEtrxbgY0RucMZBjaavV9wwaFEsLyyQmQ8r4lkaSYhNdqVyMJ3p+E9aZv4Z4JCKrfRwmJzaajDLMNRdoZc0r39MfBIbjEVKVFSeBqIod1Ro9y3vw/NV+40Od1gdnVrNfWK/b5KLKr+81L372u77z/B90tTnqC83QX8fCpG175V+9hhAT6VD2MY2MOzeW+cPf/ZTfuX0Zkn5yCp99sc3OdhdlWmgVb/CoyVV/Y7zO2kSww7gUNEmEmAaNk8BJr+SXX77hybMX3L27wve+8xHrq/M0V+H2pmXtv/82nR78+MdfodUpZ70xvVGB5AlKz4O1iDIRrhKi5IrHk0iUakikEgTUEFzOXBK4c32NhxtTnFkZ4NX2IcMioJMmJmlUPb961qfOpMJ7BS4X52JqKKwxkNoEpIFyluZcRpJmjIsOx50Bo3IfbUrS9C631zOsOt/YXqmUdB8fiOzdv8Vffb3LuDfENuc5O8lptlISCyaxaFUNM4oAJUHcxCmFyf1dBZAqgOhqNMBgqmjSYDCSxHksY7DacjIS2R3C2SDHmzbNxSUW5ubwbkwoR7w56bBz1uHgdI2P713jxmaTO1vz3N+a5+BwwOtX+7x43afTP+VVXtLolKysJ8yvZczNgUtSdCPFOEdkLP/tsrbaUh05kPHveIqfOXZPfw56DMYTRFeboK5K/yZKaKBRojE2iWVbDy6UkV7RCsZGmfdGNo+YODNUO6vacYUQIl3SDNT7XBlwAuuu97QYWGoCIfjYu6ocWyCW2EXHrL0/7F9CGH6TLdo19aT7H6TZmMeOU3QmNBoNgi8ZjUYTlQtjTIS0w5VIvdoq3Ng7GSzieUc1jOhgNFZlzDUXSM3VzqozGFO6QFBmWuKfzKOaOF/FrDP96w+f3ttZzV7UaaTs/zMdw69n0yzvCojkOy+UvvBv7QRjVCWTaPpt363odU5pJobRsE/DwO98+9t8cn/x0mt3xyI//vkZT54dMRhq0nYTj8aHskKgmWq0ODZ9vS+ikqqLAm/axIaSEYtXmrPhiOOzPiedMdvbPe7e2eSH3/+UtZWIBtxYh//pf/iUT+5f59WrAx493ebNUZf+eEg+LvE2RScZ3lSzbppIUxU0XmlEJVjvSSi5ubHEvZtb587n6AwOT3vkQWMbcyidEiT2nASPsRESXlPUfFPQMWvnZr8UOC9Ya9EqxQlgDVljBZ0nDIeavBzx+MkLluYdN1a/zU0zd+Vd+HBDqb94NJTnbw54cbBHKeCsQZbmSDODallMqqrBqrjxeQkVLLfqbyqomIHj7xTVTExkqTcz55OYlGaWTYYqbeRpxWaW1tICKxurpBa6R4forjAc9jg4PKLon3G80+T+rXXuXV/jd6/NqdejIDeurbJz0OH1fo/j3pAXo9fY43k2blyj3+vTGwdaohAP6v1R078xtqg21KkcyFnngPHnp3SKEVihUIJXghaJEbuoCJ6AahA+MKGUqEr6USk33niuVBidTDSf0jSdlNlrnr3agTnnzhPlzrQZ4qYfJn12iBNvzk8phZz3EUCGoz8+q1jl398ajTaLcyscDJvoVuxL5XnOeDzGOUeapiilzjmrdyUEda9vuk9W/w2T9odRmhA0ISh00GSNOZYWVsnsZSTgkYj8sz/dpzxH0ySRNLvKrqKMUXVt3tOiMvi7q1m1fXBmpbScc911D+uvs1w+qYkqVU2KMxnIi98ZXzehdqqgkXGusJ7DiIiY+IH1J1eDwVpVCsaq+ow411FD6uXC/MCshRDwRYHFsb7c5Luf3OG7n95iLTu/ACci8ssvevz4Z19zeubRdhEfKpAKMumJKGqASJ0ah1ifTjxaOZwf48och8KYBNtYxZGye+A5PDzi66/+jDt3lvju9+5w584CKZ5/+Omienns5fbWMq92zni52+PNYYeTYY4TDy6PkHWJ0+ROp/HGI0HwzFv45M4WN7emN+7BWOTPfvWG3tjhaZDYFr7aLGqBOuoG8IU1Oz8Dc1WfcObaC3G4rqKWVKmprrUgIUGlbYJzFIVwfNSl0/lmSfHb15p8++E6wXj6bswopIx6Q4pxhi8TfCuj2VDYREBHMI8lmQQ9ouLog1LTXm1dqw/4SjqnQPBkaUq73aTVbrDSVOpZLoLK0bbE2pxG5mk2DE0zj19pMB6PGfcGjDodXr3q0j8asf3iiJ9uD2RUBq5fW2Rza5Hrx0Oe7xzx6mDI8bDH9htDXnrKYRKZNVTj0lzXb4stqw31YvhLKcsuj1469odPsGYEqojVh6CQGpIuMWjwvowNfqVQWqGCjc9RlQrnowKtHd45kiSJgY/WpEkCSVLNSUXnVZblxGGFUFFc1QcX52emP8/sezXgwfuCYBKEgn7eZySDDzr/NGmxML9KetxCm8Bg0J0M/k4kP6DqtZ2/xN8kUPlN5p2QZjYig8ViVMp8a5GVhXUaunXp9b0hHJ52KV3N8TcjN6RiFlzhat/xzednxJgNUt/DPiCzugxumEwiz9T1/zrKgHC5oVk7pJrhQsLljU/NlNbO23lvHyPnaemJyrnN9uXeZibAXCul3+lx79Z1/sEffJeb19uXXjcK8OTlPl893iHoVRrzi/SLPkr5SiQtEIICXJyG0go0WKUJ3lM6R6kKjAHbsBVCMsFLivgEl5e0UsPJsKD31S4HJ6fcvrPMnRtLPNobSGrhH/7Omjr2Is9fw88+e8aXT19w2u3jvCKIiV0bMWhx0VGpkhBy5pqB29dXWZ1xwMMxPH+5zagAMQnapEhwcYhRTWUcQggk5jL0f3ZdryplzGoMWZMgLjAOIwSDsRoxGoLCJil9Z1ChweFBlxfPdzgMhazr9Mo7/tq8Uo9ORTZuXufx62Ne7Z5wfNahLFPwDcQ5xFvSVoLNVCyPhBpepwjiKtSpUM8N1oevQ+x5FSEnyBhjM7KGpVU97+IBl5MYR5aUpHZMqlJsC1RIybOUsW3QTFqUoxGjYZenrzvs9Z6yubXCgzsbXFtP+GirxcbGbTZ3c7YPBzx+fYLGYI1msWGZb17NnPHbYndbv6O2y7+Sctyh97xHwS5S8QUKqqIVqgMiR5KYiNYM1X0nFcMNCUrHrDyIoyiKCZKuzrJqLSil1IRvT0QmTis6sNnsKIIEJqhZVW3WJmYUTmJPKyghdwMKfzXF2tssIaWRLcTnL0TZDx/KyTHWwKVZRqBvtqpkUqtoK6pZqJk5q7oyEAxKNIlq0E7mmWst0VYbl56jfhHL2aWvELzV72vexA8rQtfP+cx73qduyQc4K2stSZKQl7HxKeF8RuW9RweHqkhEa6FGrXUkexUmEQ1MU9X480zqrSJVUygDaZpW7ykxJomzGKLQEnWkggckcuQFFzBJig9upq91dUoaIyI3AVboinTX+3fXUoyGRDxLcw3+4Pe+w8cPFli5IHp3KCJ/+rPXPHq+h0pblKWBImCSjNG4Q5pF+GuE/tfON1QZigelK5C0qeYqZi+TQ2uPnU8oCQQHo9Iy3C3ZPz3hiy+OeHB9m08f3OTpaQSJ370DG1sf8cnHmzx/sc3TZ2/o9Qu6w5hhpVmGkxFKw+Kc4TsPb/GDO+1z57S7t0+nP8L5BLEJ49KRWYO1ccxgMquiFX6Gqnq2jj25VyqS0vp3wpQCRkm8t0LwKKvRJtI3aQw6yZDSolWDZsMyGuxxdpLjyqsjs6NcpJfD2WjEjVstrt1u8WZ3nZ//4muOTocMRz0884ykwXCksI2Mubk5dMWRJnhKJwQ8NjNopXCuwHtHI0kruG7JcHQGqsSFAQuLNyZZTmrB5UN0MWIp1bR1SSJlHMpGk9kmjaV5wvw841HJ4KxFGBaceth/MeLV3lMe3Fzmk9vrbCxr/tHNhjoWkU+ur/D81T5nJznf+/Zd/uDW1Y76t8mW7C2+9+CfEIzwk5f/hn45xjsfnYvWjMucIAXGKJyvynYx5SCyqlNpugpOl0RghJps8KVzlNWeVCPrIqLQYq0lzTKarcjekBcjvC9xZUFZOFyp8FJlXwQkROl25wI2SSjKkjSB49MDCvd+2ky1OQ/rK9fwhaI/6lK6EmMrB10BQmrHBdXeNdk3r0DaAdpECqVqyDT2lJlmaEmSReJvZXCFsJS1MSolvSKrAjjuw2l/jLIppqK9U1U/TwBXlcs1EXFZ9wQlRFkTX7pqf3UYo9Am9v0h+oRm8+o+2UX7oDLguXRNva2JfnXJ5zwC5N3PVp0mvu0Y6ojj3OdXfayolDl1htOfpSovXnE+AJXUxDfRM6VaSE3g7s11bm4us964fJBHXXj+6oCXOwfkro3J0jiwmxeYxBJHRGuGhFAfTAWhjeCHaBYtlhB5fyY0UMEIgsNRRflp1EiizCh9yU++2mO30+fpwSm3bm5w+9YmWyvw3Ydt7t78mN/77sc8f7bL519+TafXZXmtxfVbW2xsrbK60GIpO3/+x0ORf/+XvyQvAibNKqYLO2F6mFwDXW0OF2KEq1gC3mpSERkrDzoQtAdyMCnBxbkMrRLExXmwzLSYMhdEe3YictCFXzwfcdI5pNM/ZXVjlQcPbvLxnQZbq9/n9ZsOL17tc3jaozs4Y+wCKm3ixjnNrEWj2SbLkpjlaUuQgPOBIBpjDZhYRgnBEXCgSpQ2KD0NeMZjCK4kUZpMKxoedPB1iwyvhWBAWchsgrZLJC5QnBYUI0037/L89QnDTo/ra3M8OfYTePqhF+n311lc+G2DVlxtbbWh+nIgKhEOh294eRg46R0SMo1JA/gc8NhGI/amJnOSVZ9aInLwfawWLNRaU5blxGnV2UuWZZjU0EgzpCV4Zyh9QeGHlBIYjApA41wBPiIDNQWRcefDlMWMzkhsC60a5xB/wgzibhaFLe/o8SiqTFRxXiG9oosCqFCAWhmUGKzKWJpfY6G9cuVHHndz+rkj9wnBKuzMAx5nuXT1DYF63vWbnvX4t1rtXL1nxvgBzqomVXzrnNUFPr2rSmrvWyIMM86kPpHzJT8zEe2aboQR/CByuWdyEVRx+TgqeKoEnISq/nq1tRLFxnKbhw/vc31z7tLfn+45+enn2zx5fsxpd0TWmMdaTVG4iL5TsVemK0r+etpDBCbiZZOyqgYSkCxOr1Z0pkiJw0WEkhGsjvpOeSmMA+hsiRfdkr1HOzzaPuT2qwM+vX+L+zeWWJ6H29eV2uuJ3N1qkxdDlhbmuX/zapACwOnpKTvbe4xGHpdFaK+WajWrCDAubETzCYqaI3iy1BcfsGnEcO7f+IAaVPCRLUA5Ir2WgEoiOzQGvCIzTRYXl0lmqo6Pd0X+7V+9YLc7pszHjMdDBv0zVt6cMhwpbt1Y5/71lKVPF7l7Y5E3Oyc8evqGV7tHDAYjxnkfPb+KK3Jcq0nWzBBjYq9PC7qKyiVA8EJROSxw2ATSbDqhOxwI4mKpp6kaJGIxQUWouY60YV5BMAaVKrLEk6BRmWI8ajLqCoNuh6/fnLF92OPorOQvnvVka63J+m84vdKvY3NqQw3lUP7w2ye0ns7xxejHdEcHeDdC6YDWAV/ksYclSYS41wOqykE1lwV6wux75Y6jozPwEhV6vQRc8BPnUHqHMYbEVhLyiUbbDAuUEjBJHOwvbY4rCsSNUZV0UFF+YBlQZTSyBaxpEkLMit52ZeuMqqaDu+i0ouOYZl2Kq3rEMeCLHRyNUhZrGqyubLHYXOWiHYjIP/uTA/pFoPSCqiZE9GSGbeb7RUA8wdfXQap9VZ+rws0eXz1f+T723s6qjj6YjRwuNB1nD2RWWXjSZ5L3y6wiz98Mc/tMNlX3zWZnD7SOMMzpwNq7neLb5rRi+fLti9duGL736QM+/vQBGxfkII4HIn/5833+9C++4KRb0mgvgbHkfgRGx36UKzAVRHvKQeZRIc4qSB1VVWg0pXRsXYqeQkbjo0YkjQRt4+1rtaIMCmyLQkqKoqA3HHF88pqDvQ57d65x59oy232RrbdoL73NRBu8LymKkjSNE/6eUIkCSgU4iIzvsb92fq0vPjSz2da5mzgyhSISexKYMGXHDwJeEB/HC+bnGqyvr7I2s3G/2Dvkq1evOC7A6oTMpni7xOnA88svX/Pi2RsO79/i9o0Nbl6zrH2ywvr6Ctee7fHizR4nnSGDwSlFgH7PMrewRKM9B4lB2wSrE4Ir0bY6Rx/wzoEIWaJptabkxcNxjhcDOkGURUJSnaNDpAJoqEApkSYnMVEyY6mloJmQzy3RnUs4OrScdroMX+3x5mCPu1sL/PL1sfzOrfed5/ntsZZaV33ZlsQ0kNzwxZP/RCcfk7YyxHrGZQHKgBiY4e2LqE3HtHRyfmlm77GrAuDZ4LooYotAm4DVBqMztDWRONtoMttA24TMZoRGQSgNYRTFPXP3YWjAebWhfnX2R5JlLUKvepavuKoToAVX712z5xP//YbEon59ACOa1GSsLq3TuqJfNShg76RL4RVBWxKbghudX7sJI4MH7/DeXXKWdbY4e6wKwVj1VkmSi/bezqqGgEZnNTMoeYXV0NB6GO9DkYI1lFxHEkCCAj9z0kpR0eoLouIgoAoRbqwAVIXme4vPqoEh0000fqaXCsr6Dce2vtJU+7t92bzWuHRSe8fw2eNdXr8Z4NM2SWYpJeDcEGNTtEooXcCYepg0TCbm4+nFSBHqMkCMvuOjF0sfQREbo6pR0eyUiHegAsoEkkQxKqIeVZosYpMFfFGwc1QyGu3xZueQk9N1fvTVrnx8Z52Vpn3nxVlZXWZlZQW1t4tVGl8WIAqjJdIVTXx7FMc0MxHXVY7qqn9n/x7JaHVsAouO+jcSs6ngAjp4EuVYW22ztDSz/j2Rf/+T56B1nM2yTVKTIU2N8oFRPqR71mUweMX29il3bm9x++YqKyuw8P0trl1fZ/fwhK8ev+LktEu318GVY5r5ImlzjqzZigFHkFhC8RbldZzzCZCZhHbTciIiK0qpsXPRyYvFYSiDQtsECRFko1RFmisehYvlax2i4KVJaKZN7FqKaa1wfGLpnHbYHozobw857B3yJ1/05eHtNh8aePym25y6oc7CG/EPBSmFR29+RCffQUJOYpuRKLl+cSWngvLVc18NDs92LC5slJNe+UzvZ0JeLVEpWyTgnacMReS/M3GWK2gFUpBkTQwGa+IQu0lMdGzmw8uyjWSOZjIPfhrYz9pF1N+lipW6+Dv1Ho5KQQCjE+Zai6wsrl35upMeHHeH5KJBJ1GKCagJwevco0bx1nNsIUQ6s1mLGIFqCLsKUuue4fvYezurNE3Jsgx4d5o7e8BTxGB9wN80chtNRKDqf0ygjRfSzXpOQkTOQTpj1nWxBnWhZzX7Zaqqf8987ruk7DavXS6Zve6J/MWPd3ny/AhlFsgLxVhKbCqgPT54lKqiurrOXoEsJlxeIqBMlIOugQfKxx5W5REMGo2NsG6qcpR4HA4rMQNeyJoULu57WqeoJMWVw1h77vc5Pj3k9tbce6ffKw2l/p9/8Uxgd4KcUl6hbRWdWQFblSmEiuTzvCO6VLJ4W2ZV9cFUkKqsq0ESwBC8JrgSo4XMCmtrLbIZFZZhAXnuwAlL820arQWCQHBVJp4YtDEMijHPd7vsHnV5/GyeW7e3uH1njdV1w9b1dTY313n9aofHz99weNqhd3xEsD1a7QVa7XlarTmc+EjD5DTaK8CQ6ZTGDDBvkI8pBbxROA0jPFpF9pe4VAYRhRGFiMEoMD5qxokPeCmQJGVuroVOm2TNBUa9MSd7B5y8OmY09ATucjAS2Wj+7XJYS/qm6smOJIlBJ55fPPpTusN9kgWDr2SBEBez7oisqJ4Zcy7YfCvTDec3+Mn9WFUIIhghirwS4p7iypLYqyI+XwLWCKlxGA/NxKHk/YQEZ83alOwtzBFX2SVndfG8gJhuSt3OO2chxGAyBEUja7KyvMrq0uUSIMDu4ZDOoMAT56jEuShHE+qAtPJUQqyEiJ/Mss3iC6ZzHzI54Kmz+msuA9bkirOEnm+z2TJgfVC1fUiWpY1CVyzusyfsEYqZgT5jpmm80jPOcPar6oClikK0UqCnFzPepB4XPGU4fzO8j3319XN+9suXHJ/lqNYGoRwjvogbkyoQqeHiCbV4GaJRWuJr0ChlINgqUgoxT6miRqPqB1JQotFiUVWDOZbdsujEvMJ6hZQlhR+DMdgkQacGkzURSemMezzf82y9yXkzFLnZevdF2dzcZHX1gFeHYwpyUI6gJDIHpAadanySxCxXzsusXx4mP++ozj18EyBOVCJFUvBRakC8Ag+JCrSblq2txUgiXFm3V5APPE2fsWjmmWs2KbTHBUfuwbcsLK0wOB3hxiXd4ZjT7T57Jy94vd/j7r1rXLvW4No6zGXXWV5a5M3+Kdt7pxyf9smHI3wJvoRimGIRxBcQNJlJadiUOk89FpE/+skrxjIGk+CspzCgVQAcOsTzCyhUSNACBkG0h0bskfmgoIxUTm1lSOaa5GlBcJ693Te87h6SvPG0Vx588P3622Dz6roayLaILkErvt7+Kd1iH0dZAVqkivvq3S8ODldlCeofL9nbbncVx19cGXvYWkkstutIalxXQIwxMeN3cWMuVI7xmiJE0tkPNaMz0iRjolxcOZmrqg4w45Rm/nx5lnH2v/0kq5m1EAJZ1mBlcYU5s3DpuPadyL/4j8/oj8Z4acUqVwhofdW6xjXDe+QSqrou5cdNeHY/mLaX3m0f0LNSJEaYNDDrklT9ghnkieDBhyjzXjtSrapZz4hKmcC2lTCjoRatqj0HrUFF9gZTaV0Z4sS+9wpfJoTQwOsRHqlIWd8S2ZxDxgQmjARQ1b8VEAhSvLdyZW3PT538m3/3M168PMSzgM9dbMw2Goge4xznem0xPZ79jtmZg3D+v6tGZaTW96AUITgkxChdqyRKvKs41IsEXFGSaEPSMBFKrqiayDEKTU2b7rDPSdfTfQ+k7cm4kNIm3Lu9xs7hI8alI4QED1FXyQUSqQaIjaDFVA74/M0JFSWMqEnZxdRT7xOAjidg8SIoqYQQdZyrEZEIX9aOVqbZWGiwNvPhZ8MBndGQRiOW67xzKONQyqNxBKWxqSWba6BNBjqBcUq/HPH0zQF7J8fMty3f/+QuW+tLPHjQ5t5Hbd5s3+SrJy/Y3j2iP+gxOh3jkiYGizWCcpClmlQHrIlXzAGjscM7hW1ETSaPwweJwVWYYcKQKkuu5gTz3Meyk4qqAlLEzUsrIUktK2urdPodBqfHvNw/4cbB8aT0+D7362+TtdUNNZI3kv6dNjaZ41dP/xw33kElfcSMCJSIjtp0dekYXbHQSEX+Wz37qlIVUFJGZO1EAUIxQRYCJo3zR+I9QRw+xPJiUPG1EuJnRb0mH+/lwGRO60PNBIXVGaJNNbMU99nZ7GQKjpjZH2YDQuqAvn6OqqAI4vlXfXJEo0yVe4km1S3ajVUSLoPFeg52TvsMPHilscrgkSjvVMHWlWhMiG0KEU/Q8V9V1wdDfaBhgm+IlTJdgWb+BtCAS3PzKCrSTC8IFk+MoFWFcIuH5TFovCtQpadhE07HY5RNCFrhS0emEhTgVZSjF+poGxCPUIC1JI05SpPigiEzGlWOY5YgKVrNc3zUp9G8QXd4RjNr4FxA69i7Oh91nF8MrQXnShKTxtqtshTOkzQU/VGHCZTtPe0XvzrgZ7/YQewClhQnOcoIwXmCV1jVrCuQaKMIodKtQSqevuj4CTEiibLdlXAkCoJClEWFqZw0RPaJ+FMcXI3lQjBGCDqAstVNCrUcC0J0YAG29/Z4+myJ/UJk8y0MCOPxiTQacY7ns+O+JKni6+en7B2M6A8EUZYi15TOkVSK15qobaONgFFoA9oavBeK0pEmrelQtwJjNeiI/MNHChubZqAKvET9qNIFxn6MSh3GjVhZnGe9NU2rTkTkj3/6mr7xeBPwmaCN4H2c/bI6qTgAHe2mxVshT4VxFsjzQFlquqOS3nDMcPiMlcUGd29uce/eCg/uwM3rd3n9ao7t3RP2D8Zsb3eAecQYMmWQoo/BkiZQAGcjGI+EYii0Ggm+X9JeyhApYmkyeIKvpuyMRbTgVOw9huArCRsXWeGlnn8pUQqsiZl1opZIUaiQ8VvItvTe1lQ31UBORD5eZGXuPn/+q/+Vk8FjXMOhkpJ+PiTJWmTJPKPRiDSpWlleg08wkqKVQgWPlwGJFYIu4uAxCh8ibybBRtdTVUSiEpsBXev1VaAOk0QglI6VDxGNC9VwrIG+HMvce5PZQoplsbWId2C0xXOexm5CdhBpfKaB96VsKgK0ggkoQhTmDAYdGviQ4AwE7fBqiFGaRM2zPn+dj2/9HVy4TLP0ugcH3jBUCYXXzCcpw/GIQutIOI0m1RafF4DDNlOGvQ6lG5Fai3cxm9EUSMjj/JivwHAeUJ4sUcy1/5rnrKzVNLL4wPsIFqVOwJWoc9opqtqExYfJZhzXWoMyEASjYs20dgxB1cXFOqrwEdKrU7zSBCRmV+IhxBurLDOcb4KylXOa6sycq+PWF7fWozmXxMZoLNLbO4LkVcT0fvbZjpN/++++YjBK6I1KVENX0NjYtNVSo/omjakLDVM9/VuNDqwBIlXZQSk9gbXHX+vJ35l9b/0VqAkkPnKbVeCTCZoyTvmfnBzz6tULfudbP3jr+TUaK2qvN5BhALEtfviDj7hxEx49O+TZywOOz/oMRnlE1A9KxjIitOZJswybGpQOlIXDF2Mym9FuthiPpnMuUU+qOu6gIjRdCVp5QvBVCUZXcP6AVo4k8awsNliZARb0B3Bw1qVTjGg2G3gdIqs6VO+HelJSgkMbyJoGm7bIypR8XMbxgtLRGY/pDk85PO6wt7fMw3sb3L6xwv27a9y7u8aLVwVbG6e8eXXGydExiS25tj7HvesrNGxc9dIRhyE9UCaEwlDmMYjSBpQEUDHA0CrgUDFwE49WoMXHjSfE14py8f9CVWKH4C3B169571v2t9LaakUBvOh9LgrPj7/4V7w86ZEuKRbbTUZlQVGOsZkl+HHFOBGq4NcRazp1MFuiReElMpZo0dXdVT/3VdYlZto6qJSMo7ZV3KxF+7gvVRmcRz64KgORtcbqBJTBc9nHSZihJJJZJONsED57A8RMMJIgVeCkSog2qBDnsEpHojKW59ZJZYG22Tr3xfuFyD//xRGvjs7wpk2iG5R5gdWGUgdEDBJi68JURRQRwYsjUhHUAZdCVUTA9d5cO1mlhKxhMebyOV+5Tu/1KiIasN2+TCt0ldXlLnE+ljhqZ3UOzlhtv1IHDGqyqYtQEaRajEmqxmeMkOvBXSVCUThcWTMoV0S0Fx9auZxixu8P1CKAsS+kosRFKOE9m6RHhcgf/fsvePzsNUWIEOSmteQhMmFPfORFRJzUh3a+h3Px71S/n7ip+r9n/l6jGmf/HnvCenKOdRkWbeMj6wraWUbZO6XbOYlMIBdsvxQpSzjtwp//8pDDkw7LG2tcv73E4jL83u+t893vr/Pq1RFf/uopu9snKJ8R0jal9nSKEUmpaWYpWZJhJeBzh7gBRpUoYt9QiYmbAAaloux8ogJGShQeRRTK9EFjJDqyRmrYWDvfED4+G3J03MMHQ6yz6Zg1U/czY2NZa5n0HYy2pKkhTQNp4imKAuccp2cjsrSNBMub7TGHuy94snHCw49vcut2gzv3Um7e3mTr2hKHuxlNHbi5ucCdG6tsKaWOxYsuevj8DCnLOFQamuQ+iUAY7eLIAQE7kcIw6GAi1ZMugYrJQ4AQI22vIlI1bohTequL8y5/m+3u/HfUnv9MWq2Un329xMvDz+mPjsgyi1iHc2V0SAq0qoa1idIWnshCEnyKqIiECfjJsD0qr4pwwkTUVatLgUC9jynRaOWr9VcEL/wavgqt9YQGytUVpgv27iHbWVNAhX6qJOOlauaJChgsIcBCY43rGx+RmsvMFcMAL17v0OuPMM1lnFOMxyMarSZWZtCYMGFcDxLwZdyftVR95hkwS136n4WzN5tNkuQyPdtV9t7OqpFAq9WIm7mZcHlcMiVEkIPzEwCEVudPrnZWtQOrr46q5iOkEkczFThAtIq6PdSDcYIOitGwwJUalZjzi1JnHKKjdNQUR10fwcwBx5kdVVEdlWWO98U71+N47OTLx3t8/vUrDk66eDOPblgcU1bit8EeLwINLto3TanPMnfMghRmp921slXJz+GrWTgltoqywFfDfYuLbVbX5rl4rzweifzseZ+DgyEnJyNevdzn6KTLwsIBmy+X+Na3brG0krG1lvKD765x79oa+zsddl4e82rvhFf9kwhSUU0SaYHziA+kmSHNIiUWuhrERqrIUWO1xRqFDiOMDuigQOlYDHUBnEd5x3w7Y2X1fEP4rJ/TG3mMbcUsuV4rXzFVM52qr+c64iYTJdBtoiPfoSSIWUIcFINYth6XJYUr6I1f8Pil4Tvfu8udawn372d8fP8ujQDXZma9VpVRT89OZDFLSJWhLB1FqcgUFGJxQUdxEV2BZ/DooGKPTsX+S8CjKCsAjcITQCRKVNQ9GeK1fRdM+W+bLekt/uD+/8jS4iZ/8uN/xZPtn1EWJxjdx6kxokycYVQBVT0vEkpCMAhZrApJxcOgdJV91YPn4VyA+7a1newpEvv3NcDrfYkPZq0mXKiJa9/VeZx+x1v24GCrKlJFMKsqImhV7xsJKQmrSze4uXGPpr0suLh/GuerMFl0xCFEmru6WlNVjqZ7ayQKmMy/1g5d1YQNcT+cgNtUJAxvt5t//ZmVtdBqtXDOYQ3VLAwzDb2pGRSFL3FlXiH0dITshrc/VBPIsgJER4kAa0nTBjUfloVqITyiYDQS8iJG2kBFOQ/nGlbAtDE5/S5qhnVRKBVQyuCDo3RjvBu/cz0OTwb8+K++5vXOKYVklF6hGgnDYhT7ayKTpQlvocHXNbxUv9thXYSCvg32HZnlFVok9hRxIJEeSSokiwqK8bDPtRstbt/aJJuBW7/olPJv/9MzHm13OD3pE7ylLAJOJ3TGjuGbA17tvub2jRW+8+k9bl1fY2EeVj5d5KNbixyf3ebHv/iMncMTjo9PcG6Abi6hkozCa4pRiU3jPFkCGKUxKgLyE/FRCEJcJCDQCUpHYllfBqSILAVz7Rbt9vmMudMbUxQasgyt0+oBqxwWMvk5rlmYoq7qPgAaYzSiFQvZPGUpWG0otMDYU4YxR2c9jnp9+mWHo3ubXFtd5v7m3DlHVdv9pRX1J786kuPTPbbPSk5OzlCtVUIKiY2ZZBS+E6wUmODQKl4/bTKIWEMEhUYjKkxQq54QnZaKDAzq10Cv/jZbQ60pgI4cSvK7S2wt3+aL5/+R0+HXJC3IpcDhY/ZecwNKNR0qIbYj6upJ7GMQy+RQs7BElocqeBY3RRwyLWVJYDrYX0m0q3cgpa+yGhX3NvmPD3OAlcOrsnQlkSUnDqDHUZ9QKlpmno3FW6zO3WA+uX7u/n0zFvm3Pz/i4GwIyTJ56VHK0GimEIoZR6Uq1QuD0VEfT1w1Y3X+DC+cb51YBNrtJjb5ax4KXmkp9X/4P/4LIcSbYIqoqw5gsp4RXl3PQSGRhNRP/qZnGoMVGkcEXSWJUqHHJEQGApMmsQfkppmTrjKw0TBQ5prmfK3sKahqaDNmFrO6V3W98XJWqJQC7REnODemdO+eJXv2fJ/PvnzBWU9DskzpNYk2OIR0pi7LpW+bfudVGdTFocDZlPn8aziXUU1/r5BYokekGpJUCicOG8AHIVUWvGd5sc3q2gKzA+TbO2f86qs3HAw0IUCjYUnnLJmG4Dx5PiChwZPnJ+zvnnH9+hoff3SLTx6ssbwC7SXL8twPeLNzwItX++yc9OgOC7r5iJFTFMDC8hIm0Sgs2mq0MpUOluB8gVGeWGOPA8GuDLjcg/NYo1iYa5ybr3ozEvk3f/qYolSICszJlK1aqh2+LtUAE6LNOPcWb4+alzFI1OVqJQ3aWRvfVoy6IwaDkqKM8zYv3xxy1jnhxvoqyfe+/dZ75P7tVY57htPPt9k/fIWzQ7KFhMXVDG3AYKsKgCIoN+GJdKFyWkSU6oQtuwo/fIgbQ5Co9hpZtN96GH9rbVGtK4Dt/DOZa2R89sSw2/mStG3xMiTgEVMJOYbo5JWOffRpLb6WsJ9Ssk24RetnDxCJfWCZgZdHGLeagC+0thhj+RBwRW31TOk32WWndXUQrGYzQ6UIhApw5VGiCQW02ytcX/uIhlm89P4yhWd7pwxLQ2kiMjdJDFYCw9EYmxqC0pVIplSZm4agJmwusfeaTKpcEeQ2WwaMfmJuvnWpsvM2+yAi2/ZcE5t8M8xwAqSr8Pb1hjwLsLs4GFz3sWpQgFI6Ui4afa5kQ93X0rGmXIwVZWGrfgcYHXm1zvdgrj7eSXZVOzCJw5rO55TvwZz88uUhp50CJ4uItREe7jxJ2sCXOZYZR1NnUDUW4oKj0hU24qpJ9bdlV+fO49xnUm3QUwirr5SUQwgop0A8a6vL3L61xcpymxryfDgQ+eMfPcEVCanNSFJIEoWTcdz4jUaSBE+GtovkaJ5vj3lz8AVfv17ik09ucHt9ibXU8HufbPD9TzZ4tTfiZ1895dHLPUwhSBL1qIJPo3NJNJIoUhv7klrV0WrUMXLeUBZQ5JHGqZFaFufnWJuZBD84GbN7cELwBoIGXQnBVVGzmVkrpcykVzmRvWE2GReQwHjURfkxWdJk9VrGolui03V0+gVSKk46A6TIWW2c8fxM5N7S5V3j+qJSj49E+i5n9OgZRf8NPmQQ5knTDMnm0WmGMoIxGqcj8CS4SqpEuQoAEAsvMUOMSsbTsm+YXPf/Vu1G9l11WH4py+1FfvL1Egf5C6Q4ZOxGiHhE+cgDiKCUmwbZoiNYQnTFHKer0YrakcV/Y3helawnO1fMvKR6n0aT6ASj33PnfYtdHay+nQT6bS2DejRIE58nUZF5SGNJzDzri9e4vfGQ9ArI+k4X3pyMCEmbIHWmHwmADRIBE1pNEL1x8ja2fqQIqOBRAkYrjDKUVdapq75VEA/EGc35+fdnYPkgZ9VMM5LERg2X2S5U/VUqHnYsb4WIBpQwdQpUZKxqht5k9iMkZj9iiDeSAqWr1Fqq2mtVNlPK4MsGwTVRpCDTLCOeeuQBUpObr/7uqzSv6tq/JwSHD2PycCCZvsyVVdtgWJLaeZxkjFwgoBgOxyzORxjmZSfy/rvJu14/27O6XBqM9WKq6CW+MMTREx//FT/m5tYt7t+5wf3qRjkKIqdHgbNeER9L8YiAl5iJBAVZo0mz3aQYK/Lc44qAkCDFmHznlNPxgC9Txf/0w99Htw3tJbh/r8nqxnf5ePsmXzx5xcvtYwoPpSspc0thktgQbWZRvddW0ZkyUVXZK/Iy4L2QImRWsTDDv7dXivzi6wNOTruIWo3cZcxuOKqCmU5LwTUhcwjnmZ+VUlitCd7RShOsjlyYpR/jQ0ljPiGd36LbGXE8Oqbbg8fPjrm+ePX0P8DDNaV+eSJyNjzgzdEho2LE2c4ZWXOJ0AbmDI1GSkg1uuJBjD08Qeu4cUW5cl1tDGoCSBI1lRJ/z1GVv7W2nnxLFbIrc4sb/NGP/gXeN/H5IWUYoOwIQl4BqaCmNKtJXaOpSbZVb8AaU5ULYzQ5Cahn+i+TfgxVheDXuBAXHdG7WH6+aX9QQpWhx+MISqAaiUBFVfC5dIH1+etsLl6nbc/vcXsi8r/+fMDr4w5i53HeYJIE8Q7nChbmGuQuR0vAY6aECiLoIEhZxGWcQaVEyL+nhoxLRXagtaLRuAyZf5t9kLPa2tokTVPyUYmyJj7YUmkx1SaCloDVivFwgAqCVZoieJpZi3I4Jkwx7udskmkYzTgfMt9o0W63UUbH/1fyE1prvGjykWU0UFjTAm2REDdYXUXWE9olamTclEhXYXAuzieJxAg2TVNCUdAbHGHWvhnWs7K8xnD4DMlalK7EaUWSKLwryJQCFzf4WoumdjDGGIKrUj8962Dr4bgo7DZdTpncnBMAxcwDcXVmFUulZZAoX2ATXFmgC2gYy9J8yvJcylwVVB0EJwLsHHbYPT7FyQiTNOMwrlisaRPQBJeSR6AjSVbNg9BAiaIIjv3jgqNQ8n/v/oIbK/N8+vAW9243WGnDysdLfHxziW6n5Be/esrzN0e8OTyGdA6TLpIPA0NnyRqWRBus1+QOhsMRCSkeocxHZEmb5aX2ZDasCHDS6YOxGK8qfjZDHKKWC2ufVDo+02sbyxSxqi8C2gtWCdp74osDWvk4P6YNojPaNBDfonfUpz/yvHh9wN5QZOsKJpATERkD/90/+h7b+6c8e7HN6zcndAc9+gOFH8Cw2SZtJjTnM2wiGK0xWjAovIus4CbRETggce4Mqv6tjv2O1Q+Jhv6WWqquqTN/KP+7f7LBz7/+Uz5/8iO645eUwVF6h5Oi4mhPQBK0yiIYKZR4n6Mp0YklVBWcunSsJmMg1f6k9VSTTRTeC5aoBJEk77/51paoZCJbArNVpml/bNamz/9sWW1qoZLpyJIGpY/zZElqKzRuHED+3oPv00ouZ1UO+OLlNi5pMRh5Gu1FCh/BPa1Wi6IYY7TCAYUraaRZHNHA07SGwekprsyx1X7kqrIggK8Iyo0ylK7EasXK8mVwx9vsg5xV5AdM6I2mU9oRIV01KEO1adbcdt5HyW9pVRe+QmTNPFazaMDaat8nIhGGbHRVAok9Ly/EBqJr0DsDCZYQIku30lKl9jBNn+sbreqXTYhudVWHDlU5KKCkpD86wvHN8tTNRgMtQr/fQ6Vt5lptChxlPkKCoKth1Frls3YmkR7KXC6FzvSdzhFsvqMMOFmn6r2RazDghSobrUscHkNJooVra8t8fP8GVRLIhrbqs4ORPH6+x8HpgJCYOFioU4KOD7bCItVMmDFRGdXqumSRIGIRaaJ14DgPdPfOOBqMebm7yN3NBe5sLfHRcjz47WORzaU3fP70DSdDx4gxPacYjQOjPogvaM3NkzUSjDEUoyHlqMNcFri+uUgziYAfgP6gpNsbUbooopklZuKAZu18Bvq2q1qVB6VC+scAukJUTR1cmjawiYAyDPMhp/0unf7Vn+iB4SAWGD66scy928s8f9bn0dMd9nYHuLLPsMzp9DWNUUqzldBupLQaBtswWGuQYOL1rCi5vIuQZK1rFKtw7EVW/xbKhnyoLZl1dSJd+fvfX2ZlcY2f/PLf8OqwR7OxRLsVWdEDNgZf3uArJhhrLUZNZThEaWpKZTi/T9XcelGdWCpQhSaxGZn9cGclyIRP79dBE140retj9PH/RK5W8WAlZaW1zkK2Skrj3PsOg8ifPznhaFgwDgptkpgVhboEGi0iVg2iI+gnVJ0UVRbg4uC6mlTPalV2F5MNqPZgR6PRptU+fwzfZB9WBmxltNttTro9gkjsK101xFYN7jrncGWJ9tOZkPj36oaYSa9nZ5ECEmUiVJw/SNOUchAXxdZZiMpAtTk9LTCqVWEFDWpmo49BiZr2pZgybZyvA9coRY+4gm5/n6E/opBjSa9olp70RH7yiz2uby7x5M0p+SjHM4I0xWhFlmSR5HXS5J9mRt77CRfWZI73YoYZpo3dSZO3Kv0gwsUiwewsllw4f8RGjj1XoENBguPWtUUe3NWsKqVOgpcVbdTOYYeX+2eMVUppNEFb0CmKDKVSYsNfxSxDBZIJwW6lLyUWJLJd55Iz8J68U3DSO+DVqyPuX1/lp89L2Vq1XF+IT/3OQOTV7oBffvmMxy92CaOAajTx1tLvnNE9yzHKkijQfkCiPA1VkllY1Uodi8iXLzqcdPuUHrIUjI2Zk9RN0vMNqSttZp4arUAFhVI2blZKoyv0YCx3KLQWbOoxyRg3HjAoxwzy833OPSfS68PjJzl7B6coA7dub3H9Gty7Pcf1ax+zv+/41VfPefxyG68tmCa9nmNtaRlfpHifVj2QVgTMaIUyhuDjQHFMxMvJkPD/36KtqAUFcCDPpJVmfP50jZf7n9EZ7KDCAGUC1sT9xePx4uOQNSqqO6gaTDGT3cyUAaOqdzXUHvHviAjNrPVrZVZCJIcOIXyTOtHV773CuU0YbvCTBMG7gCot7XSJm2v3WWmtk3H+WHMFP3+0zUFnSCkpJontldnzdyFMZl9jhqmoFdddPoaiiGXIGcLaaPWJRcg6CK12g4WFv6HMqt1us7w4z85+j1m0bI2ln5SzJCrg+jIOWaYVclDe8kRFyKjESfK6jFV5YZskNLIWpVQaR0ohQaFNCszTPeuiVRMlCRGp46umc10G1NNe2ASkUZV+6nrzhH5DEF8yGB8xyE9ot64eDl6ZV+rzJ0O5sbXIwckJMo46Tz5YRCeMVYk16bQEZfS5wb939aSurGHP/O6bo684RU7tqDGIC1FHS4S5JOXO1gJrVqmT3IsIbHuRf/3HX3A88KjGEoECr6KEralQULqe6yGAlDELRdBVZFnN1aMUZGlGqlISpSnznL2zHv3RIQenA5bahp++KmVpwZK14A8fzKmnXZGPbt7g6bPXbB936ZYlg2IE4glK4XxJ6vuszy1y/9YKG5U6c+nhrDOk1y9iT0dLlFyZ0UCr1+9qq3nYrr4GomxkS9ESSU0ruLP4HFSJSRwqc9hEoWYQlUci8suvz3jzpsvp8ZCTswHKCDv7p2xdX+Sj+9dJUrh7z7Jx4yFbX63x2aMndIc9WmnG0eEOjTSl1WrQbs/TaBqSZgNd87GhiUOfqtLG+m8bYPE221AfqZHsyfX1G/zkV5t8/uQvOBlsU/oeXueYBEySUHphXBSISOzPVD2fULO+VHd6tNj60EphmIIhQpDISfmepKyzVjurD3rPpGJ0xe9nVCSUUiit8Q60NFlsbvLw1ndZbK6j7flA/MUxPNvv0c81og1GDOJ9ZByymqAqNKpEgl8qZiGlFSaAjHOUK0B8BT6Z7e9FkEoNWw8h0GhkzM+/H9EEfKCzmptrsby8jNZ7MTUUjVY16DzWeZWakpQ65/BFxXdXl7kiTOUbLYSAUYqyykIajQZdrSLrtopS1EprjGrQPTumyA0qMXivoGIFDhOJiTA5PpFYjlETJMu0HDyBo0rB2J8yLA+JLG9X23cetNS//4sdabVTHr/e5dnrbQoxGDPP2JdAGlkSKueED5QS12LWYYkIOobs58g23uaQLrFhXHRkuuJbrG4QG0C8oIOn3TSsL6fculYN1PqS1ayhfrqXy8vtE7p5QDJD0C0IFZu7DigpKlBMfEBUze+jYmlVaVBUmRaBVCmK0oNOsUkDFtsUwfOyM+bxwQkvTvtcW1/g/u0tvuqIzDXh2x+vcHt9hdP+mF8+fsGjNzt0hjlzc3NsLC+xsXCNh5stfnh/2hAux3DWHdMblojOEKOjLp86DwCS+t6T6YYDYXoKs/ceVWYWP4g4ahHncpQIJvL4YMjRqkCbQCM1ZNkMT2EPvnx0yOs3Z7iQ4SVFW2Gw32G/f8bj1y94cP829+/dJMvgk4+X+ejB77O9e8wXXz3Gjx35yDEe9Rn2R8wvJrSDIiU+AyFEqpsQ3ExJ6q236t9q8+FEjF5569k3VaQR2h58JRvzd3n8+qc82/05p6M3jPNTkpbB2FhejbFtSgglVIRyAbg4Bnm+ZF8R5QZFo9HE6A93VkECReUsL6IBr7J3zWJFgEgUa42MNgpXQCptVlvXubP+MXN2+dz7n45F/uV/2mW/E3C6EXt5TggukuHG5MHjqeYXNbGHGgRbf0c+hLKMNFfUz9z0bOrnTSo6q2Yz+5srAy7OR2XW+sGY4uXVpKRv6iYkkZDUudg4NMSs520XQ1VNzcnnqujsrDVkzcZkU/aByDmFhpCRj2E4KJhbNig0IaiJxEZ0Tpp62HhSExZFDTudOKyJqJRn7M7oj44oFr8Zwv6P/+C6erQT5PmbPX7001+yvXvK3umY8SDefHXJT+tIrR9kijybPe8pcq3+7fn1uVgmvaqPNS1ZQD3kWMtsKAlkiWVrdYGHH21ybyM+fiutKCB5cHjK2bDAqSY+aKxOUSJofISpStTpUVqjqVFq1VyIirNAUhPlEpknkmrNldaUAspaxDQJIhyPHYeP93j87DV3rq/xOw8/4v7NOdauwZpvsHX9U1Z/Nc/eySkra8t86+ENbqxwDq5en+t4HBiVHm8hVaBtnUEHaoTo1ZlshQ6U2X5UzLSckkrKI9SYqhjuVNpJqTWMEJR3Fc+lrZCD0YZjOOuPKNFk822USfEq0B3kjEYFvbzk4C+/4PmzEz5+eJ/r19q05+CTu6s8vLPKLz47YPfgjL2dHTrdHoPBDs1ej9Zyk6zdQlRCkYeKTuq/LRigyLFM5evff/u60f5UnZavZX1lg8wmPN21vD4uyIcjdLNmOYnqBPF71EwkGxnCRUWIukh9/4PgY08aQ7PRxqgPh64758jz/J0Vl7fZOUeloFYQr1lOJAg4TTNd5NrqXeYbGyR6/dwXHZwKXzzbZ+xbSFLNR5UCXtCJib1SSlAqgtdERSyBVJmVEtxohJQFWglGYtsgLpIB5VE6/huCYK1mcWme+fm/oTLg/Dysrq7GzdbXi1GBB6JG7KQkCBHyHJEi00WtobbAxHGdH3IFpS1o8GVOo8qsjDHU1NJRwNASfKAsoNcdMb8ctZRiWcTN9KzqzXw6k4JMqVEuzzF4RuMzzvr75OEyyELcsaiZ9Pnj63Hj/+JA5MtH2/zZj79k59hzdJYzGAwIIZAkSSwDVojDwl8tI6CrB0TUZWder8/bmrDnAAQmopUkaESDxTDfanP75jW+++3759734nggf/xXLyKnXtYkMQ2s99i6tCTVMKH2KEIEHmgbr71KUGi8gnrT1KLBC6kSjDWUkuPKEUFp0qRB2mwwHgwxdpFSB17uFRydfMlnT+f55MEtHtxss5jBDz++AekN0iY0E7hK/iJLIcnaaJNRKkvp3PQaRwET6hGI9zVR4FRAqTL2+6hmBHWss0eSZiAotCQgnkS1mN2inAs46ZPOW9rLFrEJTglD24TQYNgfk6llDk8yOj96zcpCwscf3+D+vQaNOfjetzfYurbBzuoKO7tHHBwVDMYl+UlBmhcEEsbDnIR0Mtfj//P78r/RJnIs+BPK4gVKAjabA+ZR6uZ7X93l5Jbqy64opVhd32T+1Rqvj76iUxwRdIlXJcH76v6u+soz4wGomGmL6HM9QmMMaE2r2ST5sC0ViPtkUXy4NBFckWXJtAQuIWZ+VickNmV5YZOPbn2LRF3mAny9d8TpwOPMHD4UE8nCOPeo8BLwEtA2mc6xVr8PKuagLh8jZXmpp375hAONLGN1dZnFxfdn/Pigld2YV+r//D//iaAKIgKsZvSNU+Kq2tiAiBB0AeUDBI/SVHXO2ZJFnNGPA6xVhKuiBIJSQjCCGItpJZjEokqFDYEgHu8jU0WRC8NuSSgVwSeIuAkS7FyJjxm0TcU5N+lThRqeEEtIo6LPMO9SXuFUlF1VZX4kSbZ27iFZW4R//A9ucPf2DfZOHF88fs2jx0857XTJC88oLyiLGImho4RGfU21xGxFBw9aVZPhF763ZjBWaqacVYMIZJpNoKIAYlAVCapglWcuM1xbbfOt6+eJuLYPztg+7DAuI39jZFaImYVSvlpLNf3fBJ8Sb9BQlQKDxGxOSQxbfOnicGCiSRODqhCdRV7QaM3jioKiLCiCMMzHdMfHnI3GvHyzwO9/8hENK6wtK9bs213NZqbUv/zJgTRTg3OCKzyuFBI7zfwiyrO6GSYglXivRcTXpEhB3ZOrcvFIaSQBr4haUpQoEfIiwpWdTkirwelk5knqjcb08xEkTWwGSSvBNFJUGp15Rw8oho6i0HjvebPXoTvosnewwPL6It/57ho3NuD6xhqdszWevRzx9MVLDjoHFJ0BPljCCLJsgVRJNTv3tlX67TeR58LoSzrHX9Pp7pCmlsWVazSX7yPySGAFpdbey2nNqWtqLMeyuXmbpeUt7GfzPHr9U1yxh7aBoEIs7dV6V6qi56o0s6bNycgiopXCqAStE9KkjeH9y1q1laGg9DmIQ0t4Fx5oZl2ucAoqskrG29qjUSQ6IbNzrLVvcGPjAetzd859w1enXv6XP39MvzQMfUBSHYd/lRDi9h419CRgrY3UX9pURNQBi47yK97jfYiisKgJi71M6M3isxVCIEstiwtzXP8AhesPDgM2N1u0mtAfjmhkGwRJol8qx7RbGu9LCJpG1mJUlIy7faQo0FmG2ATvhKCiYJeZoLBUPfOLJhCKEp0Z8sThk5Rkvo1pWOh7LIFSg04TxoMAqsHZ8ZBELVKWIfa50qo8OaHZOT9EK1AVXadNq0kZLXhMCqf9M/Iyvq9fHMlcOn0YLjoqgI0sLvrxuJDfvZ2qN2cizz5p8/zNAV883eXpy32GPsNrQxCDF0UxLmikCYnRhLIgMZq8COhGM6JsQs2ibjCq5gWC4KrSazXwF4JUwoyAspRFQZI2Y//KjbFZyWK7zfcebl66ni8PB7zY7yJ2hUQ0uBxRPt5oUqMQ6yHKWK/WM7gENekP6Unz1KFQpqISckSnUIFYEm0IrkBrMFlCCIbgDCMpeHOUs3Owy/b+gN///h1aq+8uEXzv4ToHh11++WQHZ5scHXRYbKe0minNdgOjDa5mL0BHlOkEUlshpgIo7TEKFAEbKsYIJfjKwaVA4nOUFoJuMg6esTWILknmAjfnpw/dUScHuxS/UVm0CGGcM2cNWhmStTnKsWc4LBj1C4pcyMuS7vYx6cEpO/sjbl5b4+7dJteX4cZyk2/d/5THz5q8ernL6WnOqPCoccHmtU1ura+xmf3t6VqJHAmMgT5wAqO/gLNH6NPPSXs75MWAXncD0/8O6doPoPUdRI5FvSfNUaN63f74tSz+8CY3l+/zq+d/ym7vCc4OosyNKrDGozV4UYg3+KCJGnGOtKlJjGPUHdGw/z/q/utJ1iRN88N+7v6JEKnzZB6tRanunpbTuwtwAewCRhrNANJ4x7+EF7zgFWHGvSBIMxhgJAiQhFgCxHJndzCz07ujumdad3WXrlN1tEytQ33C3V9euH8Rkefkqa6q7lFuFifFiYwvwt0/f9XzPs8s3qXMtlZRX8JYHVX79Ks90CXG2FDqaMi3PgtYpSeljTGYYjpzhYBz6FroqC5fu/odZjl17CV2ROQndw75k59+iFt4HSVJYKW0DqtcJJ93KK1IxCAuoAGtAGIDn2ftyLRhe+8Qn7RJqgStgl6hw46b2JWkiAvlkSzJWJ7//ClA+BLGqt3VZHnwOgI6Lw9hsAhQ4r3FqBzQKFtjqzqALNJsDL/FhyhLCyiJfIHeB9w+oHzQHKrx1ErwqSZJ86Ac7GxA+kmIHOoK+kfg6w7OH6F0ikg1FTlNxiQn3KT9mr09/TxPLQXD8ohhGZtn9KuROk/XBpIkHZIMVhaUWo5ChRcWwo7Z6Iu8ceMKH99f48GzPR492+b5xi6YFOMVOKF0IW9tOl3ydotBZREdtqtWGiHoHeljAIEGpBFqgfggixDshcLbcPi22ym5qrh+aZWrq8mxm/n2Vin/4vvvUPogMqesJ2tF2C4THbLmmiE4OQ75b4aKiqkhVk0iWeikFtmgRYEgLqgmrZaiDUgrRGdGsXFk+ej+Jktzv579/tq8Uv/q7Wfy6Z0R/V6Nzrv0+xZrPbUV2p2MVitDp0GuICi56vH1lVHo6CVKhDCnscfGEuDNPq6BGQevCi+GSiQA+l9I2xaFp6oNSRr2uorSJEoCgrLdSsnThKyV0eqkjEY5w+GAYVUxKCqKwVN2tzfZWJ/jyuXTXLo4z6lZmPvKZW5duszD+88Z9kraec61C+f42uUTmJD/jg3xuwJ9sLvAHSh38f1N6v4z/OAJUj7FlOvM+H3m2zDsb7HTX6dzuMnCmSHMO8TviNKfL8ICON26GIyWfSBnz17gVx//a24/eYfaKbJuC20KKtvDe8GkXVKVh3X3FqGmis6Likq/M+0FNF+sZtWXbfl086eMqqOAMvWBVuzXRVcn9Wk2Dy9ClidUo5J20qatO5yZvcCllRucmbly7JV3+jUf3lun1jMQWVKUaMRbvJ6cA0hQukACVlKURPokIRFBKhucQtGIxDlQVXB8lYqIYR1lVYR2nnHmBZmfXze+sLGan51jYX6e9Y3dcEjiYl2gmYMA0/YSwr1qVFCXFVm3O4a7izTIMj3+edzXEA82b0OqLiC/c1qdWco0w9vAIi5WYVRGXWn2ti11meO8kOSTSOnlfG4EVUzRqrw4lI7w9eEe/eE6fdkQ/Rk75533PmJjvSLrdPn+Lx7K629e5kx3cnhM8159+tTLBx/f5fa9Z2zs9Hi8uRdYLlpzFK7FAMOoN2J+roOKvQhCifMRKSRhfo1ugSQoksCFF4XVtET4Ng4vFVop8jxhoZ3z+rXLL733R2vbrG3uo01rLKOhxvwixz/zdM+JbqqQJzDuE9/1S/N6DAQyAYo0gJNpR2I4cjx8vMPVlZyNUuTMr4karlxY4trlOdRmn74rOBxpCgy1gBWPtRV5lpCa0KeXJEnYYwCigkMQBS0bobtQRI89ajqI6wl5SGO4FLEpYgVDTktPmAC2a5F/8ZfrWO9IVBqZV0JKJZALhxvemIROktJuteh22gxaOYNBj6pQuLJgb1gwei4c9YSNzZpzq8usnlYsLsBbXz1PXUM3hUutv/sRldRPhOoBbnCf0eAR2u6AO8AOj5DiAKoDlDtA+wMMJQmKxFqsLRltOfxwxPzyc8zy64h/R1CX+LxRFsDp5JoayJac6s5yaeUy7z/9lGf7jxgOn9GencO0hH45oqgPSFtddJRIcpUn0RniNO12l+WFxS/Bue7oD3sUdVTFNhpxERrxwvk0rllPqhbHa9VKIcrgfOjDc75GdAtFh4tnbnH61MWXrn7//ibvvHsPYxawysTU9ySnPAbR8YIME9MnhKcoR4gNMHfVPEer2GYh4+c1o9XOOHfuzBeaqS9srBYW5jh1ahlzfw/nHc4HSnjB4XTQoMIx/sBVVWHLihYqysUEQb0Xox6YsLcp0nF/kneKTGe0OzNUJg3IMgzea4w2eJdwsGcoRm0kBa198J4/wyCd1LM0ZphQHpMoRnaPw+FzPD1StfjK+TAm4Z3336Ww8NG9Lp/cf8IP3n0uVy6c5fKp4x7vaxfDz083vNy+/5Qf//I2j7f77A4GVBU400aUYtgfYJQPXHHKI8ahlGCScLDXtmRMwuoBCQzdPjKIKG1wrkCJxfiMGxfPcf7s8fTE856XP/zRh5ROkWThuokRvK0j/PtlpOHLc/by/MHJxuqkMY2ZmPAcGtJWwmhQsrY9YnPj1/efvHmmoz7aLmXl4Rr3n++z1bMc9gtG/R5S5fh2G5smtFoJrXYWjWNIm4r4sBWdiuzvBsEjenJrhR4RQo0WjbMKZxXKakyakKcTWe6ygFEZ6qNNX10wyEGcTggoPic1OhrqPE9Jklk6nYzazrC/v4erLGWheb4zYmtrnWdPe1y6tMqFC12uXIKlnC/ow//tHOI3hOIOR5u/4Gj/Y5RbJynXaKky8EJ4h/Y1SkZoKpAaV5S0TUortxT1NqPtIfsHzznVewint2D57yP1pqj09Oc2WF21qrxsyGL3NPPLN/nFxz/i/tMKVQ8waUkiIXJQ2KAKEPWYUm2QUtPpzjI/u8Tc56ydTc0A/cEhZTmRJWqc95PGNMPNi79vhjYJ1gamHLGKzMxx+ewbtNK5l/7uF7/8hAePdli6cZFaKYzRx5jAJ+jtIKMUlN+bapTCaIW2MBqO8Da0dzRo7mY0CPHwSg6joZ2lLC7Mf4F5+jLGam6OhbmZ8QcwSgISqTnctBlHAYkxOFth6xqDonZNY2nkmhj3v0xfIfQ8hP4jjXMCJiHrzEKSBeE6laHFkCQakZxiMMPRXsbcmQyicudkPSezNj501clGrKkDGeOp7YCj4RNGsk1bvTpcvXb9Jln3NkcHJY/W+jzbvs2TtSNuXb/ATz7YlesXl1hdOO79XjwTEYQPBvLJ0x3e+fQpH99fp18VWJ1ATTg4JY1NHqEh1TuP801+ukZhY01L4yQJTBLogGZynhTLTJbxtVtXOf8Cs/H9Zzus7fQhbeMweGvJjcHaGkxzDDbIzldAauXkCOtVDsKLxmn6++ZvPKCyBFXlbG73+fTu2ivnfnqcWsj47jev8NZbV7j/cIMHD5+ztlZiPSiXUFpNWSsK78mlxCSWLNUBzONBe4P2SWCpMFWML5t+kVDz8qKwAtY6fO0Qb8m0YiafGKtiBGVZhYbSJA2erkTJ0NgsmSRJaFh3FSKB/DQ1QmpSHAlpO2HQrxge1lRDoRoKW/sFo/I5G1vCUf8UVy/OcGYxY09GsqTafyejK6mfC/UDfP/nlL2fI9VDOvqQmeSAxFV4p6ChaBRQ2mN0ingLzoIdkrkS7QtkOKB4vgO7a7RuCMweIPaJqOTS554bHXuy1qsH0u0ss7qwxKcPfsre/nOyTJHkQuVG1KpEGyHREg5n65lpzZPrL1aDAbAU7O9vU1QDvBbq2iIR4vPK8YpP1CAW0ySnKIbM5B3SssXy3CWunP8Kcy8Qc3+yIfK/+4//S5yfwaTdIE2jVawvRzCVChdUMdiIRWwgcFc27C9Fv4d3gSzgpDcYyBxCRi3LUubmZ2m3vxjbxxc2Vp1Oxvz8bFA5FcKHi7Q0029S6VBML2uLHZUwBXTQRjhxxiPKQhOa7FSi8d4h2pC226gkxavQOT5ms3ApZTHH9paweK4VUSuhGvKqnoXP6mfQWqG0BVVy1F/jqL/GwuytV87H0tIMC0vzbBxsQTJLDTzbGrK1+zHvf3SPr71+hXdu78ils8ssv2C03rzWVQAfrYl8dG+de4/Xefhkk42NI5wkiEsQ39AeJVjlcGLRxsU5jDW+Bp4dzlXEVWgcsxlcOj3PlQvHoaq7lci/+LMP2TooqGhR1C54PylRRC3qQDVrqU6es+nfvfj9rxsnPV9EQHusLxDlOOoXbGzus3kocnr+1emuO2t9uX9vg4UzZ1hZgNW3znDrzDLrW32ebxc8XT/k2c4ho6FQ2IyWTUhzTStPyNOMVGsSVNg7Cry2gUmFUK9CBWNlVTicKutxvkL5mjxJ6XYmN92o9BRlGXksmxqdHztI3gteNXUzIKZ7Q8Ex9HN1ZmdodRTzc4rhYcXRbp/ewSE7h0fs94Yc9dbY31nma29e5NtnX90Q+7d+yCbl9k/p7f8lqn7AbNYnqw/JZAjiAqNN0FQOauEiIbpRCnFB1cHgyQyhZaUc4cqa4tPvkZ9aQ53vIfUnotLXv9Acnc2uqYFsyJmlJVYXT/PBnZ/xdPs+R9U+ta5QqcZTkCB460hEszB76kshAQs/4KC3h/M1Kgu9qSElPQGFvTRt8euJzDYq8BvWdajfdrIlrpx9g1OtC8de49H6SP7ilw94ut5j5tJV0Cl1XSDZtHzkJGuChCO+UR5SQGiUD+rdo/4AavciJSd6urAgHrzQ6SScP7dKbPP83OMLG6szHaX+0//2T6XdyRj0g1aM1sGbt7XgnRp3TiulqMuCshgG6nhlMCal6bcSXGQ+mkLloce9MprApefR6DxFsgRlUhCFcgLe46zGVvNsb1re0G2sb/psGu9g+kCUcS51ekz3efkIA9dG6A/XOepv4mZP7osCOL2o1H/3h7flwwfrOJ+CSXEmo6BmsN/n6L2HfPzwGefPLPLn7z6TS+dWub6aHXsDb50Lb+DB80LuPlzmT374LkdD2D9y9IeClQQxLUxiMNph3QhPhTZNcyTjr0oLWEsr9awstPid16+MwR7NeLRe8XjjiKPCY02gkkkSQ12OSFIdD1c9NTcn16+a78c3VMPH94qo9VjOe2rOjzc7O5QZUcohxoT+NHcCLPvOlsizJ1scHvT4oz/+CaWFN7/RIb81x4KC106FOX54IHJn2bC0AduHJb3CUzlFOTBUQ02SQLsltDKP0RZRLtazQs0UpcaExLWEnsHS11gp0LomyxTdKV9gWA8pXYzMlIp8gkFZKNwTHnE1Spkgf6MUsR01HAhGMRwOyfOcVieNfW2KrJ1TjQRXGbb3d3F2j4QOH65Z+cq55O+cwRL7VOh9n/7ez6j6v2ImPaRFiq9KahcUpFRElZoksOXXdYnzsW9TGxIVlXBdcAK0SmjpmqOdd6iHWyTDDbLBc3z/L8V3r5Go818gLXhGlbIjc2+e4tTCVd779OfcW/uIg/opA1nD1WXQeqsdedrhzPJ5TqmzX2gdStmR9fIe+71tnNSYNKGU4BBN6vlTdanm1SOIqnm4Y0hAsLbEGIMtFPNLp7l+6SvMvPDe3vv4Hv/6Tz+gsDmn5haoAy6WaS7kkI6MF5QGBxDelBAUqhunoRgNEFejfSBj4BjxwVQlT3nSNOHKlUucX/5i9dYv3sEGnDu/ytxMi2HfBukJownuTcMWEYXt8HhrcWUVrG6i0aZhjpgcbKEgF0JLJUHmDNdg8kNBUacJkqb4RKNsSKkENWKwdZuDgx6aGcQHqRClP1/jyfEG5ZCetKIwRlHaHsNqj5Pqa9Pjxs2LdDoZBTlO2hz0BszMtlFpRq8u2dsc8mSvz/OjipWlx/zxh1ty49IKV+eOL9a188HVuPO8lEdrB3z8yXPu3t9mc6dmUA1xVYrTHp0EPS/VRI/KoKJaqQGMUcy2ElYXu7xxbfWl9/t0Y5/9fkXtUxyaVisnSzWDwT4maU9Sui+l7U6uYTWjYduf/lAnsW80TPQnFZDRFmM8zvZpd1fodFrHGjDXayt37h3wFz/7mN3tPnmeM7Atysry8d1nfHrX8ruvXebptsjFFaUaUcQNEXn4fMRHd56ysVlwMCgZDj2F1tjZHD8b1YeVjFkKplfHqwjJF0ctTY9NjdEZaT55g6WzOB98yYapZAwkiQ6AwUQm/qir5SK/nxZwinaS452lrEagHYvLKYtLLY4ORhzsHNK2ywxGFfcfHNBJ93m8K3L5C974f+Oj/4Ty4COUf0gn3aKtS9J6HnQGSSTBdoI4O+mFi4Sp2ii8DarSSnRAySqF8xZxfbodzbB8SP/5IUmxy6z0SC6MEHkkSl353POUT9WfHlUfycq9n/LRgx/zYGNE6WvSBLyFTmuOpZmX77NfN2oKBsUhvcEhlS/IVCgX6XGd6IXo6YTMxvT34+cqRztv4QcJ8+0znD917aVrf/TpM378y9tkq9cxrYSKGlHNfWnHIIpx7TqigDWhzqsklHSUs+AcrqjARQqzBrw0+Rhj2iUtHqMVp1e/GBIQvqSxunThPFliqOoReXse0BTDkixPER/gxgaFr23A29cV1WhEvtihjCjBEEGN7XachBD9OG9JEh20UxKFtRbRnsXTKwy2N/C1JTUSudE8SbrI7s4+h4eKbKZNUGUJ0VW4xIROR+tJsxocFzIc19PS0A9Wuz7b+88YXTz6zPlYOd3l4rVVPr7XB90mzbuUFaAVolr4JKXC8vHTQ8zTLe482eL86Xl+76cP5Ks3LnHj1HHP+Nb5XAHc36rl07vrfHD7GZ/c22BYWyqnqL2mqBxJlo03qTGGurAoI7TaDuohb1x7nYsvHGKfbjj5ve+/h9OtkFLRoSO9X/ZJk2RsTASDUv6YMX+RceQl4xWBCOYzIFEiEiNxPZ7/5ucGWt4fHjA708LVBRfOn6U9KQnx+Nkmf/HzT6jcDOIz+qXBpLOQwd7II1b4wQeP+fhpzh+9sylXLp7i9LIeM2BsjkTW10s+vb/JRw/W6ZUOajg4KHAJtGfaJAhzc3O4CmpXk3baaBPQkugEJzWVDT0meUvR7U7SgL2yjJ6uGSNSlQ4ZAuttKHoTJCHGkX6T2moyDLVF4UmNgLI4KUEMnZkW7c4F9rdL9jf2GFXCo6cHnDv9xQrVf9ND3DMpn/0bBocfk8o6qS5Dd0itQDIqCqwO9Q0Rj/GBSFnwJNqBDW0EkY86IOe0RpQdo5C1UcypbVyvoPfxBvL8I+au/CPEfSTKvPWFDfuV7C31oLwjK6dOM/NhxsPn79E72iC1CfOt05xZOveFXq+UPSnYY2d3nV5/F2WgrOvQlQ8Q4+3pyErJlGMtHFMWn2RABG8LTNZBM8eV828y3zpuSN9/0Jf//X/8f2dgNaurp/GpQFKTqmxMODCBwhOPz4acVgdZFR1KNonSlMMRo94RGZCg0GmCFUddO7IsQekEW5ehxqWE2W7OwtzLLBq/bnwpY5UlmsX5GbJ0gLgKiZ6iMUlgppaAENQqCsiVFXVRkrtAr+im0nDNQefim5HIx9YILQbafIVJDCpNIEkRNQx8V8phdEpdK+o6Z3+n4tzMIl5KgsH69ePlwxiUCmAFpxyD8oCD/vpnvkanDWdOz3P/cdAmMjon+CWBudlKw08eenc2Dks2dh7y8MFTbl85xx/+6IHcuHCG1y53jt1E11dTtVuJfP2bF7lzf49fvPMJb79zB3EZqTfkyoCJXmgxQlxNPtdiqZtyenGZ1aXjjMY7fZGfffSU7b0jesME7w0ZBqM1aIM4TVXXY2tzPD336+tWL65p87cv/vyZ6+GFXKfkGlaXFji9PMtyN/zRthX5yft3qVWOTXLQ3XDTGBcYkCQY2s3RgIOdI9Z7Rzx8vs6FlS4fPD2Qr15cUKdjx/z6kciVy6e5v7bN870em70Be72S4WGfubk5UinJ85zEZPgKCqnRNhiYUeHR2pAnOXmajiPJLRH5/q+ehRKzTN/w8SD5tZ4xAdnpA62PUhZM+FtRCjEBjZhmLcgyfFVTilC6vzv6IOK2hfohrn4C9RpKHWF8ZLNyAbYtOtRePIKRcBcpJxgPymuUm9RUrY9AGBVPDgVCghILMiCphsioR10MKK3GHw2R4YeiOl/5wgbrWn5Lrckjmft7Le48vM6HH/yMx/eeoOZmmO0ufqHXslJj1Yjdg01KN8SrkCmSuFdO6px7CZV70guLkCUp9cjxxoU3uLj6Gs4d54/80c/f59H6IZVKkDzBqpLK1lQ29AFmY4hHgzNwNC1FIg6jTOACldDqMhr0QML6mKhO0DjQx9638iSJZmlpgeWlL+5gfSljNdPtcO78GT69v8dgWKN0jtYTd1qpIOugTEKqDPWwoBwMmbU+YihCbcgxId5vPlTwJjxameA1RcqEJE3QrTZJ3kJ6RyA1GkOSJFTOU5SGtScVly6tYjkAKRCayGBKS0WERr2qaeZsAC7hYAkwcBcL6/3RLhu79xnIc+m+Iud9JlPq99++K+9+sM6oqtCkgbQnoiKNBi/h8wqGyjpSPcNRJfzq0y0+vrfF6eVF/qvv3ZfXr1/k3ELKlZVwsi1n4eueWDlz4av87neu8u77T3n4YJvNrT7DYUWSarodQ5rB8pLhG2/c4uLqHNcuHu9W3zwccPvBU3YPRpS+jVZZULxWgdDVoWNTN4hqGo7hxJTE1FqfZNROGs1zX4UKDCNB2wwjntWlZZaXJv/jBQ77jooEn2SoJIHExNpQYNfXGJLWDLWt2B3W7D8vWVsvefKk5A9++FxOL7f4zhvL6mxMwW6KyJM1xy/euYMcjbAqZ3RQsLU/ot1uMzM3j2qFfaZoYZ2jKvton2HEkZGPm7VroKgC279WHqMDmaeKhspHw+Xi/OiYWhk3YDf1Cq9jijcFDCSBtFWRB7BNViOJYG1BKVC6IdsisvLrPIG/DUOOYHSfunyE1PtoXY2bRfENCjjwexuv0F4wLgm6UZawCVwa6zpCEpGaAUPngnyQpKCSWORxYHvo4XNkpKj3+2RHI+TRnwjn3kRl577QnJ1TV9Sh7Mjqm1c4032N290PWewu08m/mLFSyuOkYnPrKdZX6ERRScgy4In0ZSffM41A5InWygUiAV8Jp2YvcGb5CotT0vV/8tOP5b/4pz9gY29IunCRpNvCacFRoyQjCNBKJKaWoAYRa1ZNv2lDzC0+SFcMDo5QzmIkpAG9eEyaonSC9yGNGzK4QpanXDh/hvMXvth8wZc0VvPzKRfOnyZLPubIl2TJDM57nIWGd805hzYpidKMypKiP8RZi86ygH+aQq5ER2q8KN6H0B8XDnhvHGliMHmHtNWmIpDVKhUOkbL2VJVm45nDV6dR2ZPxOp4YHYzdlpdXO9QQgvEyRijKA7YO7+M4oJRtydXKiZv76vkVlhe6HB71cb7CN1OrFcoH1BKxaJ9ms3hvKZ3D24rD2rI7PGJjcJ8P727y2tkFfvLRkVy5PEvWBUWFUPL6wtz42j94f09+9c6nPHu+Tt7JuXjpLGfPLXH29ClWF7rMd2DphWbarf0eG3s9KqfBZBhR+LqilvBZ0QZ8RO8cMzi/Dt332bWsZv5f7Mk6MSLzgpJAUbQ0P8uFKRSgq6EowErgojRB7zGQ9uJAmdisp9GmjVEzeFPRH1U82inZ2n9GOy34H/78Q7lx7QxnziyjgavnDCsLb/Dwcsm9R5vsDh1P1tYY7G7hi4KkW5J1uuRGMawqcp1RWotyAQ2YxaUuKxgWPoo3TkdVxyN3IJKMNvOlowfbNFGCeBPTLxqxYW0a1kLraxwFjgLrPLWUv2Z9/hYN26PoPcGWG2gpSI3B+JgSMrHgIYG1WznQYtBeg4vk2U5FFz/kp0LzfJBVb4AA2EDi7CMzSao9RteYcgdVG3Z2DmjvrNOtdpHqUyGdpyIjV58PWTk/VctaHz4V7WFeX1DDals62cnnw4tDEAZFj43tNayUmAScDQAHF2HhcHLN98TXG997CrEw3znFYvc0HbMwfs6j9UP5P/6f/0vuPDykVBlLywvoTk4tgRUoUZpEJ/i6gqhB+OIYn5zi0CrIBQ36R+NalYrSO6hGqmlq7ztPZgyrK8tcWPzijtWXMlbLuVL/5f/vx6IN4F2oK5UhD5+Y2FzrfQjfteDrinI0oC4LkjwP3qQKelhjhAmTCfd+6kEgFHWiUEmbrD2DSxTahn4qZQxSe6w3HO62GB7Nki23QoQWk7pKNyi0SV53eoxrC00IjkXpJLCG130Oh4854jmLLLxyTlaW5jmzPMfTJwfUzoxXVWiUNGOaUymkFGrrqT2YpIPpZHgRnu9WPFtf4/mjHR4/3ePmrTNcubLIlStLXO3m48Xdq0VsDa9f+3sMRgHGPjOTYOMmX8le3ggbvZH84N2nHAxKKt9GqYZEONQAUEFwzSsdQX3TcxRTUVO1lZf7pCZZrldFX5/l+DdrIBKIN+c6htXl43ntXg9GQxfejyagD5VDvATEnRKUNySSADqIXrZybGIo64RRXUAtHDwZ8Mnafc6tbPPV129x9bymm8Gb13J+561L/Oq2p517Np49pbBDRv0aV/WQViuknVSGqmuUr5lJU1aiUzDoQ+9oiHPBATNj09NAeKcQVahx9B3mKD5TQt8cMSUo3uMJ1GKBr9BRuQLva4QqSDR4z/FEz9/i4SpG/W1cfUSCDZyXovDegarAaFQTHbnA74kPUdd4iInbUwgQd4MoixaH8gpXWUQ01kQkmmqjDSS+xtgdZuoeo+cHuHqNueETuPRtsrkrX+rjnO1cHG9q/QVWwWPZ3dtib38D50oEh/Me6yTKKYXnTe4tNa5RqResyMQxJwJODEtLZ7h15Su0kknv1wfvP+H2pxts7Gl80iWd6+KM4KwK970XEDsFNp+8h/DisV1JXHAolMJWNXVZYQAlDj0tyxNfKdGBBcZT0Gq3WVh4uTn584wvZawATp9eodvuIHIQJyqmNnSK2BLd3KjhLqMqSsrRiGxuHsHhVWTqVuAk5Kab11ECOA/OoHSgpq+9kOucdneOKk3RVYm1KqoGg3MJo0GHnQ3h/HLr2Ht6CZ32ws8vRgZeQnFbjMfZIX27zsb+fWYXb7xyPs7kSv333/tU3tOPGVkX+kPURFzRx8MHoHKeJG2RZwk1nqqwQTZEGbK0y35R8N6DNR5ubrH6UZs3bp3nL28fyNlTc9xY0Wop/eJeSeEV/aLmoFdQuBSTVLR1glE68OJ5wdnQS2TUq1SSfn3k9CrDdCyq+AzDJRJ6V+ZmZlhePs7RcHQwoi5DndJrTcMIDxrtgzlQSshMgnch4rJaofMUnyR4Y3BVxvrRIYszbYZrI55v/IIrZxd57doFLp3tcForteFElhaus3F+hvXtXR5vHbJ7dMTw8BAxGTUJWarp5oaZzuQ9liOhKIpQe5Djn3fikKm4D473JTbfexVakINymMMhOB96b5ySSK8VhhYifPjXRb5/m4YJrBTOBRFPH1QPrNiARsOgfBLPxahhR2iCl7GOWvgbJTroKjHRbVMxQrCA9mEuIayBEwfekZkRSJ/B9h5bwzW6O2t0r/47SO+JqNnP30T84mhln5/iyUnN5uZzRlWBj/I7x2s8L0dWwslp92aIBP4+LR06yQKXT19jPkaL9+8eyn/yn/1Ttncr+mUbtdQh7baRROO9QUlgpxApUWi8FpQHr+P5+MJ1GkaLIINkMTErohVoo6i8I4kdW1olwcChWFqY58LFLwZGacaXNlaXLl9gdXWFp+t9nHPRM2wiJcGYQKjonENjqMuSYX9A55SLhOeTG3gSWjYGrxE4UxidYylwFkRntDuzDNMUZQx1ybgg6y2InWXjecGFtzKmF1u8DoCNKBMy7Zm8CF1XSkVKEUGUw1FQ2B3Wtu5xceEffuacXLt8idWVJxytHQQVEkXIpEsUQmxyvirFVpbKF4AnSw2dVo5SgdevzjSV1/QlpfdsyNbGI+7dPuDa+SV++PahXD0/y/mzX4y8tNXN6c4vYrIcGSq8tVgCJRBaEAt1ooIchlbIFI/XZK4aj2+CoHwZTDFZy5MM0q+PrhxaOxYXc17UZTvc20VqITGB9y80GSqMN2NjBUJdDEKJWCtMkob+NGMwJsGmllany6jfpzfq00oUo6d7PNrc58K5JX78pBAPXD4H506dZv9wkTPrB9x5uMb61jaFLVheOsOZ06dY6SRcWJ14iUbFdgtbxyI/4AVPI1CqArzfBMFKH06f8NnVZL68E7yqQTm8sng8oUae0ZAsKaXxPsHXHl8nqC+miv7XNmrZlnQ6da46zLQXGQxzxDmsK1Feh89pLM5rMpJ4vziccsHqGB8Uar0CQrpaW4NShIjAh1q08gp0EiQuZAi+Dn+nNNak1HiUtZhU03ZH9A/2Oer1YH9I96pD1u8KpxZQ6edL533pebGWze0NlAoHvNdCYpJQj3LHyxduCoF7Uqp9uuThvSJLZrhy8fVjpLq/+OUH/OLtO/R7Gtot0m6XtJOFHkKbYlSKkgoVJUokZlTHwJ9XjP7hUahxuaBTo00WokAX9A0h4A4aXb8zZ85w89rLUPrPM760sTp/usXplUWy5BnOhx6fkK6zYQNpHaIqLEYHCQxbDMGWmCTHqePcayGk10EiJOIltYDohvcuyFCYvIVkHVxaRE+zJtFQORDXYW93H9wc6G6A0asKVM24aQDGEU6joaV0FfOqUW2YuGBROtz6I/YOH2F97zPn5OqlFpfPrfBwbT+mbvQY1eRjigtAKx2MBAR2Y+eoXYHGUyuHyzW1F7IkQ3RCbwQPHh+xsXbIzvYhly62+f5P78pXv3KZ5Znsc91UZxKl/uJJKaeXZrB1ibce8eC9Bhsz/gImS1DeRmSaRPoVON57FWosY8QbjB+o416fkikdrOilAXg1IT+ecId5DBWLbcPKYofTL2hZbR8e0qsLXKsbYMsuRFLapRFyG9Yzy5KQUhGPc3WoB2mFSOTpU4ruzCx1loEb0a9LDo4GHJZbbB/0ePS4xdVzK1w4s8Ibq7naFZGL51e5/+QZg2HB3NIK16/Os5DA+akoVyuHoSHzVCgJjZMQi7LxUNVmQuQ0PmgUNLRVId0jKKkRFUQkDZqGrCwoQBu8C/InQQDv8+yCv/7xYsqKdB4zcwbdW6IqU2ovJIqQsm2OAXFoSaYbTPDEon/jTBLOGyWTaCTeXVgbeRclyr9Ep0FE8AJpZvB1Rag1jRgVa/Qe/hh/WNHafUL6tW8j1X0hXeCLEOJ+kTG0Q7YPN7G6wLlwBuhU4WxYb69k3GPf3DZNc61rUnLIVKNw2N+4lJl0ge+8+Q8YjTw7xVB210v+L//Jf8dB35Pki6RZhyzNUTqh8kLpLCmQeU+ip2Trp/DxQhD41BIAqiGqd4z6PbSLzcHSqKCH7JjGBIdSHN6VJC1heanD2S/GXzseX9pY+ariyrlTtLXmsBDSdpuKIaUt6CQp5WiEThJSYwCLLYcMDrZxo7Mk8xnDqsTrnCRLcdZRWxeaixVoqREXCBmd8yQ6JZKIkM90SBdX2Ov10JlD6hFGNLOmzWho2dwuGfa7dJbPUpV7JPkQL32M8Qz7npnuPLYGpRIEjdIVTlUo5UDaIAqlNaUjNHwag6sOsfUW29t3KWVX8lds4JWuUn/0/XX54JMNtnuOYTEkbaWkrZxhXVLXNVnaQiQYiknwEoAXTpkAIfeQ6ARrLYlJSFrhMC4RPnzW4/b6GisPNEUn+0Jrdu1cxr/9rRv84leP+fTuFiqZQ9IuzmpMnqG9h8oGL1ZF2iqlUDooAosorLNkWbxu9L7QHpTCNGg3VYMYtE6bXR8/rEOZYKicdyQmQ6uE2lYkyqKwGCmYS1Ourywce+8PDyr53o8/YZgIJElgq8djRKFUHVsEcgLZbCQyjjBPFQEjRoUbTQmoRJEnCUIHV2dUVUZRFTzZGjCsPI/XH3H51JBfPRapSvjaKaX2RKTycMYoteucLJvjQparixlfuXmZ/aNnjOqE3kGPVm7ozmShLuEcqdbRJgmuMeiJoAw4sXjryUw7pPZU4MfUElj2LUEaR4vGWo+XAGevpKD8W2qskheIXVV6TsnR96QwK5SqA+oAqQPWMdM5zromIYohiHmKT9G+UWVQjK2YD5pvDRZAuRCNJWWthx8AAQAASURBVIRan0hIP4kjyHh4Yne3R0t4TWcViR8ywwZq/wf0eh+TH31C97V/ADe/zRfRyfoi49H6fR5t32XgDmjP5xyNjjBkZGk67sFT0SE0SqF8gkhohRFXkbaTSEl2yMLCEqOhRayiI7NcnX+NM60rkKxS2zb/t3/6e/zkg8eUqotXLWzlObd4Cq1TKutAg8OjTEpd1mCanr8Y+EfAUNPoK07oZhnlwQG6qhgeHrCgEmZmZqgGA7JWC28UYhWJyrC2IsuF1Aw5vZqzMvNZsdqrx5c2Viszufr//stfyanFBXqjOjTupp4kS8YFQQipGq0USI3UFa4s0HUdQT+Cd9MIsZh+GqtlxnST6AhytzgF6cw8krbx1SA0oVmCkSGhrlO2tzyX5pbQqgCKaO0Dxr+5FkBQFos7PxYPw+GrsE5QrnluRe9og+3d+1w8tfWZ83L5/ClmOy22Dg/DwaiEui4Bj0pUYHUnCLqZGO2Fzxo3Azr0kDGmTw11CxRaotS2OLYGA55uD1gTkXOfE7J8IVHqzm4taw/X2J0RRlUFbshoZPGjBJUltLpZ0NYyCmVCRFvXNcanZK2cdrtNXVbjHHqYx/CdUwrEj9MGyje8kT52sAeoa8PM7CNDqfKR7Z4aQ8VCK6PzAqX4zsGInf6AoXVkkXE+7JdQZG+Y0S0hmot32Th0USoqWcNY1BITPH+TJmRaoZMEcW3W949oKUU1OqAYKbbWu/zi7kCGI7jQiS0FLxgqgLNtpe4eiNx53OPR2gF1ZfEO6ioAWLIsjxF2SDOHnpTGK/WIr4MTk4TVJyKrtChEkhC1iZriX4vIQe0+t7rs34rRWqU7dxlXncYVh0BBgkXVHlU7tAlpUVxYSy1xi/mmHaS5f6P2mkzkhUJw5uJXjfg4fwSEoSCIi9GYFfAe4ypESow6At+jeljjq4oZV6Gufee3/vH35In86a9+j0oGSFIjKkEnKtTpdaz2RydLqYAuhQieQI0jrLIckWaGuq7xFlpJB99PuXz6Fp1kkaFv8/a793i6fsD2UUW/70jaLdqLC6RpGllUFKIiUYMIx6vVOty3zfmkCI3a3uFqoRyOsKOSxAHKYW1Q3/ZiieSaEJXHlVjm53MuXfzizBXN+NLGCuDq1assLs3x6Pkm3tV47RDlSZTBo0hUJErxguCpy4rBYMDs3EJIuXmHl9iJEusfPh4owQmKGxFhuk7SnZslzTPq4RCjU1REhGmlqEvN2tMh567MkaRriK7QKkd8QppGXaFmBVQT76bhRiCgyJxzoDReRmRJipaMYlBw0HtKUW9+5py8eTNV/9f/5iN5vLVP6gGtKWqLSjOIOeWmX6EBdzToMJqajwCxz8FjIc6REJBTic7oHe1x984jHlxd+UJrdms5Ve/e3RVVltx7ukvpIE0SKhSVq3C1pRZAEnJlSJIsINnEUgxHDNwR7XabIJEQUUqxm8hHT0w3hhiioQpRlRGHR9BRgFOJxygPRuFdkENJtGZxYZbZ7nEajL2DQ/r9Iaj2GF4fnep4MIW9I+o4TVIzTipKN2waDbR2XOBWgcyzPyr55NFTnjxxzM8YXnvzPJsicvoznIObC0r9+SORnv2Yza1d9g72SUcd8jynMxNAE8HOWcChm/SqVbGPygRGdhWctvDhQlaBxgZH428IKc1EgvL235mRdmgvXIXhNYaDLfDrJNqC8+HgQ0KfY/Q0xMf7wsdkc1NUiXnRxpg1NRaIpQXffC/HHtCg1ab+z4HF4inA7XD44G0O+7uc7u0ga38pzF9Hdb9YT9arxv5oi6dr9yhtgU4MjhpjhKq0mLQV928jyRGMLs35CKjE4MVjvQTnsfCINaRZi7n2IlcuvUFbnVHvPHgs/+x//Bfcv7+FTlI6sx0kyenOdclbKU6pmK4D8THNeqymP2H+gUCVpAhGyDnHqD+gGI3G95S1NvSU+gYRHiVUCHWr1dWz3LjxapDarxu/kbE6tbzA/HwXrYP2ksNTVRVZ1jpeEFQhXK+qikH/iFl/liRJw+1aW1IdaH7E23FtpNl4U+CnsffYac+QtzpY00Mpj4/MAok22Fqxs6GwxTydTk6FRZHhrCXJHCgXb3g1jgiUtAgR1iT/nRgQKRGEJMmwIvQG6+wcPuDIr8mcfvXGfeONy7zzyV1G+wVaEsRptElRkQMupNknImehZKcDr2F0SJr6T0AR2oit1CjAeaGuFWtrW9y985inR6VcnMs/94309ZvL6s6TgTzf7bO+fcTdp5s8Xdumb0tKm5Hni1iBuqxwdewX0uFgT7KcRiJe4jw2BqPJbisVWg5CmUrQXlAmNBtqH7r0tSL8HKMkX1tEatJMsbQww6nuxCDsVCJ//vO7VLVgWhnig1iiiMMSPDcnHqdCm7mMLf7JBsqMOfuOG7Em1aFaLVKd4JzGlRZbWQZ7fbK1A85c+PVIhluX4dnGHHtbz9ja6JO2F2nPLtC1QtY2tNqG0HzuSJUKitFeSHSCVikjV+NV8KpDtB+cp1AtbIx8ABQYH5CQDZr278Twbeheod15k4F6jsghSBWMkTETB1Umh2fzVUWrJMe+NoYo7kGvjv1ehcJxjMoCjVFTD0pUgleC1wEEoHxFWw2QqqS/dsjW8ICVwwOy1/8d5HBN1Hy473dFZPlLNmEf9DdY236Ik9AM7KjQmcKVwdFHxeyABEvivQLR+GZ/qpCNMcZgVCiVKEmhUNy69RUunL8JwP0HG/zi5++zd5ig9BI6MfTqEcuzHUyWRJKCEP5MgoJJ/S/6lPF3bpydSIyC0jEaDrFlRSdJ0N7jfY1JzUuwd+8diOXM6inOnf1izvX0+I2M1ewsnD+7Sp7fpa5KtCYYDO/HhmX64PBVRdEb4OsKk7VCOqy2iNKTDakVVppkaZw45YMn7wOMNUsMre4MI7OHd4HNXalwmHrXoncg9A+7zKzmeCdosuD1I0DNmFVRRfkBSUN0pQOLuVIq9I75irIq8cxhRbE/eMr9J29z6fTf/8x5uXG9y+lTXba3twkZ9E6gkvEpgotUUX5irNDhxmpAJlMpABEXDLZvCKmgKiypyRn2S54/26J3MPjCa3frUpAneTYQufRskUeP53i+ucPGzojnO4cI7XjIh1oJokKTd6tFXdcQzBUNma7Sk3UWr6KkQ2PCPI1omxIi+XEO3o3BF85WeCrSRLG4MHPsvY5KOOoV2FqQTKMistKj0CJYRbztAtpTmvXlOJS+OaCapvCmb6zR5An/ZwL+JmuRtDVGpyRiKQeH7BzWfPpoi3tDkRudVx9U55VS76z3pL+9wKePtiil4OjogINBwczSAh3fJkk8nSzFZAmpFrAVxtaIkZdR7fjJYaFUQB2q8DmN0hjM3yljpcxlJf6pMPMNks4GrrdNURe0XAVpBnVMD8skZFIwEfYTJsbLyyTl1KSmm+RJ02ztJ8aNBoU8/nniqGgMiMMNd5lJUjKV0t/usX10wOz+AXNfq5H+hqiZM+rLGqqB7MpffvrfczRcg8ShUrC+JjUZygSnVlzIqQRnKoiEOkIjvCiwhGxFlmV4K6SkIDmJy/nWW99Fq1kerB3K/+O/+T2qUqFVyqAMdWGd5mSdHDHgXI3Xhkb7Q0jG0Wa4o6LoaCO1GOctMVCVBdVwgHd1EKwXcN6TxpYdZUxgHRGPOEueK86dXaX9xSkBx+M3i6zmlPqv/j+/kixXFIdHqHaHNEtjpBMjJOdROihKinWUxZBqNKLdmSFRCZXIuON5ur+g+ftQbWrSZYGR3YmiOz9Pr9XGVhWZSUJDoFIolVMNU3Y3NaevzaBVDl7HFE8dUijjMMDGsCZpLhg2hmvUjy0usr8neYKXPlsHD+iN1ihkT1qv6HhfWICrV05x7+EjeqMROulga0FpE42yRTc3XvO5JYgihCqKArERzhw7RRoxGTF4EpTJqCrH9tY+u7v7n2u9nm+LlHXF3FLGqSiHfiFGMHsisrs14u7DLd69vcHGbsHu3gGFdSSmHch4S6GoK7K8hehIWkmAbCtp2KJVJBlQ49qRFjUGaBDlX4J3GKVglEJ5R5omzM+1WVk6jlk/6nv2jwZgQlQVao0qJoejB60CMso3HfRMIqcJxH46/TrZauPDSgddtiwx+Ab2rhOM90ht2ekNqD99ysJMl81K5PQJzdfN+MbZWfXRdimrq2s82RryeOuQnd4h/UPHYJiRpob5bgcz00WnGkMaDqEIovBixk2mTgINmKi4Q1RsNB8bL81y/uUOz7+pofRFJcVdaS09Y2TvMix3QQ5ojaHTk8jo5UgqgmT8JAPTPLSEmm9jj5SXmCoMKXR86B8SJygf1JvVFDmB8S4weLmanBqlLL2jR+zeLrGVY354iAyeiepe+FLzfWh3ebb9kMIfQeoC+a6qgYQkeRkw1UDXm00tClykNtJa4wpLShsjbc4sXuDa+TdJWORHP3ybP/43P2ZUQN6ZZVBbvFHMLM6StHPQito7cCpkPTyTmrKPUknELHQsS4TI1qM9lIMB9bAIfI0avA9crM6DmIj0bYyt1CwtzHPt6kVW2l9+n/5Gxgrgxo1LLC60eLaxhbIpJEk8lGScZx2rTIrDVzXDox7p7Bw602jxaBPC3lDki/Wr5gLKIwjax+ZhH9Ra5+aX2W2vU/YG6ARwEuCeZNSl8Px5ya1qAZUvgBmiTdPzBaIi0dh4NY43aYqElKVWEmTJvSacY57C7vBk/QNmrl185ZwsKaV+dGdfPr59n7sP9nHO45wnzdtBZA0XvP/QUBGMlBC/qvGhL1oijD6E6sFge1JjEK8wOqXb6gRl4M8YWz2RpxvwL//sQ7b3tvnmd77KR3siC7MT6PXSlKf4eEPk04dbfPjpfZ5s7nAwKhl6i9I5Ylo4F5JvXjW1KSFRCkVgjbZo0OO4KwgYomJlK2o4aYNzGi+By0wpRbvdZmVpibnZ4wqiu4c9DvpliMZ0EpqsG69ZJwRfM94YWo2ZS5rIagyomIr2j0VU01kA5YNaq1QkTpPrDG9STHuOwiv2e0d89OkTlrufLbS3V4sspUo9q0TObvY5u7HH5u6Q3aOC7f0BrkwYlA5VKYpWhtaeLDFkWuMIOk1epZF7OwnlK6URowLZpFZoHWDwfxcoAU8aqnVTSe8HMhpdZzR8glIDtCpQJGgxMfqZ1KbwjSMX1ypGVDoamoYRBwighKlywjgrPFWTCa8RrqFEjwE4aUtRDoXaQpo6ZtMKVaxR3v0B27vPOVMeIPd+KOrGv/2FJ/7h8095uvGAmhKVVjhdxl68cNY46wKoBECFuj3xHvNTyoZKK7wNPayJJLR0l6/d/AbtdJnenuHtX91lff2QWrVRmaLygvEOMk3SSvBG8M6PWynCFMX5JgIpJDiATWcR+NDI7YIysCsLUhUdAkCZwI0vTFKy4mqUeM6uLPHazS/XX9WM39hYnT29xNJih3auqVQjfaBpkNkiAe2ljcZI0D8ZDfvM1RadBm88KDOFNI57gTuhia5CGiRGVkC30yVptXFKI0YjiY8elaGsPPs7DjtaxiQrqOQ5SQKVFZoO+EDT40EyUI6xdRRNYjKcL1AmCXT3hQNb4jRU9pBHa+9z8ezXP3Neblxe4PzqAk8e71M4H/o6WjNYr0KQJC8326nYnxNWOqLkdLwRcYhYFAZX1xjtWFiY4+qVK5w/f/7E9/DJgz25fW+Lf/p77/Fs85AnGzt05jqs/9nbvLlxhWuXF7lzKHLrBRXey2fCz893RR48P+C9Tx/wyYNn7A+HKK0oXY1IEsAJJnK3aTCiAw5La1ykDQqgLhMchFh38SJYr6mdAwlGx3tPkhhmZjtj8l4IEd9fvL3JUb+EdhdFygSxpHDiUVpHB8RH8IoaP+fFaB1ePtwnhfcQvLbzNFKH6aBvVnu8MjgS+oOax8+2eXb2FHsjkaUXPMWNUmRn2/LuR5t8uGmlk8JrF2a4cn6G/hDuPdjm/duP6A0c/bKgOLCMsgydJmTtjLa06eQtjMS9GY4xQI/JesMBEo1vQLR85l78Wz1mzmLaV3HpHSz71FKR2hNqTlMjRFDx+6nfgYqEuFOHehPhjyMyjdEG8S5ibZu9Ev7GKyhqQSUBMu6dR/mSOeNx9QajzSGP/vUOZ7+5hdz/ibB6AzX7+RqI9+SZfO9n/z3bh5uIrkFXiLYxkgzRsnc1qU5hfII2vXcapYO6gNGQaI0blXTMLLpOyc0MNy5/FVem/OWP3uPD20+YnTvDoPLUNaANaafFzOI8PjWhTSgCoTUxUIi8jA1rZfNQjaEiwukd+KJCW4vWASgXSiche+LH9UOF+JpEeZYWZzh/bvGL7Y0Xxm9srG5e0uqf/Of/Wn7083fJ23OUVnBYVESWJEkCyuMlIL2K0YisH5SDxVnE1pDngIy1jZyLB/S49jC1pbRCnMaiWDi1wvDggLLXoxUhmAgRbp3y6L7j+lcvIMkmRd0nzbJgqFy0/0YQX0Wp5tDHAGGDGxLESxCAA5QJnhvKcTh4xsh9NirwdK7UP/uTj+T2pxts7ldkaYvRoE/ebuEaaLVEjaRjBWVPYjS1tSgcyqgo5udJNOBcaD6VmqW5WW5cu8yVUy8rxf7xz96X//qf/Ss29z2VWqCwOT5b5rDwbPUO2O3d5vanho/PL/K9Xz6Rt65f5OLC8YO3UfJ8uOXl5qVV7jxeY/tgyNZun1EVFHd10sZkHZQYvEogpquMMWhlwBIY+BEcBm0UJkkYjmqytAteKMshrTRlOOhx4dw3j32Ogz6sb+2jkjZ7h31Wzixho3Swaw5vJ4j24z2npOE9PDmian7/IrksxFSIDVxnJrZRGBMEIHXSIm/PYcyI+w8e852vHKeNeXAo8tMPnvPLD5/hSVh+uMXNK8u8dvUMtxYmUPdH206ebhzw0f11tnoV+1XBQa9CuxnMsGapa2ilmlYryPFolaGNwek6AnA0tbN08xyhoGkm/pscIjsCW4QbcBFlPi9ybo65hTepDx4x2n9MSh+ND8AciarVfirCImrlSXBOdRNxiQ7NrOID36APqXUvEaTifezLCtpiIV1IbNT2k9dXCVa5mA0IzpXBoX1F6ipSX8OwZP+Xf8x8Be3X/97nnqOCXZ5ufUK/PELnBqtD03di8sDQYy1NbyB4vHLjtVWR7Tt0h1isc6RJQj1ytE2bt259i1tXvkpxlPOHf/h9njzfC/2RWmEttDoz1AKtuTlEG0a1DRkZAVfVaJWEKD7abSXgXYXXiiQJgrYB3ZdQDfv09vfwVUkrSfG2DgwVWRLh68HZSFAMq4Lz5+c5u7rAxaXfLAXwGxsrgFMrsywudDnoFSgzE8I/NeGz0tE70sqToPFVSTkqaLW7gd3C1TTdz40YIgSH0asXSDpF41SQsyBrkeQt6v4ASx0TeY5Wp8XRwT5rT+Ctb1yF/D4V27g6oAYnx4YnNlPF1w40TSIxERtTESpiY8UblBb61TpPNz5g19+TZX3jlQvwra+/yb2Hexz88inlaEgrn6O2FUq7oNkzNsF6jPkg9jyM0WlecC6kDEU5tBM0Fd2O4vzZUyy/UN8BeD4S+cM/fZvtkWakcrxqY02C9QadJHRnTyFuyM7eEb2DZ2w82+fe3U3+7O19uXxugevnjm+qq6sBkbBxKLK50+cvf/xLNnZ77ByOqDy4Sih8gugWSTtHZR5bDalqjZYEoyHLEnSqUQqKsgrpQVFI7N4v3YiFU23y9Ph0Dirol44KjUlMVH1wY9SkxBSJgrFH3aRQjm2b6drVC+jAY6S8Asq7uDcaj7wGDDS6ZCrFZObYNX706TP58fufcvfZERsDj8fTK/v0hiO2Nrb50189kBsXz3J5pa2urIQdeH9X5MF6jw8fPseuD6jqPt5XHAxruq0WruupUkNiPFnexrQ1iUloerJLW5ObRvPqb26I2xHKe1Sj9ylGB+Scon7+P0qic0hSyDVkXUiWwHShIRpWChhBe4nlhYscjJYp9p7RVoaGGu2lazUAiVh78g3Cb+r3DVtFU7OS2AysIupSi45liUlkNrmAxqskIF6diukwG5wVB9qWrOQzbO4+ZeO9v0AfHnH009+Xub/3H33mIhzJlvz43u/xdPNTvKlw2iMqMo9IgvJmUpbAx/RfjKxUjH6afeotc7NzFIcFnXyGck9YWThPygL3nhywszOkqCPnpw50atoktGbnUHmLSgk+9pwR08tBod2GXi6lx2hDpRiff4hHbM2o38OWBb6uA47A1nhv0Y4AqZdQR3WuJk8VszNt3nj95m+ww8L4rRirWzcvcOP6BX76iyekZh6nBTXVAKoIMEgjoW5RFkOGR0dkMzMkrQ62tkEq5AVjBbGM3kRZEKy+DtxwSatFPrfA6OgA6xS5CYAO62ucg73tDF+dw6dz1CpFiSFJCY3IahJmi7JEbQmQSP4jGlFRDlJ5DCZ8CAXO9Xmy8SFXzjz6zHm5ekqp7/10U9557xFKHEp3qEtLmgZus0ZojViraoJv5z3KhLqMj6SoBo14ixJHQsnZU4u8dfMiZ1dfXsJH2/Dx0wE7RYbWHVABoWNtQW5yin6BUjaIRPqEp1sVm3vPebBRc/H0PH/wo6dy9eISb0XEYDPOTKULf/yLh/L+3WdsHFj2hoqdgaW0Fl9rxA7RWpOaLkaHJkbrHcWoxONot7sgCls7bFmS4dDUXDh7kYUp27snIh898ez0RhQ1mDQPJLGEeoWMszfBi9YyUTZu0qzHoOnxdSeHYDRUfmKwGikDpUIzu1AT+PgUKEET0tbtdpumVLhRifzJj97j9tMeuwNwaQckYeAUg52CtY1D7j054P6zIX/48+fyxq1zXFtQanEJXp+ZZWXlFm9uLfNsY5cHT3Y4GNYUrsSWBa1WTqcd+TJNSE+WZRXqwoRMhNITYqK/kVE/ptz7KXtHf4krH5F5wXhNIhlG5yRphskWIT2P6EWS7go6nYekC7oNaJg/xcLoLIP+Eyj76CkkoMTalPIhtRSg6dFb8TD2XGJjayg9ECMrFetZfqpmNZU2DMzBNCAMpzSCQXkh9T5ItvsAcqlEoSWDUqAYYTcfcTSqOVIJsn9H1OKtVxqskh4f3Xubg+EGvh1q1l4Fpg0lIbVtVI0XN0WdNU1zYyKIKRgXLZq69qikxYXzN3nt5rcZDjL+8A++x+ZOD4/BO9DGBHX0LGFueZGklTGK5T4V+4K0ixkFrUBcACmhUDogdb0Pka7ygrOWUe8IbE0S7wWYaLWhNeICDsHVltzA8tIs3/76V37jbfZbMVY3blzg9deu8dOfPppCeqlxTjTknUMhPUEoqpLe0QHd5VO0Ox3qOuRikyTBR94vILL0EchBhalcvcYJpHmXmfkF+jstfF3GqCQU9bK8zeBI8+TBiItvrmCSJVA9RCoC1VIEWbw0ZPyeRUJ9qenyVgREXpJ4jgZPWdv6gH35WBbVm6/cpFevrrK6OkOvOKByg+C1hAuA6JfSUAGmHLVgJMQMqQ6NudQOLTWprrh4ZoGbN06z0jr+ArtW5A9+3uPJVkkpOZlKcc6SpS106VFiybMM5xTe2xABI1QWyt0Re4Mhj54/5pu9a7z/VGRlHhqhwunxD75zVe32RJ7uCO99+oz37jxl86AgkFmGefXWYH3QynEKdG7I8lZoknYKV9b4uiRPLakRVhdnAiVOHGUNm3tH7B4NKSx0cx3YNGLRV8RE4IFijDKMjs00EnC8slOGa9JSEXPr08+VIH6ICiKgPhouQ2CdSBPNwuzMWMdKDBQWSpeRddt420QFOV5SStpsjRy9Z33ubhxxb2ufP3h/S55sW86cSvj6aaN2ncjr51d4eq7PJ2t9nm/vsL+3zajqoazg6oqkm5FmLYpBQZakdIwh1aNYJ/6bGdJ/V2T7xxzt/gRXv0vLbNOSKvTTWYP3mmqU4Oni1Sm8zOP1LGkyh1FdWnqWLJuHtA+jXYzYQKY6jQZs1ocJDdCLjcDTwAqJRimWfsdprfA1OieiY8PtJLaSsYEMD+Mcyjm8FywGr1KUSnDDioSMudwwskO6uQCv1hTrybbc33+Htc0HSFritAQkLBohRUkSy4+C0SG9HT715GaYwllg0pTRoED7jHIofO07f59zp25x570d/uzP3qY/ykhbM9gypPq0BpVkdOcXkKjmHmi7VJAQaz5/RFE2wo+Bo9DjxJKqwJrqyoJRrw/WkiBo8ZGSUyM6OFVGhzeqdWBlOXNqkbdutX/j8P+3YqzOdLX6T/6f35MsCxw5L5oAHQ+BRjbEW0cx6FMVQ1oyH/5PmsL3RD246a5uIrOYnBl7QmmaknU6tNpdRqN+QNopSPMMUYr9/SGffrLFa9+4gU326Q3uUFd9WnlTwAwIu2PFeBGQhoIp/BgDHxrUmaXG1js82fg5l89ex8qGJOrMiYuxNA/f+ubrPHr+A8QqtGnH2tgUmW4cgoveSdyqsV/N6BSsw9eWxNTMtIRL5+a5sfKyEdndhUePNhkMoZWGpoa6HtJKNYnxITozOVqlOBSVcyRJSpqnOK3YHw7Y3x+wd/gh73/8mEtnl/mjHz+Vm5dWuXHheOPx8my4/qdbIqdPz/Pk2Rabu/s8WX9KUTpsPQDTwaQdlAk1wLp2lLWjlWakaYKmJtVCN1Ocmm2RT+V8RxVs7/UYFDU1OcqE1IJO9PgAkkg9E8hNwyxODFXjKDUbajrqCodWs7bTGjzoCOIIMsooFZhPdGTITrRnfq7LSiTadQ6sE5xK0Srj9ILCWktRa0prqH1KbT37tmR3NGTj4R5PD4acf7bJm5fPcG9fZNlM1vLJUOSjB/PcfzDi4KjHcDigv99HF21m5ueRWpEQa6/eEVRP/3qH2CdC+Rh2fsDRzo+h+IjZdIe2Kkmtj9GPJsgjWrz0EV/j2aOuQFyGdQkjMqxKSUyJk0287QWYuW+UCmjy4+MISzcprPBOmieEGtcU64KSybNUrAWpJn3crLWfRGHj88bXQaLduQBxj6l6pxK0Ski1xnmDs5C2W1x78y3oHO8NnB4lB7x7+8fs9tap1Qh0oF0LzDmBgV/HVF+jdhDOm6aGzvg9ACQqo6gtiWrRyua5dOENHDO8/fb7DAYGLylJluPK+Om1Jm21abW7VIDXQcnc+HDU6IiCdDoSvvmoBKwDAbd3DpUkGBRVWTA8OsSXNYn1k4iWAK5TaLRWVFVBR3tyo7l08fSX3WbHxm/FWAGcXl1idWWZncNgcDxEOHP4QErJVPe9oa4C9VK7rFBJ8CxCB/mxkgJNN00YYcGsBI/IiUKlGa2ZWar+HvWgwCChT6UWkIydrSHV8DQuW6QoFa12qEuF272pSzWSJDCmuYkj8GE1x2AAjtS2QAO7h5+ytX+blc7rr5yXlZZS7z0X+ZMf/ozhTom3CmUCrDuoKsf0U6AxDvik2JjqXYTq+iCxopyl0zacO93l4vnFE6/37PkBG2vbGK8wKkFciRKL8xZlwIow6Pdp5TMkaTeAOGIk4nxF7SwznUUGRcH950ds7vV5sr7L/edb/MkvN+XCuRVef0Ge5LXV8CHWDkWebx7xl28XrG/32dodUdZDnOjQp1V7aoF2txM8X2/xVcWw2ufMuVmWZ1qsTkWKgxHsHPRwmEBeCyRKEAksEhKRX4HcvgHGy1gn7ddGVi/URBpGeZTBKxNYwHU88JRHK4/GgqvpZBM6KFcHI4ykeDHMzcyilKNwhmEp9EtBKktdCNY70ixjc++Inc1dDnb7bG8c8Bfvb8u1i6e4sKjUpY5SmyJy5dw32d7b58nTIx493Wa/3+fQObRuUQzK0G84p+lkx6H+f5VDqj3BHEDxCX7v5/R238aObtPWO7SwmNLhitC7FKxAqFMqKpARCdBN2nhlaCD5zlvqKiDjslj0b2pO476q2C81Rm1O/f90ejeUeqa2p5fIDRgaV5sUcvN/4zQ8TXTmSLygnURDFrk7vaB9HfSivEKsYJOM+dOX4MJ1MC+QWcZRyI487L3HnYfvU7kRPnMIFifgfTsw3PjAnRdQz1OGanp7isZEFgtqAk+oNbz51tc5e/o6vUPhl2/fpXYtnIQMkIuGPMsyOjMzmCylFsatJCGPHtaoaTwHYjkmznEjq6TDHh4NhlRFSR5Jdps+WkVoClY6UKHVdYlupZw/s8rN678ZZL0ZvzVjdePGNV5//XV+9PM7EaDQ1AkUCYENWSDi+kODcDEcUZYlWZqiIuy98ZpCo3A8UMaME6H500vIxTrAJIbO7AzlQYfh4IBUa6wNG6/dbtM/GnD39h6XXl8gS7tk7QpXuWAUIs0IJExkQ+JQPuYO1BgFCDVChJ5TUdoNnm18wOn2737m3Cwtw7e+8RX+7IfvctC3MWUVGz1FRaaKpo4mWLFR7RYCsa3C1ZaZJOXMyhyv31jh4rmXCSF3BiK//6/fY7h7QMsn6KrAq8BFV7kK0TnWKUxrFq8zaiFQtfiC1FrS1NFuJ1QFmGyWRM3Qr4dsPz7kzvoBHz3b59L5U/y/v/9Qrl9Y4eaV7jEZj3OxpnV3o5T7z3vcubfOk7VDNg+HDMoCMkOn1WZUFAzqPqlzdIynreHimVPMto5vx8HIc3DYQ5QZ93CgJfYeBaZoxinj6BWrSZQcS4zHjBTTP5/0fwogCchCPBIlb8CHxkfvyFNFPgXArOuSoiiAnDTp0B9Z0kxjEk2n7Ulzz4yFsk6pKsXwcEjSXkR0l92+4+CTbT56sMvNvZo/vVPImYUUHLyxFC5y50Dk7Okz3H++yeb2Ab2hIwHmZ2e5dmWVC78hJPgLDXcIxadUhz+jt/8DqG7TMge0EEyZg5sh0aGu6AgOhhODUKFUqEW5YoDyGcblOPFoGYU+SztP5Q2pHwJuTK3UACaaw9uPa1NMUnpCRP6FM6ORBYFpwzb5GC+mFRujpwS0t5hIHuzH17Gktg4sI4VG60XyhdOcfuu70DkF/mQFhIIBd+6/z97+cxwWbQwlA5wk4BLEJyhf43FobHSM9Pg8mmSXQrVUA64GJYZWPscbr3+dOVb4/rt3ePBgg7JUkBoqW9Kw+rTbbWbn5tAmwUe6s3FvafxsIb84mRvnXGDUUFDH+a6qisPDQ5QPmnJJEBgL9VQEq1wMOuy4cf2NN1/j5q3rv5Wt91szVr/72in1f/gn35Of/ew9gsaMweuQ63cekMDGrtEkKoAgKEaosiTtzlIpFeg/jEHHAydADJjK3AJ4RBtIAwTVJClpt4vJ24jK0NqQaI2tagTH7n6fB3e7vPE7t2i1njEoj9CqJiQrIyw0el6TERZRqCL/XUCCBe44IUlS6qqips/a5m3Ozn3KUJ5JR53c1W5q+Le/+zu88+4nFEVF6QN91JjnK7S4opwKl3Y1YkJB1eig8aXxdFvBWF2/vMKFpZd1rA6G8HTzgLKo0UpTlzWmlWBMSmFtBASo0L1uKxSaPEsxeFxdBxolr4CU2oZCr0ra5PMdwPJs37K+/4j5TsK90ws8eX6GXz7sybmlDmfnJ5C0m2dytVmK3LiyzJN1y4efPuT2vUfsD/pIWZB5T1WO6OYp1y6scm5uiX/wrbe4ujKBAu6WIu89GjEa9klUmAusQ6XJseZI8ChpyrxNramJiCfR1UkLcyzyiuAJDzgdjF4y9pNcA8VBxDHT7ZKnk1unLIRev8I6RztRpFmO1hZnK5xYEg15bmglmspAm1nqytOvLbXXWDTDomR0b53b9+7zxqV5bl1Z5dFQpN0ON+nifIdz565y7/4+n9x5gGrnXDq/wje/usKN5b+ermAZPBD8Y8rdXzA4+jl2+BFts0uOR5caypwGdeJVkGkPAIdg+Ju0ulEapU0AsjiLNkI7yaltTm0lsk3YCVhi6j1oiTWVyGI8zV4xHYUJwHQa0U/VsMavqDgevkQnJ1wJxCBonLeIcwE4XDu0z/BJFz93Ft74NuSnUNnqS2swkD3ZGj3gk4fv0y/2KGSAyiJ9GhKIDHwwsgrBx/ro1KclQtXGjC+Ixjuhrbqcmb/CysxlKkn5wZ//koNeRdKaw+OxtoZEQ5aiuh2S2RlcopAyGPfAjhb6SxvGkKYJ2IqPDnMKogK3Z+3wRUXV70FUZA7ECg3GIKyJKBvaPrTCaM/Vq5d482b6W9mfvzVjtb0n8sGHj/jj732PYlvQWRfrezhxONLA4KByTKJI6xKlwe3vUs4uMDe7jMsSKhmSxijA+JDH9dIsFIhWOA3WVwgptbeIhk5nhs78KsXeEDvqY7RFG0ddW9J0nr29GQ73V2mvnMW5+6i8T5ZZqqLGeyFNOtQWqtKS5DniFV5bUBVexcKpSsHnKAnpQ52kKO/ZH2zwfO/nXC6vUciGtE6oXZ2bVerptsj/7Bu/w//0p29TlBU+1TgNrU6HalhQjSqWu0sURUGWpwz7feaXlzk67ON1SivXVNUBly++wdfeWH1p/h/3RvKXP7/Ps72CIeGw1mlOHRhVMLTAK1KtEVdHtLPGVmXQslEZWjSVBQgS4kGKoFEHDhGmk4z17T69Xs36Zp/3Plrj7PIC//InO3Lr+jJvrCq1W4g09D/bI5ELK9f4nVuLPHq8zt2Hj1nb2OTc5dO8cfMyt65f4OLpJc50J6nFPStyWMH29jaqHKH7jtZsQmI6iAOXpOPapdZCokM7gnZgY1pQlMfJhFE9BGXhEo26hx73WQkqeo8eoZLQJ5ZYh1IeUoO1NaXzGJNR13Vgno9jMEoQ1cGKpZZhODSdYLSgVIjevQ08fp08ZyZTeAcLsxllUTAajSiKmsGoQDnHB/cOebxWcvrMgOuXL3DlcsZiG07Pw6mvLvLt69/CVSUXVlt/LUZqPOpPsHvfp7fxQ3L9jFz3SLwC1wnQa60BixcbK8ENnXFT20ijsdEoH//PaLRPQwrJ9UmVAl9HWRTwXsKZGhMPTmIazxOyEp4ADJg2VBGarl7kDIxjGhI/DappWm0kvmaqM2onVLYm0YbEBGRuaTPqzjJnv/MfwOot1MzZE9eh5IBfffxD7j7+iEpGtDqGftmPM6NRYlH4KNGVRHSwwxOox8QarPMkaYrKwUoZ+8oSip7nH/3j/5DXlr7LD3/4mLd/dhebtShKR1sn1M5SaKCdw+I8ZZaGjJM2pD6y9vvQ5BuSn2HvewGlQzHLe4/x0BKNKYWiX+JGJanEtKXyKOPxcYESpfE2hLDVqM/i6grf+eZbv7Xt91szVitLSj1/NpSzKx0eb/fwNshxaxMa9kwSm26tJ01CubD2FhkFTRSVmNAQjAOVxBrXtAc0GaJjA7BRWOdxSmOyNqrVxRUVpR2RaR/1iXL294U7H+/y3X98Ga8eMKo3MKaM8hDgrKBI0ClRHiQLHkzM+Qa6kcg0jsFHBJrHYXLPXv8xa7u3WTz36l6CiytK/eS9vty+95z3H2xiU01lLcPRgNwktLrdULMTwCvyrIUtK8TVpFlKIp7l2RYXzi2wNPsyw/refsnDpzscDizOpIiKlEciRJr3CRJqjHh045kNZ0BKuOObmyigD2L5OqDvUMzMnsLVFevbBc83DnnQ2uPJ1pC1Pce/+lUlD56VrPVEzs0qNc0F9nhH5M1r59je3WL19CJnz85zfrbz0mdZSpR6MBDpDw6oqxHd9gJJ2qKwEiThnQYTolGjwg3nvY7ppgkbQezyDNnVcbNlrHXFPqoJk4gee5iOpn4QUlHOOmrvsC6kPdI0D8zTcRSVorIKlKBU06MVUsjBS4/zHxJPwXAqIUs1iWmR5yllmTMajagqS+VgdwC9Jwcc9mu29xe5dn6ZC6uGS78Bt9pvMmSwJrL3zxnsfkDOczLZRlHEDhCDl8Ai36CfmuZsYmousE7EqMvFVYoOgvI63l8VjVbVNMJv/B4atGfTTzfJDNIw5QSacmFMDj2FKowk9sCE1Di8pgmlCx/WML4dak+oFWEQV+MsVM4wNB1mr96CSzdQiy83P+/7bVHK8fToNp8++oCD/i42K6AuSZIE5zU6MpKEPUiIOtFx33istWhJSLMgZFj7Eq/i70i4ev41rl/4OstqWf2T//yP5HC/ZmQydGLwdcgMqDQh7Xah1aJOgqq09xKkZYQJ6jIazCaPJUqhEzPexlrADgtGh4f4URCq9d7hJZI/xPlu5J2MeDqZ4ezKMosLvwFz7QtD//qnfP5x/kJHXb5ynm47jcSGeuyxaB1QIl55jE5CvcYRvMrREKL2SVMcFaViyrnpqdA0yqC6Sc+IjBFzaadFq9tB0tA4qnWCIiVN2hT9gk9uP8QWC7TMOZA21gKSolUbW4eowRiF903xvsnrqhgnT0AYTS+YV2Ay2D3Y4P7jT+jJFgd2TV6amDhuXu/y5uuXaOcBcaSFQHCrNNoYRtUAbxzWhwPRWotWkCaGTjvhypVVrrwCWfNs/YCHj58zquo41zGVegJLQ/h8L7/N4/BfE3WEVEiHeBAU4jWjYY1zCpPkJGmbqhYeP13jRz/9Of/8D/4Nv/9vfsJP33nGhxsij49ENgbhhS+fUuo7b55S3/3GG3z71ll1kqFqxrWuUqsLs7TabQrRHFo4cgmVyqnjezUqJElCRKSoIrJMRGGcC2Sf3hH42T14Fx4x/etEYk0lPEIyJlLGRJ5KR5AfsdZiXWh+bOcp+ZSbNxqNsDYg8kyix+jB8dxH1QCUD1IrQRCaJNW02hmzszMsLMyzuLjAwsIcypiAaDWK55ub/OQXv+TffP+HvPvRMx4dnbBwfx3DW1w5YNjbR/sSpIpoO8FT47Gg6pA6l+lGXYkovsgYEVV7vSPsryjnIdJEUFMpPa/GzbwqslSEezAiBZue2YbJAn3s71/1AF76vhmN8+LxOFejvJArQ+YSpFIUqkV5/gJzX/8GnDmZ5ixR4Cl4snaPB0/vU/kSE51TidmKxgEfXzumNsO+TqgrN2b0gZCx0z4j8S3qgeHcynXydJFf3Xsuv3rnY8QbEpWBV6HGBEEstTtL3m5FggF/7LO/+AhRqcK5UJhoaoNaYDTs0+8d4p1lLAkI4/UIKcvGnFi6My3eePMmK6u/PfDPb9VYAXz9G19leWkWrdzY07HW4pVHGeLkJ6GG5YNmUjHqoZwjN2Gyp2VPPZPFHMsBeDXu6Q28igrTzklnZtB5SpJmKJ1gayFNWmidsL8z4vmDCu3O00pXo5R5EFz0kmI9EY3nEAmPwLZjwsEdb46G+8r6wN7upGZQHLG29YBHzz/B6f4r5+bUjFJvvnaBy2cXwRUkoujkHcQrKltT+hKVhbqYRA8xNRrta04tzvDVN69y7fTLdAW7lciz5wcc9gtMkh0TFGzGNLjgxRv2+O8ACRpJ+KahUhGQWwZRGpO2MEmOTlokaQtlMqwzHPUqtneHfHB3gz/6wfv883/1Y/7ip3fZ2j3eB7T8OWWtr1+5wMUL53AoilowWRuLCczO0mhhhVK+RbAqiPYpASOC9pHPDAkefrzLYsJjan9pvBi8GBwvGveJ8cI7tBJaWUo6Bf4aFRUuHizTc3/SAxg/bzzvypNmhm63y8LCApcuXWJ2fj5Extrgdcp+v+Sd2/f4oz//BT/8dE+2i79mo5U4klSRJYEwQzeVZAkRqFcWqyxeuVjbe+EgnDqMX7X/pKlFOX/i/03/nfKT5t7j14kH5wkHMTB2eKWppR37Gp1RibbDh5p7SzJMnVBLi7K9wOzvfAP95legM4Ps7x5bh8LuiaLm8eFdbt//gIPeFiqDJA9ade6FaHB8weZnD5oQ1Tjvqb2jchVaNKnkmLrF1TOv8btf/0fMZOf41Xv3ePJkC5N2SFSGq2OtMElIWm3SToskTfENqi82nJ3krDajdnaiHKzCPVQXI+pRKNNoGkcsSCyhDKLC2YBSOF+xuDDDN7/xFc7O//YyAb+1NGAzvvu73+Sf/6tf8nTjAOc1iTINxiUYAeWx3iCiA4Tb1lTFAFuPSCRHe4Mkeqw6azxMYOUx26sEsSFP6r3HakgSQzrbwXS7UPfxzgYK/OjFVIXiw3d2uHz1It2ZKwzLNaqqIM8TRGmcLRFVQTRW4f02mxhCo2iT1w7waZ3AqByispTD0Sa3H/6cc2dufeb83Lo2y9//zps83fwRW4cV3dYcRV3hxGNyg04UyhmsjT0PeHzd58KZM3z1jUsnvubOPjx9doCXHJOk1M4wDfNtoNov/vziaAAHY2cPwDdy1jGNFr1bJy6KqgUYrdYKpVMCHZbhye6IrcM1njzfYW+3z+//4Iksz3a5dXWJlcXPt4FPzaS8ef0mT7fvstZzaKUoiiGtFJwRXJTPFkWQNFCQjHnhYtav0dFSkxbLICsSIiCJ0bNE5KqXyLYSN1xY83qcHch1QitPyaaMVVkHTTVjDKmeVjhurtjMdYCBBGeo6QNzAShkDCZJyHSGF42TFipZwPsuvh4xGvbYPuyxvXPAoHAcDa6yWYqc/uuSBtECxpDoNLKCp/FzqGBQRQjSN4R7M6bQECb9TsIYng2M9ZEa9nQVDQeRMV1HZgqZ5u6DMRVi4/XLsdpUAFI0f8tUFNAQ342RhNK8lgqpRQ8SiaPjM9FOSCpNWRnKbAZZvcLMV78NF6+ATlGzy8fmv5UsqV35VH7+/g/44JNfUPhQQ6+9QyUmrrsO8PExS7yKZ07IU/o6RFdOQemrCMLSqEqjRxnXrr/F6yvfYVSm/OLnn7B3WGHdLNpo8iRnaCtopSSdFiZL43SG6yRKj5t+Q5I8zikTbIATFZQQCMwVvq6wxQipa3IdABe6WT8dWUJUVFjAYbCcPb3A62/8diDr4y34W3014LVrM+rWzUu0cg3ek+iUVBu0hrE4ngAkgcJIhGrYoxr1oXaYWBw9hlAZR1Wh78HEdELondVYD1ZrknaH1vwMzgT6D21SRmVNXVf4SvPwzgEH2x0SuUyqzoHkgXgxGijrGzXMUKsQUQGdMG5QnMhPxEwvta8wuafWPZ5t3ebZ9qeMZOuVbsuptlLf/dZ1bl4+TYalLIa4qka8QqcJI1uhEhNqZyIoVzPbhuuXT/H62ZcRgLujQu7c22Jja4AjCwznr/BI4fNEVlP/F1M0auwRhzkYjUYUVUjzJmlOkudok+PFUDhFpdpItgD5Iht7I77/s/f4Z//TH/Onf/FT1jaHx97/0O3KUPZOnK/VrlKvXZ3l8ukZ1HCb4e4TdD1AuQKxNbb2Yy9QSeyBij1YSIKPhsiryAbPZF/5GF/BJHp3saY3ngeJ6gHxEE005GlCJ89Yjv1gu7VIUVlEq3FU9euGc+E9NhHWJMoKdYBRMSBrZyyvnmJxcZG03UElOSrrotvzPNk44J2P7vPRgyF7n+Ui/zaHaf5JQDK0z9GujfJ5EBX1KhbqX7hvpyIm9cL93Px++mvg8oupXe+nYOpNinrq9fzL+7bpq3pxTKDssV1EVCSzPZ6KbMAbRsVmWeugVljfQZYu0r35dfJLt6C9gGqdeulCpezKjn3O/WcfsttbR+ceZwLxrDah5uvGPU4NE8fxealLG87G5r0rhS09jBIW0hVeu/QNNLP85Ecf8N4HD3GEdLwSHZzc1JB0OmQzM5CkId09lQJsxslbR2Niz5gJ8hAUgz7lqB9S6hLTWfG5Eg2VkwiCw9GdSbh58yJnT/92Y6HfurEC+Lf+/u9wZmUOg4sM58EINJBjHQEMgR3ZMRoeUvQPkaqK/Q1x8Qjy5U0xtKlVaQzKRkVfY0LGXAm0M7K5OZJuF68NSZZS2iKAlDD0DzUf/mqLsneWlrlOli1QuwonFSppbphpNgtNIDANRJNjQxW97NpV6FThkwqvB1Rqj08f/oKt4uFnzs+NU0r9/W+/waVzi1APkChcJiSUlR8T2SZK02kl3Lx6mteun1yrerqxx/sfPaA38gEG7QDUsRvgpPGqyCp+R+N2TtaiqfV48naLJEtxREaKymJFUGlK2p7B65TKaQprKGmh8nlK3eLZdo/bD9aOXbNjllXnFSKWADcWlPqdK7PcPAXL+ojltCB1A6gqqspSV+CsRnlF4j3aCeINlgSnMhwZ3if4wJ0dDA8ar0LNyjE57MZKwiKI89ReqJ3gfVQEUEJuoNuZ5OFrB6Oywvmmr7Bxfvz4MZ7P+AidGU0Tpo/9ME2UVdNpZxgF1WiI8zVzczOcPX+OhVOreJNT6Zz1vSHv377PJw9rtqu/BoOlBdJ24Jr0OeJbiOugbAflMsQneGeCOKYPhkBFp5JIHi5TNSjvGaf0iSW96fSfap4revLwoT6iGhSgqPFrqFjTbtZSLONaV8MlGNCDMq53i0RYvDRw7vj8GozXKO8Q5xHJkPYK2eWvcObb/4hk6SI1J9ditut13r/zC3b7z1F5jW4B2kfi2oC6a7ITryLLb/TXnK/HPUuu8LT1DG9c/QbfufXvMSoSfvzjjxiOFFk2E/XhHGU5gjQjme2Qz3TQaYKbOgucc2NH4CSntrl2AyKjdox6R9hiRKpCet0oNY6qRMWEcATzKuW4cH6Z3/md134jocWTxl+JsfrG169zdnWWRHusrSL5aGQST0KD54RKxOHKgmrYw5c1RjhRnmf8qX2cLILRMrEny6KQ1JB0WuQzc4hJIDF4HO1OSpIkKJ/x3q8eUxytkumb5OmpoAosNdp4FGmsUTVX0xOQwRQlk0gUSnMOk2ocBVYPSdolD9ff5/aDt+nLk888QL7+lUvcurZCJ3PkiZBoHRA8SlNVFYkRcmOY62S8dm2FK+fnT3ydzd0BD59t4UipbdCR8lOIqpPGZznjx6OuCExoHvFwtbYa30SiBYmpAOtkDDRI05Sk1UaSnFq3GPoWm0c1Dzf2ubslsj36/AfsV2+s8O99+zpvXOhwvutp2wFJPURVFVILWI1yBu0iuwBBTdmRYiNNjlfhq1Mm0IG9sKYQvMJgqCw4jw++VjBYLqAOjRZa2cRjtA7K2uP8yanVk0aQzQlzZa2lSb+GFKxjOOwjviJLFUkSVK7TVk5nZo6ZhWVMNoMzGY/Xtrhz7zHD0eedyd9gKA1Jgk47AYjiFUrSQMLqdICuexPJUXWMqsKfhtRfbLqdjqRccMxwUxGUY8KKDscOUYhlx6nvX3qbPmRDTqqFTWpVzTX0GPwx/ntRoQXTJRgBUZoqmaGcPYu5+Ba8/m1I58lOcLCGsi1re4/48Tt/zvbBU6wuqP2AGgu6cYyOH7kyNpwTw5okYX9ZayOJrIZaM5ut8ObVb7Gszqsn93f58P37YHIGpaU/LFBK0Z2bhdRg2m2Sdmecegwp2UiddIKR0jHybObaW4eyHu9q6tEwBBIqUEKNa7M0QqpBnFZrSLRw9swyN69f+A0228njr8RYXTql1BtvXCXPFIkBY6JB8SHH7V04zJQKxe9WYqgHQwb7+2ToOKFTKSsT8qzO2qBlY134WoebXWuNdY6irlBpSnd+AZXn9MsBSW4YDI9wriJNU4Z9xcfv9lme+Rb9QwMqJcs1VVWQJBm2dOMbJ3gZZrwozcIEBnNLYrKwofAkOQyrPSrZY237I/qsU8rGK0+v66eU+gfffp0r5+dJpKQuRmTkpLpFO0+RuqSVajJl+e63XuNU52UvZXMkcv/hLkeDCqcMJm3hbHhv0x6Uc278M/BKryr8v+CUw2sfIyuPYGlAJ+LthBpq+qEF0YLSDuVHKApsNURlCSUam3bQM6d47+5z3r+zhzqZnebEcXouVf/B33td/W//o3/If/jvfp1vXD3N5bmcRaOZQTCVww1q3EioSmFUOEgySDJqCU23FkPtFDZC3F3cX5ND0o4fJoIskqh67WOkWpcFeQKznYlKcG9gKcqa2suxfQK8MK+TnxviWW0CG4rzltpWofkUTysziKsQV6FwOFsGXsgkodudxWuN8xp0xubOLltbg88/mb/JyNr0qwKvbOhDjJGH9hIdhRRcGg3G8ciG+LuQgtMRCBHIVKejJxrxxKm/U01kFGGb0xHVMbSgVxMD2URaU5FVA2ufTr0pQiStoi8m3pClM+AS2rqDdSnbOmf+K99m6Zv/Liq9qJR6Of0HgVn9zvMPeLx+B0lrdMsjiceYyR4Ishsvg26mh1KKqqrC915BpVmaWeXGhTe5fvErPNnbk//6//XPODwqqSzU3mFaCU4sTiym3ca02jgd2Cca5wHnw7np4/2MC61CTAxmCAY0rSzDKKHo9xj1DlHOkiZmHFUJKux5o0mShNpW1NWILFV84+uv87tvnNx79puMvxJjBfC73/wqN66ew/sReRZUZROTBt4+5cMkicMg49ywlAW+KkNNCsBPDhOYKlPHdKDCT7wEAgrJKUHSlKTTRmVJYMog9LWgLEYyPv3wgI/e3efi+a/TbZ+mrkJPly2ETnsuhukOaQqwcbM3BvTl4QELpkKZIXu9B9y+9xNK9j5zjm5eXeZbv3ONbm5ZmsmoRgUpCQZPmnq0VLz52hWWFk6mcvnwkw0+vrNGUYd+jQZu/aoU4Em1qRfH5PfHq9lKPMQeIhUxww1QIDy7eW1PomoMdXw+OGWoSRiRUkjGg7Vttg8+c2pOHBeWO+qbN5fU/+Z//i3+l//wO3z3zctcXGiTywBf9aiqPmU5xPuasiwoy2IM/1UE6LSP6aNjj5h+UsR9EpscPSqCHQJ4I03CTdzOJrdNUVmq2oVIQwUOjekeni+XhvVjuH3DXjLGacdD1wnUVigrT1lXX2gepVoXcY9E5JGIPBOR3ZPf5NSwEbGSddtYXSEUCFWoE3oXUvTOYLwJ9WSOG+vpiGqsO/bCVcWrWLjXJ/5dY2SmqZQmqdumnYXj3IBx6PHfqGPGLtSsph04RVkpjJmlrhNK06V96yu03vo6LF185fyMZFN+8sn3+dn7f44zI7ypQQdAGQ1jxUlr0ay5TLIio6okz3MyZVBWYQeO0ZHnq7e+y/XZb6hH93dYf37E7s4Rzgp5u4UoofQ1YjTZbBeT5wR1igmD/fjcfHHeXzwnnEN5hxsVVMMB2BoTjR2Ai7U/paPatxK0cqQJnD+3xOVLZ145T7/J+K2jAZvxrW/e5PLl0/zi3Q+ZXcqpatBJSMeJ80g8zIwGRGPLmmo0pB4NSNIZEHAE6Xmvg9CdjznfUBOIKQVFQHVFNJgTQSUJ+ewcxaBHWfZoBEGMr9A6Y/35gNsf7PLNf/g1DgYfs7+3TruTUxUuyE/ECCOkZVRotZKm5hCRSUpNWB5UbOYTC0nBUfGED+78gAtnr1HIM2m9gobp0qJS7z/uy6OHG3x4Z5PEt0iSFMSSaU8383z9K9c5PXMCsMKJ/A//8gOerB/hkzkQj3MSGCq8RJmMz05NjYvWL3h3gQg2bvAAqQvP80QSTMb3XqO8G39AiQvyELoReNNj0lKFwmnHwyfPuPfoZW7DF8deLbK+NaAsS5YXFrm8FBLjK7OTN/zho0reu/eE++tbbPWGHA4tiQiuqrENm3SVopQiTVM63TZlWaK0iQjHJnp0sYU3kpeixnLjDeo5M5puK6Ez1WQ1HJVBx4vpVF7jbTUR1mSuRALK7KS1GKM2gQZpFyITH+TDJVJz6cCiUjtHUdVUZf1r51LqDaFcg3KdcucPQY9Isxa6vQLZBcQ/FaUvvtIb1mRggpCfVwWihojyBHkLHyQiJERKfkwU26D84i3TEA83qf6xTtUEzceUwVEvIvoiMEIigm9ai0o1X4l/4iMJtMi4HwzimRFvYRoDFt+L8gqLohKDlnBm1QunWfrKt+D1r6EWXpavH5U70s5PqUPZ4717P+XR5ifotg30fk1NjIiojQoB4b5zTOrjzW7RgUlCVJDRIcHYlNTN8OaVb3D1wtfZLAv5L/7T32d944Cy9mSpDahqDc4o0k6b7tw8ut0Jvao2aLM1E3PsTIi3UVguQTe+kA9N8dVwwOjwEFzUdnM+fp7IwJFofD0CZdFi6bQT3nrjGm+9/tvhAnxx/JUZq7OLSv2f/tPfl27XBHobB1XpSTLGRWiFw6hwiJWVxQ6GVP0++WwHIVDnN+iicW/uWEE0HqAI0Qee5H9NEoQdOx1Gh5FBGMH5Cp2EZuH1ZwOeP1okz66TqScYf4RQUhclKm3O4saDjvQtatKfAwQOxCk3RSmF0hVe99g+vMvdp79i4fUzFLInrVeACL52eUb92S+35NGTPwhoHmq8srRT4eaVFa5dOPlQ39iFZxt9LF2UThmVIxRZYHMY34mfPV4kdg1DiEy9U/8XOtuVCgKHIuHmM3Elm9dqvGHv6mgIwmuF9KkhUZoUR7/fY+3Zc7ZLkZVXQK8fH4j87N193vvoQwajIVevXOLHdwayOtfhxpnJ33zlSqYeHYpcOzzLvfVN7j/dZHt7SFUV2Mpi0pQ87eJF4UrPCIm9fhplTOADjFQIHgkic7EmqpSZoAGdR2uhlSa0pmrro1GJdRLIdsdvKzIBjI39ZC5PYoGfnj+lGrSYCgKETA63gEptHCWD9zbU1D5jqcU+FwbP8Xs/xBZ3GQ0eMBg9AVWSZl06nfN0uq+j2jeR4mNBr6Kyl9NcmgySLk5SdCSlDujFaF28RvuoAOwDj11zP9LUqPyU0yOTxuFxm4UXiMCMJoI6Hl1NbJoe+40yfn6zV8P3U3McXzskCeI1x0APiZkTH9+HQqUtDq2G9gpz179J6+ZXUSuvn7hP2/kptS9P5eeP/pzn+/dQeYloF+HmseWDsV1gPAHS7BE1uVXjfCStFoNen/nOAnWhmMuX+ff/rf8VmgV+9Yt7/OCH71HUitmZeUrxjIohpDlZp00+N4PptMeI4mZPaSGkUSXyVKjJ/pvek1oif6vYwKgyHJJ6R4oGccHg6tBTpYxGiwFXI3bE4swy3/rqG3zl0vKJc/Wbjr8yYwXwrW+9xVs/usHdJ32MSalrsLUnNSFtpolSAt6gncdVI4r+IWm9iE5NjJYEH/OqHhc2GRB2Fg0mNVKXgBePUwqT56StLibrQiGIq/C+xPsakzi2No/4yz+r+V/8r7+OPt1nc/tnISVp6tBiqlVMNZpoqFS8TrwpYg+JyPRiC4JFmR6Swp2HP2Fl4QJvnnmZy296/KNvrar/7L/9ifz4Zw84GhZo41ian+F3v/M6y0vmpeevDUX+7McPefh0B6dbiIW6rum0W1hbMcUrc+I4yUhNPkPkZEM38APG0hlNZpAmsyForSASCUH0nps6XyzGojUGIVWeFCFTjsx49AloqI09kffu9PlXf/KER2trHI4slTdsfvScRxtHXFxd4McfHcnqUpcbZ0OD9JV5pXZFZOXsZW5cOcXasyOePN3l3sMn9Pr7eD+PybqIV1hnMWmGmASVgDI6RsdTulVCoJzRyTiqds6hjSJPDKemIrtRFaQ6kiSjURmeVoCeTLGKfV2xNtBMZBzHI6uQBNSAfiEdJh6cC20FDVjEvgJ0JfJIXO999rd/jhveJuE+tnhIyxwhroJRh6o6i+s/IM2u0W5fh9YVpPcLIT+DyqYjLQO+Q5YsUPkM7yFpalIEJYHAUxQdSE9sxm6MAWOjpMbSN/F3TbJCVCB1Ddw/oZE4/n0T/YS5UNHYTdL0Y7Bl8DrCjhx39zaRVBN3Td0LzTIEQkm8AqsV+16xdPUt5r77j+HSGyfOL0AtO/Lu/tv8+S//iM2jR4ipUCYwumsJaLk4e+Pho7MtY8BFZOaQAA4K1EUpqWphS7h6+Q1unP8aw/02P/rRD3n2dB/MDEmeUVn7/6fuv58sO7I8P/Bz3K94IiIjtYJMJLTWBaCA0tVd3V0jeprNIYczHBpnl//EmvGHtTVbszXbXa6tcZdLox6OaFlVXV3oLoFSQBW01gkgE4nUKjLEU/dedz/7g/t970UiM4EiS7pZZkQ8/e7168fP93zP90sIjqCWslNSLizFFgKFkOp7U7JKMkLFxDVNzcZ1IGoqBqwoVHUkVjR19L2SCFF6EUwWhbHzIBgruLoiOn1v56YbLt4L+ssYv9Jgdeft13Hr7ft57cDPadSS5wsxZdVhFPkMIbHKygRfOerxgGo0jMZ8mY3+LcwdUGkdYdsDHHmxojGYKYDEOkne6dPtbyK4Bu8aDOBDRW5y1gcj3nxpzFe/+hC7d9/F2ZPvUNXn6RbhAlXvNJJkhlGJNG0RWqtplKhVSGQ31qGiW+acXv6A9z96iZ1b9zPUk9q/hEEjwNe+8hAfvH+Mul7FiefKPVu5/dY9bL2I2sNgBO++f4LT5wbY3lacNpjMkhmoJxUm/3Sn9WK7fJU2Y2QuuwJEpwEpfs/Y3DgrJE7vIbOd2HdkI5RmA1iJ8KBhTDeHq/fsYNsF1NZzY9Wnnj3I82+cYHmkNASy/iKFNUwmIz48s86x08scPHySa/ds56nXV/SKPUv0+rBt7sssq+qxq3azd0uHg4dPsLzeMBwPcM5gC42Cntbh8owsy8gyi2QmtTgoqJ+qe8dAFdlqmVh6nY2U5apuwAg2z7C2tZyZzdlLZVYzWHl2LmLWFOn1sVYGSGq8natFOh+xBEl6bC3782NDx9Sj46yfexVxb7G1e5JSVuhloB5CGOH8SeqqZjg4wyg7SJbvZWnpdth6B6rvKGxHZLuIbBMdPa+WzWjTQ+kQvMWkYBWDiAd0qhE3Y+KlIKNtAJnFlfnMSkNSXJ9mShvvn//JHAV9+vxpZjV98Y89T6YZGdOMLGasKbNCGTc1ZvMeFm+7D279DNK7+pLXbU3N+yfe5P0Tr1GbdaRwsWE6EDdAMFPhmZ7rtAGR9rOSgmU0vxk3DjE5zRj2br2aLz3yBxS6xHsfrfPkk6+A7TGpFG1G2G5OURRUIlCWSFlSBUWdi66gIW4oowJLsmdSpv2G8/MPUsbqG0bra1SjISYJv4T22AbBmzhHG+/IMgiuYtvmBe6+40au2rP9Uofqf/f4lQarnYsi/9O3ntelJ17nxBlPpxcXh6ZZR4yHEPA+QuGZsTj11JMhw8EavU5JYbukmUkQjbqCcwuBgakxGhJ3cnGjZalDIC+69Be2Mh6MCUwirBMagg7JMsNwrcNLz57mkS8usH3rNZw5c5TgBmjeqjTEnbZlJniqGj9Di5vPgYJxYRGPGIfKiJBZPjz6Gpt7V3PXDUuXPVbX7Rb56+++q08//xbLqyNuuP5artj88UB1ZjjWV949z/FTazhyjBiCmiSQGdljRrMNaf78uJQZ4ezGaEugGmVJxSRaa9qkApERJCm7TM8Pc1lSkIwWtzXJDkWCJ6Mh15odmzrsu2LHxz7buWHD6wffZ01yZHMP8TVr42VUDGWnR1YuUk0azroOp987z1sfLnP1jk3cfO0ODp1wum9P9H/amr7Q2Vr1zpuv59jpIR98dJr3PzzJ2dURWbegco6m8ZjMkZUZmWZRogmlA6CeoIGmSQQKVfI8p9/vbvjMTdOgKlgTg5UxZtqP12ZWYjYuTtOa1TTDau+P88yLJSA4PNHBVqeBc0Y2ivQLJ5pkdy8yJCeTQObHZKGih5A5Uu+TYOmR08FSAydp3Alqf5iV4RE2udOYcB90byaMTqnp7RLYTO63oW4LsI46G3sExdFqAsLsM84yojh55oNL+hK0Vh9oSytPQSWJo8aX1A3Pa2tBqhcEo9BuACRldjL3RnPzc8qQa4NkmL0OSqfXZdcdd9O76zPI4nWXhbReO/U2bx96GW8HZEW0Lwp1W5+K36k9OyptEE+wYIgaEppYpInigyeQ2w7Wl9x7x4Pcsu8u1peVJ77/DEeOnKO3sJdmNCS4mm5hMdZSll06/QXUWnxiEm3ITINMg5VrvQVbl22dzUtVRRvHeH0NX9VRXinE8yEm6m66EFmNPtS0LOFrr7mWRx96gP27P15f/2WNX2mwArjjtuu59YZrWF07FD2TfIj9ROSoVLjYCYPNIovIO08zHBI2bULKPEmTRAdho8RdgveJNRRpswGNxV5JC4GJNuNF3qHTXWCSdVHNCabG+xFKQ9HtE/wCT/7kLfbfcDPX3fQAzeQYK8O3EBPivxQINRUg23+trUQLlvn5oKBClpc0wZH1ak6eOcC7Hz7NNVfczERPaUd2XfJk/pPfv0n++3/7tB46cowbrvn4Yg4wroXX3jzImTProBmuSReqVepmQp5HuwWdz4IuUze58LZWPST+EVKAuqAWky6suFmYLQnta3gNiaTQvq6QGUGISibbtm/muj0ft7cYVobVCVQKLjiMNfQXF3A+Nh/7YDB5l7HLEJsxVs+Hp0acW/6A4ydO87OXzujunQtsXuqwbVFkezH7ogeWVbcudnj34FHOrQ6xThg5pW4sIRSEUCBFRqZKXsQahg+e2rs431TpZEL3AoNIFzyIwxpPZgRjIwRzwQHGfnzf8YlDVVGJavckwkdAY6+iyzEhGneaS3WXUpLbnI44ilCTOcVXYE2elFkUskBh4warlglBx9STIWunGprzZ7G9wyxsvh2t31R0lSL32JCh2klAlk9ECJOycma1plSPaQkWhJYqvvF+pVVySJvQwFxgm2MRTqG9FlZMkGoLlW6oVyW1mWBSX9aMoh0bgwW8ICGjaRmCKBN6ZLtvonffl+CKS7soABysDug3fvI/8vaHL2I6E+pQRWUMsTNUUnRu8xKHSPxc8cKJRC1NdfUAdE2Pkh5bip3cdt0DjFctyydrvv/9n9HftINJ4zF5hoToBlAT6JYF5aZWvWfGxjQhbvLVxwAtEnsRA/F8qBGQMBUCFgLqatxoBI2nNEXchycT10hKbcjzHK3jHMosXLl3O7fd9svvrZofv/JgdfWezdx7xz4OvHOQ1fUJQXs47dI0UVsvyzxQoyGQ00HJqIYj/HAdOnFR0iCpDiI0VU0GU+o6GokamBiwgijOeawx+GAxeY/O4jbWxyMmzYCylxOoqU3DeDjA5gUH3m548P7Pckxex42PUpQVwhDnHSIWnyabZBHaCuqI1BkDeOx0BxhZMpAxbtbolkOWdnRZmxzgw2NPs3vLJ7Nk/tU/e1iee+Gw3n/zpouubkdOjnnn3Y+oJgH1GVkR3UxDE0UmfaiBDuic9M8Fi2d78WwMYtPfkvT/rPCrEie0krCTKUzaMuaI3ezp+SLxNaxmZKakrgJSFkzciO5Ch82XgAoOHTnPpOnFzKKZSqWmxSzqlRGAtJFoVKkdrDWB5Y/WOLD8IVs6wk1XbOGN94Z6+w396Re8cavIqXWn996ynYMfneGVNw9x5NQAXywyDp7xaII0HRoTyCUKf4Y84DSQGUtpM3KpWejPqg8nnerf/fQNQhjQ6Vi63T5VXUOWg1jMHOTnQ2xVTkdow/GfygMpCYJuUKKdgyfWCkwQQsrcAXztsaIUYjE6uejxBIvXAlsPWTQOP6mwWQGEpOnmgQpcjlElNxCoETMg1Iew9Spu/QPc+hsUbh8s9mDxLDaMUASvsVaBClazKQ2cuSCV9nQpW2ozp1TPaVUcVKbZlZ3uCWcZF1PFCmiJljHgxDpTDDMxAIW0j1Ri07IJIC7gBbxUoNCxlslqQyfbhBQLrA4mTFTZ0lugKrbRu+cfwdWPIPbj9h/tWNGz+ndv/jteOfRDJuEkVmu6RY/JpEaMQU0kJMQNR0ssSZu5Boq8RBXWhyP6mxYxWc6ps6fY1NtCR0uKqsPXf/9P2bfzLlZPl/y3/+2fM5nAODiqIFAafC3UzlFs2kS5eZHaNkw8kBUEn46lRDQw+gwLvgmIyWhblDUpAWHiYzIC586eQJsqBjoVClNCqAi+xlpDjhIah3iHVceubdu4+cZ9F0WCfpnjVx6sdvRFfvL8UX3jtQ94/sWjkFnGTiMFWpQgkdMfEmRkUKRp8OMRVH2yXtylNL4BNWRiEO+ZA71pMx41qZZlIikjiEVyS9bpk3UXqCipQ03jGrqdkl6vx2Aw4a03TvP6S2e57vpHUHOeY+eeo2ZCWZaQRQ23LMuofaCaTLC5SbBj8nNJASpaGEWtQmNzmjCKBn9mhfcPv8BS9xrGeli7cs1lT+qD91/8/hMT1R/89ANGFYTkURV7hFIWiJn7/ZPHxbIsgKjFOo9nA4ndF6GseN9sYZiLXyhIE5/jHSIFmaTmWoFuv8eOXRcxj1xW/c7PPmRUgeYZGzej839EYVpjoxRWEHBOWPWBwcCzMgwMhic5c37E4z8/obt29tixtcvVWwvZtZjJ8qTWO26+gr27t3L4+CpvvHeM9w6fJqcgz3Lq2jGo11CxmE7cfWchUKiyWJYsLcz8eUZjGI9DMp0OeAdi8zQbPVMiRdDp3/PU4Rn7b3rkpzXXyL5MAVtNUrVOukUJ4JJUEJeoyXGRkeHVRqsUXGJpmylpJEjMQmzIItlFJfWZjQjqyXAEt46ur4A9BYMFcBUZVfpODqWJPrHTwBNZd5K+NymTaYNPe3vQWJ+asvzax81NPcNc3EqZmEKScDMpw2ozF0lQo0QFfM0w0fcltrsEiYzN4Kkmnk6R4yY1TV1RFpsY1sqo2MLOuz7Hwh1fQPqXhv9W9Jy+s/YCb374c9bqY2RlwGYZrvagNkkqJfX5VLGKiEVk5WW2QDU6N/T7fZwLjIerdHs9yrzD4PiIh296kFuuu48rF26U7/7oTX35xXdofJe1wZCyv4AL0XHYZgW224GiiMmytH2QiuocjAp4Yo05RIw0ZaGe6K4VPbuqaoSvKnDVlJ2pLdwisd6WZRbnHLlAZgI337CP++++/VKH65c2fuXBCuDzD1wp/5f/++P69HMHQErElDOCAjmqDg0hwlfiCU1gvL5G3ilZKHIky6MsTRBsUeBTeJCQTgotY0oQk2pMrfaazSi6HToLizSuSz0ZktsuroautRAMp0+s8Oyzb3PDzbfS615Fv3+YejAgz7u4EKibBmMKNBDdajUAiXV3wYjBq6bby3F1D0KBLQxnVg/yzqGfsHf3FYz1I+3KpYu2lxorq/DBB0dZH41xYsE2eKqYxYgBtag3SDbr5/gkYdWL1a0u97z5usnsO8/3c8XdWNQ2C2Qade8INSY0bN20hSt2b/nY655fHXP85BkaByaLjLhP+gytNqSIRNmsEJgEOLJWc3p0lgNn1tm1bYFr927luUO17tmVszUJ0J6pVXfs6nHLTXs48P5Z3jlwnNPnhozVMVEXFwIf8F5iO4NO6Jge3TlIfjSE4VoguC7O9Rk3GbYAqw6rnjbIhmRVQoJE2yCmcwSVmMkKgZZCPesNoq09XOJUfhrx3HnITHRWZI/KD+0xFTTEXhoTHCIOQkNVDwjVMcqyRGkwoUK1InqyhdjUH2JtYwbZzc2VKWyXvneI2eSUBZiCWTTxi0HYbHh+Yu0lGDG0tSltg2F7vCJ8G7+TQ0KDV6Exgg9gU9OyczU+N2imhKZCxyW22ILddxcLn/kKbN172UN5sjrAsy//He8dfhXnx/SzHiEEqsmYvCymTeRT9f+5mmIQUBuRC+c9/V6HejAhOM/WxS3U68rW3i5uvfFelB4fnD2l/9//519S1R6xlsV+h0ojiSUYoez36S5uwuZlLEpo9KFiyi6M537KQJT0IcTEddMHTGbIUKqmplof4CYV6tw041dNkD4W0mYgkoE8vX7OnXfdxO13XP6Y/TLGryVYAdx449Vs29rjzPlJWkxzRCyaJJhQImVSAgTPZOixRU6n38P0DHiHBnAhg3QZxwbelh6aAkcQMqP44PFBo/p6acn7PWy1gNZDyrJHNapwPrDYWUAY8+brh3n3nb1cc8OdjPwxBuOzIAZjGkJoooRREHq9HrWrEjsuiZC29Z5goqCjDsntAsZ0CUGwOWiv5tzoPV56++957N7tVHpWy0vItlxsnKtUX3trjWPHzzEaNwRjEas4xpGNZnJUC6L6gkwD6aWCUTsuRmOfD0jzgehywaO9L9bUhUzsFFq0JtC4mtx4tm7us3XTx19jdX3E8soAtR0utirPv/d8T1crgWVtCtDAJOSsB8dg6Dk7XOHImSGHjq9x/VU7ePr9se7c3kEFdmZzDMJa9d0DQ155/U1Oro84tz6kXh+z0Fliy5Y+mxe67LtqC7v7s+f4WqmGFb6JC1IdhMxHfbQI+bUaebohU9R2MWuPWyKzJDALQkjN8G0Qi4vyVAasnW+fGKRSLSkpNrQqGy1bD5SQAseURi6CRfE+1pJFPD7UeOeo/AgjHiMNhBisRJvYY6UgLn7W9rvOB5u2Gbi9xGfAiM79nMkftTYWH2MBzhonNrz+jNShWA+oj8aZojixBCzWWyRAnnWo6oai6KBasLKu9K/ax677vwJX34Fkl74uj7oD+sNX/pzX3/s54+YMRSf5oHmDc1B0BLRVRImCvrQeW22pQhvEWoL11G5MnmfkLGJrgw4CX/rCH3L3bY/iqw5P/eR5fvzzF8i7S6wuj+j0t6UgHJCiIO93yftdTJYlqEOiXY+SCBbtdp5p75fXiGDFgBN/N0HRSc1kdRA1Wv2slUN9IObzEUysmzHWKKoTrthzBbfffj1bfw1WNb+2YHXHbddz/7238sMnX6MOnoAlBEVTa2ncWMZonYuhriqq9XXqwYBup6AwpB2FowXelLbfJ+7EgkImUSU7Nsd6qgBqCuh2yLqL5JMxtRvRKRexExP9eYLn1PEJzzxzlDvu/TxLw/c4bQ8xHq6Ql5ZOJzpt1s5RVw4xBjRDrAeaKRxmU7ESVerJBNEeIkLlx9hCqMMJ3jnyJHv23MDNV1xkxb7MGAzgnXePcH6lovKKzQ2aubiTJI+kB59FRXtqpsE7jUtlS79IILrU2MgmTJsHsclsMy6+loZ+CTs399iTffwFl9fGjGqHlNnUCPNii3IbnC60jmiHM+BLgyPHZgVVo5wZBNbWVzl5esz2xZw92zrcd+fG+uHWRMY4PfD65qFDHDx8kvMnK3bv3MqN1+1j69aSLZs3HtPMNBiquDjR4KSJO1aNFG5aYxKdamMQ63ztat4GqQRjAReeN6OzWy6lI3e5MaWOSwpYMN1EhJRZJXUp1Gg8VxKJTlBFjy2bYHvqCO0ah2gdM6vgE/PMTFUsROaCS6ozxUAltDYdrZVHC1PFx8bgHhKTr20DEN/WwGYU+FZ9fcP7qGCDkjuHCkysUisRkQlmSotvIbLxWFnHYq/Yz64HvwA3PYh09l0W/nvr9FO88s5POLt2kKyvSC7UlcOagjzrEByQRYksCVmsFKlNNV0l2Oi/55kghaFqJixmmxFnadYart91G3fsf5DtC/v5cHmFH/zwGYbjQFVNKMuFlFVGRMF0iigrV5Z4MQRvYkuJTdf0BXMppH8xwTbT+WWCEnyNG41x4xESIuYlRhF8m6QBlqAmurCbGmsct956LTffeM1l5+Ava/zagtUt13Xk33zjNX3plbc5u1bH7nUXVcaRLOpoJQiksJZKBG1qquGAvNfBdjpkVnBJ7TtIClCk3gBtm1gD6j1WI/+nVocSje1MdxN5XTE5O2ax08Fpg28qyjwnzzfxyksn+PnPj3DfQ/cxqM7yweFnGftlepsitGczwYeKzBRM2UYiUypT0ECQQJEXjMdjyrxDUeaMJ0PQhk5eoAZeffeHlPkWxnpSu5fpvZofB949wsuvvEHdpFBtZuywIrF0fIi1NacNcHHW34Xj8g3CH//7YhJOFwY0IcOHGYzn/ISu8ezcssCVOzZ/7DMcWVH9mx+9TuMFDYYQ6iiWm97vwn+thcq8sPBsBKyNTaNYg5EMawzaeFYHjsH6gHqirK69wb/73nt643U7ue/6pekL7FyIjcYfDSY6OjNm26bN7Nh28YiwuGDYub3Huh8yCUMIOVDgfVTCmFqST59u0qaCqcSNMINq2mzLGhu/Bxd8dwQrZqqyEdUGLsUEjO8HcWff2moI05Unfp4IZEQeWHI8FTw0EOnoGUazlCVA4ypsFuI58h4NJN04UiNvrJvMYLDEzgsxELYplSTIb+Zn1QaiGHzmMyszV3uJ32kWpDb2WRFhzNTK4g1xcQ0G6wTrFeNju0FW9Dk98lSbdnLto19GHvgCsvmmy16L7554nmfe+B6nVg8RsiqKEDvBuUDe6dApuoyrYQoWmiyNDJY8xei4dmW5MKocWVZggkW80AwDW4qdPPbAV9i15QbqSZcnnniC9z44xSRkODVsWtjMcDxBkOgh1+8hnQ7eWlxI8Ki2/YLxOMf/NXFeZM6mxEUdSwGcw43HuNEIqRyFxhxqqgtqAImO6SFB76qOXTuXuOvO69m/61efVcGvMVgB3Hvvzdx445WsvHI4Kk+HWY9B7O9xBPVYDx2j1N4xHq5hypyuNdi8xAWXtOZCugihVZkAYvAIHpsJag1OA7UGCmsxnS4dt5kwGFG7BqNx56sC3f4W1tdW+fY3n+e22/+APdsf4Ny5M5wfjfF+Fa8D8rJLCB5pD5skuSVtFTbiMJpjrQNpouijUYKCN4opao4sv8bCoW30yk8v+Hj23BmWl5fxuhCVFdTgtInLnbWxWz0t4rNSx6+nZrXhfqIVuw+BTKLWmavHdBczrty+xFUXqVedPDfgyPEzODX4xmGEmWrIRf61bMW2CXd+QS9EyMWTqSNy6RxF2SUrO9AEtC44enZMHfqsrq9z8KPT/Psfvqm33ryXnbu67LYdOadet4n9xAvw6s25PPPOCfX2BO+fXGU8NiCLVEmt32KTSoCdLapIqrFODxjQZpEbm2njYy60lGifONfhd4lzJbJNJif/apZ8hLavhpj9iSBhTt4oHV8NibghoL4heJfmHKhWEfYLMVC1bL7WX2q6gWu/jm68H21rVCn2zDXotseHMPN6apUuBKYwV0tf38AyTP1as2AHwWegGaYxWAfGJYp2I9S2wOy4ku13PEr5wFdgx7WXPdcHRi/qd576H3jpwA+pzQDbyahDg4jB2EDjJpS2xzSQ4lEtsAmCNSbKaIX0NUwWnaqLrCAMoZ9t4q6bHuT+Wx5l/8JN8uMXP9QfPvEiozpn7Bp65QJrgyF17cgWSmyvS77Qh6KgUcWFWLPPxCbB2TSXjNAy/6anAyIJBYM1Qmhq6sEAPxhivMMEsITEFiUmBmIgZCAB19Qs9A0PPnAbd955/WWP2y9z/MpU1y82brmmkLvuuoHCOqy4VJhVjNqEpXvUO0JS+bUa8KMR1XCAryaxbuU90lJCL/hH2qHRRFqrlWhZ71C8MUheYIsuvcUlXPDY3GILYTAeUjeehaXdnDrheO2V8xh3FVuWbmBp8UqKooMPAZs7kAoxTUyRJRJERLL4u4kXfF07CluieEaTIWosedmnUWXcjPBmnY9Ov8HBY89z0r926ZV/bmzbtsTS5j5VNWw5Y0nsM8oFqSouOs5tIH5cLrDMjwtrVvMurZezFLnYP8HiQ4Rfgjp8E72Zti/1uHH3xpX13Fh1eXXE2dURXtLzLjIt22AEbHDXdc5R1zV1XUcSjg+EUUPpoGeEjgVDhZgazTwhF4qFPiM1rDSW5YnhjUNn+LsnX+apVw7yQeP1F7ksHrp5j1y7ewuFOJrhkHo4wTuoAzRTJQqTpJEMPsTb2uk6PW7B0SqSt2QR72cWL63nU+v4ulFk5dLZlVEz9W6amhkG4jWXVk7RFiKLASAEwUqGkSxmPskh1hrFCkhKDZOoSzRcJAMfveBMa/MxfX+m/VdT9XON3zXac8iG63fKCpz/aiFCf2Zag0sBNiS3gfQaXiM3MihYZygai3UG8YLxoN6ips/ZuqS49g62ffZrsOs6LmX7AXBaj+iBYy9y4OjzDPxJnEzIihw0I886WGuZTEY0vk4QaPSMisduBvG23njee4qiBM2wlFAVbFu4grtveoitvas4fs7r9//+WU6fGVM3Gb3F7UjewSnknS5i8yRC3IUsp9Hkch3zoek8IsyYmLPrM9WrggP1kSnaNPjJEN+Msd5j2uw0lV0gXnOxhzjgfMVCv+D++2/n/v2/Gh3Ai41fa2Z18nylH51Y5+fPvM6Lr36IsUsYNVT1hLwwjCdjFvs9xBEPcHA432CGI5rekMJmqZCeJeZQhFFCCKjzZGLIMoOxOc4FnPHEBgIbpew1kJU5tteFqk+zvgwa6C6UKIaqdhi7xHf/9jVuuuHrXHPFg4wOHeHo2ddY2AzW1HhRTBaLyrFZ04IxqDYp2EbKsfeKStSMC8FQNwGRPFHhA+eHR3nl7ScglJx17+j27OJCme245ppdfO6z9/LX3/kZa1WDlT4qJY13uMoBFmM9nugueuECtkGssoWnLoD+pllWMBd93vS2CwgQG2pLBnzrR0ZUP+93c6rRKtu3LHzstUIGx8+ssjaqqUQxWYKRiIohxkiSiwFJdSwjNm4PZQYHTj+nVzrSwTgwNqDiCKYGGmyRkRUGtMCpYtXQaJe6jqy+0YEhR0+8zQ3XXMGhVdV9S58O3rhy1zau2LbM2tExfgyrw8gKK4potJgVljzPgRhcRTQxBAPWxgVGfcx0srylqc8gTnOJ4G2NoWnGU7O+iw1jTPRc0xDVGhPRAlr0WlK/bKtKIgTf2uGkxyH4ZAQobWYYIueWZGDopoaJkS0GLUQn08xJIF630wwroQBT9fXpt5trHDbToBSdl+NrSKuqnoLttN9KYETABCF3BqvRd4lG0cbg6LCqXXbe9Qj9z3wF9tyAmCsue56ff/cJnnjurzg7/BDNx5DlVK7BSElTx+y0KAp8mCDGJZUdi6R5GqZZchzaCHnZoalqup1NdBe2c9fNj/CZm77MeNzlyZ+8ylNPvU41yTAmZ9wIZVEwbsYsdroUvR5Zv483GY3zOAw2zRfvPLlNJJeWDUjaKJBkuFXJjSUHQl0zWV9jvL6OTioyEawIzjVxrZLkNJyIGM7XbNlUsGNrn9tu/vXUqtrxa82sdm8pZe+uzdxyyzVsXspRP6HMDbm1ZFlGt9tlMpkkDDuQi42eLt7RjMdoVZGrJqzcpUI2ibXS9ly0/lcS3WM1m+kGSmwOJMuRsoQioyYw8ZOYlQCiHU4er/nmXz6N8XvYs+N2dm2/AQ2dOBkCiHG0Xk2Rzmlmh9JoQqsMotHmW4MleIN34H1sNA1SsVod5aOTL/HR2ZdZ14OXTYFuumJRbr/1Oh5+6C4KW1OPVzFB6ZZdRGMtIy+E0XiVy+20LzUulYF9Eux34XPjrnrmQeZ9zEK3btnEtqX+x567PoS1UUPj0oIjsvHCns+cL/j74gxGE20r1IImFXBtq5kNQWo0q5GiwZSCdIqotdZ0OL9mOXEm8OyLh3jquYMcOf8xLYqLjtuu3iT33nET1+3ehYwmqG9omobxeMz6+jrnz59nZWWFahJZYDEzjNm4+qSoIBJtGFImS8oYZn5usVZzYf3OmNh7ePnzI9PMo1UbjzWmBLH5qCpPIlvE+lHM/kKYz6xTNhjaGlIOZKja1KxrpgGuNVOMgUan5AppoftWkDplXiYFuqlXVZIImgUqpRXE3fh3yl7Sh9NgwfYI0olmj1WDDQZrOngWWXF9iqvuoH/LZ7D7bid0Lm9V88r5J/Xld37CqbVDSNngTU2QqDYfr+0sHQeDSgPSpCwyzTkh9rNJ2oSpYCXHDZW+3cz6mZortt3Ilz/3T6i0g4Qlnvr5a5w9O6KuhMbnIBnB5GS9HhTFNKOK6uezLLtdD+dt7GfZVaup6iFEDzJcQ1ON8VUVG3yJDGfn6g3XWPA6dVQXqdiy1OELj93P7u2Ln+by+KWNX2tmBXDltkyeeOGIvvL6Oxw7eYiuyfEBwsTR6RR4cTPDPGPIjcHVjmp9SJ4X9MqSQNq5m4RxY6e7Qu+TmoUCJO0biY2knmj2SFGQ9fq4ZoTTCuc9hTQUJmC0JLgF3nj9BEc+upmHv/gH1K8d48jpVUJzmn6vSn5RHj/VJkrBKrGp4m0WtCA6zc6U4yNd1GIyw3hyjoMnXqDb7ZLlwjk9qNvk0s2I993Ql6ffGeip0+d448BxxsN1unYroQk0WtHp5tgswYB66QXs0wafy9HdL/l3KqxHVZHoWkzm2Lt7Lzt3fLxedWa55uz5AU2Ii3WsQbbnVdjQhBzkgvfe+Bni5/S4tIBHOLGMzZmpH0glEEIVYUSJtRibGULICM4wCcJaVeGbE+y7+tNfjLu399m1qeCwjpmMA80ExGTkeY4tSurgcXWDjAy9Tpnmt0LwiBGsTdnhHBMuBI1Q9obA/IvtL9sFi5TliARCyqRS5IlsPqIWJiKoT5BSiIvXPIEBUiAC1M839caajCRB2Kl6hbYsvvTdpuoWbSBjQ21r/jnT9w3x80rL5AvE3qW5zGzqLE6GDzmhCRitKDIDtVI1hirfSrP1SrY/9AfYex6FLVdhL2HdA/Bu9Yx+/2d/yTtHXmStOYe1DsmikLGk4xDrgDFrxrg4pzSHtmlfYnYfZY3ABItVSzdbgEmHPZuv5Cuf/cfsz+6Uj1ZW9Rt/8Xe8+sYHODJs1gGT0wRwPkREqCyx/S6a54RUzzNzwHW7zkSh73aDl4AIJTKug4toRdNQDYc0yWDRaLxiGl8jthXWjddhcB6RBqsTrr36Sv7ga49y9ZaPS6b9KsevNbNqxz13Xsltt15Hr2sgVJSZpWnibtTaSPNslYpjD4DHj8c04zG+mmA1xF1ACHGnoDMNgBaXne0qBKtgvEaJSAmozTC9BfKFJbToE0zSNZOYpZVFD1fn/PgHr3P2RMm2TXeR6dU0k0VEe8QYP+tVAaYqxnGDmGAQLBLyyPiZ4vjRX8taiy0a1uuTvHv4WV565wmOnn+HgZ6+bCS54do+X/38Pey/agsmjMHXlDZHVGlcRVFeuLjNH5dL/7vYuNTjLvdT0/mIu8t2l+bZvn0r1+7NNtaratVT51ZZXh3NmTpePGP6tP+CKAGHExdrlRq1/zTp/8WdcDQA9aEhuEjzz7II5WR5QX9piXGAY+fXODr+dNnVpgXYd80O7r11H9ddsYW92xbYXIL1Y5rhecZry0wGqzSTIePRANdEhYAoeNpubgzBzwKvScSMaS2wrUVsOEaf/PFm2VqInkYh9s6gs7pKbCTVpIjSGhtqvLRS1iIhohUEQV2igadAJUFjTTl9zvmdfWuXLhuyuzZQzdeb2+8pXGzOxX8xkG7YLLX3BTBeoBGCU4ItoOgz8jnLviDsup5dD3+N/O7HkN33yuXqVMf1fX3mte/z3Fs/pDZrZF0YNQ2ZLSMBxc9v5OLvLcMTzTAhGmR6owSreNPWGg156ODXBNYLHrv3a9x8xQPRKeDoiG99+8esDx3dhc1ktqRdoivXYMoO+aZFpCgJNkLjMSNOcyKtb57oadeKH5MyqtYYNUOxwUcIcDhgMh4mnkCI9UlJjfzGgMkwJoulBT+mkzvuvO1a7rlu8dcaqOA3kFlB7Gn5y++/om+89SFvv3sSFaVblLi6Jkgg7+TRP8h7bOsnFQJ+XFEPRvTyLj41/wcX+wCSe1LcOSeNi4iJJxM7iYoWAagxUfKks4R0JwiJtBE8hBqMYEzJO2+e5pt/8Rz/yb98lOrqCYdPWdZGb1N0ajT1Mmly/IyOwlErMDklJNZXTBVmih1xbjWhweSezoIwqE/xzpHnKRd2snXLFkZ6RHtycdfW7R2R4wPV4yev4/z5IecGI4peh0BB1QzxBtrTemEQuhhN/cLbL0ZNv9xzL8ywSLvxWZakWCts3vzxvrJRBafPrbMyGCMmj60Iwc0EM6e+522RerZTjO93YRYYd5Peuui7o2lOaFJG83EhyfISoUZChDtCyrglwTWNdwRtOHL6HB8c/3id7WJjayZycqy6e/fVeLmaw8dGvPvBhxw/cYq1YUOtgnMeHyrGVQ5+AenHmqYnJjiZmIhayoyO3zZytsf6k7LiC8cUhkuqD4Eo/oy2VPl4QIXI0lOJGztoaeSz4NP2KLWBLE5ygQSho2EqSCvaXqDx/LVswA1NwWGO0ZcyJJjLulL29zHKvUI0aZxlYtpCjEHpOEeQjIkVBk6ozSZk73Vsuv8LlA99FbZdcdljdlzf16ff+j7PvvYE5ycnKJcAA1YLfMiiH5daVP20hhfrrIaAJQupBGA0ogsmbaaDpdCMLZ3trK/W3Ln/QR689Qu4SY/RCP7qr3/M2kgYeyXPYNLUBBNV1dV7bKeg2NSn1hDZxT4dGxMzZk3zJ6RN8/TyYc47TpKosnO4cYWvatQ1ab1KE9F6tHUPMFnaxHjKrrJrV58H773pF5qDv6zxGwlWAPfcfTOfefcoB947xvmV8yxs2ob6LOmfmchCCYHMGGyIMjShamgGI3yvD3mGybIIvfsAyXE4Cq766Y7Cto2DEgjGoRKVBjx5bO/qbEZ8TajHsYCcJkK/12WwPuHl547zlS91eeD+P2X47EnWh6dBl4E67mQAkhyJp5WySQ2LbeMJRN8fsQQJQEPd1Bjr6fT7+MKwNjjFB8eeo9/t8ugNX2eip7UjOy8asPYuiLx8aFmPnljhmRcOMlhfISsXomx/cgO9kAQBF4f3LqZQcbFg9osskkYkGsKJUJYlmzd32bxl6WOPG47gzPlVRuMaa6PmnqgHsrngc7HvsDG4brhf0qKIJE2zducQMxhRqCc1uSXWjQggrQCq4oIDI3gsJ84Oee3dj3j52Jrec8XFhYUBPpzUOlobU9Wwb/PsA52cqB786FrePHCQj46dYX3iaID18ZCmaaiqhk6/R5F3yDKD5JY8LwgpiDKtTbUQzuw720SwsGa+r+ZiY57JGUkdU82+dIinaESCsWNdyc8ep8nO3Me6GT5FJEyaa+m12ygUopRPmym1BpLM2qyY+UrpLDOaReXp+W2DlrZY1pwm4AwmbDOrgPVKGQSMYVAZlhtDsf1K9t7/BTr3PQy7rkDspRlsa3panzn8BD98+tscPfcB3a05q9VZvAQW+lsYDypKU4JP2ydtYglCAkEMmXaQkKeNa8BL2JBVaYDh6oRrtt/I17/0J9zQv1MA/vs/f0F/+OMXqH2JtxbvG0IIWJORZTmUBSbP8EJsdFYwGgOPaKTuO+On8z8hhBFV0vaKCUiIG8mmqqgmI0JTIxCZ2Wnjhni8Cl4LTFsnVGXXri089MD13PprJla04zcWrPbv6Mjf/uyw/vQnL3P+/OGpBXNelPjQRNVimE7WTIXgA/V4wngwhF4XI7GpOO2npzuDILEl36R+DCuxWdegcReLIRo152RlQN0ksvhcQ2bA64jaA/QYrRu+/dcvsm3HY+zcchdrww9Zq14FGQKKajMNVjrdado0YSrixZXF60/jzkeoMbYBkvRJZrGl5+zwAK+/H9jc2cHNex+77PG75qolHnvkHqq65OU3jzFsGmyZ4VNaFxePi1+Tn9RT9YsGrwszMyuKbxwhCJs2ddm1eydbt348Q1kfNSyfX2dc1ZTdRVpDRysylXdhFpsu+Zk3/N7qIxqTapUNkV4aMBIVBXzTYLREsmJKRrPWEIyiGDp5AUGYVGMOHlxjgSMcWVa9auvGA7WsqieXHW+8fYIzx0+za/NmPjrt9eqdsUfLVrB/b4/919zO8jq89OYJXn3rAAsLW1kZ1UwmVWT+dSyNDzROKTVDolAQWWr1siloXSR0b2RCXnivLmt94oezc6gpu0psvZalZnwMOKEVQPUuZi6q0+DWwnMoEUpsNWTUM99r2GZqTCG7GaSHttT1WdBqYUFtn8csSJlUt2pLbpJSQZ2HCwMzBQ4N2OAxXgmNJzdbWNqxn+59X2Dhoc/BlfsQuXSgOq/H9O0TL/DUc49z7Oy7ONPgsbjQoEYj21cFfBkDLhNEKrxpImSmJarF7HNbYs0qpTgaUr3PWe69/UH27YgZytsHJ/pf/p//a0T6UQS7KHCNpyiKiAhkGXm/S51bRs5FqbVI7WqxGnxiSgYTLUdMMB/brtq2X815qvGEajQm+IainUMx3U0b6tgOEIiksE6Wcf11V/MHv/d5rtja/bVDgPAbDFYA1193BXfffTMnT60zGil105AVJY2PmKkxJvkq+rTz9Xgv1KMhhTWYIo+xgDjZvcSFumXHCDPfKwma6rGKZFHqyRhBbIn4HqGeEHyEEcvcsr4+ZOviVXjnePnlQ+z9zgL/4r/4HCZf4fnXj6CmQqmAJhIoBNA8iri2BWhtgIboQhpJGEEbkJCorlBNGkzWYPIc59c5vfoeT730bRZ72xjrWe1eAlffmlayp95yOhz/hLffP0rwQu0D1vaSu8Jl4L50AcVdl50WjKe1OJn5m34smMVnzv5Ou+wYxAJqYjO28YGFss/upU1s/jgRkOHEMRxVNLWn6NspDBTfNElqmfa2GL5ImnsXG9OFO8T+ILEx3zXqI2SIQ5BYm7IFIpbaRXhYCdgsMtiaxtM4EOmxMh5z+Pgyq4ONDMvj51XfeG/IoeNn+PDICc6eOcOWzlnOLg/56bNHdM/u7dgcdvRElmvV7Uvw2H17uO2mPRw4dJzDx05z/PQqTivECU1jGKthMslZWOyCGrwQz5No1GJrz0PseI3QTkir4iVGhOM0QVeJ7u3b1IY4L1vdPhPPH8FEWnp7ewvDXSAgG495guBIN5Mo8YntN6uZpOCXNnakDLmVTWvz6Ng7GOtPKoJXE+vXGpUyTPAYl+afF3wwyZYkBkwXwOfCamWo+3vZedsXKB/8I7jypssGKoD3z7zLN57497x1+GnKzdFRemWwQnehS5DAcDiksH1ajeK5JD9+Zww2mLhZJqAmpCltsD4jb0rKps8X7/saX/zMH7IkV8rZgep/9V/9OYcOnUTzLZhMaNTTqGJshvMeo4GFXhefGZoQ4T5hTr0lCG3UttNMqP1MaTOmcz99g68mhMkEG5RMDEYiRBx30xlqctJRRkJDYQPXXrGDLz5wzW8kUMFvOFgt9ZR/9Eef570DH/LMc++yafFKVodjym5OIOreKQG1Ei3uUyZTj0YUnZLSQcgE1NPMechkiTZrqWO9SDXRgvMUsCowDY54X9HtkslWwmDMeDwihJrOwhKjZkxhhKbxvPj8Ozz8ueu59vrHOHjwDT44tkZ/S05eTPABRlVNVi7i6mRzkhTkkeikipnBN6oZ3glKRmYTfIlLPVgVJ4av8PSBvyK7o8NQT2v/EnAgwKO3ZvKTV8/oNx8/zxtvv0e/3MLYC2L6iLVx4W0ayrIkL0ucq+MmUFsH4BjcjRRIIAaZLNAi8MAMjZtzBp4PGiqWWPSOC0xNwAVPNxgWxHLX/qu45oKepTNe9VvfPcDaesPCpi1MqorMdimKDO+T9YqkmqOJ3f5CuwOMC1MbyFr2aNuLhTZp4YyZmko+97lj75Z3dWwvkCT8mTIKIzGDF5HYx2ILGiOsTUYbjvvPXj3IW0dXWR47xmOP6ezinMDy4REvfzBk1/Z1bty3h9ePqzYBdnU2fv+DZ4d64NAJ3ju8zLFzA9ZqC9LFSc7q+YYsF0JPyMRjM0+R5ZCYpaIe8Z4sA9M0aHOp4L1V/PG/UWoBB9ZkaKgjEpAcEYUoQRTrPhZEYo/gNB61dSEzi0ZiaYuvmmjusWUg9TXO0dZJwW5GpIiLqWGmuq4JLRcE8UoeBA2WyuQ0LdlKHMZV2KCYOrW/BovzhjoFS1AaI3wUAm7bley+82uUD/0Jcs19n7jAvnz+Gf3uq9/g7eXXMAsO58eIcXRMhm88XmJPnNeKYMGoYFURLYBosRLPQk3egUE1Yn1Ss7htO6HJ8GvKnt7VbC538pV7/pjd9nYB+Otv/ZyfPvcWjelF0orJCGqQLKNGyPodsn6XmtgWkpuYsapAE2YQq4hgQ5bYgQFrwUtUdg8CWMF6CN4xXF3Fj8eUquQYbCtU124OJDEtvbLYz1gfDbjq6s18/qE7Pukw/krHbzRY7VnK5eh51dtvuY533joM4unkOcFHvyK1gBGiDl5cpIxqVGqfNPi8QroSszBi/xJEzNYkvx3ROWRiCuR6WufQQDRNFcnwWYFmDZO6ppvHulm/06UIPQ4fOcmf/9sf8J//F1/hvjv/IWIcHxz7Kd3NGZUbEoLHWsvY1eQmR0Vjr89MK4aWKBDI0sLfEiESpk2IdPgy8P6RlyjMJuztsK4f6qJce8kL7sZrt/Klz95GkdW8e/AMqjnrkwEYS6fsU2axHtRUUenBZjGrtES6eNy5ukhmkWj2F8kh7b63HdNciwhBMYWLQtqpa4KTPEq/LNiy0GP31h4XjpXRiOW1IcORwxlBJJpIOhfIWgFNZFrAnunZMeurm/9kOiOHyLS7VNK/SxV1Zq+g2n56EB/VI2oToqJG6mdpx1vHvX73Z69zYnnEOGQ03mLVTN+rV/Y4vFxxev0DDh4t2X/FJl4+dF6v2rnE9n6MsNdtj8aQ7552+v5H5zl8YoWjZ1c5d36ZTneJ8bDB14Gsa8g7UaTUmBz1RSSDKDSTCsNkngz7sdGKtxqfMhZNPxO3XANoCNFaon3SBYK3sbYUpjAcpAWyrRmlGpLRyF7MNFl1tAc2zMF9zPRJ2ldrZ1kL+QcfiQohWbMrilGHqkQdQwXI0WDwTojF52i2utoI1Y69bLv9Cyze/1XkhssHqnFY1mOTI3zrZ3/Jj157HOkMyEMV9Q4JiYKfdEglsYZxaUG3WEg9fZG5jDjGdU3WtWwrtzNYr+lnC1jpkI37/NN//J+xazGKKD/53An9X/7937E6aPD0KIqSybiOG3BrMHmBlAWSFxHWJiXEqqk2FVcx1TTztN2Yx3OanLSm14ULDVpVuCb2VRFC1Jk0sbUgIARjQSIyJAKT8SrX79vN1//gIfbv+9XbgFxu/EaDFcCVW0R+9MJZfeutD3nplUNk+RJNwrrR6K8zI0wYEMESqKsJYgfkVjBlOet4F0nSIxGjVWbFaZH4EiZIW+Ga7SDFIibD5CXqXCqQThiOB3RyJS+6PPv0m1xx1Wb+5b/6ArfeeJ4jJ97Bcp5eJ7BerVBNVsgzS8Iuo2gpMShJsrqe7lKJWWA7VNr+FAN0OL+6zDuHfsRST8j3CQM9oguXYAjuWYqQ4Ivvr+qLr3/AD376WlRRdpZMM7yPcJfJcvqdLvEKi6aNqpr8aUK0tVCDhHyOewctNGim0FGrQZgCCS0xAtRG+rMEpcgtmzf1WLwIoW7l/JDlc+sMRhNsN8OWNnqa+YAVnb7u9CTNDWMuvv5cjEDS3h5v21hbm6dFt/e3dZsQAi7EDK7MSrJsBrXVtWMwGjIej9FigSzLItwSIt6/Mlojt0LjlPHpFU6dW+bw8U3cvP8KDpxWXerDrmQ1ctPOTM451Vtv2M77B0/y9nuHOLtyhqxRlIIs9KkGhvW1BskKrJRMJg0+WNS6mCVz6WgV9fuSAgiJvp7gqyCxLiGtSHxit05ZeenYtI4irQqSTG+IWZckWC+k6zaEiwUzUu8PtIrf01pVyrAI0Xe7SfJhRhuK4MjTNerVUNHBFyX12KN1iK0uYqlVcaZL3d3G3rv+mE33fBmuvuWSxwWg0bN6fPIeT770OC+8+Tjj8RH6ndhHFUNtbFFRjYxfI1FAu1XMiHW5BJ0rqe9SUZtRTzymaliQBcL5wPbeDv7gsX/MLfvupy/b5L2jQ/1v/vtv8PIb7+BDmb5/LCEEApJl2DwnK4uIKkkUoA0RPpgrDbYICWjyqJIUrLyGyGzGoN7jqwl+NMJVE4z3ZEpcl9rNhFhEom5gZoTgJ9R+xE033c7Xfv/zXHtFdvEL79c0fuPBCuCL92+X/+t//QN9/bV3yKxDpaAJJlLQA9PJb42S20hWcFUNMsGWHWxeTD1c2h6MFC+mzYnpR6TNyuzCgXgRGgFyi6GLFcNobYV+11LXA9zYs2vHVnzj+PEPXufGG6/l/kfu5vabv8hbHzwOnRGFzRhVA7rdBZq6bQxuF858buVvsz+9xO8W52sWNuU4Pc+bH/wM6i7lbSWNntb8MpDgfdcvyftnVDcvbeH1tw7z7ruHOL+6gvM5uSlBBVd5yAw+Sf+3kDcIwYQoD1XpzGo9uQMDM6HcFq9vA356/5a6bozQySx5JmzftuljBAmAlZUR68NJ1KFTE6sXSUDOyIUZ3WzMswFnf3/8MZdjOV5WOV6j1UvLLssEet0OZZlPH2tsdD4G6HQ65KlB0/mAGsGrx/uGxge85hiE42uBtTdP8MaBk1x/zRW8+KHqnp2wtyeybc4y5eCZgZ473/DWgSO8f/gE66sVTrsE0wdb00gkPATf4ENNsWgp85xLjbbHKvZVtfuoRAdK/U/Tx8Td0oa9Qbtr38jWg7jZmu+DalXTSTYW8XHzz2trm20Ak/a+9nU0bhacxNc2wU2lLiNXKiOEmAHUQclzi+Qlq5PAWmPYvHc/V97yWToP/QfIvntjYre+rLL48cbfgZ7Vo/VBfvba93jylccZNcfZsTN51ZGlYBV1HI22bFEiqav9/sRrx7RfNtHXbZbTrI/Jg9DrLBKajLv3P8iX7v4j+rJbTg69fvPbP+O5F99kMA70+wtUE6gmdfSlsoA12DxDbKxdRrQioiCaFrQLp348vgpq8aGJzE6xcXPhHb6qaMYj1DXRsdjYaQ0x9jm28l4eq4oLI7Ztzrnpxr3cfuNvNlDBb0mwAnjogdt54bkXeevd42iwMTtSwdgs7gzUY41gManHwBHqiqaaYDoFmuRr0j4vevW0QYhZPdlClGFh7p9GfNfY2LxrsFR+ha4ROr0SN5lw5twKS93dVMN1vvONl9m588vcedPXOH7yPU4sP43pBHplTvCjiOmTpH4wtN3s6ZMQFbr8tCbUTj4Arw0Q2XE0hnOrJ3nb/4gi9/j9nome0o7suuTEuX5HXPjePBb0nXeu5rU3D/LeweOsrFc0QRk5xZgyXorWgLUYAeeVoIbgXTLBnL2FnVaRZbbIzX+jaeE//e6UTpGzaSHj2mt2YS+o/59zqt//2TtMJoo1ZTwmGmFbkwrS8VySAuWFgaWtUGwkPczun+H487e1f7eL6Qw2nMu4aKWGYg0rs7DQL+mUs0tlWNWMqxoXPB2JhA1jDB7B5BlVPaRpAk0d62gTNdS1sDL2aDPhzOpBPjxxlv1X7uC1I153bTPs6sUPcd2OBQH44NhEr9y1nWNn1jlyesTplSGTcUWdMlajEzodZfeOJXZdRBlkfoQQGV1t35RJbEtEkqtuyhIS3Co6fzxSM7u2dAimmoIyzS7a+yX1ZMlGBYsUoEzb0OvnUjWd1a4iUq6AS83+JtXobBL/jQaDrhokibaCofes0kF3Xs3me75G56F/gFx17/TEXyxQAZxujvHDF77DT176W9aqj5BOk8hOOUEt2irlp7lvUoBq15UwJxYduzpTdikG3wT65WaWZDNhRXj45sf4w8f+hAW5UgB++rM3+N4Pn2V5vaYsN+OCgLGxTm+ELC/RIkezyHT2GpI+n4mQ3ezMpp8tRJg2DjK7RmJ9U/F1RZhM0GaCVcgk1YJDClSaUCCFXAQNYzqdwH33Xc+9991w2fn16xq/FcFqeaC6dUHkf/mzn+t77//P1JWh9iXGSBKvzaMEjI96gEYEa+JuI9QV9aQCEYzEOtd0A7gRywISJBhas8f0uBYWMYLPLGFcs2lpC7U/R9WMWOx1WDs7oF9kWLuZw4fW+fY3nuOf/6sHePTB/4AX3/K89+GPEalR62O9xXjQqMwc1QmyBL3pXGLQTrb2QxqsKLYDjV+D0KHsdRg0J3jpnR/RuILP3vPpJIBuuyIu+weOB33jnY84fPQch48tc+T4GU6vrOE9BGOxnQ7GFmiIMI56FzOL9NkkFV3jjgs07dSCpHrIdMTanBCox2M2FSW7d2ziyiu77LiAXHF+pebkyRXGkwab5ZG+rVHhObepzkeSq5lV+mfv1FKv5eL0/PmsqQ1GFwtcF/4USfBw0uQL2lBkhk29kl4xe/1J43BpERYTCQ8RtsxiW6g6yk6JdjKqiaeqHM6DGEvWzRip8v7Rs5w8c5Ijx5bYd9U2XvtoVXdt6bNrMe5g918RpWxOVarvHhxz4KNjHD2xzNlzq6yvr3PVnp3cduO13HTtbq7ffQlcNH7ZqXK7SSrnvtW0kggTTuG8ZBypbSUpNQG3mRDolPVG8qNqT89UKT3MYIx4f/u81jU5Pn5qvJigwJgUxA8kqcnYqUF8Dj6L9hfp9Y3EfrhzI2VgCsqrbuOq+75KedsXNwSqS40P3Rv6vWe+yU9e/i4rk5OYMvpzxXll59aN+fk9C9SiYSZvJJEdMg1dKjSV0C96+AFcv/NmvvrIP+TaTffLuUmtx07V/L//m3/PgfdPYm0fYwrW1id0+wtIp6AKjrzTI+Sx/cKjsa1NADNPMZ/N5SliwPxmLP5lAuBqQjWGaozxnlyELMkotOUWY2ZqKcE34Edcc812vvj5B7jjjqs/6ZD+WsZvRbDauhBXkgfvv5W77rqBn710HD8xSQ4nGYG18jBxq0aeGmxdUxPGIzKbZEHawjHMXQQbIUCTOvVFZNpoGST2s0RFf8PipiXOnz/HpK4py5LOYp9JXZNpRlks8fwzh9lzxSJ/+s/v5t7bhpxfPsXK6D1MJ6C2Qol06dgNoSgzcdfoJeSn6V674yQpcIhtaDR55RQlxlvOr5/h3aNP0Vvoclpf0EX20f0EKi7AjXvjQna2Vn31rTWef+kt3nj3A1bWa1ZHNa6B0CgWS2YzsqLAu1HCvts6T0ubjru6NtAHSeK/MlvIhEAmgQzPnl2b2XQRyvrZcwNOnlxjMHKYrAPWglGMD1FRnY2Z0AaTS+aCVfosYsJUSV5EppJF2n62ts/lwiyqzbov6BNrNV6NKJ3cstgrKVOwOjNWfem9VTAZWUny1PKY1Ljum8CWbg9XV9RNhVhDf6mP2IzReMxwOERyQXPDqoN3jy9z+NQ5tm3uceP+q3n7pOquRdiaalq7SpHTQfXa66/nyIkzvP/eIU6daLjrtn3cfuMVXNG/RJNVO1rrj0S3ntblRNOGI27e0gGIsHAqgZm55tu2MbeFf422G4lW/XwG0epsas89LxKMpJVyanUA51QoJMwFRIWgGSEUmJDHRdZXIB6HMlJD1d1G76q72Hv/1ynv/hKy7ZbLHouBHtPz4SQ/fPGb/OSlb3N87QgLWwvqaoxoyUKny6iaIFPlf5nLIucy9XZRITDb1oFKVLbIQgcmBbsWr+Irn/06N+y9O86dMw1//hff4+13juJcRicvMZphpabxHtvvEFxAC4ntH20QbAN/guE1zVXTMjSnNcuYHWmIuKkAEhy+rnGjEaFpyFRiv5XEDUbcYyRRZJEIH7qaftfyyEN38uCDt7Djk+bYr2n8VgSrdmzdUvIHv/cY7xz6DrIujIY+Xjk+XnCZychstDyIbQACriHUVRRiDGXE80k9VRpbSmKvFbMdX3sBmvga7UalXRPzTsbEO9QWbNqynfF4QE5G3YzZ1N2MD4KVTfzkR29z863XsP/WG7n2ikd478OKifsIEQ+p6XfmKpd+XgK6ErFIyFBxTKoRZS+6ClduTGF7lH3L+ckxnn/ze0zGjrtv+v1f6NhuT7bt759VffjkbRw6epJ3PzjC0aPLnF2eMBiO8I1DfIExkS0Wg/mMuzU1vWwXd2l/9XPfK7DQyelmsGv7Ihdzr1hfbzi/OqGqG/JulJMxRnGBSFlv+3nSmP52ASGivV3mb1P92N8fA/cvMeYljkSETKDMlF5h2VXGOxUYTCbR7C49xhowVqKLqhhGg3X6ZUHZK6hDoGrGuGAoi4yiXGQymeDIaRwE1ehzthJYfuM4b79/juu2b+ONg6q3Xxff0wpcncffj1ZrOh403LAtblSWh6pbL7OYtL5KU/wqUcYTV5yAYPwcwURmgrEtYWJ+xRS98L45CaiWmBFi7Saeq5AYuZKCnyQlB0mXxUxJPb6yzHhHIe7pjAuJBBKVZ847z2RxJ70bP8MVD/4BctPnkC03XnZBneg5/Wj4Ns+9+SO+98w3WddVTMezOhpQSE5mYFw5UJskDz2xepM2y7SHL7bTiIbE+GV6f1CD9TmF9ujLZr78yB9x162PkKdeyZ89/SY/+unzjCYZ3c4mmnGgs5CxuLjIufGAwhZQ5nhp3Xzn0J+0wQbAtHW/jfJboYWx05VhIeqqNjWalNVN2weagrALiti4MRMBqx4xji2bSh6871buuObSQr+/7vFbFax2bu3KyfOqP3vhEH/73WdpmoY865BnJd5Fm3DvfbQp9wGTQZFlOFXq0RAVQ95fiE3ARqa7uqCzSRXhLJlL9WewnA8BNCm+e0/e7eOaAWIKvHfkpVD7dXzI6XZy1s/n/Ov/8Yf8J//Zwzxw/59iRXnvyI9YbcZ0OobJOJBlQhDFa0PZ6TAcrVPkafKnFFwk9qbElDwjz3u4xgMNZIrzTfyo4lmrTvL8W49TlIZT+oxu4lq6svtTT6jrt88WtkOrqi++9CHPPvs6x0+sUNfCsHbU0mFUxwbLrLAYk9E0fubPFX0kUtYSUI0KEWqgAPCOXVu3c88dV7C98/GFtGqgqpS808UW0XDRZvECtAhN2rnOByWRWS1FTLpQ2xqUl1lzqsiUuj4NPpoki8wcZDLHDpz/HQQfiB5Q1ZClvTvZ1OtMP3sQGI0bgoneaQBZsjZWHwgGOkWJCx7qqDNZZHEBVPEEhF6Z4fIo3uyaQO2VSQisjYTl4YRzyx9xYvk8f/P8Kb3m2i1UcwvSleVG2afLBSoAybLooRUi67PI4sZPE1EGBHzarbdawnPkwinbDGbZUPs7JPRXZjt9okXF1BwyBbh5lKPdu03tQFRnby55vAy8YppAro48vW8VctZMl8HiDnbd/yWW7vkyXH0HsmX/ZY/BaX9Cj1Yf8dy7T/K3P/srBuEsjYnK4pZoJ6MhKvJjWqJJohLPtT4o0RMvaBTcbuqoUJMXXapJ7O3b1NvEktnJvTc8zN23PsJmuU5OrY31J0+9zb/7qydYH0byvlGhY3OaSUVllLxXUBmPy2LbywzZSIfFzhQpvPfRZqaFc1sCGhLVMhwUNgPfqqqvIb6JtWcf6HR7DNcGqLGURZfGO5qmQo3i6yFXblvgc4/ezR13/HbUqtrxWxWsAHZvEfnX33pLX3zlbc4tD7C2w2hYgSkiFTzpfmlrvJfwcvEOaTxUDWIjXTOiU2lhS6/fXngzD5h4wtv1qlXt9iYgPiNISeyajDJOgQAOguY0dcnxIwOe+skhrtv/GPff+cccP3WEcViBZg2rDU0d6HQsapX1wXl6vU7EhKEFopnWtVp5IS0ABxIfF0xDnOIZnopGl3nu9ccZDcZ8/r4//kSW4KXGviWR0wPVm67exclTK7zz7mHeeOcIh06ukUlOZlMPlQ+IjzRdF5Rer0ddVzRNg7FQ5p2oT6cKfkInhx1b+1yKPzQYNDQtycUEoiC4tG4VM1ZTGhfmRZf7ohcy/jYwAS+RYW3cnQaQPPpEZTZmSPnsfu+hbut7c3a9JmXNKiZSZ6S9LS13acEVgczkZBLtP5xVKh9wPuCDpwkWZ+HoyoAzr53nvcM51+xd4qWPTulVu7awoyx+sfMcZiKyGiCaScvUsgJittOqHTANPNBu7TUeGEizMNae0qNb1RGNO3tguqmAubqmCrOWDZ0+p4UGde62plIKm8UFt4HGQUXJKN/EarmNax79B3Tu/Cxcdw9SXnrnP9JlVZRT4Sh/98w3efKlv6WyQ5w0eHHEZl6BpOGpEmE9xMfsb1o7DSk2x4xKRBiPh/R6PSwZqytjymKBbrHA2umKh+67hz/+2j9H6thf+P6HZ/k3f/Ztjp4eY4oeoTZzgSggViAXvFW8iVhPq5fYlirmnaFtUrC4GKu19QUL3qF1RagrtGkwPjpVIMJgMERsRpl3UDw2i4K4VT0isw3XXbuTL33+QW7c2/utyargtzBYAXz+kVt47/3P8M1vfZfhZICP2TlFsQmPieQFabOkpF/mIVQVXgRbduJC2NKs0y49iTFh5pc7VcTMFkQhECRmMkZykAK1EY8IMpr2LlTOIj7HmE288sJxdux8nX/4T+7i4fv/lKdfGXFucIBOBsPxCuNRRdkvMC6+jiY4JqRAZaaZVWo6DBYjhiAZiENNheAIdDAUuKbizPAj3jz4ffo9uOfGf0ilJ7X8BTKsduxcmG3fzqyqfnT8Nn78wgE+Onmewx+e4Nzqeazt0eksUFWBwXDCyrCiKDp0ikWssbi6oXaOzFgWyoxNnYob9u3mQi09gKOrqt/83jvUHtR4gvgY43ysZQQvaMo4IZ0Xs/GC1JAudpm7oC8IUhcOaTc6QEt0kcSIahUw0jIBNtrQlUVGr5vTzWd0xsZB7TwupSJxw9RmcllU8DBtMX5mLBgVVdp6gcRedxPIjZJlgcbXNClYnx+s08kyJk3G2vExJ4+POPrhhNv3Gw4eU928AFs/pYsxpA2AV2TKwkvZpon9dfiQoK8EVfu2fwja4DVjCMbb2h6qFlZvaenxe882CFMli5b7rZqQcYEQ6ystUt4OGwyu8WSZQW2PlYlwXjbRv/ozXHnn5+nc+Shy7e2f+P0tjo8m7/O9Z/+Gn774PU4Pj5P3SRThaMoaF/AqfgCJFhtt7Uw0i0E41Xe0XWvUk+c5LhFnCjroOKNTbOaWm27iC5/5Q/bYWwXgqTcP6Te++UPe+/AUdejS7UXxYQJ4o6iV2AScWTSLCiLaZpvtMRTZkGlF8n7KcufgQE3ki4wM76Kkkq8rxIW02mSx9mEFI3HpH45GdDoGaxVLxa4dizz84O38wRf2bTi+9eSMFp0dv9Hg9VsZrK7eIfLqgUqffebnvPveCcrO5igsawTnSX04M66O1ZCK7hNUBJNlsXnPZFHxWEyimraNuDae8CBx8gVDtEw3qHh80hSEHEweteUoUanwISAmXtZWc7rdLqNRzXe+9Sw2C/xH//wz3H/HKk8995esrZ+gKAx1WMao0O/2GI7XyfPYeIhmMQrPOw0Td8ExnrYyNiR2YRNvz4TFzTmj+hRPv/o451cmPHTX1xnrUe0meuzlhvPnNLuI8nTL2js2UD1+2vP6G2/zwstv89GR00wmE0rbp1zoYGyP2inqG/BKlIfNyNSQBdiyqcv+a3dd9L3Xh46z51ZxAdRqcl22CSKK1GSTMpP5cbGeqQsDVXv7RSnpGxiBH79vSn4h9leFECiKjH6Z05lLERsH46pOyhYSoRgNtM6wMbOKZAKDkEnMKAxMg2UIAZGoXWiMkksMlpkGfBBkU5cQoKkNRgoqbzh11jIenOKdt49x0/5dnDqvumvLpwhYIW3OWqKFyMb6FTCjms+afZXZsWqZf2CmrL9WDaZtZdhAvJh775B0MWNmF7OzGAxSphfafq3Z8emUi4wnjpWJp7I5k4VddK68k52f+Yd0HvjKJeno82Oiy/rh6ht87/lv8sSL32Fs1ti8s8/qaIAhw6hgNMqhCQ2YGfoyRV3S/FBm9SID0bjTeVwd6NgSY/u4ScZV267n61/+p+zfczdnxkMdjCz/7f/wF/zgJy+wuLSb1bWa4BRrQCXgRFFj8FmGt0maNiS7ofn5Pu3GTp9L5jcIF8x5NK5xrkGbBrzDiG5g/+V5TuMCIUTBZADvxvRKyx03X8Njn7vnY8fzNx2o4Lc0WAHcdWMp/9X/7+91PPkxx05N6HT61M7ReEduMhCJiuUm7nqsxsKu+BrjommZ5tPCVMSjSbvHoJF+OhVuVVR97AAXh6TyanyuYKWTiBJdQDBZsubGsz4ZUmYl44nlpz95m23bF/n9P3iM1f0DXnjthzTNacpuoK6WkaLN8CJGb1pV6vReJnXCa/optIXqMhJNpCHYhiLv09RxwRw3Z3nr6BPUrHL3TSMGelIXPiHDuligmh9XpGzr7ET1zluu4P2DJzh4+DQffHCaYyeWUT8m0wxMjpDjXGRqlmWPpb5h/7W72L1j00Vf+8zp8yyvrMcM0vh4vCWKkVqyBPNe+Kz2htnFGX+m4nyChGcBaj4riKSN9nkirccVU73GC3uynA+RxFPGniY7xwyvfaCqHS4o1rZwTlJ+SLv1dislrTV8u4C3fc/ERZ5kHmpEMTisBNRClpdUjUadtmCp1eJcYLDaYPyElckRRiFw+JzqNds+IWCl42EkQePYFEAkLWwx6ATVpLUYEOwsI2KOFQhzkJ3Mbg+z+nA7ptlYqk9Fp+ZEU08xUUIk06hvg11ks9W+YELJis3xS1ey9Y7PsfuB30Nu//KnXjDfPP0m3/npv+aVAz+B3oAyDwyGq5R5B+9So6w0REfrlhyUNo4XQYsDLQwa+9Qm44aFcomOLOImHW665ha++ODXuW7P3WyW7fLhOa/f/s6PePrZt6jrHOccuSmxJo8sZhNoRAlZ+5YZxhus2ul8TQcSM8dCbLUxWyIREL3jJPXOaYgeVdUYXBO7Pa3QWmqpwsR5vFOKMqO3sIC4depqyLX79vLwZ+7kgVsvbUr5mxy/tcEK4B/84Zc5fPQMH37nKfJsMRIuyu50NxCX8gQHahKQVUWbGpJorYhFbZJrSt3Amqy3p5Xk4GLdysQekwhNCahDNCdgMFLGv43BZMJwZY1+EYOdC4ZebytnTq/yjb94ki2bCu578PfJsx4/f/lbDAbLNMaRSyDPSyIakwRA28aw1hxyVs1myv0INkGaDaoeH0ZULpDlHbrdgpXBSV545yeMXY7caRjrEe1eQprpFxnz5Ihjq6ovv3aM19/6gCNHTnF6eY2V86fAZmzfvJldu3Zx1VVXsXfnIrfs38LeSyyi771/iNFwkih0AaUBMlRNhNFUYNrrMzsUF7MrCaENNrN+qzaD2hiENi6iU7Xqudebz6x88JHIYw3d0pLPBSvnApXzeIVM7ByJI6TNRfRUiiPNrwTPRHAgYDMLSeoqqCJeMWKxYqKpqHd08hKykiaHyTBQAUYy8qLHR+fPsPbaO4yaEe+dVb1h+2UCVptRaiswKxiN/TszR2ChZau2u/MWOo/Hpg0+bbaRwu0UApwe3Gk2AkTSguqU8actqzAkur8maHYuM/NkrA9gmG2ivOIGrrjvcxT3fhG56sFPNZ/P6VCfef9HfPPpv+DV95+isst0C2iaSezXyiJDLgojhzmI2RK0m7K+hlixMpGc3tJeE519fTRmcWERxpb1wYT9e27iK499nftvfowdcqUcW1f97vde5NuPP8XKiqdbbmU88hRZhmicJc6Cs4rLBLVxE2O8IUMIhmRptBHWvtjGah4xUFVCUNxkjKkT+w/BpvcMPmbEYjLExtXTGM9ovM5ix/LQZ+7k848+8GkO829k/FYHq/1X5fIXj7+l73xwhnc/PIuKJSuLyFwhZh4ASGtCFvHvUDVRlNECNhaTYxCa8XraXo74p7ZKP4jR6GukAacOK4agMYOAHkrq/xIIUtPr5jRVQ9Uool1On1jhm3/+c5YWvsq+Gx5gef04bx08y7pbAe/AxhpCQlfizgkFHAEPwUVbiABCPqWOx0megSh1GCMFsV4UMrzkNKHm4KlnaF5ehdsGnK2e183FbqBLdhn77k87rpirkbx9IujTzz7Di6+8iM3hrjuv5s67bmXPnh1cmV9+p7+8ssqkbhDJQVxCOIq4cGKjusHHtAE3/jJdDM18Y2/MoNpgtHHMXqu94NudvzECRhM0Fxel9vXz3NLrdNg559/TNA2Nn/WXiQgmzOAiE5TCt3MzJEfrEPv/RPASkjuASbUjgxJlbwgGCYHFnmFST5i4ETbrsLSji/PK2toaK2sjAoFqWPHSgYNkJZwcqe7uXeK4SyRPxCwmTJuehTjHlVizmzocKECYM+ybQwfTYTTTYDQLMjrP6JsGsVQbTI7ALcw3VcxIwUpauS3AmRLZcg2b997K7nsehnsfhcWdl55Qc+OMP6/vnHyVv3nmzzh07jXoDig7OYPhMgbDYm+JauISGJZ48YS4saVEXT/dN0JxKKmGlBDUNmhpgDzromLYs/NKvvTY73HfLY+wQ66SU+Nan3zyLf76mz/g+Kk1rF1AfMbS4ibqYRVJWhl4K7jCUtvofZcHyJ3FYKhtjdhUD5yHrNvfhXj8pmc8HmcXPNYFgqvBN5jgo8gALQQLaixZUSBOqZsxBZ6iyLjl1uv46pe+wC1X/3aRKubHb3WwArj/nps5fXbC0f/pr2iaQGhcbP4lOtEKRJfLhMhaDbgQwElUPbIAsmEBa3eDF9bhJUS1bysGn3a9caGJC5nF4oMl1BMWt2ylHq1TBcFaqOvAYm8R38CHB9f5d//rT/hP/4+/x313fp3KrfL24QmjyZGp0jkIIcrKEyLVAm3tRDQFqraQLXNYvwiZAadQ12MUIe9sJiuEcTjHwePP4VZHPHTnV7nrus9RsIOxntGu/PIw51v2GDmyOtCHHryWXq/k2s2f3Jzcjm6nT3Cr2LxAQh5zj8Q488bhtTXdkwS9xh9qYnDROVr6NGild287ryIxcb4WlQrmFyFfTIv/0x22gGaIGsoMOsXGwNe4QNqpTINV7MVpxVljCmEjmIvRpH4trQa2xtfAJFguw5qZBh0YRusjJBM6RY5YoQkT6sYheaC31GNtuaLo9Tm3dp53Dx7n1v2Xt2knGMSDc4q1LZshQYDaNlkL6iNSMDW9bI8PcaGeBanUCpIytPSAaTbWwp8gsecqMNsQhpn6RYhXG15K1BR4ctbtVnbc9gU23/tFuOl2KDrMrcqXHCf1qD7z+nf51o//nON6CLtQUVc1g2pMv7+IOBiPx2RZgXqfiE7xu7YK6rGmbZgKjAnTAtYMEjVsWdjByskR+3beyB9+4T/gkTt+j11ynRxfW9MPDpziz/7sO6yu1nTKJcZjjy1Mguxret0eQScxezIGxCCpThU3y6TjM+tnnB+qHmMyNMlRtfMqqEcbj2sacvWY1AUe6/CR0i5YrLGxn1IEdQ3dbsa2rTt58J5bueuOi9eZf1vGb32w2rfHyOHjqj964oe8/vYZqroi7y+wNh7TXcypqxHa1GzubiKMBdc4TJHhQ4XWHqMZeZEjWY5DEvyRLpbp+pQWQKJSu1eDlUgRjfviOtYeJNJMM9Nl7Bw270W/GFWMVSaTERaDLbfz+utn+fN/+xz//F99ic8+9C8JZLz+3t9h3SqeMU493V6HIIb19fPkHaHTzRkMxnSzHpF8kRr8FMTM+j6CS6hEuyTqECFDEdTWHBu+wo9fX2Z5co4Hb/06m9n/Sz8vVy0t/G8KfluWttAvz1JPAhoKyAocCjlMbIVvApkvsT6VhFNGoiYt+CbVpyRlAUkrTUWY6gn6RL2WmG1Jgv3aHWq7cTFiphVDSbWKAGgD3byga6Ofz/wYDSvcyNGVgo6NtVEkjxunBmwueGGaycfFImDUTufbjFtoMNpWQ5IluQBZHrNL71GnGGPpGkOWaO65KVlfrVkstzEcO9ZG40sfcJthmxwmliLLUa1o4UmbbEGCxI2QDQVCql+10FN6GQFQTW6zUQOQJFvm24xDFDB4T1qAI9MzlxiWJUBwnkwyxo1Hc4sv+pyrc9bdAjuvuYdr7/o8+f1fRfZc/6nm16qe05P6AY+/+D/y3GtPcKo6CD3Bu7jpzPI+zkUYw+QR3BObqOjTmqKmksCEttaIDwTrCTYQUu+V8YJ1JWbS4aYd1/PQrV/h0Vv/kD1ygyxXqq+/foi/+ssnOPLRCk47eAx5nlGro/IjwqJllYqQRwcGca2XVCR7NDKJ17o1ZAmKTXF+JnJKtPowkppdNNasgvNo49BqQmkCQX1srwiWYCzBWowBa4UsWFxVs7XXgXrAFx5+jH/xH36dnb8lShWXGr/1wQpgoQP/h3/xJ/w//ut/z/tH13BNRqfTYTIZkWU5C50uzdiRSU6/12Xsx3EBCD5ehN7iJVKrQfDJNbjtfWx3jHELaKJAkraqyjGQxTp0RLG9AhJpyV4ipBBVMyIdYlJBp9zOq698RPfPnuKf/edf4IG7/5jxZMixUy/h5AzWjhgO1hAr9Bc61G7M6tqQXrcLLmPagxU/RdrZJuycPPW5SKqT+LSaZCiByo44N/mIVw8+RVUH7rr+y0z0uHZkrwyG53Sh/+kzoV/22HvFLixvoZUnzzfRKfqsTkYMBgOkiIHEaoHiCanelGw3Uz0rLTitEy2CmFTIN3Ihyx0wG7IpEZlCfiGEmBHNPaktoGdi6JbQLTeq8NYOWsfbaM0QhZVbunarm9jOrakkkQgbc7T5MZtjQGSyCskjK9b/VUJ0ytU4F7zmBG9xGutnlxwJERC1ce6mzxTbPQQkisWaNsPU1DEmsU8sZkoBJEwVHFo5JkGTS7ABH4XFREBDjjEWT8D7htB4fGiwKRur6hpbLjAIHU6vZ7DtOm6463Ms3fkw7L0J2Xn5QLU8WdGtnc2yomf13bWX+fGzf8Or7z3JoDlFtik2P5tWaJcZu06SXTsyxWEAwaqN56ttBDYmicam/krX4F0go0eXHj2/xGP3/D5/+Ng/xU8WObXu9OSphu9+/3leeu19Al2EHEEJBpAoneRF0iGOmwRRMz3HoDPUIKlVTDGBKSIwf6KF5DYK3iE+YH3MprSODECxGSpZfJEkB4b3lFYoSsNkbYV9V23lwXtuZt/e3+5ABb8jwWpb6tf5L/9vf6snv/Mky6M1Fvu7mayOESnIOiUDt0ZmNbHLkpYXqcgbEnRD7Pr2xPXpQnr0tKKlikryZ5rWtVrwRBMxObL6bGL3WYkBTlHUOByByaThqZ+9TG+T5Z/9yy/xpUf/U777o4ZDx57GdiuKzOPNBO8yNEBhupjQYdqEOO3qjz/iomQRmaX/EF10I/Tk40JHjyrAifPvs7p6juWVY9x705dZ1Xd04VPoCf4qx3XXbeWRR+7kJz9/gw9PnCZzWxCT0TE9jG2x+Xp6bmbqEvGfpPRDiVkLCuJt8hpKmVTKbNoxfxleCAOGEKJZXQsbooTgMJkma5By+thzjeqTL5z4eMGbja+faAYbCuEXBszLjXZhmj1lI+Hhws/faiV+0mgb4KNHXAqwISQTYIOmAnxtoz+X1RDJCJrqbTQ4UVxE8hBDzDa8knkofITQFMHhCeoI2kzf1xoIRpG8ZL3JmNg97Lr6Drbd8TnsrXfB3h3QuYiY5AWjLD1n9D196fj3eOqlH/D6ey+yWp8j71qsCGgdF2ug1SQ0YiKJR0Ek+VTRykbFHjjV2OfYSDPlPfnaI97QN326skBPt/Clz/4DHrjni2xLhqgvvLeif/PtH/HT519jeVDTLRdiQIyd8jErEkBao1OdriVpNQKmiOOsJa09x6mWOOuzSo8VxftA8AF1nhACViMylIuNQrjqAENmY01EvaMaT8iNZ8+eJf7o61/ggQdv/FTz5zc9fieCVTv+6Guf5eiJkzz57NtRKSGLltJ1Fa0m1BrG9RiTxeQ6SNyFqmuYtS7Z6USQdjM5xd3jj1YZA+I8u3ApUKJpnWIihBL343gTg6QxgXE1Ztu2HYxGy3znb37GpqVF/vhPH+GR+/9DjHW8f+RJTLHO4kKX1cE6Vgp6ve0MBxOyPAYjkjnerChj2vaYmAXOr3lTeRiihp9VKCYMmxO8ceinnF8/zejOISN9Vw3b6PwSSBf/W8Y1m0VeO+L1gw+Pce78AMmUSsFXDucFVU+ZzzLaSLC2qFqyue5tCTH7iA228dLPEo08Mg1n73mxRb4dFzKsorCrAzR6Vc2JGzoH46qKsJdJKhC0NdD2xBjavOqSzcmX+TyQ5qbMPvuFsc0Yg7WygdV46ZHqRz5MWdkaUpbX2nnAXDDU2c7ex6zdx4Yo2n6jVroxpBRMvBB8RpOy/yZUyR+LqcC000DlPVUo8PkWxr0dbNn3ENse+SO46X5kabdofVol+2QllhWO8bPXv8dPX/w7Tiwfga6yaWmBifNM6jG5UUwItFmVtC0OCNOevohrxs2PyAYkxWdK04wpTE63XCSMA3ZcsHfHPm6++h6++ugfs5Dt5fhkoqsr8K3vPMXffv8pap/R27yTUMU3iJdufP0LT9O8ctWFo918aJrf7fo0rZvRbupikFLnCc6nQGyTJU/AaQxgYixZliXtUZDM4+oB9913F1//o89y5Y7f/qwKfseC1Wfu3CLf/tG7euzESQ4cOouxW8izDnXdkNkCTxOhoPR40TCNNOqmstOYdiJhpj410KbdkULejlgPmX2GeD23jlRpxzsNV3E3FZqomD4aN5TlFhoHf/ONZwje8h/9i8f42pf6/P2PGg4e/SGuGlKaSNkOVYi72yzS5+OXmG8YNqmQn642TZ+w9dYRhwq4AI13ZFbp9DPceJWPll9B3nQsrx3l1n2fY00P6ia57jcySXfvMmxZMGizymRcI8UmMi2wFKhNFgW4CMWIpB1DXGjaYVLfjpVYdTKiURhHiNDLhqL8xbOai9HdQbESMOLpdTpYO3u8C1BXLi0m+UXo9GYus9p4aGeP/eTMClpVAmavP/cUSYvfPLPx0i+lqAfvFZvmlGkDZhI1jbheJHgIAfGTaM4JOIkQc2T1xWys8Ens1ltUDQ6hIsMbA+IwviGzUIQuRgvcxFP5nDrvU/V3sXT9Z9h5/d3kt9wLe66KNTpAik8OVG8Nn9V/+53/jvdPvcqptYNIL2DKjGHtqBqiRFhQonP1NOIzy8419lOm2+Yls1odymA9TRPIg4loh7dsKrdw3/6H+b3P/QlX5ncIwPvnVP/8rx/n8e/+HC8LOCyOPPVqxvVFhWTzkepPJtUEmc/+tT3rG37GH8L82TVKZAtrhAvxgdB4JMTWHSMZRgqCOjRZrRjiDkO9xzeOxX7Gjj07+cyDN3PjFb8bgQp+x4IVwIP338jDr9zK8RNPsjYYkeWbqBzURjES6PYKQh0LkEEFI6nG5CGxEpCkGxgFIy8cLZW83c3EhaGFpTxMYREJEid+opqrRBmdLMvJJGdtMGSx32VpaTdnzx7lB3//Cp1OwT/6J3fwxYf/GYuvG1595wcRPS8sdVVT5hmOcZpoqWlZ236epDkXItY+U3Sf+50mfi8TdRQqX2MKUGk4svoa59ZOsD46x237P8dED2lH9v3aJ+vOQuT7zx3S8+fX+Oj4gNX1msF4Arag7PUZN03Mig1TrysxaVvQ9lDFsxNrOO2a1DKoJGMmFwQX7mE/HrDmpGyMklkoc2GxX7JjrtfMe6gah5+iynGx8+iUNBGDVcrw5t7jwobZyw1Nu/72YRcuJyFZ07c+Vd5f2tYebZ2CE/BlosgzSfJIW2g1wVOxqTm2hnhJcHnaD4maGLCcjQ313uBTxuJNwAGIUhiDd4Fh46kmDZUrMQt72HTN3ey49g6yz3wJdl+FbN77qefeOT2tL733c775/X/Hq+8/RZOtQukJhWPSVEycQ02BtZHtN63xqBIbmdLhaAOWiSSRKcwcC4MYA03t6XU3YQfC4PyE6zZfzxfu+30euef3uLJ/lwB8cNrrt7/9U77/xHOsj5Si20eC0jjBGhsJDsS+Jy86XVFUW/jv48Hq4qdvThSYlB0GTcEnpIxKp2hje76DRqajzWITvK8b1IPRhsJavvqVx3joM7d+2sP/WzF+54LVrkWRZ944qqdOnuWpZw/TNEMyCmoHFBnO6QbvGUkzREzsM1EfkcAZZAbzmRW0OHebikcYJUKG0xmfIJF2h6rT5Mch5FkH7z15EWWJZDSh39vCaFDzV3/+BISKr/7RLTxw53/McB1OnHoVF1bwYYzg0NAQjJstqmb2GUUs3reZVfwibXAVVdRAZgKSWTQYfAi40GCN4mSVkU5448j3GNSnGe07x3H/tG4zN1D+mmHBrz64T46vqR78cMLrbx3ildff4fiJM1BVmGDxks2wfiuoNUkV26Z6RAzOkuxMYg1PYxO42ulCcGEWc6EM04U1J1EoLJRW6PfKDc9tHIzH1XSjHl/n44FiCqd9LPP6dEOn/889/2PBLs497/3la1ZJ6ijCQRJJb0rUBlSJTLh2HvtYH/GWaV3XBsgCyaYnBqngNfYxhpaA4TFeaY+WkTwGKhTdvJ1iy+0sXH0fm2/6Auy7Bbk2BilfLau9hBDtyJ9RNfEcn6yO8XfP/xueffVJDp86QG9b3MBMQsCNG8RCUcSlzPtJEoGVtI9LYUFl6nWHzBTW5+tAsbfMYL2hqx3KrMf27Tt59I4v8ZXP/mN2lDfLuZVKz63B97//PP/uLx9n7DI2b93FueUBZdFDxBJCjUdwqW3BxziIl/adLhzt+ZvVzNvb5z9fOy2MSvT38w4TwpTYEl8mCRugZCa1RTQB72o6WcbSQsm9d+/jy196gP07f0FR5N/w+J0LVgAP3X6l/PV3X9ZDh87w4dFhrCuopeh2GY5W6BgDIWBt7JcyAiE68kXZmdbvfm4NCTKbEDJbJ2KfjMRwME/K0ESDjzp2yfvGxF1Q1TSYoJRFQSZQNRVFZshtj3rs+N7jL7K0tMRjX7iDh+8WXnpjkYOHn0ObkwQzQvPZLkmNIET9vJgEtJ/SzP2M+mttM6cPSnANQkFRllEjsZkQxBFMxcif5q3DT3L23ClWbj7HXTd86VPrCv4yx95N8Uo816jee/d+nnzqaQ58cJTDJ0cgHVBDMPmUiak2IzI2I/U3GHCiWDOP8W9cDuYDx4U6gBcSIOJ9HmMgy5ROsfHycA2Mq4ZAq7HORdaeVsKLi77PLzIuVCuYf81Pum3DJ9KUFaUeIkKsb2iIth6+FfTz8QB6yWJrQIgyPeLnlC6IaINPDFWCwwQlS71XQTKGdFjXHF3ayfYb72P7bV+GfQ8g+2/b8GUuFagA1AgVIz44/QZPvvwEL731NKvVWbKljImOGLsKD9i8i+KoJxVKQ05GZMVaEIPO6UxqiyabNCcgbjoSpCwSMJqzyS7RrMBVW/fwtYf+AY/e/nvsKG4SgG2bS/lv/pef6zf/7kdUjSEv+qytDeh3e+AE75oocUmE+1wIM/q5NUks5MLMavqtP3YcNqxJ6VwaonpLTPGVmDvF2mMIAcnA+3idSBC8c4j3LG4q2L2zz5/8k69y3w3936lABb+jwQrg0Ufu4O23D7P6+HMM6gr1JXVdY02BSGQgaQgYa1MvCHjv8CGgmhOMIDZK3IS53ZdqbFVsaeztpGqnkeisACpTqCbEPhsfm/OMNdjMEESoNaCSUSXVgyxfYDTy/Jv/+QesnBvxx//hI3zugSUySj489jQDd5RCBDLHZDKit9DBqWN9fUi3140BK7GMYvNlW9OKn1cUco0mlV41kkuMYCRHJEcJOKkxnTFnqnf42ZvLHDv7Abdd93mO6+u6V+74tU/ibbnI8kR169IDnF+7m58/d5DDx1Y4fXaZUe0YVGMmTUBDCVlOCILNcwSTekkMJrcEEdQHMiEtxhEWlNiLQKurJmnTEtE2Jbi4g40eQYHxaEB/1zYWN3U3fM6mCbhWaqlTpmwlvl4TfGSTJeLLpWC/eep8+3f7cyb5xIaaFOhUXLfNBttkqyxLnHOXPrhZ6gWL+DWtnJK08F9CDtrmaFWLhgxMFpmVGnsIxUDT1FRVRafTQZuoPmIVTDBoHTBBqfMOVX8XO258kK37PwPX3Q37bkaWPn1T+rKe1WPuKG+8+yzPvPpDDp98i8YOyJcCdRjg1YA1GM2TK7FSmHy61ksKWF4l1YziUY2GokpQlwxGIyEqJEg0M5bSdLCuz+bNu/jDz/4jHr7zy+yQGwTgxEnVv/jGD/mLb/w9E3KyTp9GlSwzmNBgybAWRhpwxOyzRV9mliyXG7N+z3YuBI2SclGM2GOU2Euajr0gibEZX8EI1G5EXnZoJgEjQrcoWR+fp1NkPPjAjXzlM7t+5wIV/A4Hq52LmbxzaE1X1yZ86/FnwCyRZ0s0IU0O4iQ2baFaA9ZYMmsinqs22jpLhDGi5P6MNiGq0+Jr/J1peWh+x9uKH4QEJxkBF2rUGJQCk7rGURtZVd6jLmPiDT/8wRsURYev/YM7+OKj/5yfP1/w+oEnWFn9iHJR6BdbGQ/XwTqWlhYIITCpxmRZJ8Hx7ZbRTNlN0DLaWmjMENSgZET6SKDX61DXI4IdMw6nefvozzm1fIrlW1c4oS/rZq6m+2umuG+dqw0tO9UPDsPrbxzg5dff5MCh02jjKHtbQDrUIRaXrY2SN957JlVULrcSzzHExd5ai02q6W2NJ8/zDedwnmBhjKHIhE4h5PZC9QqP84omokfSIU67c/g4jPPx7Gpei/BS1PYLb7s4wSIF10/DCFRJkkkxuzJAVIrPmAl8R9KEkGF9nK8Ez7geot5hM6HIMnq9LuvrY4wtsFlJyDo0zuCMIc+6NAvbufaL/xj23QO7bkV2X/MLzaMVPasHh+/y/Sf/hmdf+TGOVYpFRx2G1G5CUZaEtrEsWbAQDIYZ9BtB4hgopiqThhisCXR7XcbDAZOqol/06BX9aPcx8uQiXLV0DV979J9w7y2PsF2iseORU6rf+fvn+PHTrzL2llqEpg3y6qNOpY+NuCFR9ANRBWcDahPammZL97jMaZsGqvit4nfVlClDq5DcBqp2PcsLi2vGWEqsCK4as2v7Ip99+E6+8qX7+T/9Iifkt2j8zgYrgJv3bZLv/viAfnDwKG9/cIbJBGzRQxGMZmknLTFTClHV3GRZhNc0pH6TdpK3mDa0UWmenaPp5unkmAtmsxHweIJOyNWiWHJTIm1/l9ZxUhuL04ITJwb8/ePP4sKYr/+j+3n4wX+K2A6vv/sE4/pU3LE5j9cxRg3D8ZCiSE697fYbklgTqVk11tsiBh9dbCTYlFVFAG0wnBBU6HVKOos9qlHFsfXXmLy9zOmVN9m/7QFO+Wd0yVxB55cgiPuLjq2Rg87ZRvWO2/fy1rsHOXz8LB8dO8vh42cpTQc3cVRVDbaDsSViM0SjPJH3VVJXaEWOZ4u6ucAS/MKAZQhkubDQL6eOzu2oqobaxUxZjE0bGI2bnNQk7DUBTHPsvzjmA1ObNcXbPxbIphp9sz6u+aB34b+PayHOjYR9RRhQaS3NY9FIZwE3vYcNijhHlgFGkTza7AR11BOPd1DYLk0oWa+7rIcOVbmFpav3c90d98KNd8OWa5Erb/lU82Y1nNVCBM+YI8MD/NlP/l+8/N6rnFo7wcSs012wuKxhMmlogovKGFjQVKsNNtHwLUZtqg1JotinzEbClAZuEAaDAf2ySyEdQqUEL3TYRHexz67+Nfzhw3/Knfs/y9Y090+cV/3mt57hW4//mPODBi3L1GsZ4udIm2FN578JEv3OmCsbqNL2TbaqNEyb+TeeP5kSQ2ZhrYVtSTXCVsu0lRZrtRxFFfUu9gqqZTIeU0jNrTffxFe//CCfuf0X97z7bRm/08EK4I7br+VP/+T3+f/8d3/OwcNn2bpwFeMmTlabRGA1mKifrHH3Y4wh2lMn2m9LdZ5OrLRgTOtT7ZhK59LeE8VTYdbnFF/TaYsne0yrzi15WtcMZadHZvucOn2Ob33rSZxv+P0/uo/PPfSfsGnTZl5788ecXj6IZJvoliX1eBV1St7PqRsfs6YQ3U6n8IEkqwZpUkAt4+6TDE3Nw4pSZiWeCBMORhMsQrnoWXOHeP3QcY4efY9zawe559YvM9D3dUE+nfTN/57hdFlFwZpZHWP7nCjuiUr1hZeP8tTTL3F6ecD5dcdgPEaNkNkCMYbaNVSVp9+zs0AeAs4FrLXTTGue7t32Mc0ChcdmwkKvpMw3fsbJZBLtUBJFPSDT7J12lx0xwNlG5xL1pAvrZxe7X6fPv3hm9elqYbM6k5lq0MXA1XafTjddIX6v3BoaX+PrBgjYPCO3BQ2WRoShdhlIH9fbRe/KG7nq5vtYvOEO2HsNsvXTt0NUelYDE06Hkxz46HWef+NJXnrnedbcgLJfknWUoVsnhIay26OUkqoaI+KT4gYxWwo2VWxiI5kmeF7bFT2NVsVcgkWdoUOHotOFiUVry/6r7+D3H/3H3Lnjs3QT4ej9E41+82+f4/EnnubMWk1vaRsT12Ak9qAZ1dSPptQEalVqDTizEeZtz2l7RqbrSLtmpIe1WqAyDVatwIFM758PVG2mNZ1HEsWWizzHNxVNs87+/Xv53Gfv4fZbr/60p+a3cvzOB6u92ws5dk711dffZLD+PJNmDfVFKhJr9LuC5JMUew1EIwYvaWccG0yjYnaY78GYW0daOvH8ldjWPEg/FdJ7FsmVOKDJhyqzkT5rs4zK1WAsVTUhL0pCyPj+915ifeD4p//RF3ng1j+mn23mmRe/x/nxh/hmGZiw0M8IoZ4GRjEG1CNkafEEIzq1FwgkgU6Ji7DgEPGgSlmUBG8Yj8YEaej0BNOp8NWAc/WYZ98/y+GzH3DT1Q9zYPKU7ilvYvGXKIZ74cjk8oZ6e0qR0yPVu266knffP87Bj87w1oEjfHRymdFwjDclWdYlN1lkfCaIDCK5JoQYsKyd9WpdGDBCCKhRMqP0ex2yjUpLDMcVzoepgHJ8XqJJTxOsFoa+fLBqx0XFdZkF0HkK9oXZ1acaEoOTiQ0+hAC2DaopQQ+tn1OS5AllhMppBHE5YWKpQs6YkqHpYXddS++K69ly0730998Oe65DFj89Db0dNef44NSrPPn693nh/Zc5NVnFlZ7uolDX6zST6G5gsTR1DNhWC1RdOr4hIRxRSFinMGwrnpmUH1JmEpNIgw0ZfbsJqTKaobC9t4fb7riLB+96lNt2PDgNVIdOq3778af4m8efZFhZtu68ipXBCLEFXh2qAR8UHwQXlCaA8+CMzmXPc3BvmAtK6RjEI++nO2IlbbKnKE7cEKOpRpXOnUyf3W5kZhsm0Qz1AecG7NzR5fOfu4vPPXo7u5bMr+z6/XWM3/lgBXDFNpEX31nW9cGQv3viBTTbjtco8mqzKPfaarO1EF7bkmNSD4ShZfyFaQq/YQlRZhMt9eZo651Agt4S7KhSAOBVgQrRBiTD2igUKmKonMegiC1xrubM2TWee+YgdaX8i//4Me688ass9Lfy4lvf58CHP8WJYWFzyWA8iiIcrceJCPiQEonY9yXYpCQtqInePdG/1iEaaBpH4yIZpSiidph3jsY1hBDIioZROMd7p17iyMmPOHj0fe675Quc0jd0Ezvpyic3b/4qxs45G4zjq6r7r97NW+8d5vCxZZbXRgwmEyaNYTgEyTvkeR6Dk8yC0jy5YQYHhik8GIOa0O3mbL3A7qSq4vGJKFTsoYlO0yFZfISpIsqnDVYXHdNANcusLnbAP1XQkpnArypxTqTs36hOFz+IvcGqyjg0BGMRShw5NSXa3Uqx9So27biSXff+/9n7z3bJruvOE/xtc84Jf21aJIA08CA8vZdIOZaqqls11T090y/na8x3mGfe9Zsx3TOl6ZK6q0qiJIoqUaJoQQMQNuETSKTPa8Mes8282PuciLiZAEmJFrjreYCb9964EXFM7LXXWn/zGTh1Dk6dQ3R+tiS143f9ulgTACN/1V+89gpf/af/lWfe+A6vXT/PRM2wrTalq5gOx6SJImu3UTKYe4YqD5RWEcQS73+CZJFDBNfpRqYj+GU5UQsVx9rLCRKZYWYOVSjWsqM8+cBn+P3P/RvOdh5tjuWlN8f+P3/1H/nm955jPwfdHjCzYFCkWiItOBsI4pWTVF5QCIVVHkSoSOVCwqovrFhYR2BR/XPhe+ejAwRNklUIFvdONUimaUUv/U5RFBMGgxaf+OTD/O7vPsW9d/7mWn/8rPGBSFYATz2wLr76j6/4S9d3eO3tnJnRQYk4DqellGHsKsA6CzL2+4WMxM6aVBtvn4W2YB3zkZZb+oGo/+c9Ho2z7biQzDA+ByzeBc2+VKUkMkVgSFONqXJm0xmtdpfZTPGtf3yBlVTwpS89zNl7n0KlFqGHXN4RlOXN0M6p7+IaqygX3odXOBH7V8KCtGHGJVwwPvCObjtllk8oZpOgIp+0CZ5KayglUVmL4XCI8PuozPPGtW9w+fqzPHTm4zz14Je4XP3YD/Qd9H+KI/EvM05Gf61rI+9v7FsuXr7BS6++zisXriMnGaVLYwvQIBVNMrLW3jLnqX2wQji0EnTarVtesywrnJtvFGqdN+cdyoV2jY873VuqpYWq6KdB6BsE4HvkOSllc//+1IS18Ps6GQNRYzGqofi44DsHTqFsipEJZdrDr2wiN0/TP/0wKw88BWcegs46ovXz8fLWxZqY+Lf9tcnbfPet/52//8Hf8txrz2JTUG1NZTOqokJpT9ZuI72jnOVYOyNNWnTbHZxzFEWBkIHCEBb9sEFAmNDqBpRQIVHVrTLvETKAqpQXrPY22bs85MzRU/z+5/4bHr/3M9yVPtAczytvjf1//to/8I1vPcPUpgw2jjGcWSaTgk6ng8IADmtV4DF6KISi0MG6Q/kgOlynUuEPgGDc/MIerLQ88zZf6IYIFHKOXhVEa5PwYFH/fOG1nIVW0uLxx87yx//qd7n/wZM/z6X6jY0PTLICePLxe/i3O1/kf/p/fx0xk+TexA/+nFALsV0Tqy21cKmlD0nLu5DAnBd1E/k9LXVE7JEHnkZ0F7Ue1FwPzHqHt6G6QXgqW7DS7zHLh3hj2Ng8hqkqhqOKtcEaX//6MwzHI/67/+FLnL3jM3Q+3uH5147w3Pm/J3EgVIERZSA2ChMFM2vdQBESFsxtRUTY5YWbWTCbTtFakXQ1xnlsRCh5EryVFOMcpEemjop9Sm8Zz67z9EtbnH/tOZ588Pe4//QnGfmrvi9O/Fp3bMf781XgpSu5P/36ZZ556Rp7Y8v+/ojprMDZUG16J7EIVIQ5h53povaeQwpPpgTt5FbQQmXi/VRXJC4KbdUVGiYsFtAkrDDhCjtnFaSGqWcr9YzxYAm/uHDV1YNwkSNFrYnoAwBC0GgUvld4BPgEaW3QtBRRtDXOMo3wVJ4AT5cp9I7hexv0T9zN6j2PwOkHYfMu6B1FtH/+qnrqrvvC7/PsW9/im89+jWcv/ICh26PsWpxUeKuRQtNO2uBypLVYawBBmqZ4bxlNxggPWusoojuna8h4zhuVemw8h43wGjiN8gnCJUxvljx41+P83qf/DU/e+1mOLKi4vHB+7P+//+vf8NIb71L6jKQ1YJwHs9DuoEOVFzgRPMlKaykqR+FEEPiNKjK6nh0v7DZux5kDbqm0QiUV2pvKg5S1Pvw8KYGoe5rNPVZvXaXwaHKOrrX57Mc/wr/61Jlf6+fzFxkfqGR1cjVglP+v/7ev+b/75rNs37hOr7eK0l2sFVReYK0nSZJYmRi8dSghULFKsnHLYp0L/Avhwk6unkUs3nS+Frydi+MiPEpZHGXg+cQFwQtBbi2lzQPvoZiFKkuljKcG5QVZ1qYwHpmt8c2n32I4Ffy7//aL/M6jfyiuVq/4FXmKZ1/5O4bmXVA38ekULxyVmSE8KJGA11gh8S765JAiXYI1JUBAGIqwI3Q+2HQH/yWHEzl4iTc5wRLSkVsThvJKMrbbjGcTbvzwOq9efY6P3PtpfjL8K7/Rv4MOK2haSPQvdbb1fvHwyVaotqbev/mO4Uc/foEXXnmD4cSgdA/jFaOiwicJCI1QEqmCnp3DhmrDlMjccGylv/Tc7868/8u/fR7jAtdFoXGmxAtIlaQqp1RVTrczwDqBDU3nufCrFBGdNgcjO1+3subVlZCBqyVqS44a9WbB+rC5mOWzSGAtcfKnCOMmhsJKfC5ZUYJUaAoFZeUQNoWky0QqcpHQ7vdRR0/TffiTJMfO0D5+B6wcgbSPSH++Smror3pDQc6Yn9z4Lj968bs8++r3uLRzAdE2WB3EgiVBqxDnkSZYcgjCZ1I0QBYCl1lASYlSCuc9mjCPc6UHI1AqIcsSpsU2OlVIlWKMxFmNli0S0aNNj0fufYzPPfFFHjvzSVbEvI35g+d2/P/zT/+CV968TkWGUB2sCXYx1ntsVeClZ1aWFFVAKBpnsUIhlaAdux3ONoD5uImJHZ6wuISEG3lzdZXfVNrWBDsYBErKuD0B4VxcbzxpljHaH4IMYsuFsRhjUVIj/ZQTG5b/8d99li997rGf55L9xscHKlnV8cdf+Sw3d3bJJ3tUlWeWT0FkZO0e1lXLVVLsaeOjjIkI1ggegcYFKoO30T9JBv5UXBxqGyQRnzBKBIKv5q3BOPj1sb53eApTAAlSKJTSocQPwtYY73FeosSAl89fZzr6Ov/pGy/5E8kDYuK3/MrKBt965s8ZWsV4cgnVkfRX+kymY2bjKUkmg2uoD1YXniD2KrWKiVVExXiiMoSnkZ8hJLSAMFK1RV9MahZECdqTtBNeffeHXHj3Ne4++RBPPPwZHrrncTbFCRQ9Cr/ts1+jFUlt8X5j4v0nL57jtbevc+HSDd65sks+GZGmEmcrvPVY6VFKkGrQSDJR8sj999LR87e/7b2/tJ2zOx4ilIp0PBeqcEAmAnSGdAsGijiEWHCcjePFupoDliqqxdagD8xznLNIFwfsUuIIr522WniXU5Uls5kJ4IPbhPdbnr0L+FYf0xpgnMAgmQrFTCm87CLa64jNUxw9dTcr5+6BMw/CyinE6j9f5HjsL/sb1bu8c+1tXnrzJzxz/ge8efUVXFLQ32gzq6ZBv9IHqkUkWMzRrHX1JwS1KrxrCtA4X3MO4zxaJiRJgtAabyVlWZJ12pRVji0tWrVIRZvEdTnWP8mptTP8waf/DQ8ff2yJS/hfvv6q/7//T/8LxnUwoo1xOtAQRKhunA86fJWzFLaicAZTv/NILsYanLMN6nYxAho4vFyt5djoXPr5jAqIbuI+fG6bmmk+Vy/zksFghdJUVFWJTiRCKCqTk6mKL33+ST725D3c8wGYUy3GBzJZfeK+nvjbH1/zs/GI7z/9IpIeUgpmswlJlhIsrQ0IG3lJc0vr0PMWc0SWswGaKgVCBt+bytdyOuH1FsmINThH1DtCYo858mqEEFRVhXAeKRK0kKias0NAa7XSNq1Mkc/2Of/aOzhR8qdf/76/OYWPnP4ym8eP8O0f/GdevwjVdI/RdARpQru7QlGWeBksQry0WFfihQ/Gk05hbYJzCY6EQCp2eFEiRIWPlZWw7dgisgQF+qDoUdMZp7MRzmucNVy8+iLD/Ru89sYz3HP6fu468hB3rD7+K7vW7xeLzqeXJt6/eP4a5197h/Pn38ITNBZNWZF4ybGNY9x77gyn7zjC6eNdjq7M/1YA5SxnNBoBLbwPbTMjVADReILVeAK5k0ErT/gmGc0r8fBlbvHgl6uiuNnxaW1pEediItiUG+8w3jMcDUk1pLKu+m/PsxJiU/jtp/2uUOA1peySpD2KtEPnyJ0cPfEA8o774fhZWDsK/TXE4Odv8+35G95jsVgKxlyYvMbTz36L7//oO1zbuYxoG/qrbWbesjfaI2nJ+PkK7WsnA9VAuMCDsk0fNIoIeT0HF4igyiC8xAuLcRZXixjiKa0hkwml13RUm55egTJlNVnncw9+lt///L9mwJEmUV0Zev+1r/+Av/i7bzOawf54H50NwsvXcyfnMc5SGENRlhSVwfi5U7VoPru+QZQi/HwzWztY17eBsfNZY7z+Ps6xpAjeUzJW1KLWvXRRDdPHrolIcJXBVgHla6oJa2sdnvrII/zhH32ZJx//9bbnfxnxgUxWAH/w1HHxp1972d+8vs3bF/fwImiYOUu0tbZh3iBcBBfUOx0Z5HpkEK713uOsCUNo7wJM9n26LouDceHm7HVfo3fiQL60BllGRWWdkEgVSn+lyacF+JQk7ZF1Mt6+tMP/58++xvWdj/I//Pdf5kTrKX7/c6usPXuUVy58nwk3GOU32Z/sMljvUVQWqQOc11oBPqClPDLMz4hck4YRqgI3q97l+ZDQpDBNOwssIkhvk7YzSAmgAjdhZ3SBrZ13ePvd51jv38lHH/5DXtz5pr9r7SySBIvHFIKN1q8GkOH9jgeLRTWQ+FMxcb275/2lx+7nueee56WXztNdafPxjz7FR598kLuOCbG97/3GQqICWBdCvHB97LUUGFtilQtIOpXgkZTYqM2mcNYipQubEdz8nIp6durCIl3vpOvFqv4qocgDxFm6QFmXHpAOa8EYhzElrTQLaEcZRVvfK1QHffQ0eEWn16K3tkLn5N2weSdsnIaVk4j+Pw/dOfM3vaOiYsIeu7x++TxvXHiVnzz/NOPpkHE+xGclpSixpkRoR6/foajyCGAKjrxhJqzwKsxbfaPIIhBOI31QX4knCleUqFSClJS2pLIlAoPQCShF5RRZ2saNFaWBx888zO9/6is8cvZjDKJhIsD5SxP/5//lH/nWd55jd1ghZQcnFM6rIBAQK6qiqijKkmlZUVmD8XUim/urLV7Dg+Hnu9rm+/lnjWgAGtqBiVRo0tAGliYAR3yELseZnNYp+SyAfdppRlXtI33OQ/fdx//hT77MJz+AiQo+wMkK4IuffZAyr/if/5e/5MKlLbLOGtNyFg316rFkjOgYio+y+iJ0z70Ku6VgQGdxNojG3m59qCus2oa8+Xms5Ou/kVLinaesLM6WuBTaqaSlgzJCEA+VVEIgRAp6jf3pmO//4ALj4d/w7/7t59ncuJc/evL/wpk7H+LvvvNnzLxnc22NmdnBuhlahSG8lBpjwDWW5bV6eRVpKg6JC95EpAGc0SDl4jC/TrSEmYIXhtIUCDclUS1UFiDCw2JI7rb4xrPvcP7KWc7e9Rh3HX2YYyv3sZb96giJ4n04W3euhkR0Zav0X/zYg+AtK70+J46Fnx9MVHWs9bscXV/n+s5NnCsxsgIlQMqg9B+5PghP6iVS1K40NccnJCshAicnVFdzHcGmOncagUZ4iRYegUGKkAoloRPQa7WR3lDNZuTOUcxKtkvvN9LbvPfece7++O+TGkOyugKrq6GC0v8ylf3cb/spO1zL3+Wdrdd4/dJLnH/rRS5fe5eiKIMavLCkrYQkCR2KypaYqUHpNOYi2XyWGnfcOONruGFxsyQayxeHMyH5C10jIzVe1lrjCmESpGlzrHuMJ84+xRef/F0ePvEkyQLl4idvDP2f/8U3efrHL2Ntihc9pmNHp79C6SqElAjnsMaSFwXTIqesohGlirxGH5wRLLXvGuEaRzhNLc1Wq0yEUUOonqgTXpxbKiHRUpGoFIUO1dSSBEGNfoxKgd7TSjJghtSe+8+c4ktfeJzHHr3zX3JZf6PjA52sTvSEeHfH+2tXb/K//Zf/yo3dLTq9NcqowB68qmKSkip8SCLqRtZoManw2lNZG1F9bs5vgNsnrQXX3kYcYBHxI8PibpzDGdfstKQM86us1SFRmoKKsipRaUqSrHDtRs7NKy+S71v+7R9/ho89eLfY9xf9H3yxw8tvf5cX3/4Bo1lOkhh8ldeiS0inqJwl+PV4vCtjG9Q3MwKBRLoszAZ8rDprfXHhcYHJAogIHxboRKOkw5QWIyvSJEW1FDemr3P5tdd54Y0fcsfRh3j0ns/y4JlPcNmd9y2xzob49Qtpntz8+ewRTnWE+IvvXfTXdnOu7hjyfIj0HUSW4Www+hOqTkEBTSrjjBBJbHkRqglTRTPz5Z14nbSki/MbZ7GmDAN7b6msobQleTFFYsmoyNpt+u2U2yYqQOhfLNgl99t+zA5vTV7itXef5/k3fsxrb7/IjeFlrCrQqUL3UnT92fGWoiqorEEpRTvtUlVVgJl7GRvLNZDCQ1SaCfu70AprOGHhLJEkCdYWVM6iEoUSispYispACW1anDv+AJ974gt85tEvcFTdQbIwn/raN9/y//N/+AteuXAV41NmM0hVysb6GpN8BkJivcVYQ16VzMqC0lRYH1XbFwjaixuN0Jm5lXJQV1Aiqq2HZFXPocJ4ISQqTaplcPmMnR5X0wuoK/OgUJFojTUFVbHLXaf6fOX3P8eXv/gxTnZufx98EOIDe2CL8col4//0z/6Kr/7ttyl9wqz0oYoQCiGCCGbYGcfOuPQLyUjgXHDeLY2hsgYRpf4bra8DZzHYrEeF7Pg7IRaGsbGV2OyqECRKk2VtWiohJSgtpC0NCipToISjozUpDp+Puf++E/zel57k458+Sysbs8cFfvzqP/L9Z/+KpL3HKL9GXhbB10o4SlNiqUhSRVXlkX8io6BvgnAKfAI4rCjxwjbv3dXLRF0ZJhpvQsUZQOFBwsiUYfecddpYFxwKpZUktFjvnuCeOx7l9ImPcHLtfja6d3Fn7/Hfqvvv/HXvX3zjOt979jWuDwuMTEjb3SCt5WVAmdYhBYK5PqFiTmVwtopggogG83M1ddBUuUd7Ad7gbYH0JUoJlA5CpUp7+u2E9ZU2dxwZ8LGHznDP0fYv7VwWfstP2GGrvMLO7AbPv/oMb777Cm+9+zqjfESaamQisd5gXIWRJZULc1lgviFkPr/By1oyOrQCWSDGRodbvFqosOqNnyPVAUjhvUWpBOfAGo9O26xlmzxy4qN88Ykv8/A9T6Bdj1UVNkdvXTL+6Z+8wreffo53r28znBqEbIHRCKOQJDjvKbVhZnLyPCcvCkprYvs8vuf4uV6m6c5nky52VZpJYj2P8jU0vT5OFxB/SpEqHYWYJc7E9YPgWh4qtGjTgsYVlkQ4hJtx/GibP/jyR/lv/s0XuPfO1m/V5+nnjQ90ZVXHA6e0+OFru35rd4evf+NplF6NSLcE4aOOXEww4ELLjFqyJ0BIoVbtFngXuTneL7UvQkQ1A+INHX9XtwNcPVSPN2YgqgLG4SkwynBk9QimLCJnIiQ2JTX4hFlR0FYrnD9/nZtbf8+VrS2+/IePc3bwUXHRn/dn7ryPf/jWf8DmCVW5jXQOn5QYV4U+vKsIw3AI0OHQumr2Y8LjKAHTYJCCrmB0J0aSzwxJkqBVijEhiUsEOk1oy4zcVpSmRApLK0swLufqaIfd197l1Xd+xF3HHuLsycd5ae9v/dGVcxz5FWgP/iLiwWNCnN/y/rU33mI8HjGpCtJURHct0C4N11NIwphBIGRo+cUmYLAUcYGcrgKCJ/6+Vvsv6LVTWjqoxyeqRZZ2GfRa9Potskyzstpnfa3HxiAhk3Cy/cvbTe/4C/7d4lXevP4Sz7/xA968/ArXdy8zMxMcnrSXYp1nmldIEpJOinMlUktknaBcsG4JQImgAO9i1yxUKkGnszmKiACs9TmtmIszA8xMkJHNVAvtU8zMk/qUOzZP88Cpj/CvP/UnnBjczcqCCPNLF3L/N994mm/80w8onGY4LVCqTSvpYIUI78OBNQG0MctzJpMJeVWCFNFqKAAijIv6otxq5AlEv6z5kEHGzakgLDXOBd6jlAEWnyhNouJS7CIfk1B8Wa/ifDO0RJV36MRiywlrPcnnP/cE//5Pfp/TJz64FVUdH/gDXIx/ev66/3/8v/4TP3zmTRwDnE9BJmitsbYMaumpns+vIHh+EJJMUcUbuSgCR0dKHB7joseVDG0AHZtBc7JmLUR4MOZWFosC7olu0WmldFsp7VSSeNcY6GkZBtI6ERgzJk1znnryNH/0R5/iU/eeEnt+2++Z13n6x1/nhde/z6y6TqW2mZibGDkjySSVdaFV5TTBAl4EqZ04E0m0iW3AcB4cErwi6DwFrs9BgmOzi/SycUilhnV4F9hmsXpNSWknq/TbJzi+ei9n73ySe+5+go3sDBu/ZpLxT4sd6/33nrnEP37nh2ztTugMVinyUCn1ex0qa/A6w4mAHJUyaL0pLUikCt9LidaKVCe02imtVotWq0WmExINg66mpaGVJbRaKa1UkWaKVgpaw8Y/183xp4T3W95QYVBcnl7iwqVXuXjzLS5tvc6l7Te4Pr7ErBqStMPc0+IDUMfpUJ1bhRMOqwq8DARp4QTCycgVqmWf4mIu5lWIIzwfQCI1RVGg0gRUaDujCARhaymnJS3VQs4SZJlxpHucMyfu52OPfZpPP/4Fjqn7mvNzfc/75166yD9+58e88vpFJrlHkCBVAghK4yKgAozzlJVhZ38PG+1kKhcICp7wOfVyXgk2ycnP/x1i3kGpK+f6cQIwRdlc+0wnYX7pamK5Q4kg6+VsMJUFjbOBgK5kSVXskSUFX/zsE/yf/vt/zSce+dW6fP+64kNxkHVcG3v/w2fe5k//f/+Vl1+5TF4mtDurjCZD0J5+v01ZFXFXXMNNBUTipXVgvCMvC2yUrnGxs17PpISsZxXBYbh5jhh+6ftlyLGMszDroZUm9LOEQZrQ1iJWYXG+lCQ4b7GuQLqcbua4/+wxvvSFT/DJT93P0bYQW/4t/+Jb3+EnL3+D67vnGZaXmJptnC4RSYqxFuMUQurQKvQeT4VwIbEIQtsDImKLuSeWcYu6DPPjqX9S25EED3WHkA4lbMz7hlSHVleVC4Tvsda9kzuO3c+xI2dYa5/kcw/+Lik9JDoKa2v68tfH2zoYVyfen3/jXYYTg047zKYFQgg6mSIvClSrBULNk1SSkGqF1hotJJ1uEtyIZUg+EcRGEjwF2ZC/2l3yzF/1OSOGoy12Z1u88M5LvLv1LhevXGB7eJVZNaQSM3RLkHYUs2KKE665H0EFV2GvQsIJAncxWQXVFBmdihcX9qDAErY1FocTFrwk1Smz2QwrIckSHJbK2ji7kqQyo+07+LFmPTnG5x7/Er/76a9wx+pZeguzqUtXrP+H7z7Dt55+jsvXdrE+xaPRUiOcD4lISLyS5MKxP5kyGk8xpQXrIzw9zNJqnlTYgMq4GZvPpBeTVVAq8Y02oJQ0BG/hAo1Ea00rDRWVRDTGmhKLdbO4MLfDRsCrsBk2Oc6NWV3xPPHYWf7VH3yaT37sIdY/wHOqxfhQHOTB+POvve3/4599nRdfvkjWWaF0nrycoVsqDMldADss6q7N3eQFpnLkVUlRlRgXvXIWjPrmVgDznvYywOI2hMH6b4HKh0WrqwSDNKGXpqRaoVSClVA5T2kMrVaLfifFjPex0xH33nmCxx67hz/840/SW6s4nvXF65Pv+O8/81e8deUZRuVVtvcvIVJHSYklGtTJ4MQlhEBLgapN7Wqlhfo2qavMqC/nmtZpfFQ9m/BZeDgGJywiwBub8+GdRIiERKRIqaMmnUcqyFjhWP8Bjq+d4+5T93DXyXMczU6R0UfRWVqMft2xU4ULbUxINhupEDcn3h/p/noXjx2/6yWe1Z+iZD/xV/0eO1zde5vXLr7Ei28+z9vXXqNQ++RujHOgRYKWQUKsVrOvTNEkGC8NRtior2mDd5hvNVVUSFaxsqoRfS60ueZk9FBZBU6fZDYt6fV6eCnIiwJDkBRTQqNFSjWx9NQqj9z9Ub7w5O/x4KknGSTH2ezM743vPH3Ff/M7P+Kl195md1xivUa64Cyc6QS8xVhLIX1IVLZgezpiOJ7QcW2UE02lV9/3xHbhYmJa/CjX0m5K6IAadL5R/w8YvvCzbq8dIOpSNXZFNTEYHErbgKaskli1SvAGLUq0HPPkk3fzx1/5NF/5wq/e1fvXGR+qg63j+o73f/cP5/mP/9vXeP3CVdr9VSyacTFD6SQOOnUjflpH3frzXlBWFbOyoKjKYB8vIiRdEHebtw8nQAk/r8Rus655FRBHyloyIeloTbedkbZb6CRBZglFWeKcI1Oa1HmoSlLraSWGM/ds8Md/8gUee+IMnn1m9jIXrz7P8+e/ybs3XuHa7tsYkYMykIXpVGmDdFCidExW8+Tr4vtsdsI1Fh8X2jiiTlRB+cI7HcAnMVE5YRtiNEikCqr0WiZoHRa/PJ+Ar0h0j8RukjCglfTodzY4tnYndx2/hzuPnGW9d5yVZIMOg1+b+vtvc0z9Tb+1c5ErWxd58crLvH71VW4OrzCz+5S+oFAjymSMkSXaK1KRopzGFx5nBMIHFK0nVEZGGqw0oY0nQjWlXBbchiPKr/FeqsMtbHJETbCPrWMvkCRIqcmLAu8F7XYHZ6GYlWSyzcnN0zx631N8/okvcffaQxxZkEy69Lb3z73+Ft/54bO8eP4NLAk665HPLBhPt92jmgbtS4tlXOZsFWP2yhkjV+IstF2LxIVuSbjvw3PXK0GdxBYTVRhh+0B9Ucm8rReRvolSJHH9GPQ6y63/A8nKugJjDNgELRJMWYHNWV/VHD3S4n/8P/8Bn/rEQxwbJB+q+/9DdbCLcWPX+7/826f50z/7KlduTmj3j1K5hLy0KBVmTw1yqUbzSBlki4TAOEtVWvKqDLInUc1bKBkEcG97auuKy813a+EFlh6l1IIEi/NhzpMFS/G0laATgjW7NVSznARNP2ujvaKqRuhsytEjXT73+Y/z2c8+yeaRDNhne/Imr7/9A5596Ztsjy8ynF7DqAKRCoywmNjuUAucFqBh0dfcNI9d4JHNExXx6AK6Mp47IZqE5kVQf0f68GGsP9hInBVomZEmGbNpRRCXEaQiJVUtMtmhrfu0RY8nHv4EG92THF87w0bvBC3Waf8aFeB/k2Pmr/kL7jpvbr/NO5dfY2/7CttXLjApdtkx+8zMDOlsaP16qGSF6zlmfhpKfOuQxqE8obKRCuFElCKSWAEmIvqsCJJlwtXuucubvToxLaLj6vBzEUW0TqlKi7eCdtoN4rN7OavdDR6651G+9PmvcHz9To607sK7NpuqKwBee834f/jW9/je8y+wn5fMZjbwrsjwVuAtjXB1aUvysmB/NmE3nzA1hkoHI8/USpQTzcy5BkiFTt6Cu/TCeZ7PnGt8rKJRuReORGlarZR2ltFKkyaRhQTnlr4vyxyFIksCBWA22iNLKp585B4++Yn7+MoffZqjq+HNjWc7vtd+/wr6gxIfioN8r3j72sT/xde+w3/66re5dHWKam0iVQsnypCsliCzLFmjIyOk3ZiGh+GcC0z8OHs6yGgXzYK+QBgW8+9rOLMzgZMiZYLzAhshh2miSFLIUkm/ndLONFgHFhQJigRPhdYFzs7IUnji8Qf5yh9+nnPnjnA8E2Lob/hXr36PVy78gOdf/R439t+mYoZLK7z2qEQ2PcvwoXRLiSpUVnNts5C0Fuw2fKgcw7FEX62FhOUwOB+QhlopEp0hhMZZjS3jh1e5YDLpop2eC7BdRUYm2qSqRz87wlr/Dtb7J1nvHWdt5SRrK0fotdfY6GyiydAkS/pvH9SY+C1vgZycws+YjPcY726ze/kSb29d5Hz+LpdnV9nPb2KKfdqUGDsjVxahBKlXaBdMCZ0UFKoI1b3wKFkrGVmwUXzV1zNMFcE3OlA8ogmo8FXgIsXPQGPt3iSrOONshKBD6z38rSSflWRJG+kSRJnQT9a4+9hZPvrwJ/nIA09wduMBuouzqS3vn/3xazzzk5e4cOk6V/f3QSd4r7AGEtFCqxbGOCb5DKkFe+MR+6Mhs7IIM+eafCzmTgzz9z1H+3lo7GUCum8ZHCW9DAaXYg60FiJww3qdAKSpuWP1nGpJuT/Oy4PKusWWY4SZcu7uo/zJv/4d/o9/8ttF9/hFxof2wOt47dq+/4u/+RF/8dc/4N2rhnZ7LaiPC9NIMCkR51e1fFKsoKTUeKC0hqIqKYqCyno8aj7jgoUevT/wvVtGCUalbWlKpNB4lWFlShF3qBKDouLIaodEVmTSo6VAKI1DI1Ua4ORVQSeVSFFhqyFnTq3xr77yeT7+1IMgJ5zqb4pXdr7nX33nR7x19Xkub7/MzeHblGIPlUW47MJ7UiwmrTlnLISMs6gg5xTMCIsA0RZRRqcBoIS/USqcH2ds8JsKSP5IEajtTAI8WKkwvA8+VAolU6oqWJk7G2w/Et2l2xmwurpOr73Onev30MvW2BgcYWPlKCudDbpihZQOmhTnBW35z9+Ner/j308l45cdI3vJS1lhmTLyu+xOt7mxd4PL169wdeca71y7QDUd43fGjKsxN9oVM10hXYlyBWtK4rxhloJPNMqrILfhFVomqDjwt67CeBvmsTF5gQzVgpfh9vUS6XUwN/QBJegwAYAhQsvMRxBF0/p2oR0cABgquhjXPKJYzZSKtuhyYu0unrrvk3zqsS9w9sh9t3iovfb21P/gxy/y9LMvcPHyDSovMSLMd5VMEU5RlFBUBiskaMX13W32p2MmsynKSVoiIfEKZcJ9X2mDFW5pzrxk41FXVjWAYoHcLZE4G9roQgi01iSJIssyWlkwA/U+eIe5hU0fBDK+dxJnE7x1uGpMO6m45+51vvCZJ/jyF5/i3rt/eXy63/T40B74Yrxy1fg//0//xFf/6ntMZmBV0kCvpZRoGeZYwolGqFIIj0p0sCvAU5aG8TQnLyqc1EuVlYhl/m2TVR2xqpI+kN+89xifYqTCyCQ+T4V0BlsMGXQSVgdtep0WQiU4H1KZd4JUa7RwtBNBqgxVvk8rcXziY4/y5S99mtNnj3I0k2LP3/Q3yzd47vw/8OOXvsH1nTewyQwjCqy0LE+t6sUqWBwA8wTkg05bPafyfoYQIbkIocCrqFigIkxekqYpQngqU+BchZYgZPAx0jXoAhBSU5smehlsIMLCF7hMxlmM80GpW4pQUZU9MtGl31ph0F3nyMpx1leOs9k7SicbsDHYJFEZnbRHp9UlVSk6aC4EqSM02Xu0Fb3f8uFc/GrgwlO/4ysqZm7EpBhSlEN29i4znm1x+eY7XLz2FlujG0yrKbNqxriYkIsKX5VkuQUFRS/BpgLpHNqUtH2YERWphEThrMfaAOlOVYKsQiKJ2kDBngNLaQ3GVGgd7kcZ0X3117oTYUWFleH6hWQ1J8cTZ14iJjjpNMLrUFG48H3mM7TNePzBj/Olz/4hZ489SGp7bCbz2dTOjvfPPHeBbz/9DG9duszeJKfygqTdwbrgclBVFlcJhEzwUrE7GbG9P2R/NqGwBpCkUpEahbKC1ITNUa4rrJhD6cP1FvP5lVv+ed3OrEGcwgWUpJSSVpbRafdotVOUCAnJeYtzocOAEM3nxEWJDOllmN/KgjN3bvAHX/4Yf/Tlxzn2HlJgH5b4UB/8Yly8av1f//Xf8x/+t6+zVwzwSR8hbMPqNSaQGrMsg1qxXVYE30OFs5KqlFTGszedNdDWGkvnoxCuc45aek/4+WOcmPfw66Tg0IHH7useuYtSSEEGSUtBq53S7XbJWh20jhWgKUhUEMUUeIQ1KOnotBLabcHv/95nePTRs9x9eoBjxKS6zPbuO7z+5vO8cvH7XNx/llLtY8qASlJKkaZpWLDKnKwVDPFQoUoSKriTOuewokLoMlamGmElIiKxRFQkECQLx10Btmk1BjNEuTDvWOa0uEaap6ZwL7ebvBP4UoINrSrpFZIgDqpEgvQJJ46epJW26XVXGXT79Pt9BoMBK/1VeukqK+IkLTmglXZIVBb/XsbWjIgETY3+ORJW7ne8w+BxUeWvwlLNz4M3VMZQ+Am75gbDcpv9/V32RvuMZyNGo132xttMZkP29repbE5uZsxMTmWCHxexgvU63Es6kmuNrNtVYfYk4mzSxeqhpmcAsdIJGpGiaVdHzlyt0BCRoxDkgp1zTTJqDE69x/tQHXsZuFLOOXrtHlq12N8b0856JDLFG4kxjqp0nByc5BN3f4JHzz3FPeceptdeZ1Xe0Zznq0Pvr16d8uNnX+aZZ17i5u4+Vmg8waMNpTGEmbJ3QZjaGMP+cMzW7g6j8TRAbQFEuB+VCMCRuv1n8EtV1cFQB5Ur/DyZCekxRRGTVJ9Oq0ums5DoXIn3BlSFkOGzXFoX4ekpiAzpKrSb4u2Ic6eP83tf+gSf/8zjnLvj55MH+yDGh/4ELMbzP3nTf+eHr/K//9cXePfmlDRpkWVtRsMpSdal1+szHo9Q2uMpETKAMQL8NMU7jXWSYT4jNxVVWTY26vWeaK7AvZysFqMZ7B5U5L6lbRCgsWma0Ol06Ha7tLMEafNAIPRBeSIMxgmwdGVJteXM2SN84fNP8eRT93BHKzzh5eItf33/df7xmT/j9UvPsr1zjU4/IWnDtBjiqGj3W/PEEfvuxpZ470l1QpIpZnYUWppOIZxCOYWIfJGwa4xtwQa6bGOryEbkYW05F5JPXeFFbmWUvBERPu0bXy4n6hlAGG5j47mLbScZW5bT0RSlEhKVoWSAZmuVkqYpqehzvHeaTjKg0+7R6XRoZ22yrE0n65DqjFbWRQlNIpPQbhIBgixi+9cG1lCsCCuMMUGt3VZYWzGejiMCMqcoZuG/MmeSz5iZEbvmJjM3paymVLbEOUPlS4pqijEVrU4WVUgC9y/cQRIholCuCVslwVziB+pCScQKuEbjhaTVoFKlwrvQ1g3zx/iwyB2cF0jhb5wP2huOeYtc+tAcLk2F9wKVJOH5nUNrjTeh5ZfKDpP9nMS3ueP4GU4eO825Y/fylSe/QpdVOtmBlt/lwr/97hZ//w/f5eqNPbZ3xwiZkGZtQDbVdW4rnA96nnmes7+/z2g0Ii9N/NzUB1VzKRc4lQSe4+1iDghZtqlf5I4JGZymW62UbntAmmQhucXkLaSjKCYoHdDFAWCRIEgojcCVU1pin3tOH+F3Pv8xvvS7n+bMiZ9iBf0hicOTcCDeuVL4//jX3+Rr3/gBly+NWBkcpzIJZeXRmca5CpmEjyfEmZZSja6XR1BYmBQls/GEoiiapBKIhTVUN9pRL0Lj6w/AkmK7X/j3smmbiyx78GRZRq/Xo9dp0U6JUNkkfFCcQPhgCieFw5YTBgNNuwP33nOSL//eJ3nw/tNAiWXMpLjJ25de4IXXv82bV3/MqHoXkwwp/IhpZcjSFOclWoRknkqB8AZniwhBDotno5rt4tIZq6UamFG3iFydtOJxK6sJM40gOVOfhxpOb4ltv3omAguVbBTa8B5v4nl2xOcL70FFtKKIztHWzCHGUkqmVRG0+FSCQMXRe01n0GidIoVGCxXEh6mleOZakTUfxzkTr1OFZW7O57wJrc1InKYWNnYeLdJokGkRwiKVAFUndo9xoSILagpEcm54PUstpjo/X3V7bnGxXbzfwumpQQUOV5N6a/1CP096taakjAAa72sHbUKlIjw6CedyVlimpUGnWVCJ8Qa8IUEiKkdGm5YfcP8dT/DJx3+Hcycf4Wj/JOtqOUld27P+ldcv8swzL3P+tXfYGxdYq7BCI2RAk5bGYIzBIVBZSlFVTMYzhsMhw+GQPM8ROiFNU0zl5jfK4ufOLwMrmrN1m+QVNicLwAs/51St9jpkWUK71UJKGe6v6GFVgzPC3G+OMq5b3dgpZ0/2+crvf4ovfO5j3H38w936W4zDE3GbOH956L/2jaf5q69+jxvXDf3eKWYVTPMRnX4bVL3IhMU43IQOKSIkXbUoKkM+LZjmE6rShv40EUEXb1J7UJ65DuFu+VH4m3miU1GrzNow54EAZ2+lmpVui26nRa/XQ8sEW1psZZASskSSJYJiNiRJHWnqGPQVn/jkE3z2Mx9nba3LyVawyb3iz/t3bzzH0y9/neff+DZTt0NvvYUTjqKoMJVFS0kqFN5VENs+zqXM23e1n249w6hbRkHhw9dKCMI1i730ASk2nw1EgElEjtnYHmzafwuKAo7aULNeSETzXkRU2XeVi6CQ6OAcnZOlEHjtER2PU6EqCPbjBLV9oRCElpUQas5Fs/U1EmGxVKqplesNSt0W8yLA9sPswoQNRFzkAvhSo/IU4RJk5LF5TKxkAr9NJXHBizNDZ31QBI/oMq01TjhkvTmok9YiyrNZmJelwJx0OGljteUb8EBw9I3XJghJoUjCufOEylkokJ5ZPiRtJSCzoHoiNSZurFKhyEczjq0c5cG7H+KRc0/y8J0f5c7BPfQW+FJ1vPj6jn/xxdd54fybXLq6xXhmUToDmeKEorJxnilCMnUIxnnO/nDM3t4eeZ5TuysEbzk171QcVJj5GZNVnXBYSFRKSbKsRaY1/V4HpQSJDoAha22zYVI+QaApyxIBaAHWFBib0+lmbKxo/v2//R0+9+nHufvYYaJajMOT8R7x5tbI//VXf8xf/uX32N4RpO11DB4jbMAUCEct7iohzGioouhlGmYrxjMrZ0ynod1jo2SMqP1wuA28XdS+UbeLyPZ3bmGBEzhnm+eWOFqZotfu0Ov1aLdaDcIrVH9Q5hNWV7rgDd7NUNqBrzhz5i4+95kn+NRT50iSgvVsRdz01/xefpUL11/mjcs/4eruq9zce4PK74OYhXaGF8FjiIQkaZHnMVGIIOHkhMFhQLjQvGp6SYFgjU9ioqoXgVA5NMr0C+TSenPQEFO9b0wyIUxXfF151K2ZmvMVockB3zJ/HhkXOSUETjnGboJXtkmeQoimkpBSNcjE8IxzTlltA9IodSwsZgH2HJJVkiQxCZr4dU4HwClarh1alj4oOzgXzp2IpU1tix7uiPpkhpavF/MKvH4PdbKak9XFfLbEcuIDh5NxJlsrlIi6+otVFgIhEpTXcR6pwnySJMxsTI7UsTJVCcbAZFyS+Dabg5PceeQsD519jCfufYK7V86yehswy1uXnH/5pVc4//oFLl68xu5oipAZutVlPC3wUmEiwMbXrciqZFZW3NzaZTSeMp1OAciyNlLKWLkuJKcaeUj9s+X56MGoZ3h1JeTiaydShdlxp0/WCtJaeNtUwrXTr3carEaQgfVkSiOFYTLZRquChx46y0efuI9/84ef5NTmYaI6GIcn5H3izcu5/+pff4+v/d0zbO9WyKzPtKzwEVQQqpvYzxcGGRcU60QkD4eFLc9zxtMpRRGY6XIBLXhrDcVtK6sQ82QFC0PdxXmYtw3XKUkSer0eq4MVOu3wgcU62lnKcG+bVpbQ6aaUeY7SgnY7w5sRn/7YWZ544gHuv/9ejnfnLPkL1Qv+nesv8syL/8DW/pvsjC+BnpFmYIWhrOpqJG18sbxwWBEriSUycfQz8iIO9WvVCxc14V1jMVHPGOYGfHFRYaFKxYfkFzDYgFtYdGqwRlyclrbOy/qMTjqEBhvdfo13gQS70Gass61YmHnMd+dhdrQ8b5RLCcQtvbfwk7m+osYVvkHYhQZnTBZyuTIPQiK10oKKiVPgvFlqi86VEupjDQtzMzEVi+fV4SnDe5Jz2PnclSCS41HI2FlQTsb2qoxtUk1RVFS5I9UtWrpPSw64c/Me7jv9CB9/9HMc797J5m0AKjtbhX/mxUu8dfEGb114h539MdYJjFdYJ6i8ROkUS6AYltZQFDNGkzG7O9vs7Q+xTjZJqe5AeCfmvKmFewFYAp6/X4iFT6uP1btSgnaW0W636XQ6ZImGOKt0zoRrJgPK1FmJNZJEdsB6lPc4MwE35PRd63zlK1/kK3/wCJsfEq2/nzcOT8pPiTcuT/3f/cMz/OM3f8LFKxMKl2K8Rkgdqgppm0VFC42XAmNKhBZIMW/V5WXBdDolr0pMVauSy6WENedvvH9lVS9Y86HuPHFB3NHbsFtvx1lWv9uj3c7QSuGcYdDtYKqKosgZdHu0223wFiENptxhY6PNRx48zUc/+hE+cd+p5j4Z+S1f2AmvX3yBVy78mKt7r7NXvsW+uUzJFl4ZoBVqQy9xURLXx3ZRiBrqHKon5SHYIIQWYcWyBlv9VS4kq7piCANqsXA+7RJ1bfE56gqskdGKu+nF8wYumimGtqMToJBLraH67z3zZATEVtR8TjRXOpA1ZAxYroxg3r6rYRGCJLyejXjH0GeDSB7VOioguPo+mFcFeBE1G28fgSO3vFgvcuYkBunzSOptcKfYuvKQIlb0wdJDSItwATigCKovdqbAtOjIAXdsnOXeUx/h7s37OXvyQR499tH3XHOeeeGKf/7F17lwcYvhyDCeTrEOpG7hVYJ1ksp7itJQudBOzYuCyWTC3nCf8WifvKji+wy0EqWCCKyJM6P6+2a+eNsqalnBZf7TuTRUzaFqtVO67TCjqikdNZgioCQDaT5QNzTeSWzlwFQIW9BrCc6eXufTn3iEL3z2Ke4/fYj6e684PDE/Q1wbGv+fv/ptvvo3T7M/VszKBCHTYKXtq+ZxWqRhoEqF8/HDkWikUBhjmE6nTPPQFqznLvNZS4gAMf7pyWpxgXXeNgCBMI9QzXDcmGBf0W1nrK2tsNIf0GqnmLIKM64keFJZawOaL5V0+hrhZihRsLmS8fA9d/HUow/x6APLM4Udd8lf2XuNFy78Ey++8x12i3dI24798XAOfvAe51lYjBcX9AClDjOq0JAyBPkee9tkBXWi8lH9oK66vOOAasitNiZucTZzEGkp5kk+laqZly0KGTfK2HI5edWK3A0XJ3SKm2QSXnv++KVr1VzZulUosb5uM8Xdu6iPpVY+8A2gYxE5Wd9E1jGHpEflkUXwzmLVFd6QbKgTAoewJbVFjEfjhcajw4wR5i1oaZGidvEN87eEFG1X2Ozdwd3H7uWRez7Oo+c+zt3JA++51rz42p7/8QvneffKTW7c3KPIPSH1SbxQCKExTlJaS2VAqITJLGc0GrG3v8/+/j7j8RiEI01TKhvOXZglqwaMVF+rRYHpnzlZCRfvv/B4pQWtVoter0Ov0402Q8HZWcTr42UktNftbB/cE2xVokVFN3Xcc/YEf/A7n+CLn7uf9d5hRfV+cXhyfsa4Oi79N775In/51e9y8coYa7PAmNHhxnc2LJzhQ2yoWzv1LGBRDHM4HDGaTshnwdgtsNoXh7Xz75cU2eNuTallnseS3osXeJFEtJuNg/wKJcIHLFWa48eP0m61aLfbaKni8DcANHQqaHU1zpakQEd6MhybvTYP3Xs3D91/Nw8+MheQHfrLfswuu+U13rz0Khcuvcyl6+fZG1+nqKakLUGSCQo7w7g8CtuGXbGKcxZnPFpoJDLsjHUSuTDzec48cc1dln1DMA3nuDn+hQQ0P3dz7kydqBD+4LIdfyzmwqSAF/PENW+dsXxtRN2Gne/A52235pkPJK1bP34eiXdzma9lNGj8d7OXWUT7LbQho5FfDeqwdWs0ctnSVhI8oiACYsK9qkQAjyRoytKExV4rShNmazpNQ7UiE4pZSa89wBmHKzxZ0qLb6XH6jnt54NTjnD5+H2dP3s+q3KT/Hny0V9+46Z8//yYvvXGJa7szKqvxMgFTBA1CqQPZ3TgKC8YFlZTxOGdnd4/t7W1G00lTqd5uE3DrNZgfc53AasBEDahp5MKaDWG8/1xoB3S7Xdrt0LFI0+he50zzXKnSTCYTBBlCpVRVVGPBk+dDum2JNXvcd+Yo/+qPfocvffYRNg4T1U+NwxP0c8SrV7b8sy+8w3/+L9/h5nbJaFQhVRukojQVeEnWSnAuzhhi+AiRrdcmaxzTfMZkMqEwVWwLWpTQqEQ3O/g65h++OcptKW5JVhkgkD4AHAK/gyZhKaXotVsMBgO63S6ttI1KokipCo/x3pEJQVsptC1QtmStl7GxlnHu3AnOnjvJIw/fvXT/XPPXfc4251//Nte33+Ly9Qvs7F9lnG8xq/awaoZKLSr1FCZosgXAgsdHyxDjA2qt5kzVIITF86nquU0N0GgywELCOnBnL7UVm1Pll85lqC6iooBfaPVhD1i8LGghivl7nV8OFy/J8pvwLC+ci8lqqc3oZSzl5tXf0jVfSlZy+bW8jNj9ML/z3kZdxvqPHKUpEDJuTqSiqiqw82qtNCIKDIfHJ4kOHmRFRT4taCddZuOKXrZKNxlwbPMu7rnrfk6cOMXZk/dz/+ajDN5HEf/5Fy77i1eu8frbl7m6s8+kVFSkFFZgjGG116GYTigKixcSpVuU1rG3P2Z/OGXr5g7ToqDIq6bSbUA3dVdiAV16u1g8n4vJynuLWNgk1htEKQVaBR+qtbWV4FGW6sixtAt8SoGrSqRMUbKFNYKyDE7aaWLxfoI3+zz+6Bl+78sf55NPPcSJlQ+Xevo/Nw5P0s8Z12e5/873Xuab33ziTe3JAABEPElEQVSBH/3wbQqT0OqsBCkaOyNJEhDLlc98Fx4qrCQJFh95njObzZjNcmZlHgbUiW6InnU0bTC5vJtv4kCysj6JyLRIRPS2QXdJCWVZkqUp3W6bfr/PSq9Pu9elk3VIkiwOzz2J8rQSAsrRzhC2QIgK5Us21lc4fddJ7rv/HGfPnubE6vyNhbnWFtt7V3jr3Zd4/eLzXN1+jandxukphZ8wtRNEKpFpQmEtpQktMJwi9cEcr1asrrlINXl1nsxlrLSW+UTUZpG3AbAsouWaanepehEo2QIfZZ5YThTBCib++wBX03kfeUnvAZBZhIsvvu7ioioc0rtG9DjMpg7MxuLz1ND05eePx177tBMAK0LOVfLlAqJQ1S2yKA8kVcbUQNruYIqc2XiEJlSzqcgYtAYok9LPNjh78kHuPn4v5+78CHffcS+DzgYr76GZeGOr8G9dvMylKzd5+8oWWztjdoZTLBqVJJhYdQZZs9git1Bay2Rasrs3Ymd7j/3RjDwvMTbMggIpu26bxmt70C/uYNez/jzBnP/IfFMQKlob9RFDhZllGb1Ol1YrZTAYLFESsPX96JoZNcjgniyC7mJZTEiVYWVF8tijd/HJj9/Hpz/5CEc6+nAN/hnj8ET9M+Pr33vN//Vf/5jnX3yHSe7RWQuvLGVZIlUW5wn14hT+poFQS9GAJIoqZzbJGU9HlHmFsRahA4BjEUgRWhy3aXPArZWVV3ihaNBbUaapflxjQUJQFOh0OqysrLC2ukGv3SNTLRJBaGeKCqkrEukRMsAlulmKdJZEKNb6PU4c2+Ts3ae499xJjh/ghsz8Jb+fX+P67ju8c+08V7Yu8Mal8wzLXSpV4FPPzOWUvkIlQYdRzMCZ0HoJPCwXFRsiSnCpNVprqUWSZkS63S5dLEpgxVMVn2NhfuU1WrYiOOTWyitcx4W24G3AHI324y0xB2LMEYoLEdGQknCtmmtfdxXr+dxCslp63eb3izMZi5eLIsShErFlRVVZtFRkSQvnPK4yeKWZetBJBlW4xi3RYrqXk9qMu0+e4xOPfYYTa3dy+uT9HFm5gyPZXbddR6Y73t/cnXBla4tL17d459pNbm7vMy4dTujmPrfWU1VVmHklGePRFJTCGs/u/pDrN7a5ub1Lnpc4L8jSTqjGfbTxiRubgAD0PzVZzdueC3PG5nNmkYjgxB2rpTRN6fU6rPQHtNvt5vHOm1DZNc8/R7o65/BGkmqNq0ry8S7Hj/Z59NHT/Hf//vc4frTN0f5hovp54vBk/Qvi6Re2/F/+zbd4+kcvMZxaVKIpDcFmhDA3mA+551WRtRataxFciyktk9mY8XDCrMixEYYs5YE2hniPNiDLO3/8AWZ+/bvYe9daNwN8a4NCQqfTYTAYMGj3OLq6TjvLSDPwlFhKlA46gBJBO20jHUjn8VWOcAUrvYTTdx7nzlPrPPzo3Zw6tnbLvbVnrvjcjnjj4ou8efk8b994hb3iGhO7w8zvM61GTCcTNvpHcVVoAQot8dLgnMESqAFmiUclm5lNDcBw3JqI3i8OwrzlAe23xXM53zm/T7LCHVggF5NU/eDlZBV+F0EUsm5ziuVE2iS4+X0xb4fWzyUWIP9hxuII8OnaZt0Yh5YanCBVKalqM5vllLMSlSrIBGVhyEeGtc4x7rvrIxxbuYtTa6c5d9dDnD1xHye6txJ4F+PtN276ty/e5I13bnDlxohx4alEAM6olsYJgzFlFNCVSBJcKZjmJaX37O7tc+PGFrt7w0D5cHGm5IkgJtEcj/A1nUMi5fL1XLqGdU6P2ob13y9uCAG8C8RypVQEUfTo9tpkWRY+s5VZevzBysxZSJMEZ3JMMUNRsrHa4lMff4Qv/+7HeerhX40I8gctDk/avzB+8uaO//o3fsg3vvUMV6/to7MByBaLkOjFnXgdQvqlZGSMCS3BvGQ4mmIXFqpFqaZb5hcABz6cjeYYQD2DiT39uoVWw3qBZiaktSZRmtVOj/XVPhubfdqdFKVDVRdsuHW0dPAkArJUkSYWQQk2B5+zvtnl7OlTPHDf/Tx09sgt99huueVlUlKwy+uXX+DpF77JhauvYlVJ2pLc3LpOWeZYa5CJj6rfBi89Sgsqe4D0W8soCUEtbrt0dn5Kwmqk4oI5xhKfpr5ui8nKmLkaydIVuF1bb+l1AmjkvcinC1OUUMUt3AP1z5fbgf42yYoAO49tKZhXhI0CSOlppW1cBa4C4RT5tESrlKObx5hMZtx1x93cceRuTh07wwN3P8rJtTN01ID15PazqJ2J98PxiK2tLV584TzjccnuXsl4Bta38CrFC4mTHi8tQofNSFVZsBpnFZP9nN39CbujMbvDUVCgqCq01ugkwftw7qtIxtVCBvFmT+CW1UghcetmI5yX+DWWQiry9Jq/A6QAW5Wkmabb6TNYCfqQWuv55u42t9Niogq0aUeZ76P8lLN3H+Wzn3yEz33qcR6574Pvr/bLisMT9x4x9Tu+8zN6Fr18bej/7hvP8e3vvca1GzMmswKkWlJjhnnS0nJxR2cbKLBzjrwy7O5PyUtDnudNK0JK2SSrWyqupcU5SD6FKiokKikUoOOiRlRST5BaNzp6NTpKOIevSrqdlJXVHmurPVa6HbrtlG4rI8sybFmgE4VSAuPLgDZMoNVOgjqDcXhjaSWS40fWePDcXZw7c5LTJ3tL57P0N/3MTxjnQ8blmJu7W1zeeZNXr/yQ3dlVxpM98nJGYXJm5RjjLVKC1KFaXVy4Ayii5hHZ5SrmPSS0FxNQOI0yEmENsLxzDo8RTbK63eywlvt578F+RDgenFkdfJ5bBm1RqUQs6MoxT8pLGxjnEW4RPVm/RlQI8QpbQabb2FKQyIy13mb4Otjg3KmHuGP1Pu4+fg/HN46QCEkqEtZad9z2JN7YM35rOOWtdy5x+dpNLl65hvMpZeXCefIhocxVHxyz2QyVpEiRUFaC8bBid3/K3u6YybTg2vY2ViwYnRLmgc4bTFRvcT74oCkVkJvWmjm1QGmWCb6xs1Gf37r955YrKiUkUgnareDq2+uFtl+dqLxZBlI019nPjRRDNaspizHdtuWes0f4zMce4nOffIRzJ7uH6+2/IA5P3i8orsy8/69//yp/8dV/4t3LWzii0rSsHXPnbSNBDT8PCSLsEMPMxVhPYSXjyZTRaERRVCxC2K2/lT+EWKglIogifHgE+Ch7I1STrIRQTXJygJYSVD2wtySppCpyhLd0O23WB13WVgYcWVul32tjjCFrKZJEhxYdlpow5S1okZColFQ6tKhIlOHoaoczdx/n1IlNPvLg6fe8767bS35oLnBt702uXLnE9e0r3Ni5xtbedSazIUaU5NUEJ4IahpNzlNucE3VwtV9umy2dv6XNRLgmAV5/azJpZpBuua07vwy1TckC9+k9whPQfrWm3dLvFgAAcxX6+bEsVgLe+2bRDd9HgWPvg76iD0aVwsto06JpyQ6d1oCO7nPq+N08dN8jHFk7waC3yp1HznFCnP2p68LWbu7feOcyV67v8c6Vm1y5voNXCYXxVFYiVYJWEYziDM5UDYjDo5lOCyaTimnu2B/OuLk1ZG84oqx8A72vjy/MDmMLXHq0lLGFaFGyJmkfvCa3OYQF+azF9p/wc8KwVpLjx9boZClZ1o5tX99sUJRScb42fw4W+HTSO0w5RVLwyMOn+b0vf5wnH7+XO9cOoen/0jg8gb/AuLKV+ytXJ/yHP/8Gz/zkdWZVUJyuvEckKWVlkVphvaDTSqmqAmctvSxDCjBlDlIjkjbGBg+g0XDMeDymKKJenkrmvJLI0RJKBrWBmIDm8IIFoc6F3b5YKDvqxdILj/CigXMrLZAIrK3ABYmm1ZUBq4MORzeP0G0ndDptdBI4JtaVBBt0SSvNEM4jhUdpSIRDUJEoj1Zw8vgmR46uc9edJzh6dJMj/VstEPJ8x3tZMa3G7Iyvc237Xa5sXWRncp23r7/J3vQ6+8UuXhdUYsa0mOB8idaaVKXNLr5JTtF1WChJWZYNyGVRgkeglmY7c0jzcuvV1thxWSe6+HsXVB/wy4ttfR1qQERY+FSjkFHPmGQE1TT6ic7CwqmpF0aIf+NEFJcNbdlgRQKll3iVoFzQ7ctki43uUU5s3sHRwQmOrJzkyOA4JzbuYGNwhEF7jfX2+8+gAN65VvrxJOf8y2+yvT8KYIlZmCc5L7AE9Xep55shKTVCBtRmVVmKylAZ2B2OuHlzn73hiMmspCgNNnYCal+ppepwgR5QK8bUd/hiy9N7hxQ2PINQzZyrVrWQUlJWcWasQ5Vsq5I0TVldG7C20mOlnaAJJHLvBM4FonVNYXAuEKCJiESJwhQG7wW9zLPWmvGRB+7k4594gicef4Aj64eJ6hcRhyfxFxw7e8ZfeHfGX/7tt/jxs89zfXsPr1Pa/XVmlcU6EKpul5V4Z2gphbMG4S2tTo/KBKsHZ6GqKmazICkzmRZBrTnqrwmdRD8pi4kD4eAXtIxGu6US+2mggwWUlHMOH+G7qZYkStJpt1hb6XJ0c4OV1T5ZFvyygjW9IJWhTaekRKmwmONKEA4lfeCnCEsrVayt9zlx7DgnThxjY3P9PXegI3PTW1lgxYyLWxe4uX+ZazsX2dq/ytbwOlu715nkI4wrMKZsNALrCsl6E7ylvKHd7USibzQflDXKMgI27O0/FrWHVN1qXfzNfEgPS6K80PxbuHBOtU4jsXlu81IDBITwqFSxSIR2sf0Y1M4V3ji8JYgHO4FyAfgSfp/S7R+h3e7R76yy2l1lc+UoJ9fv4tSRO9noH6OXDUhos/oe86fFuLyd+929KVeubfPuu9e5uT3CoxiOZowmOVIltFotUJKyDDp9aZo26LzQvpPklWEyLZkVJddu3GQ0LZlOc8rKhCQXCeJSSpyxC9JGdcKyEUizMF+qz/4CsAXCJkngcF4EgrWM502GZOiJ0H1vSVNNv9+nP+jSbrfIlCTIUEc/sjg3rOW8nABvoruAqbCuQsfrKAUM2o4vffxevvzFj/HQIz99A3AYP3scnsxfUjz/Vu6/+/QzfOOb3+XCxevotI8XYdBsnWz04pJEkSYKWxZYW9FqZ1TWRT5P3Gkbz2QyYX9/wmQywdiwY0VqvBdYF31iY/VwC1GriYNzjBgH2ma10KtsklZdOYR2jpLBXG7Q69Drtej1u6z0e6yurtLrtEiVDL5NvjaadAgsOpGkGspyRpZKlBY4W4J1dDotjh0/wpHNNY4dH9DrJgwGA4735nOuLbfnnS9RUuKj027lZ0ynY/aHe+zsbbM/2+bCjfPsFzvs7+8yHO8HxXthkMqAdBibY3yF8yVe2DBwlxbvHd6DVq2wgC60h2qASz07gXo+RuNtViP4hFBLVcFBqLmzHhkh9jXwpa7kFJ6ymjWJ0/vQVhRCoWSKllmYNYkWraRPJ+vS66zQ76zQ7/Tp6gGnj5xhtb3O+uo6qyubdLIOmhRJQlf89AH/pe2h398fcf3aFteub7O1M2I0Lpnljsp4jBVYr4CoMiHAxrZz3YIOIamMZTrNubm9y7UbN9ndH2I95FXgRQmpQGnqxqcQoT26mKyCULRruGO3mxcuAUwWZpDh+yi5FDcVEoFzhlRLVlcGbGxs0O92wvzW2DkU3pexvegCOMYLQOMqGTYeOBAVphjimXLPPaf4+JMP8jsfe4T77lk5XFt/wXF4Qn+J8c6O99/57rN86zvPcv61dxhPPO3uOkK2sT44mWqtSTMFIhj0EdW16/ZVrW1mjCOflRSVYX9vRFlWFFWwqtBJC6VilRWRagdFOEP8bMlKUIt9+rhY1zv7OGOTAu8sxuaAo9VK2Vhd48jRTVYHK6wOeigRyM9JqoLiBBVKeJQCgQnwYR9kqZQEEduRTlSkXU2nn7Gxts7GxgYbqyusrq2wOuhzIpViy1R+U9+e9X81v+xNNmZk9xiO9tnd32J/f5fd0Raj8S6zcsTu3g2qakZhc6wtcMLgfdglG1cForKrcCYoxYdNQ3RFdlUAmEeFBCccwnucCDOiMCuSWMIsKXyt32psB8ZFudaoqxdTJQKiUTlJojRJkqFkipSaRLdIkw5p0uXUyTO0kx6D7jor3Q0GvXUG3dWQrOhzVNweDPFecXU49nujIbu7uwxHE65f3abILePxlOmkoCjBegmkCJlSGhAyzEGtFxRVSWUNSupgbmgM4/GYrd09dnZ2GO6PmcxyZkVJaSxJ2gpQdCFRUuNlbBvaUL2GNuDCPfkes8PbhScortctP0Ww3FlUQdFK0Gu3WV3pM+j1aWcJSsxbitarmHzzUIELE661FeASNBneOlxZIMSMTsdw6s4VPvv5J/jdzz3J0UPV9F9KHJ7UX3JsTbx/+dXr/O3ffZvnnnuT0dih0j4ejQFsdNbVmUZqgXMlMlq817DkudJ1sE4fDseMpyXj8YSycEiRBNsRLwKpeAFbu9jPn0eN4b19BVYrAhzkn0gfWmZKKbw1UUA3KGOkSUKrFazhN9dW6XbabK6ts7Lap5Um8XgCeEHJ4D3kvEEpQZZqlArKBZX3iKwNMrQWEyVpt1JWB10213r0ey1OHlmj09K0EoUSlo1B61Z4vN3xQvjG6NFQUJkcY3Om0xHTcsx4vM9kOmIyGzOZ7DOdTZiaIROxz9ROKIuC0hSYymFsSVVVlKYgUTogDr3AeAPWYbxFuCjea2yUbgr1gaoBHNHCQ/hQAadpRpqmpGmLNE3JkpRMdOiLdXrpgMFglZXBGv3+Cv3+gH5vjVbWRcuMRGSkdFj5GSql28XVG5Xf3h+yM9pnd2+fnf099kZDZrMZ5bQMYBupwCtctOcwLmj1ZWmbWWEpjUFGl+zCVEynObMiZ3trl/F4zM5OeM6yqECGFrVUAYJuvQBR2+wojF+YSTm7pODR3LUNxeD9wCuSyqkIKhJ4Z7DWIKSllWiyNGF10KPf7bA+6JPq0I63lQm1rkooLFgBkuDrFdQswBsBVoIRKAG+mrKyqvnok2f59Gce5p77j3K8kx2uqb+kODyxv6L4yfmR/853n+M733uOd69s4USLpNUDnZDbYNooEo3zJamM9gs1Yin+O3CjNNYLysIxHs8Y7o8Zj3NM5VEqaezDlz7kB834GsDU7ZOVt2H+tWjBXfNL6jmWjEgvWduhR56Lt440CWTK9ZUBa2trDPpdut0O3V5Gr93CuwqdyCj7Y6jKHO8trTRFpR32xiVKJ6SJJpGCREMqIU09qYTVfou1fov1lT6DXotet0W/m3HkSP/nup+ndts38jwiVI0VM27mV8iZUpZ1gjJUVUVlylg1DGOVFaDMNTKtsfqICgmhMtZNe1aJ0NbtdnpRW65Fq9Wik7Vot7tkWUZbdljTx0hp0Xkffb2fN7ZvWL+7N2I0mXFzd8hwMmVvOGJcFBRlqHhMfP+dVooznrKyWOswTkZjxSQmsGAjX1aW0jjyPGdnb5etrS32xyO2t/Ziy000FeScpC3wsU3qqTdhsbISwTm3tmi5JcTBJBVmWItoSYcEEZyqvbehzYyj09L0Bz163YzNtdVwX0kViO3O4m1QVfdKkTvifCu6OxuLd8HXTDrIp1NaGo4fXeFTn3iYL37+Me47feuG6TB+sXF4gn+FcfGK9//07Wd5+kcv8O6VbYYzi0rblEhKJ/CRzJtKH+ZFqoa7x8GxDMKvWoUPY1V6JpMpw/0pk8kMU4UPeOXssgZek7iWldzdbZJVQBpXzQLbaBouzF6WhWXjwizrKszh4i41UZI0Tel0WwwGPY5urLO6tkKqA+ou04p2p0W7nSFlAJNUVUWv223mBsJbpAh6donyKOmxJidRkGjCc7QyBoMea6sD+u0WvSyh28oY9LsMfs4E9n6xa3e89551HaqZPb/lrbVLicr7ZVmsGjQgxNzfbFX+8omhV/cKPxqO2d8fsbc/Ybg/YTIuyCuDR5GXjsoEDTvnIzw7+jQZU4YnEdFAtFY+Ly2VcQFIEYE/w/GI7e1tbu5sM5lMqIxFJ+2AoIuoVSklIpLQpdTR1Tq+hBBzwEN87HsBgA4KAdeAFLfw80DRiO1V6Ui1DPPVfof+oE0nS2llCc4avLEI44LKvgjISucFJQ6vA8oP60LV5YJWZqY87dRz1x2bPPn4PXz0ow9x+sShB9WvIg5P8q8hvvvD6/6v/+6b/OjZ88ycBtmmFBqdtZBCNwCJWucsfNjnqDXvwo5dqWAHX5YVw/0p+7tDxtNp2CE3O1kHiDlPZWEheK9kpeWc2b8s7xOSVsPmd+4Aki4kyFRneFvFiszgXUg27XZGt9NifX2V9fV1jh3ZpNttU4vVJklCS0twBcq7WLlJEiWieKxvEFxSBX5YDXyQPngZtRNJS0AnU3RabbJ2i06rRbfbpT/ocvTE4AN3z+9eHfvJZMZoNGJcFmyVOVNnKfOKvCixlcMagfdB4NY6iTGhjSmFxjmoqph0AWPBeBfg2l5gnQ/Jqghz0q2tbXZ2d9na2mF/PKIsS2wtYCgUNvqpKaWRUhCckx3W1nD2OaVCqYDOm/tPSZx5j2QlakDKXClESM/cLTnaxziHFpBmml6vw+pan36/S9ZSaCmDyrwPFAVva57anPdWeQdKhjausbjKoIShnUIn8zx43538zhee4tNP/nyzwcP4l8Xhyf41xU9e2fbPPv8qf//tH3Hx8h66tUJuINFtpFe0W13KKqixt9ttVCKDtcMCOq1GlEkZeD3FtGAyy7ly9XrjpBqqK9kg+rz3qEQHTk6txLCgiKGEQPgA3V10kF386qOGHRDaZwvHJXHRJXdRPChwU7wPUkZSQqvVot/rsLo6YHV1ldW1Ffr9Pt2WIPUTMm0b51UbFyetg1UFxCF7dIOVUqJFDVowtBKJko5EClAytHxSTZpqklTRaWWkmaLTaZG1ErIkIcsyjvR/sxUGrm7t+bI07A3HobrJy2AfX1lM5agqQ+E9PtPMnMOVDuNdJHsH2pZzBKdaQgFjbViM6wrRekVuMpyXlNZQlQFosbO7x9bWDnujIdvbu1jnFjYzNHNVKXUwjww/ZC4vNf968CQvAX68nKMm6xlVQ8AVzWYpJByBTjVSqgZYlGiFdiWDXpf19VV6q9FzSng8Ac1pjIltWRVAMDYgE2tyr7E2iNRaQ6eVoKWjnO1x+s5NPv/ZJ/jspx7njkPu1K88Dk/4rzGu7Hr/7adf4J+++xMuXLzJZGYCxL1KSJMsGhAGwm5o7TnSVhY/bCFZzVGDEm8JqMGqYm84Zn93l8lsFgb8Uc7JmLlUT83LAqhiK0viImfnvZPVfHYQeUALFVr9m2VVBtcoBXgfFzkCRFhKyLKMfj/qsLU1Z+9Yo9fWwWur1YJYQamoGF4rX8McNamUCOhDrTGmIFHhZ8EMk0hYBqU8UoDWkixKRqnIH9Nak0rBaqdDEnXnlFJBE1EJ1jd/sXDk3e2hDxWqb5JF5R2FF1Q2zMnqFqOzgUxsvKcqLcZ5rAmuwcYRVRYclTHoNMH6Bft6H659VVmMcZRF1SQWSSDGlmVJmefklWBSKHaHM27evMmN7S3290fMZoHjZ6yPAsw+OCFjmwqn5jL52wgBL8ZB7cWDyUqLIJe0aM+yqB5S/1urBKkEVWkwtiJNMvq9lDs2V2hnKmj6ZQFoYeNM1eJJ0xZlVVHmJc7RtCeFjeaLHhItsS4nn+0x6EmeePRePv3Jj3DmrmPcfaR9uG7+GuLwpP8GxI9fn/ivfe2bPP/Sm4zGFcK3caSRfhpUuFvtNk5IJrMxaZrGOUgtZBqqkERGK21S8qJkPByxN9xntD8kL4sI1pjbfHvvo46gaDTPlBINr2WuerH8tUkU9QG8B1Cj+bVnTnIVbi6PY+e7c6loEkO/16GTpYGs2e+yujJgfWPAxuoKvW4LY3MSrciS0B6UwiOlD2aCWgdOjJSoujVpQ3LUIrYVtUKIOBeMCTCJiU0JkM7ExKYa3UalFFrI5n3WAJj5f36Jl9Zwc2DeUo07dxtt1ytbE4KJycpjHVReND+bm0/Wl0BEcEesVISKbtUyVKDOQZnjrMXYkMiEkBHRF9x2kySjMiF5zWY5k8mEvd0hO/t7TKYlF6/sMMkrhsMh09kMa/18hikX1TnAiZgQ8Yh6EyNuLzd1i8/XAdNKYnIVJM18FFgSjq07C+G8EOeDiixLWF/fZGO1y+ZAo5WPGoIe4yyV9QF5KyTW1C3HuWZhAMo4qCyZTMkn+6ysaE6fXuOec5t8/KMP8MQ9h22/X2ccnvzfkHj7hvfPPvMK//BPP+TKlT2mhSNNW4gkZTrLsULTanfxcbGqxWqdN6Ftp4JlvRSKygmkShAepvmM/f199vYCLNlEo7jSzG29hVAN4lBKGfpF75OsFsMLF+WamH89qJnnlyH0AbKuSGSdOG1TRVjrkLoV+GMCklTR7WSsra1wbGOV/qDD0fUVOt2MQbdFu5OSSIGQwZtJahFg5HHWJ31Ai2klyHRIZi6qtis3J1JrHZ2SpUMq1ySxRjdQEpKVPJCk5PxxkpCo6jXbM68GQsIK58FU4dwbT6ya/EISA6JpX51snbOxjepxMqjjG2spTBUWYB+UOqz1COPQ0b7F+aAhj0wwXmKsoDSwN54ynszY2xuxs7vP7u4+e7tDhsMh4zxnPCtxIlqvCNEc37zttyxVNb8ZwsIvpV6+H5pks6xpeBvF3qgAUrd6VdiMeJYrLBFBD0LQbQcvttXVASsrK/S7LXy1F+gfURHJOBug8lIhYsVWa2fWor81sTtBIgpLpi0PPXwnn//8ozz4wFGO9Q5BFL/uOLwAv2Hxk5f3/Hd/8AI/evZlbtzYot1fwZIwyw1eZiRZK7R4YitNCI8iLJDChyQmRYLxEZGtA6JrOpuxs7MXOFrjMZUJO3qhFFqnAI3T6iLUPcSBysrN5W0Cnyi0ApvJxMIM7HbK4nOhVrdUNcggqY5xAeHVmEa6UHllKrTtjm+u0e222VhZYXVtwEq/x8qgx2AwoN2RaD1F6VDBKRn4TkIItFTxvwgU8WEh1jIi1UQ4GJ96UPMkpBBNhTW3dnExOYnm53ViU2r5+H1MSjYmq7qyCm08h/FzbzGMxOcE6aRGOcRivImKGy7SE4L0U1B3Ci0/ay3OCtqyizVQWcesMIwnBTv7E7b2xownOZeu3mQ6KxmNZowmBWVRYUxoEVtvaHWy4B1W88YOcO4WVccX27E1AKe+/rX24UErzEZb8ZZ7IiRCKXR8HRWFcGsF90CpsM7QSjNWVvoc3dhkdXWVVjsNyZEK3KzJlIHTpQAR0Y0itkQrnDPIyKdyzsQNCdxz8gQfe+xBHvrIXRw91mKzdzif+k2Iw4vwGxiXb3r/g5+8zPe+/wxvvXOZWe6RSQ8vWuSlJW21MQ4QDq0lWhDlH6IpoNJNElCx1WERYShfGvb2hkFrcJxTVGVYNMV8JxtiGTax+DUkqxr9dWsL0C98tg/OHGAhmbm5iV0jFaUk01kBKqgPhMG6bW5UBZiqQilBmig6WTDHW19fZXP9CP1ByvqqotXydLtdOp02nVYrEG6TOKOzJkDhkSgtYzKKHwbp8dqBCuohUs5N+oCFSso3yaqusARBiaRuE9Z5ulFn8B4bq4QAdgi7/5oQ6yxgQRgJrv69a9qVRO6P9S4mKhmljqCoSiazGWXhGe3mTGaG/dGQ7d0RO7tDtvfG7I/GjPOSyoCpQnUdJJIiUEUoEB5ri6UW3XK7c+7nNU9Wy35a6uCyIt4/WS1SK8LryXl7OJDxgmGpCq69mxtrDLodVldX6fc68ZraZgPnhAERNAnxEu+iqgUBDVlWOVoKtPRUZkY5m6ATOH78KHedWOd3PvEUn/vEscO18TcsDi/Ib3A8f2HPf/PbP+L5519ne6/AuBboFmUVlS1U0NeT3mFdicRHvT0aDyHrA3/JIUjTDmnSIs9LJrMpw/1JmGkNJxRFgRCKJFFzsdYmllXD68orNrniYyLCTDB3uiUsRI2ja1zwjTHzSkUchMlDls1V0xv+UkSb1S07UxN1qwCRl1rRSlskiaabpXTaGav9HqtrfVYHfVYHHQb9DllLsbHSJ82g107JMkWaSBItG0BGNctDMlRpIzXVJNtoQgkhidTHUM9O6vZhjX6rk3FdVYWdfmj91WKv9bHWbUGEamYoYdYVIOTOgXFQVo6idExmBeNJznCcsz8asT8cM84rrl7fYZYbxpMJ06KgMqECbnhKkcgt4xUMxzZH6bmqXEpOi9fBOddU4jQV9lyDDwK5dhFEMR8/3Uqf8LGFOY9wvuqEqLUk1QHs0u91GPT6nDpxnCQNbdumOnfRZ0pB4QwGj/cq6Ak6GWxb4oYhTRS4EmtmmGpKqix3nDrOJz/+JE89di/333FYSf0mxuFF+Q2PK0PvX339Gt/81g946eW3KZ3EWgUiQWgNIsB2S1uihSTNEiQRyOBlg+gL85OgfpGqoMfmvWcynbGzs8PO3i7FLMfH2UcjRXrL3GoBto5b2DXHeZRgKVGF54h/ubjoxzjYWpJS4GzV7NhZfDURdt3WWsRCJSaEwnkPPiLUKhersnAetBQBqt5WQel9tUe/22J1rcvKoEOvm9FqZQHGrhNWe0GGp5WGn2mt0XqeXLNExxmVv017cPm4awuQpnUbk5W1FlPZmHDD18JUGGvJjaeyhrKoKEtDWRqmk5zJZEY+q9jZG5MXhtE4ZzTJmeYF09yQFyVl5fEqoAHr+aGIbcnKWqyr4nHQzMSozRrjJqSujISXUQMxtBvnEPKa5zTnO3kxT37h3quvsLxl23Pw/lhsJ4PHY5sNTauV0u206Pe7HD2yGdQntGwg9wKHkglShDZoXpUYpbCi9vESCK9RXoEPxpSmKnDVlHbqOXlinXvuOcX9993Fvffcyd2bh4nqNzUOL8xvSbzy9sj/6JkXef6lN3jzrXeRSZdJ7lFph9KCQdHprjAa7tHLBBITGPgiSDQhA/nTWE8ry/ARlYcKqLPRZMjuzjb7wwl7e7NAIPVxtfVzXUIhAnIQGVpfTgRnXYtdWqTFLfMMGr3DGlgxj9j+YQ5FDz+99fZ0yOW/lSGp1SyeOmrPo2ZBFLGlFhU3JL6RjEqUjjysFK0lRzbWyBJNt9Wm3WnR6XRotzPa7aDl1+20SJKELE1IYmsxSRRpmpIkSXg5IVBCNAi9IiYkY1yAiZcl+awgz3PyPGc2mzGdTsnLip39nLyomEwmjMdTxrMg/WRNOMqiNPH8BCCCa6o+Fc/FMnS8Tgn1Wa3BLvPzNU8ntdtyuI4Si21mkT6274SUURdyTgj3Mjjv1lY13nuwQWGeaP+Bl4g4JzS2CqoQiUKqwMNzNggbCw9pmtIfdNnYWOPIxiq9fivo8eEwRUkSDRptFXiEqQq2JLmxmARkkmIriyktiUxQDmxZgKvoZAJJwR3HV/jspx/jkx97kPWVwyT1mx6HF+i3KC5em/orV7f4zvd/wiuvv83WzgyfdDFkzCqPRwcbbl+G5SoioZwLC4hKsoCGq7UDIzw72NOHRSCvDNvbI4ajGcO9IUVRBeFVmQAhUTWIPynwEpys0RwhEbjC3uJ+W891IFQatypnh+F6beEQWke3Fyz1B/+28ZZa9juCW1tOEJLT4u6+/rdSYeEsplOkcigh5+9Z+DC/khLvApox1XPys5SiMfSLo8OlZB1aaPP5XABU+Ga2GNp+htKAlC2skw3Hyi7McqSUKF3Dx5fJs/UMaRH2PY9Qad9qYsgt56yZzznRAGfsInovVlc+Jn4vl8+lMUGlvJYHC4aKCu9kGK0614AZEA5rCpwzJImi3Wpx/MhRsiyh3+3R7bXIsgSpQquv5qMpEZ47nDwVjzkgFJ2CwhpsUaKlItMJVT7DllNS7bnj6DpPPvYAjz96jhPH+qyvHiaq34Y4vEi/hXF9x/t/+t5zvPzqW7z+5iW2RwUq6ZCXjna7hzWh2tAChBaETWgcPjtDmqYNeksIgZIJQmlkaCAyrSryomA8GrG7s9+QQrGLMHfVING8mC+ozYzqANx48b/F6qmJCJX32KZ99l7RLKYHW4oHeWC3QSLCQruK+bxo8blTLakrEOdrdYdqYQ4TqlIpwvwuaN3V5Gyon+7W41dLMzoWfKzqn1tP9DtTcyqBqluQ4XF2wS+KeA2WzsPtTl5NRVhq0b1fuNgGpJEhWjxHtyADmScrrXXDXarncnVilB7qHCOwgEMrQafTYnV1wGClz7H1zSCdlWYI6bG2itSGaum61RWbs2Bt1KjUCueCOLF0FryhLCY4U3DqxAYP3H+WM6eO89gj93LqsOX3WxWHF+u3ON541/qnf/wc3//hT7hxc5dpaVG6h1B9rA9us0JahAgafkqHgXVQAVDRakHGxU2CD4lIZhKpBd45JuMZOzu77O7uM5vkoWU4nlInOkRApLGgfH2wqjoYSwucmM9GhJc47JyU/D5/f7vv5y/7fhYSROWM5Xbi4sLrbVhE57+LfDTcQqJcaG3aRdkhD0KFny8qPCwlbNUkrIPvwTnI0nZzXDUAoYbAA02yqtXGD+amW6vWA3Ebc845BSFUPBa/NHeaR00iu905rnllNtAAFgAVoVHrEKJWVXckqWDQ67K2vsra2gorvT5ppkkXxH+tnXPwpJQIrbBmDqNv8raQ8TU9wld4V2FNSaIcvZ7i2JFVHnvsfp567GHObOrDde+3MA4v2gcgnj2/43/0zPO8deFt3nr3JsM8RaV9Wq0stPhsSVUVgTicpo0tt4yq2iFRhZ27l+ASh/VB7FOrBCkleV6yH4mjN29uY6yjKj2liYuyDK1CpRS2KpYrqbioNgsM82TlCLMRFwEhYUbyUxQx6oSBW/q+jlvVuQ/8/QF0Yo12q0Op+ftdjAAOsAcqwwOTNemjKbplWRNvAXix4CR8W9CJm6vl1yTcZVJsnTDfS9Zo+fwdTGbz41rggzGHzkghmq/hl8vJKrRx5cKmRDa8KAjzJyVqKxoX2s4uGoviGPTDLHB1dcDm+iorKytkWQJRz1LFas41jr3xfUTn7KKoUEmcWdVq7UkQgK7KKYl3CJejtOPOU5s8/tgDPPDAXRw90ud4+zBR/bbG4YX7gMTWrvdvXrjIt77/DC++dYO9saXMC3SakGXtwNyPkj5ZljV/1yyWKiQbocFgMc6At0FpIgmPN2VFVRlm04LZrIj2E2PGoylFUeFdbMOpgDarXY7rhFUvknWycrdJKmHRq0nDt4u5IKp8j9v3tiMbFiqwumW00M5aTEx15bPY6vK+VucOba66rVarfi9WgqWL5ou3qd58RCwutuUWybVCelIZVPLn72m5jXqwDbic7GLireUjeK/KazlRLT7fLefNLydG4eJ94+dJOFRhYYanlcBag7ElzhQICVlL0e1mdNst7rzrBJ1OUMLXSjabBedcM88MmwIRW6VhJlXZeWuxETm2FZUrY5VlkM6QuIr7zpzi3vvv4tyZk5w7d4IT/flJ2i9u+JXsF+cVdhi/mji8YB+wePvK0L/y7k1eevVtXn7xVba295CiTZL2SXQHIROci5qD3uKER0gLMhgqOkCqtBGAtdZiI+8mSZJgGqhSyrJiMpmxP5qxvzdkNAp+SVVVUdma7CsCpBxi1RYTRGwhNrD6BVM97z3qFpO9ELJuD8ZFvt7ZH6xMrDe3/Hzx387Y21Y09YzIuFo5Yi4SHN/BEtx6uXKaJyvjbAMCuV1LTqmEgFRcWJSb9+BRfk4JuN3cTcj3rhxrXlT9fhdjKWnV86ilWKYKyMXzV8/XPM15UQvJfn6uBNaUAWWZStqZotfrsL6xwvrGgEGvS9ZKm3Z0OSvJ8zycl1g5mYg6nEsJyijkGyD/WmucCaaKQjqqqsC6gtXBgONH1tjst/joow/x4EN3cHRw6wWYuS3flpuHa99vWRxesA9onL829K+/9jZvvHaZCxeuc/PmCGMz0qyL9TJAz5UE5RHa4KXD+RLrINUdrJtrBColG2WLMH8ArVLSNEMIRVVaJpMZ4+GYWV7y1jsXMRHdZkwQHPWCIKMjA2qLuLt3gmbhDKAMMUd5HYiah1M3rOoFdCmEj8nKvWeyqtuA7yUj5Gp4t6uFbvUSMEIsVIkHn7vmIzX8qjj7WZwJqYhakz6oOQgXEHWKYErpnGnmY7erzN4rWc2BDgc/1iGZ3raSPbgxaM5p/fP4PuL5F/Hc1KofeI+3882BEp4k0ayudDlyZIONzVW6vSzYs0SqQFkGc8darDfoIIZZVGkqSESj31cTebGiORIlYDoZgjD0OhmeCq3h3nvO8cSjD/DY/Sc40r/NLuEwfqvj8IJ+wOOtyzP/2muXePnVd7jw9g22dyd4lYW2nBQ45RGJR6iwSFaVJZFdBBpJaMkpHeWIRBChrblEMiLWaqCG9KE5t7M7ZJIX7O3tsbOzw3A4Jo8KGVIH9JbxDikVSmuEUMGl1sXEgG4G53OYd5izJYnC2sATErcd8rsgt3MgWcF8sVcHKrmDX8NcaLlNB4vtxZ8C4KBukxE2BZ4mGTvm0Pzwc7cEMPHRiPJ9n/s2rzU/IAlyeSZWH0et+l6DNsLfiVuqt0S3F0SOI2TdOpQUJFLgvMGZCkHgSSXRnqXbbTPodzl9550kqaLdzmi1k4CQ9CW2MhhTRaRgqEilSPEeqjygBlGSmc9J2hmmrMinM7SUJErjqhJnDZmSVOWERDo21vvcffoE9997lnNn7+Lc8cOZ1Ac1Di/shyTeuGj8Cy+/yWtvXuSNC5cojKfy4KJTa+UqpFakuoV0aYCxe49xQeRTaUGaarRWcSYSeUhCNBp+gfgpkLrVyDxN8hnDnX22dnfY2dljPJ1gKhedZWX0RppDkZXSWKPwiPD8SuKto4q7dyl1M6+gbtcdaM85EVtEC3MemCekRbTirWoKNNyqg1FP0m5tzS0DKRaJtfNE4mLFc6BteDApCsftX30e7/uh9TJUS17OEy/ckribhy8ktZoXVVVRyUJFrUgfEqgSHq1CZSMVtBJNtxO8yDbWVtjcXGdlpR/7d+Ee8bWHWfSTqgV8vQd82JQ4U8tahlZxIUqssNjKIIUgVQpfBQh6IjwtLeh3M+44tsH9957m4YfvObSW/xDE4QX+EMXO1Pv9seXVNy/yymsXeOX1t9kd5SA0Do2QCYlKKadmrsOXhflC4LsEnlbwNaKxnVdRdkgQdO3wCV5G+LGSYAV5WTCdTpkWORcvXgqqDdOcWZHP9f2kRqsUpdtUVoAN/K1ATo1+VyoJLrFAo723qGohHM4XDUjjYBsNboXWH0xYQYbooGZdHcstv/p9LCYrXGiVHgQ+3H7GtYjDE1HDD25fvdUQ+oOxeEACIdOGa7WUhJeg9wtV1oJorBCCLGsH7pgJ/DJ8hVSCdkvTbmdsrK6wttrnyNEN1lf7dDodUq0iJ61CioAIDETnckn3sQZLCCTOybBxscTqNaAojTJYDN5avDVUxYxyNmOl2+LOk0dY6bZ4+P5zPPTAWe44Kg/XsA9JHF7oD2m8fn3qX3vzEq+9eYkLF65yc3uEd5pW1kHrBOtD26hWh5irKIiQvIRoEpYWoRqJdQVCpo1Aq5eCRGhkoqMauSDPw1B9fzQMXlu7Q0bjfWbTgtI6isIjZTpXAodAlrXBlygAHmQUePV4IZcqmIYEfRuVivdqAy5+XyerkDwWk0kdMRG818l14kCyur1CxO2ewQmCWvjtn3jh1Zfe9cKxCKwLSeHWinLBZTduNBrytvBIERyRp9MpSimyRNPuZPTaLQaDHutrq/QHbY4f2aTVzsiSgIr0NqicG2MoihkIM0d+1kLETQtSUJVhY+K9wFThmKSsEX8lXlQgbNCI9I5ECfrtjHNn7uDB++/h9KkT3HX0cCb1YYvDC/4hj9evzvzbb9/grQuXeffiNba295mUOUqnJEkKUlMZh/WgVUar1aK0htpkMMgL+mCR0ag4JEgRQAlhmz1XQJBSkmVZIwDrnGM2KxiN9hkOx0xmOVev7VBUhtmsYDabUZYG5+dIwlarTRCEFU1lBSKCN3zoKx1Q+F6qMG6TZRZ/LyG62kYh1wNov1t4Sweeq56lHaxibmc2eLvwqKXXmHcl48LeJCG39PuGQMzcBTf8wkZ4uY/Q96qB/fto0yIlJElGqiS9fptep83G5hqbm5us9nu0Oy3aWRpcqqOWV1WG6+OqkiRVjYOvjaRf7+fOyNb4oCpvfZO0DgJbjHHYKiiht1JJq5WxubHCmdN3cvedJ7jj2CZ3HzucSX1Y4/DCHwYAN/e8f+vN67z+1tucv3CB3dGY8XiGR6PTAHn3PjjYBkPHiJRTAoVtkhWAMTZA3NN0iWCrREAh2ipIPmVZ0Cqs7eOttVTWMZqVTKYFO1vb3Li5HQAaZRXQhc6zPxzHZFVDrSNar55POXPL8S0mDmfeH8Agl6wvAiRiUV3eC7WUeG5JVrEavP2caJmAfGtPUuAPoCFvl6xCco0Vk5s/h8UvuTU753DGNjOnALiwJEqSJAmtNKHVCp5gK/0BnW7KuTOnSBNBu92m3W6jlMTX5pA48sm0uWZ4T02UDujPEqkVc7kloncX0YQktJdrpKj3FutMPCeORDgG7YQ7Tx7h1InjnDh5jFN3bHJ87bCS+rDH4Q1wGLfEq1em/tW3LvLyK29w/cYu09xSVRJjgySTzlrNblhK0NLHSitwn7TWCJYXayklWgSdu24ra/hAc5RfUL9wQpJkHYROEM6TV4bJdMbu/oidnT329kfc3N7GGk9eOoqioCij1UZN2hVzH6lbUH4A7j0beADoWrX8dsCHhe9vp7MReKxqKTlS/x2LFdx7q3QEMuw8QR5MVjTP4RtCbtN2E1BUOV6KaPURfLeSRNFppWRJSruV0em0WF9ZZS3awa+s9FkbrNDpJng7xdh8WQ4qSkoJofDWNV5bNVG61kdESYqqbFp/oR0czmWoFmWT1Ly3KC3xvkJpwerqgGNrK5w7cYQzp45x3z0rh+vTYTRxeDMcxm3jZuH9zt6Mq9e2eevCZd66cJn94QzrFUVpESQIJZsddu2eK4gWEVF/TkZYsxa1WGvgbgWPKI2KwIk0TaNZZOADqUSjVIJAIWP1VVlPVVnywjDNS4bDMTs7e+zs7rG3t8dkMqOsKobDKdZ7vLVUjZhqPcOSJAuVyyL/KZBeRbBWuR0nKX6teVTxGQjtwvnjnKwTleLWpORuSWB11EWWtXNVjMYLbBGQEc9tbdlBdG6uW41JolCxcspaCb1Ot5E26vV6rAz6dDotVnp9Wq0UARhThspJWDJtqaoiKH0ojfBzVfiQj5LAlbJhE1JXVd4LZKKpjGkSk4iSSbVaergOFryNqhYtslbC6qDLuXNnuPfsHdy9elhFHcatcXhTHMb7xs1p6fPSsD+c8OaFy7x14VIQzZ1ZitKDbIFXOK/QOrT+QrUkGuizVEHpvJ5zZVlQcEC4BkmolCJJNUoJvDORv1UjCqPZYdQx1DptJIq8Fxhjmc1mTCYTJrnh2tYO47xivD9kfzxiMpkE36iywFSuEUYNDsoeiUTquq0l8ZVqyLGhvSjn8zcAqZvz4yOpuVGdF0QblgXyMtCAI4RARNV2IZbReEqAQFJVQdXCORMSUZO0fANoUEo17sap0rTaWbDUaCcc2RjQ66T0+30GgwGdTocsS2MSU6AAUVdFtnkPToRZnSmrcO08lNY2Eki1rQlSRjUJv1SxOgvWO6qGPA1SeLytKMscvCFRglamaLcSVgcdjp/Y4NyZ0zxy5sjhWnQY7xuHN8hh/MxxdTj1W3sj9nYnvHPxGm+/c439/ZzKSpzXeBeIxmmaNrydoABBI98khEd4i9CCTCeNbbxfsCfvddKFNmOwgZjbx4cqzLuoqhB/B6EVVnkJqkVhLEURAACz2YzxLI/mhgW723sUZcl0Oo2/z5nkM4oiJDPlU3CBuFuDAWxsudWYx1pcdTFJ1eWVbyorEVUd5v8GR1WUSLUwR4tJoz5GKUMlmdbGjgvzJa0la6sDsiyh2+sw6HbodDp02x063RZZoulo0Eo06Esf50q1MkcZrTbm0PUAsgiNTklVBKdm4TyVs8hmYxDafaWZc9jCawTuXVkFK4+k1W4g67gS7yqUsLQyTbulOXl8kztPneDs3Sc5tdE5XIMO42eKwxvlMP5ZcX3i/c7ulKvXd7n47hUuvXuN4f6EYAwbqiGlFFrPW4V1JEo3NugNGVXNhV/rJl2zeKs5aRVodvn1v4OBZPhPoDBopIjAjaSWSgp2E8Za8J7KGMqyDDOvomRWBMfeqrTs7eyHRbk0zIrg4pvneXD4NaEdZj3RLNEstLfE0nGFRC1RQiwkW087a6ETRZZlC/8ltNMMrSVoyLKUXrtDq9UizTRZltFphcdlaYpSoklkQS1jodVpAe9xMbmY+B7r5GQOQPqtm/+75lt573HGYpxtjqdu5ymlltp6tV1MnYyNLSG+XqKh22tz9Mg6d95xjCObaxzZ6HOke9jqO4yfLw5vmMP4F8f1iffXr+1x+fJ1dnb3eefyFayr5xhh8dM6JUmyMM9yIi50kf4aVSm01g0qcK4+UZNVFyqViF5u5mRCNO0skCiZxeQWE5iez9UAWkk6ByCoYHQIC3wsOdcBDAu9p3IV3nis94xGo4hcNE0icM4FNXkf3leQqlpWS6+5V4NBb0661ppEaXQSVO+lgjRVCAVazS03aiBFgJ7H1zRVkzTm/3mqKjj1hkqqhqjPlTxKaxveUy1q7GoNPuGCxfyCbUrD14qvu8jfanhUUS4L4dDCsTroc+zYEY4d3WRtbYXVQZc71g8T1GH88+Pw5jmMX2jsTL1/9+oNhuMJWzd32N7eZjQaU5YG48A7RZpmgETIAKIIatuq2eXPq5D4X402FCLMQWIVplStWShAzJF/7aTVtO/qqJGLUgYNQy9Fg06sq7P6dZMsmatzKIVSCVILlNAgfaONuLiYz1tiAolAHoCkez+3GKm/D3MpF3ho0azRMTcbXLTOWDQhrNtxNm4GFpOHdWBFTFSu9uoKoA0TKyhra53AgNZz8X3U7UJPUK7wPm4aqBNTrM5sFZ83vL7Wmm63zcpgQKedcufRdVYGXTY2NjixfqgwcRi/mDi8kQ7jlxbXh4Xf3Ruyu7vHzs4e27sjppMZRWEx1uNsmEFpnSJUElQMolW5h6VkVXcRhQhiuiF5xQQm58lLCYkzHi3lHOAhdSAviyAbleis0f+rF3q58HiVLFdyi8kTUaP55olq/rcSJSSpnmsENuCFmAzqxOO9iCi+ZTUN5z1FUVEZi3cOFtqf1vqFlt6iFQiN5l7lLJXwTVXlnItJC0oTxWIRy8kqAiPqpKmUx9hi/r6NxUbzRClBSYnWilYrpdPpsLrSZ3NzkyNHNlgbpBzvHVZQh/GLj8Ob6jB+ZXHx5thPxjnvXLzCbJozGs0YT/MI1Q6Lshcar/QSGk/IZYBCqGA8yFipxKSllEJLhYytwwbg4eW8SpAeJULySmr9QlG3KjVSBRSel3OUYlCdlxF+T2O+eFCwVoigqJ6ky6TeQIoNGaNui1rjm6qnTmShjedIWz0qE1B5xoWfWWujjp7Hete0LgOMPs6Y4u9mpgitvbryQzaKEc5BWQQIetMGjCr4IiYr6/KmFRjoCCCloN1KQ4JqpaytrXDi+DGOHNnk1CHU/DB+BXF4kx3GryW2J97v7gSe1N7ePsPRhPF4zKywWBcW4MW5VY0EjIp9DcdLyCAc5IVHCYWM86Y5AjEkkDnxWCC8bxJbI3grabhgtXBv3ToMXwVyaYY2f94aBBLU5+cE5MX2nPeLSSkmKls/Vi1UYJ7KepwXCz8Lc6XaNdeYIPDrbK2XSFNBWTxSKypbBUsOZ8GBdS6oUDjw1i0kL7dQ+Qm8rxAELlwiQ/XU7mT0ux02NoJw7ZEjq2weAiQO41cc+qc/5DAO4xcfGwcWuys7hd/b22M4mnFze49pXkR+1CyAA2QEQkiBcCJ04YSMAqwShET4AM5IsmSOMpRzdJ7zAmcdqU5w1BVKnXAI1hoiyB15wodDIJEiJqf4VSEJCn4RNNE4eonQp8QG+PoiECHkDAJt2uNF+M/5en4EzgmsD+aRXng8Hh8cD+NsCTwVxjtA4KTEB5OswL9SQaHeGAMelFARLOLi8wHSU5ZlbK3WGwGHUi6AYGTKaq9Np9tmbWWVtbUVBis9jq+qw+R0GL/WOExWh/EbESfXs2Yx3J54n5eG0WjEaDRiPJoyHI4ZjifkeYlOdawGKryTOKEimlAgdEYV23jCKpQIQAopBEIKRPTICgjCMBPyQuAQSAE+yMCGN+LrJBISkfVBsFeq/397d7TTRgxEAfSO7d0sgTZUQULq//9cpRIVIZJsdu3pw4ydTdoPCHCPhFAeCDwEjeyduWNNB1aM7D1txkosK8+ypiCIPnqlQCgAIrQUFLX0eAAokvxkKIAWiGRAZytosOKmnveHYL/XZr7sfdpzKRUbRC6CFBKQFVkzSrYvKTOgGQEZd4MPK6sipoBhGPD4+IjtdovNt3us+wF9CthuWKDodrBY0c25PnXt3rMeDiPe9yPG44Tdn1dMpxnjONm6kdPsDQYTUE6IfWdFRzxpPHiGYbTrvHk+XTRPWIRQtJgn8bDVOisFP1FB/CQCj0JSD2YFgr9uXSB+MlOxAmKFpJ6MBBKiFaa6y6r4MkJPTFfpAC9I9cqwXSUK0He2ybeuTVHNtu/Qy1uZZ4gWBAFWfUCShJTurHsyij13ure1Hw8P9xhWHbZrFia6bfyA0of08qY6jhmH4wn7vaVUjMcJU56xnw7IUJyHdRfrQeScsHE9UNyFaFeGPpMURBFiRPRmDStW57b0+jwrSWiDyyriJyv1k5kP3mqBZnv2JIh2lZeLf7cGh+KFqa5OqXNerVj5Hq7j4eTDvee8w3btqcC6j4gBlg246nE39G3wOKWAn08D/+/pw+GHlj6NlzfVUgreD0fMJVvihH8tZ5QuVnRg0SLvB7ok9swrWjVCrPNZ3kyRwvJn/p0Ls7glD7hdFCt4saodfZqLNU4Ue20NF4IyF08sL+3nl39f9iWKLVOxW6HrOnRdhxAKvj+sEKJilTpsN9z/RJ8DP8j0Zexej1pULIEC6sOy+WIAF7CuwGvWNWj7rWpxAtC6Bi+KXTgnYgBomXx11fw4T60bryWwwx97ZVgDCSy1vXZCLovler1uQ82SIp5/8AqPPj9+yImu/Pr92u4NWwSTWCLE/9YM1/mvWngiYr0FxPJ96vdivRRtSeKy+KEonp+4x4mIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIjoi/kLhnJTsf6RAkcAAAAASUVORK5CYII="
-             style="width:96px;height:96px;object-fit:contain;
-                    border-radius:50%;display:block;margin:0 auto 10px;
-                    filter:drop-shadow(0 4px 16px rgba(0,0,0,0.18));">
+        {logo}
         <h1>Mundo Solar Suite</h1>
         <p>pMGD O&M Platform</p>
       </div>
@@ -123,14 +182,19 @@ def _pagina_login():
             if not email or not password:
                 st.warning("Ingresa email y contraseña.")
             else:
-                usuario = _autenticar(email, password)
-                if usuario:
-                    st.session_state.autenticado   = True
-                    st.session_state.usuario        = usuario
-                    st.session_state.datos_cargados = False
-                    st.rerun()
+                try:
+                    usuario = _autenticar(email, password)
+                except Exception:
+                    st.error("🌐 No se pudo consultar Google Sheets. Intenta nuevamente en unos segundos.")
                 else:
-                    st.error("❌ Email o contraseña incorrectos.")
+                    if usuario:
+                        st.session_state.autenticado   = True
+                        st.session_state.usuario        = usuario
+                        st.session_state.datos_cargados = False
+                        fijar_acceso(usuario)
+                        st.rerun()
+                    else:
+                        st.error("❌ Email o contraseña incorrectos.")
         st.markdown("<br>", unsafe_allow_html=True)
         st.caption("¿Problemas para ingresar? Contacta al administrador.")
 
@@ -140,12 +204,16 @@ def _pagina_login():
 # ══════════════════════════════════════════════════════════════
 if not st.session_state.autenticado:
     _pagina_login()
+    if modo_perfil():
+        panel_importes()
     st.stop()
 
 # ── Cargar datos si es necesario ─────────────────────────────
 if not st.session_state.datos_cargados:
     with st.spinner("Conectando con Google Sheets..."):
         _cargar_datos()
+else:
+    _aplicar_carga()
 
 # ── Atajos a DataFrames ───────────────────────────────────────
 DF_PLANTAS  = st.session_state.df_plantas
@@ -165,14 +233,11 @@ usr = st.session_state.usuario
 with st.sidebar:
     c = get_colors()
 
-    # Logo embebido en base64 — funciona local y Streamlit Cloud
-    c = get_colors()
+    # Logo servido desde static/ (components/assets.py)
+    logo = logo_html(88, 6, f"0 3px 12px {c['card_shadow']}")
     st.markdown(f"""
     <div style="text-align:center; padding:0.8rem 0 0.5rem;">
-        <img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAasAAAGrCAYAAAB+EbhtAAEAAElEQVR4nOz917MsV5beCf62cBHq6HMVNBIJkUAKpC6ZpSiarG52kdUcm27rfpgx639jnud9nsbYRiNpZJMzVcUqlphiMStFZaVCSiREQiZwcfXRocPd995rHrZ7RJxzL1JUJZAQscyAc0+ckO4e+9trrW99H6xiFatYxSpWsYpVrGIVq1jFKlaxilWsYhWrWMUqVrGKVaxiFatYxSpWsYpVrGIVq1jFKlaxilWsYhWrWMUqVrGKVaxiFatYxSpWsYpVrGIVq1jFKlaxilWsYhWrWMUqVrGKVbynQ/2i38AqVvFOi1uHE/EIWsAjqCDxp3gCEJxDdPy7aIVBIRoMGqVAqfi1UkAQQYkiIBAEUeC9nz9vQGOUQpRCA14Em2iUUiilMEajtUFrhdbx9q12vvreruJ9F6uLfhXv+Tjsl+KcwzlHCIGiKBARQggROLwnhBD/UxpEIQo0CrRCCWCIP7VglAat6r/H35XRaCLAWGvR9WsHQAWFkzAHveZ9hBDwEiBEMBMfCMT3Iiqg1AKg4n8GpRRJksxfx1pLmqYkSUKSJGznevWdXsV7MlYX9ireE3GrH6QsIiD1+328BJwvqaoK59wckEQEEQFYAoHToGBNCjAHJaOZgxFaSIwFDVoplNYYrVEm3l8pNQctAFFAUHgJNRgJWusIki7ggocguOARH8HLI/P32QBqCAEJan57/AwRErW2GGMwxqC1ppO1I4hlCVmWkWUJearY6qjV930V79pYXbyreNdFA0yjyZTxaMJoOmE6LSjLMmYtogji5ot6BKO4qGvNPDPRWqO1mi/yxsTMxWiNFtDKoDQ1kEWQoc54ICw9R3yeOejV71PVYNKATggg4lHKRFBaBiE8wYOTgKiYkRECLgSob4+ZGYTKUXkhOEfpAuI8HjUvSwYPqFB/JkVmE/JWSjvPSLOEtU6bLE/otHLOr9vVGrCKd0WsLtRVvKPjaOxlMpkxGI4YDEaMJzMG4wmu8pTO46qARyHoeTZjjAVkDh7GGKzVGJOg6/qc0jG7ajKqCDix9JenKUoCWts5SGmj5iAVwU5OZ2YmPpcWTpXtmgghEDwIHu8EJ2Ep01OI+PqnMCnLutel6zKh1D2v+Dl9A8jO40KIP72ACEGEaeUWWVmowDuUBmsEqxVKPHme0e20WOu26bZbdDodOt02eWrY7qardWEV77hYXZSreMfFj26cyHg04bg/YDAYMJrMKEtHWVS4IFiT4lEgsUyntKmBJV7O1lpi5mPqjKoGGzSqzqwgzAHK6gRt64xKa4wENMtZE7HMhjqVaUEEvdNlxKY8FzDK1mVAIYial/mUUnV5T06V9URqEBONF8F7wXuPcy6WCV0Er+Bi9oVoZOl+3gvOe6rg43FRCkLsyTWgJQSMitmeBIcSj1KKPE/pdru08oTtjQ6tLKXX69HptDi33lqtE6v4hcfqIlzFLzRuDoIMx1NOTk44PDphOBxxMhjFHo/ERR3RLBMMtI4Zi8LMF+UITDFtMqkiZlaRnRfBCgwGCFht5iBjjMLq5FTPKdUGqxZlQQClpAYzNQclvdTvasAKAsYoJFIJ5yxAL8wzJO99DRbqVG8KNAHBBUXlF4QQCQqPgI8gJi5mk8FTlxKpszQIRHLGWfKIiMTSIuCcmx//pn/X/EQFEgPWalpZTruTs97rsr25ztbmBr2OZitf9b5W8fbH6qJbxdsel2+NZDCcsndwzOHxCYPRhFlR4VzAByHLWnFxlgg+DSBYvSj1Nbef+o8IQloHRIONaRVGyaIvpSJwKVWz/M70nqzWmBrgEm0WZUKzlGk1Jca6RHiWoBFrgTJ/nxJYKvfFx87LdE5OMxJRYDSV8/gqZlQNGMXyIYgTAurUczrvCS4SNZSKoBjCcr8s4BtShlZIjVwiEsuoS8STqioAQRNB2hpFnljaeUKeWO65+wJr7TabG10ubierNWQVb0usLrRVvOWxP3DSHwy5ubfPzb0j+icDZoVnPCuoXEApjbGRfq1VCiyyqGUgaDKn0/2iBWjpOuNJUoUyEYxEgXi3ADxjIrX8VNkuglNmE4xVCGUs/Sl9KmtqMrSmL7UoE56+n69zmEXWwqlSX1VV82Mj4fav4Hg6wUkkVvh55lX3vQR8FfASs6rm8QEhOIk9LlEEpRd0/CVGYfCxTCr17JeIEJbKkR5BKUMQib2xqsQHh5IQQV8D4lhrt9jeWGdne5PtzU3WN3rccz5brSereMtidXGt4i2Ja0cie4cH7N3ap9/vM5pMGQ0nDMYTgqglgMoiVdzoWMbysVzXlPW0XoAREMtUpwgOS30japaelvkwbfMwrTWJiRRvEZmDi4gQxM3vY4zC2IDSHq1sLB/qCGLNY4yJZUirNMrGkiFGY5VGtCJN8lPltSb7iaW+MCdUhMC8J3W6XOfrXlS8zblFSc8HwZgE5xxlER8HkQUoopCgcG5B1ljOrJr35F38GbOvML9PQ4cPmHmPLYgDH9+3QjBKqIpZZEUKWK1o5y3W1rpsrW/Q7WTcffc5NtbabK2tZr5W8fOL1cW0ip9bvHbzWA6PhrxxY8Dx8ZiTkxNms1lcdGvCgtEJNovZk4jEvhN1BiSR8ZbZbE43b/pGDSCJeJLELhEbFpkWxAtaKVX3n2KPqim9zbM0EwEnsdm8PLjInISsZREqoKGs21PlRmvtXHFClDqlQBGoX1dOlyzn4FWzAQU/J0icmp1SAV8WkcoeAs45qtJT1j0skficcU6rns86BUrxmC6DVRPNcZrNZvH2+m8RROuSoShcMAQx9XO6qLwhUcEDIEttPKeVw7kKqR9vtcHqwMULu/Q6GZvrG5w7t8OjD3ZX68wq/t6xuohW8feKKweVHBwccf3mLW7cuMX+0Yj+xFFWETTa7Rxr0/nO3Vo779k0sZyxGKUhuAX5wdr5LFQDWos+E/N+0jxEkaedU6SL5cxMRDC2YQ6q+XtpFnsnnsqXeF9RVdV8qLjJbqrgGQwGc6BZKE9EIgUoiplfIoNQ/7sGVBVI03SJUm/n6hMROCFPk5jhmeZnvJ8yCVprxuNx/fgFA9KLx/tACJ4QBJZKgCEE1By4wpzgoZbLk3U2J2i82AhWPpwB07qU6NypHuE8M/MBJZ7ZZExiDVliWF/vcP7cLud2Ntjd3eTR+3urNWcVf6dYXTir+JniYCQSBG7tj7n8xnWuXtvn4OiY0XiGq6JcUd5ZixTrEIiNeo2xOqoqGEsIix5SHKIN80VXE9DGo3VYAFj9XwSrmM2cerxeAr5g0KqFSFxMm8xJRKhqGvd4MqMoCqbTgslkwng2ZTqdMqsHiwejMc45iiL+XlUVrgqUriKEgLV2TkoIsphvIoCIimVMzHz+qlnUIWY3TelumWm4nIVlaUJiNWmSk+UJaZaR5zlZlpEkCefOnSNJEvI8J82zWnZJkyQZxgrOVWjlTwG0hIXEk9bUYLVcAvR1BqVwHlwAJYIXWXqeyM5sqPfLBI5lUDMoEI8rZpTVDCWBNDOc293knrsucOncJttb62xtdtnqrpiFq/jpYnWhrOKnjpeuj+TW3jGvvX6Dm7eOuHnzhFkZMDZDmQxVyxOJErIsZgMhBBSRCq0EfHBkNlnKihoiA1hl0SaAKqIwbOSdz1l9qqaWxyxDx57SGYYgWIJLKArHZDJhMBoxGU44HvQ5OTlhOB4xHIyZlQXT8YyiKucZky8cpQ9olc5JCbGEGF8jLPefFIBGaECnJn+IRotaAqJmoW+I44FToU7/rqQG7LOfy0RihDGGNE1J05RWq0Wr1aLdbtFd67G2tkannbKzu0mSKFq13FKSJGgU0oCTOAiLHhlLQNb08xa/x88SYEHyqG/3c5A6C1qq7rlVGB1JLOVsRPAV7TxBhYp77rrAA/ffzfmdbdY3uqz1MrbaK+BaxZvH6uJYxY+Nq/1CDg9OuHL1Fi+9eoVr1/eZFgHICDpFqQytU0SZev5JsKYCXCxfJbpeKAVrNEliIptOxzKUUoKpy2Vx3kkQ4xeCscpE7T1tsTZFq5gtNUPB3gtFUTAcjjk+PmY4GnOwP2AyLRkOhwwnY6pZxazJkIKnKCqCAh0UDRlPVAQaAEWCXuo5idLz4yE1cIli3m+LsbiPEs4AKKeyv6YcF//tl26rwUoiVaS5X1NubML7pTkpvRC0TRKDNoF2ntDupGyur7GxscH6+jobvTV6a11arRZ5noI0vS4/LweiBC2Byk3RDfW+VuFohpi996D1PMuKDMUlKr4IZViUeTWxDyfO4V1JcBVZYihmE4wKnNvZ5v777uO+u+/i0l3bPLC7AqxV3DlWF8YqboujUuRkJNy8eZNXXr3Myy+9xs1bBwQseWsNLwbBICYFZSPdXC/KdKlxEGYLQoMASCxtpelcNcFqU4OUXuotCV6BTqKauLUpCoP3QuUCznmOjk4YjwqOT/qcnAwYDEZMJpNYyisdZRV7TIWrlkpuZrHc60UmBMu5TsyKGnU/JRo59Q3RS5BBVGgHlu+k1FwRkPj1ah4RThE+4j38qePe9JGMsvHVaosSXYvbzt+F1ohaCOMuvzbKo5VgVTjVF0uzhE6rTZpa1jd6rK/3OL+zy+bmJu12G2Nr1Xgc4mcI1RyMqKWstIo9stF0Mn+/AEEW5cYAFKJxQfCViyXfGhQRjwpCVZRoBY0qoYRAJ8+4++67ueeuczz6wO6KlLGK22J1QaxiHnsjkVt7fS5f6fPyj97gtddeYzwtMCYBZRCl0TZBiBTtKPvQgFSzoIHFk9SDuHF2qul1xBJTauJi3BAmmnmmhhSRtXuUVcyYxuMpg+GI4+M+J8cjxuMJx/0hZRmYTgqKosT5pdITgjIBUQsRW9GqprHHkpb3NRPvtqs/8vkSFct2qrYKuU3lAWJGJkvZ1FJCEG8N8+eLcRq8lp9ruRQoQWHqbKaZE2t+NjfGLEjNn+0UTR5PqlNCcKdo8UoLmU1Ikngc8jyl3WrRauW0Wi3W19fZ3d1lc73DxkZOmuh47uqS4DK9vqH/L55/AWxBaSTNcF7mjyEIqvm8IWZgJopfzS1bXFWR5znrnYzNTuCD91/ggQfv4/z5c1zaXmVbq1iB1SqAy0ciJycDXn3lMs88/ypHJ47R2FFVFWnd2Je6ZwPgG+VxFWWFGkUIalWHXBk0C5afPrPWxNvMvHxlajBzzlF5xd7BkOF4xsnJCSfHA0ajCePJrFZWrxBlQCxK6Ugr1xH8RBReHDoVREV9v2aWaHnOqAGWM90jQKMJKBx6GUw4LUcUlrIyAEMsJzaVvqbktwxIcub5TsfyO2ky0dOvMS9JAj5UpxiOqqbOzz+DB12XKAMRLEJ9PNCK2WQciSdLVcwsy1hb69Jrt9jc7LDWabO1vcn6+vo8I2t6ZrMiZlYhOILz+OCWskWYOE9Qi4Fn1dDqfcyiFJqqqlBBSJIEa1O895Rlia8maD+g09Ksd3tcuus8D3/wAe696wIPXloNHb+fY3Xy38dx5UTk1R/d4oUXX+HmrUP6/RFHxxMwHfKsS5ZleIk7X+99PZ8UKeViYr8JLZHNVs87aRSttIX4hclgpKEnc9p6YrMaWAJVVTGptQFPTgaMRwWHJ9M5QaKoYqnMGIMyttYD1PPFL0oHqjn7DhWo/AyMwiodF816sVThNFjdMVRAUcESJJ2+f5jPOjV/W2RA4Q7Z2k8CquVYWIosP//Zfxtj8GdYeIu/a5Rb0PZFhVqbMJYNRYWFWaRezGzNn0MLidFkaUq7ndPtdtlc67G5tcH25gbdbpc8jVYrsXQo+NDQ+0tEhNJFhY4477VQmA8hGlEaHee03BJ1HkAri9UB8TN8NcFVFWmq2VjrsruzyUMfeIBHH36Ahy+tho3fj7E66e/DeOMoyPPPv8IPX36NW7f67B8OGU8K2q012t11KhezlKaMkySRVQZQVDNSa6KTra5Le4a5kgSACqaeETLzeZxo5y6UzlOWjsl4xvHxMUcnfQb9IaPRiMlkRlEJ7dZ6FH71tWOvjiW7EBa9m5jlLQZ1RS/+3Qi1Lks1xfclwII6DqBOleviT6FCLWdKzeP16SFadQqDIuuRZm5LnQWpJZJGUG8CmM3c1xmG4FnAMvqUMsW8vKhity1RWe0+7E+VCJv3b4zBNRJM+Jj5qqg6H+n+SfwMziN4EqNptXPWuh3yluWuC+dpt3K63TadVoa1mgV8BJBqDkLee1xYAtRanQStQKKD8mJTEwG2KKb1JiCgEYKvcOWUXrfN3Zd2ePyxh7jr4g733tVhq7UqEb5fYnWi30fx4uUDuXrtFj986TKvXb7O4fGEJN/AJG28N4Ct+zx+XtqL2nHMB3qTJEGWbNeVAq3q7KpevSsfMDbFGEMIUJWO8WzKYDBiOJqwd+uQ8Swy+GbTkkDNaEvSKCVUxYXLaFC1HqCnlhuSRtVczRXQG3v42FMRUtMhLC2QVjUsP6nnjBa9JE1UdUeFeQ/qrFyf5jQ4NQw+dYbcoKMAx1yf7+yzNNFkZrcxBpdLd2oxe7ZMAIEFWDYIoTDz96+VxPexPPukTwvtOueiA7IxKKswRFV3cZ7KC0a3o4xtzUbUOLQCg6B0dA9rtxI2el3W1zqsrXXZWOvOLUZMqDAqEKiFcpv3Ufcky7KMz1/3ETF63rsqygqddBClqIoSCZ5EK7ybobwnsYFq1ucD99/Fkx95hEceuY/H7lkNGr8fYnWS3wfx+o2pXH7jGs88/yIvvnKZWSGIJOi0jagE7w3WRmZfVRakGbgqsvnSrIUm6s3Fxnx7LsTasPeWBWVFgbEJhasYDsccHR1xdNxnMBjRPxkwGE8iMy8o0LFvZWyCUoYQQlwsa+29ZeUEpRTaRvZgFRYuwAEfF9X5kLDFkOFcXHyB+WAw80FlgIA+U52bExaWmzmACnUmdqrcFubg1QjbUi/QLjRPfEYlngUNfH7bqXms+A4iw29xnwV4LsqE856VUihRePEQIIiPmc7SZxO9NBwswlIadKpb1hBclGrF1wpSkz8CSqr6+DmsBoVHSdRhzBNLr9djY2ONtXabuy9tkyWm7kfZCIQi88+t6/PrZYm4oWLvzyvDaOpJs3acfytLUmtIjKYsxlTFhHamCX6K0RUXz23y2KMP8sTjH+TSpS120lWm9V6N1Yl9D8drJyI/ePplfvDMC+zdOmY6E2IFLGYwOrGR5Sd+sQDqQKrVnOGFsWQ2AW3n2nOxhFPv1M1ixx4zHMX1m7c47g84ODig3x9SliXN+hxEagr3UnmuGahVClEah9zx8zT3WVZmaIgNDTtPswAFtfSY+IDF4+4UTb6ldP0+z9zXsAwsYQFecvp+obYQaTK25b6MiMwFd5ff2/JMV2T4vfl7bRQ5AIIKqFATXUQTVEMkaajyy6+xtAm48+EFFIpk8do1WGkV5huTIA4VhBD8KeDU2qBVYGd7nY21Djs7O2xurkdqvDH17FZAnI+MQpoSoKs3E57KQRUMgfh3EQEfFTYUAZQH74CAq2YEcbRbCRfP7fLEE0/wkSc+wOMXV4D1XozVSX0PxutDkR889zpPf/95rl+7xWjiqEqwNXGiWf9ENTv4pf6TElSQmvkVF61Yfqt7QvXcDjXglM4xmczo9/scHx8zGk/YP+pTlCVFUZzqRUCtzWeSMxnH8tBtBJ5mMV22hm/mnuYL+232GjEzWWgInon50G9NJK+p6ZEgIfXvCxX2+SK/1LvSUpsXLpXdmsW6IVo452Kv7Sy4NVK3eqksWWsKNo7CUtujCAtAOgtozXE8q37RxEIiSZ963DJYNQf7ToQQjZmXOpmXdxsG6CI7bUC42RxoHR2aq2JClid0Wjm9Xo/1jR5bWxtsbW6w1uki3mGsAu8iA9BVNQmn3qwEhfM1gaQR/MUTarkrAG0Wg8hSz9Plec7udpvf+KXHeOKRu3nwwtpqfXsPxepkvofi1onIt59+gR++dpVXXrvK3t4BRmdkaZeqFMCQZ22UiYsKhCh3ZDTGLnpOhAUxoul9NCBlbFrr5lUMB2OO+iecnPQ5PjlhOBzW6hA6KgIuCdTGBbqxYT+tjXfbiqmXS1+LhVpL0z06y5pbAjsAe/sifgocw+mMLP4M88wkliGXSAFLuncLdYp6WFaWBnvDgljhRc6wCRdDwfP3sTRHFZA5ZV0pc5r2fuYzLLKqO3999dn5LzkNWsvH7Q52WvPzEcFpsaGpD96CYDI/f83rRTC2icZ7R6hiuTaxmm63zebGGp1Oh92tTTrdNt12KyrY+2qeYYUQ0EmKC74myoQ5CAbnTzFMm59a69gHc54817QTz7137fDhDz/CJz/2GHdvrjKt90KsTuJ7IK4di1y5OuD5517i2Rde4vL1W2AsRtuY1agUY2KmpLSlqoq5FJIxGm1CDVSRYadVXit3CyaxJDYjIBRFxbQo6B/1GYxHHB4ecXwyYDKZ4L2Pi4rR6Dojg9sZcXdkwcnpjEEbdWaEtvl7LXVUyyQtnms5MwsErSIBZHnutrlvTeU+8wZO/3anpEwWyuWpTWiUKCKAnZZMOtsj0mfeRwRDfebYLH3+M869Dbvw1GcRXR8DfdtzqLNsQ3mT494QNs78SQJ1RrUwpxTxt5U05yVZaTYPEZSjuaNACHU52WO0xlqNNYput81Gb42dnS021tfJskjG0QSCCnhZDCDPPy/MrUq0tjjnotVJUJH0I3HwOE0tezevsLneYWuzy7337PLkEw/zoUfu5Z6dlavxuzlWJ+9dHs++VsnXn3qGp59+kYOjEc4HnASyVo7W9fAlhiyLHlFlWZKkBpM0SubRs0jw0YpDp1jTQqkkKktYg3fCyXDA3t4+R8fHHB+eUHlHWTpK7xZ9CyIlebmJLyKL4dAlKvnphXop65Hmf4vMg7kw7GnViTlhQS31vACnhKDVAiROlcuWQOy2MlpNhw+WxuKjed7F3FXAldWpxy/AaAlc3uTzzd/nGYBe/AxYA9QAGCn6NSAtl0Rro0dEL455fcwabcHbXpM7RzgDeM35jI9bgFUjDzWfi2rGApZ8uQCKKupCJsYumJchkjOQ2H9KjCVvpWz01lhf77GxscHGeo+8nVOUw3my5r1HXONJtsj4AVxZIRLB3zlHVb+uSMBaTVWOCG7M+d0eH378QT7+sUd5+AMX2clWmda7MVYn7V0az70xlOdffIOnn36ZF1++xngaSJIOIlEUVuuFLUfjYQQBZSDNkho4FguksiaqoScpSnK8p5Y7GnN81Ofo5Jh+f8ikmOFmLpbPdFQ/N0oTELwLBImTUNosFCwasJqXr8JZkDhDMgh+UW471VdZ6lnV2UKjfr5QeFB4VYNaTXBoZnYWKFXv2OcludMKEonKkPnAap1N4OuHB6zWLARoI9FimbnovV9a7Buyx3Imped/WzZ+bECxLCZo3FL2FJmTighMITBftKXWOVzgZbToUJw+xmeB6hQxhduzs9PHpO5RLYHVMtGlGf5t/oZK6tubt1TPe4VY1jNK43yF+AgqrVaL9V6H9fV12u2UrXPr2ERhbXyeUC1Kj1pZiqIgSRIIjRlmMndSVtoyq6IfGcFjjUdJCcy4++IOH3rkfj77iY9w6VyPnc4KtN5NsTpZ77K4MRR56dWbfPkrT/H0sy9TOYsybYoKjM1p5R1w0TQQFRcDkdiozvOUdq/NrJjOFxytI6CpWhYpiGY6dozHU46OTjg6Ooq9KFdFgDAajYkyRl5Oadct3GndHUkBTf+roaY3sVzKUiraqS9iGYiWxGcb9fOlxyulaqfepL5vU0gMtWdWDZaNjf0S2w2WsMwvCAxNWa7ZAGijGA9H8TnFzx+7AKJwZjFvBnhZ6v81ZdK6fDb/uFHuqZ3ncwJHfN5ao7DWZ2yyKaX0fHYpfi4F4jHzku7tMVeZXzo6Z0OrJeBZEt6dn58zxI/bXqN2GRb8ElMwql0oHdl93rv5HFfTC7TWkqSKu++5SJ6ndLtd2u32GcNODT7MqwbOuTk7stEtnBQzWu02VRmV97WGdp6SAJqKjzz+EI89fB8fe+IDPHTRrNbAd0msTtS7KL71/IF889vP8Ozzr3I8mDGeebxKQCVom6CMxZWedpIRqshYS1NLlluCCrXzbUGn05nvVE2SYk3UZptMZowmU46OBvQHI06OjpmVFVYbkiyt+0U1ZbwWIZ2XjJqFtQbIUBsdAmcyB+5gPniaABB7SvVC3vT49aJPI9KA1JmMTMeF3KqURbawDFRREaHJMlFhKeNaAJZNoiK4MYYkteRpRquVkWUZNtG0szzKDWkV+zDWRisUZed6e8uMxSj4Gmnazgem02lUka8qZqWjmlVMywJfRvLAeDyF2mbD1zJFrp4z9kJkaWqDVnYOWnEAVyHiicvvaWWOUyB1B5BZ7lsZJRAaC5HTQPWTQikV1Ufmvy/9EmoAq5VETH1NVFWBc7GEl2cJzpV0u122t7fZ3t5mba1LmqbxKUI8h1rr+YyWtfXgeJ3RVsFTVRUhQJrlJEnGdDzDFTOy1OCKIRfPrfPhx+7j4x/+IB/8wHnOr68knN7psTpB74J4/aaXH750ha99/Xs889wrYNqISVHaEkyUrAlN/0QpOkmHMG9QC8YodLKwcE+ShGbOVZmUEGAwGHHr5j6Hh8dMi1nccUtNpW5Ya3WmEMKd1B6WwGEp41jeiS/3OpZ/P70Gxn6ONXFxKlwUPNVJFKutvCNN04Uw7bKckjJRrcLVoq001Oqanq9kvpCnmSVNLWliSBIbm/4bG6z3WuzsdElSaLfb9Hodet0u7XZOnucYo2nnadRI1FErMTIeo818o7e3zLwTYe4F5QNMJpNoYTIrGc+mFJOC4WRMMSmYlYHjwwmzWUW/32fQHzGdTpnMCkbjCaPJDK0tRemoKo+TgDUJ2kbSRqO3GA0qE5SKivTNBkFqEK68B/Q8y3XBgyiMVmgcEhb0fQlqsbkxp5mKp0I15UK9JOy7xH6s/9pkbHrpGlhcO3rezzPG1Irwkfq+ubFBnkdFeaWpPbYqNAsleOfcQmkEG61KQmRYaqLfl5uNMaokUSW7Wy0+9cnH+NyvfooPnF8J5b6TY3Vy3sGxPxJ5/Y1DvvI33+Nr3/w+47GwsX2J0axEaYtYTVAO0Z5ANZcf0lXUd7PaoMyipNWIvSZJBtpQVZ6TkwF7t444PjqhLANohQtRyPX2HssiW4A7ARUsg9VZqvQpdtupHfvpLKuqPEYnKLugejeg5yUCUaMZ2Cy2zRCzVopEAolRJMZijCJNUzrdFpvrXTqdFjvbm3S7Hba2YlO/1crIWxmtNCPNIEk8Wgs2iXYmjW18VIsXimKKNioKwqrFXJdVFsyCCm8wUb0hKHw9N+SDzGWovI+ZUwNkzgW8Ax9SnIPppGAym1KWFUVVMZkVzKYleweHTCczTobR9Xg4HjEaTRgOh0xmFVnepXKhzi7qnp2tyQ61eaVzLoJCDfYu+OhyrMHqsLTZYb4xabyxiqK48wU7BysIStDztLj+cwMidb+vuWqWS6hxyitbGD0SqwO9tS6b62t0uhG88jzFJgbnSnxV0Myvaa3xMxfp/8rEHibLc2uB4CuUlBgqEuNo55p77zrHpz75UT7+0Q9yz8aql/VOjNVJeYfGK7ecPPXN7/ONb/2A69f6oFtAzqQQbJITjEKpQNAO0QVKB7RxKAxacuKXfiHwGstwsUk/mcyYTAv6/SHHRwOGwzFl6UAMWiu0VfhTxoB39m16s8b8XDtviS6+DFRne1anhVsViU6WbOUXKgnWWnRiCVVFFeLfmtcwVpFlGe3UsL2Ws7nWYnd7h416tqe31mV7s0e32yaxmiSxZFlClkRGpNJxiFcpwSYL8sX8naqmTBgis1JLrWgh87/rGqmiFYegJBJPRKRWiBdcIA7CNgSOoGBOVVe4AI13WHxcvD0ocF4ikCcpZekYTyZMJrPo+TUaMhgMGE8cV68eMRzHQe3JbDoHSlcFKh9IkgRXD2sro0Fi6UxcJIgE7+YU+9gvqktuTu54/jhzjMJ8LmvZz+sUbp1+2HJ2JRoJNpJ3JNqheF+hNWR5SpIY1jc6Mdva3CDLFmMEUVlDkanWfIA8qEAQweFx3hPEYa2lnE3RBLSC2XgEQXjoAw/w8Q8/xG/82mM8fLG1WhvfYbE6Ie+wuDYJ8uwzb/D9p1/ge999lqPjKWm6RpqvoVQLlKWoSzSiAyiH0vE/berdJS1CiItd4xkVvDCdxp36/t4xw+GYQX+I90KSZCQ2w/tA6UqUVXPAifGzgdVpJhm3gVWclVnINDWMu/mzigJpnG5jCasopvMGurGxV5TnOb1el7Vej7WNHtubW2ystdjsWbbWWmzvbNFtd9CaaH2hFTYxtLI0vicf+3paonK8rbOPxfBvBDJDzJzmtHsfm/pK1+SS+lg1m4PU2No/itrKI/aaIvAI1sahV+8a+wwW5oUhMHPVKYp/kMi8FAXBg4stpXkZtOmLlWVJUYGXnP6w4ODggKPDY/r9PkcnfY4OTxiMJxRFMXdT9rUTMEbPM++mnDZnHdY9Ra2in1WjDXlb3AZWZ/58G1jVih6NLFUN3EicCTQ1W9W5mt23JJjcamdsrPXY3Nxkrc60tNbgIZEMmn6fdoAQVIUTRxBBqyjmqyX2G7UkVJUDD1YXPPbwJp/65MN85pMf41JvlWW9U2J1It5B8ezVkXz/By/xl3/5NUajOMekbYbSKZUTRCXYJIvurapRAw9oE9WwjQK0ovIKbdJ6VxwXl/7JkMN64ZqMi5oOvgQ2S6oH4bb5oybuBE5Lf5Uf//hl6nNTsom/L4ZNDQrvSnztjRTLb2ATQ6/dotvtsrHeo93O2dreZHt7k43eGnknp9tqk7cN7cSTWLDW1H2RmIXZ2ovLVSVaQ2o1SWKwZvFeQGFNHhdQUUsZl5rPDDXEAK1P6wVqpVAGrDZz+aTImoQq+AhKS8zARkV+TloJAYdHpAIdj0dVNVR4M1fvUErhg9S9nYUSu3eC8yC6ReVVBKO6vDgrSmazkqJ0XL58hf5wxOHhMYfHR4xHU2aVw7uoXi9YnMSysbUpWpulLDCWL+szXR+yMzR5ebPrh/mxWjxsmZcYb7c2nR+fMO+dgamvmbnShYY8z9lYX48l3Y0Nuq0u5awC72IJlgqlApgIcqLBFVUckMdEUkrQSDD4KuCqEWky49x2zsc/+gS/8suf5GMPrnpZ74RYnYR3QOxNRL77/Tf42je+ywsvXebwuCRvraONiWrn1pC3WjjnGIxHdLtriHh0YwmhY8lv3texGmUswcNoNOLo6ITj4z7TyaxeIGP/YdGULudMKq01zJ13T2+Fl3X67hQNWDUlxNt6ViwZKTbv1XucqxalPg0Gj9VClqR0Oi3W1rtsb29y4dwuGxtrbG2ux8wqS8myZD4vpgkYC5GLESncWkfVhCQxZEmKsUTChonzPtpECrvU3k8SFHneieVUlkuoCrOE1c0x1waUxN6V1tGUkPrTRhGHGgBCJMKICM4vVMhDCATUqd+dlCgdQS72lpqsLoKgURYfZF7em894BYUTQFmCqLov5nGVUHqHd1Fzz5iEyaxgMBhxdNyPIwrHcUzheDjhZFxQ+gh+8RyaORhGgk5Wf8Y3A6uGOn8ahBbXkaqvl9vNJmOvcwHei00CtwkLzzc4StNut9ne2mFjc531Xitm0ypWCKQuGTczdwvCSOxlORdwFRhjydMUoytm4z7WVDzy0D187tc+yac/eTc7K++sX2isDv4vOK6diHztGy/zV5//Cpev3CTJ19Gmx2hSghbanRwnJZPpmCQxbG1tMJvFrEOLRqOxpLFfEqKNe6U8kyr6Rx0f9xkORlRVHJhMkkU/KIiLZRUbF9tG4saYdGnGZxFnqctvlmf52/yaTpcBfajm/44LEqRpSp7ntDLDWmbZ3uxx4cIFtrc3Wet1abUyEgtKw1qnjQ8VEkoMscQXgU5hkpgVaK3n9HOj6yxIa5TytLIMpZoMSUhM7IdliY1Ne+9jT6oGdKP0qbJlauNQtVULHyylo6Cr0lJT7xcg1ABJY5VROj+npcdjEI9D6V3MwmZx4xCWwKhhYjoJuMItbOLr2aPlY+1wC8q7BJA60xOLoJnNinrWy+IDOOcZTWacnJxw3J9wMCo47I/Yu3XAyckJ02nczGhla4JFNX+teKLvnElFMGp6V3eIO4GVCjg/xtTnRNcbp4ZwIUEhIaCVmQsiOxdBPktbtNqGu+7ZIm8ltPMOSZKgg4qEER/7Y4nNFuQTGzdgVVUREKxJGZ4UdFoZMEPckEvnuvzyZz/Er/3yR/ngPe3VmvkLitWB/wXG135wU/7yv32NF166ynQKlTf4YFA2R9vYL3E4tA7oJJajvK9q7bUo7GpI0DpFhwhWXgLXD2/RHw/p9/sURRE9noyZ9zaiPUPjIhvAqJriXLP0JI5P3hmsbl+YoqbbQhFBQu0Gu6QQoeYDoHFhiQoXEaTa7ZzNzU22dzbZ6PW4a3edbiej1WrFjEURFy8NUlPXCQ6FRBBSep61RWaergV6DUapSL6whjSzJEkEryQxtLKENLUkNeMvTSLrL2tblIKt/O0v/xxOvFSzCEBRQqiazxNVpad0Fa50tWKD4Kow/3fM0jyiHJU4XOVjqbBWyHchkjxs0iIEKEqPqwKio5JG5QLTyuNUwmBSMBgM6vLxEbf2Djg4OGIymeFj+vYmIrgLYLoNouTNtjdL15pyoIqYGUEkRTih8T5LbEbwnqqMbMamnDfXEdQemznWN7rsbu+yvr5OaltxtqtWvFChtjoJIVYV8LFXSbQoyZINiqLC6IrUVJSzY/Kk5BMff5Rf/5WP86tP3rNaN38BsTrov4C4UYh85WvP8aUvPcUbbxzhXEoIOUgSqbeqROn4BVL1HM8yGKRJVi9OtbGgSinLkkF/yHA84uatw6WFJMyp6000PQUzP/2nSRNNLb9ZABrJn0bY1BiD99GWQVRkVCkTGXQSDEa3CZVHJPYVfKjwVYlNDFlmSBNF3krY2Fjj3Pkdzm1vs7beJU0tWglr3VZtaa5q1l2tttG8jxCb5DGbsli10KhDHFkrDvamqSWzzWBvQqudkaaWtV57TmnfXcvftd+BG7fGUhQlRVExm5ZMp1OKqqRSwqxycyKFSDw2LmhCEHyIA8S+tuQSFTcXcdhYmFazWvU8xH5X6RkMxxwe9OmPRty8ccTxSZ/BMDINXZ2dKW3JkqjKbxuprTqrDCHMr6M5nf7ULFp9jgkYXauONPN9QlTuqCNuqNSd+64qUFUzkiSh1+2yubnJ5uZmTbTRsZflXJyTM3FDJUu9MVGGgKL0Di2xHyzeIWFGninWOin/7Hf/AY8/9iCPXFiVBd/OWB3stzFulSJ7B2P+2xe+zvd+8BKvvXYTq7to02M68ShSemsdfBhhbFj0dmoaM6IQHYEkSZK5XcdwNOH4OJInpmWJhCQSqlUjZROWGHmL5riZE7Oby6DpDZzWemukjZYXF6UaO4xGDaImTaDBxT5AQ2qwiSK1ht5ai41el/MXt2jnGb21dizvGYUxGptEZe5iWpIYS5aYevgW6lFTlBLSxCA+zAkZWZLSarVot7vkqSGxgbyV0Ou262HelCxP2e6+P1QKXr5yJLOyYjwtmEwmzGYl08mMybSiLB02zWM/TRpBXV3Pe9UakkktICsqljLRVD7OfU0Lx9HxkMPjAXv7x5wMBoyGMwajSRx/QNFttedafcC8XNfY2y9T3xeD5q7usVVkxsZrFuYUwmUB40UP9OzpjNdvlmWx11fLMnW7bTY3N9nZ3qLT6UT/q1AR3GL8wdSVBY8QRKik7hUqE/t+vsIqaGeabsvy2U99hF//1Y/z5AMr8sXbFasD/TbGV57Zkz/+07/ihy9dZjINlCWYpEWadFAqQULMJJSOA75z+nLDOLPJvNEeRFEUFYPBgMNav885T0BjTK2N12RTwS9lVgtFbS23gxQqENQyNbnW2JPoR9UoX3sXCLXsjbWm7h04vCtJLSgik6/Tzul0Wmyu9Th3fped7XU6nRaprc328AQXd7VJasiSnFDG8o5RRGq+OJSuSKwisZEckaeadiun3U7ptDLa7RatVossTem2Y69iayVUyt7AS1FUTMYzxtMZxazk4PiEsnRMp1PKplRYA5cLEJSh8rWcFvG8OwlUzuO8gLFMZyXDyYTBcDwnahwfHzMezTg5GUWCSpNZNRU+uzyQvMimlLZE9X8QH0hOqcDXg8Z3PJN3LiuaZk4vxL6U1SZeg1sbkU261gMV6spCvYmr7UcET6iJP41Ys4hQliUq+Jj1+RlWlTz+6P387j/6TX7z05fe99fZ2xGrg/w2xNVjka8/9UO+9OVv8YPnXsFJSpZ3wRhcFUsiWZaBChRFQavVomFRqbmBYVR0UMpQVp7hcMjR0QmDwYCyquJ9lUKUwXs5BVaLXeppf6DI3lsCqvo+Xs2gNguMt98BsFhYU4TAYuHB08k96+stLly4wIXdHbq9NlabeUkuS/XcLkIpRVIPLgdxiIdEpZFZp+IcmTVCq21Z7+W0O5ZOO6HTzdlc79Drtri4vnKE/VnixqGX0XjMyckgDhKPJ0ymBdPplFkJhYu9U+cj3T5mG3WPh1ow1+ioguI9VeUZTyecHPcZDCYcHAziwPnxMVVVkaY51loq7ymKgjzPWYgeL/QKG/p/M48eB3uXlfEjYeMnsVJdFeYDzY1ZpJLY9zRWc+HceTqdFr1ejzy19YzarJ4rkzlLFeIGsdmIiavisHiowBdomXHp/Dq//iuf5Ld+65e4b2e1OXorY3Vw3+J4+bqTv/yrr/HXX/gme4cT0mwd0RlFFVUCstwCDucLtInqCIJFQqSKz4d6axWBqvTc2t9jOi0YT6a16WEEsxACpXPzAdIm1Jm5lzlYsQRSc88kh5MiKjDUJRqlTL21jWBVFY48z0nTWIYsiwpjDBsbG2xttrhwvk2va9nY2GCt24lDsnHbHMkSREqxrvtfttF5q0oqV5Jnhnae0G23aHdSOt2ctbU2Wxs9Ot2MXrfFduvd22t6J8XRwMt0OmUwiOAyGJbc2B9TVorZbEbhHM77udq7V5rCeRrpXy+16rtWVKVnVlWMx47RaMz+/j57e3scnwwoy5JGi1DZhQhvo1u42OxoxNdDyLVzc4zbwerOfmWx7zT/dzOEvkT2yZI0yjdtbrLWjVm4ENmCulZg8TVQa7VQfI+ZpqecTem0UoIbMxsfs7XR4Zc+8wk+97lf5TMfWrEF36pYHdi3MJ56/kj+7M+/yNe+/gOmZUKabVKWoNNWfY+AsVEmSRuPMg6Uxld23vBuqLWzabQ7GE8nnJwM4qNlQV1uvuzN4OgyWC25HZ0KcxaoqOVpWJQBF4C16FlVhZsTLTqtjPX1dXZ2dtje3mKtm3JuJ8PocvEcEt9DWmvslZNxLGcieF+hBNLM0mt3aLcsuztdOt2Erc0N1ta6tFotzvXS1bX6NsTRwMvN/QGjccnR0RGHx32GwzGj2Yxi5imcxyQ5LgguaASFNkkcPg8eHxSli4BSliVHJ8fcuH6Lg4NDJrMpEhQnJye1k3WCMnqeZQGo2uJFye2lwLOx7MB8ikCkknpmzZ2ak9Nzd2ePUVEBZX1jjY2NDTqdVvRlCwEzdyqOWaRS5tQcnNYwHByRJZr1XsZsMqQsxjz50Y/w27/9KT796fs5n6+yrJ93rA7oWxCHM5G/+uIP+MLnv8obV/YZT0Foo3UXhyEEIctzlA4U5QhtHK22RSiZzQqyZA1MiiI2d2ezGcPxhNFoFEVERc13pc0XCJiLvzpXLqmkszAynMdi57ocjdVEQJZUs5sSTfQ5UkriDIry5Llld2eLixcvsLO7RauVYajw5ZDUKrI0xdpaozB4fFVQVQVZ3bvIEktiNJ28xfpGj93tHdY32qytWVqZZme9u7o+f4Fx7WAkx/0B/ZMRBydRR7I/KpkVjlkRKB0onRKIosjOR4WOzlqP8XRCUVRoa0mSjPF4zJWr17l+8yaj4SSyFWcNo7SeY2NRZn5zmvvZRSvclmFVfmEho+sxhkYmq5Hsomb/pWlCr9djbW2NbqdDag12rrSi5oAlIlHB3XtQgrgKJCq+I9FUMs8SOm3hf/r93+CRh+/myfvPra7fn2OsDubPOW4ei3zha8/x+S9+jR888wJa5eStTUJI8SpBmwRrU8pyhlJClmuU9pTVOM6IpDlIBhJr6ePphMFgxGg0oqpqpQdt5hnVsmyRd1GpwKana/q3m5y/GVhF9hcqwSNxNkXV1hq6FnnVgYsXdtna7nLxwi7rGx1Sq1DKo43CGqFtNeIdrowipFYTrThMJHC0EkurlbC9ucH53R3OnzvH/ZdW5ZN3cuwNZ3J4NOS4P+WNN25ydDKmP5jhPHhnYlmbBJOnFGUZN1P1depdoHSeWenwXjg6PuHw6IRbt/Y5GYzqbCUK5jYMxfko8alrtL5EzpS19VJPNgCNUzEsOQ4ohVmizkfmapj3plqtnK2tLTbWe6TEOUBFpLFLiO8pSmYFvAvYxKCCp3IF4l30MxPB+zE7W5bf+tyn+c3P/TJP3LMqV/+8YnUgf47x+o1C/uA//yV/+ldP4cni1KtYBEPAEothi7q9UlHNQaTC1Bp40cupxXAUFQVGo1EcgFyadZKlGt98voiFZcfZ/rM6A0pzlqGLJnXGmGgTDhTOo006l7FRSkAJ7dyyu7PJ7u4mmxtdOm1Lp51hk4DGo1RNU9caVZUoqZvciUYDVkOvm7O21uXBe++mt9Zic2Od3TW7ugbfZXFrIHLcn3H12i0uX7nO4cGQ6ayosyuJ1QMFSkdCUFXPayljybIWk2nFYDRmOi046Q+5fv0mh0cniBB9y2q6uK89t5rrNSrXB3T9HRKioSW1n5UxjWHlGeHlM8Qi7+M1r4mknqbvm2UZeWq4a3eTLE2wdiFrJTpmeyEE0HHOkLDsfBzFhxOrcOWITsvyiY89xu/+48/xy0+sr67xn0OsDuLPKb78ravyN1/+Kt/5wQvsnUAgi4CgFwgyt7NIIzA09XOtbe2uC6WrGPQnzIqK6WTCrCjil1gvS+qc+TKeNULUp3tUZ8GqUbFI6p2v0gs6u4hQVFVk6SUJ670OGxvrbG322NpcZ63bIs8MShxIhaJCqKLKmomSR+3Egndoo1jrdtjZ3eKuC7tcvHCejc02O91VPf+9EEdTkcGgYv8wZklXrl7n1v4RojLG05KydCht587Ggo0lP5VQVFGjsnSewWDC8ckJ+/vH7O3vMylmmMSSmDgvKJ65+7DCoEShazf65b5UCC6qqdvkVEamznwfGmAx9fxiI/9lrSUxkFlhY63D2toG2iZ1mT2WKEUEbZIarOKoSVTCiHR8qzQaQ3AT8lR47JG7+Ue//Wn++889tLrm/56xOoA/h/j8N2/JH/7Rn/DCi68yGDuS1i6BNGYlurY1aIQ1a825hTW7jirTnugzNZlxeHQUSw5VM+ux2F3G4eA3s+yo48zs61mwaqi4SnwcLq6/+M45fChpt1PanSyy+zY2a5Bqk1qDkkCeJpTFFCWOPEto53GI0wcHwdNKFVvra1y6eJ6LF8+ze26bu1a03vd0HE4q2d8/5PBoyEuv3KQ/nDEaTqIOIgovhspB5QN53o1ivhi8KLyPskpHRwOu3rjO8eCY8axgNp5ReSHRFrSdC/Oepq4HlIlViUbzstETXI5lqTDn3KnyeaPiLhKtGsVN6HU7rPXWaXXaZFlWq8839jERGEWWxKObTFAsUkXxZFcOsWbKE4/cxT/8B5/lVz7zGBfXzep78HeM1YH7e8T+WOTrT73Bn/zpX/H8iz9C2xzRKUKOYGuQEpSqm7L1Dq9p8mqTolSctRqPpwz6Y0aTMVVohiYXTeJlUJJwpgx4Nn4CWCVJQlUVUDObRAJBHEmSkOeWCxc22N5aZ2trizxPSYwhMbWye/AoCSRWk1uDSEU1nYIK7OxsceH8Dndf2Ob8uW0eefCdWf5wciQCJGrrju+vkhsi3NmzSaFqiVoz/335Z9yBW6jpAgGwavsdeRzeqri8V8jB0Zjr125y48Ytjo5PmMwcggGb4VygCooopBtln7RNAc1kNmUwHrF/cMCNGzc5OR7F+SedzIeWG7eAhlwkKpwSGg53JA8uy43VzMMl8d8G6JCA1Q7BY3VCu91mfX2dXq83L5UHt+SiTBwxCSGgaoYkztQlQcGoKaE64eL5Dv/gt3+Ff/g7n+XujfeHksrPO1YH7e8YRzORv/zrH/Kf/uBPubU/JmttUAZQJIve0bxeHkkK8cYom2SMAZVQVZ7+YMRgMGQymeCcI8nTUxP+zcBvE8sCs3cEqzNNq7NgFYKLZUATjQ+dn2GtZXc3gszGRs5aN8oUSf0lTIwhSy2JAiVx1kSFiiwzbK+vc/78LvfdezcXzm/zwN3vjKZykAMBR6DEUxIo8BRkaDwFgQpHRaDESYX4qN7h/JRlpfgm5uxKpeZKHtHqPspMaTSKNpZdoBWV8DG1Z7NBE5VFFOZ9AWDXD70cHh5za++QG3v7UZ5pOCEEzbT0GJNhk5zKx6FjrS0OqLxjMivp94fs7x+yv3fEcDTDe5n3wRAdh5VDwIVIPMKAVbGc/mauxHObkKXv11yALASEQGqjB5zUva12u81ar0O326WV5eDd/OkaohPE14wCH21GoxEaT6ulCeUE78c8cO9Fnnjsfn7/9/4pD19aVRp+1lgdsL9DXL4V5E//6xf54pe+zbX9IUm6QaUypjNPq9NGBQfKvenjrUmj+23lGI/H9AdDxuNxVFJPNLdfxurOoMSdwUrOyNCcnVkJoc6ktKbVzuj1WmxsrrG1tUWv26KbW6ypPZTExwxMCUYCSipSo0iMsLnR48H77+aRhz/Ahz6w+bZeS04OBEqkBiFXg4/gmM76UNuhV25G5cYUfoYPU4JMGY6OCFT4UOL8DO9LSl8ivooDoaE8A1QLq4u50oJeMDGNtmij0MqgVZvUnEdJjrUpSZKRJi3SNCexLbRK6HW3MTrHqBxNjiJFk2BJAYupx7X1ewjQLt+cycuvXebqtVscHA04PhlSlIJJMoKY6MMlKjoqawMqjnhMpwXHR0Nu7R9xdDhgPJ0xmc6A6LtmTLTFCSEgOvaMTplc17Es5ryQgZrPZpy6r/e+NnpUsdznPdZqNtfWWVvrkicpphGYDoFl+XkvIdqyaBUlnJxHgsMqhdUBi+N3fvOX+e3f/AyfeWI1mvGzxOpg/Yzx6vWx/PUXv8Z/+sO/4GQkbJ9/gNEURlPA5LTbOeIHaFXV1HA9lyxqlKNDgPF4zHA8YjabUboqKk/U1urOVfNS3jIYLXaLP74M+OZgFb+s1lq0gXYelc93d7fZ3FrHWkPwFd2shSX22rSinifxZAbSFDa6GQ89dC+PP/IAH7z37ZE68nJLAmM8EypOqBhRuCOmsyOmxRHjYoArxzg/Yjo9IsgM56toAREqvLgo8aR81KFTzYBo7SlFrQ+35GY8D1nyrZqrzy+DlkHraP+ulAIf5jvuKE1lMTpD6xRFitUtEtsmS9fJ0i5Z2qWV92i1umR2l555BC0bGJVgSN9ToHX9WOTlVy9z4+YBN/aOORkMmcwqUFH3snQBnWRUvnZCVhbvFIPRlP39Y46OhxwcHlEUBUVVSyKZhdJFnOkLpzhG/sxQ/KJicfttAnivalUYBeLxZUkQRytNokxTu0Oe52Rp7I2pZbDCM6lGtDptrMkpGvFgMVGL0Je0UsUvffrD/NN/9Cv80pO998y5fatjdaB+hvju8/vyF3/1Rf72699lUoDJNhiMHU5SemvbTEshiCezBQqHwcz19URHPT1RmsFgRL/fZzgc4sWhbZSeabaEIfjTNfjatE8Jc1HQxn/1jhmX6Lm1wqmov9BZlnLh3A4XLpyj28mw1mAT6i+nkEkatdR0qFl/Jd2W4q67drn3rh0effgBtjY77Pbemtp7kCsiTPAUVEyYVP05KJVhwP7BG3gZU/kBpetTuEmdNVUoKVBqilCixMd5MRUro7o2WyyXyzj1BkKWSjl2vrgtfJYUer6BblTDl0GrcWpGVSgzQ3Co2ktKY1A6xagEpbK4GKo4SyfBEnzMpKzJsWqHlnmMTJ+j3e7S7azTaW/QydZJ6WDJgQxIUerdO3R65cDLa5ff4OVXXuf6zUOcj6XVaemxSYdKFC5UsUQYdD3PpXBBcfX6NY6PxhweDimKAqfLmBFLM1a8ZCeyBCRNdtVQ1RuCxbJBplIKm2ZUVRFFcE3cakbdyoDR0G636Xbb9NqdOIYyT9AMgYqspRkOhxSVp93qYW3ObOoQF6WeDBXVrM+nnnyY//lf/hM++9GVtuVPE6uD9FPGD1718m//w3/mG9/6AZXXaJujbHRerUJkKFmTYhM91xZr7BCMSQiiKEtHUZbcurU3d41tpuMXihEBHUL0hqq/dNJ8qYDGlE8nlkTHRdP72vVUg9UWRRJf3zeOvB5jYsmv3W5z4cI51tfarPW6GCO1qrlHcIhTJCEnVQajHYn17G5nPPTQJT70yL088dDFt+SaKeWmCBXCAUfuO0yrqwxHx4wnR8zKPpWb4PyIqi7diUSdtmXKvfcecRWpVggOJO6plW4yqdiMt1ksw5auwoeapVmDlg5CC42EgISo5tEIBDfjbcsbCdVYozR9Sl2BnqC0x2AQpWqNu/onsacSs7QzHk1ACCnKbBN8gsKSJe2YedkNWukmnXSX3Y0Hadlz5JxHsQ70UO/S7OvK3kjeeOMm167ucevmMYcnU0rJCdpQUVD5kjIIKItSkZI+nU6ZTWD/puf6zT2OJ5fxqgRlqXw8zqrOahspp1jSBgi1eoXUm49m0DjCHBC/C/WgcTMYP9+0SGQTtmqZsV6vV5uhSj0jqVCFw2gQFXAITkKk3kt8T1YnlJMhlikfe/wB/vk/+3X+8a8++K48f29nrA7QTxFf+OYt+ZM//xI/fPEqpbfMCh/r6qaZ4agn5Bv7jVq4VSmDsRatNbNZyckgZlOxxCFzbT+/dBq0BExoSBkmCoY2C/IcvJoZk5puG2JGpo3CKIOb1UOSNi6mSkHesmxvRxp6u93CGkVqLEgFIQ71JqkhtQluUpJbzdZmh0ceuouPfORBnnz0/M/1WnFyVQIjKk4YVQcc929yfLLHeHaNQr2OkwOqahYzJFOgtAO1GKAWEYIXwIIYEEsIsQTni6IuYaq5IG8s/cXXnhbT2IHSGmXq0l2DNgF0tVD38KjoUo+uBVL13GdMYaIjMfVxjp+MJI0LlarPWWMiSIgeYL7eRESsqsk3KhAX0AA22tFr0Rgd+1lSJSjpkqgeyq3Rzi6y0bmHXuse1tr30G2fJ2cToUUVLJm5M9PxnRp7h05eevE1Xn7lOjcOCw5O+szCgLzXwto2w2lJWXoSm2FMRlUYxgPL0ckxt05e5WR4wGDsKKpoWy8C+DhkP2fThqhFmdT8o0XS1cwqWiBgVNy4NbHs7dZECAFrLb1ej16vR5qm8ZrwQlulsXyoKjwOr+PG0weFiKGaeVp5hp8OMGrGZz/+IP/0n/wyH//oB9lpr4gXbxa3DySs4lR89el9+aM/+jxPfesZZpUlb6+DTqiv/cgB08l8kj0EQeno0RO9cGA6LRiOJgwHYyaTGUme188eF1JzVpGiXgjfLJrGrgpxgVTNTr9uNCstcbJfQbfbYWuzx/pGh16vSytPCa6knbVItKGqwJiMLMtQoqnKAbvbKQ9/4AIf/vAj3H/POS6s/3xEZEu5Lo49xu51rk3/kJPxqwzGV5nMDqncqHZr1ZSFi+UbFaIpo26jTbQ7j9YnFYEKpQPBO0Q0SArBIHiSVjSbVEHNyzu+6YEAmW3F46WjGWUIrn4eifNAkqJ1qzYN1CiisLBWWWSsVQLKYJRFK4upB0wNKm4sQgZKITU4SW03jwiB6FWGckjwoDxBKkKoiNZ/M4wZI4wRpfA4QvB4JoiMmIVDsqTHaHqFG8Pvo+mRpxt02ztsrO+y1r6He7qfpJJXRJHjScjUz3ej8VbEue2oZHL1lsjzP7zGG7ducuX6SxyPBlQl5LZLkgpFIVSFQYKh3fKkrZz2xj3sHeSY/QHD0YzpdFqPhtSZlRd88GgNNtEEiZvBRcSepNTuxMBpmad5KTgClrWW0pcUswrFBIWh04nO06mp1wYf1dupiRiCjnNlLups4hSonLIo+NZ3X2Q0HDAaTt6OQ/2ujXf8RfyLjC88dVX+4A//gldevUXhEqal4IMlabXiIqgUSi+GdrXUzVyt0MaACOPJhMFgwGQyIYRYjnB1iUE4rZoO1Arlgabo12RVYYki2zSMbSOHBAghUq9DwCqDMZp2J2Vne5OdnU26nRZWR3O7zGZMRmOM0qx1u4hUlMWM7e1NHrz/HB/78CUuXejwgUt/t9JSkD2BgkhXKCj8gP7kBiej1xnPrtAfv4LjJqXs42UIqsTUPSWtMoJrIcEuGuGqLttIGXtBKi7yi53uopQTteii4ruIqn0nNYoERYpSCa4KaGx9fzVXCDHGgGnhJMekOWnSxtoEdIrRGYltY3RKt7WGxqBVgtUJiU5q+R4DyiJ040xRfWZEfAQiiTv28biP4AhS4twMH2Y4X0Slb8YE3ScwxvsKHwq8j/cNUqGUULgiDnXXpWddu0cbnZCbHXJ/D+vt+9ndvoftzXvpqfNo1oEWHvum82XvpPjRTZFXXnuBZ194ges3Z1RVQsDgKoMKazhf4jgBHfDKMJ4Fjo4nHA9H3LpxncpHHUJExZ7hfIxEaqLNEljVJcDmnCkC+szYwpuNizTl4CzLoiBur4cNAS0BryrQtZOBKII3hKCxKqeclhgFndxQTPcpyxM+8bFH+N3/7jf4H377kXf8+flFxOqgvEn81ddvyR/8wZ/x3e89jzYdkrxHFQzKxD6VLEkUNaywRCdgNF55quApJnHAcTwe45zD6KQeyD09cHq2zLAsD9M0iGNSoPG1PIzWGqvq5nCI/RiDqll+GesbHXZ2N+l2MhITOYmWBKNSDBkqKLwrCW5K3nLcd98uH/v4wzz6wbt55K6/O0PJy4E43mAkb9AfXqM/usykvMqkusGsPKDyA7wvUDpEN2BjkEb2xnu8d/X8lz9NL0aDGEQMRqeLnpEOoIo66yoAjasMEpK4o3YKvAJJsbTRqoNRXRK1RmLXSM0muV2vGXlr0bm5laNSS5q0sDaNAq06xZJjSOuRYIshxWDPeILZH0t8aGa/wEW1BCpcPf8VQsCLYzAZ44OjcmNmxZBpdULpTijDCV4GnIxu4EIfryaYxOFkwqwY4VyBxrDZ3kEqi/It8nSLrfUHObf9KOc2PkSHuwlskKp3h7vtD6/05ZkfvsFzz/2I/YNxHA2wm3hfMPN7TKopLrQQ3aJymnExY3ByxP7RPkeHA5wLpGk2dyj23qGt4rbMCr2wIz4jlHs2GrkyY+IwcFmWKKXodDqsdbp08ozUaqzViIm6gRE4E5SksQrgheAEowLWOkIYk2bCzlrO//z7/wP//J98QAEc9Eeych+IsToIZ2J/JPLVb17mj//kr3n2+ZextoMLUdfM5nlt631Wqy8ygZLaosMjDMbRLbUsZ/Xf1VxD7Oxj4czOrQYrCSqWkZrme9OzqunVKni8i+SK1Gparajbd/78Dt1ORqebkxgB8SivMJJgsJQjR6fdppUnbKwnPPzIeT7+qYf4yIM/245b5EBgBhSUjBmOj5mU+1w/fIaZu86kuMrM3SCYfXQywiY+0vNNjqsU5UzhfVR61/Vci9ISewYSS4Ixu4rGf01mJKFZXHQUIg0zQohZlwSNUVtYFbMgrVIS1SaxXTKzTmLXWO/eRao3yJJNWskGqd0k0S2saaG0ZeYrlNG131ez41akv4BympNDcQwpQ2Q+luEIpwaMp3v0x9cZTW8xnBwynZ1QuQkwQ+sJwc0Qr7GmRZ5ukyc7ZPYilnM88oFfJjXnaNldUrNO8g5nFV4dVPLqa9d57tkrXH3jmBvXjkmyBJVOcEEoXYvKZ1SAr2cI+8MTjo+GDAYjBqMJZVlhTBSr9bWlxyLOglUsD79ZzGXPWHyvGyV3ay3b6xtkWULeslit8MHhXUCpBK1SfKHJ0jZVVVHOCoyNvnbOz8BPePSBu/i93/0tfuO3HmR75Ys1j9WBWIqbfZHvPX2Zf/vv/5IXX75GwNBb22IyKxClSfOM8XRKmiVzFXStlxY1idIx43LGZDZmMp7NZYy01vHiLEsSY+daZacufBECDTsNlsuDfgnMjKqHIGtWU2o13XaLtbU12q2E3XMbKB17Wogn1YrEWEzQBOfITILVgYceuptf+9Un+eDD22y1lRqU+7KW7v7Ya2I2uiVJqglqQlAnlBwwqd7gePwjjvo/YjA5ZDIZEVQJelz/N4mZj6k/Q0igLsPF7Kgu61EgIiSqjQq1Sv2pNSP+ErUMY6YVvEFCjqaF0R2M6qHCOq1kI1K+W9u08g1a2RatbJtU9QhkaEnRKq8zIwvEDDV4jU3fmcw6kUMRSqRW3fDMKNyAWTFiOhswHg8ZVzcYFC8yLW8wnQ0pq3Gk9QePMRZr2ujQZnP9Pi7uPsG5rQ/Ryx4k5RyJemuYnj+veO7KibzwwnW+991nGAxGzIoSY9t4aTOaBmbOz2euolV9YDiasLd/yPHxCR6h1copqhkQlggWui4FqsjIfRPlkvm9tZ5bi8wV4cOCMZhlGXme0etkZKlF18xfLTYSgbzC2hwJsSXgfUVRTlDKs9bLCNMRd53r8Hv//Hf4X3738Xf0OXk7Y3Ug6tifiDz11Gv80R9/ge8/8waYdhTODAImTt6IFrI8BR37EADWplidIAGqSihKx0H/mNDMbpyZnAfwtaV9A1ZQDyU2YGUakKrvf2rafgFCSkGeWnqdNhvr0UCunSegHGlqsaKoyoLgI527nVoyA9vbHX75s0/yqU88yu7GT965ldW+KF1idQBKKvoMJtfZP3mFw8HLjGY/YhpuUoZ9gsxQZBHErcQyHVFrzTceXCpFpBnEjHTvWM4rIwvP5ygStF6Y8C1sUTQSNFq1YjlPb5Elu7Szc3Ra58iSbba798RMSnXRZEBCIAESrPrxYPxui7I8EqUD1mjAU/gjJuoKM7fPtDhhONrjePAGx/1rTIsDghQYFXuDVm+QJ+dZ7zzIzubDnN/5IGvJJay6+x1zjCo5lIIblAjB382O3VTffuG6fOvbT/P8s69RlBZte4xnQuEDaZZRBc+0mEVVJJ1SOs/B4RH7+/sMJ2NsGll/c7CqgQpi31nEn1oYz4JVowu4LC7dZFbGWsrSkWUZ3U5Ot52SJtGOBB+rJVonSDCULipdJElC5UuKcopWgUx5Qjnk4Q9c5Pf+2T/gt379YXZXLMH3Nxtwf3IkxvTYyhL1jacu86//9R9x+coxQXeWJug1Rim0jbYEXqJaOYBSghDFNcvSMR7NmEwLXDjttDu38AinfXUWmUOtptDcvZadUapu/FOrTYtHKw3aI6LIU8vGWo/trQ3WOm2S1KJR5Ekr+mAFaKUtEFBuxu6FHo8+fIlPf+YxNjbSnwqoJsVNETNE1ICT6jrj2TVuHb3IpLxKf3KNSbmHlyFBFzXogDADYwjKELxErTZlUEqjlSXUjqtGgU0StM6irA0aMEgAY0EbD3i8EyDB6nWs3iLVF8iTi3Tz++m176GTnydPt0l1j0zd9b76Uqfpjy/djsI1mW3tM5reZDS5TuH2ODz6EaPJPmU1pNR7HI2POBp9l2tH66x37+Kg/EPpJg+Qcjf6F1gidHJNJrzCK9f/hsOTPvdf/B0APvnoJXU0E3n24df5wpef4vXXj9EqJ1MJs8mUgCc1GhJD5QVsws7WNlpbzPEBJ/0+KEHVfSeUwrnY8zXW4lwc7ofTepAQN1jaLJi6Yd5n1gQRQuVBW6ZFhXMO53K21nq0WimiY3/LV3H+Ms0sXoTCTXAhoKzCaE0QsK0uz790lel//HPMWYO692m8r77Yd4r9QuRv/uaH/Nmff5XnnrvGybAkb/fwajH4ialZdwbA1UrqEinIKFwFs5ljNq0oK49X+jRYcUabjEXpL8aSIrQCtJ3748wbueLAh1jWSxPy1LK5vsbO9ibtLCV4h1FCnmbMJiWpsdHdVyryRHjgvl0+9clHePxD93L3uYXQ7LQ4klZ2+4IXiQBTSg45Hr/GweBVjgevMi6uMCmu41Vs9ntVoqzMWYkQCL6o33e2VPJb8vMysYyiCXN7kgjkFq0SyqnG6KwuW+WkSYd2vst69x7a2SXWuw9g2SVVF7Bskr7Dey7vhJjJkQgDAgM8RxwNLnNw/DqD0Q1G4wNmxQBjA+12j/X2JdrZJTa7j7K19kF6yUfmx3cwPpK1zlvPJnSyJyez57h69C3e2Ps6/cGEu8//Bp965F/QVQ/PX//FN4byrW+9zFe++jR7+wM6a5sEfD0fZwiiqbxiWjkq5wkIN/f3GI5GjCejqIpvM4xOomySamjtYc5GXQaqZsC4ibNixx5FYlu44CH4WKLPUzrtnCzLSGwc6pewUKbxoWH4xnWgnIxp5SkJFuUKHn7gPP/in/0Wv/ePPvC+vs7f1x8e4EtPX5N/9X/8Z7733R9h7AaBhGAEloRKAVCCqADKLYBKK6rKMZ0UzGYuzt+g48Dwj4k3E6VtQurSgpprmMUvjlEam2jO7WxGxl8nJ89SNIHgKrQSUpPiikgLSFPHhd01Hn30bp78yCM8+fhP7sVMy1tSyi2CPaJw+xwNXmb/+DlOxq8zq/Yow5Ags6gjqjXaEGeKaNh7Dmt9LHtICpKgQ8JcHUAJ2vio8FD7EIkH5zwSDJoNrLtIK72LXuc83fZFOvl5Wul52nkkBFg6Ufz1Xara8IsMJwcieAIlipJKRgzHexweXeW4f51peYug96ncEKNbbPTu5dzW42yvPcFG9um37XifzJ6WK0f/jZevf55h8RrTqWe99SS/8Zn/G1vm02RL535/IPLd71/la1/9Aa9dvo6ogFeasgqUQWGTNiZpMa0co8kYr+Dw+IjDw0Nms1nUbjRJrZIfpblkKbNqvq9NX2oZrODMsDC6VqwhsgqDwyho5ym9tTadVpyx9KGKowoh1L52aq62IeJxpSdVOVI6lJ/wkQ/dzb/8F7/B7/72w+/ba/59XQb8/Ldel3/37/8LTz/7KqVYLBZtLIEKoxuFgUXEi9agdaSKu8ozm82YzSqqykclBa0g+DkBI8abX9zN8zZepCHeIVrC1+6nVRU1yTrdFuvdLtuba7RbGamG4EpEAnmWQPCUswlWNGudlAceuMTHn3yYJ564n7t23tw+flYeirYzUGM8r7J38B360zc4OrlMf3SFUvbRdoJKSzIdCA2hJMT3Hb/EGqU9SmmsikZ5wUcRVwlxEdAGtBZ8KOrsMqAlhdAmMT1a7R0yc5H17DE62T1srF2im10kYRP9LqFav9PDqp07ZNGHstt9gpkfUvgb7J98j/74NQaDE/qDA8aj73HQOuHKwRflwvbjbzl7cOhelZff+BI3R9+iP30Z25rSznKmo8tcufFdzLm7Tt1/dy1+0Z76bl+efu5FnvrWdyiDRyeGRBlKXzEdz/DK0m7nuODZ2lgnMZr+cMR4NInjJEphrSXUYxNnN5XLZKizt8//jaKqKrQ1saRHLA/OSoeeRjX/PE+hfv6Ie02POqDQ2KyFkorJyNFJc7I859kXL5P82Rf4/Ddel9/57P3vy+/C+/JDAzz1/In82//wx3zhS99GTBebrTGZVZjEYmsZJTUXom1Ya6A1eEqqqmA6K5nNZhRVQxyIrL8gC6mWZdv5hiNwurFbh1an1NE18bWUUlhtyFspW+vrrK91SSykRpNZhUbAl4iPg46WwGavzUef+ACf/exHeOLhjR97jovyppjkkIIbHI1foD95iZsH32NS7DGcDKNRZBIHZoNaNJJDXbZoBl2VFnSdbfkqoLxGEUt58cvo0LrCWIfz0zhjpXokskum72ej8wjb64/Saz1AJ70Lo9aw2qLfBQOs77Uo5DUp3DGzYsC0OObo5ApHxzeo3IQ0zbh0/hHO7zzCevrgz3UT4eRQpuzx+o3v8Nyrf0Fln6PU1zAJpEmP8XHOZuvD/OoT/zub+WMk5Ldl11duiXz9qad5+pnneeXVKyjbQtkW/VGBw9BeW2M8nRF07FONRiP6J0NGowm+DHhRkVFYP99pU8dwRxCD04DlfFlbxyRzgNNEFqu1mm6nTWo1qTWgAsEz940LaFzwpGnObOxQQdHKLeX0hFZW8shDF/nf/+//kkcf3WYrfX+RLt6XmdUPXpjJv////jl/+7fPILpD3l5nWgWwCpMqdF3SCnUpTut68FMU3gdmZUlZVkyLgqpyBDF1/0ovsdaW1BVUw/rTZ/7GaVff+t8aja8qQhDa7cj02+j16LRz0sTQShPKYoJ4QRmhLGZUxZSdnS0euO8Cn/3EI3zwoUvcd7H1phezd3uizQTPGxy7F7m6/z1uHjzDYPI6Sh0hakaSaJTJAI0PFYRGOHehhxitMSL1mwDBC1JFeRmtogVHCI7KFSiBJMnQqks7u8BW5wOstR+imz1EN/8AnfQ+0ncQE01mRxKV8Ou5G+dqEdSYPSMS/V6Cqk+pjhIk4pn3IXUsKcf/FBgTn0cbYvoeTTjRsdFfa/qg0tszoLcrMvXA/LWD7Mn2xlUONl7i4PhlJrMjbuz/kPGkz2bvhIPhD2StcxepjqAxKw8l/ztQ/53sSUWf4+GrXN77KsfF86TpISSBwjlcmBJ0YDS5zmD6Km27gbH33vY895yPC/gXvnFFsuwbvPTqG4ynFUmaoVCMxv0ohYbCaqHViszVNE0Z9ccMRhOszeb09TtVQW53Gj490G8b7UpxKIkb3kBkAvpKUJMCn8U1JbEWJYHayAujFIJmNq1IkmjCOhpPMTqhdIrvfO8V/v1//HP+5f/0j3/WQ/yuj3fMwvB2xYs/cvJv/t2f8IUvfYcbByPWd85TiGdSFdiWwepAZpLakyjae1ibAgpXD/WOZ1EKp/JNo7R2L1UWhUT5oEbORfRceLapK86JsaqxmjALUwqlUBLmZIn19XU213vkeRbtCnSgnaX4coq46DOllWd7Y50nHn+cjzxxH7/0kTe3HJjNXhfMCWW4zmD2GofDl7l19DxHo9dxDEgzhXL1MK6u0EYQSqpQxKHHJKtLfKo+PlE3T8Lp4cggUXhWa6KIoiS0svN083vp2AfrTOpD9Fr30dIP/cKuQykOBO/AF1AWUI0hFDAbwWQMkxEUMyjHhOkUqWYUkyEqVFAb88VRgkWD3MsyYcagjAZt0DYhqIRWqws2wdgcbAa2BWkLsvpnZzP+TC0kKZgUrIUkQ2W/mD5dkD2pOKKSPieDGxwc3qDfH5DYDjub97OzdR+99kWSO5QZf1KUckuECXv9K/zoxld49eCPcekbYFzdO7K4SqGqhJY6x2b6KJ987Pe5e/33f+xrvXDVyVe//m2+/d3nuHk0xIvFEUtzXkm934gkqar0DPsT+oMxM+dxgVOZ1FmSBdwuuxT/EbC6Jk4IIBaUPXUfhZCnmm7eIrcWqzUEQbmo8i9pyng6wRhFlqTMZiXiPNYoxI0h9PlH/+CT/P4//3U++6F73jdr+Hs2s7oTy+3VqyJ/8Zdf44tf+Q5FsGztXqIQYVbOSPOMLDUU5RgMi2ZnnQwFwLlAUZXMpkXcRCsDVmNEE2rTNwHMUrYkWojZVUMwMNHnCI1CzXtbivqnRHuQbqfN5uYmG701ksTGAWABLYrB0RGdjiW3oFXgwu4mn3jyI3zqk49w//k7lwYqdyRKHWP0Pn3/KtePvseVm08zmF5B7ACdF1iZ4oLQSXepCo8PFVKTIZT2BCmpfEWatBDRuBIkCGZeKtE1PT1BvCEEg9YJqenSaV3g3M6HOLf1YXrZY1h1D62lHfzbEVIcxkxpOoDpCMZ9eOGruNEJ41Gf6fCEMO3j9m8g0xHlbIIrJjETcgVSFeALtHiUVARfgY+CtJEQE+L5NPXXShRB1edcW9AWpROCGJRN0CZFmQyjU5K0TZa1CFkb2TyP5D3ybodWt0veXcd0e9DZQF77mtDbApNBkoHNUflbXyptKOyV3JKL67skZo1OvkfwFUXR5/U3XqTXmzAs96SX/vQ9rUL2JTBmyj77w2e5cuspxuENehue0bDEB02nk+GqkjIMSZKUobvM4fAVRtUr0k0WGx0fDsToBVg+erdV105ELlw4x99+7du88tp1QiVom2GVxZs4xC8COrOwrjFZyt7BYa3Qrgh+uSICSoUlXcFG4HYht6WIPlxx7CRmT8JpZ+IQfJzJVLF3i9VYoged8x43mdLrthlPRwzGJ6z11qkqzWQ0Za27RjXzfPFvv0t3LeGlm315+ML6+wKw3hcfEuDGicgf/PF3+Lf/4Y8YTQNe2UX5RTc6c5GtZnS9qwoKZWLJoPKO6WTGtJjFzKE+co1tR1CAaCJsLYRoY6hY4sES6t5WY11glUao8N5hrCJJDO1WxvbGBr1eL/aCUCRWo4LgZmOyBDLradnAwx+4xG//xmf4xIffXAooyC0puMbJ+PnYkzp8hll1k0lxQOFHoAqUdWhToURjpUcIEr2jVIWyHm1rHb4gVIXH6BaWKDhbldHKWxlPaltQ5djQJdebbLTu4tzGB9lae5h25z5sep5MvfUUXJntC7MpTIcw7MPRHv74Jn5wxOTwOroY4ad9qsmAcjKMLsOuRIUKKcYYFc0u4/9CPK9SsxmbTXRt7dGMKMxLRtqeKh/NxYoVdSnZz/2zGhFVT7Q8EaVxQaNsgjUJJs8xaZu0vYZprRPyNtnmBVpb58ku3Qu7F5cysQySLip/66n8QfZFMQMpGQyPuHVySL8oUNpy97lL9LJtOtm9P/F9lHJLSo546fqXePH1P2MmrzCTQ7ypILSIu8ISVIUwQUlCLhc51/0EHzz/P3L/uV+hZe77ia/zzEuH8uWvfI9vfOtZ0B2OxwUhWHSaUREQHZUap0WURzs6PKHfH0eFFGVjFqZCXWmoEFnY+OiaRKS8xUnAZg39/exAO3EzqhQEhxLI05R23iLLMkyjkVlWsZelfKThi4vVGLFoiUK7uQl088Bv//qT/G//1/+eD1x4a4xQ30nxns2slmOvL/KXf/0in//SNzgZV+i0FUFGayQ6DgHU9tQKH6IenaqH/0pXUVax7FffBTgDVPEJ4iUqtdGbWtBSI5jVd1PxSVRQ0b9IItuvlaW02inbm+uxfCae1GYQBFcUpFrR62a42TFGVfzKL3+cf/oPP8e5HzPcW8jLMuFFBrMXuX74HW4dPovTR3FGSpdY4yIln0idDQHEj8FYTKJBJ4iyKFSk4oqQpQpfBqpqhlYZxqQon+CDwhUduuklNlv3srvxEOc3HmItf5DEnEOpn7yo/H1C+reEcgw3Xsd/66/p791ifHCD8ngfGR2iJifYckjqZpgwRbsZJlTkoUQR+0xKSSzLEKeylVr2Papfpy75zRmfqpmji39X+MU1Mr99ycDvNiHVurxUl49EBXSorS0KhYQ4YF2ZjGByRkkX1V5H9zaRzjpmbYvu7iW2LlyCnQvIzR8I6RrkLVT7rdEz1EtKIFJeF6+6pGGMKM+tvWuM8wn7Rzdkd+vHSziVjLl69AxXb32fUfkjpuEGJlGIqzd48QsUr1HtkQBTd8y4uMkkXCboDyKyJz/JNfnDD2+r7z1zIBfPXeS/feHrWNth/2hIWZR017cYTKdMJjO2dnc4GRyzublJmrY5OR4yLTw2iQLWzhf1pnZpISD+Hn3OTAQzxZJTdy0G0Hz/xcdrC3AhMCsLAkKaplht4rNKzQ7WAS+e6I6mEG1IVc54OmV4Muab33yJe+/6HnsnIj9uHXgvxPsCrL7z/Wv82V/8V5794cvYtIdWFlRt/U4srSGxliw160dbg1YK56K7b1mWeL8kj/TjXlBsNN+rv2Tz+yqHYGOGItEqW4tgDOSthF4vp9vL6fYSxAeUCFIGNJpUZVhVosOU++5Z47d+80k+/YlH31ToMsiBzHidveHXOOh/j+PhSwyLa5T+GAmzaGZoarmjmoYuwYIIwbhIz9cmCsf6WJ5QYqLRoNaYEIEOcTin0X6NXvt+NnuR1ddp3c3a2iXa7CJ0fqwS+d815OiyMD6Ck5uwdxX+y/+L4ugWJ4fXqaYjqsmIajZAuwoTShIqEqmwRtAqykApDRgVeQ71ILg435yw6HEES3qN1Dh29uMsRIfNKYrzchP+zCNO9UHifYNoTJpH6mgIGOcJzhOCIyEgviC4MVIc4frXmAWYklC0OpQb2yRr67Qv3YdZ2yLdvoA88yfC5jno7UJrE/UW6B6qdMEI7MuR7HbuQntoZ28OVGO3J4nR9P0rXN37Gvv97xKkRJEAviaqVPMyGpJA6NA4AJ+M9rly8/t0Wlvcv2nwcl3MT2AmPvnhHbV3LNLbWOevv/wVJtND2mnOeHoEIWVzbZdyDInuYFNDYl3cnw1HuCogjbmqSmjMHAGCxE2NaI9Wp3uWcDvlfbkP5r1n6j1V7Syu0gytklhSRuLsoUj04KoXLOc9Kiisyrj8xjX+9E8/T6+V/N1O3rso3tNIDPCV79yUf/Pv/4Rvf/cFvG5TBYPUdOqmnqNCvHCaOafG/kNEKMqSoigoXAW1Ojhn5qdO7bwlSgbF8POJeKUa6rrCKBtLjEqRWk2eJXQ6Ob21Fp1WClJhlCXVLYyyuGmFCjPObXe4dKnFb37uI3z4w/exlZk796fkdZmEVznoP8ON/e9z0H+OWdgjSR1ZrnG+BAIBV5MiiAoT5IhWCDMCHpFamy/EUobBkKDxzkFQJMpik3U062TJRS6e+zAXz32UlnkIzSbQOjW8+dOGK/dFJ/o2WrKMj4TJEIaHcHANufYqsxuv4w6vUfVv4oZH+NkIwwyNj0QVDYkSlPboEJmJxsZNRCCeE19vXBqfMO2lLvkZFuWccMrWvrm9Ue5Y2pIsjSDcOW4vES4iiKKsFzKrNSbEso+SgKlBMlShdjlOCaKovIr6kWgqkzA2Fml3ydbPkW6cJ9u5m9b5+8nO3Qfru7B1F5gM1f3FCdfO5KqM3AFv7H2dH17+/3A0fpEkNSgjeBkTantlpZK6glGfAxESkzIdOlLZ5L6Ln+DxB36He3qfwqoP/dSf56lnD+Xzf/M3PPP8y8yqFKFHUeUIGUEHSl9GRX/xjEYjDo+PmZUlRif4oFHKRjyVxh9LUMpHENOm7mGefs3m/kp8PH9yetC4lWWkNiPXOSghKEeQCi8uXl+i0Vhc6bGi6OQWX/Yppgc8+dGH+d/+19/jH//a29sHfjvjPZlZHQy97PSMevmGyP/7X/2ffO2b30V0h26ny3QwqZ1a1XwwT9X4o4RIxTaGyjnKsqIsqzqjqm09lnbUt5WHoKYe12QKXd+gBFmSU6m8j86yxpLlKd1Oi24vJ09ttD6vFdV16rEWvAxpZ57HH7ufz/3qk3zs0dsBwMuhaComvM6re/+Jo/GLHPVfp/RH2Lygm6R4ryjKkiRNECqUCIgjxPQimtRh8CFEqrryGBUw2kS7d3GYmiDiqw6JvYed/EPsbD5Cr3uRXq9Hps9RsUn296Cg2yXld5lcFfqHsH8Dvvgf4dZlqr2rVIN9Rse3mIxPCFKgE4lzLKmjowI2lIgPtZ1KzFJRYKzCBV9nSgaUmYOLFU3AE6u/t++O5+ed2omYujzVnPZaiPjHQxVo0/QyJJZXT70Q6CpEqjsuKtWLr91t6/5ZGpW3kAlaQ5YksfwkQimxoFmVfaq9PWZ7LyM/6pB0dsjWzmG6u3TP30d75y7kpS8JF+6DpBXFGIN+W8gaAJ4x1w++zUuvfZ6j6Ys4dYiv2qQqjcdA6q+RRGsNJLoDKxU3HDat8G6P48nz3DzZodPepJArkqmfjh336Se21XOXjyVLNc8+9waD0QwTojSTsgmhAsFjE0W3m+PpMhhOcZXgvIoCANiYeRsQSgJxvtJQk424M/UdHee4lEjsl9c97dI5vBNsK0fVrgKxXyr1dzV+tDzJKWcF00lFmuYo0+PZFy7z5//1a3zxOzflNz9x4T0JWO9JsNrpGXX5WOQ//Me/4m+++h2U7SBk7B8e01nfoqzcj00pfQhUwUdLD+8i0KhY/moiKG5faABoatk61n2avgZhXrRWEhfNVpbQylLyVkpmE0BwVUWqLIlRVMWIalxyfqfDpz/+OL/2Kx/lsQdvZ/4U/qoo9uiH17l2+G2uHXyFaXWd0k2wFnQSL/oQHEE8lSuIWV90mzXGQsiQoPEh7mbjbFhNw/WeUHqCtyjVItUX2Ozez876xzi//WHWe/eT2g6BCsgRaf+dz51MDuJGur8PN69RffkvKa++SnHjNaqbryODfZgdYXFYE9jILCGzeKsoCYh3zMqSBF+XWgRVazs2WbGqGV5aqfnQ99zPSBkCRX2uGsmdZSp6nK2K59TPbw8qxN2JCEHF26PNfVx4l382fTC1JHgcVLw/KPJWQ3WO812xBASN1LGyGnEB7yEKd1coVSEh/t7OsvgeQsC7Ej8d4qYHuKPLFKbD9PVtzPou7Yv30blwP3bjInZjB3YvIOVNUelbu9gVsid9/wK3jp/mcPQcko4xiaKczVBBsM3mMXikLrcJCupZx8qNsWmFTitG5Ru8cfO7GL3BgxfP/0zv4/H7NtXlQy+d9t/y7W+/wNHJlNlkjGadxBq813hXYBPN9uY61qYcH0/xTghiamNUhdIqujXfpvl5ewmwuS2ERXm5kW8KPuBCIC1LtLZYE+KGV1TtXBwZp4hglaYoCpQyZJ11hqMjvvn9F1DW8KNrIg/e9d7rX70nwWqvFPlPf/gd/uTP/pr9ozHbu/cwHBdUzmNNQuUWWQ4sdj/RBl0og6P0Did1cWc+ZxFnpk6Vce7w+lI31GMPVuICp8K8LJBnGXme08k75GlCatK4uw+18oPWWGNIs8DOxXU+84lH+M1f+yR3n0tvuwBFbgrc4PWjr/HKlb9FsptU6jo6m9HKUiRoyqKicjNU4khbQllNEAKIQasUTQshrQkWHpuAVZGSq/EEX6JE00536KQfZKP1SbbXPsr21mO0sm0kTnth/x5qEzI7FPoTeP01eOn7yI1X2bv2OqODG/jxPpRDWnpGOxGytbhwhxCiy24oCE5jrUFZg1M5QVuMqc+bcoTg5x5gqc1imS/UpZrgazq6jplSEk6lR7J0loMKcc3ktJKBUk2mtHxuGnJF7GnUex5CTXEXJbE1BaBVHEJXCnFV/KlVXZ70iA6RaKA10+CRRKGSWmGlUeX2EvsoBRgEo4Xc6HoUo8RT4ZlSzgZMp9fY23uZ8MN16OywtnuJi/d9EHvvBwiXvyJq8xx0NlHm599rnPojrlx/hr3+D1DZCWmS4pUmzSq0DvNMd1HJEBqeLRDRXVWImRFCxcHwNczN79PJ7qOQ1yT7GUYi7tuOpfQ/+v89L1/6m68w6FkOBxVOaVxd5VBBoU1CJ+/guxatHFUplK4i1ICqTHSJjvePz92UjVUNYoueZzzPAak5JM3cVn18XEmiPRLFyuYMYxUiq7QqZ2RpK14jeEoviM057Bd8+/sv8l//6uu89PJUHv7gm4sCvBvjPQlWX/jyq3z+C9/g4GRK3t7kuD/G2BZbO+v0+0OyVs4iA1pMqrsQL6hpWTSaBfOdUbMjPrUYvek7qHfeSwrODVBpFHme02116bTaJLr2uglRVgkNyguVG3HPA5v89m9+ks9+8hHOrZ3eKRXjW+LYY1Q+wxsH3+Da/neZyXXEHaGTESFUECQaDBpTA4rDB0eS2mghX1lC/cEUoabJVwSJ79disdKCoMnSHXY3PsK5rU+x0f0kmb2P9O+5kElxJAwP4fgAnvoSxcs/YvT6D5H9V6hOblKUE1oWrAkEphhxWKWYFVOMAZ1YrKaG1KZcJhjditYtVSDUGaRowWqFsQmhPh9G13R0HYexrcSNhddEcJBo5GcwEaTqQmmjoK8wdRmwKfnEcy+i6qxIx+OqDI36Y/O7iI9sVPHxdlXfT0m9aMUZvyBS9xFNHC43FuUcSseSbQiCr6KdjSUhUZokFZR3SHB4X9FszOKiaMjTFtqVWF/gZmOq8SHD/R9RXn4Wu3EOuXg3m/d/kPUHHkb2vytk65BsoFp/f3LGcfG6HAye5ZXL32Rv+Ar5WomXFOc8OtF12c+g0fUsoyZIzFh1velLrMKLxyohbVk8JYeDy7x281tonTCTF8X4TRL701+f//y/+5D6ylMvyZ/8xZeYlhXDqUPEkRqNFygmBQHDxtoaihkTUxAmJVXUd4/HNxJ77xhvlmFBQ7CptQKNpvIlYNGi5906kXrwPMSqkIQSbTSlk9imSHJCcNw6GPIHf/SXrHdaHPZFttffOxnWew6svv7MLfl//D//FbcOCkTleJWQ5S2KyjOZzMhabZpGbVRpAKXr+QYJdb+m7kcpHe1Blp6/ybTuJGgJIOLrwdiozC4oqioO2LaynF67x1pnnV67i/gATkjTBF9WFK4kzwyumPLkEw/yud/4ME9+9L7bgErkQIQ3GIy+x9VrT3Ewfgmnj9G6iuYIza4cj/OTOOehQ/TCEot4RXAB5RN0vZAKM1AzjAEhxagMG3JSdtjoPsa5zY+z3fsYeet+UD1S83dfuKTaF0bHcPlZuPwy7rmn2XvxOcqjPVI1JglHZHpGnpr6s2i01VDLOiW2A4Q4kCsKLaHWcoyNDhNm1CsdQQXEBAIBEUcIcdFrmJpRljcuNy4AdTYzn6NTISoRLFmgxLJwzM6DarL0Jer6qdOlljKzemNEYM5Prh9UF/yi1uM8q2uytzpjCwoVPKkkEBQ66EgOEl2PS6iav1iA8igd5wQdjSJUfZ0HMFpoSYkKAVGzuK8aHlANLzO7+gx7z3yF/vYF1u79IBsPfQTueQQZvCJkG6js7yEFpae8evUrzOQ1UBVlAcbaSOOuKtKkLsuKJsQDTyAajRoTMFYoXDQv9UHX9dOAVhMOhs8yfrFP7yMp5zuP/8xv7UOP3sXa5j/h3/2nL3Pl5oj9gxFat8iyLhiYFQ7nCjqtFKUdQRRh5nDOQRVZiomOrLzGkBGYV2YW1eTbD98cuJQQ5ZkcsyquRanRpLpmHKqAtYYgVf29bliokShkbc7hyYT/8udf4OJd53728/MOjvcUWP3g1b7863/3RxwfT5kVIJIiweJULPGhTE0XjSU6XZeJhFg98RKi6WLDEmSRPZ29vH68ArMnhGjgpghoJSRpVmdTXVppzng4otfp0spTxsMBidFs9NpUsyG//itP8plPPcZHPrLDTvc0UHn3qhT+GfaOv8f1g29wMnmJUh9DEjA6xRqh8AWoWky3VpWI4GxqZYmA0Vl0PVZCVU3xvsAmgSztMuprtNqhk15it/M4lzY+w/bah9H2p2db3SmkuiaUfYoffInxay8y+eFz+KuXMSd7JLMBm8aTZUKlxoh2MXMxJvYtagXrOYNTIunFEHtRWkJcvCVgiKaNgVi2C0Sdx6DCvCQragEEoR4A9nOQ0BEemtVFL4CKehMSIjTO+5ZNbyFSvqh/qjv+VHMNwTv/vaFEx/cRe1kL25g4A6ZFYQhoFEaoS0Uah8cZmX+WICoq3CNROaUuD6gQAUApF8uhNXkjD4Y1ppTDEcPRAbeu/4gbLz5N795H2H3wY2SXHkROXhbSDqr904nYFuGGGGWY+CmXbz1Ff/oys3AT0YEo15XUmVQZs8oQwaq58hWqVlGJx99qRVAJIpZmCasYxYqAcrx87cuou4Ugr4n+GUqC22sddTAZy//l9/8hf/QnX2I67CMijMcDgmqx3u5RBIcXh+QaURZtcmazgsoFkKS+HgSUv833SjU/f8w7ipthRyBm/kFFLXYvi/MXxIOqvw/zGlA8UoJmWgovvHqFf/N//me++cyRfObD7w0x6PcMWF3ri/yr/+M/8+WvfI9RkVGpDG1SREXn2XjxB8SrxQVT18S9BFzwOF/reSmzQKpTp/kMQ6zZFctiMWuapsF5vPMYJaSJpZXndPMW7TRDKk87zdBB8MUUgydUE9pZzsOPP8LnfuUJHn5o8xRQObkhXi6zN/gS+ydPczT8If3Ra5COsVbjVaBysfTjGNc02gKlU3TIEEkQnyKiSY1CpPz/s/ffX7JlV34n9tnnnHvDpH2+3qt6ZVGoQhmgCiiYBhrNRhty2rA5MxpJv+gH6U/RT6O1ZlFaSxqJi1qURFLNEcnuaZpmNxpoeFPee1/P+8yXPiLuveds/bDPvRGZL19VAWwABa45tV5FZkTkteeevfd3f/d3UzdjfGgIobEoMBXUO30W+3dyaO4hbln8IoeHDzEobkfCz19cquMzytUzTJ76Js2lU6y++RrV5XPU1y4yiBPmCijnalwzpqki0uuhrkd02kVG6qsMuWW4BGeLtHpCDAQt8bl5nroJ6possmtRjHNCFKZRU/Z2U47AdNfZ7XZCpjmFbExkb/RENjaajRG7588Nr7rr+7teEfBiVDhJHQQkOXJzGg0aUlPOMOLI9JCdExovNA58RqG9KoXSdbjW1BaBZ8WMIseGyeOTo1cl5kgUUlNO1tk6v8nWlXOM3ngFnT/MPY99HX/3Q+iV15QDtyDF/lG26opCZBxr1E9YH7/PqYuPs7HzAZFNQnA4Kbtr6ykht+ewa2y5uCCKOHP62lyhU8vHmni0R6mITKiYcOrSFqD4OxZo9JIG+fiEkcPDOQF49s1VXV54mhdeeItY2zysx9tZ7SZROkV6AU/Oe2pNU2cY0KlFtXmOtBGWdmvOhx+DQcSWghSUJrccUnGmcjH7vez4aBeQO4aLBxhvrfHCS2/y7e89zjsXo957fP8yl1+n8V+EsVqZqH7n+2/z199+nFEVaJLHFyXeF5k0QaarJ2KszRY5QZzlqZqYqJKVfybRTCfFHphde7rxfu9uGSAtD7CjxBe+oN/rM9cfUPgSkjVRHBQFTTWhiSOCi8zNeR749G38yR//Ng9/avfEUr2kI97lytpTXNt4kQtXXkDdOm6gRkMXqJuGJk5QrXCurftpGW1tMaNBCaEQmphIWpGi5bWcDnEs4jnOXcf/HoeGD3O4/yAid/78RmrrqrJ9CV59gtU3nmP1jRcYXzzFfJpQTLboaUWZS96iNhAaXPAkHyyScNFUHVxrTLIxcOSEs8UMZOWHpHZPo49E31LLs3HKZQRWV5kXkdz6xRyZdh/7yWW1hiqh7GaF2oe2+EvuTdRZJfl5XsmGauopSc4pTpP0ESWhChpS50OpQhIPLnv4zrQjJSkugXhFUs6F5UU+SQu1OZIIKo5eEUgxkVKkJ0rPB0iJ5vpZdlau8u7liyzd+wb+7oc48oXfQseruh/l3Yj8Fd4HNuvLXFh5gStrrzCRVXzZUEpBiomYKlptSWLMzkHMObwpvqFEo3AnJaUAWpj+nrNkkfgJIjXjesx7558kpTk+c1ePsV7R/s9YlP7Y/Qfltfe2NNUN77x/iasrI3a2t+gNFkwT0gtBhLIoGPZB1TFODVXd5GDHIv52fdgtfvsh2e6ZqN+LEFXQZPC2c4ITN1PGkNMOOJwaY1KA7XGDOo/3A77z/SdZXFpgZax6MwGBX5fxX4SxeuHly/zzP/0LVtYbQpjHeY8XsQczKV58F5LXGnFeMCq3tbuoUyImNVkhka44tBsd2NwuUva7ebZC21W0HalpcChlKBj0egwGA/rlgAKH1pH5xQGba9cJLjIolbkhfOHR+/kH/+BLuwxVnVZUZJ315iUuXHuci6s/YWv8Ho3foCwDTuaYTKBOEecdoUioU1Is8anfHbMt0A3eqy3maUQIGQKtBzSjA/T9HRw98CiHFx/h4NLnWQg/v36fji4pV07DM9+keec1Rh+8QbrwLgvb11hgTCiFVCSD+IhMmgiaKEKgVxTWEhyy4ZcMCxlcBFmLLyuERIHkIzWN0RdcInklOgFkprgXWsFRI0Dk+hadiZLUZaipsu/vquqcgn6zho3uSGGKW90ky/6xLp6bGq3Zt9UiRCtituOZynyZoTL0MeKagiL5bFwVXKKR2G1XFWJWbdHkTVhXLaGvEhj3AnVdUzcRlxrmUHqpQZoJg3rEdmy48vIzbFy4RFhc4sDR/Snjk2hqIULNyuYHnLn4BJN0BimaXNTcoDS4KDhXZsKKJ6WIOM3PVT7J1NYjOZxKLlj3+BxZuC7qrXF9z9b6eU5ffRIXlNuOXGdH39SSw/s2n7zZePCeeXn17Q39zvee5qlnX6OqFeciMSXrOkCgcIIrAo4an8aIGEsQZJqzYnck3nVh2GdY1lFytC8QzbFokCyT63KEnTqij9MW3bH1aaeeEIKRj06dvcYPfvQcD37mgY972p/Y8WtvrF47s6n/5J/9O1594316/eNUMViDxBgz3OEIzuGceeVeWhqs6XJFVYtCnCezLZC02/jcCDJL9/+9zdgEq9PqFYF+v0+/7NEvB5ShQJqEkhhvb+GlQdKY4aDHFz9/P7/3u1/i8/cvCMDO+IoOeiMaznFt803OXHmCS9efZRzfh2ILH5RGHKmpaSrwwRGCRSN1lQihRHVWTNX6XonkqCs2NI3HxTm83sJi/14Ozn+OW49+mcPDhzuF7Z916PXLSrUOL3yP9Q9eY+31l4nnTjHcXGGu2aYXIqEvjLQ2z94HxAW0hJQaYqoZNxVFyICGQo5TEQLkyMFiF8saqUskBxBJzhbw6H2X/jHhz9ZYmfnzs8ecFw7LVVs0KhlXk32Mhh2YzMyAfN9n58hHOLD7Ne+bHbPOUpcuy+QIAYO2RTpjlYit0AheHT5CkEgikcSKhC0Rb9dHk+lAumTsR4kxG+2ASs1Ea6R0lIMCF5U0mlBtV7gRpOiYG8wjkx0W50qWl+ag59lvDMIJGek5jaywsvE2a9sfUAzHxBQRUZQJ4mucWM2bU49QUjGhPTPt1EAETVbW4X0AtXNov2ffjRlHiJQLnnFzhncvbrO1cwW9a507Fr5Co9f0ZzFYD316UV58fVXrVPH0s29yZWWF0FuE6ExWyTnEOwrn6ZfeygPUcpqtsWprqboSmQ+JrAzuy8ZKzWD5zIiMObmeZycdIKiKzz9GgaLfpyxLRjtbFL1F3n33Av/6X/8lT760oV/53M3bB33Sx6+1sTq3OtI//Td/xeNPPEOvt0TdeJzvozqBZBRi7wVHsoaBknDeIqGkTfcwt7Uqqvn2d0n8vKObGKtWPkmS7vqkDAX9ss+gZ0bKqUMSeLFJPNre5MjhBZYXF3jwM7fx93/vyzz6GTMQm5OrSlxnNLnCZv0GF1af4drm89RcpBhAKJfYGddoFCASSvAhkiQSa0dTFXgXMPkkk6gxxfAGqzeCwJCmHuL1JAfmH+T4wcc4tPgQc+XJn8tQ6caqsnKe6o2n4fIHXHrmu6RrZxhtXKNHhRvaIjKJhr/3Q4+mbqhGExpRXAmuNAhPQyRIY4WyroXoCoM4LNGYWZZgRc2OJMbAVEmWp1LrD+ZmYFmH5IjMWHIdk89lMWE3XUKm5ixfihs8YYvqkkzhwOlU+Rg5iQ/91Mg/SbTTrHRqC50jy1+pNflMOdISgZQsD+tUcVKDT3kxN3WSKCEn5B0qecETxZPAR5xU3TyWbAhiVKrYIGIiF8PBgH5Y5MzaiGr+KHd97iHkzjs/9ITqxnF1501WNl5HZZOiUCQlIhVQ4XyDC2pamHUPFXJXaoP8tG1uKQ5cCerwWhjJQRMka19jYaI5KU1yJobrVtgZX+XSxnU4vU19TDl5+OsffnP2GY88cFBefXddNTmeeeFt1jchEkyIOhmN3hTZE/2eJ4pQ1bqbku4cjeZ+bx/mrEie36pEFbyYPJwoNElJSSm9ghr5wiWb17ZWGcmmig2p8TSN0OvPszPa4OnnXuXB++5hZVP10MKvJxz4a22snn7uDb713Se5vlHjiyUkhpx8z1UtzuVGgBBjlSeCQxVqzXQI53ESUDEacJMSfkpDyqNdvKZU1F21U75lagmiSn/g6PecQXUYQy01ikPxmugPevjU8LkH7ueP/vDrfObuvgCM9aqWbDLSs1y+8iKnrzzO+uhtGncZ9SOSOppxIPg5mqZBiag3aaSmqnHOMxguWqM68YhEXI6oINO204CmOkjf38mhhUc4fvgxDi0+wMB/5ueLplY3lIvvUb39DKdefpyNd1/iSLVOOdkkuIpe3+G8UsfKqNniqZqK4ALDfjDIThLJm1ZhowZXGRrmkEzBd0ImQ6hJEWWyhfqEy96oE5eVRXK0q4KT1FZB0SpROGfGQCSRJNk+ZEqOsRNr/+pGX0Xav599r6UeY2SImxH9VMxw3vxzMybWG0s6PTmjpmfBYTEj7NXmuWRfW8GYkE4zY8yMu/UVMOclae7unBTvEqhpJpIXW1Uo8SYc5CLeCc4r1DAeN+yMJqSDx5ADtzF/z/1w+Baob76M7NTXuHDtBa5vv4WGHRqtCKEkNZYz9c4hrkZTpNEGjRB6waLXtNsOtufQ5CafJgRNJqaYXp9XR6OOWFeo26Y359HmKqcuPUU16tPrHWKtOq3L5c/WAeChTy3JG6ei+mKOH/7wJZyYK1RpxCS9GkJhDkWdPJqSCRALXSmJpJaGvycSVbdnLpHzUln5RAy6bstrXNak9F2pgjOnA3suSuepmwn94YCqShTlAqPJFn/znSc4dsuhn+W0P1Hj19ZY/fClq/rP//TfcfrCDuIXcb4kVTXSJJKPuXbGYD7Bk4Llbup8w1Ws9To6LZkUEQrvsDggh+06VdO2JHiyBdBZ0psUyesrwRWURULchMHSHFpBPYnM9wq0rqgnYxb6fcogfONrX+K3/94jU0M1uaxxfJHYv8Zb5/6MtZ3XuV5dpGYD5yY4n0kASUEn2UDmWhQxAVAVpa4nkOZt6fI7KGOCr3BS4OISqT7KQvEgxw/+Jrce/E2W5h75+XNT58+oPv1trr/yI+pzr3Nw7RQHdlZwPkKpOC8mwRQbqzsLVmSrTmic5YWQHFHlJpXemd6aGYm2yj+33JCYDUjK8N00IrK6MlvaDPKNFoFIGz0LqWVnZZkkS2S3Ob02mW9GMLnYGZHWWrVGK2WiwxTOm8rYmmyS/1BjZfu++edmbNuozXVs+K7itHttASFj/Nl7WV5KA6nNsaXshee8l0tt9JfySTlUhCgJlzxIidY1HkfwpvohERwFIz9kwy1xz9f+gHD350jM4+f2F8Sd6Bk9v/Ujrm+/wiSeI/TMYUwxgMxlR3KEpmjZmFCAFkCFU8spG/9FUSwaiwl6vQFOhNQYhcP+J7Sdt3uhsBy09khNQ9QJoT/i+uR1nnjl/8tn7rzE+Z2n9NDgHvo/AyR47JDjv/mj32RnveblN95j7eJlwrDPoF+yU0+omwmJQOH74B1aNMbQxYxrFBDvDTGADsY0gkQ+B3WkHM2Kt/sZqe2+BZsjtZrzZh6dUKhD1eVyBsW52shbDQz6y8RGqBJcXKn503/7LZ58fVO/8sDCr1109WtprF4/0+i/+rNv8uwL71LHPqHsM6mVwpvkjsaUPWeZJirNLlmuPsN9HYwzs+jYr60nbvU2mlsATBPn7ffUFltJeBcofcA75cChOba3tuj7HnODOSab23hJLM31IG3xja//Br/19c/yuYeMJru1dUl9WGF94zXOn3+cs+s/YcwlmthkPTuPJkUl5n2apx3xGPxhubZWq67wgVhXSKH0ep46era3PD05zPLgs9x55HdY7n/u5zZUunFOeed1rn3rX7L11ovI5XcYjK4xaDYQmVALaDauXfmRuO56xbC7fkmywZpe+2xUWoPgFKXJWP60TQtdcW9LfHD585xzbF9djjuy0dJ2sc9w4t4ckrqcjxQ6yGaqSJI3bd/sjgNydEcbXbWG58bX1rR1Oac9r7uPx+jlM7uxyK3TipsxUhZaWS1Wm9tTS9x54nRxzNtrjbs6yafiSc6TNOCCR9IIbTJV3ntSXdC4IYfuvp/i6O1UcwfplTdXbt9M57h8/RXWtz6gZoNCPVDY06MexaB3wXqmaVZ88e1NYNoDjBxD2qm2vcdmax0drYB0qhOaQFyJOFM3aRihcplE4s2zDePqKuHkb1LrWS0+pvjtwQWR1U3Vf/jHXyUMlJ2frrOyOWLSVAZne08RSprKZTCmxLkMy2lj9jQTf1To5JNa1qrL98fPOFazPfHsjgPReH8xO9iNal4J1PahiV52ZpumIcYSdX3GdcPllW3+6q9/wOtnxvrA7f1fK4P1a2esVrdU//03n+cnP32a8xevsnz4BBqtL0yv6BlOnJWMRXym47ZJy2yXZmikszBDu1i0zME28nKdUcv/U0u+GzMn4p0nuMIYOCEQJyWleGJVE0NN6Zepx+sMD8Ejn/s0f/APH+KBu6aejSvX2ahf5/z1b/PB5ceZuOuoRLzv450x4GIzQXyDD9EWYXG4VJinSsCeDqs/KmKFSxUpRZqqoG4WCe44Bxe/xm2Hv8Yti48ykE//zBNV11eUldPw1LfZeOVxtl9/lrB9lWFo8L1E1S8JoUeqdkwlwreeY15kslpIt8C2xshnpl1H620jWPtdW4Ph2s/EaovIhqozYG2ktFcxvcVrmVqNmfc7x6Y92ha6manrao/L4MX279r9uun0oPv15tfxJuon0wPevYH2eumuHRiUN5Xsmd3Bnv3knFd3XLF9vw3zdGrsRCEmQhmo64jWSj9AVM8oFMThEnc++AgcPwm9uQ89jfWts1y5dorxZBtXtrlHT9tlV3NxK9rLuUnFcol0NP1dMOCMUTeNTiGl3dfSqSM2IFpC7gsl0gA1jW6hUrM+WuP01Q2UNW6/5UtM9A3tyceDwQ/mfM8Lb6/pZFzz06deY9wUVAjjyYTg+nhRfIDCC67JBJimXVyyI5bVczQZCuC0NVrmQpjq/P6HZHOQTrlCxerIXesMJSWEgpS8UelFKMtA0prVtXX+9vs/5raTyx/ndD9R49fOWD3z/Cn+9rs/4eKVdQbDJcpiyKiuDM12jvFkh6IodhV56uwkh6lEycx2rc5j+rOaC5wjqi59btvLWmWm2FbgnVD6QBEKgvfU48SwnCe5CmqhkMRwruCB+4/wj/7kazxw1y2yObmqkgSVa6yNX+D8tR9w6frTxOISZShRStACkZBZRRGRGtdGCeSchAY70LwSeVFUJ5QhMG7mqCdzhOIObjn8RW6/5Xc4XDx4Q/uOmFbVu49R5f72K6y/8EM23/wp7up7DHcus9gHXwZ2Us1ELZFvNW27WZLtwi65rqdtTmkNIFtDg7129UpMo6bWUDkyPJjviJsakdbA7FbDz/uZKdKcwn1ZFX2Wzdn+6KbtO3YL1rZRX8oO0Z6oTLjhvb3D7a3T2jN2RQuQveXZz+1+q5MZtuDMyE7V1GZr+2Y+9rbsQjsav31L8yKY4VWJUADBszMRxuUcveMn4c574cARxB256Ymuxtf17TP/jo3ti0iIhFAS8wOouc+bnYdgrTAcaLwhP7j3urTR1CzDbtb4R7UMnUUw3k5dfTYEFZERrqzYqt/lvfMbXFu5yF23XGWteV6Xw+c/9MZV8Yoqjp4/LI9+elmeeW1NE/DsC+8zqjy9sMDOaIQPOReqUIij5wLqTZC2STOIj1opiaQWMdAceVv0JUo3P2fvoIrBnwGZxpsWiBo5JoHLZTguWzBfOFLyaONZWdvhu99/ih+/cF6//uitvzbR1a+VsXrvnOr/4//1b3jq+TdopE/ZX2RSRVKCwntLuDqXcwrTsv5Mcu5qUVrPdbrw7DZcXY8i55hpep8/tYfAJpbghK43lZdghYJ9T6oipS6iOqEIG3zxC7fzh//gET53r02OYSkkLnB25ce8d/6vub7zKimsIb4xunGTIJnkjHPOJh+F5dC0mR6rtl1vW306JVHTpAUCJxmW93Jg6QscP/QYB4r76cmNShQfZaj0/dc0vvwMl/7Tv2R85nUGOxeY03X6ZYNzkaoa0WiCUKAUiGvFiFKnUt8KtGqnALFbcVqNY27XV+jgvo4s0XqkduM6skS3WrfbmoFP8lcBI2zssmHtXe2Q4N2XIEkbfU9VE/KW8vG1v6ddf99+pB9yRT+MuvxxPiefEzCNLGads0w4cI5ODYLZRT3Dn5aTdd13jMhhBfRJa6JX66eWPDt40sJhlu+6Hw6fgPLmUdVYr+jpaz/lwuXX2Blfopiz1jRNnUssiKBNhktdNlaAGGAn7L5Z0/IQl4NAK7idFYJti7uVBpdh5qQFKToDFl3fCCpUjOttGtcwiRO2tzfZ3tlka7zCxdHf6MH+Z+jJ/uSLvcLNX3xwWZ54+ZyurF7izbdX8W6RURPBTUAbUCtV8U4o8DQJNFlhgkG07f1OMxG7ywScttzCkIkWELC8ZnbsdGb9StqKWeApraGqKD7YvW20wjmhHM7h1PP6W2f4T3/9Y94+F/XTt/16qFv82hirq+uqf/pnP+CZ596gagKhN0fdCClGysKDJuq6wXtvRZMztqVVMVBy6DwTXnd5kTza0FqkXTLaqMUgJkt2G7k54AhOKJ23fJkzleRYTej5kmp7i9JXPPq5E/zRHz7GVz9vD8Gkuayj+hQrO09w9ur3uLLxDNGtUbqCKqm1L1cH5BoUJyQ1+n1MEe+t31Q7WdscjIgS1TGpHUHnOTD3aU7e8g2OHPgNlssHf+YJqWsfKG+9yrW//hesv/4CYfUsy2mLYagog4ALVBppxPJk3lneTCVl2NXcPVtnspFyM5DWDcYrU+09UydhJpISkWyYc9sV2oi4jah8Z+SmfaLaAuBp9KzdAz8bMdlCkbpmirM5NCwy06kR6pS2xd7f9bns3+msu64fAQNOj2vme537TNYObI11+7+UW5y0dlo7YpDmZJkkc9y6/GA2VKI21y3SV5yHRmsL2guhHguxnKO85Q7m734IBgeA8qbHX3GNaxtvs7p5ilo38RI7g1IUPWK9M3MtoIMxaM/LJsds1DSrqZdS6ozVrshKrWuveoMYU1Lq6BECgukIJo046VE3DV4muHKHtcm7vHVmnXG8zJ23XmVF39JDct/Hel7uvfsgf/JHX2W08yNefOED+vMHSalCk3UvQJwhL7l7cIvoRFXI6vtTEVsgc/taW9T2qoY8L/J9tMuW5575HNSq+OQIrkCjkZKcg6g1TWPPVa8oSREm1YQfP/Eyd9x+8uOc5idi/NoYq6dfOM1ff/unnLu8Tn/uEHUqICa8l12TPaWIBMm5KvPIO+OUmV/K1EjZJ25mWciJW6Rb+GY9HoROIcPjKHygcBmfRvGq1JOKctHRXxxx7z1H+KM/erQzVFV9VZt4mg/OfZvza99mlN7HlRXO91A3gNQg3mcqasL7yo6vSVmF2pTSbdlpsGiqjUIE1T6uPML84H5uOfxVThz+MnPuZzNUunNJuXoGnvwWl5/7MTtvP8f89jUOhETZF7YmI3aco3FCCgO8WNo81NYKnOBJLeejHWICsLT9wDKc2TVtzsQRO59cCyS5Bmo2qO2MVI6OXf6bvL0uWmtv2x7HpbUorZGcPT6MTjOFge1q5N81H9pu6ZxOe7bzeuFDLRVTj/pnH/aHNxNAkD3n2/XX0mmE1ap2dJtTS/HHGWPg1QgKqbAC5So6/MIRFm/7NBy/C4o5pNg/Gt/Wy7o6eoa1zXepmlVCP7doSRHnQ+4K4LMzNs0ttoQRaB2K2Yu0GzadzcWhDk1tIbd9FmONiJJ0gtI+K6AEYoSimCfWYyIJLQX8Buv1dd67fJ7row+459Y1zlc/0oPFnQzk9hvOs95a1WL+oGxuX9SFuaEA/M/ffFm3N7/LtbV1tsYNIqHLITWY4xTEgw/WqZrWOZq9gXntSeZIGFAwTU90V8TRlefkELlTsTCNxzxnSSSN5nw76y/QJCU2QhkWWVnb5FvffYK//v77+offuPsTH119Yo3V9saKzi2aQOYbp6L+2b/7Dm++c4Zah5TiqVOiKHo4B81kRK8Qyl6PcTWxoroZQzXNU+Wwmd1e9a7cldGpMiKVoR2bCTYp8n8eR3CewjkKB14SlsdqOLg0TzVe4f77DvDHf/x5HnrYvJdJdUWRy5y99AOubjzFTv0BjazSNCDSowiFeYdRTHRUYqbgGrPH+55h/3EG85dkRbCpAPqQDrF86FFuPfJlbp//CnPy8M9mqEZXlPdfZO2Z73P5hSfob17iKJv0izE0Y2Ij+EFJ5YQmFEjwVoDdNHgxRuREGhMEoTVAeRF3Bve1sCDQRVzOiklQJ1lRJBPYW7y+M0q5FMFlmRk3zQG0zEPrP2b1KG0/KnVWCJtag9UVPelM/ZNOjdhMxGTzwgxVW6ybZvIIZqASBg8nyxtIG+nc+OpzH6ybfa6d87UnYuoCiHbGZldL1SLIllI/ZVh0E9yc9tYg57cTtI0BpXXEMgzoRUkedmoYpZIwf4Ty6O2wcAQpby5qHLnO1fU3WR+dIrkdQlYnaVKDSqAejwm+n5HJOs9jY/e1pSL4KYS/a27O5KzaUpL2510NVLW0XJDkeebq3AbItjEaVXjXw3moY2NGzY3ZjmuM17bYHkfuu2ObcDyylt7TZbdbeqyYPyjVzoqWw6mA7//qDz4r/+n7r+k//Wf/hp2xzR/nrF5NYspojSdkpi7sFk/Wdv60oF82dNNWNey7ZtksyRJxeQ7EbBgTKSvRi+1XhToqSU3rsQwLvPza+3zn+49z6oLqnSc+Itn6Kx6fWGPVGqrVLdX/3188zvd+/BQuzKGxJJKLfVMiRqu9aZrGdAC9pxYlOXvoxDnEebvpagugyxFWK2DaQkTk16iW7NyV7c1ejxOB2hiAkr3S4EHrBk1jiiLgtOHWY4v8/u89wh987REBiLqqjiucvfoDPrj0lzTuHMgE1QHe9yxOShFXCBozlk+N0oA4xJm4aFVVFEFo4gTcyAphqz7EIfP9u1hY+gy33PJVDg8+S48TP9M114vvKi/9iMs/+HPSxfcYrF6h14wR19A4B72C5JSJq0kuNwxMzuoBRFA3oJEGdZG2B9GUWWcGBDUIp4XhUhsJuLxQSbKFpTVyXWTTwm7T39vyGiRHNtBFYm3KsruForvqo8S19mq6UKMzHrpkIzaT09K8nf0CIxVF1RLrPp+vGQ/tjOi0jqoFA3TX99rXG0KzpLuMFXuMleVis1fdRqn542m3YtrM7fTvO6HVbAicg2QRe1l4titIroebO8D8sbvo3fEZ6C3ddP5M9KpeH7/Ce6eeZlxfxgd7Pn0wZyOlGudC7oDictRjxCG7tCZ51sTWmZRdUWJKZtC8LyjE535djswosG3EEtEexARSIzIi0VDHCUoAFwiub45RyrWWYrJfiQkxbnBt8xW2Xr/O5cun+PRtv8Va9ab29CiD3jSanDVU7Xj4wRP8b/83v8e/+jc/Zn0btne2SSKEYgAuUFeR8bgi9PqgKUeEARVMBUMVp8kisD2jjYj3y4UmNwM7i6UFmibl65yfsxRJmhXqVXBln+2dTQb9JZ587jVu+8tv3/S+flLGJ9ZYtePZF07zV9/6IW+9e5be3FHK0COmKWThslFRJ+ByTyLxdCvlDAw4653s+v+sxzLDxJIMBapagagT65s0HAwZbY6YGw4YliXbG1cpfWRpcYBWIxYHBf/oj3+HLz92B9erK9ovEqP4Hpeu/IirG0+R/FlUNlAtcZh6hrGvTEKmFQmasobsiMRBKxWlVFacLCVJF/Ac5+D857n91q8zN7iXPscpfoaCR33/dR099becffbbDK68QbF1hbJqKIoCnNCoN9QlZGkZGkRrBI+nQHBZPJbsVebttpFTi0c5bMGXbIhcey9bJYkcPWVL4XJENVs310a+FunY/oSUI5zZha41RBnec55W+cLmQ8qwIVkxQ3bX53UR19RYTnNkbU4sq2JkqMpZfDaNyqUlMEj32ra1z5Q8iwyAlM/BIrw2UsoRz8zcbOul3EwJgMvvCym3sdduhk9tmwAm7pw3RNuB1oxnyt2JI1p7nM/GaniU/rE7Ye4w0r95VFWxytrmKRqu2fx2EYdH226/0lLWBdRDW+zd5v805Pdn66vaQ52iIbb4Jrz3RtiYia7MqStwmjUWJWBAXAJp6IrRgCTB7Jw6M2SawCVgm53mDGcuVzTVNvGObe4+9hiql1Q+pN3IHUcPyHsX1/XKSuI/fetxrq+us3jgEKPJmO1Jw2Bumf5wjp2qztG5y/PZ8lTqwDvJXUDzvYNuvrXv7Rp5/rZIQPIQG2nTxVk6K8PHWCWmDyVVFVE8UgxZWbvK40+9yPcfP6vf+OrHqzn7VYxPtLFa2VL9x//jn3Pq7BVcMcSFgrppPU9jnDnIcy9juGKU3uQ9OBO+7HILHXto953f6ym3NQ9gauB5vcCRsugmBIdJ4qSK0ilOazyB+YWCb/y9R/jqlx/ktgOSo6pX9MzGT3j7wl+Q/HmQCYkCJ708QUcgVVZWEERKA2u0ZUrluhoaRBLKBHGVPXdNj364jYNzX+Tkod/l+PAx3M/QvwdAX3lS1777Z1x59SfEK28TZA3XjHBFHykclQSaZA+DV8slOZJ54RIRaVBnLC8RQXxrXNiVk5qNpKSLkFrPP0NzYgas/fs2supyVOTmhy1Lz0r5s22YRkYdZT3f4ZYef4Nn2kZ0riUi2HZ1D6FiNlpp/xkSdWOc1SbC6Zh4Zli7oClN3+9e0e73LpGeIyZmdp1PZ9frXlhwdqHvlFdo9+tmckItvN1ef4Fk1zemiC+GqMxTHLyV/m33wvDgPrPHxkSv6er2i1y48ip1vE7DCCsE9yYR1R6PTM9n9zHac5eY3r8biShuqpsXba455/DeM5lMUBW8a3moDnBoCuCKNpTNOegm378IWTNRtQdaWOQvE3DbjOIHnFtbpdYLbE7e47aDj3G9ekHni1spbqKhec/xJXntrGoi8K1v/S1XV9cY9BeIEbY2VxksHIAkOG2VO0GTNVQUnxO97SXI82b2lt90tLkthRTs+lkLnYjLSI3kHHFSa2VSBOvbt10pr755mu/9+FnOXlE9efSTCQd+oo3Vt77/Oj/8ybM06unPz7GxuYPzPYKzNthOMFkWABIqnqSCumlklYSu1gDyOjMrQHrDA2Ey/FMYUEAjPudEnCaa8YiluTnq8YgmTTiwNKSa1PSLxCOfvZff/90vclu+4ZWe0fNbf8X5lR8Qw2kkbKJxiKQSm4INuAniahNcUEdbfyKtl25HmlfHZBp/bgCpR3C3cvTAo9x5yzc4NPz8z2SodO2s8v6rXPrev+bqiz9lbvsKR0ujuGrw2fNTIk2G9RJBBKdZJZsW0jKvNUrKkazmQmrtclItXdq51njZOU0jrvb7U2hOpI0spMvDJMnSTJ2X3UJae36HzkABM92f24kwJdJILjAm76+Fhk3BIhtFphFVG8kZSrX7cu9iA7bTbtYAQaeQMfu5o80d2TXoPm9xQ2bt4kyonX+VbHC0DRW7bIbQdR72WLTmlHZFdMmeAcdU4DaUnlhFfOgTZZ7+wdvg2J3I8MNqckZsbJ/h6uo7VLpBkgqkRAkkPJosT9fqbhp9XSHJrufRbrJmWHX3vexKTbI2oLELiy7SSgmcRBTLCeUbD1p2xqq7ghpx5DYrGux7FJCdL0JNKCOarnP2+gtcWj3DhcOnuP2WL3H7sccY6Rndj3wB8OBJkVOrqoWr+au//ls2t0YMez1iVFxTU/gAyeHEUbdOFlMdyHZudz617J1lu8e0rCL7Gxke1Sj46Izc0ubhFSZxQigKQuHZqXaQYkBNxfMvv8f3f/TSh+zpVzs+scbq+Tdr/cf/4z/j3OXrNPRJboIKLMwPmYzGpoGlmmEziHlhalufd7mQvDC2gfBeqjrMhMmtsoH6XPme8sJjE91jUZVDKUJGGOKYpoJBqdx370l+53e+wqeyjEnSc3pq7bu8derPqd1bzC0q43EA10MjaNpGdWKHmdQaxEoi0qAqRARVn0uJ8vHg0aoPskS/vI0jy5/ljqN/j6PDz+LkxjbjqivaEG/wBPXye6ovfIv3nvhPbL75PAfrCYddoNrcJi0ItTjQGvHR8nIh4QWCMyMKwXIehjWYgfK5uYVz0wW2NU5kOKOLlGYo5yJM1STa96cRjv1Nu0C3kEja9fc6Xbezj9HCQtlYsRtGap9cg1Do3nftt7t5MmsEdRpZdcvHHrhKuq3uhpdnvtd6y3Z/Zv/eNt46X90FbMeemqpONmpqk9vYqnMGZo/RFsLdoqnTv5V8egJiC10jBTJcxh+6FRb371nVjoottibnGdeXaGQHQuuoJKz3VJGjmmB52DZ0hNzxlwyHtuShmWOeukXMEizaFhzOBYvgNOvwyY5dN83nkoy2Lq1yBkZMghZKbSzCah0oB3WjpGi58ejGTCYXOXX9cdaq84y4zMnDX2BD39CSI/vqC955UOTdcxMtfeLbf/sTzl+8znJ/gegSoxhzDtcRXKARh8ttiZITYpo6E12udPaW7Ql8dOY91QTenDDvTfjYZ2YhCM4lghN84cArk52KYdlH8Lxz6hLf/Nuf8M7pkd57x+ATF119Io3V5Q3V/+nPn+bl196lP7fM2rb121lYWCDGGi/R8jUKUbLmmYTMAMzQn6OLrpQpqwamj3D7VrtwWkuGdpJY4a/SGGSFqaY7lKL07GxtMuyZqvrO9hon7z3O17/2GF97xAyG6gd6eftxLlz5PnU4je9tM45Ckxd8U6CoEK0gupzzMBhANRrbrC2WnPEI0QLPIn1/O0eXHuPuW7/Oof4DKPtDNA1KNdMEDkDPvq+jJ77F+ef+kvG5lzhQXWNZPL3URyQRk0O9mifurT4DEiSlUaXwHkdWzvDW8BEfu5Ybdm1tMTKDIjhnxsc5pvksmVLXwXKLrjUUyIxjMdXyk1y3pV3uyv5uF+TXyTJp97AL0we6/TzBbu2/dgsyfd8+s+/vfX+K4+W7JOwyBDdTstiriHFjdD/VwbN9tHNyZs8zORz7kN2EkZlNtlGl07ZAe9qEEi9da5Bp76hE8o5GA/2lYwyO3g7l/L7n0o61yWVWNk8zSdchtE0TU86XBQTfEUFU6+mp4UwaKe/XIq4btz9rvFpyVedkOtflriBN/0lAU2S6zM1AxNoiAskiK2ny9xIpeoKbp1FlUleoKH4uUesqlza3iOcqLq9c4J7j17n72Jeo9YruBwt+6raenL+W9PDSAf7iP3yL1986g/p5fDmkTh6kQcsS54Qg2dFWM2KpdZK4+Txin8/aJczhTN8xKiIRl/tgJQXvEjFNzHEJAiEQozAaV5w6e4XvffcnN93fr3J8Io3Vk0+d4rs/eILL19aYXzpMKHo0qjRNw/bmBktzAxyGOztV1DmcFySUpJA9fjf1Sqa1Cnu8lHah0lZL0L5DhgFd66a32LHm6ErVWllE6JeeI7ec4Le+/hs8+ui9ACS9qBfXf8IHl/8jW80rzC3WNBrYHjUInlq3rGU7WRNMAPVItFxVciPz/lJbjJw9dTyic8wPP8WxA1/i9iO/y6H+Qzgx2ZsmXlXvHCJTptJekoW+9bRu/vgvuPjs39KcfYlbyoqFoqTe3qKWiuHSHHVTgVers5FEzNCcOs2zXTJiZ3Br9ELjguUKJRHEIB7JYZWbkUQiR6tIZlbSKqjr9PoLHdV8ChFCu4iLb6tMsqHKf9tGQrNkCCDv35bCXfd9hmAxa2Wkve1Tb4bp7NGZovLdC0UnAuV2s7k+bLFpT3H392+ExYCuU43mYq5WvKMzdtnIAx3U16pS2Pfaz6dIgqqaQnhbk9Ve2SKgrmTp8HF6x25F/M3h5VVd0ffPf4tr18/R6E5u65LT+aooAclFxJpqcJN8DNafyyIfUJnMGI3Zaye7IqkQQjby1nPLe3uvZQd3C32rPUg9ezFB207UiVaZH3W2pmhAU4kPJcE1RO+o4shqHF0CV3N1432urFxie2eVOq1w24FH2dF3dCj33nCNbj1sk+Xf//Xr+ld/80POXLzO9a2aWCeqJFBVUAZ8juqSs7Y4tLDnTIqvS2XdpFCvZce2bXJw1ojWi4DW+Zk0Q97UFk0WvTL/XaDoL7G1M+Z73/8R3/nuC/p7v/voJyq6+sQZqwurqv/k//03nLt4jVDMsb49Zn5hmVhH6rpmcX4B0YZWJsaKfwvUeygKKHxW/M76aZLQllnXDt1DP86q06aa7VEcLoH4Bog4iVg6pkTUkVJkaThPmuzQ88qXv/QZfu93H+W2AyKbzUW9uPYU5678kM3xW8RwlfHWOi4Ivd6QqmqIqfX+wIm3VgARSII9aoInZdw+w5AaEJ3DN8dYWniQ24/9NkeG39g1mbxz1Gn7ptdWX/uJrj3xN6w89wN6q6c4kLYYVGPUKb1+gbjAaLyDuIgkh0aILuuZeXBFoHABjaawYU0LnSmGOCHl+hjr9WMN8TojMlO8awaqlTEivz91LJy0XXBbmCt7zA4s15TyA+mzYWkjj2zcZ7T3UhbEnWqoyUxUMt3nrvyAmqGKhiIhOWcpyXdFv21dFBjxJgGx7YvVUbFNOUE6/rvVE7UQlKbWaM4UyIrlXvPEtMvm2yiiPa865zcCTjOEmqGzVunDWIi5ULwTe22hovy7fdk6juQIL3lb5MQPmTDPgQMnYOH4TeeUbWaFrdE5tidXUDdBnKdVV4hoFx3sR/o3I2nnb5fD5NL2M/C7oUGmpSszsHJKaXqZupPc/fusPNN+owhzjEZjGiqKXrDntt4mpURZeGIcEasx1zbe4OW3Nrkwd4oH7v4txvqaappn4G+Ua/qv//ABefO9Wv/jX32H7/34acqRsjVuaKQkqSeJp8Fk4pJIVnHRaeyuVifmxVqjtEOYlnFo62CJkPAkr0hwxCYhaVqH5yVrZOSHIjUJ5wp88FxfX+ONepMfPP4iF1dVjx/8KE/rlzc+ccbqb37wEn/2H/6WSSqRok+BMK4aQq6X0kbxruySrFEc0XvwPaRXIEUWfs2ucVsRPvugOG0XL1ukVHPEpRCjMFcsUo+2KUpBUyQ2FYPQRxrBRU8QRxrXhBT50qMP8yd/9Bh3HPKyoxdV+YBTV/+SUfMmVVoj1RHfD3ifiHHTkDMdAiWqyejqqTaPMhh5IfhAUxkub317hBT7zJV3srj8We6780+Y6z18w7Wbjahmh26fUt55g+3v/gc2X3ycxfWzzOk6+G3EK3WAGuuHY62HG/BZ2V2EkBdokvUIU9QKLTPER4bkXGqJKdrlktpIqs0BtVTvKQabF6DumXCEdpHGoS6CS+Z0+AzRuTZZ3OSouLBFO6sVROJ0PzPFxXnzXV6njcymkVYLl6kZqjIQaXB1pHDgdJ66rmA+5fOVXGuniEvUPtA4qy9zCi6CjwWqBQbsTEBqJJhnH9WhaRqFOZqu+68mnyNrQVzM7wVSanDBoDIfe1kEtUa1aQNWooR2QuRX1+0BQFLO+eQC7amYsF3DuoZNHHrkTvxtD4G7ecO+ia7olfGPubb6DGNdhVKNmp99E7tTNYmZ+aC7lx11ZtzbiHEKU05zbrPwJThibGweiPVAk6zoYjV8RmvXJFZ/qVMtwaSK+JCNpJ/WayaLsoP31PWIUDgCgagN0iRKKVB11jIlCc47RtU6k0nN5s4mO1xlXd/ijsNfZKwXtS83tk65/55CAP4/f/pt/f6Pn+f1t64QysNECtY2awgFw4PzXK+2iC5Cbh7baCI1NQWB0pW4XEoD2anKTlx09nS26hfRKRog9WwySpOsd1gSCl8a1N6YgY+NwfhhuMi2eH7y8lkee+kDVieqB3ufDIP1iTJWP3llTf/03/4NO1WiTsnUGySrPyerRSCBtvCBgHrDXFMRINPVlWQLb4aVWnhJdOpltTXyrRfdLpbeQVNN0FijTSSliIuCBPAoQcBFpd/33HfPnfz+3/8iBw4Ka82b6jjFK+//J3bqt2jkguV7sCRnjNHIIJpzU+o6nClJkxeUBnGeGO3BLosAsWQSPSHdwsGFR7jjxG8z6H2Kgft4NVS6c1p5/TnOf++bjF97lqXRCnNpk4IRSa3yXTWQnMu1vdPFyznZxVwjw6mmoN42UszfNUzW8ntuGjG1UZVFSzmfktfO1EKCtNFXC9/kY3etQyGdEO2sQ+wSlp80yieiOpXR6qK5KYuvY5PNRlG05zW9nC2bOwokp1Z6o4DzFOWASjZRF4mS8MnlOem6mi+CMnV1PaLe2JGuMoq8a3X78kRMgs2uOGUuu+xkaSIRjUSQEYK2oNlybrQWfAbmzBuehov5zKZm2sJDpS3CaiNMi+sDUYeE5dtgeBjx+ztBADUbbG99wGhyjlp3QGuCK+z5nMkRmcFp74HbA2XN0tT3fnYj7DUbYcUYiW5KY88FbB1lfxepBugmUkZXZi7BruOxaxKtsiFjcSLkvJ6lGfBKimN2mitc3aiQi5usb63zmeMLjPSSDm7CzP0//O/+vjz+zGn99nef5Ts/fJHTF68xXDpGb7DA2toG/YUeExcz6GxKGFI4iGZ8gxck5nhUrLkonZQZWXHdIk9b4UNWtqjMHVGmZQwtIzNfiOgEHxZ49e1zfOt7P+Gee2692a3/pY9PlLH63vd/zOOPP0lT50WwS8TnOEgceKHJquNRLInoioJUFjQeg4lyp1bH1IvfDaPsHi2Bwry0Gh9qnNZWJFoHQiZziI4pAgQ/x/Jinz/4h1/ia5+3fNFq85S+fe47XLjyONJfQXxtcJpEmpTQJIgUhonbUkjHctI+ZCKHwSGJXq+HqKMZBQp/KweXPs/Jo7/NLfOP4T5mszi9fk559hmuPvFttl5/Btk+y5htfAmNeoIOkGQyn9E1NH4M3go5vbiplFG+hlazlmG+/IAk0c6bNc/eZQJD6qC/jsDS3U977VplzBg3APWtqryD3JRPnANp7JjI0JkLBtlm+DGRrOuwTNPT7XG2UFQSi4Ta45ilRFsTQiG6LF+DmRBXQGywTruhRMUo9E6U5BLSzGHNYpLR91Nj3cUkZKp+Jg64GnUR8Xn5biOrHAkJucVLXRFCJBWROpqygTo1ZyvFaQpPGqJr6/DKLhfjxe8B3HJE1TlHU29AmDoH9l5AQw8v8ywfuR2GBz50jlX1iOvrl5hUG3jvIRuqvWNWKomZo9tfAzDt+Wz39lraekqJuq5x4inLEu99jp5SZhhms7wnMDCINHXbmtV6bJsdtjVyswog5NZA3pu2ocv98mKjbO9scuFCw1o5ZnNlh4fu+V1qPafFnnY87fjqF++QV95Z01tuP8oPfvoK7566yvboKpI8IfVIUlCrlang8hx3StQGJw7vTKi3haVFTATOXnOph5NMtMjGKDZobAlcICk/Zy3WmOdD1ETVRJ57/lVefP6zrGypHpr/1UdXnxhj9dRrV/X/+N//E65eWUOKRcNUXaaha540zgxW3WTpI++QIkBpnU1dXmTaAsw2Wup6/sieBzOP1qsEW1hCGBNjDVriFQpf4HNuoAjKwfmSr37tQR79/B0AbOobevn6T3n/3PcI/SvUaQvnKhwRMg1dtTAaujO32B4WNYkZnOH2YgKcIZTgSpqJI8VlDi88xKdO/g6H5x/D3aR9wQ3ntHFGeekZznz3L9l56ymWWac3B9W4IfoCxaI2jyCScNRmZCR1OQRpC0iFzpCqI8tVTX/GzRiwtl3JbBfgNjKCznC0/a2m1PVsMCSRQjbkKbealwIh699hLdBtKyFj/JrhxtbgmxPgmIUfsQiqhf9kNxOwjcjMEOXISoVAsEXCJeoUKXzT5bK6CC05hJKgFT551Nvxu3bCSYNKRLy1KkkyY6wySjCtlWnwefsSonnvyYF6ChXLnZLhn9AQEZIWBkem1kG7ofqLFv8UnfaBsl1OaeOiGBNNS1x/ieLgHVAuf+g82xmtsb5xiZh2CD0HoU9TTfafkzOw3o3vzb6/z0O65/uto9M0Dd41lKV15XXOZRTjRkO1S6F9z++zc9DCKNPeVI20FPiuXCLny611j8d7M1hNHDOarHDm0rMUpRBCYEff1uFNGp0+fO+yrFaqBw8v8j//u+/w5tuXkDCfIc4hhfM0otSimXgVs5vbkFRxLhvcLFPm1AqcrbWRdtqWAojP8GeMZsg1GSSqGX7V7FQpjMdjTpy4jWsrV/mbb/+QB++966b345c5PhHG6uzVpP/0n/85H7x/jqIcEmOrcm3hd9uzJ6VEq53mnIPCQ+FxwRF9zj8lg5zsac3Yd47M2geyHdJi4UydJ7RmPF5DYkOQeTyBwgkSE9SBwVzggQcP8t/8d1+m1x+zEt/S1Z0neO3dP6eYuwjuOkGNKNEwRlOCrjq+MFaRr2iLNo2tlXXOcut25wJ15ZDmAAfmH+D2Y1/jyPznCR/XUK1d0PTM9zj9479m/P7zzI3PE3SE1I5BOaAmECWgBQQavKsQ11CqompeufobCxFnk+T7JcyneSqhjahaJYquqJbdxmlvvZXaiksi5UaSDpW80BKBtqVC+763bbqG5GK3ILf3W3NBeIvQ6YxRnObNZv8lo+0ToHKoDCiGQ6rYMBntMJERpTVl7vQHU6H4GPG5/qwThcjGO4nlJsXXpFzyoggxGVLgLNyj1e1zvdwd2im1QqSkoEQkErxtwCQZEw0R1dKgRlLOv+4lFUzHVA6qu2v5JT9reKoUKOaPwvwx4OZ9qzbTqp6++GPWty/SsEVKAQM9Zggj5MWw+1lnPnPcwHxkhrXZeTj7GC+xG5A0EfM/5x2hLIiT2EVMLdlkuu9pqYA5kXTfaaWx2uhvl3EzrwfJkZSRuxq8BxGPDxlZcDVREqcuPc/W6AJ3Hv8ClyY/1lt6X9/32T1Yipy5vq39IvGjn7zE8y+d49LGNhIDRX9ILAqcEyZqTlrKyJKQ8G1aI6cULH+a0wxEg6ZRy+05h3qrG0lihIuczAe04z+pQIwKUrC9HXnyqVd4+kuv3HQO/DLHJ8JYvXvqIk8++SLr6xNCb2CJ1Iyrmk+4W6E4OUGCRVWuLCAYhbotIkVkdwTV4dUtRq1Zlm0aeWmKht0SiU3EaYPztbX+iIFqVNMPwpGDc3zjG5/jnkNeNvWsXl5/mXOXvsOofoPlpQmTahNfzCNxKrwp6hAKVIN5ak5BYl4vcpM18Rg1XdDYJ07mWe5/mjtv/S2Oz3+BIPfsO9n3Dl09rzzzfa48/R2233mWheoaB8qEThpSDb7o0Yjvop3obEo7F3NbEqVxgTY/REtm8CZEKxm57DT03J7XVv8tL76z+aPZ+9O1sW37XNEyukyEGMhsOUu4SxtS5JwYeeEhG0Sr9equAlN8BFoiDTKltVuNVqYtZ+hSMukAb5GhRkH8Em75M/SDY7T+FpPRFQpRvAYkiwxrpvbbSm2J+xZfS7nIFR/NUAmZWu0tylOFoNngxkxT92gD2ymQijmUAdpEgm7ifSJXbXSEkyYJ3nq9G12bjBa0enw6hcRmlSFcZwyke1E8jcyxfPAklIeQcPPcaJO2WN88z6i5jvOR2mih0EVtM/NyD5Ovu0/7zeEcKbTJpJsxA9s8VUrJcjkhEEKgrt0eeG833Lcf9buLbJMAsTNU02142nyX99LR6K3zgXbOi7iacV0xqbfZunqW9a2L7GyPOT/6Wz3Sf5RynwLi2w/MCcBzr5/XQwde4C+/9RIboy12JiPcYAE/GOCMPoIWiopHSDkHDr4V5FZvTpAqKSNBDpcJZw7xHilKmpaNnKYRdefcAUVRsL62RdlfpBpv8t0fPPWJ0A38lRurU1dV/8Wf/iXnL6whfkhVK76YsoFUQVrMtgU5JBuqfonrFURvbSU0J/qldaXz6Ioduyi/yZNTCWJeSMr4cEqJwvXxyeGlRqKisSBowckTS3ztqw/zuYfvZF1P64TXuXj1e1zbfJb55RE74+sUhbfma3kC5Exsl8QV18YjKcOPuR4le0SifdADLM3dza3Lv8Ut81+h5MOpw9157lzS6vUnWP3pX1BeeIcD9QZ9El48rtc3iE0aggiNcyZL5ew4HUqQVlBVSV2tB921kwxhSiZidMZs5rVrdtjJGWXsvy3cbSOatmDXuXwd8tLlBPHTxURwpibiIt41eeE3Y2QPl+L8lICxyxlvoWNmbNdsNKXtueQcFJJzXg3OOzR4ZHgADv8GLCzSH/aZrLxAM7pE2dT4VAKexilJapLWRsbAg8sRqsslCFmxwBYVO1Av2ZgQzVi6xpyB6BjRI/UO0Fs6jpc5qu2rxO0t0MrIJPmapxwVOMCniBfTh7D1XqFFKKazBE0tnNXmkeyCaMJo1MUS4dAd4D68EHhUrXB96wx13CD0YVIZY8/gs+k+uj3rjChzaxzU7uU0N6oz79F9Zy8BJqWpI6SqVFWFiOTcVSDG1OWldgndimBkYaE1lp1DlctSYjtnu2+4DJPZ2mLQdya6iAApG4TszHnFFQ7vAiO5yvur36R2l7j3+CpjPa39myAkX3jgVnnz1Ip61+eFNy7w+jsX2Ko2kBDwvkdH8BByHZ0gyQqwXbK1L5FTIWLMTusEYPO9TZVQT0DtOtjjkrKDr5msJCT1lOUczhe88toHfPPbP+TU5bHeeaz/KzNYv1JjtbKt+tOnT/Hd7z7B+lZNb3CQSZ3rRVJWpsZ6R+ENwlHUwtnCI2VAgieJ0ZONaSbW8XTmIdnlmUl+dtvIShOiCZcUUo1EY/9pFOu2qSbbPzcI3HfvSX7vd79Av7eJcJFT5/+WlY2n6fU3SLqN956EI8bKoiQKRIK1IlBFxOq2rDsoTCvtGyxBXoDOU6TbOLb8KMcPfIEeJ5GbiGbODq1XdfXUa5x+/sccWj3DcOcac9QUziEpUscG55VQCCoV1t4xZe05e8hscSWL1mtmA87Aec5yLpltYgu+mxojywllkkNrGbp+Yjo1Uk5QmRopoGMC4lzOS2XjSMzFxy3UR1bDqJEUkC5npV0eqWUQtpGVZiNkN72NMFo2VY5yu/ortVviA+odqbcMBz4LB07gdQsdb9BMtlGfMoMqs1JdTaTKu+hbtNcaf9F8XuaQOIyFJUJniFWMoo96Ki2YFAdwc/cxd8v9EIa4K29SN+epqh3KLCUkgrXcSHZvvFOjNZMj587ot5EUJIl5SfP5HlpS3QhAkKRAwyIs3AJ+cNP5tq2renHjaTZ2zlLFDfoukXAEmRGt3SeCYc9ns0ZL2gTpzHc+rN7KpovlqJqm6XQCZ1vet9/fm6u6kXQhHerSshO1LZrWdp6aR9Q05uw6MdKQtvcQLGcUHON6TECR0rO6/T4rqxdZWVnjvtuuslK/rYeK/fNY999pzMt//hev6Hi8zekrW9TBWhY1KsQkJB9QeggVKq177jpj2kWsIp0qhmaaqXMO9QHV2hwqbVr9aMtZaiTW0OvPs76xTd9Bqhrefv8il6+u3fR+/jLGr9RYNcATT73ImfPXcH7IaNJQln2apiJkJYo6Gv4sSUhOaFBC4fG9Ei08Y7WyQ5ex3aYxhkuXVM9jCn1YmKtVY907vcEx9XiMNjVBMkATPdUosXzkIKnaZnGp4L/9r3+b5aUalQu8f/Z7XFj5Ma64gA9KXQcaxaSInPWS0RSsKWKr5i1WuZ9ijaScoPXRIkUF0QHUhziy9Ai3H/oay8WnEZm2ZNC4quL379AKyvbWKmvr1zjoA+MIRKFXeoJTvA9IiCSpSFFx3uNSAc4RxJ7GKBbjibPcUUc1J0/yvKc2L9VGTvZgGyGDzuhNBWDb42tD2zYislzV1Hi0C4gXT11HBv2CumrAJYoejMeWpnQum/lUGRHGWz2Yz8XgMZKLwXMek2muLEnbEn16LlOWoBnRkj5VA35ugf6RE9A/icw/IvH6D/SgE3ZGm+jofaTZQUIiBGGSTOmj8CB1bUiks3otzYucqDcRYAXRaIYlqEn4E4kJRimRigXGnGB++VFYfAjmB4S6YfXKTzkyLGEkRj7B5qoXjLHqKivxED9ti6NdOXTHHnMh+9MxC8Jm4+a9RynpLx2HchmZ/zDhWri+8QG1XqYcuM6br2O0iHHmXtuFtjkwjeSms6LLfX4E7MfMXGxhOPu+tYyPUWmaRAihU2F3rq2lanJbEUeKqeumK2Ikiba8JKXUzWlo5+TuczEtQnM2YmwLvTVHPuYYhmDs1dFkgkueokisjF7mhXevsTO6zun1n+gdS7950+v7v/9vH5bvPHNF//JbT/DT5z9gUlccWjrO9dEYioJRk1ApcRKJ7XXTSB1rXK9Hmr3I0mqvQFKlGAyodpRUNxRdHi6a0+6tMeP29jaD/pDJ9ha9Yo4zF67yP/2bf8+Z62O9/cCvJrr6lRqrJ585wyuvf0CjJfg+pe8xmUwoe1bYqylNvaScZ3E+4HslrigtV6UWVXla/NVNKdHSLoxtCN+S1GzSOk24FNG6xmnW/0uJelyxNFxEXWDt6nWOHQ38r/+73+HgwYrBcIdzl3/K+tZLVPV5hDWQHo2CpoLYiHnJCGhpoXhmBZoeYEO/X1LXFmGBQ5MjNp7SH2CuuIuTR7/CUnk/e3vn3NxQ2Th5x90c+a1/QP30gEnybF+7gOqYeZ/oibU/aCbKYOBJzoN3JG9QXASj6hPxzrxsg+ksErL1NsN4jlxWoJ2x6fK6vr30baQ01QekNU4y8/cZHhTYtTB0DRS8CY8qDrJ4cG3cFKQwGFewnJN5wmKK0y3duc1vtQSGNtrLcFNrVHFqPZecLXAae7jeMfzSHTCwoliZv5+eNMihS3AVJpP3Kdg00e6kbdckellLMUEmVFjezUUzVtQRX5ijQJyQmsaum/cQFhiHQxSLn2F47DFYuBcKxS1cwS8cZ2u0yWIorBVUzkkY/6SBFvZysQtZLYBvi7Szl50zwWQYS9Tyd5axdPjBISiWPvTZrdIO43iNSleJUhss+yHf/7Ao6+cZNzNoMUZCsLYhzqXuvfZvZqOq/SIso6qb02OHPCWA7Pvd7rX9OWYoGVOncQ5RQ38at8GYxOun/wqVxIXt5/XE3Odv+kw/eO8RnPsa/blFvvm957l27j3mjhxnVEUGZZ+YakNxRGkytLewMM/OxCKu7jhFTH0F63AtTnAhQChIdQ0YiuKSQde9oqSuJlBAfzBH02xx7vxV3ngr8NqbH3zcW/R3Pn5lxurMuur/5f/657zx9mnwc4grcaEkTsaILyCalpXz5hlFNa/XFz3K3gBXlqj3JiWjipKjE0m79tMyx4CcvDZvMjiHS0qsGrSqoKlxGtHYkJqapqpxURj0PF/80r18/e/dh3fn2Nh+jwtXv89O9RqaxpAKw8DxiBTmqfrG9qmCVevHDGPVWKt6Mm4eQHvEukTSMovz93Ly8Fc5NPcw7ib1GTcbUhwSnVzR/j1fpO+PsXD408TTzzC68haTtXPMVw2LBIbeJm4tMHaRxkvX+r1IfesoLlVWsDB6t2T4rjVS5jxMX4Fu4bPfZ4gMGR7sUL7cvUVpI5qU8y9tjsLhJBBCQrxJSEWUFBwqgRQ8TTPJkYDLZQq2L7v/mbrbXT3Jx5AXcslQplg+dGpMNee2bCmfxD798lOw8Bnoma6dK24RjRe1PDaBiWN7vIXqCOcnSIhoMlWKJLtp8+QicHUeiQ7nIrQOQBKUQJQ+6odUsoxfuo+FW7+AP/oYUt4lGq8qC3dTLt/FeHSeQVAKiVlqCSDhXXu9d9+XTgUFzUaphcVMKsuJ0DE/EJCS/vDQh3YEBhiNN9iZXKTW66BVhjUz9NtFJu0x5PvAXqO1H9svzSAiN3sEssOD7yIzBSMONA3e9yiKHimRI6yWZh5yjRa7IjPnsjahZkKUc6jOMhWnx2EGr+07156DQYUWjCW8M8IMqY91JzDXpWoiiQmbk3d47VxDrVuc3v62Lvc+z9I+RJbjy7aH599X9eJ4/Pl3WKsmNBPFlYFxFKrapNK0FOrJmMlkkqPFbDwzoqHZadJkzpwrCzRGYlN3ub22V5jL+okpGWnFUzLaEc6ev86TT7zK2euqJw/s4y38gsevzFi98uopXn3jfbbHkXLQp24EYqTs9xDxJKlBBO+MotykiPMlvUEf3+uhhUedJxHzOmT4k2e6eOW1YIqP533bDQOSEqsJqaoIKfvFdaRf9KmbCRK3eej+E/ze732eXu86SU7x7qm/YW3zNaS4mvM/BVGTefPJCu7aBcF2mhfjNpoQNUPoegTfR+MAbeYZFHdw9MAjnFz+EkHu+rkmgvQst6Xrq8qhYxy75za23nuWldefYO3iaZiMmPNGf26koRJnNRwiWcolEJxau5U2Ad3WhVnzMLtGznUdgLtFcSYn1VGTuwiNaf6ki7BaokULKU7rfkTsgYramGSMOBrxJDfHRB2umCdRgTSWx0IhKV5MqqqWqR6d5M7AU1FazQzHmYiRaf8tFWcSXmGRYng/zN2HyvQxEX9cdPuCsrNNqC9QbW2j6SK+CARfWuTU1HYNxAgntpIJXTdhJ0ANGqEoiTKgkQWiP0gsbmHpls9THn4YKW0eiD8iOnpOe0ufYuf6ezRxFSc7xlVRnUKdMjUM0zgnG2JlCrk2FtFbuYRYPjhlmE0KwuAAFDenrAOMJ+tsT67RyI6VGGRNOwSiTrUr9tLFYRrh7De6PNGHxmntdnb/3rICNRcIt3BgyghNezwd8sIUBp6ls1v+58ZosG0Tc2NEZjqMxrBzuKCkSG6q2CI9VsIwoWaw7FjZeJdXT0/YHm9xx8Etrow/0KP9/Z/7z98t8upZ1YMHl/nL7zxOVSea2tN3Ja7oIar4EBAtGY226Q/nOqZnpPVDDHVQ70koRdFDYiJOKqI2GaEQUqqJdUO/CKgmRpMRvaJkYfko43qTnz75Cl957AsfeW9+EeNXYqzOXlf9v//Tf8uFC9coews430dSpGom9Ic9mtqSf7ZohSzc6ChCSdkfoD4QnS0qLTPG4fE5suowcNlNo7W1VTKmrhATKUYkGuW4UFA8wfWJzTaHjyYe++ot3HXPHJFTVPoSF6/9mMRVStfgO12x3FvLWct538FNOTpsddHU4KCyFPPympJUzzPn7+bY8qMcnv8cjv98eRNZOii6eVU5fIj5o3dQHLyLzXdfpDn7JqtXzjLwNTGNqDWg4vFBcKlCYmVJfjEDYMd8Iw15175aSGXP4tJGKiBd6wzpjNRsnVXLJmxFZZWUbIGtUg0+J5RdD/VLJDWIJ6YdxG1AAUEqXFRQY+GJtvVMuxU4AOv0nCOvaWQnMzk0R/QBXx6lXHwAWfjCDWcvcydE197Rnl6iurBNvT1G0iYuFEjOX5hiRcpmo43sYjaWkVQ34JRYlIzjImM9TG94P8tHHqQ4+ij07tq9U3+AMPwUbvgm9XiT4BKuwc47G8WYF12XZvJC7aIrMznDlhSAFbRqko6Y4nyB9ObB9T90ju2MrzKerINUmZmW72+b0M8U+r2Gaqoks/+kmtbv3XzSpdjmUGdhODq90KZOFEWBdwVOguV0WhZdt//2mP2uv22f01wnmw9qNu9mc9vISa0BbD/0iEJQJSbN6iPeJKx86+BZa0gthY3qEq+c/lsuXz/HZ/0lLqc31FXLHOnfqCv40EmRNy+oTibr/OS5d3n/0hr4ORbml9nc2WZSN/T6gb4M8rWfcdDaa5/r0pyABqOyO+9RZ+934gsovbKgSom6miBOKUNgPHK88/YFnnr6VS5cUz1x+JcbXf1KjNXpM+d5+vkXWd/YwfeP0kShKHpU9bZBInnStJX2OCH4grLfo+z3mIgJUibsM1JmxEgLx5mXozLVGcscB3tMvEBTmRcWTUrJ55uIeKpJIumEzzx0O9/4/QeYX7rG9uRd3n3/ByR3DYljVH2uA2sXC2PUtRR7gFZlW2ZrqcR6OjVVQz1O9Nwyxw49xB3Hv8pS+cDH7vR7eax6rH/zyRKdI8zl3lorZ7R3x8PwzrNcf+c5rp96BTdaw8UR/VopSDiM1t6Qdk3ylIkKImo5EWd5LdfCazOwjckcWR6r81hdZuJJjswyC7D9W8k5pF1UYm8020YVDQ6KEnXzzM3fgfdzrG2sU9fXEcYmj+XzcdYRYjK9SLIhbVNX7Tnl6LbNYXUqFvl3dYFGhgyWjsP8iZtef1m+V3TtCR2M10hxE61Poc02qrW1ZOgUPWjNFUhjUBMNlJHkSxrpMdZFmuJ2lg5/nuL2r0B5DNkrqeXnCYM78f2TxOYdkou5cSAogeQ8UYw1SSNmxPKndIu/dpGFUb93Q3cuK+sThkhx7KZzaxKv6Yun/iOTatOUOUQNqtWWZKCdqdmvtunGiGX3rj46vzWFFPeyCtvoqpVeCiHsUrTYu982ymrrsDTnQKeEjtni5r0U+nabBvMa1KjQKESrmUtUxlp1+XjFiBx1qgmFEnrbXBu9xgtvVYyrmvtv/8ZNz/r+EyKvnq206A/Y+u4zvHd+FRcKvLc0SUIRbznRVnTASdfQwYAScahEY24WJUW/T2wS1FVXDqCxRnEEB/1+MOLPpMKrtTB6+cV3eOutCx9xj/7uxy/dWF3dqPRf/ttvcuHSNRIDRB3jqmE4FzINtbb+VPiuwNoFTzkY0O8PCaFkornhX6bdOm9Nxsxfs8TobMsHstRM18dGjDXYTEb4lKm8eeIHAk1Sbjt5K1/92mPcdvuQnfHTXLr+Iy5efpuFJZ/pHCl74y3FG8QZE7FtySBS0XYsFbHCYAGaZocmeoIfcGj5JMePPMSB8v6Plae6uK169vwG77y3xnMfbOqRQ/Pcvnij0QpzU/FROWTtt/XqWT1w22cIr/8Yd/FV3IU38dtX8NWIhppxYa0dvCheNOvfuc6QiLTRz3R3ItO8ic68pz7nFXIEYw0xcwuLrj2Iy1YkL3LO7qAi+H7ARUcqAioFrreEP3o3zJ9g+cpFtrbOMRptU8skN3UBJwmRMO031RIIsqFsnZg2omq/Ywedl0AJUC4zPHgrzH94nRHz9xKONizFinoVquYVnIxwMkQkdEK/Nmxeipi2iYpRbmopCEsnWDj4OXpHPw/F3cg+haPij4qOX9FieIJqUmQCUsS8eQfe0XjrhuuikBskzcBwcRrPOEEjBndlXUVJxgYsih4U5d7d7xqj8QZbOyuMJ9toiFaXl8tFWrGu/Y3TFIrbZaBmtASt4PvDL/uskWqjoVnSRF3XHQzovbdIPFqT1pY5CHTyTO12jFuRI8EuCptCkm2NpAEz7f5k+nxLYcagtpyPyARPQ3J1jnotV+2cUJNwXukN+1Q7wrlrr1HrDi5MuLD1jp6Yn/bGUr2msWoIvVvkoZOlvHA2aUXgmz94iQvXR4T+ApQlVT0haaSQNpJvn8GW/ZpZgfk5dt5T9ns0TaSJDeR2KwqQKiKKDyUkISVPUfQpi8Sp05d4/KfPfPhN+gWMX7qx+uCDK7z00nvUtac3GBpHLk1okgcfSFEJedFqsNC0LDwyGEC/T51FJG3RsUiqddy7SZWyB+OMjq25tqQAfFRCdOgooWOFFBEsmSgI4hrmh4Gv/8YDfOWLd7G++RzX1p7k6upzzC/lffiAamPtp/PkTklRtXYEwfVwmkiuwnovFXnb1rwR7VG4AywOPsMtS4+xOLzvY2n+Xawr/eD0VZ594QPWNuyBvPXEEX7w1nW9/cQyS3NAgkNh/4hLjpwU3b6qC/feCW88BS/8iPGpV6nWL1DXmzRZ4qhkYpXxIjOPKnniK0LCZSV1U2+Q1lyYuoiLHeQqZAFbaXMBeTkTOgPSUscl588mTYOXEnWmADFJE4IEmDsJR+6H4e30rx1k51qkmthiXfptvFOCC9RNJlxkCyRdjk26nAoCXbdhkc5mRSnR/q2wfA/MLe57H9Z0RZflkEg4LDpZUZp10vg6o+01SumbIghZDzDX1plCRqteUdJoySgOiMUJlpYfonfyNyB8GvkwNf3eMq48RHJLNAwJria5lAtCwVOg0qC+ISnW2BMHSREJiMZc12XqEK2zpWI94NSbiC3hwyHAUbzCqL7CuN4xZyMrOqhODdV+J7GfAZvCwV14niG7m0tG3Wyb7YgxEmM0QxUE10ATY8cubkUCurmXkkWGotYv6obtTqPStnh4um/ZtS1xnkZb4W2b+0kSRCWpCWw3GpkfzpOayNraGoUbUM7B5Y3X+NFTW6zd5rm09a4u9BehMTJH6E0Rl0dPOnnrmqo2yn/4zpOsT7bwxYCUwJc9w0lp87UQsEhKxQqFU4aBNTi8BHzhqMSufXAlGgyiTk1tpSFiLUW8FIzG21SjbZ555Q3ePDvS+08OfmlQ4C/dWP3oJ2/y5DPvgsxl8sOY/sAKaX3o4cWRqjEuCHhvbRrm5pCDy+hwjkk0Ty4AuZjJijPF2GNOIajQIExcoC4guTEhNvRqGGqJriXcTkGpfXbGm8igJqYx/cE8zWSbRz51kt//2j3ccmid89ff4vz5Z9gef8DygUWqUQVixb5Ra0SNmGHygwVeHS4VxDShHBRocEzGDc57eiFRVwlplijTPdxy6O9z8uDv05PPfDzob6PmmddOcW61QWWRFANr5yacXb/IbStj7vvULdx5BFY06SFx+xusuSOi9VXlrq/CoYfoX3iX1ZceZ+P08xTVJYr6KuKNXaaUmYVpRBfnGwSjugahi5RiUtRDCn2jDKcm5+myMdJsGBQrGs2/t1I1KRuulIuJ3WDITqYgKw1lX9mONcssQf8eWCwJi7fTnz/C1qXn2dl8i5QuIrpCSjuUvQWaWtvY1+DgFHNXYY8LQmrvm5PM/rKcRZV6hKX7oH8HyP4kg+WZvmHSOyQ6+kB7/cD25YNcvfwUB9JleqwirsKpsUMlFx4n+jTMM26WkP6dHDr6Bfyhr0C6C/EfUfxdTVi45QT19p2k7W2SWyEUE5g0+AQDKU34NIwsRxKFZmKU5NIJznvQCdqkzPq0Wrq6gUlU6Hlirwf9m0eUja7oe2vf4vr4HdTVOFeYVw5QKy5YLc/efFK+WgBTeD8PJVreJwvE9vo9mqahruvOQOwmRexWpAC6JozOOZLCuK5wHvr9EpGSppmYQKyUOO+o64gEj4pj0kxsQe4ZIUN8OXN8MvMqXWNIkZzrS9YMVJwSqWliNcN2d1lkeKrYp0lxLqAji3gK542BnBLOJyq9zCvn/xXF4nUeuOuPOdz7NCI3lqzcd1jknTNJF4Lyb7/5JOc3rjNcPMxWU+F9YQ5JM8JJonSeOjY00VAqFwZU1YhGRswXjjAXCJMesappYkKDQf24khADGtvi+4QrC8reImdXN/iLv/khV6PqEf/LyV39Uo3VT55d0//nP/+fialHdAUxWVO9pKAUaCpJOLwPtEwx1y+R4YBUllReaFqvSMFJVrfO+m4uJz1dFp0kFFZz0haNVjWuhnpU4SYNUSf0fGBuEEjqWF9Z5Y7jh/itr93PrceVaysvcv7icyhrhLJmPNkkJkdwfYskclNAE1gl1zJkGR1XEJuGuqksa1W4DJf08c1xDsw9zPLgwY9tqF65tq7PvfoBo1SSyoKoPWIKTJqGarOivrjGSBsuXQk8dt8tH7otKY5MIYaV83pw/igH7/kUzYWXWT/7PKsX32FY1vTKHq5wJK1odIJPWQUjP3kd27nlo4sVRJZeZx5qupyVayO13HunjXjEkSOf3GY+yyo5DM3Slm3mBzi/BFrAwSUWFw6xsHiMzbMHGa+8xChC36+j0YyDis/F5ZYEj7kNS9TUFQfjrJg7UVCUPYreCcLC3Wh5HOdvTHTvez0Hd4nuvKv9Iw3LxRz1tVdwuo4wQWSEY2JzxAmRHnVaQIe3MDhwP/7oF2DhPsR9DJHiUIJbpOjfSrNzhUlax8mYECKtiC2xQYrs6fuCorDoyqGQGiuGLa3lSZ0aJDRofwBNnzFDtkaO+Q9RrohMGNWXqXSNpI11DRBTJhe4oavBfsy/mzMB7f22sD+E0Bmlvcap3fbNttmq4LQwYQiB1CRSamhrNtt4uiUWxM6pmhZS794mgBkp9pxXSxRSTV17Gfsjsfw2dJT3jiicmajGE1OcChomEK7x0nvfIjHgkft6rOkVXd5Hxebe25089fJ1vXhtjW89+QpXNq8yf+AYO1WD4nM7exMd6BUeJ4WVVuDAe0Q8Uax21ZXBdAebOtdoOYSAiJ/2CcsanOujEZvVDj9+8nn+4L/63X3v5S9i/FKN1U+feoZXXnuTmKwINeVkvrac2yzu6gpPoxHxjsFgQG84xIdA02LNSEeGmKpwSyYCQO0UnOXARCMuOQr1uDRhUm1Q1zsEL8RkdU+jUQVao3XDI5+9j6/9vU+zdPQ6b599m0tX3qNcqCh8oK4rymK+w7LbrrgGEeTJr0LSiC88TXLElCgGNV4aUl0g9WGW+w9z4vBvcHD5jo913S6MVH/y3Ot8cOoyYXCY4bBHo4EmCuM6UjdjVlZqtrdWOVckLl+8wrffuKz33HaUexY+3OuRQ7eKbp5Tbj9CuHSCpaPHkXdeIq6dZ3XnEmWzxaCsKZy1Uo/ZsYjJm9FwDnEm+utlZMbFsasJYpvEV4yF51zI5JhcFJyNX5v89X47136B4kkUFhE5ARehPweUUPSQw3MsukXm546wsbLA1uZrLA6umf5ZMhXxkGFjLzEX37aNFe04R1VBE3sMh0foLd1NsXwXFDfvjrvvGCwz7N3NcH6RZvmzeG2wTsY1YD8DqHjqFCAsEOaOwtwxRG7/eJ6pG4JbZmHxdja23qceCY2r8G6LqAltTBeuSAHRwlrIRiMPkSPamAo0JmKwQuTaNUyailgu0evfxcL8A7afm4xEw9b2JlU17hh/9jz4qWHaczbTfNL+29S0+w9agoT3tsi3sF67r/0KgqdGMcPRSWnqRCwU7wuKoiTWpnAhbSG6eFKy9ScltVYvkiX1Z4/vI4zthxFE9vt5CidOodD2eJSC8URIkzVe/+BvKIoJD935h2zpFZ3fz2B9apk/8F9gW0f84Km32di4ji+G2SB7UhKq2FCUASmEpo7m0EvASd8MszhCX9Eaqh3r4yfZNFjlSl7jDBxhMJijqmrOnb3MKy+/ecO9+EWNX5qxevWDbf0f/vG/4NrKOq5cMihIrb2Dy4uJS7l9tzpqtXC51x/SHwxI3mOpiHjDjW6lwNvqkugsUQpmS0Jy+KSkuiJO1pBQkZJh085BNWkgTfj0Pbfx5S99moWDW6zvvMra1jskWSPpGJx54iEEmsYS9SYj0HTnaOVdyiRW9EMfoaT0gneRelKj9SILxZ3ceey3OH7w8/TkwMe6dm+8fZWzF7ZxfoGogbLfM4OtCdd4mklJ3SjjScN4lNjcusJ25diu5nj6nOrRZbgzN0+rqlUtJLfSCEdEd65ZgqF3FO4aEJaPcfC2B4kfvMyVUy+wvf4+MV6iTIm+jxapSImmQGzZjbnlgA/gghEH2hyUOO2IDq2rEQVbFKRlCqaMr1s+RZz1dLLSLZfzZPk5lQKRE7seWq1Pq5s/wPJwjo2rQ5qdFxEumHyWE4rQ3i+bNslBkzxJF2hkmcrN04RlhvN3URx8FIZ3I+HOnwnaEDksqpeUwSJh0KfbmanDdok/ESh9sPnqpvDOatzRg3744Y6FHBbV95TyGPgjRJZo2Mb5CokTKEzw2aceREh1pFPNFIcGQYqCSapoXEl0gegW0P5xeoNPsXzgUTj4RQg3r7FqqNne3qRupj2r9rL/xMm+hmmWBLHnk13vJ03MOjqzzOA2Ymq3t5/hQgVNJr8UG4OwizCg8UJdjUhJKUJpkUXb3DI3MhPZLeW0a7Mz0ODeurHWWM7+7YcxIE1zUNkv8kxJKYfCxvhdXn13TE/muOeWyNrovC4PdktgHRyKXKpU/7D+IqNxww+eeAPvc++8oqAm0qQaTYoP0FJ3g3OI9oyk4yK+Z06C1oI2npBagkbqSq8jaqr+yeGkIMXAX3/zO7x2akcfvPPD5+7fxfilGasnn3yec+evUCehwGeBxZZemZPvmVHWJIs6fREIvRJXBFMBT/vAAErH/jIZVUgSEOcRhDIW+KS4GlI1oal3CCFSVTXq+xShh6NgUAi/940v88BnDrK2+SLnrnyX9e238eU2TdzGEfF+QNNERAqm6o8W+k/7U9hDFaPV1IgT6rpmtC3MhxPcsvRFbln+MgP/8eC/l840+sRz77Iz7lHOLVCLUGmubXGRwjkKX1DU1inZtPIaLl6vuL5xig8W57nn5BHe3lD99KJIWe7Gv2W4O6GvcVVZugN/6CTHb72HrfMvs3n+RXZW3yelDeadCfMUPhK8QMgQW1KIzhh9rrAEedtjKgvjGlxkAr+q1hIFjeAqM1iuMiPaRdog0uBoshBtCXojRCXFHaLNBeX4gMXlW9h6LxB33qOpVklsIcUI79TYxNGR0gKRQ0hxB35wOwN/K1oepX/gTjh4NxIe/LkevL3yWD/L+ChDNR1L4E7gi7sI/RXQHnW6Am4TEcslkgSnFRIarPEj1l5CsA4FIoyakkaP0+/fz9LBr1AuPQyD24w23ztx02Op4g6j8SYx1tb8VEz0uRMI1mlrj+loc1R73tf933fOaqNiE3EuSycF3xmrpqqA1j2dOdSWrKG2zyYpk7ohhALnCnwRcVWc5o3yc6q5vUpK5Ghuf4MzS6zYWxTc1m61TVX3H20yK82c/979RELPMx6v4ouK9dEpnnr1L6gmEx6550/YnFzVhd6RXfenTPDAXUdZ/40H2by+zkvvXGeiinM9ymJAE4WuzVgAYkIocbmpZ5SGUDi0P0YrD9vkbG+NapzWK+aC7WpcoTgmFbz4whu8+sa7Nznfv9vxSzFWb57a1v/T//mfcfHKdRRrRa6Y8m9OeyBYC/FGElEF1+tTDIb4XplD85lISttXNShQW8qlsW3wjojJKQWwJGGVqGvLhUyqHXzwBFdQNQ1aj7n71kP85tfu4667hTc+eJXLqy8Q3UXKwQ5JbcKLFtSVEgqgVUxva4WYMuK8L2hSRGWMoFSVw6dDHJ57hFsPf5m54uMthm9fV33ymfdY31GSm2NUCWFQEOPErp1ExAVECkopKJwJWG7sXCPGmp3RmI2tCRtbIzY2D/H0mUqPHyg4eRNocEUrFSmn+aydD3T+1juZP3c322dfZvvim6xvncfHLbzuEGRMH4/z4CVApu8m2mYFLkeedTY81gacNqeI5a7I1PK2IatoYZIv0ljOq5OOCQj706olnBBN15RyyPw9HlZeZfXqW6xtnYHxCmWoKYseoVxkOHcHLtyKG3wK5u6E3i1QLEN/CSl+foPzyxgih0XjWZ07tM1cr0+qPmC8fZpxdZG62cLVmywwzi3ezGmrNdFEJeJpZEByC4T525gfPszc8iPIwqPQuw3Zpxh17xhPttmZbJNSpBX2sMXb3fDd6QJ8ExhtvzyTYLnMLLLbRiohhF1RVvv9GyA5fHc8qtA0ViRclqYwUhSRqmqyhJvuFr5WzcGwsB8bcS+Dsdtn/j2l1BE9brwGs38//f3GiKsBF5GiMsKGNjST07x9/nEGvcPcd9tvArAzXtFh34g+B3O95TuXxjra+hyra09z+tqYahQJC/M46TPRaC2QNFK4EjTR9ugSV5J8hfYCfm5Imkwgd0nW1JBck02xQaRF0aNphNFOTc973njjA1a2VQ/N/WKJFr8UY/X6W6d4+73zrKzv4Mol61KroDNekXcY5VIc6gvKYZ/+whxFr+yopCLWeKOTkmn/fPZB8YKGkhQjBYmecwRVJuMarQxyrBTK0EeTJ0ZleWHAF790H7fdKozGb7K+8zrJX8KHEUqVK+F7uddWb7ovsR42SYDkbeHt2oZXiK/R5PDxEAcWHuW2w1/n0ODhj7xeq6q6OoJXXr3Ahaub1DqHuj51SqRoqh64DLG1Tpo4S5QCg14JvgT1TCaRy6tbrF5f5/yFBU4cHvLihagnDjuOlrsn16EZQwUgw7tEa4u05m59mPLM82yefYm4/h5x6xxSrRBjjXeeQrB6KFdQ5/br1twwAIWxw5xF0OoyPJajw9yPPd9Gh8ggY+k7RmJx0i28Mrg5tVvcYdHJVWXp61B+irniHZq195mML6E+UgwPMJw7hh/eCeUx6J8wXcry0CfaQO0d4k+KTs4pgxO4ySWG/VO48Vm2xxeZbL3NhHexVlZDFE9FpPEeV8zjytvolQ/QX3gYv/QIDO5Ehh/fQI/HW0yqbWKa4MXKABqFooO0stHpXND9YL+2aJ7dn7e/J2NtCuaYpgiNpq7Qtwi9DnLb28K+LdIXUYiW76rrSFFIzl0l6rpGREmxsQgx5LajUfeFL/fm1GbPY69hMmmnMPMetA/p/jDinnyXRBrdoeyVTEb2DIdh4tLaa/BOIARhpXlFJ/U2O9VVHZbTKOveW/ry+ulNXd2IfPvx13jn7ArUc4gvQRtSpwGYcCmXMDgHzhFdIJU9q2/dFCQ2aJoYEYmWCu9ydCV4N6Ca1AQKnnv+dX7y+L03uUZ/d+OXYqzeP3WR65sjtsc1BxeG1I2YJnXuoeO8donZRESDI/T6FIM+zhc00gq/tnBfHt0PnrYtenKO5DxNHSk1EkTwUaFqoEqIFPTKeVQKqrEy6JXcf99x/sHvP4YrzvPqG3/NZv0uRW9EKKCqoy3AlTAa1Rw8sExdt23pZ2Z2VngQJ9lrARcU4hCnd3B08fMcW3qU8mMk0yPw6tuXePv0ZSZSUCeDSnv9PtvVNmXwxi7TTFRIWMV8hiAWFhbYHm9STRrEC0V/nlhPuLxesTVqGDcXeezhW1lV1YP7gv4zp1UYbKhxRYsDRzl4+73UHzzP6NJrTC6/yahaASq8NIRuDZp6l6KCpgJTsTYM3ImSnFHbW6Nr7KweSVqijIDzWXOuh4p139Xqmkr5IQZrBiLR+oIePfEITK7b4lrMQe8wTPrI3Ie3v/ikD+lNC8h16y3tpyuEndPsrB8kbTjqeIXYeOpkXFUJCwzmb2U49xnKg18BdzeyvH9PpZuNsV7V01efpG52iKnCqbEAU4TkMis3Ryz7jb2Rxex7e78nYkXKbXQ1+15RFJ1SRac8MbsdSab1KDlvFS0nZYXCmajhFG2sQJtcf2R1kv6GY9lrUG5GGJllLe7+e535ef9znn0Mvfesb24zVx6l1++zsXGFZrRG4d7kmdcaijDktoOfox9uu2E7D9yxIG9eVj13ZZVLl9esdU1RECRYCYWL+JRAK4yhW6LepOvU9fFlJPrGulAnvyvX2kZjdZ2Ym5un8J7Jzgqnzl7i6edevuFY/q7HL9xY/fTZS/pP/8W/Z2Or5tCxE6ytbxGKPkVRQCaPOlFiqkkpkkprVe8GA3zZM0JTMu+6bdHcLYTOW6gqgITcEdOwahc8Q+8JOyM2V1dptnbouR4NjqpSBv0FaznRbPPbv/UFPvWpea5ff5VxfIskq4ivqJPBbAYmFgwHc4zHFc61iguZiq2muC00aEqQagbDHpNqkzQpuf3wY9x6+OuUbrfu33h7VftzN9ZQvHOh5vTFLTbHiVAajb+WGpcVB1JUkgv4VsYpi5KakFGyxm8hEIIjRiUVQkoFqYKNyZgL1yp+8OQHfOM37vpYBgtAvEUf2pzVYniC4paHSRdeY3z5DSbX38ONr1DIFv3Q4HRkNT0UuamfnUPSikiFd5ByLsXumaCuRBjgnBAZETVS+oJEoNHCIrTQQFpH9aqKHPnoYy6y3FRc1fAR7VV+nYfM3yc6uaZhcIzFQ3fC1TuZrH/AtY0zTOod+oNDHDj4KfoHHob+3SDHdhn1jzscyvrGVcaTTcq+R2lyS45yukjP5HNuZM21smPTzzuFmZkx24J+9vtN09A0DVVl/e6KoqAoihw91RZlkZ02EZKak9ukxKSu6YvQ7/dJMs+kGlM3Y5zHIE0xMepELnZvVTX2MSzGILQ1oFXJ+DCIsNvWjHPbEkZamLPtu6ViRLJBv09KwnhsDOQyRMbpKlc2Jrz49t/Qf3iBpf7+OqJLA/iTv/9V1jcbnnz5NHGnwBUFRb9HE7dRckdqseuVxBx8dT0EmF8u2bl2lWoS6bmAd0rT1AaGeFOjn1QN3vS5UBHeee8cr57a0Yd+gUSLX7ixevm1d3n9rVNs7zQMQmJp+SCj0ci05SAvsMb9jy5C8JSDIb4sSN56xirTXBXMTAgFxKIq61FE9pKE4ATqhmY8wjUNIa+MXgKln6epEmlS85XffIj7Pn2Q7fE7XFp9lp3mFK43QkVxWB7G2nyEjO9ql0TO/BA6OEBbWixUk0iKc8z172Chfz/DcDf9sHvB3M9Qvb+l+sPnznN1bcSogUHfOo+SEilVqEaSBCOWKJl4kJPnavCGQWZZB05zry9xxMIjKqxvjBlvV7z4ynn008d/pvsp4WQ2WpfUHbub4eV7KU8/z8alVxhtnmOrWWGuTBRS44imQpEqiIlQKEVpRIs2ddUW56RcvItEXBHNeRGhUeu9JWWAwmEpq+pnO+b/gg1VO6Rn0abWZ5XlA/T693HswCWaNCaUc4T+LVDegZQ/G8txdiQq6jRCqfO/uGstb43VXlHj2XGzSOpnHS2Vve13VxRFLggWUqqo6wllmKMIgaaGqmrohZ4VA7csQqdI0naFAVJGcGYVKm4+ZvNnrSFtjdhHndtN308ejX1DEXR6bArgG5Jsc/ba6xw89wxBDrNaXdCD5W5CzPFFkXdXVP/R3/86o0p45o2L+HLIpJrgnCnT2LoRDeFq14yc85fC4fslriqIsbG+3WK0flWsQW40CkavP8/OzjrvvHeGl17+xRItfqHG6vQF1f/h//anrG/VLBw4ys44EtOY4Dwt2dzmt6XjxXmkKCkXFnBljyjOBGvzoiYzxqpTRYCOBo2Y7lZA6HuP7uww3txGmsrSSSqIKyikIDVjlg4M+f3feZRP3dNjc/QuO/V7uN46hIhosPxKckBhRA4EyElgyeCAuj3eV8K7gmrk6BUnOLr8eQ4vPsRy7+5dE6qaXNSytzuhfXmi+pNnT3Hq3CbblbUfaaLiXCJqRGmsS2mWz4HsRGaKKRINEXSlUcrVimO9U7wzPD+qMK4bSqdsrq0Qq4M/172VcItovaKcXCYcuJ2DKw+ycfldmrW3mWy8RtNcAq0ofSRIRYrRSqcV62mV76OKibA6cUQ3RqUGV+cy64qaRAxDtBDwwXjn/meftpVe0wT099Hd+y9pSLFbAFcnVxWf+2fJf97j3uiYSbWDao1iC/O0y2/bJkP3ombsZQNOF+ppRLVX6eKmaaL2+ylRp9TBgi7XZUnySBOpqorklbIoqauGahKpSqNvOx9yc0a3h2pu9Vbe79lXFzX5Xe91ihkJ6jrSNKmrDdt7TjeyCmcc7va9/E9TiUrCMaGtPbUFsETFsza6wFtnHkdjH/8pmOhV7e1BGj51SOTCRPX85c9w4dIKlzbWTL2izOiMZERGwASdQcXjEvgehGGPUA1oRhVRrVmtIMQGxE/voysD9dixsrbF8y++xcVN1eMfUdv5845fqLF6+fX3efm1d9nYrhgsLlMUE7uZ0TToWvZN1Myk80Lo9enNDUhlIGlWc4YuEoPdRgvMQLW1VUkgiNITIU4mVDsjypgIotQpEsRRVyM8Ez730H08cO8Sk8nbXL76PBO9QvI7OGd9iVS9ET7aJGknDmktRTTrmCnGtTfmmifFgKR5Dsx/huOHP8/S4K4brs1eQwVw6swG75+6yngyhysHKDV1NEHMlBLiHGW/JDbTpK8llXPPrHylYmPFtp5ktVh5Yjpn+UEpPAURdEIofv55JUWGBnVFOXg7i0cfQK+/xfj0IuPV19jePEcpmwxLxWskZGEAS08GlDIn0jVT8WvUma4d7bMbFfXO1BtkCHGAhJsrgu83oq5qIuJvXEV/LYbqqu4nufNxxs8D991sNE3NpNomiUlVqanhskuItiU5zIybF9XeuJgrU4XwDxvt91v2XWt87OeCsjRx3RiFXjlH0yQmk8jAFbgi4F3IRIgsdeQ80HYIlnx+H34erRDubF7tRgO4j8G6AR6d1mlZdDoloEi7+okAJYijGDZc3XofPR8YDHvM9eaZ6Kr29syRIsJvPHo7Fy59mr/6/tPUvgfFgIm2zoC11NFMWvOS9Y8LwQ96+EmPug40VSR4y18lUWIzoewNiDHSpITzBUVY4M13zvHiSxc//Mb9Z4xfqLF69c23Wb2+RRMdG5vb+LKgcI4UK1CfJ4WQ1ERni7KkHM4hRWlECXLCUiy31Xoy09oKe03WvtaEGqWhcBHqSJxUpKrJXUwVycyzwtUsLCi//9v3c/K2yPlLr7Jy/Q3c/BZ4tTqfTNNUUifvnzqD0MIG5k22yX9E0BRoJn2G4TYOLzzC4fkHmf8YaupPv3tBn3n+TVbXGraoEEpC4S0/ppaLMsQsM+m0xfozUSHFzlF1KVNwBTQX4Toc3nlEEsEr9fY6MhCcuxFSe29bdXsCRQ2HhnD0o1QwZrTytL6og/IA7sKtbF96la3R+0z0ImW6ztDXzPdK4lZE6CESTEBVGstheRPQ9DlyVRFiciRXIMUiFAeR3s9OLfc/50L/SRk/r6H6ux5NmjCZbANNF8UrZNTDZWhpCksDHXFqdqh+PJjtZmO2zklVu3yVqV6YSPJwfpnxltX1HVg+ymRSs75+nTooZa/A+4bgSyqsNYaVw+R+ZEwZhlNVjCkxpN2/wWKyy1DNGqsbDNWMUbf3suPWlnHk76mMTUlf23xvyk6xteiQEKnqNS5vvcrrpwOlO8BDdw6Y6DVtxjCXGbNHhnbEP317oleunuel9y4xqhucs2cveUuduAyBem0QIDpFSoMCZaeH1ik77q2INYTCEVNN3TRZeLzkg1OXePrpXxzR4hdmrF57b03/+3/8Lxg3ymBuiUkNqomd0RbDYMQIp8GKg51HvCP0B/QX5iA3x7PmpVkZ2X4073jPHN8r6+O1od7Zotqp2pZS1mPJWS8hH0bcdfIgDz54gEH/Gk08RdIruFDT6/epRzKN3pwRKER2Ry+WonI5dzSl3qoGJC2xvHwPBxc/Q4+PzgmtxKjPv3qGC5fX2Bj1WE87MGkYDEvm5no4J/hcaFvXNdDWltk1taI9aKddodGEYp3l/KIrUBfwjcdJg2iDOGM2Li32dh3Lc6crfeb1a6ytb6LjLY4uzvH069f02PICd5zofeSiKcVx0fqy9gbHuPXwp9m+/gajlZcZX3+bVK0S6xED38e37M/2BmUlECEzlJIjJmhSD3EHKPpHoDz8kdfyfxm/uBFTzaQaZwjQykzMqZsap7bM5GZmaD923f7f+fAxa6xmIxtVj3NQDEtSAWiPueESc0OhqZVJtUWKgnMlIVhZCmpaetYLz56p/Y5j9vdZGLGN7vYjluxfZyW7rsMuBQw1CTgEJBVoCrjcM04VoktM0gTpRTRtcWnjbV4/9VOGgyUePPlllgZ33XBx77+r5B/8zqNcXPku713aQYZzCP3OoUWi9fPL6JFpcgu+17fOGE0i1sma23pwIsTY0Gik9B5RZVJHqnHDmbNXOHel0tuOlh+5Vvys4xdmrN49dZa33j3FyuoGYdinGMyRtMYXCk2dpTUTzhXgPVo4Qr9Pf36eibPw1GWmn0hruaZD2gtNfkCyJ25wasN4a4NmVFFqgWpjKtu+oYnbLM0Jj33xHnrFKufOvcDqmilVRG1IdcRJL0888xTVWfGva4tTU8yXzjwim9tWN6Sp4MD87Zw49BAH5u6gkI+mSCuO48fv5N77e1xeT7x/eYXr29voTmMJ0VopCk9ZFtRNTeEht1SbOU47jgCEVOOAsRei81SuBClzyXIDsebEoWXuuvs2FrKxulipvvLaWX789PNsTBxrmyNiqrm4MOTM2jaHl+b44VubevvRee468FF0d4PpdLKq8wceYn75YZrLL7Fz9RXizvtQrIFuom4nM5Ikq7D3kOQhCRo9MKAXDjFc+DTl8qegt/xRl/J/Gb/AkVKkrifGftV83/IzMtUF3H9q3IyufVPDtCcKueHjruOnM5o6BjhEIqqO0c4ExwBwjMc1Rw4fI/g+Fy6epqom9PqeIgwoioaqqYlJMtoD0kmo7Y4A99LLRaQjVswyFm84506pozvzPddkqoABCZWt/PkCLvUh9Q2edBNUJojUtnYWJc1kxPm1l/n/s/dfP5ZsWZon9tvCzI5y7R4eWl+VsrIyq6qr1ZAFDsF3/lV84CMBggCHJAgQM+QAxAx6WqHZXV2VmZWVOq++NyJuKNfajzSx91582GbHj3t4xM2bmdWi6q7AgZ84ysy2me2111rf+r7FjSVW5i5fGK8kSj0dBHn0/LuM/+YLdkYpFS1QJtKbMUErIQkeUYGqZt5JWxnS7hAmDl/kIAGjDS44Su8QqVA69oKhPUa12drc5Wc//cUbz93van8nzuqLzYn8f/+Xv6ZyiiRrT3nixqMh3XYyLavGTJbEjmBrMGkbm/bI65RahEqEWgeo5gUjkthKw5hcXz9KAkYURgWyomQ0GhJKQemE4M+45ZSvuHf7Fv/tX3yfrPspG0//lmH+jN6KItcpRRUZrKPAWg3FpV5BNlGAFqhXljFAqPPb3kDosbL4NmtL36Cj1790rD7ZO5IvNoZ053u8+61r3CzA/cbhXvQZjyfkowIvinanhzWtOh1QpwYUoML02HTNDaJDvTKTSK0jKsT+NQ94z2Knw4O7Kzy8t85KfZftnPT56NkWL/ZO0UkPrwzpXAfT63HsPEc7p+yelmzsLfLzZyLr83Br+UucVlb3aI23xC7eZX7lHuHoQ473follF8MxyJDIVCH1JKFwJATdA3uFrHefdO37sPztN6rXfm1/t+bkUHaHH+FCMb0P4/rxDDjhJbb5y5svi3P2qsP6LQpWcI4fsAE1hBAIXhDxDAYD2i2DBM9xf5er165xbf4hgyPH6WALZRVZaqiMY6I9PkTttCAh1m3qyGc2DUiTLqNBAcZeL+8jLZQQa2hGX0z3/XbpzmnNStXurJZw0SrOc0FFFGaSJEyKPKpca89ovMOLw/e5dnSf7eJXsqLucJFW7d6cVr/eCnJwlPPvfrkbhX5URPQZZdERlx4XjQZQCi2KJHVUdkLFBBXAmjgmps5iOVeiMZGc2is+f/KSn//y74bc9u/EWR2fwr/9N3/L0fGEJGvjlJBXY1qtNPZSBfDeYRKFo2JSBuaWrtJbXafEgjI1q7qLuXBiPrpZbQVtor4YcYVjVCAEjxFPRxyT3X1aeYkKURpAtzLKvERX0E4z/vx73+PerQUOBp8wlg+YXy2Z+FFEw+gEhQOpEB1iQ2toxfqaLkFVeF9E+GYRu8LTTCPOUOUZqb7CYu87tNOHaPVm+povCpGf/PwFT57tsbx8jRs3brCyCv/rf3yHh/daPH68xebWCeNSUxWB05MSlKEzZ0E5EgPWKipfgXMkVpNlLUg1Hkfux1He3kRexDCBzJVcXenwnYfrXKl1aI5E5C9//ZTt04B01zCZpt1OaLe7aG3wpaeUiuNRxenpPjv7fdbmOvzlB0O5fa3L/dUvcVqdut9p+Lno1Yeki/dwwyfkJ5/gxs9Iwj5tOyRLHNp4cumSyyJJ9x5zN/4U1v4EWg9//wvza/u9rJIxjglia/5H7FnUwdlkG9WHuRBRnF0iZ47mzAmc1YhCnITPsT6cZ4qIJYGmZgven22jETwUE5iUx2RZxtFojy9etPmT9/6Yb711h08/+WuKYhfCmMW2ZTweM8j7LKyscTroo7UgXqBmozCYKVQeIMksBlU3P4eIWPY+SswnUZ+q2e/Zmt00TYjUMHciktFGpQYXHCEAql27a42ogqCr+D0lIBZxipQuKmiMSakyYef0Mb98+j+DnvCnN/73l56/P7qu1b/42w159PKYR3sDRKcYY6O+mU3xCHnd0O+qgkQnZN0exekYbSNpdVUVca0efI2I1hFljFARqETzweMTHm+LPLz2h0UF/p04q48+esLOfp+8iDxXohygIy+ccyQ2qVVgwauAshm2ldXAimQacWkxCLNcW1ECQSmDSs5wBlopUqtRzoMrSULAlQXioAgB50s6ScLoZMSdh0vcuTXPSf9TDk8+xsk+SU3/I6Kx2hBCcRYtwRT1Nx20WpxNcBijUBJwztBJ11mdf4+53n066sEbT9SzSuT9z/v86vMtjg/H7J56Nnb2WF9f4Op6h2vX17h7e51nz8f86v1HvNzaZzKZkLUiSrDdboO2BCdYk2DaKThHfzQk1Rk6sxiTEcTj8wk+d9gCEh14+9497iycXUhPt054uXWI1y207dBdSDE2YKzFkKBSFXPpOAIFx+OK3A0ZlAUHwzY/fDyUq2tdHi58idPqva2k2pG59gp+cIdR+xrF8ccwekrlN6E6wlWKsV4lW3qHuavfh5Vvg72D0rf+oBf+1/bVzUtZ1xjr6B4da8ESmLYcztjrIoo3SWq87vWLoIr61cu+hdaa0hXYNInAHS3sHx7w5ItH/NG7/4xvvv2P+fWv/4pOq02eH9Br93DKc3R6QLfbRaqyPhrFlGy20etSBt20jUwjoYDCzOybBvyrezZzDM04vNqPr4h9nQ1ASqYZndDUpUOtT1a3zSgrBD/mJH/O84MPeG/9n146ngDffHCVv/jzb7D9L39CYUwNuLAobSmqkqzbpQwOY2OJQxkhaWWUxhCqElvzNhoMXoiTsD5bbASdsHc45oc/eXRuu8Edira/H63ZH9xZ7Q9E/g//x/8P/eGo1uvS05WF1RoHdQgtNTOFJm1ltLsddJrg6wam+KcesBn0XyPgF0+0TENSozRBHMW4ZHjYx41yOp0eaMEPHe1OF8sc/6u/+DO+/cfLHA/+A8eDnXpfokP0rjiL4CQlXjgGUZ7Y79CwxGd16O9qKL5AaDPXvcuNq9+l13ozqOIgiDzedXz25AVbu/sY1aEc5xweHjIqSvaOegzLLjdvzTG/3OE7f/SQazcX2d094PDgFPElblTgxrER0qQJrVZED9qsQ+lAe41WPTKrKKsxxbhPL9PcvrbE7XtnoIpnJyJ/+ZPfsPnyhKS7hkkM7SSJgAcvYANpmpHYlCr1+CqhHI8ZVxOG+0P2jvZ5udvi1vU1/nazkitLlnud1zstlVxV4g/FJAvMt27B0jeRwTOKk6cUpy/I8wnJwm16a9/ArH8b2ndQ+v7Xjuo/swnnufimPVaXnJnLkW9njmW26fZ1FETn029nr51PG17urHyIC1qtNWXhMSwxGVc8eflj3rp3ixvr30e+0eWDT/4FS9evMtg/oddpcTo6pioVBkOQyE0YRCMSE+wRkQzaJohEja3zciIR9t4k5V9viovEv+dommTmGKfje/b5hsWn+U7DTD+eDNnY/oKP537KxuDncnPuB6+cnXurVr1/KPL+54/49eM+nXQuktwajxFqMFfsR8UHtLW0e12Kfko+zjEmzr1hZiGvwtl1YFAcn5zy4x/9DQe5yGpNsvv7Oir4O3BWH336gqfPN3ABkqyNbw5MQmzGUxZCTfUfAmIsabtF0mmhjI6ii43WUX1SVeO1a0cWgmBUDD8RH5kpUJRlQTEc4hzgQahQIpgkMBoesbrQ5eFbKyxdGfH8w18zKQ6wLUXlY0ExiEcTiRpjNFXLW2tXI3TiDeQqUMpibX3iKksrvcLS3Dssz72HYeGNY9SfwMutIw5PJthsjnZ3HqUMI6UoxbBzMGHv6BHdjxU3ri/z1ls3+P737jA8vcXOzgGfffIFh8en5HmgN79EYlLKsqSoIE1TjEmY5CUa6LQzyCskn7Cw2Obh/WXmam29AyfyyaenbO2McFXCXNomaaUxqgyCiEP5uHrWRmGVibBXY9BFwhhhMPEMD4ecTCo2Docs9BJ+ujeRKwst7maXO62GuglAqj1RC2/RWtiidbJFmg/JVq+j565CehX86yXWv7b/dNY4q/OTc1NfivWbaHrqqN4UWb22YXbm/6/SNb0BkDE1TVk6ksRGxnUHraRFlkHh9vjo85+w+K1vcvXKWwT5Zzza+BGrizd5sf8p166ss7G9Rae9WIc1zUJbIxLr2FobtDKUIeBcw3hRL5zx57Iwb2LruKjTNUsxdb6BuEkdhqlrjo3LTZ3OoU2CtTFVOZwc8ctP/yOZ6VHISzFVF3uhfvWdFaX+h59syvPNH1MmGXv5EK887XbGpBxDmkYKqRCjpqzdwmQtvO7jRSI7kD9/nmblWsqy5Mmzp+zsV19yrr6a/cGd1c9+9hu+eLFJ4QI2S2hStsFHgT3lYzgbROKJtoas00anCU55vI+8frN2RmAbnVXT/IeKKlhGCRICIZ9QDMckKsWJYTzuYxNFN+1SjAZ861vf4PrtjP3+jzjo/xJlTtDicGWJaauY0lOx2deHpI6uAqgCVCR+RCKs2liL1oGqdEjVY3HuPqsL36at79J+A2/dbinyZFv44sUhgzzQ6s2DtmiT0OrNUXnBJ5a8KBgdF0yKnHw84e6tdW7fWuJPvneF+Xabzc1tNncOKaoSlw8og0J0hkhGq2XjWFWByo1JcSwud3n77hL3b69OQRVb+57Hz/coqpTewhJZ2qGVpUAVI9J6hVdVBaIqpEl1GIVuZWRmCZI2ZZFzVJSc7A4w+8LmwYh3797g077Iu/Nfhhy8UiMH94T5d2iLg6wFOj3n1L62/7wmDcAphOnz5h810KJheAivcT6/vV1Ez0Xz0zTahajkwlUSF1qKonBY04kOVgVabcXTZx9zY/4T7lz7Y75x+5+zc7DP2H/ElaWrHA62me/2cJFjO25F1fuvIx2YMoaAxfsK7yA0CuFTGRv/SmR1Mf3X2EW4+1lacXb+a5zY7PdlBjYfF9NKRZHSoCbsjj7nyc4a7958l7XW25eO8J+8d51ff/M2P/xoC600Dl3zJDo0sX6lELyCJLEk7QxjLb7KIydgc6YuBoASgdv7+4f86pd/2J6rP7izevp8m+3dIwqXRR43UaRJRhnKiM8HxPnIA6chzdpkvQ5YQ+Edvhb3O0etVCfgYrQFWunYUaQ0xlgSFZB8QjWZUOUF1bikm2QoW0YnEyrabeEf/dlDrt/SPN/9GUFv08pAdMBVFbhGjK25+RRIglAzrKuqHq6Asao+sYGq1GSssDz/Fsvz79D+kgbg4QS+eHnIzl5sltatjElRkGSapNUmlI7MWJKWQbkWrprw7PkOezsH7O9c497d66yuzHHt6hzvjeHR0w0eP91icDpBm5iWGA4GdNsdTFlRVQNWVhK++eAW7z1c4aaNSpWPB4W8/9EmT7d2cczRbs1FyXpRdYqT2O8mQpAw5V1Em5rg12AyQ2YzVNZG5QVFUVA5z8bumKLY4eQk5999MpJbKx3WFmD5NZEWgMpelez+2v7Ls1eafBuKpdd99hKbjc4usjfE71weWTH93IXtXPh9rWNU5Z2i004pJgVlUdBZ6JGHgmdbv+H2jQcMwgLf+/b/hl98eILVwvZwm3a7w7CoddSmzf+x5t40/Xrv8U5wXqYli3ifvBotXvzbHOuU4EApzjHHy1QrZ+Z7Z4CTeHz6rC8ruIjyJYokYhyqm/Pi6BM+ffG3dB5cnuW5v6DUJcSCywABAABJREFUXz4q5DePvmAUOohoiiInTVPcdLsaUQGvFGknztPjkxwvEaFoRDEVZuQswgI47Y/5m5/8/NJt/6725maGr2h//dMt2d4+xgWNSbMa2h1PSuOBDSqy/CpQJiHrdci6HcQoKnFnSKIZOyeDNhM6R8VaFcUvywI/GeOLHHFCkmSR2V0C49Ep168tcOOW4eDoF5wOHpF0J5i0QlTskYgXIHgX61JnN05zoTT9+lF23YeS4BUts8Ji523W5r/NnL71xvHZcyKbeyUbGweUlcYkbbSyU+ZmpRStVooyOdZUGCukSQubLJBPUh4/2ucv//LX/OynT9jbq5hfgve+cZM//u67fPOd21xZzkjCmGrcJ4xPMdUJC+mEe2sZb91c4sFiWwHsB5HHT3d48mKLfulwiSZYTRkUZa2mG1V1z5BYSglag9IBbVSUWNAKbS1pq0Onu0BvbolOb4n5hWsMx5qPH+/xw/ef8cOPt/nV84onJ195if21/Rdj5yfQczWWS973SA23jo+aDx1P1KZq3hcdGWBERfXwwKsptOndV7O2NNsOdXJMgjr3CKJwXkiSBOdKQhhirKfIQSeWo9GHPNv7CYPBgE5yne9+439HOVzm+tLbGN+OUUrtM5QOYAJoj7IBbRUu+CiuOk35mSin4RUqaF4/rSpmPf00shI93feLY3x+fONj1rk392ZDfxV0CUnBabXJr5/8FY933mfkdy697775IOXPv3eflXZGS1l85UnT1vT3tdYEo3BKSLptWvM9xOqZhGSkIdCYiE2Yoh8NLgiPHj/nN08Gf7B7/g8aWf3Nz37F05fbZO15gmnX1P0FqbF452I0RZ3Wi5wdmCwjbbWZaEXlA6nW54A08YQ0yJgaKlmnI3SdmNLBQzlBihKpKpKkjas8rpiQ2cDifI9/9k++xYOHCV9sfEB/9JJWb0JZaZzUBd+gAVufqDPHdLZua/i6HCFM8KUi1V3a6TqLvXeYaz9EfwlJ6mACm7uHHJ4OsUkHlaY4CWStqM9TTAra7QwjgrUabRMqCejEgMkQ55lUOY+f77NzfMK156vcvnOVO7fmuXNrnp2dCdvbOxwejtAh0MFze22NP3r7Jm/f6E73bTKGl5sH7PcLVKsLrQxJIlBEtMHYrIllI6N9fWN4X+JciPIfdV1PK0NiUtBRrkG5gJ8UWC0UTnGU5xw9fcHW8RHj8gHPxyJ3ZgAYEvbEK4NVX6f8/muwWfWDy+xiSg5eX5M6S4O9uYZ18bvTaOXsxXOfieTPiqyVMBickhjLXG+Z4UmJEmGQH/HJ479mtfvHrCzcZDF7wDt3/hs+/yJnpRcYHT8h6Lw+4IYPFECjdMD7akZjq2GxafCQb66rzYIi3qgoLLre9lk9cLYNoAG6aB1LEmcilEJR9rG2x8vjz3m6/xG3r/6jS/dlTSv1w5cj+ejpjxjlUNRznFVRoFaZSDQelCNppaSdNmJiCrSBnDQq3o1yexBFFQRrWxyfTPj88cvXjsVXtT+os/ri6TanpwVeujiJ6bosi6qeWRabgYOK2i9lELI0Je3Mxb4prbFZFvVktJlGYlBPmCry2wUVVWittbS0phoNSAicHB5SDod0rMVPHDZNMSHDVSM6i/DOO2uoZAPMFq0aDOdVFI+Lp9hASKKIo4mvCBXU8uwKG1MDSpGkUCmDG2Uk6VWurnyPjr39xrE5EC/Pdwo2NrfrPjKN8z5ekN6hVaCVGfCOTFuUA1ERQiq2JtWVFCtdJsMRhycF/dM9drYPeeutG9y8tkivXfH979wksQltA+0AcxauLJ5Pvz16tMH23ili2oht4bQlJJoyTEi0RrxgdaSU8iKxj4u4vsgSTQhROVRQEATlA0ppNBptFFlP4b0hVSmFg3EuHORj3n/ylIODNr98NpQ/vttTAEpfUU6Ovo64/gu3ODGZmdV8nZ6fSdtN08XT6OgiCpD69frzPtaXVC2c2kjXj8fjc5O51B6wuf9CXbPRmLPtzjhAYwxBBYpiRJpalFhGozHaajSeIBN80ufT53/FjfWHdLjNuzf/t1TFkMebf8lc54TD0SZKexJrKMs8/m6aEVRF4SbxHjYJAD4IKAtSRSCGifWkmrXpldoUENtCbIr3ntKVVN7FYzIarUwUlvShpnWydepU6gxHE2FFB+Vcc38qQnBYY5hM+qjU8PHmL1nsfOu153VtTvHP/ugd/od//QssKalJ8cGR2ugkfQiIikFBSDRpu0VZFCgJWG1RAr4qIk7axuyQ0hbnYG//hL/5mz8cm8UfLA34i0+HsrN7hDIt0AlaN1xbql4hUDOoe7zWiDGYTo+k3SFoU9efzKs9GE1UpUwkrKXJjQaUeIxWFKMhVB7lS5SPFEXOV4gI3XbCd757l+Ulx8uNHzGcfBGRfdNehjCzGrT165rIfVbzdKHr1+PN4VyJd0QE4Pxb9Fr3yNSb2RWG44pPP/2Co/4wpj50TGPSMKOL1CwcYL3GBI0Szvi6tOCN4KzC9Lq05pbJunMMxhUff/QpP//pLzg52OfmesLtVfjWslIPVpW66KgAxkXJYFQwnjiMadPtzWNbWazfSYkjUAbBBUHQWJtibUyNiHcYFZntrRKs9qTGk2hPqgNWe4xR2JYm7SS0eyntXhudZpyMKp5tnfCjX37Kjz/Zns5i9r8Qotav7bewqYzFb4PMu9waDagmQ3JRbLHdbp9TCZ7VjWrYIi4FJgBoRVBN4rDe5ZrGXXRB0BOCLsmrE17svc/m8cfMqRXVVevqrZt/yrXlb9BSS3SyebSk5OOCqixJUktiNGWZXziaxgM3KMgIuJjlK73YTzX7f+/9uYbj2bF4hY0dpguG2TrXWSuBR0kEm1mrmaick2qfnf7nbAx/fenJ6hn48+/e5pt31+laTVWUBOcRX/8+1KwWFpO1aM11EWNrYcvXM9PHtG7C7l6fT574P8hi9A8WWb3/4adsbh5SlnEFopQBcbWnOSsyemIO1KQtOnPztLpzlCpKhBitoSGFhGk/FZhzmYeYF42r+gTN8WmfkOdo71EhRkLOBTQlrZ7m+z+4x/q1wKcvPiAkh/WPJIjyUT+JECP9mm1dpAFVlLWzjQlshaCUJzgBadNr3WZ5/h1a9vqXjs/RacmzjV3EpHUU0qQ2pYbLxxWqloAOTYOhidlJANPQ+nuS1OKLghAcmMBoXFAMT+mkGSf3AteuvPnayPOcqvIEZVCkuEpwozHOj1G6A8FMV1SaCCbROqY7YvpVoaaoJ6KjVRB5zSwVGqUSjAnYxJJag0vaTI4rRqdDjndP6LZ6bE5EbrT/sF3uX9vfrb0ZPq6n4KQ3ObLYQCvnIqLZCdraFOpIbravK9TpONM05XL+der7I/5QQHxSA7V07BvUE4IKKBJOhgMsmzx58TNeTD6W2+1vqIXsDg9u/hmH5RZ+UHA02aZyFVmiSUxM1buyqLMcEOeKpq4t0zJHPMaIELysAVprO3U6s3RNDdgiAjqEiyKQjfMK4QyI0gBeZHoPggkabS3DKjAoT3hx8AGPNm8yLnakc0G14MZcVPb9v/3bTXmy9z556bDa4iQCzZSK804wCpOltOd69O0hUU81oJWeLgtEZEq4a0xGKB3Pnm/z0Sd/GFHGP0hktTsS+fSzx/SHJUiCUrYuvMX+J02tTKkFMQqHQrVaZHPz2FYbQeNRNfQ1hvfTVcXMdpqEg8ysqhDPaHBKKAu0cyhfRSkQVSGhYn4x4ebNBNGbwBGKIZFp0CDTomVtU6La+nzWzcAQ+6oUFkKGZo7MrrE095DF3n3a+s21qpcjkecvjxjkDttq13yIsSu90ViK/WScHVfTryIWpRKmQAcdEF3hZESgpNVtMb+0jE3n2Nud8P4HXyD5xdXfectaHTpZi7LI6R8dcXJwQDEaYonN1bPpFhd8vfqr0xfGwMyqTtUruiC1inFweA8uKLyPN6PVmm6rS6+7SJYt0motMS40xatN/l/bf8E22xc0ravEd8597nWO6mIkcPG9JsqoqgqtYwkhTVOAqdMyxkybcWf5AaeRVlAxwggKJYaYDQmIVDGrI4KYlFGZ0+oZXux+zKMXP2Es+2LVqrq2+B4Pb36PpfZdjF+gbZbotlbQIaWYNMwW9T5HbPMrx/m6iKN5zVo7HcfmWC6Pos6jJGfHP/5mMw82G6mzMaJJdEypYhy7p0/57OXP2Bk8u/S8ALz3YJ2rSxld7cmMxmpdO1WFF4WTgFiNbWckrQyUqkEmdaN2DaIRpaPqtzagEnZ3jvj0s6ev3e5XsT+Is9raPObRo6cUpafVnkfV7jUGxWHqqDAajMYbRdZp1yhAixdTpxUUWs4XHi8No3XM3Xpfkec55WgcnZWPkYlRDufHpAl88xu3mFvos7X7S4KcUpUTztYCaoo+okkdKCGyVmjQPqKAlIppQEkhdAnVIp30LisL7zFnbnzp+Dx7OeazJ3sE1SKvPF5FETOpC3OqRtOYhutMB7wOsa9DaZAEG1JMUBgJ4HOSxJO2BGUCGEtFm+ORZXNriHdvDphv377D7VvXWGgbqskR45N9qsEAisD4eBRTAeKmnfHQkIQqZJruiBell/gIRISnKI3RGVa1UF7ji0CVB3wF4jUaS6JbVJWnquDwYlMOsDUJcvi75pi+tr8TS9SyMsZg7dm1dZnTuWjnIov62nk11dXoQlE38rqpRpXWmiRLsWmCVhbvzpg0AnKmygA02lJ6mqpMokw8VU3vFgU/K6+xrQ5OAv3JARv7P2XIY0o5lEzdUXeufI/ba99hqXsPK0to3wGfEkJUBY7psUBQgaAj2Wz8Gx+z49I41XjMEc3Y1ObOQBpmulBvxrXBQEaGe7kwB56fti++J14QD1YMWWopOObZ4Sc8O/6AU3kkIgevnLSra4Y/evsmXVOQiD9bOOvoiJxEDKBNElrdDiaxdVQL1MKVsQMPvIRYz8YyGlc8e77N1uHvfz//YSKrvQM2NncZ5w7v61VAkBlZjygQKEYIWmHThM78AjZt4bygjImTso/MFKoOP3UT9tZ1qwYGS/O694z6p3jn8JVDh8iY7nzOJO+zuNzm+z94h878iJPTz1HkGKPqaKmOXqYd942mUqhTmJHZXOlGhkMhQSO+RZV3aSe3mevcRvNmhoWDUmRrZ8jhaYlpzVP4xhGFCL1tCtJyBktFq9qh1StHCSgcVgQrCuOEVCVosXinqIIh2JRc4HhUMBm9fn/2nMjykuJb732DH3z/Pd69t05blfT39jjdPuFw55hhf8hkMo7kwLqRQzCRgNgJojWiLOiEoG3MYWtDqFmbjTisClgTnV0wEUocvIAPMYoLjgRY0XWD8iiXXzw+ln/7yy35n//q5/zNx5t82hc5uMSZfW3/eayRkD/vpF5t4PW8Pnq6GClc1hirlKKqKiaTCVUVWcbb7TbWWmZ7tC7fhooOKjQoupnaTrD4kFJUmk5vmYPTY5yMGFXP2dj5FZoIVOhylXs3f8C9a9+hpVaocoMOGZYslgDCq7WiqHknU6HW2cesc24WgCGEqZxIsyBsjn0W/Tf7vdlaX+P4zqbwJkNTt+GUVYwPlEdlwonb4/HBr9iffAG8Krja68Cf/tEDVjqgpURcQHycCxtGedEKnaR053qYNKlTfnH/fOOcFQR0HWEZFAlbW3s8frT/2uvqt7U/SM3q6dOnjIZjjO5QFg6dNMwPZ5+JfRbxYVstOgtzqCSlCAGTWgRN5R02SSMh7YXoqmk+m704q6qif3oaJUScizliEbyrMDZw9doya+sdJsVLlDlGKU+WJFTi6jRz7JEIyqNFauCFBpKYlqtTCI2Jsihpk9l1Fnv3aZl1rHpzM+vmNuwdjtDJHJgWyoJTLkaeKqYtVFwe1mKTINiY6lQBLRXmbJkDHjTtum6mCVIz0qcKaZeotkVU9sp+bIycHJ8IT595Ch9XQPdurHB1fY75XsLz54eURZtxFRgNBlhnCb6inbWmaQt0U79riDyjFEmoV7deBawIOkTofLAVOlEILYLS+LpvpZcpbqz2uL+k6r6vUn7yy8/Y2BEOR4r9sef5yT5Pn5fcu7L8d8Lg/LV9dTMmtic0Nq0dA03dZvrezPcaOR9RMxIYdZq5+UTTmsJM6stLQBxQqmkvYqvVmkYqTRqqURyPe6EhZLFmRYmi1peSpL6vDEKCC1HOvZARebXDp1/8hHsr/5jcHYoCriQPeHh7RH9wxPaxo3T7eE90gueW+OHsr2rgf9Dw+zX716TwmkdRFFMdLKX0q45XCRJiilBri9aRgi6iDM9AazQsInHopudECaSi8EWFTltMbMGT/V9zd+8e69deRS5rA2/d0bx1Z5WND48RqdmHIscUqkZ6CtDpdBgkydTlSZ0GlEgGW7+oCR5skrKzu8f773942SX1lez3dlafvjiS/9P/+X+kqBTzC0vklSXUuVwtNRNFTQQpWuOUQmcZSaeLJIaqcrSMwRCFzIwxBH9WvFd1v0FQMRoBIhtQ0JhCcIOctE4fhCTKCxjR9OY6XLliKdxztvd/g0r7lFWBKx0RcRpQNbgBMTGak8hUoZSdFhfjTniow3EJlrX5t1ide4cWK28cm8NS5Ec/P+Dg5BR0ynhSIAaUVzENKDJznPVf1RRrY0EnOoIGyn/Wp2Ywkd6/clRFQVXkdDqamzdXSdKzfdicFLJ71OeXnz3j2fMBh4cjOp0erXbCnXurPHj7CgtLb7O+XrCzmbO9f8TOyXNKH5CiwLc6tDs90nYLq5NIJDxF/MRxbFbXkQvao02FUNTnMUFpjXOCLyu8G3N1vcudW8vTfTw6GvPk+QG7kxYTejg7h1Mt9oeeo8PnfPFE86//Zke+8WCd21e+dlr/uczoFGMyZudUYIqCk7ov8bwTe9Vm614XwQNKKaqyilGcTfDeM5lMMMbQbnXp9Xo1QKjCS5gi6Zqoo+kDk6BQU6RvnblQcWWVGks+GrO4uMjktM/p+Jhy+Bkvjt7n7fUlWuqOAjiVx3L32hGVn7BxeEKeF6hWiM5XFNA4bgFVTtttRJ05z4vH10RRTX2uAVZUoanJqbq1K/Z7nqtfNVsTidtXgWkLSRROAQGb1CS8XlGWDpMFMI69/lNeHnzCg+53Xzkny/Vk9//6D0/kJx/ukmBwKgNj0eIQH2KztVJR8cEmEUaPQ2OnYrgxpdnMDxqtW5yc9nnybJODgcjq3O9+//7ezuroWPHBh5uULkP8BN3q4pQH52kHoITUZDhjGVcVZqFDurSA66bQqgXLELQIVkWdmNDUiXyUqBYd+5AqXUEQMpPQFsP+7gnpMGA9aGORpGLiKlLdheqIf/7f3GHtxi4fPn6f7twu2hpK70nEgA+gq5jfDpHZ1egScBhdUPoS8R5lhKAqjLWo4ClHsLT+Lgvtd7Hq6hsH/mAAT18+Iy8mtBZWKXOHUQlVCBGkoAK6znEHH7Bak2iFDxMUgSAGT4aELEZ1GjQlZRjQyhKCt1jixa0Rbl7p8b1vXOf2jCjiF1sj/v2PP2T/pEJnCwzHAT05xfuCZ0f7PN075c6tW6zfbHH9dsZkuMCPfjxgOB5zcjxikgtSaYo80JkDUYGsY7CJIp+MaLczrE5wpafVapPnBS6tIHhUkChnIBYpNUYqsI7ugub77yxM93Fna8xRXyhbGUm3Sy/LkKqkKiuKoJm4isHmPptlxf/y4YncvLbAlSW4pr92XP8pTdMhtXMkNqNwDttK4zXqPYm1BF8Qs9hnEhoNUC8uzDTN+kZFCNv0PQlx0RNqyQkvAalqcBOxpj2ZTJhMJnS73Sn4wjlHWbpaH0oQFCIFGI3BRo6LGqWmVdR/865Ea4VUDmsTSjEom/Pz5/+a1fV1cjmUllpRC+qh2hk9kjJMOB5vMVab5HKKTjp4l+CKDK0tSeIJLuBkQpppgk6oquh8krpHylcOqw2tNMNXcfJvzOPjAl9RQ74ViTKIVvgQG5x1YgkBiqJA6doRNqjLKXsEiHJUIQJBPAnKZhRFQaIEk1k++uzn3F/6PqW8kFTdfuX+eevGMtd6scb8ZOJITBdVjjF4KudptRcoxo7WwhLFwRbGuZovUtFq9RhNJlgV8GUBYtAmY1IZPvlii8P+73v9/Z72YuOE4SROrFXwOClAR8r5CARXKLFRqlxZRKfYTgdSS9AKjEbrs1XVFF1CjZBT9Ymor3KlPRIcLp8QJhMoq4gClIATj5NAqErWltuY9JCD0w9QaZ8iTNCJQlszLZCq6YRqUMHElQwRRWi1QksSoy4leHGApdtZpZNdpfslelV7TuTFix3G4zFKGYq8wrsa3acTtLXxIjSCsUJiIlWLK+tGYRX/qulpsiA1fD1ReCkR5anKIdXohJW5hG/cWef60lma5pMDL4+fHjCcZFR6jlJ1aS2to7uLSNrhcFTw8aOn/M1Pf8GvP9yiP4SFFfiLv/gOf/qDP+LunWu0M0Ux7jM8OWTcP6UcTyjHJVSKVtqGYKiKeMFWeY73HgcEm6BtG2vaBAejwZDJ+ASbVty6s3o2Tn0vRyclZWmxWZveYo+VpTmWlueYX1lgbmUJOz9PH8Xjg1N++WSTn36yya8+H/LRiche9XVN6z+VWZuRpb2ZtFtTQzlPFXTRvipW5rL+pNnaT1FEHkrv/TQ12G63I4OK5gzAUAN+MHpayymLHKQCqRDvCR48ijzkHOQveHr4PlBM9+Vq9y11dfEtbqy/S8suIkFHlKsQH0EhgbodJUZuoWYrVyqi6OLYxTRmA1dvjsVzxqfuZ2p2TdR5EeR02VidWV3DqiPKWD+Kr4oEkApHzl7/JbvVxqVjv9pr80//5NsklCQm1g6Nhiy1pGlKFQJiUmynS5qmsRRATaPnfATV1RGktSmVh6IKHB0PefZy5ytdBxft94qsdo5F/i//93/HeJSjbQIXip/UOy4qgsXRCpuldHs9rI11mSYM1pEZsb7AkulBN/nt6LhMLV0PZTGkrAaImqCaXilAaU8rhW9/5x69uYrjwQZJYiidr6lCCtAVyjg8wlkzHyABg8eHqJwZGSKj8mhVaBJ6LM/dYXn+zXpVAMODPZ4++oDTwxGqexNRPWyaMPYlwUqdbowIxlRSUt3CBEvlFT4RQuRBxiAYKhAfJepFUFgqF51VUY5RfsyN1VXevrXC3ZrK6CCI/PTX2zx7vo3zCWnSIRjDfG+O8URoJwrIqCYjDo/6jIafs7t3zPxcj+/+0R2u3Gkxf+UbHB6OePz4Kc+fbTI4GmNNB+ktIBNFp9fD48EKWUshypO1MgqnIzO1GIwkOIFJMQQGzPUSbty8Mh2nlzuH7O4dUvlAL23TbbXJbFxhZsbg04Q0tQyHMB6OOBpPOD4+Zn+/y9HRMrfWl/n0UGShC9daX0daf5dmdRo14uq0b0ydx/ckakac1U1qu+z5bO152qYxU+U6t2i9UMsREaqqqtF0kCQaa82UUEB5jasaerBYEzJWv0Ia29SJUBFx50Lg9PSQR198zMO57XPHfWP1bXK/x8Hx5wwnp5TViKBKMAkowVNFIIPSuCqAMTFyU3UTs9LYNIlz3gVnRR19NhZCwChNVUuhW2un32uc1UXX37DdT8epJjbQSqK6sIrkv/E3PFvbz3m59IShbEpP3Th3z9y73lI/eynyL3/2OVlQOF/FdTIaZTRlGWhpTafXo+z2mAyHEVhSLwY0sZwSCyxRRTlNU/I859GjR/w+9ns5q9MBPHr0mDzP0aYLU1GwgAqx7NcgRioBZQxpK6PT6UW5dJlxRDR558g3FYutNT+WMmil0Aq0VFgdGE36VL6PqAlBCYqGGyuQtR3f+OY1ktZT3OgQawUjMTSPK4+I3olwdDOti0FMSSoJWGUi4CFoVPCI0xi7wtL8PebStS8dm8xAy1qMhvFoTFkm2Pml2C9imxtRE6RCBY9VDkUCOobvgkETMBJQUsT8rxi8CohYEKGsCozxrK/3uHtzgdXu2fZf7Dqebe4zyB2mvYBNu/i6ztVut/EuQiy1gKuEsgrs7B6zsbPLXv+Q+w9u8fDuGu98o8v61W+xvrLA3vYBx4djTFUyGpexbmgtSTf2oI0nY3SagMrw3lKVxHEMFY4J853AtWvz9CKfLodB5Ec/fsTxaEKStem02lhRVJNxPB+i0caStVK0nifLYgrleH+f/f6Y0aRg9+CIlcV5riwv8P6ByJWVWElYUV87rj+0GRJaaRuFZar5BkRaHoUKYVo7gssc1fk6zmUR1xk35+XOrXk9TrwR3t5M6MaYKC+kA1HULrxSGzLGUJUOW9MJRefqY4qtFLb2nvNs5wMG8kzm1F0F0NO31M7wl/Lg6p9wOjxmd/IY9ARtKpQWXIg0S5aoeyUhavdN0Y1akSQJRseUqXMOL+FMhmTGAnVnWD2WDbhplunidY3ZUwKF4GPOEwHctPYVgqCCY2f/BS+3H/Pg2qu1K4Clebhz/Qo7W0Ocj6B07+MCUmmFF+i2O7S6PYZKR83oeh+1bhxXmAYvnXabosr55OPPeXEU5Pay/p3uzd/LWR0cHLG9tUtVuVjMrFcNkqgZqpQ48D6AthmdXpekleHrwbOqbnblDMKJSmPBztarD2VqEpMUiyL4AYPhIWU1wDLBi64doicxHmuHLC2XjCZfIJxQVTnWZvgKspatgRqxjykiHhroOhHd1khIB0PwIToIn5KlV1nsPiD9EnFFgBtr6+qXn+1La+GEz54f8XzvgFJVeGPQRoNVGFLQUXvKSYTUO6Vw1AAPqTD4OrIi9qOhCSpFicYVOcsdw7fevcHD28ss12wQL3ORv/7FS7b2B5i0i0pb6CQjrQvWqU2oQoWSBJMa1FwSUxuVUJaG7f0RR/3HfPF0k29/4wFv3Z3jB9+/xfDkFnvb+zx+tMHO7imj4wKdtujIHKI6lKWilWSIGFAZWieUrmQ8PKIKIxaXWty6vUQK7IvIyQC2j8YMndCZn6fVahFFgsp4r6m6J4c4EXU6nYisMpbRaMBoNGJ0NGH3ZMzG4ZCdQcXNk3nuXeuw70TW7NcO6w9pCkViW1jTQvmk1olqQEivZlXOnr+O4FW/8nmoOQNVvcU6uzIL2AhTJxmjp8o7rLckSYxemnqW90msaVVF3VRcg5aEeI3iUVohwREkYFTCuDjis82/5fath5yGDVnQN2uHdZ33bv9zjvtH9F/2Kf0mQRcYXeFjf3/k1WzqSTW0PEK/LcYkUINHfA2WUoo6wotj20QojbNuUoCRycOdRVYzbQOvjrmKqEdqAIaK40SI2S2lKob5IfvHzzgZbjGRHWlfqL2nGr73rbf5eO8XjH1VowAtXhmUib1u2ISsO4dOEnwlGC0o8VgV+Vt1jRwW5wlBGA7HfPHFM/b3ji67tH4r+72c1ebWHv3hCGUSFBqtGmLLOnxXEEQTNHgNOsvozi2gjaWoBdKMPtuFiOTRMxFVLMqCik2zotAIUjqKyZggJSohMqyIQoWENCu5fTcj6xwzmrxAJ2OCd5gkoZQYWYlIZGUNCYhFxCM61GmMWB9zweND3VOCkOg55tt3mM9uob8Erv5it5BCNB7LH19d5eo9+PVHT3ixfUg/H+OGCq8UJol5YKUtHk1QnoAlSO20JeaaPR5dM8GrkFBWFUFKtJSsLc9z/+4Kd5eT6T5tbDsev9zneOzoLSziRaFUVBHOi0lEDFlLajOUUozzgqry6EThbIsgUJRjXrw4YDwYs7exwp2bV7h/c4lvf2eN5aVFnj3fYHPrkNPhkNPTMTbvYFttTLtLURWYNCG1GWVeMBqc0ElKrq0ucWN1DgOMSni2OWD7aMxEDN1OBwi4qsCqgNJxn734SBSqY6O2KEV7bh6dZqStHlUxoZiM2R+WDJ7vsrO3x/5ei/vrS+wORdZ7XzusP5RpUtKkR5q20VVC8MQopmYm9xIF+y5GUBefv/E16pLBLBr3gjW1qub9EAJVFZnQXeXRiUyjLWstxmqqqsK5cpoKEwLeOYxJ4jZDIEkSKj/g5dFHbBx/xK3u4nSbvc5VJbIn79zaYW+4RXGcM/Db6CTW65VSKBNRyr5pHK5rTk0NrYmqRKK8zhRcUm9jtj7XNGA3qctZnsQ3jV9EaSQRsKIcilB7/kYwMSB6wulom53DZ6wt3XvlF1opvHd/gcUfwW5/gEoyQpLgA1QhZp0qgaTTxbR7VG5QbzmglaGqKmzaQqsEj5BXE4KrGI4KTvvjS8/pb2O/s7PaG4j8d//dv2E8KrA2xWuLTRSFrzBKTVU+GmpAMZqkldGe60WQQ1kR60E6UvOJoHScjFQd4oSaakzqhlwdLFagLCuqyTiie9IEigglNWha7ZLv/ckNkmwPX+yjbI5RID5gFLgqB6ui9ozoegXiCHU/hg6glaob9lLAEipHmi2x1L1LV72ZB3DjWORvP3jB/smQ+fl57ty/yeoa/Nn3H7D2dI69o2O29g44HRbkwxzXaiMZOFRMd1qLSMCIIWBwGKyyBCqo89ah9CgpWV3qcP/2GqvLZ1j1nT2Rf/HrJ+ydjvE6Q9mMEGLHGMqjlI83q3eUocKjKJ3DJC16cz3mtOH4eMBcd5E861HlQz75dJutF/sM3rvL7dtXuXo9YenKPW4crLK1fcCLl/scnh6DLznORyRJQqmH2HYglBOM5Fxd7nD3+iLzWJaVUh/tiXz2ZIfTCaheC1JL5XKMipRN02bEC9DdECITdZK1SdMW3ncpioJ8PCHPc45GY4anewxO+wwGgQ9eelme19xY+Npp/b5myGhlcyS2iybBSbwmm7oyMGWimYp1Uk+qs7UsuZj8etUuc1RN2nH2upj9v3cBT4kvK6y1JElsYtZak6aRjDnWq4rIluGr2iHEmpvSgbIacVK84OPnf8vSw29f2Kcr6nj8kXzr3j5DN2DcPwEp68yQqmtDsS+qAUtYa1HWEBRUwVN6N2XdEImCjdNm4KnzhTRNSJIs1sFcTHcKZ6jKWfOzVSwBTUJM//maCT9KfWiSGAvYitPJLs93PuHO9fdeGecrmVKfnYrcvbrAi/09SonACi9xjlJ1Ta3T6ZH2epTjSSQDqNuVmmvAh9iKJEFhTcKkcDx5ejmw47ex39lZHZ3kPHu5xXBcIqYFur5onI99SsR6lVGKgCJog7YpaatN0BZ0QImeXmihqdTW+JWmryoSJsfIzSKYoPB5SZkXpCGmCINoQs2sbKzj3sMuTn1O5Y+hGtJOO/hQkSQW511swpXYHIhA0AXgISh8zY0XfIXWEj/nUzKzRDe9RqJuvXHSO+xX/OrzF2wfDuh22jzdOuDtB3d56+Ei33znCu/IFX7zfpsXW9vsHBxRVZFhrAwQdIZNFZnN6sg9XhxIlCiJpLeBRAJWBW5eWeDerVVuJNl0n7aPxnzxcpe8UmTtDBITGdxNiMS3ysXFhIpRZGJjGjRoRVHl5JVjrteOi2WXIdYiVYeyGvHZF3s8eb7BjRtLfPfb73DnzhzXb86xsrLEk8cvGI8CR0dHhBLGZcBmJcrAYuK5d3WVW6tLLCul9p3I05fC9u6QYNp05xYwrZTgJ5Hd3dfoLQmEUDc5Thcx9Yq1jr50raPVbrcpJjmuSPFjx24/53jwgtX5Pg9v3/yaNPcPYJlaVc9HfymJbqNIkZqo+vyo6ljUr+2rIgHhDA04azFSiX+TJJly6sEZu0Mz8QPTSKqqKtIsqaU24lyTpillWdYL5DhHNQKGTnKCKvli62P++M7JK/s2l13lrVt/ypOdx+yePsfLKUo7FI5QZ2QSmyDhbJF1GQ8gMHU+syk8LREVOMt0caZV9ZoxVTOvS90D1gBI8KimjxRQWgi6YlQes3v0nNPJPgPZljl17dyA2wBvXV/lw8dPOfRC7qMEiE0yVBkXlKQppt2JqG45c8BpmhKAsixJMxulQ0LCaX/M+7/55KteDmf79Lt+MZ84trb3UDrBJilFUBSTCTrR0zDdVx5tLYXzSJYwt7xIGTzBVShrUD6Gxqru8I4URBpDHAxHRZKlFIXHeKGVdHDjESd7RyRYLC28M4ClLHLSTHH9+jyt3oDcvcRaF1GKEqnzfcixVhGwQBLrHxqUdjUqKEUB3k9I0pQyLzGqh5IWbbPG8vyXs6t/9sUzTiYFpc0oR45RfszOzpAPPmzz9v27PHxrhW998za376zzcnubJy+32TkYIKUBbXBVYH4hJS9GeBKSzEYHWkuJ+LKkpTRXl7t8563brC90ptv+Ylfkr3/+iFElpJ0OJskog8daBVoo3BjExfZBDUEcoXKIjjpeaEPHaLT00Vox30twPsW7LlXVo6gKJm7M860J+ye/4fr6PA/uXOfB/UXu3lpkd7PP7laLrc2XbG7tQxXoLszzzt2r/OCd+9zUMVVpPDx5tIFOehSuRJWOxcTWZJgOpXRcxQGqZqiOlFMKo0E15ML1XWpQWAOtuTZqrkVVtjg+OETRZqvvOP7oC8bldZ4NRO7+Hk2JXxu0W4vM9VaxxxlFKDC2vo5CrE01UdRFi71UjQJtfG2W02+2SViZi6muuhRQRyQNTdFUiNXH/EtjWuvYMBw8riwoquIcCCPLWtgkI2t1zohzrWJSjHHiSK1l7Pq83P2MI/9Mls3d6Q5Zs6JOw4Z8793/lmF1yuebf4Nu9VFWKPKKVhJ7vxQaj0yh9ePxmHHd3NykBJs04XR8fIyCGlorbQxlVVE5R5DI1j7r3JpuAZmWC+vILHI+TVPpkdy3OQcOa4UiHzDxpxycbvDWqnvlfCXAt9+6xd/85gN2NsdkC4tUQUUHBJjEkBeOhdU1jjY3KYucTppQ5RViNE4c3W6X8WRIaqmBLYGNjX22DkWur3z1+/B3dlYbmzscHg4pKiHRgUBcucRoWGoSkDodoFVUBU4TdJpSSdPMFrMIzXUWn/qYCtSAblgrVKQcie6aajJGOYlIPZWitaXT0bS7jofvrCBmE+QIJTV9kmKmd8lMa1Xx5qoQXH3G64imgWHqDBUMmVllrnsDo97MA/jZTiX/6j/+gtx5Km9BdN1QW9Ef5/SHOV9s9Fi70uPBwzt893t3uX77Lh9/8oSnL3bp96N0x/H4hE6vi20vxnpajRry3mFcwVyvzbfeusH9a12Sum1+qxT58KNjPt88oCKpgRgQ4SK+Tg9EYEmIvqse8QguiWNfxd4uX6BqFg1tM9Bpff4ygrQ4HRwxykvy4ojRsGRvZ44rK/Osrcxz/9Y8Wy/nODkeEvwc3XaHa2sdHs6d1dSOj4UXG9scDSzz61eZW+sR8OT5mIVeN6Zm5fylKXU9xNSXE5w5Kz2l2onXW9bp0l2xGGnTP+qzc7gHj1+SmIL9UmQt/dph/a5mVZt20kOrFsEPYh+latgWmubU83T6s5HAZTWX1wVfv0tUFhT4cLb9hhGmcQ6zkhxNXah5XpYVBMWkzHG+z7Ptj3jv9g84Hb6Uhd5ZRmVB31Tb5WN5cPUfcXJyxGH+aySMiPyZZ0watv595xx+ipS+/JhmX79Yq5qmCV/7vdn3mlRn8/7Ze0qpmmFOEB3I/YC945ccVVsMZF/m1Nr0w7eXlHo+ELl3bZVP9zYY+QqlE9pZC6lytIq9lJJkqCTDl+UU+KKUqQk1Qg0a0ZEvUKKD29kr+F3sd3JWRxOR//f/+EMGg3GEW4vFiY81vJkaA0S23qCjFkrS7mDThDxE+WMz7cCO35nWuYhcVcroKUGi1QYTPNVkhBQ5mdZIFWnoQ1CkqdDqFNx/uICYX6MYRFiRNpG6SCkiqWVcpTWT9NmD2LhMdG6ld6RKCF7Tbl1jZf4hiZ7Bhl9iz17usHt4gtUZ7TSjoXlxzlNUJduDgr3hmM2TPgNneVDeYb4D3373AQ9v32Vrc4fNzU2OTk5BOyajI0plyFotfCgxbsxcqri12uatu8usZ2dX8Ob+hM82DjiaBMjSafoBIEhFXflDT1ez9UWuYsQS6VJULMgGj1IhejQtaOtAJyjJMGQsda7hJgVFPuD5iyFbz/ZYWUh558EdHty/wlsPbnBFKbU3EblySeqtLEtECU5cLHo7qXmlNJOyIFGd6TWklNTAF4WuUzW24UJrnNVMWiUAohPac3NY28XTYjAc83J/l1464eaV9psv7q/tjZaoHt32Mka3anUFjdKKQK1vZJri/kwDqzQT+MxLMhOJvdJjdUZYff7z00+dfe/SKO4M4j3rIHwtKFhVsZYS61iNs7KkqYpsK5WiLEq2Tz7mi+2fM3/7KgBVcShJtqIArqUP1eOTD+X4cJfxxheM3SnaprgAhqh3laVtrEkpyioCmLTF1RmCmOKv+0zD+WNL0hTqCDI62QvN0eciqosDEBf4QiQ7YAqwqCXodZxXg3GMy1Oebz/i4c3nLF59VT3izpxS/8//+Ei6n+4w9DU9naofWiFpinaOpN2hmEwISkENmGvS+FMCXjGIaIaDkkefP3v1pP0W9jsxWAQPLzd3GOclSZKirEWpM1bgZmehXrObSPNvWmlk6J4pyJ6T/lBnq7TmeYRb1lBIH0UGpZxgFJiaVj9CaAs6nQlXryk8h4gax+js3CHqeIJrlnWFR3CoEHuepgieWooghs2WdnKDhe5dNK3Xjsl+ENncP6YoFFVJdHwhdrAHA6aVQtai1CknI/j1h8/5V//6R/z1jz7l6LBifc3wvW/f4J/82Xf4sz/+BtfW5vDFKZKf0NaOlpTM2cCdK/N8650bLM0EeR/vO/n4sy1e7p5iO12MSbDGRFYMDYRaVgGZ0cKsHXZT7FYhkvyLoHQaaxJAUBVe5Xg1Jugxokt0EsEyaWcBmy1Suhbbezkff7bBL3/9GUf9CQCXOSoAr6DVTTC6ZDIeMDjtE0ohtbGHp/KCl+Zm1FNHZVCx1YFIAqxqBywNUrKOD8WXBPE4DybL6C4sEzAcD8YMR5M3X9xf2xvN0KLbWcKaFqFha6BZwTeMM6/aRUaK+J1L9K20OpuML743872Ldi6NqM5IY5vns/NNUz/K83xK4eRclMRJbEa3vUBiNY5jPnn2txT6mH7Ymzqqxh4ufku9e+cH3Fp5l0wtISFBm6xuCtZTcEdZljF1aV4lrL0YdTbfA3DujEZq9rOXjcn512tMpSgaKqZGwSLW9hRoRRFy9o+32D9+PmWcv2jXlxdY6HawOkY24qra1Qa0MZC0yLq9GjsQ20qkbkcS8aClpmWMbPj94YQvnr68dFtfZr9bZHVa8vzFFvmkwraSuLpSJgISIrQv5o2bRl1jSdoddJripe7NUGraBtBwXU1VcesQq9FzUtpiEHwxIh8dEcox2hqCytDKIrbCpiVXrkN7vs+4OkV0QRQtbCDxkbVYICJWmrQgHiSpNXBgKhFC1K7RtOgmN2iba9g3SNcf92HncEDhFMHbmE/Xggs5AY/SGkyCUgniE4rKU0085eSA/tEpz58t8vDeVa5fX2D96g3WVhdZXOjivbC6tIoOFW1TcevqIt+7f8art5+L/PUvNvn08TanE0g686Q2weizicPRXMgR/RhmnVUcIXSAoD0imqDakSGbEpGKIB7E1Y69QFSJEFemWXuJ0O0x6h9zNJowfHpIbzFjoxK5mVzurEwGOq1ATdCSUY6GnEhFd87Sm+tQhJp5QJtYU6yd0XSvYwJ+OqlB0zIRdcKMBecm5D4hL8CH2JReeYkpzdr2vMjWPhz3c5wEVpY63Fn7uqH4TdZRK+rD4/9eWmkPRWz4VqGJbGNmQi46LMUUMaiUIvimTCDIxc/JK69eMjG/Cr44966KezMLXADQ01X/mXRHCLGRNepUKbSKpNvtLEHUiP3BYzZPHnNzaf7S8Xjrxrc5Hf0TTofH7IyfIbZAa4VpQB+1FEijs9Xs0WzyrtnPsyZgi3MlzoWp6CnU9EkidaQ0c/zqDHFJ7UiixH1MnJumHFNb5QFl8MozqQYcn25RMrz0+NaX51hdWuDpYBgbfo3GVHV5RScoC53eHH2b4F3dFCw1ibAEmkshZqwMk0nF3u7hpdv6MvudnNXxSZ+jwxMa0a2mQOq9R1SIE2UdyguQJAlpu4VJLKUXlDagiJyAYYZ5vH4yTV/VaYWIMnRU1YhifIxSETKrhGktStsJ129lTIoXOE5RukQpy3m461k6QilHUA4tCqa9TaEGWiiMTgkh0MnmmevcwrD0xjF5vnnMwfGQUSGoxCLaoHTAaouX2BwdZ14DOsFqi80UuJLtg2P2D/fYPdrj7t4V3r53g6vrPW7feAfx0Esgs7B+SaQyHMHzF8f0+wGVJThX0mu167qOwkuMSHz9VS+RsT0IaHStvwNKBbRELRrHWZ+XIsoDEBxWKVBCOzVUBFRwBGPQnYREeoyPA/3RKU83jrl17fKLH2BpLePhO7cp9C4bOyOO9w5I2h0kzFHkFd1uNzoiHetRUZwy1A6qTqPEUsTUhcVrTaPEIVVOYlKUMbhKan62SBfT3D27lcgnT/t88mSb46FDac3KSpej4RU+PvSyNq9Ze42z/Yduc91FOu05kiTDUUaEm46Q5iaymaLUL9RbXld/ORctzERWX2Zv6t+adVbRUZ5FVrMM6I0gZFk4lPKIM7Q7GZUbojsVj7feZ23p7Uu3v2huqcfHfyXPd15wONkjLwd02slU96vp/wq1I75sX2PG8wxY0SAAmzrblHbqNcd/8XWhouETVbNlDiLS0AdqwlyPaMdxf5eT8e6lx7e60OLq6grhyRFat0gsiKv3S0eu1Vavh0lSxBUx/Tg7zvqs1GNMQlHmHJ30ebYlcvf6V7u/frfI6uiE4XCMNSlIrUsjEQWIjjIdU2ZgrbBpOiWanEhEndUSk/UJrHn96l03KpLiNtyBWjQhlIRiRJEPSJRD+Yj2McqjtMOmBbfuLjPKP8FkYzQh1l2UnkZyOkTiRaVLhAqtHKJSxKVoMQQ9BgTvBGtb+NIz11tmvnedTL+eYX2zFPlX/7+PGY4dXll8qPCVm6YvNQkiHk2sBRkTIulvCLHjPlnAOcfmUeDg5CVbm8/58z9+j+++d4tbX8J3NylgOBKcj/IdxsTGaQJRMVTXeWpiZIk0HfMGUCCqXonVqCQ8XnsEiybFhCy6CyUoHApP6QpEXFy/icXYDGkrtEsQabHbL3m5fTnF8n4Z79i7b11DtXsk6R7u8RFVMJQTxcnpCWEVspZBZSlJajEqio9EeGxdzxBdc07qulk4rimNBFQosIbY92dAI7RaKfNzLbJOrDsenpZ8/PlzPnt+AK0FknaH050+R/0BO1146+YaO7nI1a/5Bl+xTjJHtztHq9VhWA1qaqAzgU6UcDFldT4NeJ64+uJnXzcpMy3gv86R1WAhkbpmdpHhoY6o/Pm0ZAT01OxAIWAAVxQ45QnK8XzvEx7c2eRIKllWZ0AhcQeCUfR94P7NXXbyD9nq70RwhbU47ymKot5n9QpdUpCGdb6OqrQhMZaqTv81KdZQR6a/TToUQJTU6NkEHY+GSNId2dGVsmDAVRWpDhwd77K3v8WkOpR2cj7VebWn1P/1b8fSbr2k0AolgcTGrJMzcR5pdzsoYwgqsubrunTTHJ+X6BOssfgKdnf32dz86kwWX7lmdZSL7OwdcnI6xLlA6ap6ZSV1ztdi6vqqKAjaQJqiWy20jSmYKeZfzgqxMnMyzk6mihGKUigfoMyhzAm+rFcscfbKUk1vTnHvXpcs7UMo6wv7bFWhlJrCyBqE4mxofPY8IN5hlUWFLu10jW77jHj1MpvksHVwTCUGlXYxWQYqNsNpMRgSrCS1cqcgvkLpCmMkFkO1jl3idMgry8bOCds7+5Tj32JlGSBRgPMUE4fRGQHBKcEFX6f86jTtWeKBphB7tuqqud4kMkMriZGWEmoZFYV4jXdRLdgkKWkrgURwKnKdORTeJ0zGgd39EzZG/pUDMAkcFNHJrq3P8f0/fcD3/uibrMx3sC6npQzDkwGjfs5kUlGV9SpTFF5D0LFnLxhFaFimARUUWuIRproFFeSjIcP+EeX4lE6mubIyz/JiwpGIjF3FxEGhUkw2j0p6TERxmle8PJjwweNd/vaDl/z02Ug2Jr8DLO3vsWWs0k7WaJt2ZJSRWppeq3ie6tFqkGyzj6bP6OID3lyLedP/Z1+fOkZMvVg05xxj4wA88XlVCxw27OjKaJQ1nI6HVMFzPDjgqP+crb1PCOTntqfsqpJKsWDX1P1r3+b22jdYal3DSIKxiiAuLux0TXhQi70Cdd0n8hciBi010MOqaT/W7Hx4dpBvWjvV98LM8CilUPoMdSlipmPi63nodHTEYX+XCn/Zj3J7rc3VuYxeq4UWjbatCMZSgjJA2o7IQBGYyZQ1+yuhrj8bS1CavcMjNnf33nAcl9tXjqych6dPt+mPC1QyjzGRGilI7GlIdYb2gqYON21Krg3txSWC0rWnr3uwtdRpuHgOjDL15BhRJJKC06CdxwZh/8UmXaWZOE+a9SgqiwtCGoTluQwddjEcooxB6Qy0jrUjooS8SBGb4gIxHYepc69lnPgUaFEY63GVx3KbufZDbDL32vE4dCK/fnzA7sExk9DFV7bO4ceaUfAgEdg/zdc7KTFJXN14H52j1obMJIjOkDDH0YBINvsldnUJri9nvNyYAEtUY4vXFSoJpFkbYxKCi8JwRmu8r2+4utDqAmiVYG2KUSl4T0JSR1E51C4B0QQS0AZt2oyLnKwTaVdwEtFhlSfxnhaWTFJEny/abh6J7OzBxy8H7I9PkFRYX7/G2+91eHj/bbaenfDk6QZHEzg5HJOPHXMLDpMGlA60e23a7SxKneuExCYRxegiK4dRgUQZlGvRarUZl+B8QTcDnY+4tXqNlo0l0Z3TIwbOo5IWWdZlZf0KhU8piwnHJyX9U83mOOflySE3ByU/3xe5ugQ3v+YbxLDCnSvf49GzvyTRgcoJlQ94ZcGoaTq54ckDzkVLIZxFGMZEkmolgjiHdw7xFyfp82nEWQaL2Qm9gUl7CWesDhcQc6quI8VInJm/Yfr/UgKmneGkpJUIyCGHJx8zCZuvjIVOlxXAnd676pP9fynH2zscqU9wMmAw6qMTi0oMk3FFYuZiD6p2ka/UKBQpziXYdpc0FaoqZzQaRbRgjRgkMFPHmwWp1Mc+HVw9XfSHEAiSg40STBF7lGDEULnIRG9bBldOkKRi+3CTYF+VIAG41oVbc5rhYWDsDL6V4HVUgxACThvmV6/TPzyhbRWVm2XpIM4rgKuimkVQwt7RV4+svrKzynM4OupTFhViPFHqIs79tq5VRbSxxOY0q2OkYZM47dVM30DNd1c3sc1YXBnF+kQUJ4RQFqiqgtLFlT5QBcFa0MpzdW0ezR5KRihp4J7RUcBZATI0uaRG5VM1f2I/lyiFEYWSFGtWyOw6Rr8eBViFipPTAUUJlajokKXu/ZG6HoSur6joNlWNiERUDJubdCcg3hBMh/6wYnf3y0/oSlep//DTLXm522b7tKQsx7iBIxhPu3S0Ou0pSF8QfJBa96eOs3xzvjwSAsF7jNJApGY6I3NRtSS4jiukYCJwIwBi8GUgFAEpPZ6CbmsZW6OaDqqhPH50yA9/+oKR7/DZ1gtOilNoea4eHnH32i1urq7w9sNF7t9f5G9+tcuz7T1OTo4ZjU5pdVM6vTaVh/4gZ2FujkiS4tAhila2khi5iosQYR8iJUxZljAZsmShk6asKaU2RWQ8jmjBVrvHwsICC3OGSnVxvkWnYxj1S/LJKdunI04mQzb397l9dYFfHeZydTnj2j9gEEZXraqnJz+Uhe4q/aOnWG1xxHS7l/Cl6Rrv/bmIqmmUTZJY6ynycjrhnndGZ2wQF6OrKSpREQFSbwiGm+Dk7G+Y/o3Xt0ZpjXaOEBxFVXBw9ILtvc/eeFzrvfu8c+sH/PzZBsOiX6OZPfiATiwoC15wrowNyjh85Ul0QitpITKmKN20HvuqvW5kZ1DYTV0eVZdBokyINCToUi8SIJYIjMf5CcPilNPy+NJfX+zAtcU2T48r0qQVafCMRzGJciBJC0nTeB5DbDCO820980zptSIauXKB7d09dkci693f/j76ys5q0C842D/CuRBVN0OICBDUVFxsurMolNG02+34nvqSKLa2iN6r/xPib5d5EVN/ZYlWTX68Ro0lFbfvXkPYQGRmsN70+69/N4pFSkI3W6XTWmHuDSjAIhd2tk/ICyLFinWIjlIBTHu64tcbyH5QBhAkSERONekQFEprEtXm9KTP8cnldZ+L9uDda+Qm8MnTPfaPK46OPGUVqIohyuWx9SGzJK05VNohd7GfRONAHFocmgqrFNZqPFVciCmmvUyx1hXwdU1SaiBKY86XFOUEJRPabbiyuoQ18SI9nQgfPH7J8xcO3V6B1KIloXCO7Z1DRscFR2t97l29xvxCix/82To39pbY2jxkc/uAg4Mhk8GY+cUFut0WLlHoLAp8uuDwOt4UWltEeZRxODy+VrHFexZWVphbWK73FUbDQFkI3VaLXsuQGICCVip0raZrAnk7oSw9w+GQk+0Tjgdjdo9z7t5Y5zcnIlcXYP0fqNPq9eZZW7rFy/0PMNZTUdVRgK+jgDcDH84BB0RmkHD6UpDB7HfeZLN9W6+iBF/flDtrIdQgscahakV/eMze4QsOwoas1kzsF63bWuDm9bd4fHSTwfEhVo8jAMUrsiQluNig770nzSxSEvs4O5o0g9x5ytJdMkmed1Jf1lismn1v/jWL0RrooLSKaMEaMBXE0x8cc3yyf+nvtjuwtrYKzzZj7Rhdt5DEedpaS6vVIk8srii/dHzLsuT58+cMh1/+2Vn76s5qMOL4+Dj2TiUJwZmpBktTRDTaxJ4eFJpIN9KkBGYvthiFXAg9Va2cqaSOUMCEQD6eIC426drU1onEgFYVaVJw/docwQ9QuoZac/6kXtbXddHie1ExWEuLbvsK3ezN2lWDYcX2Tp+qiFEkEHmz6uiquXW8EjS6Tkg2C7+Gsjf2OwlR3tuaQD4aU1WX9z7M2pEXWTZK7YjIyu2rHJ1U/OyHn3J4NCZ3FboAxIKOQbtXnjRpI0FFyn8JKPEEAlZLDZt1NbJO1UCMMI1SI5O+Q/BEmYUYTfuywLsR7cTx4O41blzvYYBDEXn/8Ta7JzmlbTO/MEe7Y0mqFs4X5Hlk9ihe7nByPKTVUnzv+99idSVlfe0aN25c4+NPXrCzfUA5HuGLnPFI0+6kzM23aXVStNLkNWzWGsGpisJXOGnHSF5rlpeX6dW9aZMc+n2HK4S5+ZTMCuJGiOQoBUY7enOKuYUOLvRon3Y5Oj5lUglbRyUnwx2uLM1xtL7I5wORpQ6smX9YTqtj5llZuoOWeSTkKHK0NXguTyVdvBdn61RnYoqhrnuniMg5brymjtNQuc3+1uw2Zn/3sn34MoclxMlbB6L2qtYYoynyMQenG+T+9bDrTF1TW5Ofyd3r32Gv/5LK97HKUUrNdRlKUM1iOra4GKNptS2iHWVZRh2o38Eu691SqmGmjyKyURQxOioXAomps0niGY5OODrZ41SOZEEtn7uWV4xS/9P7A1G8iCRSdR8VEqH02irSVoJJND5vpJdmQC34s+hKFGXp2NneY5J/NSaLr+ysTvqnnA6GKKJOSwT3NAq2dTiuDYHYB2O0ImvHNFoIAUwk/dHTwX190kCjMCIYEcrxqMbvxxA/bkYh5LR7FZ25krI6Rbc8U/HGGbsI3pi1Vy7woNGqw1zrOq10lTfZ8fGE0+MSCWnsq1BRHbNR5/S1O1J1N25o0oM0aQ3qfpWY8jASaGlYXF/i+vWrl27zSEROhrDxfJcf//Qz/urTLdnYHdKe6/GNVcNC95s8e7rNs6fH7B3lDE8gWE3SVpAE9Lyg6i50bdLaqRaUwUHweJWBRFZ6XZ+JGBWHyE4fXN3spCPIxQWKfIyEMb1uwrsPr7K6FPe1BB69OOSkNKh2F9VOkUSR2RYt3SJrdbEmpyocJ3mB6+eM/uo3rK2ucP/+TW5ch7XV2+ztXeXly222tnfpDyaM+5ZiPM/y2gqdXoYoV6dYFUErvPOUhaOqPF2lWVrskSTReX6+BcPBBAmaTpaSpQpj4pIrTUB8DjryZCixtOfarLe6THJwRcVgOGS0dczB/jE7a/Pcu77I81xkLoPlfyCRliVlqXuHbnadojxCtEeoMLqGa8pFpzFTN0KdRex1rjwEoaozJdSToTa1CrDEBVRVVYhvyMHqe7m502eSMSKCFn2ejbz5vJylyl6X5WmcoYjgXJzPynLE9v5nvNz5iJOwKYv6xqXfnmtd587V7/L5s/fJB3s4VaEkSr47X2B1bBh2FahgaXUykhQm5Yh8UhIJaBvg01n67OJxRHuVAQTOUqJxctY05IGqRmlX3hEFaGOK0Booygn90QGByx3IylKPbtvSn3iC2BrFGM+bsYokS7BJQhEC1pp6nOv0KudBFy7AaDRhPPo7jqwOD44YDkYRuhjihIxqpBvOWCe8CNpEzq203aqL+ZGkMtaz1IzDOm9BBDEKoyOgWnlHMR6hRDAqiWg35yMlvc5ZWdUY26cIQ7SqIhVI/VuXIYkurvLOoW5Eociwpstc9zotvfTasdifiPzVT58wmShQbbQmak/R1Ko4B8V1dUN0/KMQU9epRBBxWFFY5ciM5xtv3eHhw/PAjj0vsrk74Ye/2GFjY4+NF5t4X9FbaGFamrXr67z77tusXclYWLrNvYe3ef6s4KOPnrO9e0TpKrQx5K4ELdg0JWun6EzVOloQ8HWoH8EvnqYbPSA61NIPMTUrwRDKipCXuHxMZj3X1pdZW0pZVkrticjuCeweF1S6jU0zJuKZb7fBhQhmSRPopFSZI68mVEE4OB5xcjzktD/gwcPb3LzR5e7dlPUrdzg5ucMnnz7m4KDPcDBgpyzozPXI2intbooxKW2bgZSEIqAcdDsJa0vdOkaMfYKToiLN2mSttAaThKi/EzxeQONwXuoVaI9Ou0u7BfmoIrOWKp+QT4Y8fbnH7t4ea2sL3Lp5hSe5yIN/EHD3lPnuLa4sPuR493FUsfYOZeyUYfVL01UX6lCNFUUx5e1r6llNijCEEOuQnN3L57dTZymaG/DCdr9sLRGBwkLlXeznqxffGDidbLKx/ynv3Pzz135/Tt1QO+ETubb8NieTp4zcBBV8LXbaOJaIqs1MQpa2CcGR50MqH7A2hddEp68bx3OvNa/rM0Tk2XqhiaRiW4/U87bWUIWC/uQQfwHx2Fi3A3O9Ftt5iXhXT26aECpECSY16Cw5I+6c7l+TlQERTaNPWJaO/f2v1hz8lZzV4VDk//Hf/9vIot6cSBphsQCGWuY5IDqKC9ospdVu41Skz0cncbJrgpiLFxQqAitqyRETQnRWoxGpD9OIzruSJNMkaeDm7TYqOcZKBcqhdSRyfbU58PU2u1rRKiFLFuh1rtBWK6+9ussK9vdPqZxFqQSUI4QKrZN6uz5O6kCEhBNpOnTU+9I1rBOpUCFgjaaXwu0rbd65s8ys0u3zgci//+vP2No55WgQOO0X5JOELOuSD6A4ztnvH3PQf8LcfMqdW9d5cL/DH1/JuLL+Ns+fbLH58oS93VNkDGXwFMmEUKXYTtSTCqobFUmkIK54DVHCHJQOiFR1v0dsKJag8BWEKmAksDzf5q27V5lrx/H2FXz2eIfcRaopaSXozFK6HFwFYlFisTbFttokqk3ayvCjkuHxKdv7BwzHI549nePq+gp3bq1y4yok+iHH/QE72/vs7B8wPNlnPG5T5POUY0foGcoyUA0VaVCszXVYW4nMFLsicjI8oKQgy7ooG9GZ4hVeJZROodMWIh6jk1jHU4IJOQowiaeXGqQ3R1mknJyesn96xM5wl+2R49aVNd4/FLk6D1f+HjcVZ2pVncpLub72Ds8OfohXh7hQoVUEN112y11MVc3KZcw6rCDgXJS00Trql8VHEhUEOJPciDWtMPPbMgVXnOfcA9HnsyrNHHQxwnLOISFgTFqj6hQ201ThlIPTZ4yqy4EIjfXUOvdv/BH7p59THPUp/AlBuSmprQ4REZ1lLYwxjIshRVFNkYrRyb4+4ySvCQmbhbHSMo1Oo8qUR8QRgq/bTs/qcQEBKwRVMsoPyd3Jpb/dSmG+l8HuEFSCURF47xsgnFXoxEY9vhABWmf75WOQVx+T0QlFXvHyxdYbx/GifSVnVTronw5BIhyyyYlOo5NQD1gIiEkwNoaGSdbC16tzZIYRmJnFT63BQl0XQddtqz6gfIUvcsQHFBptEkJVYYwiyzxXrliS7BQRF5Evuk678ds5qllTymB0m9TM0UleH1VB1KA6GU6oxSsIFEhwNZW/qhk24mdDjTRSUounScN8HgEAGkdiLN008E//5C2+d2/h3BW5s1/y/ofPGZQaUT1UukSnHXP7LlSIdZwOCw4+22FuMePFzhHPNld4cPs6t6+2uXvrOrsvr/P5Zxs8f77LYOIZliXVOODEoL1FZwlGAypC3eNNoc76s0QDUcoAbVHeoBzoILSNYWWhy+0bq1ytET4S4OnTHZy0KNG0jcZkCl9VWAkkKrKf1KIlscclsbQXDWiPKz2ucmxs7nG4f8x4kHPr5lXW1ixXr8xx99Ycj75Y4skXLzgZjJkMTimGQjW0qGCoRimZrlhud7hbO/7ST+gPB5RVRdbVKBMJWG2aoEyL4EqMTQi+QAQMGnE5hXNYNK00BTQ+xOtwKVvG9LqcDMfsDSqOTl9Sjtbxt9987fx9sAV1S/1m419Jqhep1D6FnzCF+r7BmvpUk65qoiuoU3ja1Cm4WhC1Bl2kNeIsy7IporCxaeoLLnWUv72F2okFbKIpi0Dl4+Lc+xOORhvsHD3j0L+Qed0luWQx21PLarP4UNbm77N//JKRPwUVf29Sxh5Ooy02S1BaKMZVLGtojauifNLvYzGVqjjH0xiaKNShdIIyUeg2wvgDQZVMqj6Tqk8p+5LOMLADpCl0OxajAi4ImCjdE1OJAWzsTxNjUdNzERuRG7FIqaMxrS15OWFn/+ArHddXclZF7tjY2iYvK2wyV9N2aEJNuR+bzNS0LhWCZ3VhPjKn11xZnsiSrYgnR9VHobSacoqJSQjiCYVjqddj9/FTjDis0rU+Vk6WZThXgUyYX2wzKbcJeog2rpYAqSMZifnx8+mC2fOgpsXChkPQO8v8yhpavZmh+3gwYlKU2CTDCRhzdq82hU2hLm+KoelCD42WTZriXUmmPL4cIyje/uZ97qx3zm3n+Ujkhz/dpJR2ZHZWLZzScVWkDaJimkKZDomaZ1CMOTg9ZWPzlBfPDnl4e5Xb15dYX+3yT/7iJm/vLPHZ400++HibwluKSeQNzMcDbFvT6UCSprgqRn5JklD6HAkhon4mJVo0VgxKJYzGh7SM48aVZW7MzNFbOyUKS+mEtJMhOhCkQksFAt5XIAGtLCF4go83tIijs9StG3srIMUXjqdP99l4ts+Nm1d4eP8G6zfgm28vcX19iRebO7zY2KR/coobKqpcYdQcV9YWeHBtfbpPo/6I/mCEbbUJOhINtxLNpCrxWGzWwZc5mhQVBMGhCaRGMMohwRHQKJ0iSpGmbXo2RWwLOyk52t3ni40DpByz50Su/D3vy1pevMXtG+/wq0efY9stQo3GfTUdNJOiqlN0ypxNpk0dCgVhhukBoiMqimLKBtHtdtFak2UZ7XZ7qklVFEXt4M7AVOcQiK6OwMx5ktvm/RDCdD+MifLsoiP5dcBjbeDwZJONnUe8s/79CEt/jXXsMt96+I95/PRDUrWPMY7T0z5zvQXyiac7N4e1mnExpCw8wSuUicrC7iLobGp1BVlfmM+aGpzEujIiJInFKhtFKKfaWaoGSMV6bpoE2p0OeV6SJB36owNKP44K0BcsTaDXSzHKY1Tk2fQ+YJOMvCppActX1jl+vkFSA+Maiqu4c3WbEiA1KnLQn7A/EFn7LTXmvpKzGuUFg/5wJgpqHjE3iQp1Gq/+iNFom0wh641TiBcs1InPeqAjgWVQUUwtemFBqoqQ50hV4F3UnRKjI0RZCZ2uodUtSZIRRahRRfUNMXtCZ59fzFufy2WLxeo5WukyiX2zsxqNSyalJ0RZ3bjamzmqc2AOFc5qpiEyfVRlTmpAXEFKyb07d3h4d53lTmu6g4dO5FefjHmxcUTpDE5rggl4Bd7UIGFVN1qLAVEYurQ7CcpXHBxPOD76lCfPLG8/XOf+nWusrl7heytvc/vB22ztjPjooxfsHx2TT0qSTkIxcMwvzpGlC/VioqKVJJQhoRgUzC/MU0wc+WhMmEwIZc7Kepc718+Qk4fjSn78/h6DYYFTLYxSJEaBNFBkUMHXRfKIPpyeDyJIQltD1ktI0zY+Lwm5w1clL17ucHo6YOXlArfvXOP2HVhdu8riQouXz1+QHw+RRDPfXeD+9Susds/Ia4eDCZNxhdJtkrSDNgnomN6sxFEUQzpiYq8dglHUUP1Iktvc7KgqRlc6Ug21sgStLWVvnkF/yO7xiK39y/P/f59svnOFK4sPmG/doO+fAyGyNbzm81+G1qs/9cZtTiaTKdS9UQA2xtDpdBARJuPiHIqw2W7z2dK7SxkilFJoZaIAaE3n1ZhTAaUc2hQcj7c5lR3W1KuyGo0tmetqa/KBPLj9x/z6yQtEJmQ2An6SJIu/6SIbe/Cx/1QkqkD8jmIYQBzDxFqUOiPnlVAHA5ynvmrSqSF4XKgo/ZBJeYr0XnWWWkHLahRRyLYBYCkd4ptGoUyCTlIoYoLwzBq8eDSFwTvh9GTI6CvcIl/JWQ0GI45OTiMHFOcvyAbXLypCF4OKqxNTC4lFeYqm9TayXkgQpj26Z8MCirpJVkHlCWWOkurcxdUAOubnUzqdEqUGKKloSCkvopEuq19NyRZnb6BgsHqebmeVTL/eWR0GkR//apO8cphU1WKQYG0LCTFibMATMJMXD0LwDp1YqiLHZAorFQu9hG88uM7dGwvntnNwBJ8+3mRz7wRpQjdTxihNK7zSoJKIkkRhgiKjRfAGJ4rClQxyxSAv6ZfHPNv1LC/s8e6797hxo8vqjS7z87fY2Tpl88Uxp/0RE4RiMETSWLcpFCStJMJTrcVNPKGoUN5htaPTzXjrzg3+0e1seiZf7hzxfGOfce7QXU1qDYkN+Coqjeqm/h3qxkXtMSHBK4tSLSQo0J40AdsSQlsoJ4LPE/Jx4Kg/YP/giJ3tPQ4ObrB+dZGFuTlWvvUuC1mKrqBt4Z3181fX4cGY0RhoZyRJC9BUVYU3JSpRWNHYSrC1OECzGIhjHWuxzvs4qamADQ6D0DKKFE2RGYaiOR7mHJwM2BlVcrUb+eQOCpGhg2Chm/796NFa0FfUB/v/kyz2bjE42gfcuagK6nG8gFo7e232b3xvdqq8zKmVZRkdS1VNFYAbx5VYi+5aghNKV8VzW0cWIcQoLa2h8Q3l0qyTFIlpKyFMUc7x3lU1wtmxf/KcvaNnrKysU8ihZK+pa/eydd65+wM+ff5jinKAVY68iIs9CBTlhKIoCCGm7EQihx9TaaPLndbFiGr2tdhcHZv3gwuRB1EiJRba12WYGtQSu60iuw8VuRvSHx/B8qvOygDtzGAVFCGWWSTSDsUPaIVKLEnWxZWnU2aisxMudXSlUcbgC+Hw8JjR8LeHr3+1yGqcMx7lTNV3Z8Ltpj5zrjO9BlhgdJ2OM5zpfzS8Cq+a1NIQiTJIPsKXY3RwNUGirbugPQqh20tJkhNc6OO9Q5uzFcP0914DtLjoqOJzRWIW6bavcDFvO2tlBQeHp0xyh+hYuPSVkNiEmAiZOTYV6rpPZMiwCnAFlgDOMd8zvHV3nbs3V7jeOZvADgqRn396ys5xn0JiY6HSgmiHUoGgTazRqSgEoGu0pA4O76PUSae7QHtukbLMORkV7J8ekhrH/knO3VurPLh3g2vXe9y91WNzfYmtrSM2Dk55trHJpH/M4vISSZoSqgpHhihLJR5xHiOeUI5ZWrDcvHq+RvNyr8/+yRhMh6zVIkvi6s6VJaJTRGpdHeqUUJ2q1Si0yaaF8xCEYAI6NaQ6RRKNskK7mzIZ5ZyMBvzy/Y/ofp5w9doat2+s8eBbKT11OYy8017A2mMqbdDKYnUSEabBgVQYZTEqOi204JUi6Cit4ompZa8ieW6QujcoCDpE/krxBQpD6aByEmm1gGd7Q/ng8wOOygoSYf3K0htlVP5rssXOdZbn7rFz/Ah0iafisnv7sraRyzIfXPK52c835AMNMtA5NwVh5MrQy7poS4zMs2yqC9U4rjNoN+fSgCINz2FzSiKZtg+1tAgKhed4sMnO0XMerHyXjNdTsc3rK+rF6CO5deVdTp5v4WSMUhIb772nLCrKwiEh9ls1+6G+JLK6GIGeQ1fWEWdVO6q4Fqzn6dkhrRGTPiiCKLQKlC5nOO7jL0lvGqDdiTXt+DuR57BpH/AKtLbYNMXNONGpCOfMaxH0YTjtDxl9BX25r+SsxuM8IgEVSIPhr5tzp0CLJq1HdFZZlp2l5nQkQw1KphRAplm+1iZogoAKsYW2zAvKyRgdKoKX2hk1Fuh1UrQuCH6IR7CqYdF4dQ6Y7Zif/f+553Vk1UqW3zgWo4lj7+CUvCjRrZIgNq7cfC1nUScDVTMRQ/08kGYZVT6hZRVGKtaXV/jeew+5unS+sPpit+KTLzY5LTy6046NxbppNjaYevJUQaGURwUPhAiN1zoi9lQdAdsWRido38Kg2Nyu2NzY4OXTMXduLvDew+vcuNvh7sMOG5s3aacpG5vPUH6Ey0d4ZRHXBZ3R7SyQFwX4gqo44crqHW6sn1FSPeqL/Psff0y/UJh2C2stsck7rqxEDF6i9lGzvhNlIru+CMrnUehNFHgVb6jIgoNqQ5pUGA22m6D7LSbDktMx5M/HDI63uba8wLs3FIeVyMoFZ3DrxlXW10dsnzoG/T69zNKeSzEqMA4VXspYOE7q6oWK+xn3lyg4KBGVivga+RQQ8fhQURQ5pVekFyLqZ1v7vP/0gGOn8QmsHPXZX57nl5sDubHUY73zX6/Tmutc58rK22wc/Jqjoh9X8OpVZ/WmReP5xWWTTH/1u3Cecimm+yTC5lVNBlCGqdyGtXEOStN0CuoYDofRKdQliVlEslKqJmzXsf42nSM0gbhQHhdH7B19wSiMSPWbSQMys8g79/+ML7Y+Yjw+ojWXonTAV46qBO9qBV8lFxbwb3BYr4motI6AIRCCOEI4639tPqt0o/0Wa94qRBo1pTWVFIzyAT686qw00O1k2DoYoE4xelF4IhFwanRsRSFmTvw5sM0sACaSDxRFxWg4fuP4zdpXi6xGo1q5Ul2aVm5QKM0JtiYlyVKUtohzU/lxpRrmhjNH1Qgexq9HpIpBU5UVvixjcBZnZlBgrMIaQ7fXQukSz6R2mAYRd84Bzg7Sxf+/GlkZUrtAZubfOBbjvKJ/mscLWDweQas2iowgE+oEEkpFQi7NGdGmlgDeYzOhm1huXVvl7s05rsz05+yMRP7Dr17yZHufoTN14T9O0knde6J9hlENH2EV5TFwMeKiBql4IZhIT5VaC6ZNqByBhLIQXm6dsrO9ye7uNm89WOXh/bvcvAFLvbfYP77Ly81nPHvxnIOTU8qJw5gu1djhqgmZKum1NffvXOHWTJH0+dYpe31H7g0ZGiMBqtiIaLWJC5YQHVhQ7ly7qAbweZQFsVHYc0ZOLqJB0xax/UGRzVnSdkI1gXzi6Y/HbO7uc//GFa5eErV0u3D/wS2OP3nOzuY2YTTEryzQWWyR9DJMS1FWHj3N7ZvpZEWIKRXlI8N7XBQAYlBG452nIuA9aNuI70WBzB/+9EMOR56y3WEchPzUMR7tsbd3yM7iMr/ecLK8bujZ//oaixfVDfXx4V/L0tY1DkdPUTrW9y4CHJq/l2U93mQXPzOL/LvYowVEUEEdTVlrY4an7tOy1rKwsBAjm7JRbziLtqJ+25nTEPFAEiPpOvp3jDg62eTwZJ/F5Xtv3Hcd2lxff4/1lQccjj8jSQVXTWpovgYsSnuglhTCnqvf/jbWzF3GGEzKedZ20ShtCFKdobCn46UJqpmXFD548mI8RWGeG3OEdpaS1BqEDXxe1dRxIKAttq7HzX6z2dbMqKCVpaocJ/3T3/o4v2LNalA35JmZVOB5m42wlK3FxFQEXSg9I4JGE1ZPp6j6PQ1ax2YLpeoCZEWmBadjpOK9xySxBtJuWbQqqUJV9341wJPX3wQXC6vNyW4iq1a2QPKG8B4iuGIwnAARBRlCglYp4mLUgwrTi0PHjU3HxjlHq53STeD+jau8/eA213rnJ6hPvjjm8+fb9IuSynbxPmBQKB9pWiBDqQ5aGaK2aYkRhegSrxSV8jQoy0RH2ivvPaEqsUqRtS2S9RAqjg/7fPzkmBc7OR9/OuLh9evcv7XE/TsJN268xfXry3z26AUbW0PyIoIOlpeXadkJd6/Pc319cbrfT3f78i9+8YKDgaciJTV2OrYNajRIjApjA3Vdv0RiwZaAxWNVAaEiaINWmsblBzImo5xOp4fJDEmqMUpTTnLK/QNGgyEffvIpa/OGQyeycgGNt2aV+qgSOcqvIpWjOK043jkhH7Xors9hFzK8BtGCBYx4DAoTfGTTF8F4wRpFFQAMvkZZVUZwKkHpQCu1ZEmKMSAVVEFD2iZbXKfV6+DdBDc6YXdwysnRNlvHY25ObnHvRoujQmQ5+6/LYV1ZvsPV9TtsnX7A0MfUzuvqxa9LBV5ml703C3mffTRmLvRhqTISx2obARadTmcqex+RrtGxeR8Xd7GtRE2RgYEGsBXRzEqVHPV3OTw85O6yZ+yOpGOXLz1fa51ltV09k9s33+XF8Y/R9og8H+GdQkIXrSxaj6e9UVq/CQ14+fjMOqsk0eR5DCqQZCbNqep6lY6cpCJIiPN0g9zzviIv84jSfWU7gVZ69ntx/q/BdfWErm1UD7/ULom0y8JxdHTyWx/rV3JWw1FFkQcEGycYFdBKg54pUkokOFQS+2aCsfj6+GJRfQqJOzuOxmnU//feo0NEnIS8JBQxBehDQILH40lTwdoJrTQBPISYbPNulmA1cL7zr/Hu08D4XHQVu98tiZknofvGsZgMKyajnFBpSif4BiIfAjqNaLEmBA/ElJxSUWI6uIKV+R4Lmefdu2s8vH2e1f3Jsci/+dEjNg8G6KQDylIFITUJ4sD5GHmKVjVYpU5/oPBiqHxAJRadaMQLriqiDo2ypImpUUeByk1I0pTewhrGJIxHBV+8OOVkf8CLF21u3Fni4Vu3efDWCosLK1x9tks59lxZW+PqlQRXVlxbT7g1M7GOJo6trSNGkwzRKcbEhkrRkfTYobAonKqjTaLOj5Z64SIxag4IIdQ8jyqJvTd19N1pz2ONrWsQFe0swaQqSpYUhu29Iza3Dnn39sor5+1QRMbAt96Z40r3PbaeHfL/Z++/ni3ZsvNe7DdNZi6zvS9fdarqnNMO3U0ABGgkknHj3hs39Kh/R3+AnqQIPSviPuiNDFKXuhINJAokARANdKPtseXd9nb5lZlzzqGHmbnW2qZOVTUBshvU6OioffZeJnNm5hzuG9+3+3Kb7vERw3KA6rVYuL4eh6NVZDOIjjRShEUV6diCVxJ55ELQcYQgKMQHUgONVJFmCmWgLKGQDI+imSRsbTUZDS0hKQlG4fojjnpjek9es7Nn+daNJZ4cj2RlscHKbwn0fU3dVr/Y/2fyau5LeqcneD0GogJBpB7zVOJqk+b8rJ5aLag5G4G/zYld5AOs/51A3SPubYJ+QyA4QQePaEWe5+jE0khSbJZiSSfwd1d6ilERgWBiUKrqzaLRUlcDAoPxKd3hLp4e+G/eK4zPuLXxCcvNm+TKMyh6eAlg0lhO1lVJvCLoRsJkBvXqhsb03C+WAa02sfrlYy3CqNgnjzIjpnre4idOyJxqYIs4yjI/l7nOfFkswyuFxxNU7EuqSvZJK1CJQWVJNbc1zd7i+zUoBxJLqU5i37/X/RvoWZ2MRP5P/5d/hVYLaBuiPESF4tK6QIJDvEXrBCsR7pvOtRirOBhmKkbeRpLgqyntWkumLm2GqiqYGI32JS00Z2d9jGhGo5y0MVfRLBkoOzQXTlhZyfBujHcam8QZDS3VaSlfp1nEGq0GqftCgjaCDwVKG1CGIheaus3i/HVKOd8/umhuSKXDqch0SikthgNHa67B2J1hE48yFagCDcriPPgyZzERWqHHf/e7v8O37m8wG0W/HIn8p8/OeHw4ZOgjbDt1VTSpErx4golAFWEAAkKIzAEVHVIkAI2sIjUZcKyLu1jKIAYXSdoArUiyiKDMmgniLZ3CMzoNvOi84us3B3z7/k3ubK3wdz7eZGMOvinq975JPgpYozBWoW2OqIATj9dxTs4L1RMS2d+NRE0jEwKihIKIKI1uLTK0K1+RZ2qh9APQiixREXyhYynRJmB0RpatcXJ2dXQagF4JTQX3rsHW3Co7i5rnr15z1CvJuzk7eQfbzFhoa3TLYm3M63z1VGuTUeJRicb7iu1ACTp3tBVkjUAjKZhbiPeQS2BQZiSppakdi2rMxqLDzs8x6mUcHad0On0GecmwcOz1jlhdXuT2tYzPhiJrTdj6LSgNbjV+h+tzzzkqXnNcPMM7SIwFGSGhjF2SoFCSoUQTdLzeQbuqV12PYMA3Ug6pKXffrE033SmAoi5veAQfPBPaPe/Jx8WkRJgkCWnWoNHUFGkey4SuAJejpAqaqhkcbTRCzlcv/yM/+M4PaMun37guG41r6tnpX8m3bv1v+NGvjlA6QyVdfDjFJg1UaFIWgRSLVyGeX4WWFkVETZ87zwgoiRDyQJIktFoNtNaMRqMJGa7SoQK7AMYCFhflkNEqVjqstZGJwnuU0gxHXQp3ObPaMIn6s1MRk7UYMcYnFoKrnt9YEndasAsZJAKFqyoqllB6jIkwdydDNCnapCidsH/4fsoS8AHOqnBxKLj0UBObQojlPaka+ypi+o1SEQhhE8RqQiX+ZUVhAkxH7y5chAryrhGsBlMKOsiEwDZUwI7IqeDJ0iHG9ogS9nEDV1IntvUNO4NGqSO32sszO4sV02JlMqxq0dLXvnFz+Pj+Gn/373yHn372iOc7OyTNFRp2iTIvac0nE7VUEdAYEEtqEjJjkMEhmzfWubuxwMry+U3otO/5+sUOB6c9ylJidB6i0yHUwtR1A7SsroNUM0BVxFRlmRda1JOftIGITKyf56o5mwhUU+gueIZFTn44xLkXHO/t8v07m3z6/asJPGtbWWzw6f2H/PL5DoPBGbaxCEOHpJoka5CXDq08VuuYKdXXUyQGF8oRTAUgCRqCRUvNlBIVjEX7OLWhJCpUE+l9gqvZuSNv5egCKvbRcSmP3/T56vkuwRvW5tf46PYCP/jdZW7fX+YXnx/y6MUu436PYb9PeSYU800WFxpkmSFJLcYonJQE0RgVS7M2SUltglcFZT4EERKlSGwEZQwLGDshBIdVnlTG2HKMVRmL7SZpY572wpizk1M6gzGn48DJXpf90z47BwvcXlvki47I+txvNrv75uIn6idP/l/yqPsn6GIfVGSZ8S5W9hOdUZYewszYy7nyUAwmpaJ/fpt9aNnwoilTzRcRBR9DCJEGqRoUbjQaaGtIkowgDUo3oMgd47GndAEjijzk5OGIbr7PUvu77/zOuWyZldYd5rLr9IZvCCaAcWBs1fu0aBUlboSZweoamCZTiroJwKRmqU+SipTBV0oNNRNQPYgbg4C4QLpK12Sy9rpO36r++lsz2uqYvBK89iiJn2xCzJ68CoQqOhYVqhlNhSKpvjOfZFdBhKIUhqP3J7N9f2dVwHBYyVYkNffdLNJk2kz1IhgToxVtTOVgJkHO+QW4gAac/b3IlHJFqSriUlEQWikhTTXWVjROM+8LoWr41f+fmfCOfZzzctthIsUcU3GbvF1ssbZmE/7JP3rId39wlx/99Kc8fbbDyckhRcgYjTIcmlQZUhtnoHxRIjisLVlqt/jk7l1u3G6eW5GXx15++miHk/0jpChpmBQbHLl38VipCYPNZMnqf4NMmaz1pLH9FuLOej04T3cTRxA0znusEZIsJSDsngw5PTymqS0vTkXuLr99w7y1ptQ//7OOUOb4UY5xgbKfo5uWLJtHRFfCjyoGFsrhlSAqqkBK1etT6FhaUJW8AVGKRJSf1uFDQKlIreRLgVKDExJbsDCvZ0FT/ORxV/7yZ085GhSc9AtGo5JXtsNxZ4sHD9ZYWk349Pvr3Pt0nSdfvWZ754CdwwEH/SbD8Qpzy/M05qDZUOByUmPJyCI02MV+bBSz07jcY00LaxM0MBpBXvQIErPNNGtAKfgiSrekqWF5qU2WQHs0xnZyOmddOqc9xt0jTg9bHKwtce/aOi/HInd+g4lyb1y/y/rJA45H+4zdPsrG0r0AXllKp7BKVWWiOpCs+CfraobIBFV8tV0+/fdxUrPvm6V8cq5ie69KVt5HeHxqE7TRpGla9ZZsZGF3Oa70jMdjDg72uHvv3d/dbi6ysXGN1aUtDkctRBpYG3lMnQoYayJm+C39qrhPTr/He49WakJDBRFYUpblpTm3d9l0Bq4qo15VBqTGzqmqbHn5KtT7yPT5hClpxPQ1URgyykn1+312O16uLZp3HvR7O6uyLBkMBm9tks6aiMRmZmInFEuT1pEI9TxW/MXFE44wTqUEH1yF1gnT9wI1W0bWBJt6ghRURB7vezpE8sup7lW8XjaSZZq3NAlnj1PDnTmlTkRkcfn3Gf09xxdfvuRHP/mSg35JGRJSpUiTgLgxZShppAlL7YQffnqHTz+9dukzj07GfPn1C3wZaBiDMRrxJbgIoUX7WEoRmVJTSQVekSnT/LQBfb6Wf34NuXK9FAGjHdYkiGmDbpOPhwy6gb2TnBc7g3euzUd3Fniyvcir10PccEjhNaZoMKJAtKI5l0XnRKWLVWWGSlfHqoh1exGiyEo1pEmc8jfEKJKKn1KrBHxJKA14aKaazY0VWhVr1aP9IH/2lz/nyc4xPm3jdQNvW4wDPN/e56D7mo3NVW7duc/NLfjD373F9voKX704ZPd0yNloQG88pDGXsDjfZL6ZkLUsJslQZYi0PBKHTpMkI4xL0rRBaqLMSDEu8WGMkETskNextEmCKyOTQTBCs2VptudpzS3QmW/R7WQMul2Oznocn3Y4Ou2ze7LOn++KrC/BSuM3Dzm40Fzl4a3fY//kNTudYzAjIrRfIcESROFN5ahU7PXGPredCaI+zN7PUb399ReXcDgcopQiMRZjiWrk2pKmKVlmcKUGX1KGkv2DbfI7/Xd+Z1utqv3yc9lYu8Wrs1V6voc1bhLBa63woRoKnjmcq8Zr6v82JgIatNYTR+W9VL6qHiPSFxx/nVFdMctWicW+vVd4HpQ2AaZVjt9qhbYzIIzZj64RtZXoo64EageDwYRF/1323s7KOcdoNKqQfvXCzZ6ImiBEAiESNVo7w3RcQR2DYIyiwk+ce39cCJmkvKEsKMYj8B6CjymyxAKXiKPRVCRp5JuDgJcwc3HrrCr2jZDq4kmN7JktAaoK1KKxpoG5YrFn7fnOkTx+/Iyv94fiPCzPaR7OZ2q7L3L7+jX+/OdfMyoC5CWucJS5Q6mUlbVlrm8u8fvfu8utC8wKz3bH8hdf7rB7NGBcKgIJBBdLdSKVVIJUHSc/ufj1mSJ6ElFNb051yVHNsnYoItKuLgdEuGvkygtaCF5RBkOw80gmnI6Fr1/s8aYncvMb+Lzu3IAf/nAT73vs749QZRukSYkmaVpKSnRaoBOHTqNKLErhq81KhyhPIuJjWWjCVaYmjfPokE2MSIMmlArlFAlRTHF1aZWkOsLOMOeoN6AwMLc6j07nCWIIhVCOB5wOhnRfHXBwong6v8Df/e4aa1tt/nCrzXEHHr/c5umLbXqHfVw3p1xYoFww+CVLmih0GpGxKigoITEZzaxJrRFYlMMIT/YKNIxGOQ1taagMSSAER5Cc4CpnnjbRCxmtbJVeu8XxySlnZ11en/Q5HjteHfe4c32Du5stdoPINf2b47Daakvtytfy+NnnHB48IrgBxho8IEQYeZAxNQI0mq2YyGP5yr/1bN62CdY2BU6dt7cvz2xGdZEYtyxzSidoHaU7Il2TJbGWkEauvbPuCcPR6Vs/f9badoXNtTss7mzRPz0AN4p8mcFF8mR8FdVPgSZxL5w6CKjZexKSNEObBO+EInd4d2FcoNodpqsx/f152qvYGnkvn18JSb7N6uFsT2TkiC+NTgqIoyBhepzD4fBvxlmNxwVa2yjLXgshwvkNsCrraTulWgo+bixa1aWqy5FN3QOLFlBa4UNJ6fLqswNBHFrFQxZKsmbApiUhFEic8IvQ98nnzCIApzZxUmomSwwKo1KSJCOpJD7eZqedgn/1r/49Nmvw+3/we/ze734MwI05pXb6Ihubv0sIQAG+dlZGs7CUcuctJbQ///nn/PJFh6GzFF5iVlVR+Zsk9mxK73HBoxPLhJ2+iobissXy6OzNeNW5T0p+1WsuzsMoceAF5xOc0dikiU09veEpr9/scnR48xvXR4AHD9axpsmTJ8fs7PQ4PR0y7o0JLoWxx2aKpK3JMOg00hnVXGZKx5iiHmkI9flU18uFgBcwFcIzhEAoYyZmjWFprs18S+Mkov8+ezKgQJPNz5PNt2kuLJOXUPSjYKNTLYqy5OC4z+FRn3xccH1ziTt3W9y7BZvrN7i5usLTF/scnHTpHB7ROTOcnTVZW19meXGBNEkRGeGcI9MNGmlGouPd58o8dg00VY8hRQXwVWBtkqoc7R2+9BhrMUAjTaLmWLtNe3HIcadHfzjmbO+YQV5wfNzkwfVljoLI2m+Qw7qmPlH/n6//b3Jw8EsO+x28lIiRCMnW9X7gqwy6VkioxlWIg+8XpYNm7d09q2/edd9239c/18+HEPcIEaF0AedylHJIw0zESAd5j87wiKEcSUutfeM1mFPX1Bcn/19ZXbzJ9tFj3LhEZTEQUzqywqAVhFlE8/nzrX9OkoQkSRARijynKIoouaIV31xCvfyZU4uyP2/fO96SldbD/Bq0MWDi+gWRmWxsGhCEEEcDfBCGgzH5+N2K6PCBZcDxeMo6OB0Anv5cOx1RGmUSTJLGSXAf+yg1318tfa0EzMWoR0XWQasiDFhciRDrs+diKB1IM49NS4SyOoZpNFItL5NarNSQA1/F5376OonDeVolZLaB1d+MBHz24pTjE01Rjjk8/iuePzvh3/75kWyurTLuw4OtD9s4vjzoyP/8T/+YN2cpki5iLHGQrz4lZQjiyH1ETyXEhLHuGWoBpeqhxguaParKLGeChIulXFXtDEoT9chcATbFmAYkGcamFEEh3hN8yXh49dT5SSFyNoAvX3Wx7Tab1+eYX5pj6dker9/sc3Y2pNvvIXmKcw2ktISRwTTAZgptBbQg1Iz5cbpf9PReq/c1qciOBXDek7sc7x1WBzaXV1mdBwLkBk57Q4YuYJotvIJBMUSpjLSdkTYSWqUlH+aM+kJROL7e2We312H/bJmPbmxxZwu+dbfJ5sJd9o7OouDiWZ9ht8+JV7gcWo2U8XgYkVrW0UzVhPvvjz7fkxCqgXBtMEmGFA4XHCIeUSVKO6w2GFXx2diI9tIY0sYczdYcjbkFOt0+Z2dnjErHi+09pOiztfjwQ263/yJ2//r3OOt+xeDxHmdFDpknUFQI4nrotBq9qBxVbBgE3KWe1QRkfeFbLm7o759RTctS09Ja/TwEH58DXe9vOpncjwFhnJfgwKicnj/hpLPDR+vvx8i60Nrk+vpDvn7+S0ZhHIFQKuo9ReFTWz3X6konBZwj8c3znLwsYlVJq2865SsWoT7/aq0qAFqdEFxes7o6U70PPUFww/meVYDK4U6TBS9VwFlhGEIIjEajv/7MyvvzYIcphdA0fZ/8TU3TwanFOaPIWhHhk1NwRUXDo5j5DEGIDdB4frEhP23QCTYt0XaEVNo2kdfr/AzX9CJMLV742R6XrjbGJPLFqcvZ2Kw55hmVTUaF0Ms9w1+84vMv9rh94yN++P2P3ndJJ3Z01KM3LBG9iJcU7+M8UrwxBKvi+gelSdMGMkmp61OoSwVRWWtW9nv2nCdtQpFzfcDJTVb7BGsI9bXxAVfm+PGQphY2F+doXkg8T0SkO4Jfvezx5MU2b/ZOCQjf+vZHfPrpFp98Z4v7n2xydjrk6eNtnjzZo3TghkIxttiRJW0nNOYSkiyKt8V7oNLDEVXj70FHhZygawn7gBePkxwhR6uCpQXNtUypQxHJPXT6OaORsLjcJEmaKNtAsOCjtEqis8iYQUCPS4pxSS8vefxym/3dA/avrfPxR9e4sQU3byxx68YSj54d8+TFLp1Bj8PBEJMabKpRqkQJpHp6D/pCEK8Ro9DKMhrlZEqRWYvgKShjKUhFRFgRQBuNCgHvcpR4Wo0mWdZgaaFBu9Vg0OtyMjzjtNfntDe8klrqv6Zdm7vFg1u/y7NXX9Adn6EZ4xhTkgMqKoUHy0TVN95s1bvffyj217EpgOCKCs9splWX0QTq3k8sYUV5jKEfoulw0t1H3iIHf9GayQLry3dppSs4f4pWAtqhdC1GWX/fZWxA/XPtqIAJU8e0DxRRgkCFDr5cBrzk0ERPemdxn37/zGpSrlQxG9ZVD6tW2rj8IVMARnBM+mzvYx/grPyk8SgwAUrMHsT0+BXKWLRNCR4aWZOiiI5OpB4GnYFOM83MphBlRT4eIyIYrfGlx5rpfIWxQqMlCENCKGhkCYPRkEajVS12LD3K5AHQ02NUniRJKN2QJMnwPqak45GnfW2xolu52g5ykf/Hv35DqeYYh4C2hjeHx1jr6Qx3Oe6e8e9/vCv/+Pe/Gfo+a8uL6yy2ljk+8KTzDQpVMi7yiirGMK4oroyxjAuPTSLCJiqhhorGymF1nCVTVQlNfCSCnZT8Js1cXfWqZh4IEcRHsMbIFSRNgzUmZlNFTkMKVlqwudzk+59Mp/W/2i3k3/zHp7w+6tEZlfQGDp9noAKdv3rMs9evePBgk/sfXefWrTbXb37M8mqLg70BL1+ckBcaigZ56dGlZmwczcU2NjUoFeeYgnIkxuB1LAFqaylKRys11QxXThnGOMlZaguba/E+WVdKPR6KnJ4NQLVR0kb7FuItNUehhBJwaFMy19Y0WxlZqegPRriRoe/hs1dHvNg/4eHtTR7eXWN9Cf7B31nlo+urfPn4JbuHXc7yMUWhmWsmpNpzY2tK1xVK6HXHtK6tUpYeVRHnuhCVrTEerTRKLKhIVhyIIwaZjgTFwY2JMuWW6+tzHEtBV8drd9rtEW59Mz3Yf2lrqFW1m/9KPr3z9xk87nEyfgytEps4ilJQuoExaVW6DmgVJuAhJAIaJswn1eZbR+2lm1WhvbyZzzb4z2+uV2doEwcVqt2oelYkBBAqaI+KM2HV+733JFrwUjB2Z+T03mtdVs0t9bj/l7KycJOzw1e4PEAan9M6Yyr8Zbqj2bL9ysoKeZ7T7/cnDPQ1urF+bfVD1a659GEYY3CVozAmBTEEFNYkJG8BmClVUTkBGI0xyYTz1WpL8AVJktBoNOh6JqhlH4QkiUrqMYONpeAsaVD6nNHo/QaD39tZ1TDPdyJvZHrBlVJ4NfXtNfwy3gymQnjVn1fRx9flxMm0e/xrXS5URDoVrRUmKUE7gp4BHFyq9dazVeevmNSzYTNIQEWC1ukUQnuFeYH+qGDsAk4bjLG4NEOU4jTPUWeef/effsZffn4of/c7b2dtnzXjPdbl2LxApW18kAlFlTiHCx5rDcamCJ7gHag4j66Is0daKQhR40srOwHBnD9nmdzUSikuJpCTtTc6cpcph8WAL1DlkMXUcGN1bvL6/Y7Ijz5/xVcvDtkflBTK4rzFqoRUK0qBvcMRp50nvHy1y0cfXefW9Wt8+zs3+eRj+OijnJfPD3j2fIfT4yGhWMBkDbw4srkG7WYDawzeRx0gUPEhSVIsUayz9LGU5nxOEUbY1LIwP71+Z92SPAdUigRDcLHsgvI1VANUjGyVBKwo5hoNEp1QNCO7/2gw5HQ85ouXuxyedHh4c5Nra3NsbsDa+h2evSz46ukLhiJsra1wb6PNxgx5hgkaXwZc4UiSLDJdiBB0iAz8RvCi8aWOLC2NBHARWIPHVtWToG0sYKuUREuM9SWWVy5vb/91bVAeSztZVU86P5Lto2d09/ZAD8jLIVonEGKAqCTWApR2iPc4CehK2HLWaqf1Ici/d732sqO7UImY/IdGqtIWVAO0RseAQ8Z0+vsMypP3Pq7F9gZbq3fYOfucMhlVbB+Rzy/4CoQwgwCsJU7SNKXRaEyyqavOb/Y86gztUmY1AShNMQbUfDL67ZlVWb4d1h4/dcbZEz/zKpsEAzKVbXkf+yCAxdsWaGo1r1Jk8kWfp0+52qbNzklTs7LaQZo6e50BciRGkaQedITGRiSgecuYwtXHMKlVh1hb1dpiTRaH2N5ihYf+qIujjKSlCCEJKKsZlCNkrGj1M57uv1+kBfCt2y31R//hscy1tnmyd0whGeNS4QuwSYJJMxJrcdX4QLvdrvqD1QNVp/sSe3EoO9OrYvK3WehrLKvWUeQsSlCjTWTbCFKSGUG5EanO2Vpa5v6t6S7cLeDN8ZCjQWAkTUyjRauRYXwAVxJ8C+cyBqcjOicFJ8dHvFkfc+/uGjdvrHDvQcbm5i22rrV5+fyAbqfgtNPH+DajTk456NOea9KaayIGxt6T5yXaZIDGlYHgoyJPCFFba211lfl2dKjHIvKnv9ihN8oJOkZ2ijLKbitiFoObLJNGo8VEJGszo6U9RfCYDAZdRWdQ0N3rc3g2Zqlt+OT+dR7cW+DWzZTVlY9JLCzOQcPGrG5y9ylFKOMYRpqmiHgCCucjAwzUpdgM0VGCRelIeGwBg8fomHEEDV5FZkVFvYnXpaPfHKv7oA8W/1D9v7/8v8re6VNOhgeozGBshne64qZT1ZB6iCzdEet0ZetlImYwU86e/G0SmF5dqprtaV163yXIdrVvKX9pPxEFPkCWJPjc4aXguLNHf/T+zmpD3VV//Pifyucv23ixsUcXAj5olKskUPzsLCiAwtqEZrPFaDSiLKMMUExE1fT41TTAf5vVwerFdVDKYm16JfQc4qxtGd4O3gIqCrhKOiSE6ue65TB1ZnV1zntPeQXL+1X2Qc4qenhVlclmN8OpBQVB6agSrHWkZapvJKkhjJe5Ac+BJ1Qc9I16LPGiGSLTdYyvDcZE2LoQp6Lj/lNlVhMl4yk3WNUphYq/Wzg/GIyoSBVlGjXFw9Xr4MH5HKWjDLsLAbEKk9mY4RkYlsLLvSOenYl8tPR+fYT/4R89VP/6T76WveOfctbtokJKkjVJjKLIS0a5JbEZ7UYzpneKiBzSdcnzfPJYO6T651m7/DDHNYgs4YIykf3eioKiwPgRK62E65sLXL++MPmW/c6I/bMhY59iWwskWUKjkWJ1ScgBl2BoEJpQDAccH3U4PNzl4PCE7d1lbt9a587tFb7/vRXu3FrhzesuT57vcHQ6pCxKysIzDGN8OcRkGbbVYnFukVHuUNUD7QuP5CWuGNMwsLG6gjWR+XnkYfegw2DsUUkTrRVWe0IYV0CNWaivAUlj6TGEiGxSkFjNfLtBI0kZtoVyXNIf9Okcdzgd9nizt8C9rVU+vrfGw7mrr/X8XIPFhTaFivLsWSNFSGKTWYTgS7QGYywWcKp6wCVULAEOU5Whppcuji1MGbbf5y77L2etbFoqfnj3h+wcf8XZ4+ckaFzpqtK/qSJ5R6j0w5TSBCfIzBjKdHN8Wy/l6pM/D7R6+3sub9pTwEYE8eiaVzsehVJYa8nzAm2E4eiUUdmnJycyr64mtL1oqyvXaWTzDHIVHaKJpU9UQvBhAkAIIQ4MZ1lGlmWEEO+hc8zqs722MNN++iarwEuqAjOJRLBLdFZXu4VRPgVYnMMtYKLqREVUridJSi0dNaMSPMEcxBK8d5HP9X3sAzOralXfYUpFEltmGX+r6FHV0dHMay/eSxqDCpGMkYreaWLVLJfWkGYKVGxsxmghiVmSuvoGngUZXPo9Gq1SVITivfXcxNf9gwrMEARl4waPD2ir6Xa7HB0l9N6i1XIyzmWlkV06km99+xa59jx6dcrTVwccH5/gy4TENkE3MGJQqoErIyFnqL2ThklIJRV10Uw2NS0LXKhpw4wzjzRYSsX3am1RBHw+oiEFm2sLbG0uT963PRT5jz/f4WRQILpBmiQkBEwoCGWsXZvE4J0HDFm7RdrIcOUC/X7OV191ef7shIcfXePjj2+zsqL59vcW+OiTBb76/Iw32wds7+ww6vYIRYuk3Y7aOU4hOjIKKAm4PFAMxoyHOXOLbebnl1FEZOL+AE57jlEJWUrMrFRAMcLoSOkUxBKZqC2ELD58qQPtEW9QARKtSBsJSeoZNQMhSSjGC4xLxbO9IWdHA9zI87Ijcmfx8h22tTHPvTvXeHx6ysuXz7mxcZ12ltJupiSJRdlqrsd7BINJACLlmJLYNKnRVV7F2bcSE2fFxFfB3G+ubTTu8N2H/4DT/hteH/6CoLqgS7SN5Khe1CT+MpMy1LTiUs1oUBPTXn6yr0IBX/V7zv/3BNxx/veTfy99R7WpGl1VjwLKCkXoMxp33gMwPrWl+RXWljfo7H9NWQXrRqcoUrwfRgLlKpDOkpT59hyiokzTZAi9LhW+89suJwezPbAQQuS31JER4zwwbmpFUcS1qYJkCZGgOm651ViSVihbYQuCAjP9vqolGAOTCo1dM+O/j31wz0pdCWu8vBiztBtB6llqKiBF/HcWth5U1cicQNz0JHKIm26dWkZggdaaJI2lKpFAEDCzBJcTh1U5nkrSZIryIdLyT44/ZosKTfiGzEpCSTEeIz5gaMTemw4EbygLR8sktNMWawsLZPZqp3eVowK4u9pSJyLyne/CT3/+hM8+f8Tx2ZhB7hmXI4rc42RI1p5HxFBzM4tI5cOroGCm0Xo+MpVLN+pkveKfEeLIAIQYWATHXLPBta11VtZXJu856eccdEaUwWDTFpm2pGpEgqfER8ViXVHZGBMphiTDlxmuyMkHwuHxMWX5hqPTE25sLfLpp3e5tmz4ez9cYufGEs+eLfB6d4+zXp9Br0evN6SQlIXlDUzSwCpFPijI+zlWDEvteZYW0rqxyekABoUw9oqEBMQSgsfoOJSuqNdMT0YBPLWwdayrx3llBRqM9mRaQGWUWQKlwQ803c4pj56/Zmn+6sb0vXWl/vx1Ka8/7/Di+WvKoWdlfpn1lUWWVhrYxILxVelHYSveNjVTloqTSZoCi9MQVErQloqB7UMZdv6LWkutqSN5LN1Pdjk83icETyl98C5S1UkU2ASFMgptkgj4mZz/tHwdQoiBYWUXe02z9j79rYvlsPg+YDL2Er+fumCjYmWpLqVhAqEsOeueUFx/f567LGmzuXmN54cmUj6FAFL1p0Lcm7TWE5YKYwzjIoIRLvZ4Zp/xuipVn0H8V879lzp3s0QSWglgbEKWZW8tA0aS3KjvNfmuOhCut20iwEV0fTznGTQm6107rsqvvI99gLNiWip6x2vr5v4U1j5zoMS5oItT6rM9qykKKH7vRXBEfXLGCkIJKhC8oGyMlOpR0qm9PVM6v3FrRBvCFdor0y9XSOnRLsGSolSDIAFxYH3KXDrHw82MHzy4w2p6NcfgiRPZ2YHDnTNarRZHZ/uoRFi7fY2BwNIc/MMfPuA7D27z8vUxn331mle7J/THhlwMvvSIJjKra4kS3tToblUpFV88t+rGkelDfLH2HOVG4uu89xgnNGzC0lKTra0tthZTBRGq/qMv9tg/6eEwpEpjQkkqY9JSsFkTLxCcI7EKZQRFgfc5QQJZljK3sEqznxKKEbv7PY4Oexwe5izOZXz/0/usLMHf+7tbfHSwxRePXvL01S6dYUDbhLOTDkoPyZIGRZ4TxiXtZou15XUW2rGvg4KDk2OKEPBkKL0AKtJXKVERMqwSIEbIogRMGdvMPjoLDLGRriLpqcbSMpbllqUYjglFSUgTumQcnPX5qyen/IdnQb53U7GSnl/ca9cs18/WOeyN6ffGhLKHy2EwGtBa8bTaloZO0VohwaFwKHzctCOoHq8TvEoIBiRpILaBokQry7uZ1f7rWpMV7lz/AQ/uPOPp7pihzylCgfeC0ilaNfDkuKCwEmqPMbmHjTGTnyc02DOKwuczpMuLMft3VeWhF3O0yfNQVX/O/bUSZAyKSbncmFiCL8KY07PDikT2/cxi2drYqvpTkRHeYKMaesX6kyTReVhrGY1GDMfnHdVFqP30HKb72VU2G7BPe2IREt/IWlc6q+NC5J//eC+iD3W7WsPzGVEs8ZlL75+sa9WimQWveOS9goq4Zu9p8QRnWA8k1nL1VarBKjKwqykhIPpcFhUj93pKXc+8r/r06vPjwC/E76IiRYwOyqMxk1F3kYiEE6k/N4q/BxRK4uYevWiUKZiyAZ8/+LiQ39BArLRt0BqRDKUsCYEgHpMo1tqWH35ym9/99jrrK+c3rBcnI/ns0QH/9F9+zcFBn4ODI1qtBiedI+aW2zw4czzo3+DBVsZcBt+9kan9UuT23Wu83unw5aPXfPH1CwbFGEKC6AS0ndTUsapSWDb1KlbrHtn1kIp/z0tVza16XtWQX9CVArFVyHiMloJWKqwsJKwsThVAex6OOgNGeU6WzdHILIkWEm1i6S+oKKmgBa0N3heVamtKe67JaDAiazTJmg1yFVDBU/iCveMRO7vH9Ho9blxf487tm6yswh/+4R3u3L/Dl4/e8OzlHsPekDJobFpAMUDKDs1mi3nrJ8QuAnR6XXxwGGWwSSBJskgQIJG5oj7v2AQWxEokBJZpyWnS5fQeozQ2MYz7Q1IjJM0E1UoRgaPOkCe7x6ACd5fuX7pvWgbu39ok0QlPvnxDPsrpnxYMBtAcGpZXF1icgywzmFTHoQsJ9dgqJroujIr7pjYGYxK0RGLf1d9gNnaI3HiH4ZX84ON/xPHxC/x4SOnHoH28J7VAMAhC4fIobaPthOJIaw3B4UUoypzao0wLYQpqaaCKO7S2t22Gs5WHc85uBqEgVMJmk9UNaGPj3HaSxRJtcPQGXYK836wVgKXJ+sItMrVCyi5BR/YVmUiRROh3s9kkhEC3252Ms8yWKWePfdKjjozP1TdVyuRMWUFCxRITCJjIwowWQ6papGYOpS6q/UIeYFgqxl4RKmekiOA3wcUKk6q+QyyIivRRxDJ7XS27yuQdckzTNXtPG+Rx5sk7QXTA2gS0QSTWO6VClomO8opJatAmwlITbQghSiQo4jp6TV3EiqUMqeeGQHlDajPyoo9KQsxmJImwVhPpWIx2pCbDSIoPfdJMx8HQ2X4YFTu5jiwB1E5Mx/kAHzxaVxe/IrVNTUr6DWjA3OcUytH3BUEF2o2M8fgI8X1uX1/ke/eb/O//x81LG8cXxwP513/+iB/9+AnarOODwbkmR2cF2AVGQ8vpL/b52efbfOveBp883OTLnkhuYH0TVtcWubZpeHCnzdOnh7x8dcppd8jYG4LNsK0GLnic1ngDAY1RCitRKTixCi2O4B1alUTUlSAqOj3RGYKZ/B8K2oxp25yPb904x8pxfAK7ux2SSlcrhCFJa45hbrEhpnmTYCpEleK0qmMX4zHWakpfoBNFM2mRtlN8UVIUY7xu8uR0wIvOiJ89OeL62hqfPLjJjWvwD/7gJt/6+CZff7nL5198TTHqcG11jnbS5ObGPN+9s0hLQe7hrAfFOKd3skdqF2glbbwrKTCkWVLpr0VnIEqDBqfibFpmYz9MCQQnGCXYaqA9lIK1Cb7KeLROKE1JSCyllHRHXUZlJPs9GpWy1kzUGydSALfmFKu35vn26sfs7HV5+vKE10c9DrYVp2cJa6slC8sN2iuKLGuSmAz8EONLtIpDw+PgEGfRvqTZSLATxvDffFvXt1VfdmT0/RP+7Of/C53uCUma4xnjxBNMSgiBNAVd9VFcCV45Em2wWpMaIW0YvIAPZRQ+9RYJFiGiYJV21KVD4FIwHWSmHF6XGMO0RzRNDCKrDSFFtESAi3KRMioISCRRVlrT7XbIPwS+rlbU7vgrubv6fY6ePEFnYxyxjOh9SbOV0Wy38BIYjobkZTEpg74tDxGJhNBexzEg4zVaqjRBRZkhr6Obd6Ega2h8OUKRQuFotJZYSm+woC7vX2UC2z1HaKygdIZBSFwEACkELzZiFFSC0gmgsYmm9GMS3aR0DpvYmFToKvgqBa0SRuP3G7z4gMxKXUjZogrou7nOL9RXaxgjgIrJ6EWopZKKBBEHuMlNhNIIDq0iWktVOlHx+CKLelBVtieaSVys4ixNRCSCiI2sCGLPRVT1DfxNhc6gIC8KGq0G/VFgPB7SSABdsDov/P4PLjNYHIvIz56dsn0wZBxaKCyiMrAOVIqoKOw3yhVqrPjV4z3e7B/y1eNFPrq7xicfXeP6Ety+PsfSXIsffOceP/vFK375+Qv2jwec9Lp0TzokjTa60WJcOHSSRo49JQQJkY1Zx3JKEF/1Q3SlgBsffCpwRfAGHYREl2ytzrGxNlVCPRCRv/jVGWf9Mc4ZlA0YHVFT3iQoY1FSTscvz/XMZmvqCqma6VoZyFQU3RSHk4Rx7hgPAuPRIZ1Oh1vXlrhze5PNNcvq37/GzWtr9LonbCw3ubbWYC6FlrWspEodi8h+CYf7x+T9IdduX2eunVIER5Im5N6hdIh9cgNKWUQ0vlIsnlQRhFjMj2Ji1OAiVQVpQaLIpfMaLwYXojZSvx9ZuKVheToW+er5GWWZs5CAkcCtG9dYWmyydWOTr18O+OrlAcdnI3bfvGHvwLJ59wYLbYudUyRZijGgcGgdaBqFtZBpj/ElKvhvAq/+xtmcuq62Bz+Vwzs7dMeHnOUvUNahlaNwJUmSTKTla0SeCg4vAfEK5QNJRX6sdYZJFM4ZXKkoykDhhDSZ5aRjsn9MnZGebvwz92dEJsbfBxXQFTnABEpf6T2hwrlyuoiidDnjsvtBa5GpJZZb10h1G+d7OJ8jNkqSxBEHiXRKeT6Zf4r8f988DlQH7LN9pHN/p1LiJhLNag1GWdp2gXZj+fIbgO4YurkwlljJ0VSI2SBYBFTs98YsanZk6WoPETPIq2dg32YfJGsfv+SiqN/lv//n2mwdduKo6u+euQlr81QNu8kNdNURnm/Kzt5sMPuZ3+x+JVRADx/VeTU5WsasLrX45KOb/P4n85e+vDuC5y8O2N49QkiJstVlhIhrDTLV1SE4Os7R7Qw53B+zvzNm92XOR3fX+ehOm40VzTCH/+0/vM0n39vgy69f89Ofv+T1zgBlMo7OhujWPCIBb2MU472jNEJiEqyyKNoRuxMqCisJGF2gGEeapdACN6Y1l3Dvzi0e3lydZlUdeP76Dd3+GJO0SFJbZdj1wx/7LLPRq8z8fJXVPYnYDzWIh5ETAobR2PGqc8zh/hFnnQEP7t9hdSXjzkcJidmkmcCtCySuEqBtoWFbBJ9QFIZhrilDSTavcRRYHXudGovyAUJGKklVKikIqhYADKgQSTonA+raVIAAYtbvNHiF8hacmpTynYcXb3J+/MtXDIcjFpoZiQpsnwhb16+zsgEPP22zsHGPvf1TDvdec3B8yvFroZ828csWNuaw8wZrLLFkGcAZVD4kjHooKfB+mWMRWf0tSbFWWjf47sd/n5PhPj9/NKAcnmKagpFhLMFLVumzVYP7uqQMMRrHgxtHKjdrE5RJSBKFMQGbxueozN1kL5jdP3QNmlEVLREVjCLUZbUoWR8D1qlpubyfeu9xSmFiU4BhPqQ7+DBnZYxhZWUVa1K8E8oQSFNLI2tgbZSnrzUEbUUK7px7pyrEu0wpBSFKdBgdMy+tLe3WPHOt+Svf0+3BYDCaOneZ9rhRJpbSMRcyj7c5ql/PR3xYz2qmNjqZU6ocxVUQ9F/XainnwHlHxTs2vvo1l+08WvGiqUoITqlvHniL3wHNZptivEeaJLQahlQ5vv3wHr//g8vy1kdO5Gdfn/L06R79fonOWrFXIiHKb3uASNaaJBowpLZNcB5XCm92x+ztPOPx49d8+skmDx+sc/fuEioRmi34h3/3IXfu3OPHf/mIszPYORjwfO84jowmgsosSZaglKYMgisgTSInm1EarR06+Aqc4eJKuSFaxmwuL3Dv9o3puQSRn3xxyOFJHycKYxO0jSVT5wpC8HgPpmLAn67vNMK9CJmt/z65zqoSvksbaDJMw1AOMobDY5482+Xg6JT19XV+8Dsf8fBGzHX2XClbNplcOF3C2jx8eu8OO7sdut0BpJFxPfexk1erZPlQol1seFs0yhgKKap4JzDptsPkQRTx6Hp4QTRKDDpYlBeUWLK0CcBgCK+2T3i936X0mu7Qgcs56u+wetBj48Y1bt5a4NYNuHVjmaNdy872Idu7nrPOCfvdIeNOg8HGEgtLC8zNzZGmSXUr66iaHDwE9zfMpvfXa021qQayJ9978E84Oe3w8ujn+FLRTAM++FhSUrGWrFTUPAPBhwDYyELiBV0GjHGYRGOsIknrwX5D8NPZ0BoaXd9/NZfe7P+nyOOAMlM1ibr/JTMrHEJUgBAiGEtrxbgY0RucMZBjaavV9wwaFEsLyyQmQ8r4lkaSYhNdqVyMJ3p+E9aZv4Z4JCKrfRwmJzaajDLMNRdoZc0r39MfBIbjEVKVFSeBqIod1Ro9y3vw/NV+40Od1gdnVrNfWK/b5KLKr+81L372u77z/B90tTnqC83QX8fCpG175V+9hhAT6VD2MY2MOzeW+cPf/ZTfuX0Zkn5yCp99sc3OdhdlWmgVb/CoyVV/Y7zO2kSww7gUNEmEmAaNk8BJr+SXX77hybMX3L27wve+8xHrq/M0V+H2pmXtv/82nR78+MdfodUpZ70xvVGB5AlKz4O1iDIRrhKi5IrHk0iUakikEgTUEFzOXBK4c32NhxtTnFkZ4NX2IcMioJMmJmlUPb961qfOpMJ7BS4X52JqKKwxkNoEpIFyluZcRpJmjIsOx50Bo3IfbUrS9C631zOsOt/YXqmUdB8fiOzdv8Vffb3LuDfENuc5O8lptlISCyaxaFUNM4oAJUHcxCmFyf1dBZAqgOhqNMBgqmjSYDCSxHksY7DacjIS2R3C2SDHmzbNxSUW5ubwbkwoR7w56bBz1uHgdI2P713jxmaTO1vz3N+a5+BwwOtX+7x43afTP+VVXtLolKysJ8yvZczNgUtSdCPFOEdkLP/tsrbaUh05kPHveIqfOXZPfw56DMYTRFeboK5K/yZKaKBRojE2iWVbDy6UkV7RCsZGmfdGNo+YODNUO6vacYUQIl3SDNT7XBlwAuuu97QYWGoCIfjYu6ocWyCW2EXHrL0/7F9CGH6TLdo19aT7H6TZmMeOU3QmNBoNgi8ZjUYTlQtjTIS0w5VIvdoq3Ng7GSzieUc1jOhgNFZlzDUXSM3VzqozGFO6QFBmWuKfzKOaOF/FrDP96w+f3ttZzV7UaaTs/zMdw69n0yzvCojkOy+UvvBv7QRjVCWTaPpt363odU5pJobRsE/DwO98+9t8cn/x0mt3xyI//vkZT54dMRhq0nYTj8aHskKgmWq0ODZ9vS+ikqqLAm/axIaSEYtXmrPhiOOzPiedMdvbPe7e2eSH3/+UtZWIBtxYh//pf/iUT+5f59WrAx493ebNUZf+eEg+LvE2RScZ3lSzbppIUxU0XmlEJVjvSSi5ubHEvZtb587n6AwOT3vkQWMbcyidEiT2nASPsRESXlPUfFPQMWvnZr8UOC9Ya9EqxQlgDVljBZ0nDIeavBzx+MkLluYdN1a/zU0zd+Vd+HBDqb94NJTnbw54cbBHKeCsQZbmSDODallMqqrBqrjxeQkVLLfqbyqomIHj7xTVTExkqTcz55OYlGaWTYYqbeRpxWaW1tICKxurpBa6R4forjAc9jg4PKLon3G80+T+rXXuXV/jd6/NqdejIDeurbJz0OH1fo/j3pAXo9fY43k2blyj3+vTGwdaohAP6v1R078xtqg21KkcyFnngPHnp3SKEVihUIJXghaJEbuoCJ6AahA+MKGUqEr6USk33niuVBidTDSf0jSdlNlrnr3agTnnzhPlzrQZ4qYfJn12iBNvzk8phZz3EUCGoz8+q1jl398ajTaLcyscDJvoVuxL5XnOeDzGOUeapiilzjmrdyUEda9vuk9W/w2T9odRmhA0ISh00GSNOZYWVsnsZSTgkYj8sz/dpzxH0ySRNLvKrqKMUXVt3tOiMvi7q1m1fXBmpbScc911D+uvs1w+qYkqVU2KMxnIi98ZXzehdqqgkXGusJ7DiIiY+IH1J1eDwVpVCsaq+ow411FD6uXC/MCshRDwRYHFsb7c5Luf3OG7n95iLTu/ACci8ssvevz4Z19zeubRdhEfKpAKMumJKGqASJ0ah1ifTjxaOZwf48och8KYBNtYxZGye+A5PDzi66/+jDt3lvju9+5w584CKZ5/+Omienns5fbWMq92zni52+PNYYeTYY4TDy6PkHWJ0+ROp/HGI0HwzFv45M4WN7emN+7BWOTPfvWG3tjhaZDYFr7aLGqBOuoG8IU1Oz8Dc1WfcObaC3G4rqKWVKmprrUgIUGlbYJzFIVwfNSl0/lmSfHb15p8++E6wXj6bswopIx6Q4pxhi8TfCuj2VDYREBHMI8lmQQ9ouLog1LTXm1dqw/4SjqnQPBkaUq73aTVbrDSVOpZLoLK0bbE2pxG5mk2DE0zj19pMB6PGfcGjDodXr3q0j8asf3iiJ9uD2RUBq5fW2Rza5Hrx0Oe7xzx6mDI8bDH9htDXnrKYRKZNVTj0lzXb4stqw31YvhLKcsuj1469odPsGYEqojVh6CQGpIuMWjwvowNfqVQWqGCjc9RlQrnowKtHd45kiSJgY/WpEkCSVLNSUXnVZblxGGFUFFc1QcX52emP8/sezXgwfuCYBKEgn7eZySDDzr/NGmxML9KetxCm8Bg0J0M/k4kP6DqtZ2/xN8kUPlN5p2QZjYig8ViVMp8a5GVhXUaunXp9b0hHJ52KV3N8TcjN6RiFlzhat/xzednxJgNUt/DPiCzugxumEwiz9T1/zrKgHC5oVk7pJrhQsLljU/NlNbO23lvHyPnaemJyrnN9uXeZibAXCul3+lx79Z1/sEffJeb19uXXjcK8OTlPl893iHoVRrzi/SLPkr5SiQtEIICXJyG0go0WKUJ3lM6R6kKjAHbsBVCMsFLivgEl5e0UsPJsKD31S4HJ6fcvrPMnRtLPNobSGrhH/7Omjr2Is9fw88+e8aXT19w2u3jvCKIiV0bMWhx0VGpkhBy5pqB29dXWZ1xwMMxPH+5zagAMQnapEhwcYhRTWUcQggk5jL0f3ZdryplzGoMWZMgLjAOIwSDsRoxGoLCJil9Z1ChweFBlxfPdzgMhazr9Mo7/tq8Uo9ORTZuXufx62Ne7Z5wfNahLFPwDcQ5xFvSVoLNVCyPhBpepwjiKtSpUM8N1oevQ+x5FSEnyBhjM7KGpVU97+IBl5MYR5aUpHZMqlJsC1RIybOUsW3QTFqUoxGjYZenrzvs9Z6yubXCgzsbXFtP+GirxcbGbTZ3c7YPBzx+fYLGYI1msWGZb17NnPHbYndbv6O2y7+Sctyh97xHwS5S8QUKqqIVqgMiR5KYiNYM1X0nFcMNCUrHrDyIoyiKCZKuzrJqLSil1IRvT0QmTis6sNnsKIIEJqhZVW3WJmYUTmJPKyghdwMKfzXF2tssIaWRLcTnL0TZDx/KyTHWwKVZRqBvtqpkUqtoK6pZqJk5q7oyEAxKNIlq0E7mmWst0VYbl56jfhHL2aWvELzV72vexA8rQtfP+cx73qduyQc4K2stSZKQl7HxKeF8RuW9RweHqkhEa6FGrXUkexUmEQ1MU9X480zqrSJVUygDaZpW7ykxJomzGKLQEnWkggckcuQFFzBJig9upq91dUoaIyI3AVboinTX+3fXUoyGRDxLcw3+4Pe+w8cPFli5IHp3KCJ/+rPXPHq+h0pblKWBImCSjNG4Q5pF+GuE/tfON1QZigelK5C0qeYqZi+TQ2uPnU8oCQQHo9Iy3C3ZPz3hiy+OeHB9m08f3OTpaQSJ370DG1sf8cnHmzx/sc3TZ2/o9Qu6w5hhpVmGkxFKw+Kc4TsPb/GDO+1z57S7t0+nP8L5BLEJ49KRWYO1ccxgMquiFX6Gqnq2jj25VyqS0vp3wpQCRkm8t0LwKKvRJtI3aQw6yZDSolWDZsMyGuxxdpLjyqsjs6NcpJfD2WjEjVstrt1u8WZ3nZ//4muOTocMRz0884ykwXCksI2Mubk5dMWRJnhKJwQ8NjNopXCuwHtHI0kruG7JcHQGqsSFAQuLNyZZTmrB5UN0MWIp1bR1SSJlHMpGk9kmjaV5wvw841HJ4KxFGBaceth/MeLV3lMe3Fzmk9vrbCxr/tHNhjoWkU+ur/D81T5nJznf+/Zd/uDW1Y76t8mW7C2+9+CfEIzwk5f/hn45xjsfnYvWjMucIAXGKJyvynYx5SCyqlNpugpOl0RghJps8KVzlNWeVCPrIqLQYq0lzTKarcjekBcjvC9xZUFZOFyp8FJlXwQkROl25wI2SSjKkjSB49MDCvd+2ky1OQ/rK9fwhaI/6lK6EmMrB10BQmrHBdXeNdk3r0DaAdpECqVqyDT2lJlmaEmSReJvZXCFsJS1MSolvSKrAjjuw2l/jLIppqK9U1U/TwBXlcs1EXFZ9wQlRFkTX7pqf3UYo9Am9v0h+oRm8+o+2UX7oDLguXRNva2JfnXJ5zwC5N3PVp0mvu0Y6ojj3OdXfayolDl1htOfpSovXnE+AJXUxDfRM6VaSE3g7s11bm4us964fJBHXXj+6oCXOwfkro3J0jiwmxeYxBJHRGuGhFAfTAWhjeCHaBYtlhB5fyY0UMEIgsNRRflp1EiizCh9yU++2mO30+fpwSm3bm5w+9YmWyvw3Ydt7t78mN/77sc8f7bL519+TafXZXmtxfVbW2xsrbK60GIpO3/+x0ORf/+XvyQvAibNKqYLO2F6mFwDXW0OF2KEq1gC3mpSERkrDzoQtAdyMCnBxbkMrRLExXmwzLSYMhdEe3YictCFXzwfcdI5pNM/ZXVjlQcPbvLxnQZbq9/n9ZsOL17tc3jaozs4Y+wCKm3ixjnNrEWj2SbLkpjlaUuQgPOBIBpjDZhYRgnBEXCgSpQ2KD0NeMZjCK4kUZpMKxoedPB1iwyvhWBAWchsgrZLJC5QnBYUI0037/L89QnDTo/ra3M8OfYTePqhF+n311lc+G2DVlxtbbWh+nIgKhEOh294eRg46R0SMo1JA/gc8NhGI/amJnOSVZ9aInLwfawWLNRaU5blxGnV2UuWZZjU0EgzpCV4Zyh9QeGHlBIYjApA41wBPiIDNQWRcefDlMWMzkhsC60a5xB/wgzibhaFLe/o8SiqTFRxXiG9oosCqFCAWhmUGKzKWJpfY6G9cuVHHndz+rkj9wnBKuzMAx5nuXT1DYF63vWbnvX4t1rtXL1nxvgBzqomVXzrnNUFPr2rSmrvWyIMM86kPpHzJT8zEe2aboQR/CByuWdyEVRx+TgqeKoEnISq/nq1tRLFxnKbhw/vc31z7tLfn+45+enn2zx5fsxpd0TWmMdaTVG4iL5TsVemK0r+etpDBCbiZZOyqgYSkCxOr1Z0pkiJw0WEkhGsjvpOeSmMA+hsiRfdkr1HOzzaPuT2qwM+vX+L+zeWWJ6H29eV2uuJ3N1qkxdDlhbmuX/zapACwOnpKTvbe4xGHpdFaK+WajWrCDAubETzCYqaI3iy1BcfsGnEcO7f+IAaVPCRLUA5Ir2WgEoiOzQGvCIzTRYXl0lmqo6Pd0X+7V+9YLc7pszHjMdDBv0zVt6cMhwpbt1Y5/71lKVPF7l7Y5E3Oyc8evqGV7tHDAYjxnkfPb+KK3Jcq0nWzBBjYq9PC7qKyiVA8EJROSxw2ATSbDqhOxwI4mKpp6kaJGIxQUWouY60YV5BMAaVKrLEk6BRmWI8ajLqCoNuh6/fnLF92OPorOQvnvVka63J+m84vdKvY3NqQw3lUP7w2ye0ns7xxejHdEcHeDdC6YDWAV/ksYclSYS41wOqykE1lwV6wux75Y6jozPwEhV6vQRc8BPnUHqHMYbEVhLyiUbbDAuUEjBJHOwvbY4rCsSNUZV0UFF+YBlQZTSyBaxpEkLMit52ZeuMqqaDu+i0ouOYZl2Kq3rEMeCLHRyNUhZrGqyubLHYXOWiHYjIP/uTA/pFoPSCqiZE9GSGbeb7RUA8wdfXQap9VZ+rws0eXz1f+T723s6qjj6YjRwuNB1nD2RWWXjSZ5L3y6wiz98Mc/tMNlX3zWZnD7SOMMzpwNq7neLb5rRi+fLti9duGL736QM+/vQBGxfkII4HIn/5833+9C++4KRb0mgvgbHkfgRGx36UKzAVRHvKQeZRIc4qSB1VVWg0pXRsXYqeQkbjo0YkjQRt4+1rtaIMCmyLQkqKoqA3HHF88pqDvQ57d65x59oy232RrbdoL73NRBu8LymKkjSNE/6eUIkCSgU4iIzvsb92fq0vPjSz2da5mzgyhSISexKYMGXHDwJeEB/HC+bnGqyvr7I2s3G/2Dvkq1evOC7A6oTMpni7xOnA88svX/Pi2RsO79/i9o0Nbl6zrH2ywvr6Ctee7fHizR4nnSGDwSlFgH7PMrewRKM9B4lB2wSrE4Ir0bY6Rx/wzoEIWaJptabkxcNxjhcDOkGURUJSnaNDpAJoqEApkSYnMVEyY6mloJmQzy3RnUs4OrScdroMX+3x5mCPu1sL/PL1sfzOrfed5/ntsZZaV33ZlsQ0kNzwxZP/RCcfk7YyxHrGZQHKgBiY4e2LqE3HtHRyfmlm77GrAuDZ4LooYotAm4DVBqMztDWRONtoMttA24TMZoRGQSgNYRTFPXP3YWjAebWhfnX2R5JlLUKvepavuKoToAVX712z5xP//YbEon59ACOa1GSsLq3TuqJfNShg76RL4RVBWxKbghudX7sJI4MH7/DeXXKWdbY4e6wKwVj1VkmSi/bezqqGgEZnNTMoeYXV0NB6GO9DkYI1lFxHEkCCAj9z0kpR0eoLouIgoAoRbqwAVIXme4vPqoEh0000fqaXCsr6Dce2vtJU+7t92bzWuHRSe8fw2eNdXr8Z4NM2SWYpJeDcEGNTtEooXcCYepg0TCbm4+nFSBHqMkCMvuOjF0sfQREbo6pR0eyUiHegAsoEkkQxKqIeVZosYpMFfFGwc1QyGu3xZueQk9N1fvTVrnx8Z52Vpn3nxVlZXWZlZQW1t4tVGl8WIAqjJdIVTXx7FMc0MxHXVY7qqn9n/x7JaHVsAouO+jcSs6ngAjp4EuVYW22ztDSz/j2Rf/+T56B1nM2yTVKTIU2N8oFRPqR71mUweMX29il3bm9x++YqKyuw8P0trl1fZ/fwhK8ev+LktEu318GVY5r5ImlzjqzZigFHkFhC8RbldZzzCZCZhHbTciIiK0qpsXPRyYvFYSiDQtsECRFko1RFmisehYvlax2i4KVJaKZN7FqKaa1wfGLpnHbYHozobw857B3yJ1/05eHtNh8aePym25y6oc7CG/EPBSmFR29+RCffQUJOYpuRKLl+cSWngvLVc18NDs92LC5slJNe+UzvZ0JeLVEpWyTgnacMReS/M3GWK2gFUpBkTQwGa+IQu0lMdGzmw8uyjWSOZjIPfhrYz9pF1N+lipW6+Dv1Ho5KQQCjE+Zai6wsrl35upMeHHeH5KJBJ1GKCagJwevco0bx1nNsIUQ6s1mLGIFqCLsKUuue4fvYezurNE3Jsgx4d5o7e8BTxGB9wN80chtNRKDqf0ygjRfSzXpOQkTOQTpj1nWxBnWhZzX7Zaqqf8987ruk7DavXS6Zve6J/MWPd3ny/AhlFsgLxVhKbCqgPT54lKqiurrOXoEsJlxeIqBMlIOugQfKxx5W5REMGo2NsG6qcpR4HA4rMQNeyJoULu57WqeoJMWVw1h77vc5Pj3k9tbce6ffKw2l/p9/8Uxgd4KcUl6hbRWdWQFblSmEiuTzvCO6VLJ4W2ZV9cFUkKqsq0ESwBC8JrgSo4XMCmtrLbIZFZZhAXnuwAlL820arQWCQHBVJp4YtDEMijHPd7vsHnV5/GyeW7e3uH1njdV1w9b1dTY313n9aofHz99weNqhd3xEsD1a7QVa7XlarTmc+EjD5DTaK8CQ6ZTGDDBvkI8pBbxROA0jPFpF9pe4VAYRhRGFiMEoMD5qxokPeCmQJGVuroVOm2TNBUa9MSd7B5y8OmY09ATucjAS2Wj+7XJYS/qm6smOJIlBJ55fPPpTusN9kgWDr2SBEBez7oisqJ4Zcy7YfCvTDec3+Mn9WFUIIhghirwS4p7iypLYqyI+XwLWCKlxGA/NxKHk/YQEZ83alOwtzBFX2SVndfG8gJhuSt3OO2chxGAyBEUja7KyvMrq0uUSIMDu4ZDOoMAT56jEuShHE+qAtPJUQqyEiJ/Mss3iC6ZzHzI54Kmz+msuA9bkirOEnm+z2TJgfVC1fUiWpY1CVyzusyfsEYqZgT5jpmm80jPOcPar6oClikK0UqCnFzPepB4XPGU4fzO8j3319XN+9suXHJ/lqNYGoRwjvogbkyoQqeHiCbV4GaJRWuJr0ChlINgqUgoxT6miRqPqB1JQotFiUVWDOZbdsujEvMJ6hZQlhR+DMdgkQacGkzURSemMezzf82y9yXkzFLnZevdF2dzcZHX1gFeHYwpyUI6gJDIHpAadanySxCxXzsusXx4mP++ozj18EyBOVCJFUvBRakC8Ag+JCrSblq2txUgiXFm3V5APPE2fsWjmmWs2KbTHBUfuwbcsLK0wOB3hxiXd4ZjT7T57Jy94vd/j7r1rXLvW4No6zGXXWV5a5M3+Kdt7pxyf9smHI3wJvoRimGIRxBcQNJlJadiUOk89FpE/+skrxjIGk+CspzCgVQAcOsTzCyhUSNACBkG0h0bskfmgoIxUTm1lSOaa5GlBcJ693Te87h6SvPG0Vx588P3622Dz6roayLaILkErvt7+Kd1iH0dZAVqkivvq3S8ODldlCeofL9nbbncVx19cGXvYWkkstutIalxXQIwxMeN3cWMuVI7xmiJE0tkPNaMz0iRjolxcOZmrqg4w45Rm/nx5lnH2v/0kq5m1EAJZ1mBlcYU5s3DpuPadyL/4j8/oj8Z4acUqVwhofdW6xjXDe+QSqrou5cdNeHY/mLaX3m0f0LNSJEaYNDDrklT9ghnkieDBhyjzXjtSrapZz4hKmcC2lTCjoRatqj0HrUFF9gZTaV0Z4sS+9wpfJoTQwOsRHqlIWd8S2ZxDxgQmjARQ1b8VEAhSvLdyZW3PT538m3/3M168PMSzgM9dbMw2Goge4xznem0xPZ79jtmZg3D+v6tGZaTW96AUITgkxChdqyRKvKs41IsEXFGSaEPSMBFKrqiayDEKTU2b7rDPSdfTfQ+k7cm4kNIm3Lu9xs7hI8alI4QED1FXyQUSqQaIjaDFVA74/M0JFSWMqEnZxdRT7xOAjidg8SIoqYQQdZyrEZEIX9aOVqbZWGiwNvPhZ8MBndGQRiOW67xzKONQyqNxBKWxqSWba6BNBjqBcUq/HPH0zQF7J8fMty3f/+QuW+tLPHjQ5t5Hbd5s3+SrJy/Y3j2iP+gxOh3jkiYGizWCcpClmlQHrIlXzAGjscM7hW1ETSaPwweJwVWYYcKQKkuu5gTz3Meyk4qqAlLEzUsrIUktK2urdPodBqfHvNw/4cbB8aT0+D7362+TtdUNNZI3kv6dNjaZ41dP/xw33kElfcSMCJSIjtp0dekYXbHQSEX+Wz37qlIVUFJGZO1EAUIxQRYCJo3zR+I9QRw+xPJiUPG1EuJnRb0mH+/lwGRO60PNBIXVGaJNNbMU99nZ7GQKjpjZH2YDQuqAvn6OqqAI4vlXfXJEo0yVe4km1S3ajVUSLoPFeg52TvsMPHilscrgkSjvVMHWlWhMiG0KEU/Q8V9V1wdDfaBhgm+IlTJdgWb+BtCAS3PzKCrSTC8IFk+MoFWFcIuH5TFovCtQpadhE07HY5RNCFrhS0emEhTgVZSjF+poGxCPUIC1JI05SpPigiEzGlWOY5YgKVrNc3zUp9G8QXd4RjNr4FxA69i7Oh91nF8MrQXnShKTxtqtshTOkzQU/VGHCZTtPe0XvzrgZ7/YQewClhQnOcoIwXmCV1jVrCuQaKMIodKtQSqevuj4CTEiibLdlXAkCoJClEWFqZw0RPaJ+FMcXI3lQjBGCDqAstVNCrUcC0J0YAG29/Z4+myJ/UJk8y0MCOPxiTQacY7ns+O+JKni6+en7B2M6A8EUZYi15TOkVSK15qobaONgFFoA9oavBeK0pEmrelQtwJjNeiI/MNHChubZqAKvET9qNIFxn6MSh3GjVhZnGe9NU2rTkTkj3/6mr7xeBPwmaCN4H2c/bI6qTgAHe2mxVshT4VxFsjzQFlquqOS3nDMcPiMlcUGd29uce/eCg/uwM3rd3n9ao7t3RP2D8Zsb3eAecQYMmWQoo/BkiZQAGcjGI+EYii0Ggm+X9JeyhApYmkyeIKvpuyMRbTgVOw9huArCRsXWeGlnn8pUQqsiZl1opZIUaiQ8VvItvTe1lQ31UBORD5eZGXuPn/+q/+Vk8FjXMOhkpJ+PiTJWmTJPKPRiDSpWlleg08wkqKVQgWPlwGJFYIu4uAxCh8ibybBRtdTVUSiEpsBXev1VaAOk0QglI6VDxGNC9VwrIG+HMvce5PZQoplsbWId2C0xXOexm5CdhBpfKaB96VsKgK0ggkoQhTmDAYdGviQ4AwE7fBqiFGaRM2zPn+dj2/9HVy4TLP0ugcH3jBUCYXXzCcpw/GIQutIOI0m1RafF4DDNlOGvQ6lG5Fai3cxm9EUSMjj/JivwHAeUJ4sUcy1/5rnrKzVNLL4wPsIFqVOwJWoc9opqtqExYfJZhzXWoMyEASjYs20dgxB1cXFOqrwEdKrU7zSBCRmV+IhxBurLDOcb4KylXOa6sycq+PWF7fWozmXxMZoLNLbO4LkVcT0fvbZjpN/++++YjBK6I1KVENX0NjYtNVSo/omjakLDVM9/VuNDqwBIlXZQSk9gbXHX+vJ35l9b/0VqAkkPnKbVeCTCZoyTvmfnBzz6tULfudbP3jr+TUaK2qvN5BhALEtfviDj7hxEx49O+TZywOOz/oMRnlE1A9KxjIitOZJswybGpQOlIXDF2Mym9FuthiPpnMuUU+qOu6gIjRdCVp5QvBVCUZXcP6AVo4k8awsNliZARb0B3Bw1qVTjGg2G3gdIqs6VO+HelJSgkMbyJoGm7bIypR8XMbxgtLRGY/pDk85PO6wt7fMw3sb3L6xwv27a9y7u8aLVwVbG6e8eXXGydExiS25tj7HvesrNGxc9dIRhyE9UCaEwlDmMYjSBpQEUDHA0CrgUDFwE49WoMXHjSfE14py8f9CVWKH4C3B169571v2t9LaakUBvOh9LgrPj7/4V7w86ZEuKRbbTUZlQVGOsZkl+HHFOBGq4NcRazp1MFuiReElMpZo0dXdVT/3VdYlZto6qJSMo7ZV3KxF+7gvVRmcRz64KgORtcbqBJTBc9nHSZihJJJZJONsED57A8RMMJIgVeCkSog2qBDnsEpHojKW59ZJZYG22Tr3xfuFyD//xRGvjs7wpk2iG5R5gdWGUgdEDBJi68JURRQRwYsjUhHUAZdCVUTA9d5cO1mlhKxhMebyOV+5Tu/1KiIasN2+TCt0ldXlLnE+ljhqZ3UOzlhtv1IHDGqyqYtQEaRajEmqxmeMkOvBXSVCUThcWTMoV0S0Fx9auZxixu8P1CKAsS+kosRFKOE9m6RHhcgf/fsvePzsNUWIEOSmteQhMmFPfORFRJzUh3a+h3Px71S/n7ip+r9n/l6jGmf/HnvCenKOdRkWbeMj6wraWUbZO6XbOYlMIBdsvxQpSzjtwp//8pDDkw7LG2tcv73E4jL83u+t893vr/Pq1RFf/uopu9snKJ8R0jal9nSKEUmpaWYpWZJhJeBzh7gBRpUoYt9QiYmbAAaloux8ogJGShQeRRTK9EFjJDqyRmrYWDvfED4+G3J03MMHQ6yz6Zg1U/czY2NZa5n0HYy2pKkhTQNp4imKAuccp2cjsrSNBMub7TGHuy94snHCw49vcut2gzv3Um7e3mTr2hKHuxlNHbi5ucCdG6tsKaWOxYsuevj8DCnLOFQamuQ+iUAY7eLIAQE7kcIw6GAi1ZMugYrJQ4AQI22vIlI1bohTequL8y5/m+3u/HfUnv9MWq2Un329xMvDz+mPjsgyi1iHc2V0SAq0qoa1idIWnshCEnyKqIiECfjJsD0qr4pwwkTUVatLgUC9jynRaOWr9VcEL/wavgqt9YQGytUVpgv27iHbWVNAhX6qJOOlauaJChgsIcBCY43rGx+RmsvMFcMAL17v0OuPMM1lnFOMxyMarSZWZtCYMGFcDxLwZdyftVR95hkwS136n4WzN5tNkuQyPdtV9t7OqpFAq9WIm7mZcHlcMiVEkIPzEwCEVudPrnZWtQOrr46q5iOkEkczFThAtIq6PdSDcYIOitGwwJUalZjzi1JnHKKjdNQUR10fwcwBx5kdVVEdlWWO98U71+N47OTLx3t8/vUrDk66eDOPblgcU1bit8EeLwINLto3TanPMnfMghRmp921slXJz+GrWTgltoqywFfDfYuLbVbX5rl4rzweifzseZ+DgyEnJyNevdzn6KTLwsIBmy+X+Na3brG0krG1lvKD765x79oa+zsddl4e82rvhFf9kwhSUU0SaYHziA+kmSHNIiUWuhrERqrIUWO1xRqFDiOMDuigQOlYDHUBnEd5x3w7Y2X1fEP4rJ/TG3mMbcUsuV4rXzFVM52qr+c64iYTJdBtoiPfoSSIWUIcFINYth6XJYUr6I1f8Pil4Tvfu8udawn372d8fP8ujQDXZma9VpVRT89OZDFLSJWhLB1FqcgUFGJxQUdxEV2BZ/DooGKPTsX+S8CjKCsAjcITQCRKVNQ9GeK1fRdM+W+bLekt/uD+/8jS4iZ/8uN/xZPtn1EWJxjdx6kxokycYVQBVT0vEkpCMAhZrApJxcOgdJV91YPn4VyA+7a1newpEvv3NcDrfYkPZq0mXKiJa9/VeZx+x1v24GCrKlJFMKsqImhV7xsJKQmrSze4uXGPpr0suLh/GuerMFl0xCFEmru6WlNVjqZ7ayQKmMy/1g5d1YQNcT+cgNtUJAxvt5t//ZmVtdBqtXDOYQ3VLAwzDb2pGRSFL3FlXiH0dITshrc/VBPIsgJER4kAa0nTBjUfloVqITyiYDQS8iJG2kBFOQ/nGlbAtDE5/S5qhnVRKBVQyuCDo3RjvBu/cz0OTwb8+K++5vXOKYVklF6hGgnDYhT7ayKTpQlvocHXNbxUv9thXYSCvg32HZnlFVok9hRxIJEeSSokiwqK8bDPtRstbt/aJJuBW7/olPJv/9MzHm13OD3pE7ylLAJOJ3TGjuGbA17tvub2jRW+8+k9bl1fY2EeVj5d5KNbixyf3ebHv/iMncMTjo9PcG6Abi6hkozCa4pRiU3jPFkCGKUxKgLyE/FRCEJcJCDQCUpHYllfBqSILAVz7Rbt9vmMudMbUxQasgyt0+oBqxwWMvk5rlmYoq7qPgAaYzSiFQvZPGUpWG0otMDYU4YxR2c9jnp9+mWHo3ubXFtd5v7m3DlHVdv9pRX1J786kuPTPbbPSk5OzlCtVUIKiY2ZZBS+E6wUmODQKl4/bTKIWEMEhUYjKkxQq54QnZaKDAzq10Cv/jZbQ60pgI4cSvK7S2wt3+aL5/+R0+HXJC3IpcDhY/ZecwNKNR0qIbYj6upJ7GMQy+RQs7BElocqeBY3RRwyLWVJYDrYX0m0q3cgpa+yGhX3NvmPD3OAlcOrsnQlkSUnDqDHUZ9QKlpmno3FW6zO3WA+uX7u/n0zFvm3Pz/i4GwIyTJ56VHK0GimEIoZR6Uq1QuD0VEfT1w1Y3X+DC+cb51YBNrtJjb5ax4KXmkp9X/4P/4LIcSbYIqoqw5gsp4RXl3PQSGRhNRP/qZnGoMVGkcEXSWJUqHHJEQGApMmsQfkppmTrjKw0TBQ5prmfK3sKahqaDNmFrO6V3W98XJWqJQC7REnODemdO+eJXv2fJ/PvnzBWU9DskzpNYk2OIR0pi7LpW+bfudVGdTFocDZlPn8aziXUU1/r5BYokekGpJUCicOG8AHIVUWvGd5sc3q2gKzA+TbO2f86qs3HAw0IUCjYUnnLJmG4Dx5PiChwZPnJ+zvnnH9+hoff3SLTx6ssbwC7SXL8twPeLNzwItX++yc9OgOC7r5iJFTFMDC8hIm0Sgs2mq0MpUOluB8gVGeWGOPA8GuDLjcg/NYo1iYa5ybr3ozEvk3f/qYolSICszJlK1aqh2+LtUAE6LNOPcWb4+alzFI1OVqJQ3aWRvfVoy6IwaDkqKM8zYv3xxy1jnhxvoqyfe+/dZ75P7tVY57htPPt9k/fIWzQ7KFhMXVDG3AYKsKgCIoN+GJdKFyWkSU6oQtuwo/fIgbQ5Co9hpZtN96GH9rbVGtK4Dt/DOZa2R89sSw2/mStG3xMiTgEVMJOYbo5JWOffRpLb6WsJ9Ssk24RetnDxCJfWCZgZdHGLeagC+0thhj+RBwRW31TOk32WWndXUQrGYzQ6UIhApw5VGiCQW02ytcX/uIhlm89P4yhWd7pwxLQ2kiMjdJDFYCw9EYmxqC0pVIplSZm4agJmwusfeaTKpcEeQ2WwaMfmJuvnWpsvM2+yAi2/ZcE5t8M8xwAqSr8Pb1hjwLsLs4GFz3sWpQgFI6Ui4afa5kQ93X0rGmXIwVZWGrfgcYHXm1zvdgrj7eSXZVOzCJw5rO55TvwZz88uUhp50CJ4uItREe7jxJ2sCXOZYZR1NnUDUW4oKj0hU24qpJ9bdlV+fO49xnUm3QUwirr5SUQwgop0A8a6vL3L61xcpymxryfDgQ+eMfPcEVCanNSFJIEoWTcdz4jUaSBE+GtovkaJ5vj3lz8AVfv17ik09ucHt9ibXU8HufbPD9TzZ4tTfiZ1895dHLPUwhSBL1qIJPo3NJNJIoUhv7klrV0WrUMXLeUBZQ5JHGqZFaFufnWJuZBD84GbN7cELwBoIGXQnBVVGzmVkrpcykVzmRvWE2GReQwHjURfkxWdJk9VrGolui03V0+gVSKk46A6TIWW2c8fxM5N7S5V3j+qJSj49E+i5n9OgZRf8NPmQQ5knTDMnm0WmGMoIxGqcj8CS4SqpEuQoAEAsvMUOMSsbTsm+YXPf/Vu1G9l11WH4py+1FfvL1Egf5C6Q4ZOxGiHhE+cgDiKCUmwbZoiNYQnTFHKer0YrakcV/Y3helawnO1fMvKR6n0aT6ASj33PnfYtdHay+nQT6bS2DejRIE58nUZF5SGNJzDzri9e4vfGQ9ArI+k4X3pyMCEmbIHWmHwmADRIBE1pNEL1x8ja2fqQIqOBRAkYrjDKUVdapq75VEA/EGc35+fdnYPkgZ9VMM5LERg2X2S5U/VUqHnYsb4WIBpQwdQpUZKxqht5k9iMkZj9iiDeSAqWr1Fqq2mtVNlPK4MsGwTVRpCDTLCOeeuQBUpObr/7uqzSv6tq/JwSHD2PycCCZvsyVVdtgWJLaeZxkjFwgoBgOxyzORxjmZSfy/rvJu14/27O6XBqM9WKq6CW+MMTREx//FT/m5tYt7t+5wf3qRjkKIqdHgbNeER9L8YiAl5iJBAVZo0mz3aQYK/Lc44qAkCDFmHznlNPxgC9Txf/0w99Htw3tJbh/r8nqxnf5ePsmXzx5xcvtYwoPpSspc0thktgQbWZRvddW0ZkyUVXZK/Iy4L2QImRWsTDDv7dXivzi6wNOTruIWo3cZcxuOKqCmU5LwTUhcwjnmZ+VUlitCd7RShOsjlyYpR/jQ0ljPiGd36LbGXE8Oqbbg8fPjrm+ePX0P8DDNaV+eSJyNjzgzdEho2LE2c4ZWXOJ0AbmDI1GSkg1uuJBjD08Qeu4cUW5cl1tDGoCSBI1lRJ/z1GVv7W2nnxLFbIrc4sb/NGP/gXeN/H5IWUYoOwIQl4BqaCmNKtJXaOpSbZVb8AaU5ULYzQ5Cahn+i+TfgxVheDXuBAXHdG7WH6+aX9QQpWhx+MISqAaiUBFVfC5dIH1+etsLl6nbc/vcXsi8r/+fMDr4w5i53HeYJIE8Q7nChbmGuQuR0vAY6aECiLoIEhZxGWcQaVEyL+nhoxLRXagtaLRuAyZf5t9kLPa2tokTVPyUYmyJj7YUmkx1SaCloDVivFwgAqCVZoieJpZi3I4Jkwx7udskmkYzTgfMt9o0W63UUbH/1fyE1prvGjykWU0UFjTAm2REDdYXUXWE9olamTclEhXYXAuzieJxAg2TVNCUdAbHGHWvhnWs7K8xnD4DMlalK7EaUWSKLwryJQCFzf4WoumdjDGGIKrUj8962Dr4bgo7DZdTpncnBMAxcwDcXVmFUulZZAoX2ATXFmgC2gYy9J8yvJcylwVVB0EJwLsHHbYPT7FyQiTNOMwrlisaRPQBJeSR6AjSVbNg9BAiaIIjv3jgqNQ8n/v/oIbK/N8+vAW9243WGnDysdLfHxziW6n5Be/esrzN0e8OTyGdA6TLpIPA0NnyRqWRBus1+QOhsMRCSkeocxHZEmb5aX2ZDasCHDS6YOxGK8qfjZDHKKWC2ufVDo+02sbyxSxqi8C2gtWCdp74osDWvk4P6YNojPaNBDfonfUpz/yvHh9wN5QZOsKJpATERkD/90/+h7b+6c8e7HN6zcndAc9+gOFH8Cw2SZtJjTnM2wiGK0xWjAovIus4CbRETggce4Mqv6tjv2O1Q+Jhv6WWqquqTN/KP+7f7LBz7/+Uz5/8iO645eUwVF6h5Oi4mhPQBK0yiIYKZR4n6Mp0YklVBWcunSsJmMg1f6k9VSTTRTeC5aoBJEk77/51paoZCJbArNVpml/bNamz/9sWW1qoZLpyJIGpY/zZElqKzRuHED+3oPv00ouZ1UO+OLlNi5pMRh5Gu1FCh/BPa1Wi6IYY7TCAYUraaRZHNHA07SGwekprsyx1X7kqrIggK8Iyo0ylK7EasXK8mVwx9vsg5xV5AdM6I2mU9oRIV01KEO1adbcdt5HyW9pVRe+QmTNPFazaMDaat8nIhGGbHRVAok9Ly/EBqJr0DsDCZYQIku30lKl9jBNn+sbreqXTYhudVWHDlU5KKCkpD86wvHN8tTNRgMtQr/fQ6Vt5lptChxlPkKCoKth1Frls3YmkR7KXC6FzvSdzhFsvqMMOFmn6r2RazDghSobrUscHkNJooVra8t8fP8GVRLIhrbqs4ORPH6+x8HpgJCYOFioU4KOD7bCItVMmDFRGdXqumSRIGIRaaJ14DgPdPfOOBqMebm7yN3NBe5sLfHRcjz47WORzaU3fP70DSdDx4gxPacYjQOjPogvaM3NkzUSjDEUoyHlqMNcFri+uUgziYAfgP6gpNsbUbooopklZuKAZu18Bvq2q1qVB6VC+scAukJUTR1cmjawiYAyDPMhp/0unf7Vn+iB4SAWGD66scy928s8f9bn0dMd9nYHuLLPsMzp9DWNUUqzldBupLQaBtswWGuQYOL1rCi5vIuQZK1rFKtw7EVW/xbKhnyoLZl1dSJd+fvfX2ZlcY2f/PLf8OqwR7OxRLsVWdEDNgZf3uArJhhrLUZNZThEaWpKZTi/T9XcelGdWCpQhSaxGZn9cGclyIRP79dBE140retj9PH/RK5W8WAlZaW1zkK2Skrj3PsOg8ifPznhaFgwDgptkpgVhboEGi0iVg2iI+gnVJ0UVRbg4uC6mlTPalV2F5MNqPZgR6PRptU+fwzfZB9WBmxltNttTro9gkjsK101xFYN7jrncGWJ9tOZkPj36oaYSa9nZ5ECEmUiVJw/SNOUchAXxdZZiMpAtTk9LTCqVWEFDWpmo49BiZr2pZgybZyvA9coRY+4gm5/n6E/opBjSa9olp70RH7yiz2uby7x5M0p+SjHM4I0xWhFlmSR5HXS5J9mRt77CRfWZI73YoYZpo3dSZO3Kv0gwsUiwewsllw4f8RGjj1XoENBguPWtUUe3NWsKqVOgpcVbdTOYYeX+2eMVUppNEFb0CmKDKVSYsNfxSxDBZIJwW6lLyUWJLJd55Iz8J68U3DSO+DVqyPuX1/lp89L2Vq1XF+IT/3OQOTV7oBffvmMxy92CaOAajTx1tLvnNE9yzHKkijQfkCiPA1VkllY1Uodi8iXLzqcdPuUHrIUjI2Zk9RN0vMNqSttZp4arUAFhVI2blZKoyv0YCx3KLQWbOoxyRg3HjAoxwzy833OPSfS68PjJzl7B6coA7dub3H9Gty7Pcf1ax+zv+/41VfPefxyG68tmCa9nmNtaRlfpHifVj2QVgTMaIUyhuDjQHFMxMvJkPD/36KtqAUFcCDPpJVmfP50jZf7n9EZ7KDCAGUC1sT9xePx4uOQNSqqO6gaTDGT3cyUAaOqdzXUHvHviAjNrPVrZVZCJIcOIXyTOtHV773CuU0YbvCTBMG7gCot7XSJm2v3WWmtk3H+WHMFP3+0zUFnSCkpJontldnzdyFMZl9jhqmoFdddPoaiiGXIGcLaaPWJRcg6CK12g4WFv6HMqt1us7w4z85+j1m0bI2ln5SzJCrg+jIOWaYVclDe8kRFyKjESfK6jFV5YZskNLIWpVQaR0ohQaFNCszTPeuiVRMlCRGp46umc10G1NNe2ASkUZV+6nrzhH5DEF8yGB8xyE9ot64eDl6ZV+rzJ0O5sbXIwckJMo46Tz5YRCeMVYk16bQEZfS5wb939aSurGHP/O6bo684RU7tqDGIC1FHS4S5JOXO1gJrVqmT3IsIbHuRf/3HX3A88KjGEoECr6KEralQULqe6yGAlDELRdBVZFnN1aMUZGlGqlISpSnznL2zHv3RIQenA5bahp++KmVpwZK14A8fzKmnXZGPbt7g6bPXbB936ZYlg2IE4glK4XxJ6vuszy1y/9YKG5U6c+nhrDOk1y9iT0dLlFyZ0UCr1+9qq3nYrr4GomxkS9ESSU0ruLP4HFSJSRwqc9hEoWYQlUci8suvz3jzpsvp8ZCTswHKCDv7p2xdX+Sj+9dJUrh7z7Jx4yFbX63x2aMndIc9WmnG0eEOjTSl1WrQbs/TaBqSZgNd87GhiUOfqtLG+m8bYPE221AfqZHsyfX1G/zkV5t8/uQvOBlsU/oeXueYBEySUHphXBSISOzPVD2fULO+VHd6tNj60EphmIIhQpDISfmepKyzVjurD3rPpGJ0xe9nVCSUUiit8Q60NFlsbvLw1ndZbK6j7flA/MUxPNvv0c81og1GDOJ9ZByymqAqNKpEgl8qZiGlFSaAjHOUK0B8BT6Z7e9FkEoNWw8h0GhkzM+/H9EEfKCzmptrsby8jNZ7MTUUjVY16DzWeZWakpQ65/BFxXdXl7kiTOUbLYSAUYqyykIajQZdrSLrtopS1EprjGrQPTumyA0qMXivoGIFDhOJiTA5PpFYjlETJMu0HDyBo0rB2J8yLA+JLG9X23cetNS//4sdabVTHr/e5dnrbQoxGDPP2JdAGlkSKueED5QS12LWYYkIOobs58g23uaQLrFhXHRkuuJbrG4QG0C8oIOn3TSsL6fculYN1PqS1ayhfrqXy8vtE7p5QDJD0C0IFZu7DigpKlBMfEBUze+jYmlVaVBUmRaBVCmK0oNOsUkDFtsUwfOyM+bxwQkvTvtcW1/g/u0tvuqIzDXh2x+vcHt9hdP+mF8+fsGjNzt0hjlzc3NsLC+xsXCNh5stfnh/2hAux3DWHdMblojOEKOjLp86DwCS+t6T6YYDYXoKs/ceVWYWP4g4ahHncpQIJvL4YMjRqkCbQCM1ZNkMT2EPvnx0yOs3Z7iQ4SVFW2Gw32G/f8bj1y94cP829+/dJMvgk4+X+ejB77O9e8wXXz3Gjx35yDEe9Rn2R8wvJrSDIiU+AyFEqpsQ3ExJ6q236t9q8+FEjF5569k3VaQR2h58JRvzd3n8+qc82/05p6M3jPNTkpbB2FhejbFtSgglVIRyAbg4Bnm+ZF8R5QZFo9HE6A93VkECReUsL6IBr7J3zWJFgEgUa42MNgpXQCptVlvXubP+MXN2+dz7n45F/uV/2mW/E3C6EXt5TggukuHG5MHjqeYXNbGHGgRbf0c+hLKMNFfUz9z0bOrnTSo6q2Yz+5srAy7OR2XW+sGY4uXVpKRv6iYkkZDUudg4NMSs520XQ1VNzcnnqujsrDVkzcZkU/aByDmFhpCRj2E4KJhbNig0IaiJxEZ0Tpp62HhSExZFDTudOKyJqJRn7M7oj44oFr8Zwv6P/+C6erQT5PmbPX7001+yvXvK3umY8SDefHXJT+tIrR9kijybPe8pcq3+7fn1uVgmvaqPNS1ZQD3kWMtsKAlkiWVrdYGHH21ybyM+fiutKCB5cHjK2bDAqSY+aKxOUSJofISpStTpUVqjqVFq1VyIirNAUhPlEpknkmrNldaUAspaxDQJIhyPHYeP93j87DV3rq/xOw8/4v7NOdauwZpvsHX9U1Z/Nc/eySkra8t86+ENbqxwDq5en+t4HBiVHm8hVaBtnUEHaoTo1ZlshQ6U2X5UzLSckkrKI9SYqhjuVNpJqTWMEJR3Fc+lrZCD0YZjOOuPKNFk822USfEq0B3kjEYFvbzk4C+/4PmzEz5+eJ/r19q05+CTu6s8vLPKLz47YPfgjL2dHTrdHoPBDs1ej9Zyk6zdQlRCkYeKTuq/LRigyLFM5evff/u60f5UnZavZX1lg8wmPN21vD4uyIcjdLNmOYnqBPF71EwkGxnCRUWIukh9/4PgY08aQ7PRxqgPh64758jz/J0Vl7fZOUeloFYQr1lOJAg4TTNd5NrqXeYbGyR6/dwXHZwKXzzbZ+xbSFLNR5UCXtCJib1SSlAqgtdERSyBVJmVEtxohJQFWglGYtsgLpIB5VE6/huCYK1mcWme+fm/oTLg/Dysrq7GzdbXi1GBB6JG7KQkCBHyHJEi00WtobbAxHGdH3IFpS1o8GVOo8qsjDHU1NJRwNASfKAsoNcdMb8ctZRiWcTN9KzqzXw6k4JMqVEuzzF4RuMzzvr75OEyyELcsaiZ9Pnj63Hj/+JA5MtH2/zZj79k59hzdJYzGAwIIZAkSSwDVojDwl8tI6CrB0TUZWder8/bmrDnAAQmopUkaESDxTDfanP75jW+++3759734nggf/xXLyKnXtYkMQ2s99i6tCTVMKH2KEIEHmgbr71KUGi8gnrT1KLBC6kSjDWUkuPKEUFp0qRB2mwwHgwxdpFSB17uFRydfMlnT+f55MEtHtxss5jBDz++AekN0iY0E7hK/iJLIcnaaJNRKkvp3PQaRwET6hGI9zVR4FRAqTL2+6hmBHWss0eSZiAotCQgnkS1mN2inAs46ZPOW9rLFrEJTglD24TQYNgfk6llDk8yOj96zcpCwscf3+D+vQaNOfjetzfYurbBzuoKO7tHHBwVDMYl+UlBmhcEEsbDnIR0Mtfj//P78r/RJnIs+BPK4gVKAjabA+ZR6uZ7X93l5Jbqy64opVhd32T+1Rqvj76iUxwRdIlXJcH76v6u+soz4wGomGmL6HM9QmMMaE2r2ST5sC0ViPtkUXy4NBFckWXJtAQuIWZ+VickNmV5YZOPbn2LRF3mAny9d8TpwOPMHD4UE8nCOPeo8BLwEtA2mc6xVr8PKuagLh8jZXmpp375hAONLGN1dZnFxfdn/Pigld2YV+r//D//iaAKIgKsZvSNU+Kq2tiAiBB0AeUDBI/SVHXO2ZJFnNGPA6xVhKuiBIJSQjCCGItpJZjEokqFDYEgHu8jU0WRC8NuSSgVwSeIuAkS7FyJjxm0TcU5N+lThRqeEEtIo6LPMO9SXuFUlF1VZX4kSbZ27iFZW4R//A9ucPf2DfZOHF88fs2jx0857XTJC88oLyiLGImho4RGfU21xGxFBw9aVZPhF763ZjBWaqacVYMIZJpNoKIAYlAVCapglWcuM1xbbfOt6+eJuLYPztg+7DAuI39jZFaImYVSvlpLNf3fBJ8Sb9BQlQKDxGxOSQxbfOnicGCiSRODqhCdRV7QaM3jioKiLCiCMMzHdMfHnI3GvHyzwO9/8hENK6wtK9bs213NZqbUv/zJgTRTg3OCKzyuFBI7zfwiyrO6GSYglXivRcTXpEhB3ZOrcvFIaSQBr4haUpQoEfIiwpWdTkirwelk5knqjcb08xEkTWwGSSvBNFJUGp15Rw8oho6i0HjvebPXoTvosnewwPL6It/57ho3NuD6xhqdszWevRzx9MVLDjoHFJ0BPljCCLJsgVRJNTv3tlX67TeR58LoSzrHX9Pp7pCmlsWVazSX7yPySGAFpdbey2nNqWtqLMeyuXmbpeUt7GfzPHr9U1yxh7aBoEIs7dV6V6qi56o0s6bNycgiopXCqAStE9KkjeH9y1q1laGg9DmIQ0t4Fx5oZl2ucAoqskrG29qjUSQ6IbNzrLVvcGPjAetzd859w1enXv6XP39MvzQMfUBSHYd/lRDi9h419CRgrY3UX9pURNQBi47yK97jfYiisKgJi71M6M3isxVCIEstiwtzXP8AhesPDgM2N1u0mtAfjmhkGwRJol8qx7RbGu9LCJpG1mJUlIy7faQo0FmG2ATvhKCiYJeZoLBUPfOLJhCKEp0Z8sThk5Rkvo1pWOh7LIFSg04TxoMAqsHZ8ZBELVKWIfa50qo8OaHZOT9EK1AVXadNq0kZLXhMCqf9M/Iyvq9fHMlcOn0YLjoqgI0sLvrxuJDfvZ2qN2cizz5p8/zNAV883eXpy32GPsNrQxCDF0UxLmikCYnRhLIgMZq8COhGM6JsQs2ibjCq5gWC4KrSazXwF4JUwoyAspRFQZI2Y//KjbFZyWK7zfcebl66ni8PB7zY7yJ2hUQ0uBxRPt5oUqMQ6yHKWK/WM7gENekP6Unz1KFQpqISckSnUIFYEm0IrkBrMFlCCIbgDCMpeHOUs3Owy/b+gN///h1aq+8uEXzv4ToHh11++WQHZ5scHXRYbKe0minNdgOjDa5mL0BHlOkEUlshpgIo7TEKFAEbKsYIJfjKwaVA4nOUFoJuMg6esTWILknmAjfnpw/dUScHuxS/UVm0CGGcM2cNWhmStTnKsWc4LBj1C4pcyMuS7vYx6cEpO/sjbl5b4+7dJteX4cZyk2/d/5THz5q8ernL6WnOqPCoccHmtU1ura+xmf3t6VqJHAmMgT5wAqO/gLNH6NPPSXs75MWAXncD0/8O6doPoPUdRI5FvSfNUaN63f74tSz+8CY3l+/zq+d/ym7vCc4OosyNKrDGozV4UYg3+KCJGnGOtKlJjGPUHdGw/z/q/utJ1iRN88N+7v6JEKnzZB6tRanunpbTuwtwAewCRhrNANJ4x7+EF7zgFWHGvSBIMxhgJAiQhFgCxHJndzCz07ujumdad3WXrlN1tEytQ33C3V9euH8Rkefkqa6q7lFuFifFiYwvwt0/f9XzPs8s3qXMtlZRX8JYHVX79Ks90CXG2FDqaMi3PgtYpSeljTGYYjpzhYBz6FroqC5fu/odZjl17CV2ROQndw75k59+iFt4HSVJYKW0DqtcJJ93KK1IxCAuoAGtAGIDn2ftyLRhe+8Qn7RJqgStgl6hw46b2JWkiAvlkSzJWJ7//ClA+BLGqt3VZHnwOgI6Lw9hsAhQ4r3FqBzQKFtjqzqALNJsDL/FhyhLCyiJfIHeB9w+oHzQHKrx1ErwqSZJ86Ac7GxA+kmIHOoK+kfg6w7OH6F0ikg1FTlNxiQn3KT9mr09/TxPLQXD8ohhGZtn9KuROk/XBpIkHZIMVhaUWo5ChRcWwo7Z6Iu8ceMKH99f48GzPR492+b5xi6YFOMVOKF0IW9tOl3ydotBZREdtqtWGiHoHeljAIEGpBFqgfggixDshcLbcPi22ym5qrh+aZWrq8mxm/n2Vin/4vvvUPogMqesJ2tF2C4THbLmmiE4OQ75b4aKiqkhVk0iWeikFtmgRYEgLqgmrZaiDUgrRGdGsXFk+ej+Jktzv579/tq8Uv/q7Wfy6Z0R/V6Nzrv0+xZrPbUV2p2MVitDp0GuICi56vH1lVHo6CVKhDCnscfGEuDNPq6BGQevCi+GSiQA+l9I2xaFp6oNSRr2uorSJEoCgrLdSsnThKyV0eqkjEY5w+GAYVUxKCqKwVN2tzfZWJ/jyuXTXLo4z6lZmPvKZW5duszD+88Z9kraec61C+f42uUTmJD/jg3xuwJ9sLvAHSh38f1N6v4z/OAJUj7FlOvM+H3m2zDsb7HTX6dzuMnCmSHMO8TviNKfL8ICON26GIyWfSBnz17gVx//a24/eYfaKbJuC20KKtvDe8GkXVKVh3X3FqGmis6Likq/M+0FNF+sZtWXbfl086eMqqOAMvWBVuzXRVcn9Wk2Dy9ClidUo5J20qatO5yZvcCllRucmbly7JV3+jUf3lun1jMQWVKUaMRbvJ6cA0hQukACVlKURPokIRFBKhucQtGIxDlQVXB8lYqIYR1lVYR2nnHmBZmfXze+sLGan51jYX6e9Y3dcEjiYl2gmYMA0/YSwr1qVFCXFVm3O4a7izTIMj3+edzXEA82b0OqLiC/c1qdWco0w9vAIi5WYVRGXWn2ti11meO8kOSTSOnlfG4EVUzRqrw4lI7w9eEe/eE6fdkQ/Rk75533PmJjvSLrdPn+Lx7K629e5kx3cnhM8159+tTLBx/f5fa9Z2zs9Hi8uRdYLlpzFK7FAMOoN2J+roOKvQhCifMRKSRhfo1ugSQoksCFF4XVtET4Ng4vFVop8jxhoZ3z+rXLL733R2vbrG3uo01rLKOhxvwixz/zdM+JbqqQJzDuE9/1S/N6DAQyAYo0gJNpR2I4cjx8vMPVlZyNUuTMr4karlxY4trlOdRmn74rOBxpCgy1gBWPtRV5lpCa0KeXJEnYYwCigkMQBS0bobtQRI89ajqI6wl5SGO4FLEpYgVDTktPmAC2a5F/8ZfrWO9IVBqZV0JKJZALhxvemIROktJuteh22gxaOYNBj6pQuLJgb1gwei4c9YSNzZpzq8usnlYsLsBbXz1PXUM3hUutv/sRldRPhOoBbnCf0eAR2u6AO8AOj5DiAKoDlDtA+wMMJQmKxFqsLRltOfxwxPzyc8zy64h/R1CX+LxRFsDp5JoayJac6s5yaeUy7z/9lGf7jxgOn9GencO0hH45oqgPSFtddJRIcpUn0RniNO12l+WFxS/Bue7oD3sUdVTFNhpxERrxwvk0rllPqhbHa9VKIcrgfOjDc75GdAtFh4tnbnH61MWXrn7//ibvvHsPYxawysTU9ySnPAbR8YIME9MnhKcoR4gNMHfVPEer2GYh4+c1o9XOOHfuzBeaqS9srBYW5jh1ahlzfw/nHc4HSnjB4XTQoMIx/sBVVWHLihYqysUEQb0Xox6YsLcp0nF/kneKTGe0OzNUJg3IMgzea4w2eJdwsGcoRm0kBa198J4/wyCd1LM0ZphQHpMoRnaPw+FzPD1StfjK+TAm4Z3336Ww8NG9Lp/cf8IP3n0uVy6c5fKp4x7vaxfDz083vNy+/5Qf//I2j7f77A4GVBU400aUYtgfYJQPXHHKI8ahlGCScLDXtmRMwuoBCQzdPjKIKG1wrkCJxfiMGxfPcf7s8fTE856XP/zRh5ROkWThuokRvK0j/PtlpOHLc/by/MHJxuqkMY2ZmPAcGtJWwmhQsrY9YnPj1/efvHmmoz7aLmXl4Rr3n++z1bMc9gtG/R5S5fh2G5smtFoJrXYWjWNIm4r4sBWdiuzvBsEjenJrhR4RQo0WjbMKZxXKakyakKcTWe6ygFEZ6qNNX10wyEGcTggoPic1OhrqPE9Jklk6nYzazrC/v4erLGWheb4zYmtrnWdPe1y6tMqFC12uXIKlnC/ow//tHOI3hOIOR5u/4Gj/Y5RbJynXaKky8EJ4h/Y1SkZoKpAaV5S0TUortxT1NqPtIfsHzznVewint2D57yP1pqj09Oc2WF21qrxsyGL3NPPLN/nFxz/i/tMKVQ8waUkiIXJQ2KAKEPWYUm2QUtPpzjI/u8Tc56ydTc0A/cEhZTmRJWqc95PGNMPNi79vhjYJ1gamHLGKzMxx+ewbtNK5l/7uF7/8hAePdli6cZFaKYzRx5jAJ+jtIKMUlN+bapTCaIW2MBqO8Da0dzRo7mY0CPHwSg6joZ2lLC7Mf4F5+jLGam6OhbmZ8QcwSgISqTnctBlHAYkxOFth6xqDonZNY2nkmhj3v0xfIfQ8hP4jjXMCJiHrzEKSBeE6laHFkCQakZxiMMPRXsbcmQyicudkPSezNj501clGrKkDGeOp7YCj4RNGsk1bvTpcvXb9Jln3NkcHJY/W+jzbvs2TtSNuXb/ATz7YlesXl1hdOO79XjwTEYQPBvLJ0x3e+fQpH99fp18VWJ1ATTg4JY1NHqEh1TuP801+ukZhY01L4yQJTBLogGZynhTLTJbxtVtXOf8Cs/H9Zzus7fQhbeMweGvJjcHaGkxzDDbIzldAauXkCOtVDsKLxmn6++ZvPKCyBFXlbG73+fTu2ivnfnqcWsj47jev8NZbV7j/cIMHD5+ztlZiPSiXUFpNWSsK78mlxCSWLNUBzONBe4P2SWCpMFWML5t+kVDz8qKwAtY6fO0Qb8m0YiafGKtiBGVZhYbSJA2erkTJ0NgsmSRJaFh3FSKB/DQ1QmpSHAlpO2HQrxge1lRDoRoKW/sFo/I5G1vCUf8UVy/OcGYxY09GsqTafyejK6mfC/UDfP/nlL2fI9VDOvqQmeSAxFV4p6ChaBRQ2mN0ingLzoIdkrkS7QtkOKB4vgO7a7RuCMweIPaJqOTS554bHXuy1qsH0u0ss7qwxKcPfsre/nOyTJHkQuVG1KpEGyHREg5n65lpzZPrL1aDAbAU7O9vU1QDvBbq2iIR4vPK8YpP1CAW0ySnKIbM5B3SssXy3CWunP8Kcy8Qc3+yIfK/+4//S5yfwaTdIE2jVawvRzCVChdUMdiIRWwgcFc27C9Fv4d3gSzgpDcYyBxCRi3LUubmZ2m3vxjbxxc2Vp1Oxvz8bFA5FcKHi7Q0029S6VBML2uLHZUwBXTQRjhxxiPKQhOa7FSi8d4h2pC226gkxavQOT5ms3ApZTHH9paweK4VUSuhGvKqnoXP6mfQWqG0BVVy1F/jqL/GwuytV87H0tIMC0vzbBxsQTJLDTzbGrK1+zHvf3SPr71+hXdu78ils8ssv2C03rzWVQAfrYl8dG+de4/Xefhkk42NI5wkiEsQ39AeJVjlcGLRxsU5jDW+Bp4dzlXEVWgcsxlcOj3PlQvHoaq7lci/+LMP2TooqGhR1C54PylRRC3qQDVrqU6es+nfvfj9rxsnPV9EQHusLxDlOOoXbGzus3kocnr+1emuO2t9uX9vg4UzZ1hZgNW3znDrzDLrW32ebxc8XT/k2c4ho6FQ2IyWTUhzTStPyNOMVGsSVNg7Cry2gUmFUK9CBWNlVTicKutxvkL5mjxJ6XYmN92o9BRlGXksmxqdHztI3gteNXUzIKZ7Q8Ex9HN1ZmdodRTzc4rhYcXRbp/ewSE7h0fs94Yc9dbY31nma29e5NtnX90Q+7d+yCbl9k/p7f8lqn7AbNYnqw/JZAjiAqNN0FQOauEiIbpRCnFB1cHgyQyhZaUc4cqa4tPvkZ9aQ53vIfUnotLXv9Acnc2uqYFsyJmlJVYXT/PBnZ/xdPs+R9U+ta5QqcZTkCB460hEszB76kshAQs/4KC3h/M1Kgu9qSElPQGFvTRt8euJzDYq8BvWdajfdrIlrpx9g1OtC8de49H6SP7ilw94ut5j5tJV0Cl1XSDZtHzkJGuChCO+UR5SQGiUD+rdo/4AavciJSd6urAgHrzQ6SScP7dKbPP83OMLG6szHaX+0//2T6XdyRj0g1aM1sGbt7XgnRp3TiulqMuCshgG6nhlMCal6bcSXGQ+mkLloce9MprApefR6DxFsgRlUhCFcgLe46zGVvNsb1re0G2sb/psGu9g+kCUcS51ekz3efkIA9dG6A/XOepv4mZP7osCOL2o1H/3h7flwwfrOJ+CSXEmo6BmsN/n6L2HfPzwGefPLPLn7z6TS+dWub6aHXsDb50Lb+DB80LuPlzmT374LkdD2D9y9IeClQQxLUxiMNph3QhPhTZNcyTjr0oLWEsr9awstPid16+MwR7NeLRe8XjjiKPCY02gkkkSQ12OSFIdD1c9NTcn16+a78c3VMPH94qo9VjOe2rOjzc7O5QZUcohxoT+NHcCLPvOlsizJ1scHvT4oz/+CaWFN7/RIb81x4KC106FOX54IHJn2bC0AduHJb3CUzlFOTBUQ02SQLsltDKP0RZRLtazQs0UpcaExLWEnsHS11gp0LomyxTdKV9gWA8pXYzMlIp8gkFZKNwTHnE1Spkgf6MUsR01HAhGMRwOyfOcVieNfW2KrJ1TjQRXGbb3d3F2j4QOH65Z+cq55O+cwRL7VOh9n/7ez6j6v2ImPaRFiq9KahcUpFRElZoksOXXdYnzsW9TGxIVlXBdcAK0SmjpmqOdd6iHWyTDDbLBc3z/L8V3r5Go818gLXhGlbIjc2+e4tTCVd779OfcW/uIg/opA1nD1WXQeqsdedrhzPJ5TqmzX2gdStmR9fIe+71tnNSYNKGU4BBN6vlTdanm1SOIqnm4Y0hAsLbEGIMtFPNLp7l+6SvMvPDe3vv4Hv/6Tz+gsDmn5haoAy6WaS7kkI6MF5QGBxDelBAUqhunoRgNEFejfSBj4BjxwVQlT3nSNOHKlUucX/5i9dYv3sEGnDu/ytxMi2HfBukJownuTcMWEYXt8HhrcWUVrG6i0aZhjpgcbKEgF0JLJUHmDNdg8kNBUacJkqb4RKNsSKkENWKwdZuDgx6aGcQHqRClP1/jyfEG5ZCetKIwRlHaHsNqj5Pqa9Pjxs2LdDoZBTlO2hz0BszMtlFpRq8u2dsc8mSvz/OjipWlx/zxh1ty49IKV+eOL9a188HVuPO8lEdrB3z8yXPu3t9mc6dmUA1xVYrTHp0EPS/VRI/KoKJaqQGMUcy2ElYXu7xxbfWl9/t0Y5/9fkXtUxyaVisnSzWDwT4maU9Sui+l7U6uYTWjYduf/lAnsW80TPQnFZDRFmM8zvZpd1fodFrHGjDXayt37h3wFz/7mN3tPnmeM7Atysry8d1nfHrX8ruvXebptsjFFaUaUcQNEXn4fMRHd56ysVlwMCgZDj2F1tjZHD8b1YeVjFkKplfHqwjJF0ctTY9NjdEZaT55g6WzOB98yYapZAwkiQ6AwUQm/qir5SK/nxZwinaS452lrEagHYvLKYtLLY4ORhzsHNK2ywxGFfcfHNBJ93m8K3L5C974f+Oj/4Ty4COUf0gn3aKtS9J6HnQGSSTBdoI4O+mFi4Sp2ii8DarSSnRAySqF8xZxfbodzbB8SP/5IUmxy6z0SC6MEHkkSl353POUT9WfHlUfycq9n/LRgx/zYGNE6WvSBLyFTmuOpZmX77NfN2oKBsUhvcEhlS/IVCgX6XGd6IXo6YTMxvT34+cqRztv4QcJ8+0znD917aVrf/TpM378y9tkq9cxrYSKGlHNfWnHIIpx7TqigDWhzqsklHSUs+AcrqjARQqzBrw0+Rhj2iUtHqMVp1e/GBIQvqSxunThPFliqOoReXse0BTDkixPER/gxgaFr23A29cV1WhEvtihjCjBEEGN7XachBD9OG9JEh20UxKFtRbRnsXTKwy2N/C1JTUSudE8SbrI7s4+h4eKbKZNUGUJ0VW4xIROR+tJsxocFzIc19PS0A9Wuz7b+88YXTz6zPlYOd3l4rVVPr7XB90mzbuUFaAVolr4JKXC8vHTQ8zTLe482eL86Xl+76cP5Ks3LnHj1HHP+Nb5XAHc36rl07vrfHD7GZ/c22BYWyqnqL2mqBxJlo03qTGGurAoI7TaDuohb1x7nYsvHGKfbjj5ve+/h9OtkFLRoSO9X/ZJk2RsTASDUv6YMX+RceQl4xWBCOYzIFEiEiNxPZ7/5ucGWt4fHjA708LVBRfOn6U9KQnx+Nkmf/HzT6jcDOIz+qXBpLOQwd7II1b4wQeP+fhpzh+9sylXLp7i9LIeM2BsjkTW10s+vb/JRw/W6ZUOajg4KHAJtGfaJAhzc3O4CmpXk3baaBPQkugEJzWVDT0meUvR7U7SgL2yjJ6uGSNSlQ4ZAuttKHoTJCHGkX6T2moyDLVF4UmNgLI4KUEMnZkW7c4F9rdL9jf2GFXCo6cHnDv9xQrVf9ND3DMpn/0bBocfk8o6qS5Dd0itQDIqCqwO9Q0Rj/GBSFnwJNqBDW0EkY86IOe0RpQdo5C1UcypbVyvoPfxBvL8I+au/CPEfSTKvPWFDfuV7C31oLwjK6dOM/NhxsPn79E72iC1CfOt05xZOveFXq+UPSnYY2d3nV5/F2WgrOvQlQ8Q4+3pyErJlGMtHFMWn2RABG8LTNZBM8eV828y3zpuSN9/0Jf//X/8f2dgNaurp/GpQFKTqmxMODCBwhOPz4acVgdZFR1KNonSlMMRo94RGZCg0GmCFUddO7IsQekEW5ehxqWE2W7OwtzLLBq/bnwpY5UlmsX5GbJ0gLgKiZ6iMUlgppaAENQqCsiVFXVRkrtAr+im0nDNQefim5HIx9YILQbafIVJDCpNIEkRNQx8V8phdEpdK+o6Z3+n4tzMIl5KgsH69ePlwxiUCmAFpxyD8oCD/vpnvkanDWdOz3P/cdAmMjon+CWBudlKw08eenc2Dks2dh7y8MFTbl85xx/+6IHcuHCG1y53jt1E11dTtVuJfP2bF7lzf49fvPMJb79zB3EZqTfkyoCJXmgxQlxNPtdiqZtyenGZ1aXjjMY7fZGfffSU7b0jesME7w0ZBqM1aIM4TVXXY2tzPD336+tWL65p87cv/vyZ6+GFXKfkGlaXFji9PMtyN/zRthX5yft3qVWOTXLQ3XDTGBcYkCQY2s3RgIOdI9Z7Rzx8vs6FlS4fPD2Qr15cUKdjx/z6kciVy6e5v7bN870em70Be72S4WGfubk5UinJ85zEZPgKCqnRNhiYUeHR2pAnOXmajiPJLRH5/q+ehRKzTN/w8SD5tZ4xAdnpA62PUhZM+FtRCjEBjZhmLcgyfFVTilC6vzv6IOK2hfohrn4C9RpKHWF8ZLNyAbYtOtRePIKRcBcpJxgPymuUm9RUrY9AGBVPDgVCghILMiCphsioR10MKK3GHw2R4YeiOl/5wgbrWn5Lrckjmft7Le48vM6HH/yMx/eeoOZmmO0ufqHXslJj1Yjdg01KN8SrkCmSuFdO6px7CZV70guLkCUp9cjxxoU3uLj6Gs4d54/80c/f59H6IZVKkDzBqpLK1lQ29AFmY4hHgzNwNC1FIg6jTOACldDqMhr0QML6mKhO0DjQx9638iSJZmlpgeWlL+5gfSljNdPtcO78GT69v8dgWKN0jtYTd1qpIOugTEKqDPWwoBwMmbU+YihCbcgxId5vPlTwJjxameA1RcqEJE3QrTZJ3kJ6RyA1GkOSJFTOU5SGtScVly6tYjkAKRCayGBKS0WERr2qaeZsAC7hYAkwcBcL6/3RLhu79xnIc+m+Iud9JlPq99++K+9+sM6oqtCkgbQnoiKNBi/h8wqGyjpSPcNRJfzq0y0+vrfF6eVF/qvv3ZfXr1/k3ELKlZVwsi1n4eueWDlz4av87neu8u77T3n4YJvNrT7DYUWSarodQ5rB8pLhG2/c4uLqHNcuHu9W3zwccPvBU3YPRpS+jVZZULxWgdDVoWNTN4hqGo7hxJTE1FqfZNROGs1zX4UKDCNB2wwjntWlZZaXJv/jBQ77jooEn2SoJIHExNpQYNfXGJLWDLWt2B3W7D8vWVsvefKk5A9++FxOL7f4zhvL6mxMwW6KyJM1xy/euYMcjbAqZ3RQsLU/ot1uMzM3j2qFfaZoYZ2jKvton2HEkZGPm7VroKgC279WHqMDmaeKhspHw+Xi/OiYWhk3YDf1Cq9jijcFDCSBtFWRB7BNViOJYG1BKVC6IdsisvLrPIG/DUOOYHSfunyE1PtoXY2bRfENCjjwexuv0F4wLgm6UZawCVwa6zpCEpGaAUPngnyQpKCSWORxYHvo4XNkpKj3+2RHI+TRnwjn3kRl577QnJ1TV9Sh7Mjqm1c4032N290PWewu08m/mLFSyuOkYnPrKdZX6ERRScgy4In0ZSffM41A5InWygUiAV8Jp2YvcGb5CotT0vV/8tOP5b/4pz9gY29IunCRpNvCacFRoyQjCNBKJKaWoAYRa1ZNv2lDzC0+SFcMDo5QzmIkpAG9eEyaonSC9yGNGzK4QpanXDh/hvMXvth8wZc0VvPzKRfOnyZLPubIl2TJDM57nIWGd805hzYpidKMypKiP8RZi86ygH+aQq5ER2q8KN6H0B8XDnhvHGliMHmHtNWmIpDVKhUOkbL2VJVm45nDV6dR2ZPxOp4YHYzdlpdXO9QQgvEyRijKA7YO7+M4oJRtydXKiZv76vkVlhe6HB71cb7CN1OrFcoH1BKxaJ9ms3hvKZ3D24rD2rI7PGJjcJ8P727y2tkFfvLRkVy5PEvWBUWFUPL6wtz42j94f09+9c6nPHu+Tt7JuXjpLGfPLXH29ClWF7rMd2DphWbarf0eG3s9KqfBZBhR+LqilvBZ0QZ8RO8cMzi/Dt332bWsZv5f7Mk6MSLzgpJAUbQ0P8uFKRSgq6EowErgojRB7zGQ9uJAmdisp9GmjVEzeFPRH1U82inZ2n9GOy34H/78Q7lx7QxnziyjgavnDCsLb/Dwcsm9R5vsDh1P1tYY7G7hi4KkW5J1uuRGMawqcp1RWotyAQ2YxaUuKxgWPoo3TkdVxyN3IJKMNvOlowfbNFGCeBPTLxqxYW0a1kLraxwFjgLrPLWUv2Z9/hYN26PoPcGWG2gpSI3B+JgSMrHgIYG1WznQYtBeg4vk2U5FFz/kp0LzfJBVb4AA2EDi7CMzSao9RteYcgdVG3Z2DmjvrNOtdpHqUyGdpyIjV58PWTk/VctaHz4V7WFeX1DDals62cnnw4tDEAZFj43tNayUmAScDQAHF2HhcHLN98TXG997CrEw3znFYvc0HbMwfs6j9UP5P/6f/0vuPDykVBlLywvoTk4tgRUoUZpEJ/i6gqhB+OIYn5zi0CrIBQ36R+NalYrSO6hGqmlq7ztPZgyrK8tcWPzijtWXMlbLuVL/5f/vx6IN4F2oK5UhD5+Y2FzrfQjfteDrinI0oC4LkjwP3qQKelhjhAmTCfd+6kEgFHWiUEmbrD2DSxTahn4qZQxSe6w3HO62GB7Nki23QoQWk7pKNyi0SV53eoxrC00IjkXpJLCG130Oh4854jmLLLxyTlaW5jmzPMfTJwfUzoxXVWiUNGOaUymkFGrrqT2YpIPpZHgRnu9WPFtf4/mjHR4/3ePmrTNcubLIlStLXO3m48Xdq0VsDa9f+3sMRgHGPjOTYOMmX8le3ggbvZH84N2nHAxKKt9GqYZEONQAUEFwzSsdQX3TcxRTUVO1lZf7pCZZrldFX5/l+DdrIBKIN+c6htXl43ntXg9GQxfejyagD5VDvATEnRKUNySSADqIXrZybGIo64RRXUAtHDwZ8Mnafc6tbPPV129x9bymm8Gb13J+561L/Oq2p517Np49pbBDRv0aV/WQViuknVSGqmuUr5lJU1aiUzDoQ+9oiHPBATNj09NAeKcQVahx9B3mKD5TQt8cMSUo3uMJ1GKBr9BRuQLva4QqSDR4z/FEz9/i4SpG/W1cfUSCDZyXovDegarAaFQTHbnA74kPUdd4iInbUwgQd4MoixaH8gpXWUQ01kQkmmqjDSS+xtgdZuoeo+cHuHqNueETuPRtsrkrX+rjnO1cHG9q/QVWwWPZ3dtib38D50oEh/Me6yTKKYXnTe4tNa5RqResyMQxJwJODEtLZ7h15Su0kknv1wfvP+H2pxts7Gl80iWd6+KM4KwK970XEDsFNp+8h/DisV1JXHAolMJWNXVZYQAlDj0tyxNfKdGBBcZT0Gq3WVh4uTn584wvZawATp9eodvuIHIQJyqmNnSK2BLd3KjhLqMqSsrRiGxuHsHhVWTqVuAk5Kab11ECOA/OoHSgpq+9kOucdneOKk3RVYm1KqoGg3MJo0GHnQ3h/HLr2Ht6CZ32ws8vRgZeQnFbjMfZIX27zsb+fWYXb7xyPs7kSv333/tU3tOPGVkX+kPURFzRx8MHoHKeJG2RZwk1nqqwQTZEGbK0y35R8N6DNR5ubrH6UZs3bp3nL28fyNlTc9xY0Wop/eJeSeEV/aLmoFdQuBSTVLR1glE68OJ5wdnQS2TUq1SSfn3k9CrDdCyq+AzDJRJ6V+ZmZlhePs7RcHQwoi5DndJrTcMIDxrtgzlQSshMgnch4rJaofMUnyR4Y3BVxvrRIYszbYZrI55v/IIrZxd57doFLp3tcForteFElhaus3F+hvXtXR5vHbJ7dMTw8BAxGTUJWarp5oaZzuQ9liOhKIpQe5Djn3fikKm4D473JTbfexVakINymMMhOB96b5ySSK8VhhYifPjXRb5/m4YJrBTOBRFPH1QPrNiARsOgfBLPxahhR2iCl7GOWvgbJTroKjHRbVMxQrCA9mEuIayBEwfekZkRSJ/B9h5bwzW6O2t0r/47SO+JqNnP30T84mhln5/iyUnN5uZzRlWBj/I7x2s8L0dWwslp92aIBP4+LR06yQKXT19jPkaL9+8eyn/yn/1Ttncr+mUbtdQh7baRROO9QUlgpxApUWi8FpQHr+P5+MJ1GkaLIINkMTErohVoo6i8I4kdW1olwcChWFqY58LFLwZGacaXNlaXLl9gdXWFp+t9nHPRM2wiJcGYQKjonENjqMuSYX9A55SLhOeTG3gSWjYGrxE4UxidYylwFkRntDuzDNMUZQx1ybgg6y2InWXjecGFtzKmF1u8DoCNKBMy7Zm8CF1XSkVKEUGUw1FQ2B3Wtu5xceEffuacXLt8idWVJxytHQQVEkXIpEsUQmxyvirFVpbKF4AnSw2dVo5SgdevzjSV1/QlpfdsyNbGI+7dPuDa+SV++PahXD0/y/mzX4y8tNXN6c4vYrIcGSq8tVgCJRBaEAt1ooIchlbIFI/XZK4aj2+CoHwZTDFZy5MM0q+PrhxaOxYXc17UZTvc20VqITGB9y80GSqMN2NjBUJdDEKJWCtMkob+NGMwJsGmllany6jfpzfq00oUo6d7PNrc58K5JX78pBAPXD4H506dZv9wkTPrB9x5uMb61jaFLVheOsOZ06dY6SRcWJ14iUbFdgtbxyI/4AVPI1CqArzfBMFKH06f8NnVZL68E7yqQTm8sng8oUae0ZAsKaXxPsHXHl8nqC+miv7XNmrZlnQ6da46zLQXGQxzxDmsK1Feh89pLM5rMpJ4vziccsHqGB8Uar0CQrpaW4NShIjAh1q08gp0EiQuZAi+Dn+nNNak1HiUtZhU03ZH9A/2Oer1YH9I96pD1u8KpxZQ6edL533pebGWze0NlAoHvNdCYpJQj3LHyxduCoF7Uqp9uuThvSJLZrhy8fVjpLq/+OUH/OLtO/R7Gtot0m6XtJOFHkKbYlSKkgoVJUokZlTHwJ9XjP7hUahxuaBTo00WokAX9A0h4A4aXb8zZ85w89rLUPrPM760sTp/usXplUWy5BnOhx6fkK6zYQNpHaIqLEYHCQxbDMGWmCTHqePcayGk10EiJOIltYDohvcuyFCYvIVkHVxaRE+zJtFQORDXYW93H9wc6G6A0asKVM24aQDGEU6joaV0FfOqUW2YuGBROtz6I/YOH2F97zPn5OqlFpfPrfBwbT+mbvQY1eRjigtAKx2MBAR2Y+eoXYHGUyuHyzW1F7IkQ3RCbwQPHh+xsXbIzvYhly62+f5P78pXv3KZ5Znsc91UZxKl/uJJKaeXZrB1ibce8eC9Bhsz/gImS1DeRmSaRPoVON57FWosY8QbjB+o416fkikdrOilAXg1IT+ecId5DBWLbcPKYofTL2hZbR8e0qsLXKsbYMsuRFLapRFyG9Yzy5KQUhGPc3WoB2mFSOTpU4ruzCx1loEb0a9LDo4GHJZbbB/0ePS4xdVzK1w4s8Ibq7naFZGL51e5/+QZg2HB3NIK16/Os5DA+akoVyuHoSHzVCgJjZMQi7LxUNVmQuQ0PmgUNLRVId0jKKkRFUQkDZqGrCwoQBu8C/InQQDv8+yCv/7xYsqKdB4zcwbdW6IqU2ovJIqQsm2OAXFoSaYbTPDEon/jTBLOGyWTaCTeXVgbeRclyr9Ep0FE8AJpZvB1Rag1jRgVa/Qe/hh/WNHafUL6tW8j1X0hXeCLEOJ+kTG0Q7YPN7G6wLlwBuhU4WxYb69k3GPf3DZNc61rUnLIVKNw2N+4lJl0ge+8+Q8YjTw7xVB210v+L//Jf8dB35Pki6RZhyzNUTqh8kLpLCmQeU+ip2Trp/DxQhD41BIAqiGqd4z6PbSLzcHSqKCH7JjGBIdSHN6VJC1heanD2S/GXzseX9pY+ariyrlTtLXmsBDSdpuKIaUt6CQp5WiEThJSYwCLLYcMDrZxo7Mk8xnDqsTrnCRLcdZRWxeaixVoqREXCBmd8yQ6JZKIkM90SBdX2Ov10JlD6hFGNLOmzWho2dwuGfa7dJbPUpV7JPkQL32M8Qz7npnuPLYGpRIEjdIVTlUo5UDaIAqlNaUjNHwag6sOsfUW29t3KWVX8lds4JWuUn/0/XX54JMNtnuOYTEkbaWkrZxhXVLXNVnaQiQYiknwEoAXTpkAIfeQ6ARrLYlJSFrhMC4RPnzW4/b6GisPNEUn+0Jrdu1cxr/9rRv84leP+fTuFiqZQ9IuzmpMnqG9h8oGL1ZF2iqlUDooAosorLNkWbxu9L7QHpTCNGg3VYMYtE6bXR8/rEOZYKicdyQmQ6uE2lYkyqKwGCmYS1Ourywce+8PDyr53o8/YZgIJElgq8djRKFUHVsEcgLZbCQyjjBPFQEjRoUbTQmoRJEnCUIHV2dUVUZRFTzZGjCsPI/XH3H51JBfPRapSvjaKaX2RKTycMYoteucLJvjQparixlfuXmZ/aNnjOqE3kGPVm7ozmShLuEcqdbRJgmuMeiJoAw4sXjryUw7pPZU4MfUElj2LUEaR4vGWo+XAGevpKD8W2qskheIXVV6TsnR96QwK5SqA+oAqQPWMdM5zromIYohiHmKT9G+UWVQjK2YD5pvDRZAuRCNJWWthx8AAQAASURBVIRan0hIP4kjyHh4Yne3R0t4TWcViR8ywwZq/wf0eh+TH31C97V/ADe/zRfRyfoi49H6fR5t32XgDmjP5xyNjjBkZGk67sFT0SE0SqF8gkhohRFXkbaTSEl2yMLCEqOhRayiI7NcnX+NM60rkKxS2zb/t3/6e/zkg8eUqotXLWzlObd4Cq1TKutAg8OjTEpd1mCanr8Y+EfAUNPoK07oZhnlwQG6qhgeHrCgEmZmZqgGA7JWC28UYhWJyrC2IsuF1Aw5vZqzMvNZsdqrx5c2Viszufr//stfyanFBXqjOjTupp4kS8YFQQipGq0USI3UFa4s0HUdQT+Cd9MIsZh+GqtlxnST6AhytzgF6cw8krbx1SA0oVmCkSGhrlO2tzyX5pbQqgCKaO0Dxr+5FkBQFos7PxYPw+GrsE5QrnluRe9og+3d+1w8tfWZ83L5/ClmOy22Dg/DwaiEui4Bj0pUYHUnCLqZGO2Fzxo3Azr0kDGmTw11CxRaotS2OLYGA55uD1gTkXOfE7J8IVHqzm4taw/X2J0RRlUFbshoZPGjBJUltLpZ0NYyCmVCRFvXNcanZK2cdrtNXVbjHHqYx/CdUwrEj9MGyje8kT52sAeoa8PM7CNDqfKR7Z4aQ8VCK6PzAqX4zsGInf6AoXVkkXE+7JdQZG+Y0S0hmot32Th0USoqWcNY1BITPH+TJmRaoZMEcW3W949oKUU1OqAYKbbWu/zi7kCGI7jQiS0FLxgqgLNtpe4eiNx53OPR2gF1ZfEO6ioAWLIsjxF2SDOHnpTGK/WIr4MTk4TVJyKrtChEkhC1iZriX4vIQe0+t7rs34rRWqU7dxlXncYVh0BBgkXVHlU7tAlpUVxYSy1xi/mmHaS5f6P2mkzkhUJw5uJXjfg4fwSEoSCIi9GYFfAe4ypESow6At+jeljjq4oZV6Gufee3/vH35In86a9+j0oGSFIjKkEnKtTpdaz2RydLqYAuhQieQI0jrLIckWaGuq7xFlpJB99PuXz6Fp1kkaFv8/a793i6fsD2UUW/70jaLdqLC6RpGllUFKIiUYMIx6vVOty3zfmkCI3a3uFqoRyOsKOSxAHKYW1Q3/ZiieSaEJXHlVjm53MuXfzizBXN+NLGCuDq1assLs3x6Pkm3tV47RDlSZTBo0hUJErxguCpy4rBYMDs3EJIuXmHl9iJEusfPh4owQmKGxFhuk7SnZslzTPq4RCjU1REhGmlqEvN2tMh567MkaRriK7QKkd8QppGXaFmBVQT76bhRiCgyJxzoDReRmRJipaMYlBw0HtKUW9+5py8eTNV/9f/5iN5vLVP6gGtKWqLSjOIOeWmX6EBdzToMJqajwCxz8FjIc6REJBTic7oHe1x984jHlxd+UJrdms5Ve/e3RVVltx7ukvpIE0SKhSVq3C1pRZAEnJlSJIsINnEUgxHDNwR7XabIJEQUUqxm8hHT0w3hhiioQpRlRGHR9BRgFOJxygPRuFdkENJtGZxYZbZ7nEajL2DQ/r9Iaj2GF4fnep4MIW9I+o4TVIzTipKN2waDbR2XOBWgcyzPyr55NFTnjxxzM8YXnvzPJsicvoznIObC0r9+SORnv2Yza1d9g72SUcd8jynMxNAE8HOWcChm/SqVbGPygRGdhWctvDhQlaBxgZH428IKc1EgvL235mRdmgvXIXhNYaDLfDrJNqC8+HgQ0KfY/Q0xMf7wsdkc1NUiXnRxpg1NRaIpQXffC/HHtCg1ab+z4HF4inA7XD44G0O+7uc7u0ga38pzF9Hdb9YT9arxv5oi6dr9yhtgU4MjhpjhKq0mLQV928jyRGMLs35CKjE4MVjvQTnsfCINaRZi7n2IlcuvUFbnVHvPHgs/+x//Bfcv7+FTlI6sx0kyenOdclbKU6pmK4D8THNeqymP2H+gUCVpAhGyDnHqD+gGI3G95S1NvSU+gYRHiVUCHWr1dWz3LjxapDarxu/kbE6tbzA/HwXrYP2ksNTVRVZ1jpeEFQhXK+qikH/iFl/liRJw+1aW1IdaH7E23FtpNl4U+CnsffYac+QtzpY00Mpj4/MAok22Fqxs6GwxTydTk6FRZHhrCXJHCgXb3g1jgiUtAgR1iT/nRgQKRGEJMmwIvQG6+wcPuDIr8mcfvXGfeONy7zzyV1G+wVaEsRptElRkQMupNknImehZKcDr2F0SJr6T0AR2oit1CjAeaGuFWtrW9y985inR6VcnMs/94309ZvL6s6TgTzf7bO+fcTdp5s8Xdumb0tKm5Hni1iBuqxwdewX0uFgT7KcRiJe4jw2BqPJbisVWg5CmUrQXlAmNBtqH7r0tSL8HKMkX1tEatJMsbQww6nuxCDsVCJ//vO7VLVgWhnig1iiiMMSPDcnHqdCm7mMLf7JBsqMOfuOG7Em1aFaLVKd4JzGlRZbWQZ7fbK1A85c+PVIhluX4dnGHHtbz9ja6JO2F2nPLtC1QtY2tNqG0HzuSJUKitFeSHSCVikjV+NV8KpDtB+cp1AtbIx8ABQYH5CQDZr278Twbeheod15k4F6jsghSBWMkTETB1Umh2fzVUWrJMe+NoYo7kGvjv1ehcJxjMoCjVFTD0pUgleC1wEEoHxFWw2QqqS/dsjW8ICVwwOy1/8d5HBN1Hy473dFZPlLNmEf9DdY236Ik9AM7KjQmcKVwdFHxeyABEvivQLR+GZ/qpCNMcZgVCiVKEmhUNy69RUunL8JwP0HG/zi5++zd5ig9BI6MfTqEcuzHUyWRJKCEP5MgoJJ/S/6lPF3bpydSIyC0jEaDrFlRSdJ0N7jfY1JzUuwd+8diOXM6inOnf1izvX0+I2M1ewsnD+7Sp7fpa5KtCYYDO/HhmX64PBVRdEb4OsKk7VCOqy2iNKTDakVVppkaZw45YMn7wOMNUsMre4MI7OHd4HNXalwmHrXoncg9A+7zKzmeCdosuD1I0DNmFVRRfkBSUN0pQOLuVIq9I75irIq8cxhRbE/eMr9J29z6fTf/8x5uXG9y+lTXba3twkZ9E6gkvEpgotUUX5irNDhxmpAJlMpABEXDLZvCKmgKiypyRn2S54/26J3MPjCa3frUpAneTYQufRskUeP53i+ucPGzojnO4cI7XjIh1oJokKTd6tFXdcQzBUNma7Sk3UWr6KkQ2PCPI1omxIi+XEO3o3BF85WeCrSRLG4MHPsvY5KOOoV2FqQTKMistKj0CJYRbztAtpTmvXlOJS+OaCapvCmb6zR5An/ZwL+JmuRtDVGpyRiKQeH7BzWfPpoi3tDkRudVx9U55VS76z3pL+9wKePtiil4OjogINBwczSAh3fJkk8nSzFZAmpFrAVxtaIkZdR7fjJYaFUQB2q8DmN0hjM3yljpcxlJf6pMPMNks4GrrdNURe0XAVpBnVMD8skZFIwEfYTJsbLyyTl1KSmm+RJ02ztJ8aNBoU8/nniqGgMiMMNd5lJUjKV0t/usX10wOz+AXNfq5H+hqiZM+rLGqqB7MpffvrfczRcg8ShUrC+JjUZygSnVlzIqQRnKoiEOkIjvCiwhGxFlmV4K6SkIDmJy/nWW99Fq1kerB3K/+O/+T2qUqFVyqAMdWGd5mSdHDHgXI3Xhkb7Q0jG0Wa4o6LoaCO1GOctMVCVBdVwgHd1EKwXcN6TxpYdZUxgHRGPOEueK86dXaX9xSkBx+M3i6zmlPqv/j+/kixXFIdHqHaHNEtjpBMjJOdROihKinWUxZBqNKLdmSFRCZXIuON5ur+g+ftQbWrSZYGR3YmiOz9Pr9XGVhWZSUJDoFIolVMNU3Y3NaevzaBVDl7HFE8dUijjMMDGsCZpLhg2hmvUjy0usr8neYKXPlsHD+iN1ihkT1qv6HhfWICrV05x7+EjeqMROulga0FpE42yRTc3XvO5JYgihCqKArERzhw7RRoxGTF4EpTJqCrH9tY+u7v7n2u9nm+LlHXF3FLGqSiHfiFGMHsisrs14u7DLd69vcHGbsHu3gGFdSSmHch4S6GoK7K8hehIWkmAbCtp2KJVJBlQ49qRFjUGaBDlX4J3GKVglEJ5R5omzM+1WVk6jlk/6nv2jwZgQlQVao0qJoejB60CMso3HfRMIqcJxH46/TrZauPDSgddtiwx+Ab2rhOM90ht2ekNqD99ysJMl81K5PQJzdfN+MbZWfXRdimrq2s82RryeOuQnd4h/UPHYJiRpob5bgcz00WnGkMaDqEIovBixk2mTgINmKi4Q1RsNB8bL81y/uUOz7+pofRFJcVdaS09Y2TvMix3QQ5ojaHTk8jo5UgqgmT8JAPTPLSEmm9jj5SXmCoMKXR86B8SJygf1JvVFDmB8S4weLmanBqlLL2jR+zeLrGVY354iAyeiepe+FLzfWh3ebb9kMIfQeoC+a6qgYQkeRkw1UDXm00tClykNtJa4wpLShsjbc4sXuDa+TdJWORHP3ybP/43P2ZUQN6ZZVBbvFHMLM6StHPQito7cCpkPTyTmrKPUknELHQsS4TI1qM9lIMB9bAIfI0avA9crM6DmIj0bYyt1CwtzHPt6kVW2l9+n/5Gxgrgxo1LLC60eLaxhbIpJEk8lGScZx2rTIrDVzXDox7p7Bw602jxaBPC3lDki/Wr5gLKIwjax+ZhH9Ra5+aX2W2vU/YG6ARwEuCeZNSl8Px5ya1qAZUvgBmiTdPzBaIi0dh4NY43aYqElKVWEmTJvSacY57C7vBk/QNmrl185ZwsKaV+dGdfPr59n7sP9nHO45wnzdtBZA0XvP/QUBGMlBC/qvGhL1oijD6E6sFge1JjEK8wOqXb6gRl4M8YWz2RpxvwL//sQ7b3tvnmd77KR3siC7MT6PXSlKf4eEPk04dbfPjpfZ5s7nAwKhl6i9I5Ylo4F5JvXjW1KSFRCkVgjbZo0OO4KwgYomJlK2o4aYNzGi+By0wpRbvdZmVpibnZ4wqiu4c9DvpliMZ0EpqsG69ZJwRfM94YWo2ZS5rIagyomIr2j0VU01kA5YNaq1QkTpPrDG9STHuOwiv2e0d89OkTlrufLbS3V4sspUo9q0TObvY5u7HH5u6Q3aOC7f0BrkwYlA5VKYpWhtaeLDFkWuMIOk1epZF7OwnlK6URowLZpFZoHWDwfxcoAU8aqnVTSe8HMhpdZzR8glIDtCpQJGgxMfqZ1KbwjSMX1ypGVDoamoYRBwighKlywjgrPFWTCa8RrqFEjwE4aUtRDoXaQpo6ZtMKVaxR3v0B27vPOVMeIPd+KOrGv/2FJ/7h8095uvGAmhKVVjhdxl68cNY46wKoBECFuj3xHvNTyoZKK7wNPayJJLR0l6/d/AbtdJnenuHtX91lff2QWrVRmaLygvEOMk3SSvBG8M6PWynCFMX5JgIpJDiATWcR+NDI7YIysCsLUhUdAkCZwI0vTFKy4mqUeM6uLPHazS/XX9WM39hYnT29xNJih3auqVQjfaBpkNkiAe2ljcZI0D8ZDfvM1RadBm88KDOFNI57gTuhia5CGiRGVkC30yVptXFKI0YjiY8elaGsPPs7DjtaxiQrqOQ5SQKVFZoO+EDT40EyUI6xdRRNYjKcL1AmCXT3hQNb4jRU9pBHa+9z8ezXP3Neblxe4PzqAk8e71M4H/o6WjNYr0KQJC8326nYnxNWOqLkdLwRcYhYFAZX1xjtWFiY4+qVK5w/f/7E9/DJgz25fW+Lf/p77/Fs85AnGzt05jqs/9nbvLlxhWuXF7lzKHLrBRXey2fCz893RR48P+C9Tx/wyYNn7A+HKK0oXY1IEsAJJnK3aTCiAw5La1ykDQqgLhMchFh38SJYr6mdAwlGx3tPkhhmZjtj8l4IEd9fvL3JUb+EdhdFygSxpHDiUVpHB8RH8IoaP+fFaB1ePtwnhfcQvLbzNFKH6aBvVnu8MjgS+oOax8+2eXb2FHsjkaUXPMWNUmRn2/LuR5t8uGmlk8JrF2a4cn6G/hDuPdjm/duP6A0c/bKgOLCMsgydJmTtjLa06eQtjMS9GY4xQI/JesMBEo1vQLR85l78Wz1mzmLaV3HpHSz71FKR2hNqTlMjRFDx+6nfgYqEuFOHehPhjyMyjdEG8S5ibZu9Ev7GKyhqQSUBMu6dR/mSOeNx9QajzSGP/vUOZ7+5hdz/ibB6AzX7+RqI9+SZfO9n/z3bh5uIrkFXiLYxkgzRsnc1qU5hfII2vXcapYO6gNGQaI0blXTMLLpOyc0MNy5/FVem/OWP3uPD20+YnTvDoPLUNaANaafFzOI8PjWhTSgCoTUxUIi8jA1rZfNQjaEiwukd+KJCW4vWASgXSiche+LH9UOF+JpEeZYWZzh/bvGL7Y0Xxm9srG5e0uqf/Of/Wn7083fJ23OUVnBYVESWJEkCyuMlIL2K0YisH5SDxVnE1pDngIy1jZyLB/S49jC1pbRCnMaiWDi1wvDggLLXoxUhmAgRbp3y6L7j+lcvIMkmRd0nzbJgqFy0/0YQX0Wp5tDHAGGDGxLESxCAA5QJnhvKcTh4xsh9NirwdK7UP/uTj+T2pxts7ldkaYvRoE/ebuEaaLVEjaRjBWVPYjS1tSgcyqgo5udJNOBcaD6VmqW5WW5cu8yVUy8rxf7xz96X//qf/Ss29z2VWqCwOT5b5rDwbPUO2O3d5vanho/PL/K9Xz6Rt65f5OLC8YO3UfJ8uOXl5qVV7jxeY/tgyNZun1EVFHd10sZkHZQYvEogpquMMWhlwBIY+BEcBm0UJkkYjmqytAteKMshrTRlOOhx4dw3j32Ogz6sb+2jkjZ7h31Wzixho3Swaw5vJ4j24z2npOE9PDmian7/IrksxFSIDVxnJrZRGBMEIHXSIm/PYcyI+w8e852vHKeNeXAo8tMPnvPLD5/hSVh+uMXNK8u8dvUMtxYmUPdH206ebhzw0f11tnoV+1XBQa9CuxnMsGapa2ilmlYryPFolaGNwek6AnA0tbN08xyhoGkm/pscIjsCW4QbcBFlPi9ybo65hTepDx4x2n9MSh+ND8AciarVfirCImrlSXBOdRNxiQ7NrOID36APqXUvEaTifezLCtpiIV1IbNT2k9dXCVa5mA0IzpXBoX1F6ipSX8OwZP+Xf8x8Be3X/97nnqOCXZ5ufUK/PELnBqtD03di8sDQYy1NbyB4vHLjtVWR7Tt0h1isc6RJQj1ytE2bt259i1tXvkpxlPOHf/h9njzfC/2RWmEttDoz1AKtuTlEG0a1DRkZAVfVaJWEKD7abSXgXYXXiiQJgrYB3ZdQDfv09vfwVUkrSfG2DgwVWRLh68HZSFAMq4Lz5+c5u7rAxaXfLAXwGxsrgFMrsywudDnoFSgzE8I/NeGz0tE70sqToPFVSTkqaLW7gd3C1TTdz40YIgSH0asXSDpF41SQsyBrkeQt6v4ASx0TeY5Wp8XRwT5rT+Ctb1yF/D4V27g6oAYnx4YnNlPF1w40TSIxERtTESpiY8UblBb61TpPNz5g19+TZX3jlQvwra+/yb2Hexz88inlaEgrn6O2FUq7oNkzNsF6jPkg9jyM0WlecC6kDEU5tBM0Fd2O4vzZUyy/UN8BeD4S+cM/fZvtkWakcrxqY02C9QadJHRnTyFuyM7eEb2DZ2w82+fe3U3+7O19uXxugevnjm+qq6sBkbBxKLK50+cvf/xLNnZ77ByOqDy4Sih8gugWSTtHZR5bDalqjZYEoyHLEnSqUQqKsgrpQVFI7N4v3YiFU23y9Ph0Dirol44KjUlMVH1wY9SkxBSJgrFH3aRQjm2b6drVC+jAY6S8Asq7uDcaj7wGDDS6ZCrFZObYNX706TP58fufcvfZERsDj8fTK/v0hiO2Nrb50189kBsXz3J5pa2urIQdeH9X5MF6jw8fPseuD6jqPt5XHAxruq0WruupUkNiPFnexrQ1iUloerJLW5ObRvPqb26I2xHKe1Sj9ylGB+Scon7+P0qic0hSyDVkXUiWwHShIRpWChhBe4nlhYscjJYp9p7RVoaGGu2lazUAiVh78g3Cb+r3DVtFU7OS2AysIupSi45liUlkNrmAxqskIF6diukwG5wVB9qWrOQzbO4+ZeO9v0AfHnH009+Xub/3H33mIhzJlvz43u/xdPNTvKlw2iMqMo9IgvJmUpbAx/RfjKxUjH6afeotc7NzFIcFnXyGck9YWThPygL3nhywszOkqCPnpw50atoktGbnUHmLSgk+9pwR08tBod2GXi6lx2hDpRiff4hHbM2o38OWBb6uA47A1nhv0Y4AqZdQR3WuJk8VszNt3nj95m+ww8L4rRirWzcvcOP6BX76iyekZh6nBTXVAKoIMEgjoW5RFkOGR0dkMzMkrQ62tkEq5AVjBbGM3kRZEKy+DtxwSatFPrfA6OgA6xS5CYAO62ucg73tDF+dw6dz1CpFiSFJCY3IahJmi7JEbQmQSP4jGlFRDlJ5DCZ8CAXO9Xmy8SFXzjz6zHm5ekqp7/10U9557xFKHEp3qEtLmgZus0ZojViraoJv5z3KhLqMj6SoBo14ixJHQsnZU4u8dfMiZ1dfXsJH2/Dx0wE7RYbWHVABoWNtQW5yin6BUjaIRPqEp1sVm3vPebBRc/H0PH/wo6dy9eISb0XEYDPOTKULf/yLh/L+3WdsHFj2hoqdgaW0Fl9rxA7RWpOaLkaHJkbrHcWoxONot7sgCls7bFmS4dDUXDh7kYUp27snIh898ez0RhQ1mDQPJLGEeoWMszfBi9YyUTZu0qzHoOnxdSeHYDRUfmKwGikDpUIzu1AT+PgUKEET0tbtdpumVLhRifzJj97j9tMeuwNwaQckYeAUg52CtY1D7j054P6zIX/48+fyxq1zXFtQanEJXp+ZZWXlFm9uLfNsY5cHT3Y4GNYUrsSWBa1WTqcd+TJNSE+WZRXqwoRMhNITYqK/kVE/ptz7KXtHf4krH5F5wXhNIhlG5yRphskWIT2P6EWS7go6nYekC7oNaJg/xcLoLIP+Eyj76CkkoMTalPIhtRSg6dFb8TD2XGJjayg9ECMrFetZfqpmNZU2DMzBNCAMpzSCQXkh9T5ItvsAcqlEoSWDUqAYYTcfcTSqOVIJsn9H1OKtVxqskh4f3Xubg+EGvh1q1l4Fpg0lIbVtVI0XN0WdNU1zYyKIKRgXLZq69qikxYXzN3nt5rcZDjL+8A++x+ZOD4/BO9DGBHX0LGFueZGklTGK5T4V+4K0ixkFrUBcACmhUDogdb0Pka7ygrOWUe8IbE0S7wWYaLWhNeICDsHVltzA8tIs3/76V37jbfZbMVY3blzg9deu8dOfPppCeqlxTjTknUMhPUEoqpLe0QHd5VO0Ox3qOuRikyTBR94vILL0EchBhalcvcYJpHmXmfkF+jstfF3GqCQU9bK8zeBI8+TBiItvrmCSJVA9RCoC1VIEWbw0ZPyeRUJ9qenyVgREXpJ4jgZPWdv6gH35WBbVm6/cpFevrrK6OkOvOKByg+C1hAuA6JfSUAGmHLVgJMQMqQ6NudQOLTWprrh4ZoGbN06z0jr+ArtW5A9+3uPJVkkpOZlKcc6SpS106VFiybMM5xTe2xABI1QWyt0Re4Mhj54/5pu9a7z/VGRlHhqhwunxD75zVe32RJ7uCO99+oz37jxl86AgkFmGefXWYH3QynEKdG7I8lZoknYKV9b4uiRPLakRVhdnAiVOHGUNm3tH7B4NKSx0cx3YNGLRV8RE4IFijDKMjs00EnC8slOGa9JSEXPr08+VIH6ICiKgPhouQ2CdSBPNwuzMWMdKDBQWSpeRddt420QFOV5SStpsjRy9Z33ubhxxb2ufP3h/S55sW86cSvj6aaN2ncjr51d4eq7PJ2t9nm/vsL+3zajqoazg6oqkm5FmLYpBQZakdIwh1aNYJ/6bGdJ/V2T7xxzt/gRXv0vLbNOSKvTTWYP3mmqU4Oni1Sm8zOP1LGkyh1FdWnqWLJuHtA+jXYzYQKY6jQZs1ocJDdCLjcDTwAqJRimWfsdprfA1OieiY8PtJLaSsYEMD+Mcyjm8FywGr1KUSnDDioSMudwwskO6uQCv1hTrybbc33+Htc0HSFritAQkLBohRUkSy4+C0SG9HT715GaYwllg0pTRoED7jHIofO07f59zp25x570d/uzP3qY/ykhbM9gypPq0BpVkdOcXkKjmHmi7VJAQaz5/RFE2wo+Bo9DjxJKqwJrqyoJRrw/WkiBo8ZGSUyM6OFVGhzeqdWBlOXNqkbdutX/j8P+3YqzOdLX6T/6f35MsCxw5L5oAHQ+BRjbEW0cx6FMVQ1oyH/5PmsL3RD246a5uIrOYnBl7QmmaknU6tNpdRqN+QNopSPMMUYr9/SGffrLFa9+4gU326Q3uUFd9WnlTwAwIu2PFeBGQhoIp/BgDHxrUmaXG1js82fg5l89ex8qGJOrMiYuxNA/f+ubrPHr+A8QqtGnH2tgUmW4cgoveSdyqsV/N6BSsw9eWxNTMtIRL5+a5sfKyEdndhUePNhkMoZWGpoa6HtJKNYnxITozOVqlOBSVcyRJSpqnOK3YHw7Y3x+wd/gh73/8mEtnl/mjHz+Vm5dWuXHheOPx8my4/qdbIqdPz/Pk2Rabu/s8WX9KUTpsPQDTwaQdlAk1wLp2lLWjlWakaYKmJtVCN1Ocmm2RT+V8RxVs7/UYFDU1OcqE1IJO9PgAkkg9E8hNwyxODFXjKDUbajrqCodWs7bTGjzoCOIIMsooFZhPdGTITrRnfq7LSiTadQ6sE5xK0Srj9ILCWktRa0prqH1KbT37tmR3NGTj4R5PD4acf7bJm5fPcG9fZNlM1vLJUOSjB/PcfzDi4KjHcDigv99HF21m5ueRWpEQa6/eEVRP/3qH2CdC+Rh2fsDRzo+h+IjZdIe2Kkmtj9GPJsgjWrz0EV/j2aOuQFyGdQkjMqxKSUyJk0287QWYuW+UCmjy4+MISzcprPBOmieEGtcU64KSybNUrAWpJn3crLWfRGHj88bXQaLduQBxj6l6pxK0Ski1xnmDs5C2W1x78y3oHO8NnB4lB7x7+8fs9tap1Qh0oF0LzDmBgV/HVF+jdhDOm6aGzvg9ACQqo6gtiWrRyua5dOENHDO8/fb7DAYGLylJluPK+Om1Jm21abW7VIDXQcnc+HDU6IiCdDoSvvmoBKwDAbd3DpUkGBRVWTA8OsSXNYn1k4iWAK5TaLRWVFVBR3tyo7l08fSX3WbHxm/FWAGcXl1idWWZncNgcDxEOHP4QErJVPe9oa4C9VK7rFBJ8CxCB/mxkgJNN00YYcGsBI/IiUKlGa2ZWar+HvWgwCChT6UWkIydrSHV8DQuW6QoFa12qEuF272pSzWSJDCmuYkj8GE1x2AAjtS2QAO7h5+ytX+blc7rr5yXlZZS7z0X+ZMf/ozhTom3CmUCrDuoKsf0U6AxDvik2JjqXYTq+iCxopyl0zacO93l4vnFE6/37PkBG2vbGK8wKkFciRKL8xZlwIow6Pdp5TMkaTeAOGIk4nxF7SwznUUGRcH950ds7vV5sr7L/edb/MkvN+XCuRVef0Ge5LXV8CHWDkWebx7xl28XrG/32dodUdZDnOjQp1V7aoF2txM8X2/xVcWw2ufMuVmWZ1qsTkWKgxHsHPRwmEBeCyRKEAksEhKRX4HcvgHGy1gn7ddGVi/URBpGeZTBKxNYwHU88JRHK4/GgqvpZBM6KFcHI4ykeDHMzcyilKNwhmEp9EtBKktdCNY70ixjc++Inc1dDnb7bG8c8Bfvb8u1i6e4sKjUpY5SmyJy5dw32d7b58nTIx493Wa/3+fQObRuUQzK0G84p+lkx6H+f5VDqj3BHEDxCX7v5/R238aObtPWO7SwmNLhitC7FKxAqFMqKpARCdBN2nhlaCD5zlvqKiDjslj0b2pO476q2C81Rm1O/f90ejeUeqa2p5fIDRgaV5sUcvN/4zQ8TXTmSLygnURDFrk7vaB9HfSivEKsYJOM+dOX4MJ1MC+QWcZRyI487L3HnYfvU7kRPnMIFifgfTsw3PjAnRdQz1OGanp7isZEFgtqAk+oNbz51tc5e/o6vUPhl2/fpXYtnIQMkIuGPMsyOjMzmCylFsatJCGPHtaoaTwHYjkmznEjq6TDHh4NhlRFSR5Jdps+WkVoClY6UKHVdYlupZw/s8rN678ZZL0ZvzVjdePGNV5//XV+9PM7EaDQ1AkUCYENWSDi+kODcDEcUZYlWZqiIuy98ZpCo3A8UMaME6H500vIxTrAJIbO7AzlQYfh4IBUa6wNG6/dbtM/GnD39h6XXl8gS7tk7QpXuWAUIs0IJExkQ+JQPuYO1BgFCDVChJ5TUdoNnm18wOn2737m3Cwtw7e+8RX+7IfvctC3MWUVGz1FRaaKpo4mWLFR7RYCsa3C1ZaZJOXMyhyv31jh4rmXCSF3BiK//6/fY7h7QMsn6KrAq8BFV7kK0TnWKUxrFq8zaiFQtfiC1FrS1NFuJ1QFmGyWRM3Qr4dsPz7kzvoBHz3b59L5U/y/v/9Qrl9Y4eaV7jEZj3OxpnV3o5T7z3vcubfOk7VDNg+HDMoCMkOn1WZUFAzqPqlzdIynreHimVPMto5vx8HIc3DYQ5QZ93CgJfYeBaZoxinj6BWrSZQcS4zHjBTTP5/0fwogCchCPBIlb8CHxkfvyFNFPgXArOuSoiiAnDTp0B9Z0kxjEk2n7Ulzz4yFsk6pKsXwcEjSXkR0l92+4+CTbT56sMvNvZo/vVPImYUUHLyxFC5y50Dk7Okz3H++yeb2Ab2hIwHmZ2e5dmWVC78hJPgLDXcIxadUhz+jt/8DqG7TMge0EEyZg5sh0aGu6AgOhhODUKFUqEW5YoDyGcblOPFoGYU+SztP5Q2pHwJuTK3UACaaw9uPa1NMUnpCRP6FM6ORBYFpwzb5GC+mFRujpwS0t5hIHuzH17Gktg4sI4VG60XyhdOcfuu70DkF/mQFhIIBd+6/z97+cxwWbQwlA5wk4BLEJyhf43FobHSM9Pg8mmSXQrVUA64GJYZWPscbr3+dOVb4/rt3ePBgg7JUkBoqW9Kw+rTbbWbn5tAmwUe6s3FvafxsIb84mRvnXGDUUFDH+a6qisPDQ5QPmnJJEBgL9VQEq1wMOuy4cf2NN1/j5q3rv5Wt91szVr/72in1f/gn35Of/ew9gsaMweuQ63cekMDGrtEkKoAgKEaosiTtzlIpFeg/jEHHAydADJjK3AJ4RBtIAwTVJClpt4vJ24jK0NqQaI2tagTH7n6fB3e7vPE7t2i1njEoj9CqJiQrIyw0el6TERZRqCL/XUCCBe44IUlS6qqips/a5m3Ozn3KUJ5JR53c1W5q+Le/+zu88+4nFEVF6QN91JjnK7S4opwKl3Y1YkJB1eig8aXxdFvBWF2/vMKFpZd1rA6G8HTzgLKo0UpTlzWmlWBMSmFtBASo0L1uKxSaPEsxeFxdBxolr4CU2oZCr0ra5PMdwPJs37K+/4j5TsK90ws8eX6GXz7sybmlDmfnJ5C0m2dytVmK3LiyzJN1y4efPuT2vUfsD/pIWZB5T1WO6OYp1y6scm5uiX/wrbe4ujKBAu6WIu89GjEa9klUmAusQ6XJseZI8ChpyrxNramJiCfR1UkLcyzyiuAJDzgdjF4y9pNcA8VBxDHT7ZKnk1unLIRev8I6RztRpFmO1hZnK5xYEg15bmglmspAm1nqytOvLbXXWDTDomR0b53b9+7zxqV5bl1Z5dFQpN0ON+nifIdz565y7/4+n9x5gGrnXDq/wje/usKN5b+ermAZPBD8Y8rdXzA4+jl2+BFts0uOR5caypwGdeJVkGkPAIdg+Ju0ulEapU0AsjiLNkI7yaltTm0lsk3YCVhi6j1oiTWVyGI8zV4xHYUJwHQa0U/VsMavqDgevkQnJ1wJxCBonLeIcwE4XDu0z/BJFz93Ft74NuSnUNnqS2swkD3ZGj3gk4fv0y/2KGSAyiJ9GhKIDHwwsgrBx/ro1KclQtXGjC+Ixjuhrbqcmb/CysxlKkn5wZ//koNeRdKaw+OxtoZEQ5aiuh2S2RlcopAyGPfAjhb6SxvGkKYJ2IqPDnMKogK3Z+3wRUXV70FUZA7ECg3GIKyJKBvaPrTCaM/Vq5d482b6W9mfvzVjtb0n8sGHj/jj732PYlvQWRfrezhxONLA4KByTKJI6xKlwe3vUs4uMDe7jMsSKhmSxijA+JDH9dIsFIhWOA3WVwgptbeIhk5nhs78KsXeEDvqY7RFG0ddW9J0nr29GQ73V2mvnMW5+6i8T5ZZqqLGeyFNOtQWqtKS5DniFV5bUBVexcKpSsHnKAnpQ52kKO/ZH2zwfO/nXC6vUciGtE6oXZ2bVerptsj/7Bu/w//0p29TlBU+1TgNrU6HalhQjSqWu0sURUGWpwz7feaXlzk67ON1SivXVNUBly++wdfeWH1p/h/3RvKXP7/Ps72CIeGw1mlOHRhVMLTAK1KtEVdHtLPGVmXQslEZWjSVBQgS4kGKoFEHDhGmk4z17T69Xs36Zp/3Plrj7PIC//InO3Lr+jJvrCq1W4g09D/bI5ELK9f4nVuLPHq8zt2Hj1nb2OTc5dO8cfMyt65f4OLpJc50J6nFPStyWMH29jaqHKH7jtZsQmI6iAOXpOPapdZCokM7gnZgY1pQlMfJhFE9BGXhEo26hx73WQkqeo8eoZLQJ5ZYh1IeUoO1NaXzGJNR13Vgno9jMEoQ1cGKpZZhODSdYLSgVIjevQ08fp08ZyZTeAcLsxllUTAajSiKmsGoQDnHB/cOebxWcvrMgOuXL3DlcsZiG07Pw6mvLvLt69/CVSUXVlt/LUZqPOpPsHvfp7fxQ3L9jFz3SLwC1wnQa60BixcbK8ENnXFT20ijsdEoH//PaLRPQwrJ9UmVAl9HWRTwXsKZGhMPTmIazxOyEp4ADJg2VBGarl7kDIxjGhI/DappWm0kvmaqM2onVLYm0YbEBGRuaTPqzjJnv/MfwOot1MzZE9eh5IBfffxD7j7+iEpGtDqGftmPM6NRYlH4KNGVRHSwwxOox8QarPMkaYrKwUoZ+8oSip7nH/3j/5DXlr7LD3/4mLd/dhebtShKR1sn1M5SaKCdw+I8ZZaGjJM2pD6y9vvQ5BuSn2HvewGlQzHLe4/x0BKNKYWiX+JGJanEtKXyKOPxcYESpfE2hLDVqM/i6grf+eZbv7Xt91szVitLSj1/NpSzKx0eb/fwNshxaxMa9kwSm26tJ01CubD2FhkFTRSVmNAQjAOVxBrXtAc0GaJjA7BRWOdxSmOyNqrVxRUVpR2RaR/1iXL294U7H+/y3X98Ga8eMKo3MKaM8hDgrKBI0ClRHiQLHkzM+Qa6kcg0jsFHBJrHYXLPXv8xa7u3WTz36l6CiytK/eS9vty+95z3H2xiU01lLcPRgNwktLrdULMTwCvyrIUtK8TVpFlKIp7l2RYXzi2wNPsyw/refsnDpzscDizOpIiKlEciRJr3CRJqjHh045kNZ0BKuOObmyigD2L5OqDvUMzMnsLVFevbBc83DnnQ2uPJ1pC1Pce/+lUlD56VrPVEzs0qNc0F9nhH5M1r59je3WL19CJnz85zfrbz0mdZSpR6MBDpDw6oqxHd9gJJ2qKwEiThnQYTolGjwg3nvY7ppgkbQezyDNnVcbNlrHXFPqoJk4gee5iOpn4QUlHOOmrvsC6kPdI0D8zTcRSVorIKlKBU06MVUsjBS4/zHxJPwXAqIUs1iWmR5yllmTMajagqS+VgdwC9Jwcc9mu29xe5dn6ZC6uGS78Bt9pvMmSwJrL3zxnsfkDOczLZRlHEDhCDl8Ai36CfmuZsYmousE7EqMvFVYoOgvI63l8VjVbVNMJv/B4atGfTTzfJDNIw5QSacmFMDj2FKowk9sCE1Di8pgmlCx/WML4dak+oFWEQV+MsVM4wNB1mr96CSzdQiy83P+/7bVHK8fToNp8++oCD/i42K6AuSZIE5zU6MpKEPUiIOtFx33istWhJSLMgZFj7Eq/i70i4ev41rl/4OstqWf2T//yP5HC/ZmQydGLwdcgMqDQh7Xah1aJOgqq09xKkZYQJ6jIazCaPJUqhEzPexlrADgtGh4f4URCq9d7hJZI/xPlu5J2MeDqZ4ezKMosLvwFz7QtD//qnfP5x/kJHXb5ynm47jcSGeuyxaB1QIl55jE5CvcYRvMrREKL2SVMcFaViyrnpqdA0yqC6Sc+IjBFzaadFq9tB0tA4qnWCIiVN2hT9gk9uP8QWC7TMOZA21gKSolUbW4eowRiF903xvsnrqhgnT0AYTS+YV2Ay2D3Y4P7jT+jJFgd2TV6amDhuXu/y5uuXaOcBcaSFQHCrNNoYRtUAbxzWhwPRWotWkCaGTjvhypVVrrwCWfNs/YCHj58zquo41zGVegJLQ/h8L7/N4/BfE3WEVEiHeBAU4jWjYY1zCpPkJGmbqhYeP13jRz/9Of/8D/4Nv/9vfsJP33nGhxsij49ENgbhhS+fUuo7b55S3/3GG3z71ll1kqFqxrWuUqsLs7TabQrRHFo4cgmVyqnjezUqJElCRKSoIrJMRGGcC2Sf3hH42T14Fx4x/etEYk0lPEIyJlLGRJ5KR5AfsdZiXWh+bOcp+ZSbNxqNsDYg8kyix+jB8dxH1QCUD1IrQRCaJNW02hmzszMsLMyzuLjAwsIcypiAaDWK55ub/OQXv+TffP+HvPvRMx4dnbBwfx3DW1w5YNjbR/sSpIpoO8FT47Gg6pA6l+lGXYkovsgYEVV7vSPsryjnIdJEUFMpPa/GzbwqslSEezAiBZue2YbJAn3s71/1AF76vhmN8+LxOFejvJArQ+YSpFIUqkV5/gJzX/8GnDmZ5ixR4Cl4snaPB0/vU/kSE51TidmKxgEfXzumNsO+TqgrN2b0gZCx0z4j8S3qgeHcynXydJFf3Xsuv3rnY8QbEpWBV6HGBEEstTtL3m5FggF/7LO/+AhRqcK5UJhoaoNaYDTs0+8d4p1lLAkI4/UIKcvGnFi6My3eePMmK6u/PfDPb9VYAXz9G19leWkWrdzY07HW4pVHGeLkJ6GG5YNmUjHqoZwjN2Gyp2VPPZPFHMsBeDXu6Q28igrTzklnZtB5SpJmKJ1gayFNWmidsL8z4vmDCu3O00pXo5R5EFz0kmI9EY3nEAmPwLZjwsEdb46G+8r6wN7upGZQHLG29YBHzz/B6f4r5+bUjFJvvnaBy2cXwRUkoujkHcQrKltT+hKVhbqYRA8xNRrta04tzvDVN69y7fTLdAW7lciz5wcc9gtMkh0TFGzGNLjgxRv2+O8ACRpJ+KahUhGQWwZRGpO2MEmOTlokaQtlMqwzHPUqtneHfHB3gz/6wfv883/1Y/7ip3fZ2j3eB7T8OWWtr1+5wMUL53AoilowWRuLCczO0mhhhVK+RbAqiPYpASOC9pHPDAkefrzLYsJjan9pvBi8GBwvGveJ8cI7tBJaWUo6Bf4aFRUuHizTc3/SAxg/bzzvypNmhm63y8LCApcuXWJ2fj5Extrgdcp+v+Sd2/f4oz//BT/8dE+2i79mo5U4klSRJYEwQzeVZAkRqFcWqyxeuVjbe+EgnDqMX7X/pKlFOX/i/03/nfKT5t7j14kH5wkHMTB2eKWppR37Gp1RibbDh5p7SzJMnVBLi7K9wOzvfAP95legM4Ps7x5bh8LuiaLm8eFdbt//gIPeFiqDJA9ade6FaHB8weZnD5oQ1Tjvqb2jchVaNKnkmLrF1TOv8btf/0fMZOf41Xv3ePJkC5N2SFSGq2OtMElIWm3SToskTfENqi82nJ3krDajdnaiHKzCPVQXI+pRKNNoGkcsSCyhDKLC2YBSOF+xuDDDN7/xFc7O//YyAb+1NGAzvvu73+Sf/6tf8nTjAOc1iTINxiUYAeWx3iCiA4Tb1lTFAFuPSCRHe4Mkeqw6azxMYOUx26sEsSFP6r3HakgSQzrbwXS7UPfxzgYK/OjFVIXiw3d2uHz1It2ZKwzLNaqqIM8TRGmcLRFVQTRW4f02mxhCo2iT1w7waZ3AqByispTD0Sa3H/6cc2dufeb83Lo2y9//zps83fwRW4cV3dYcRV3hxGNyg04UyhmsjT0PeHzd58KZM3z1jUsnvubOPjx9doCXHJOk1M4wDfNtoNov/vziaAAHY2cPwDdy1jGNFr1bJy6KqgUYrdYKpVMCHZbhye6IrcM1njzfYW+3z+//4Iksz3a5dXWJlcXPt4FPzaS8ef0mT7fvstZzaKUoiiGtFJwRXJTPFkWQNFCQjHnhYtav0dFSkxbLICsSIiCJ0bNE5KqXyLYSN1xY83qcHch1QitPyaaMVVkHTTVjDKmeVjhurtjMdYCBBGeo6QNzAShkDCZJyHSGF42TFipZwPsuvh4xGvbYPuyxvXPAoHAcDa6yWYqc/uuSBtECxpDoNLKCp/FzqGBQRQjSN4R7M6bQECb9TsIYng2M9ZEa9nQVDQeRMV1HZgqZ5u6DMRVi4/XLsdpUAFI0f8tUFNAQ342RhNK8lgqpRQ8SiaPjM9FOSCpNWRnKbAZZvcLMV78NF6+ATlGzy8fmv5UsqV35VH7+/g/44JNfUPhQQ6+9QyUmrrsO8PExS7yKZ07IU/o6RFdOQemrCMLSqEqjRxnXrr/F6yvfYVSm/OLnn7B3WGHdLNpo8iRnaCtopSSdFiZL43SG6yRKj5t+Q5I8zikTbIATFZQQCMwVvq6wxQipa3IdABe6WT8dWUJUVFjAYbCcPb3A62/8diDr4y34W3014LVrM+rWzUu0cg3ek+iUVBu0hrE4ngAkgcJIhGrYoxr1oXaYWBw9hlAZR1Wh78HEdELondVYD1ZrknaH1vwMzgT6D21SRmVNXVf4SvPwzgEH2x0SuUyqzoHkgXgxGijrGzXMUKsQUQGdMG5QnMhPxEwvta8wuafWPZ5t3ebZ9qeMZOuVbsuptlLf/dZ1bl4+TYalLIa4qka8QqcJI1uhEhNqZyIoVzPbhuuXT/H62ZcRgLujQu7c22Jja4AjCwznr/BI4fNEVlP/F1M0auwRhzkYjUYUVUjzJmlOkudok+PFUDhFpdpItgD5Iht7I77/s/f4Z//TH/Onf/FT1jaHx97/0O3KUPZOnK/VrlKvXZ3l8ukZ1HCb4e4TdD1AuQKxNbb2Yy9QSeyBij1YSIKPhsiryAbPZF/5GF/BJHp3saY3ngeJ6gHxEE005GlCJ89Yjv1gu7VIUVlEq3FU9euGc+E9NhHWJMoKdYBRMSBrZyyvnmJxcZG03UElOSrrotvzPNk44J2P7vPRgyF7n+Ui/zaHaf5JQDK0z9GujfJ5EBX1KhbqX7hvpyIm9cL93Px++mvg8oupXe+nYOpNinrq9fzL+7bpq3pxTKDssV1EVCSzPZ6KbMAbRsVmWeugVljfQZYu0r35dfJLt6C9gGqdeulCpezKjn3O/WcfsttbR+ceZwLxrDah5uvGPU4NE8fxealLG87G5r0rhS09jBIW0hVeu/QNNLP85Ecf8N4HD3GEdLwSHZzc1JB0OmQzM5CkId09lQJsxslbR2Niz5gJ8hAUgz7lqB9S6hLTWfG5Eg2VkwiCw9GdSbh58yJnT/92Y6HfurEC+Lf+/u9wZmUOg4sM58EINJBjHQEMgR3ZMRoeUvQPkaqK/Q1x8Qjy5U0xtKlVaQzKRkVfY0LGXAm0M7K5OZJuF68NSZZS2iKAlDD0DzUf/mqLsneWlrlOli1QuwonFSppbphpNgtNIDANRJNjQxW97NpV6FThkwqvB1Rqj08f/oKt4uFnzs+NU0r9/W+/waVzi1APkChcJiSUlR8T2SZK02kl3Lx6mteun1yrerqxx/sfPaA38gEG7QDUsRvgpPGqyCp+R+N2TtaiqfV48naLJEtxREaKymJFUGlK2p7B65TKaQprKGmh8nlK3eLZdo/bD9aOXbNjllXnFSKWADcWlPqdK7PcPAXL+ojltCB1A6gqqspSV+CsRnlF4j3aCeINlgSnMhwZ3if4wJ0dDA8ar0LNyjE57MZKwiKI89ReqJ3gfVQEUEJuoNuZ5OFrB6Oywvmmr7Bxfvz4MZ7P+AidGU0Tpo/9ME2UVdNpZxgF1WiI8zVzczOcPX+OhVOreJNT6Zz1vSHv377PJw9rtqu/BoOlBdJ24Jr0OeJbiOugbAflMsQneGeCOKYPhkBFp5JIHi5TNSjvGaf0iSW96fSfap4revLwoT6iGhSgqPFrqFjTbtZSLONaV8MlGNCDMq53i0RYvDRw7vj8GozXKO8Q5xHJkPYK2eWvcObb/4hk6SI1J9ditut13r/zC3b7z1F5jW4B2kfi2oC6a7ITryLLb/TXnK/HPUuu8LT1DG9c/QbfufXvMSoSfvzjjxiOFFk2E/XhHGU5gjQjme2Qz3TQaYKbOgucc2NH4CSntrl2AyKjdox6R9hiRKpCet0oNY6qRMWEcATzKuW4cH6Z3/md134jocWTxl+JsfrG169zdnWWRHusrSL5aGQST0KD54RKxOHKgmrYw5c1RjhRnmf8qX2cLILRMrEny6KQ1JB0WuQzc4hJIDF4HO1OSpIkKJ/x3q8eUxytkumb5OmpoAosNdp4FGmsUTVX0xOQwRQlk0gUSnMOk2ocBVYPSdolD9ff5/aDt+nLk888QL7+lUvcurZCJ3PkiZBoHRA8SlNVFYkRcmOY62S8dm2FK+fnT3ydzd0BD59t4UipbdCR8lOIqpPGZznjx6OuCExoHvFwtbYa30SiBYmpAOtkDDRI05Sk1UaSnFq3GPoWm0c1Dzf2ubslsj36/AfsV2+s8O99+zpvXOhwvutp2wFJPURVFVILWI1yBu0iuwBBTdmRYiNNjlfhq1Mm0IG9sKYQvMJgqCw4jw++VjBYLqAOjRZa2cRjtA7K2uP8yanVk0aQzQlzZa2lSb+GFKxjOOwjviJLFUkSVK7TVk5nZo6ZhWVMNoMzGY/Xtrhz7zHD0eedyd9gKA1Jgk47AYjiFUrSQMLqdICuexPJUXWMqsKfhtRfbLqdjqRccMxwUxGUY8KKDscOUYhlx6nvX3qbPmRDTqqFTWpVzTX0GPwx/ntRoQXTJRgBUZoqmaGcPYu5+Ba8/m1I58lOcLCGsi1re4/48Tt/zvbBU6wuqP2AGgu6cYyOH7kyNpwTw5okYX9ZayOJrIZaM5ut8ObVb7Gszqsn93f58P37YHIGpaU/LFBK0Z2bhdRg2m2Sdmecegwp2UiddIKR0jHybObaW4eyHu9q6tEwBBIqUEKNa7M0QqpBnFZrSLRw9swyN69f+A0228njr8RYXTql1BtvXCXPFIkBY6JB8SHH7V04zJQKxe9WYqgHQwb7+2ToOKFTKSsT8qzO2qBlY134WoebXWuNdY6irlBpSnd+AZXn9MsBSW4YDI9wriJNU4Z9xcfv9lme+Rb9QwMqJcs1VVWQJBm2dOMbJ3gZZrwozcIEBnNLYrKwofAkOQyrPSrZY237I/qsU8rGK0+v66eU+gfffp0r5+dJpKQuRmTkpLpFO0+RuqSVajJl+e63XuNU52UvZXMkcv/hLkeDCqcMJm3hbHhv0x6Uc278M/BKryr8v+CUw2sfIyuPYGlAJ+LthBpq+qEF0YLSDuVHKApsNURlCSUam3bQM6d47+5z3r+zhzqZnebEcXouVf/B33td/W//o3/If/jvfp1vXD3N5bmcRaOZQTCVww1q3EioSmFUOEgySDJqCU23FkPtFDZC3F3cX5ND0o4fJoIskqh67WOkWpcFeQKznYlKcG9gKcqa2suxfQK8MK+TnxviWW0CG4rzltpWofkUTysziKsQV6FwOFsGXsgkodudxWuN8xp0xubOLltbg88/mb/JyNr0qwKvbOhDjJGH9hIdhRRcGg3G8ciG+LuQgtMRCBHIVKejJxrxxKm/U01kFGGb0xHVMbSgVxMD2URaU5FVA2ufTr0pQiStoi8m3pClM+AS2rqDdSnbOmf+K99m6Zv/Liq9qJR6Of0HgVn9zvMPeLx+B0lrdMsjiceYyR4Ishsvg26mh1KKqqrC915BpVmaWeXGhTe5fvErPNnbk//6//XPODwqqSzU3mFaCU4sTiym3ca02jgd2Cca5wHnw7np4/2MC61CTAxmCAY0rSzDKKHo9xj1DlHOkiZmHFUJKux5o0mShNpW1NWILFV84+uv87tvnNx79puMvxJjBfC73/wqN66ew/sReRZUZROTBt4+5cMkicMg49ywlAW+KkNNCsBPDhOYKlPHdKDCT7wEAgrJKUHSlKTTRmVJYMog9LWgLEYyPv3wgI/e3efi+a/TbZ+mrkJPly2ETnsuhukOaQqwcbM3BvTl4QELpkKZIXu9B9y+9xNK9j5zjm5eXeZbv3ONbm5ZmsmoRgUpCQZPmnq0VLz52hWWFk6mcvnwkw0+vrNGUYd+jQZu/aoU4Em1qRfH5PfHq9lKPMQeIhUxww1QIDy7eW1PomoMdXw+OGWoSRiRUkjGg7Vttg8+c2pOHBeWO+qbN5fU/+Z//i3+l//wO3z3zctcXGiTywBf9aiqPmU5xPuasiwoy2IM/1UE6LSP6aNjj5h+UsR9EpscPSqCHQJ4I03CTdzOJrdNUVmq2oVIQwUOjekeni+XhvVjuH3DXjLGacdD1wnUVigrT1lXX2gepVoXcY9E5JGIPBOR3ZPf5NSwEbGSddtYXSEUCFWoE3oXUvTOYLwJ9WSOG+vpiGqsO/bCVcWrWLjXJ/5dY2SmqZQmqdumnYXj3IBx6PHfqGPGLtSsph04RVkpjJmlrhNK06V96yu03vo6LF185fyMZFN+8sn3+dn7f44zI7ypQQdAGQ1jxUlr0ay5TLIio6okz3MyZVBWYQeO0ZHnq7e+y/XZb6hH93dYf37E7s4Rzgp5u4UoofQ1YjTZbBeT5wR1igmD/fjcfHHeXzwnnEN5hxsVVMMB2BoTjR2Ai7U/paPatxK0cqQJnD+3xOVLZ145T7/J+K2jAZvxrW/e5PLl0/zi3Q+ZXcqpatBJSMeJ80g8zIwGRGPLmmo0pB4NSNIZEHAE6Xmvg9CdjznfUBOIKQVFQHVFNJgTQSUJ+ewcxaBHWfZoBEGMr9A6Y/35gNsf7PLNf/g1DgYfs7+3TruTUxUuyE/ECCOkZVRotZKm5hCRSUpNWB5UbOYTC0nBUfGED+78gAtnr1HIM2m9gobp0qJS7z/uy6OHG3x4Z5PEt0iSFMSSaU8383z9K9c5PXMCsMKJ/A//8gOerB/hkzkQj3MSGCq8RJmMz05NjYvWL3h3gQg2bvAAqQvP80QSTMb3XqO8G39AiQvyELoReNNj0lKFwmnHwyfPuPfoZW7DF8deLbK+NaAsS5YXFrm8FBLjK7OTN/zho0reu/eE++tbbPWGHA4tiQiuqrENm3SVopQiTVM63TZlWaK0iQjHJnp0sYU3kpeixnLjDeo5M5puK6Ez1WQ1HJVBx4vpVF7jbTUR1mSuRALK7KS1GKM2gQZpFyITH+TDJVJz6cCiUjtHUdVUZf1r51LqDaFcg3KdcucPQY9Isxa6vQLZBcQ/FaUvvtIb1mRggpCfVwWihojyBHkLHyQiJERKfkwU26D84i3TEA83qf6xTtUEzceUwVEvIvoiMEIigm9ai0o1X4l/4iMJtMi4HwzimRFvYRoDFt+L8gqLohKDlnBm1QunWfrKt+D1r6EWXpavH5U70s5PqUPZ4717P+XR5ifotg30fk1NjIiojQoB4b5zTOrjzW7RgUlCVJDRIcHYlNTN8OaVb3D1wtfZLAv5L/7T32d944Cy9mSpDahqDc4o0k6b7tw8ut0Jvao2aLM1E3PsTIi3UVguQTe+kA9N8dVwwOjwEFzUdnM+fp7IwJFofD0CZdFi6bQT3nrjGm+9/tvhAnxx/JUZq7OLSv2f/tPfl27XBHobB1XpSTLGRWiFw6hwiJWVxQ6GVP0++WwHIVDnN+iicW/uWEE0HqAI0Qee5H9NEoQdOx1Gh5FBGMH5Cp2EZuH1ZwOeP1okz66TqScYf4RQUhclKm3O4saDjvQtatKfAwQOxCk3RSmF0hVe99g+vMvdp79i4fUzFLInrVeACL52eUb92S+35NGTPwhoHmq8srRT4eaVFa5dOPlQ39iFZxt9LF2UThmVIxRZYHMY34mfPV4kdg1DiEy9U/8XOtuVCgKHIuHmM3Elm9dqvGHv6mgIwmuF9KkhUZoUR7/fY+3Zc7ZLkZVXQK8fH4j87N193vvoQwajIVevXOLHdwayOtfhxpnJ33zlSqYeHYpcOzzLvfVN7j/dZHt7SFUV2Mpi0pQ87eJF4UrPCIm9fhplTOADjFQIHgkic7EmqpSZoAGdR2uhlSa0pmrro1GJdRLIdsdvKzIBjI39ZC5PYoGfnj+lGrSYCgKETA63gEptHCWD9zbU1D5jqcU+FwbP8Xs/xBZ3GQ0eMBg9AVWSZl06nfN0uq+j2jeR4mNBr6Kyl9NcmgySLk5SdCSlDujFaF28RvuoAOwDj11zP9LUqPyU0yOTxuFxm4UXiMCMJoI6Hl1NbJoe+40yfn6zV8P3U3McXzskCeI1x0APiZkTH9+HQqUtDq2G9gpz179J6+ZXUSuvn7hP2/kptS9P5eeP/pzn+/dQeYloF+HmseWDsV1gPAHS7BE1uVXjfCStFoNen/nOAnWhmMuX+ff/rf8VmgV+9Yt7/OCH71HUitmZeUrxjIohpDlZp00+N4PptMeI4mZPaSGkUSXyVKjJ/pvek1oif6vYwKgyHJJ6R4oGccHg6tBTpYxGiwFXI3bE4swy3/rqG3zl0vKJc/Wbjr8yYwXwrW+9xVs/usHdJ32MSalrsLUnNSFtpolSAt6gncdVI4r+IWm9iE5NjJYEH/OqHhc2GRB2Fg0mNVKXgBePUwqT56StLibrQiGIq/C+xPsakzi2No/4yz+r+V/8r7+OPt1nc/tnISVp6tBiqlVMNZpoqFS8TrwpYg+JyPRiC4JFmR6Swp2HP2Fl4QJvnnmZy296/KNvrar/7L/9ifz4Zw84GhZo41ian+F3v/M6y0vmpeevDUX+7McPefh0B6dbiIW6rum0W1hbMcUrc+I4yUhNPkPkZEM38APG0hlNZpAmsyForSASCUH0nps6XyzGojUGIVWeFCFTjsx49AloqI09kffu9PlXf/KER2trHI4slTdsfvScRxtHXFxd4McfHcnqUpcbZ0OD9JV5pXZFZOXsZW5cOcXasyOePN3l3sMn9Pr7eD+PybqIV1hnMWmGmASVgDI6RsdTulVCoJzRyTiqds6hjSJPDKemIrtRFaQ6kiSjURmeVoCeTLGKfV2xNtBMZBzHI6uQBNSAfiEdJh6cC20FDVjEvgJ0JfJIXO999rd/jhveJuE+tnhIyxwhroJRh6o6i+s/IM2u0W5fh9YVpPcLIT+DyqYjLQO+Q5YsUPkM7yFpalIEJYHAUxQdSE9sxm6MAWOjpMbSN/F3TbJCVCB1Ddw/oZE4/n0T/YS5UNHYTdL0Y7Bl8DrCjhx39zaRVBN3Td0LzTIEQkm8AqsV+16xdPUt5r77j+HSGyfOL0AtO/Lu/tv8+S//iM2jR4ipUCYwumsJaLk4e+Pho7MtY8BFZOaQAA4K1EUpqWphS7h6+Q1unP8aw/02P/rRD3n2dB/MDEmeUVn7/6fuv58sO7I8P/Bz3K94IiIjtYJMJLTWBaCA0tVd3V0jeprNIYczHBpnl//EmvGHtTVbszXbXa6tcZdLox6OaFlVXV3oLoFSQBW01gkgE4nUKjLEU/dedz/7g/t970UiM4EiS7pZZkQ8/e7168fP93zP90sIjqCWslNSLizFFgKFkOp7U7JKMkLFxDVNzcZ1IGoqBqwoVHUkVjR19L2SCFF6EUwWhbHzIBgruLoiOn1v56YbLt4L+ssYv9Jgdeft13Hr7ft57cDPadSS5wsxZdVhFPkMIbHKygRfOerxgGo0jMZ8mY3+LcwdUGkdYdsDHHmxojGYKYDEOkne6dPtbyK4Bu8aDOBDRW5y1gcj3nxpzFe/+hC7d9/F2ZPvUNXn6RbhAlXvNJJkhlGJNG0RWqtplKhVSGQ31qGiW+acXv6A9z96iZ1b9zPUk9q/hEEjwNe+8hAfvH+Mul7FiefKPVu5/dY9bL2I2sNgBO++f4LT5wbY3lacNpjMkhmoJxUm/3Sn9WK7fJU2Y2QuuwJEpwEpfs/Y3DgrJE7vIbOd2HdkI5RmA1iJ8KBhTDeHq/fsYNsF1NZzY9Wnnj3I82+cYHmkNASy/iKFNUwmIz48s86x08scPHySa/ds56nXV/SKPUv0+rBt7sssq+qxq3azd0uHg4dPsLzeMBwPcM5gC42Cntbh8owsy8gyi2QmtTgoqJ+qe8dAFdlqmVh6nY2U5apuwAg2z7C2tZyZzdlLZVYzWHl2LmLWFOn1sVYGSGq8natFOh+xBEl6bC3782NDx9Sj46yfexVxb7G1e5JSVuhloB5CGOH8SeqqZjg4wyg7SJbvZWnpdth6B6rvKGxHZLuIbBMdPa+WzWjTQ+kQvMWkYBWDiAd0qhE3Y+KlIKNtAJnFlfnMSkNSXJ9mShvvn//JHAV9+vxpZjV98Y89T6YZGdOMLGasKbNCGTc1ZvMeFm+7D279DNK7+pLXbU3N+yfe5P0Tr1GbdaRwsWE6EDdAMFPhmZ7rtAGR9rOSgmU0vxk3DjE5zRj2br2aLz3yBxS6xHsfrfPkk6+A7TGpFG1G2G5OURRUIlCWSFlSBUWdi66gIW4oowJLsmdSpv2G8/MPUsbqG0bra1SjISYJv4T22AbBmzhHG+/IMgiuYtvmBe6+40au2rP9Uofqf/f4lQarnYsi/9O3ntelJ17nxBlPpxcXh6ZZR4yHEPA+QuGZsTj11JMhw8EavU5JYbukmUkQjbqCcwuBgakxGhJ3cnGjZalDIC+69Be2Mh6MCUwirBMagg7JMsNwrcNLz57mkS8usH3rNZw5c5TgBmjeqjTEnbZlJniqGj9Di5vPgYJxYRGPGIfKiJBZPjz6Gpt7V3PXDUuXPVbX7Rb56+++q08//xbLqyNuuP5artj88UB1ZjjWV949z/FTazhyjBiCmiSQGdljRrMNaf78uJQZ4ezGaEugGmVJxSRaa9qkApERJCm7TM8Pc1lSkIwWtzXJDkWCJ6Mh15odmzrsu2LHxz7buWHD6wffZ01yZHMP8TVr42VUDGWnR1YuUk0azroOp987z1sfLnP1jk3cfO0ODp1wum9P9H/amr7Q2Vr1zpuv59jpIR98dJr3PzzJ2dURWbegco6m8ZjMkZUZmWZRogmlA6CeoIGmSQQKVfI8p9/vbvjMTdOgKlgTg5UxZtqP12ZWYjYuTtOa1TTDau+P88yLJSA4PNHBVqeBc0Y2ivQLJ5pkdy8yJCeTQObHZKGih5A5Uu+TYOmR08FSAydp3Alqf5iV4RE2udOYcB90byaMTqnp7RLYTO63oW4LsI46G3sExdFqAsLsM84yojh55oNL+hK0Vh9oSytPQSWJo8aX1A3Pa2tBqhcEo9BuACRldjL3RnPzc8qQa4NkmL0OSqfXZdcdd9O76zPI4nWXhbReO/U2bx96GW8HZEW0Lwp1W5+K36k9OyptEE+wYIgaEppYpInigyeQ2w7Wl9x7x4Pcsu8u1peVJ77/DEeOnKO3sJdmNCS4mm5hMdZSll06/QXUWnxiEm3ITINMg5VrvQVbl22dzUtVRRvHeH0NX9VRXinE8yEm6m66EFmNPtS0LOFrr7mWRx96gP27P15f/2WNX2mwArjjtuu59YZrWF07FD2TfIj9ROSoVLjYCYPNIovIO08zHBI2bULKPEmTRAdho8RdgveJNRRpswGNxV5JC4GJNuNF3qHTXWCSdVHNCabG+xFKQ9HtE/wCT/7kLfbfcDPX3fQAzeQYK8O3EBPivxQINRUg23+trUQLlvn5oKBClpc0wZH1ak6eOcC7Hz7NNVfczERPaUd2XfJk/pPfv0n++3/7tB46cowbrvn4Yg4wroXX3jzImTProBmuSReqVepmQp5HuwWdz4IuUze58LZWPST+EVKAuqAWky6suFmYLQnta3gNiaTQvq6QGUGISibbtm/muj0ft7cYVobVCVQKLjiMNfQXF3A+Nh/7YDB5l7HLEJsxVs+Hp0acW/6A4ydO87OXzujunQtsXuqwbVFkezH7ogeWVbcudnj34FHOrQ6xThg5pW4sIRSEUCBFRqZKXsQahg+e2rs431TpZEL3AoNIFzyIwxpPZgRjIwRzwQHGfnzf8YlDVVGJavckwkdAY6+iyzEhGneaS3WXUpLbnI44ilCTOcVXYE2elFkUskBh4warlglBx9STIWunGprzZ7G9wyxsvh2t31R0lSL32JCh2klAlk9ECJOycma1plSPaQkWhJYqvvF+pVVySJvQwFxgm2MRTqG9FlZMkGoLlW6oVyW1mWBSX9aMoh0bgwW8ICGjaRmCKBN6ZLtvonffl+CKS7soABysDug3fvI/8vaHL2I6E+pQRWUMsTNUUnRu8xKHSPxc8cKJRC1NdfUAdE2Pkh5bip3cdt0DjFctyydrvv/9n9HftINJ4zF5hoToBlAT6JYF5aZWvWfGxjQhbvLVxwAtEnsRA/F8qBGQMBUCFgLqatxoBI2nNEXchycT10hKbcjzHK3jHMosXLl3O7fd9svvrZofv/JgdfWezdx7xz4OvHOQ1fUJQXs47dI0UVsvyzxQoyGQ00HJqIYj/HAdOnFR0iCpDiI0VU0GU+o6GokamBiwgijOeawx+GAxeY/O4jbWxyMmzYCylxOoqU3DeDjA5gUH3m548P7Pckxex42PUpQVwhDnHSIWnyabZBHaCuqI1BkDeOx0BxhZMpAxbtbolkOWdnRZmxzgw2NPs3vLJ7Nk/tU/e1iee+Gw3n/zpouubkdOjnnn3Y+oJgH1GVkR3UxDE0UmfaiBDuic9M8Fi2d78WwMYtPfkvT/rPCrEie0krCTKUzaMuaI3ezp+SLxNaxmZKakrgJSFkzciO5Ch82XgAoOHTnPpOnFzKKZSqWmxSzqlRGAtJFoVKkdrDWB5Y/WOLD8IVs6wk1XbOGN94Z6+w396Re8cavIqXWn996ynYMfneGVNw9x5NQAXywyDp7xaII0HRoTyCUKf4Y84DSQGUtpM3KpWejPqg8nnerf/fQNQhjQ6Vi63T5VXUOWg1jMHOTnQ2xVTkdow/GfygMpCYJuUKKdgyfWCkwQQsrcAXztsaIUYjE6uejxBIvXAlsPWTQOP6mwWQGEpOnmgQpcjlElNxCoETMg1Iew9Spu/QPc+hsUbh8s9mDxLDaMUASvsVaBClazKQ2cuSCV9nQpW2ozp1TPaVUcVKbZlZ3uCWcZF1PFCmiJljHgxDpTDDMxAIW0j1Ri07IJIC7gBbxUoNCxlslqQyfbhBQLrA4mTFTZ0lugKrbRu+cfwdWPIPbj9h/tWNGz+ndv/jteOfRDJuEkVmu6RY/JpEaMQU0kJMQNR0ssSZu5Boq8RBXWhyP6mxYxWc6ps6fY1NtCR0uKqsPXf/9P2bfzLlZPl/y3/+2fM5nAODiqIFAafC3UzlFs2kS5eZHaNkw8kBUEn46lRDQw+gwLvgmIyWhblDUpAWHiYzIC586eQJsqBjoVClNCqAi+xlpDjhIah3iHVceubdu4+cZ9F0WCfpnjVx6sdvRFfvL8UX3jtQ94/sWjkFnGTiMFWpQgkdMfEmRkUKRp8OMRVH2yXtylNL4BNWRiEO+ZA71pMx41qZZlIikjiEVyS9bpk3UXqCipQ03jGrqdkl6vx2Aw4a03TvP6S2e57vpHUHOeY+eeo2ZCWZaQRQ23LMuofaCaTLC5SbBj8nNJASpaGEWtQmNzmjCKBn9mhfcPv8BS9xrGeli7cs1lT+qD91/8/hMT1R/89ANGFYTkURV7hFIWiJn7/ZPHxbIsgKjFOo9nA4ndF6GseN9sYZiLXyhIE5/jHSIFmaTmWoFuv8eOXRcxj1xW/c7PPmRUgeYZGzej839EYVpjoxRWEHBOWPWBwcCzMgwMhic5c37E4z8/obt29tixtcvVWwvZtZjJ8qTWO26+gr27t3L4+CpvvHeM9w6fJqcgz3Lq2jGo11CxmE7cfWchUKiyWJYsLcz8eUZjGI9DMp0OeAdi8zQbPVMiRdDp3/PU4Rn7b3rkpzXXyL5MAVtNUrVOukUJ4JJUEJeoyXGRkeHVRqsUXGJpmylpJEjMQmzIItlFJfWZjQjqyXAEt46ur4A9BYMFcBUZVfpODqWJPrHTwBNZd5K+NymTaYNPe3vQWJ+asvzax81NPcNc3EqZmEKScDMpw2ozF0lQo0QFfM0w0fcltrsEiYzN4Kkmnk6R4yY1TV1RFpsY1sqo2MLOuz7Hwh1fQPqXhv9W9Jy+s/YCb374c9bqY2RlwGYZrvagNkkqJfX5VLGKiEVk5WW2QDU6N/T7fZwLjIerdHs9yrzD4PiIh296kFuuu48rF26U7/7oTX35xXdofJe1wZCyv4AL0XHYZgW224GiiMmytH2QiuocjAp4Yo05RIw0ZaGe6K4VPbuqaoSvKnDVlJ2pLdwisd6WZRbnHLlAZgI337CP++++/VKH65c2fuXBCuDzD1wp/5f/++P69HMHQErElDOCAjmqDg0hwlfiCU1gvL5G3ilZKHIky6MsTRBsUeBTeJCQTgotY0oQk2pMrfaazSi6HToLizSuSz0ZktsuroautRAMp0+s8Oyzb3PDzbfS615Fv3+YejAgz7u4EKibBmMKNBDdajUAiXV3wYjBq6bby3F1D0KBLQxnVg/yzqGfsHf3FYz1I+3KpYu2lxorq/DBB0dZH41xYsE2eKqYxYgBtag3SDbr5/gkYdWL1a0u97z5usnsO8/3c8XdWNQ2C2Qade8INSY0bN20hSt2b/nY655fHXP85BkaByaLjLhP+gytNqSIRNmsEJgEOLJWc3p0lgNn1tm1bYFr927luUO17tmVszUJ0J6pVXfs6nHLTXs48P5Z3jlwnNPnhozVMVEXFwIf8F5iO4NO6Jge3TlIfjSE4VoguC7O9Rk3GbYAqw6rnjbIhmRVQoJE2yCmcwSVmMkKgZZCPesNoq09XOJUfhrx3HnITHRWZI/KD+0xFTTEXhoTHCIOQkNVDwjVMcqyRGkwoUK1InqyhdjUH2JtYwbZzc2VKWyXvneI2eSUBZiCWTTxi0HYbHh+Yu0lGDG0tSltg2F7vCJ8G7+TQ0KDV6Exgg9gU9OyczU+N2imhKZCxyW22ILddxcLn/kKbN172UN5sjrAsy//He8dfhXnx/SzHiEEqsmYvCymTeRT9f+5mmIQUBuRC+c9/V6HejAhOM/WxS3U68rW3i5uvfFelB4fnD2l/9//519S1R6xlsV+h0ojiSUYoez36S5uwuZlLEpo9KFiyi6M537KQJT0IcTEddMHTGbIUKqmplof4CYV6tw041dNkD4W0mYgkoE8vX7OnXfdxO13XP6Y/TLGryVYAdx449Vs29rjzPlJWkxzRCyaJJhQImVSAgTPZOixRU6n38P0DHiHBnAhg3QZxwbelh6aAkcQMqP44PFBo/p6acn7PWy1gNZDyrJHNapwPrDYWUAY8+brh3n3nb1cc8OdjPwxBuOzIAZjGkJoooRREHq9HrWrEjsuiZC29Z5goqCjDsntAsZ0CUGwOWiv5tzoPV56++957N7tVHpWy0vItlxsnKtUX3trjWPHzzEaNwRjEas4xpGNZnJUC6L6gkwD6aWCUTsuRmOfD0jzgehywaO9L9bUhUzsFFq0JtC4mtx4tm7us3XTx19jdX3E8soAtR0utirPv/d8T1crgWVtCtDAJOSsB8dg6Dk7XOHImSGHjq9x/VU7ePr9se7c3kEFdmZzDMJa9d0DQ155/U1Oro84tz6kXh+z0Fliy5Y+mxe67LtqC7v7s+f4WqmGFb6JC1IdhMxHfbQI+bUaebohU9R2MWuPWyKzJDALQkjN8G0Qi4vyVAasnW+fGKRSLSkpNrQqGy1bD5SQAseURi6CRfE+1pJFPD7UeOeo/AgjHiMNhBisRJvYY6UgLn7W9rvOB5u2Gbi9xGfAiM79nMkftTYWH2MBzhonNrz+jNShWA+oj8aZojixBCzWWyRAnnWo6oai6KBasLKu9K/ax677vwJX34Fkl74uj7oD+sNX/pzX3/s54+YMRSf5oHmDc1B0BLRVRImCvrQeW22pQhvEWoL11G5MnmfkLGJrgw4CX/rCH3L3bY/iqw5P/eR5fvzzF8i7S6wuj+j0t6UgHJCiIO93yftdTJYlqEOiXY+SCBbtdp5p75fXiGDFgBN/N0HRSc1kdRA1Wv2slUN9IObzEUysmzHWKKoTrthzBbfffj1bfw1WNb+2YHXHbddz/7238sMnX6MOnoAlBEVTa2ncWMZonYuhriqq9XXqwYBup6AwpB2FowXelLbfJ+7EgkImUSU7Nsd6qgBqCuh2yLqL5JMxtRvRKRexExP9eYLn1PEJzzxzlDvu/TxLw/c4bQ8xHq6Ql5ZOJzpt1s5RVw4xBjRDrAeaKRxmU7ESVerJBNEeIkLlx9hCqMMJ3jnyJHv23MDNV1xkxb7MGAzgnXePcH6lovKKzQ2aubiTJI+kB59FRXtqpsE7jUtlS79IILrU2MgmTJsHsclsMy6+loZ+CTs399iTffwFl9fGjGqHlNnUCPNii3IbnC60jmiHM+BLgyPHZgVVo5wZBNbWVzl5esz2xZw92zrcd+fG+uHWRMY4PfD65qFDHDx8kvMnK3bv3MqN1+1j69aSLZs3HtPMNBiquDjR4KSJO1aNFG5aYxKdamMQ63ztat4GqQRjAReeN6OzWy6lI3e5MaWOSwpYMN1EhJRZJXUp1Gg8VxKJTlBFjy2bYHvqCO0ah2gdM6vgE/PMTFUsROaCS6ozxUAltDYdrZVHC1PFx8bgHhKTr20DEN/WwGYU+FZ9fcP7qGCDkjuHCkysUisRkQlmSotvIbLxWFnHYq/Yz64HvwA3PYh09l0W/nvr9FO88s5POLt2kKyvSC7UlcOagjzrEByQRYksCVmsFKlNNV0l2Oi/55kghaFqJixmmxFnadYart91G3fsf5DtC/v5cHmFH/zwGYbjQFVNKMuFlFVGRMF0iigrV5Z4MQRvYkuJTdf0BXMppH8xwTbT+WWCEnyNG41x4xESIuYlRhF8m6QBlqAmurCbGmsct956LTffeM1l5+Ava/zagtUt13Xk33zjNX3plbc5u1bH7nUXVcaRLOpoJQiksJZKBG1qquGAvNfBdjpkVnBJ7TtIClCk3gBtm1gD6j1WI/+nVocSje1MdxN5XTE5O2ax08Fpg28qyjwnzzfxyksn+PnPj3DfQ/cxqM7yweFnGftlepsitGczwYeKzBRM2UYiUypT0ECQQJEXjMdjyrxDUeaMJ0PQhk5eoAZeffeHlPkWxnpSu5fpvZofB949wsuvvEHdpFBtZuywIrF0fIi1NacNcHHW34Xj8g3CH//7YhJOFwY0IcOHGYzn/ISu8ezcssCVOzZ/7DMcWVH9mx+9TuMFDYYQ6iiWm97vwn+thcq8sPBsBKyNTaNYg5EMawzaeFYHjsH6gHqirK69wb/73nt643U7ue/6pekL7FyIjcYfDSY6OjNm26bN7Nh28YiwuGDYub3Huh8yCUMIOVDgfVTCmFqST59u0qaCqcSNMINq2mzLGhu/Bxd8dwQrZqqyEdUGLsUEjO8HcWff2moI05Unfp4IZEQeWHI8FTw0EOnoGUazlCVA4ypsFuI58h4NJN04UiNvrJvMYLDEzgsxELYplSTIb+Zn1QaiGHzmMyszV3uJ32kWpDb2WRFhzNTK4g1xcQ0G6wTrFeNju0FW9Dk98lSbdnLto19GHvgCsvmmy16L7554nmfe+B6nVg8RsiqKEDvBuUDe6dApuoyrYQoWmiyNDJY8xei4dmW5MKocWVZggkW80AwDW4qdPPbAV9i15QbqSZcnnniC9z44xSRkODVsWtjMcDxBkOgh1+8hnQ7eWlxI8Ki2/YLxOMf/NXFeZM6mxEUdSwGcw43HuNEIqRyFxhxqqgtqAImO6SFB76qOXTuXuOvO69m/61efVcGvMVgB3Hvvzdx445WsvHI4Kk+HWY9B7O9xBPVYDx2j1N4xHq5hypyuNdi8xAWXtOZCugihVZkAYvAIHpsJag1OA7UGCmsxnS4dt5kwGFG7BqNx56sC3f4W1tdW+fY3n+e22/+APdsf4Ny5M5wfjfF+Fa8D8rJLCB5pD5skuSVtFTbiMJpjrQNpouijUYKCN4opao4sv8bCoW30yk8v+Hj23BmWl5fxuhCVFdTgtInLnbWxWz0t4rNSx6+nZrXhfqIVuw+BTKLWmavHdBczrty+xFUXqVedPDfgyPEzODX4xmGEmWrIRf61bMW2CXd+QS9EyMWTqSNy6RxF2SUrO9AEtC44enZMHfqsrq9z8KPT/Psfvqm33ryXnbu67LYdOadet4n9xAvw6s25PPPOCfX2BO+fXGU8NiCLVEmt32KTSoCdLapIqrFODxjQZpEbm2njYy60lGifONfhd4lzJbJNJif/apZ8hLavhpj9iSBhTt4oHV8NibghoL4heJfmHKhWEfYLMVC1bL7WX2q6gWu/jm68H21rVCn2zDXotseHMPN6apUuBKYwV0tf38AyTP1as2AHwWegGaYxWAfGJYp2I9S2wOy4ku13PEr5wFdgx7WXPdcHRi/qd576H3jpwA+pzQDbyahDg4jB2EDjJpS2xzSQ4lEtsAmCNSbKaIX0NUwWnaqLrCAMoZ9t4q6bHuT+Wx5l/8JN8uMXP9QfPvEiozpn7Bp65QJrgyF17cgWSmyvS77Qh6KgUcWFWLPPxCbB2TSXjNAy/6anAyIJBYM1Qmhq6sEAPxhivMMEsITEFiUmBmIgZCAB19Qs9A0PPnAbd955/WWP2y9z/MpU1y82brmmkLvuuoHCOqy4VJhVjNqEpXvUO0JS+bUa8KMR1XCAryaxbuU90lJCL/hH2qHRRFqrlWhZ71C8MUheYIsuvcUlXPDY3GILYTAeUjeehaXdnDrheO2V8xh3FVuWbmBp8UqKooMPAZs7kAoxTUyRJRJERLL4u4kXfF07CluieEaTIWosedmnUWXcjPBmnY9Ov8HBY89z0r926ZV/bmzbtsTS5j5VNWw5Y0nsM8oFqSouOs5tIH5cLrDMjwtrVvMurZezFLnYP8HiQ4Rfgjp8E72Zti/1uHH3xpX13Fh1eXXE2dURXtLzLjIt22AEbHDXdc5R1zV1XUcSjg+EUUPpoGeEjgVDhZgazTwhF4qFPiM1rDSW5YnhjUNn+LsnX+apVw7yQeP1F7ksHrp5j1y7ewuFOJrhkHo4wTuoAzRTJQqTpJEMPsTb2uk6PW7B0SqSt2QR72cWL63nU+v4ulFk5dLZlVEz9W6amhkG4jWXVk7RFiKLASAEwUqGkSxmPskh1hrFCkhKDZOoSzRcJAMfveBMa/MxfX+m/VdT9XON3zXac8iG63fKCpz/aiFCf2Zag0sBNiS3gfQaXiM3MihYZygai3UG8YLxoN6ips/ZuqS49g62ffZrsOs6LmX7AXBaj+iBYy9y4OjzDPxJnEzIihw0I886WGuZTEY0vk4QaPSMisduBvG23njee4qiBM2wlFAVbFu4grtveoitvas4fs7r9//+WU6fGVM3Gb3F7UjewSnknS5i8yRC3IUsp9Hkch3zoek8IsyYmLPrM9WrggP1kSnaNPjJEN+Msd5j2uw0lV0gXnOxhzjgfMVCv+D++2/n/v2/Gh3Ai41fa2Z18nylH51Y5+fPvM6Lr36IsUsYNVT1hLwwjCdjFvs9xBEPcHA432CGI5rekMJmqZCeJeZQhFFCCKjzZGLIMoOxOc4FnPHEBgIbpew1kJU5tteFqk+zvgwa6C6UKIaqdhi7xHf/9jVuuuHrXHPFg4wOHeHo2ddY2AzW1HhRTBaLyrFZ04IxqDYp2EbKsfeKStSMC8FQNwGRPFHhA+eHR3nl7ScglJx17+j27OJCme245ppdfO6z9/LX3/kZa1WDlT4qJY13uMoBFmM9nugueuECtkGssoWnLoD+pllWMBd93vS2CwgQG2pLBnzrR0ZUP+93c6rRKtu3LHzstUIGx8+ssjaqqUQxWYKRiIohxkiSiwFJdSwjNm4PZQYHTj+nVzrSwTgwNqDiCKYGGmyRkRUGtMCpYtXQaJe6jqy+0YEhR0+8zQ3XXMGhVdV9S58O3rhy1zau2LbM2tExfgyrw8gKK4potJgVljzPgRhcRTQxBAPWxgVGfcx0srylqc8gTnOJ4G2NoWnGU7O+iw1jTPRc0xDVGhPRAlr0WlK/bKtKIgTf2uGkxyH4ZAQobWYYIueWZGDopoaJkS0GLUQn08xJIF630wwroQBT9fXpt5trHDbToBSdl+NrSKuqnoLttN9KYETABCF3BqvRd4lG0cbg6LCqXXbe9Qj9z3wF9tyAmCsue56ff/cJnnjurzg7/BDNx5DlVK7BSElTx+y0KAp8mCDGJZUdi6R5GqZZchzaCHnZoalqup1NdBe2c9fNj/CZm77MeNzlyZ+8ylNPvU41yTAmZ9wIZVEwbsYsdroUvR5Zv483GY3zOAw2zRfvPLlNJJeWDUjaKJBkuFXJjSUHQl0zWV9jvL6OTioyEawIzjVxrZLkNJyIGM7XbNlUsGNrn9tu/vXUqtrxa82sdm8pZe+uzdxyyzVsXspRP6HMDbm1ZFlGt9tlMpkkDDuQi42eLt7RjMdoVZGrJqzcpUI2ibXS9ly0/lcS3WM1m+kGSmwOJMuRsoQioyYw8ZOYlQCiHU4er/nmXz6N8XvYs+N2dm2/AQ2dOBkCiHG0Xk2Rzmlmh9JoQqsMotHmW4MleIN34H1sNA1SsVod5aOTL/HR2ZdZ14OXTYFuumJRbr/1Oh5+6C4KW1OPVzFB6ZZdRGMtIy+E0XiVy+20LzUulYF9Eux34XPjrnrmQeZ9zEK3btnEtqX+x567PoS1UUPj0oIjsvHCns+cL/j74gxGE20r1IImFXBtq5kNQWo0q5GiwZSCdIqotdZ0OL9mOXEm8OyLh3jquYMcOf8xLYqLjtuu3iT33nET1+3ehYwmqG9omobxeMz6+jrnz59nZWWFahJZYDEzjNm4+qSoIBJtGFImS8oYZn5usVZzYf3OmNh7ePnzI9PMo1UbjzWmBLH5qCpPIlvE+lHM/kKYz6xTNhjaGlIOZKja1KxrpgGuNVOMgUan5AppoftWkDplXiYFuqlXVZIImgUqpRXE3fh3yl7Sh9NgwfYI0olmj1WDDQZrOngWWXF9iqvuoH/LZ7D7bid0Lm9V88r5J/Xld37CqbVDSNngTU2QqDYfr+0sHQeDSgPSpCwyzTkh9rNJ2oSpYCXHDZW+3cz6mZortt3Ilz/3T6i0g4Qlnvr5a5w9O6KuhMbnIBnB5GS9HhTFNKOK6uezLLtdD+dt7GfZVaup6iFEDzJcQ1ON8VUVG3yJDGfn6g3XWPA6dVQXqdiy1OELj93P7u2Ln+by+KWNX2tmBXDltkyeeOGIvvL6Oxw7eYiuyfEBwsTR6RR4cTPDPGPIjcHVjmp9SJ4X9MqSQNq5m4RxY6e7Qu+TmoUCJO0biY2knmj2SFGQ9fq4ZoTTCuc9hTQUJmC0JLgF3nj9BEc+upmHv/gH1K8d48jpVUJzmn6vSn5RHj/VJkrBKrGp4m0WtCA6zc6U4yNd1GIyw3hyjoMnXqDb7ZLlwjk9qNvk0s2I993Ql6ffGeip0+d448BxxsN1unYroQk0WtHp5tgswYB66QXs0wafy9HdL/l3KqxHVZHoWkzm2Lt7Lzt3fLxedWa55uz5AU2Ii3WsQbbnVdjQhBzkgvfe+Bni5/S4tIBHOLGMzZmpH0glEEIVYUSJtRibGULICM4wCcJaVeGbE+y7+tNfjLu399m1qeCwjpmMA80ExGTkeY4tSurgcXWDjAy9Tpnmt0LwiBGsTdnhHBMuBI1Q9obA/IvtL9sFi5TliARCyqRS5IlsPqIWJiKoT5BSiIvXPIEBUiAC1M839caajCRB2Kl6hbYsvvTdpuoWbSBjQ21r/jnT9w3x80rL5AvE3qW5zGzqLE6GDzmhCRitKDIDtVI1hirfSrP1SrY/9AfYex6FLVdhL2HdA/Bu9Yx+/2d/yTtHXmStOYe1DsmikLGk4xDrgDFrxrg4pzSHtmlfYnYfZY3ABItVSzdbgEmHPZuv5Cuf/cfsz+6Uj1ZW9Rt/8Xe8+sYHODJs1gGT0wRwPkREqCyx/S6a54RUzzNzwHW7zkSh73aDl4AIJTKug4toRdNQDYc0yWDRaLxiGl8jthXWjddhcB6RBqsTrr36Sv7ga49y9ZaPS6b9KsevNbNqxz13Xsltt15Hr2sgVJSZpWnibtTaSPNslYpjD4DHj8c04zG+mmA1xF1ACHGnoDMNgBaXne0qBKtgvEaJSAmozTC9BfKFJbToE0zSNZOYpZVFD1fn/PgHr3P2RMm2TXeR6dU0k0VEe8QYP+tVAaYqxnGDmGAQLBLyyPiZ4vjRX8taiy0a1uuTvHv4WV565wmOnn+HgZ6+bCS54do+X/38Pey/agsmjMHXlDZHVGlcRVFeuLjNH5dL/7vYuNTjLvdT0/mIu8t2l+bZvn0r1+7NNtaratVT51ZZXh3NmTpePGP6tP+CKAGHExdrlRq1/zTp/8WdcDQA9aEhuEjzz7II5WR5QX9piXGAY+fXODr+dNnVpgXYd80O7r11H9ddsYW92xbYXIL1Y5rhecZry0wGqzSTIePRANdEhYAoeNpubgzBzwKvScSMaS2wrUVsOEaf/PFm2VqInkYh9s6gs7pKbCTVpIjSGhtqvLRS1iIhohUEQV2igadAJUFjTTl9zvmdfWuXLhuyuzZQzdeb2+8pXGzOxX8xkG7YLLX3BTBeoBGCU4ItoOgz8jnLviDsup5dD3+N/O7HkN33yuXqVMf1fX3mte/z3Fs/pDZrZF0YNQ2ZLSMBxc9v5OLvLcMTzTAhGmR6owSreNPWGg156ODXBNYLHrv3a9x8xQPRKeDoiG99+8esDx3dhc1ktqRdoivXYMoO+aZFpCgJNkLjMSNOcyKtb57oadeKH5MyqtYYNUOxwUcIcDhgMh4mnkCI9UlJjfzGgMkwJoulBT+mkzvuvO1a7rlu8dcaqOA3kFlB7Gn5y++/om+89SFvv3sSFaVblLi6Jkgg7+TRP8h7bOsnFQJ+XFEPRvTyLj41/wcX+wCSe1LcOSeNi4iJJxM7iYoWAagxUfKks4R0JwiJtBE8hBqMYEzJO2+e5pt/8Rz/yb98lOrqCYdPWdZGb1N0ajT1Mmly/IyOwlErMDklJNZXTBVmih1xbjWhweSezoIwqE/xzpHnKRd2snXLFkZ6RHtycdfW7R2R4wPV4yev4/z5IecGI4peh0BB1QzxBtrTemEQuhhN/cLbL0ZNv9xzL8ywSLvxWZakWCts3vzxvrJRBafPrbMyGCMmj60Iwc0EM6e+522RerZTjO93YRYYd5Peuui7o2lOaFJG83EhyfISoUZChDtCyrglwTWNdwRtOHL6HB8c/3id7WJjayZycqy6e/fVeLmaw8dGvPvBhxw/cYq1YUOtgnMeHyrGVQ5+AenHmqYnJjiZmIhayoyO3zZytsf6k7LiC8cUhkuqD4Eo/oy2VPl4QIXI0lOJGztoaeSz4NP2KLWBLE5ygQSho2EqSCvaXqDx/LVswA1NwWGO0ZcyJJjLulL29zHKvUI0aZxlYtpCjEHpOEeQjIkVBk6ozSZk73Vsuv8LlA99FbZdcdljdlzf16ff+j7PvvYE5ycnKJcAA1YLfMiiH5daVP20hhfrrIaAJQupBGA0ogsmbaaDpdCMLZ3trK/W3Ln/QR689Qu4SY/RCP7qr3/M2kgYeyXPYNLUBBNV1dV7bKeg2NSn1hDZxT4dGxMzZk3zJ6RN8/TyYc47TpKosnO4cYWvatQ1ab1KE9F6tHUPMFnaxHjKrrJrV58H773pF5qDv6zxGwlWAPfcfTOfefcoB947xvmV8yxs2ob6LOmfmchCCYHMGGyIMjShamgGI3yvD3mGybIIvfsAyXE4Cq766Y7Cto2DEgjGoRKVBjx5bO/qbEZ8TajHsYCcJkK/12WwPuHl547zlS91eeD+P2X47EnWh6dBl4E67mQAkhyJp5WySQ2LbeMJRN8fsQQJQEPd1Bjr6fT7+MKwNjjFB8eeo9/t8ugNX2eip7UjOy8asPYuiLx8aFmPnljhmRcOMlhfISsXomx/cgO9kAQBF4f3LqZQcbFg9osskkYkGsKJUJYlmzd32bxl6WOPG47gzPlVRuMaa6PmnqgHsrngc7HvsDG4brhf0qKIJE2zducQMxhRqCc1uSXWjQggrQCq4oIDI3gsJ84Oee3dj3j52Jrec8XFhYUBPpzUOlobU9Wwb/PsA52cqB786FrePHCQj46dYX3iaID18ZCmaaiqhk6/R5F3yDKD5JY8LwgpiDKtTbUQzuw720SwsGa+r+ZiY57JGUkdU82+dIinaESCsWNdyc8ep8nO3Me6GT5FJEyaa+m12ygUopRPmym1BpLM2qyY+UrpLDOaReXp+W2DlrZY1pwm4AwmbDOrgPVKGQSMYVAZlhtDsf1K9t7/BTr3PQy7rkDspRlsa3panzn8BD98+tscPfcB3a05q9VZvAQW+lsYDypKU4JP2ydtYglCAkEMmXaQkKeNa8BL2JBVaYDh6oRrtt/I17/0J9zQv1MA/vs/f0F/+OMXqH2JtxbvG0IIWJORZTmUBSbP8EJsdFYwGgOPaKTuO+On8z8hhBFV0vaKCUiIG8mmqqgmI0JTIxCZ2Wnjhni8Cl4LTFsnVGXXri089MD13PprJla04zcWrPbv6Mjf/uyw/vQnL3P+/OGpBXNelPjQRNVimE7WTIXgA/V4wngwhF4XI7GpOO2npzuDILEl36R+DCuxWdegcReLIRo152RlQN0ksvhcQ2bA64jaA/QYrRu+/dcvsm3HY+zcchdrww9Zq14FGQKKajMNVjrdado0YSrixZXF60/jzkeoMbYBkvRJZrGl5+zwAK+/H9jc2cHNex+77PG75qolHnvkHqq65OU3jzFsGmyZ4VNaFxePi1+Tn9RT9YsGrwszMyuKbxwhCJs2ddm1eydbt348Q1kfNSyfX2dc1ZTdRVpDRysylXdhFpsu+Zk3/N7qIxqTapUNkV4aMBIVBXzTYLREsmJKRrPWEIyiGDp5AUGYVGMOHlxjgSMcWVa9auvGA7WsqieXHW+8fYIzx0+za/NmPjrt9eqdsUfLVrB/b4/919zO8jq89OYJXn3rAAsLW1kZ1UwmVWT+dSyNDzROKTVDolAQWWr1siloXSR0b2RCXnivLmt94oezc6gpu0psvZalZnwMOKEVQPUuZi6q0+DWwnMoEUpsNWTUM99r2GZqTCG7GaSHttT1WdBqYUFtn8csSJlUt2pLbpJSQZ2HCwMzBQ4N2OAxXgmNJzdbWNqxn+59X2Dhoc/BlfsQuXSgOq/H9O0TL/DUc49z7Oy7ONPgsbjQoEYj21cFfBkDLhNEKrxpImSmJarF7HNbYs0qpTgaUr3PWe69/UH27YgZytsHJ/pf/p//a0T6UQS7KHCNpyiKiAhkGXm/S51bRs5FqbVI7WqxGnxiSgYTLUdMMB/brtq2X815qvGEajQm+IainUMx3U0b6tgOEIiksE6Wcf11V/MHv/d5rtja/bVDgPAbDFYA1193BXfffTMnT60zGil105AVJY2PmKkxJvkq+rTz9Xgv1KMhhTWYIo+xgDjZvcSFumXHCDPfKwma6rGKZFHqyRhBbIn4HqGeEHyEEcvcsr4+ZOviVXjnePnlQ+z9zgL/4r/4HCZf4fnXj6CmQqmAJhIoBNA8iri2BWhtgIboQhpJGEEbkJCorlBNGkzWYPIc59c5vfoeT730bRZ72xjrWe1eAlffmlayp95yOhz/hLffP0rwQu0D1vaSu8Jl4L50AcVdl50WjKe1OJn5m34smMVnzv5Ou+wYxAJqYjO28YGFss/upU1s/jgRkOHEMRxVNLWn6NspDBTfNElqmfa2GL5ImnsXG9OFO8T+ILEx3zXqI2SIQ5BYm7IFIpbaRXhYCdgsMtiaxtM4EOmxMh5z+Pgyq4ONDMvj51XfeG/IoeNn+PDICc6eOcOWzlnOLg/56bNHdM/u7dgcdvRElmvV7Uvw2H17uO2mPRw4dJzDx05z/PQqTivECU1jGKthMslZWOyCGrwQz5No1GJrz0PseI3QTkir4iVGhOM0QVeJ7u3b1IY4L1vdPhPPH8FEWnp7ewvDXSAgG495guBIN5Mo8YntN6uZpOCXNnakDLmVTWvz6Ng7GOtPKoJXE+vXGpUyTPAYl+afF3wwyZYkBkwXwOfCamWo+3vZedsXKB/8I7jypssGKoD3z7zLN57497x1+GnKzdFRemWwQnehS5DAcDiksH1ajeK5JD9+Zww2mLhZJqAmpCltsD4jb0rKps8X7/saX/zMH7IkV8rZgep/9V/9OYcOnUTzLZhMaNTTqGJshvMeo4GFXhefGZoQ4T5hTr0lCG3UttNMqP1MaTOmcz99g68mhMkEG5RMDEYiRBx30xlqctJRRkJDYQPXXrGDLz5wzW8kUMFvOFgt9ZR/9Eef570DH/LMc++yafFKVodjym5OIOreKQG1Ei3uUyZTj0YUnZLSQcgE1NPMechkiTZrqWO9SDXRgvMUsCowDY54X9HtkslWwmDMeDwihJrOwhKjZkxhhKbxvPj8Ozz8ueu59vrHOHjwDT44tkZ/S05eTPABRlVNVi7i6mRzkhTkkeikipnBN6oZ3glKRmYTfIlLPVgVJ4av8PSBvyK7o8NQT2v/EnAgwKO3ZvKTV8/oNx8/zxtvv0e/3MLYC2L6iLVx4W0ayrIkL0ucq+MmUFsH4BjcjRRIIAaZLNAi8MAMjZtzBp4PGiqWWPSOC0xNwAVPNxgWxHLX/qu45oKepTNe9VvfPcDaesPCpi1MqorMdimKDO+T9YqkmqOJ3f5CuwOMC1MbyFr2aNuLhTZp4YyZmko+97lj75Z3dWwvkCT8mTIKIzGDF5HYx2ILGiOsTUYbjvvPXj3IW0dXWR47xmOP6ezinMDy4REvfzBk1/Z1bty3h9ePqzYBdnU2fv+DZ4d64NAJ3ju8zLFzA9ZqC9LFSc7q+YYsF0JPyMRjM0+R5ZCYpaIe8Z4sA9M0aHOp4L1V/PG/UWoBB9ZkaKgjEpAcEYUoQRTrPhZEYo/gNB61dSEzi0ZiaYuvmmjusWUg9TXO0dZJwW5GpIiLqWGmuq4JLRcE8UoeBA2WyuQ0LdlKHMZV2KCYOrW/BovzhjoFS1AaI3wUAm7bley+82uUD/0Jcs19n7jAvnz+Gf3uq9/g7eXXMAsO58eIcXRMhm88XmJPnNeKYMGoYFURLYBosRLPQk3egUE1Yn1Ss7htO6HJ8GvKnt7VbC538pV7/pjd9nYB+Otv/ZyfPvcWjelF0orJCGqQLKNGyPodsn6XmtgWkpuYsapAE2YQq4hgQ5bYgQFrwUtUdg8CWMF6CN4xXF3Fj8eUquQYbCtU124OJDEtvbLYz1gfDbjq6s18/qE7Pukw/krHbzRY7VnK5eh51dtvuY533joM4unkOcFHvyK1gBGiDl5cpIxqVGqfNPi8QroSszBi/xJEzNYkvx3ROWRiCuR6WufQQDRNFcnwWYFmDZO6ppvHulm/06UIPQ4fOcmf/9sf8J//F1/hvjv/IWIcHxz7Kd3NGZUbEoLHWsvY1eQmR0Vjr89MK4aWKBDI0sLfEiESpk2IdPgy8P6RlyjMJuztsK4f6qJce8kL7sZrt/Klz95GkdW8e/AMqjnrkwEYS6fsU2axHtRUUenBZjGrtES6eNy5ukhmkWj2F8kh7b63HdNciwhBMYWLQtqpa4KTPEq/LNiy0GP31h4XjpXRiOW1IcORwxlBJJpIOhfIWgFNZFrAnunZMeurm/9kOiOHyLS7VNK/SxV1Zq+g2n56EB/VI2oToqJG6mdpx1vHvX73Z69zYnnEOGQ03mLVTN+rV/Y4vFxxev0DDh4t2X/FJl4+dF6v2rnE9n6MsNdtj8aQ7552+v5H5zl8YoWjZ1c5d36ZTneJ8bDB14Gsa8g7UaTUmBz1RSSDKDSTCsNkngz7sdGKtxqfMhZNPxO3XANoCNFaon3SBYK3sbYUpjAcpAWyrRmlGpLRyF7MNFl1tAc2zMF9zPRJ2ldrZ1kL+QcfiQohWbMrilGHqkQdQwXI0WDwTojF52i2utoI1Y69bLv9Cyze/1XkhssHqnFY1mOTI3zrZ3/Jj157HOkMyEMV9Q4JiYKfdEglsYZxaUG3WEg9fZG5jDjGdU3WtWwrtzNYr+lnC1jpkI37/NN//J+xazGKKD/53An9X/7937E6aPD0KIqSybiOG3BrMHmBlAWSFxHWJiXEqqk2FVcx1TTztN2Yx3OanLSm14ULDVpVuCb2VRFC1Jk0sbUgIARjQSIyJAKT8SrX79vN1//gIfbv+9XbgFxu/EaDFcCVW0R+9MJZfeutD3nplUNk+RJNwrrR6K8zI0wYEMESqKsJYgfkVjBlOet4F0nSIxGjVWbFaZH4EiZIW+Ga7SDFIibD5CXqXCqQThiOB3RyJS+6PPv0m1xx1Wb+5b/6ArfeeJ4jJ97Bcp5eJ7BerVBNVsgzS8Iuo2gpMShJsrqe7lKJWWA7VNr+FAN0OL+6zDuHfsRST8j3CQM9oguXYAjuWYqQ4Ivvr+qLr3/AD376WlRRdpZMM7yPcJfJcvqdLvEKi6aNqpr8aUK0tVCDhHyOewctNGim0FGrQZgCCS0xAtRG+rMEpcgtmzf1WLwIoW7l/JDlc+sMRhNsN8OWNnqa+YAVnb7u9CTNDWMuvv5cjEDS3h5v21hbm6dFt/e3dZsQAi7EDK7MSrJsBrXVtWMwGjIej9FigSzLItwSIt6/Mlojt0LjlPHpFU6dW+bw8U3cvP8KDpxWXerDrmQ1ctPOTM451Vtv2M77B0/y9nuHOLtyhqxRlIIs9KkGhvW1BskKrJRMJg0+WNS6mCVz6WgV9fuSAgiJvp7gqyCxLiGtSHxit05ZeenYtI4irQqSTG+IWZckWC+k6zaEiwUzUu8PtIrf01pVyrAI0Xe7SfJhRhuK4MjTNerVUNHBFyX12KN1iK0uYqlVcaZL3d3G3rv+mE33fBmuvuWSxwWg0bN6fPIeT770OC+8+Tjj8RH6ndhHFUNtbFFRjYxfI1FAu1XMiHW5BJ0rqe9SUZtRTzymaliQBcL5wPbeDv7gsX/MLfvupy/b5L2jQ/1v/vtv8PIb7+BDmb5/LCEEApJl2DwnK4uIKkkUoA0RPpgrDbYICWjyqJIUrLyGyGzGoN7jqwl+NMJVE4z3ZEpcl9rNhFhEom5gZoTgJ9R+xE033c7Xfv/zXHtFdvEL79c0fuPBCuCL92+X/+t//QN9/bV3yKxDpaAJJlLQA9PJb42S20hWcFUNMsGWHWxeTD1c2h6MFC+mzYnpR6TNyuzCgXgRGgFyi6GLFcNobYV+11LXA9zYs2vHVnzj+PEPXufGG6/l/kfu5vabv8hbHzwOnRGFzRhVA7rdBZq6bQxuF858buVvsz+9xO8W52sWNuU4Pc+bH/wM6i7lbSWNntb8MpDgfdcvyftnVDcvbeH1tw7z7ruHOL+6gvM5uSlBBVd5yAw+Sf+3kDcIwYQoD1XpzGo9uQMDM6HcFq9vA356/5a6bozQySx5JmzftuljBAmAlZUR68NJ1KFTE6sXSUDOyIUZ3WzMswFnf3/8MZdjOV5WOV6j1UvLLssEet0OZZlPH2tsdD4G6HQ65KlB0/mAGsGrx/uGxge85hiE42uBtTdP8MaBk1x/zRW8+KHqnp2wtyeybc4y5eCZgZ473/DWgSO8f/gE66sVTrsE0wdb00gkPATf4ENNsWgp85xLjbbHKvZVtfuoRAdK/U/Tx8Td0oa9Qbtr38jWg7jZmu+DalXTSTYW8XHzz2trm20Ak/a+9nU0bhacxNc2wU2lLiNXKiOEmAHUQclzi+Qlq5PAWmPYvHc/V97yWToP/QfIvntjYre+rLL48cbfgZ7Vo/VBfvba93jylccZNcfZsTN51ZGlYBV1HI22bFEiqav9/sRrx7RfNtHXbZbTrI/Jg9DrLBKajLv3P8iX7v4j+rJbTg69fvPbP+O5F99kMA70+wtUE6gmdfSlsoA12DxDbKxdRrQioiCaFrQLp348vgpq8aGJzE6xcXPhHb6qaMYj1DXRsdjYaQ0x9jm28l4eq4oLI7Ztzrnpxr3cfuNvNlDBb0mwAnjogdt54bkXeevd42iwMTtSwdgs7gzUY41gManHwBHqiqaaYDoFmuRr0j4vevW0QYhZPdlClGFh7p9GfNfY2LxrsFR+ha4ROr0SN5lw5twKS93dVMN1vvONl9m588vcedPXOH7yPU4sP43pBHplTvCjiOmTpH4wtN3s6ZMQFbr8tCbUTj4Arw0Q2XE0hnOrJ3nb/4gi9/j9nome0o7suuTEuX5HXPjePBb0nXeu5rU3D/LeweOsrFc0QRk5xZgyXorWgLUYAeeVoIbgXTLBnL2FnVaRZbbIzX+jaeE//e6UTpGzaSHj2mt2YS+o/59zqt//2TtMJoo1ZTwmGmFbkwrS8VySAuWFgaWtUGwkPczun+H487e1f7eL6Qw2nMu4aKWGYg0rs7DQL+mUs0tlWNWMqxoXPB2JhA1jDB7B5BlVPaRpAk0d62gTNdS1sDL2aDPhzOpBPjxxlv1X7uC1I153bTPs6sUPcd2OBQH44NhEr9y1nWNn1jlyesTplSGTcUWdMlajEzodZfeOJXZdRBlkfoQQGV1t35RJbEtEkqtuyhIS3Co6fzxSM7u2dAimmoIyzS7a+yX1ZMlGBYsUoEzb0OvnUjWd1a4iUq6AS83+JtXobBL/jQaDrhokibaCofes0kF3Xs3me75G56F/gFx17/TEXyxQAZxujvHDF77DT176W9aqj5BOk8hOOUEt2irlp7lvUoBq15UwJxYduzpTdikG3wT65WaWZDNhRXj45sf4w8f+hAW5UgB++rM3+N4Pn2V5vaYsN+OCgLGxTm+ELC/RIkezyHT2GpI+n4mQ3ezMpp8tRJg2DjK7RmJ9U/F1RZhM0GaCVcgk1YJDClSaUCCFXAQNYzqdwH33Xc+9991w2fn16xq/FcFqeaC6dUHkf/mzn+t77//P1JWh9iXGSBKvzaMEjI96gEYEa+JuI9QV9aQCEYzEOtd0A7gRywISJBhas8f0uBYWMYLPLGFcs2lpC7U/R9WMWOx1WDs7oF9kWLuZw4fW+fY3nuOf/6sHePTB/4AX3/K89+GPEalR62O9xXjQqMwc1QmyBL3pXGLQTrb2QxqsKLYDjV+D0KHsdRg0J3jpnR/RuILP3vPpJIBuuyIu+weOB33jnY84fPQch48tc+T4GU6vrOE9BGOxnQ7GFmiIMI56FzOL9NkkFV3jjgs07dSCpHrIdMTanBCox2M2FSW7d2ziyiu77LiAXHF+pebkyRXGkwab5ZG+rVHhObepzkeSq5lV+mfv1FKv5eL0/PmsqQ1GFwtcF/4USfBw0uQL2lBkhk29kl4xe/1J43BpERYTCQ8RtsxiW6g6yk6JdjKqiaeqHM6DGEvWzRip8v7Rs5w8c5Ijx5bYd9U2XvtoVXdt6bNrMe5g918RpWxOVarvHhxz4KNjHD2xzNlzq6yvr3PVnp3cduO13HTtbq7ffQlcNH7ZqXK7SSrnvtW0kggTTuG8ZBypbSUpNQG3mRDolPVG8qNqT89UKT3MYIx4f/u81jU5Pn5qvJigwJgUxA8kqcnYqUF8Dj6L9hfp9Y3EfrhzI2VgCsqrbuOq+75KedsXNwSqS40P3Rv6vWe+yU9e/i4rk5OYMvpzxXll59aN+fk9C9SiYSZvJJEdMg1dKjSV0C96+AFcv/NmvvrIP+TaTffLuUmtx07V/L//m3/PgfdPYm0fYwrW1id0+wtIp6AKjrzTI+Sx/cKjsa1NADNPMZ/N5SliwPxmLP5lAuBqQjWGaozxnlyELMkotOUWY2ZqKcE34Edcc812vvj5B7jjjqs/6ZD+WsZvRbDauhBXkgfvv5W77rqBn710HD8xSQ4nGYG18jBxq0aeGmxdUxPGIzKbZEHawjHMXQQbIUCTOvVFZNpoGST2s0RFf8PipiXOnz/HpK4py5LOYp9JXZNpRlks8fwzh9lzxSJ/+s/v5t7bhpxfPsXK6D1MJ6C2Qol06dgNoSgzcdfoJeSn6V674yQpcIhtaDR55RQlxlvOr5/h3aNP0Vvoclpf0EX20f0EKi7AjXvjQna2Vn31rTWef+kt3nj3A1bWa1ZHNa6B0CgWS2YzsqLAu1HCvts6T0ubjru6NtAHSeK/MlvIhEAmgQzPnl2b2XQRyvrZcwNOnlxjMHKYrAPWglGMD1FRnY2Z0AaTS+aCVfosYsJUSV5EppJF2n62ts/lwiyqzbov6BNrNV6NKJ3cstgrKVOwOjNWfem9VTAZWUny1PKY1Ljum8CWbg9XV9RNhVhDf6mP2IzReMxwOERyQXPDqoN3jy9z+NQ5tm3uceP+q3n7pOquRdiaalq7SpHTQfXa66/nyIkzvP/eIU6daLjrtn3cfuMVXNG/RJNVO1rrj0S3ntblRNOGI27e0gGIsHAqgZm55tu2MbeFf422G4lW/XwG0epsas89LxKMpJVyanUA51QoJMwFRIWgGSEUmJDHRdZXIB6HMlJD1d1G76q72Hv/1ynv/hKy7ZbLHouBHtPz4SQ/fPGb/OSlb3N87QgLWwvqaoxoyUKny6iaIFPlf5nLIucy9XZRITDb1oFKVLbIQgcmBbsWr+Irn/06N+y9O86dMw1//hff4+13juJcRicvMZphpabxHtvvEFxAC4ntH20QbAN/guE1zVXTMjSnNcuYHWmIuKkAEhy+rnGjEaFpyFRiv5XEDUbcYyRRZJEIH7qaftfyyEN38uCDt7Djk+bYr2n8VgSrdmzdUvIHv/cY7xz6DrIujIY+Xjk+XnCZychstDyIbQACriHUVRRiDGXE80k9VRpbSmKvFbMdX3sBmvga7UalXRPzTsbEO9QWbNqynfF4QE5G3YzZ1N2MD4KVTfzkR29z863XsP/WG7n2ikd478OKifsIEQ+p6XfmKpd+XgK6ErFIyFBxTKoRZS+6ClduTGF7lH3L+ckxnn/ze0zGjrtv+v1f6NhuT7bt759VffjkbRw6epJ3PzjC0aPLnF2eMBiO8I1DfIExkS0Wg/mMuzU1vWwXd2l/9XPfK7DQyelmsGv7Ihdzr1hfbzi/OqGqG/JulJMxRnGBSFlv+3nSmP52ASGivV3mb1P92N8fA/cvMeYljkSETKDMlF5h2VXGOxUYTCbR7C49xhowVqKLqhhGg3X6ZUHZK6hDoGrGuGAoi4yiXGQymeDIaRwE1ehzthJYfuM4b79/juu2b+ONg6q3Xxff0wpcncffj1ZrOh403LAtblSWh6pbL7OYtL5KU/wqUcYTV5yAYPwcwURmgrEtYWJ+xRS98L45CaiWmBFi7Saeq5AYuZKCnyQlB0mXxUxJPb6yzHhHIe7pjAuJBBKVZ847z2RxJ70bP8MVD/4BctPnkC03XnZBneg5/Wj4Ns+9+SO+98w3WddVTMezOhpQSE5mYFw5UJskDz2xepM2y7SHL7bTiIbE+GV6f1CD9TmF9ujLZr78yB9x162PkKdeyZ89/SY/+unzjCYZ3c4mmnGgs5CxuLjIufGAwhZQ5nhp3Xzn0J+0wQbAtHW/jfJboYWx05VhIeqqNjWalNVN2weagrALiti4MRMBqx4xji2bSh6871buuObSQr+/7vFbFax2bu3KyfOqP3vhEH/73WdpmoY865BnJd5Fm3DvfbQp9wGTQZFlOFXq0RAVQ95fiE3ARqa7uqCzSRXhLJlL9WewnA8BNCm+e0/e7eOaAWIKvHfkpVD7dXzI6XZy1s/n/Ov/8Yf8J//Zwzxw/59iRXnvyI9YbcZ0OobJOJBlQhDFa0PZ6TAcrVPkafKnFFwk9qbElDwjz3u4xgMNZIrzTfyo4lmrTvL8W49TlIZT+oxu4lq6svtTT6jrt88WtkOrqi++9CHPPvs6x0+sUNfCsHbU0mFUxwbLrLAYk9E0fubPFX0kUtYSUI0KEWqgAPCOXVu3c88dV7C98/GFtGqgqpS808UW0XDRZvECtAhN2rnOByWRWS1FTLpQ2xqUl1lzqsiUuj4NPpoki8wcZDLHDpz/HQQfiB5Q1ZClvTvZ1OtMP3sQGI0bgoneaQBZsjZWHwgGOkWJCx7qqDNZZHEBVPEEhF6Z4fIo3uyaQO2VSQisjYTl4YRzyx9xYvk8f/P8Kb3m2i1UcwvSleVG2afLBSoAybLooRUi67PI4sZPE1EGBHzarbdawnPkwinbDGbZUPs7JPRXZjt9okXF1BwyBbh5lKPdu03tQFRnby55vAy8YppAro48vW8VctZMl8HiDnbd/yWW7vkyXH0HsmX/ZY/BaX9Cj1Yf8dy7T/K3P/srBuEsjYnK4pZoJ6MhKvJjWqJJohLPtT4o0RMvaBTcbuqoUJMXXapJ7O3b1NvEktnJvTc8zN23PsJmuU5OrY31J0+9zb/7qydYH0byvlGhY3OaSUVllLxXUBmPy2LbywzZSIfFzhQpvPfRZqaFc1sCGhLVMhwUNgPfqqqvIb6JtWcf6HR7DNcGqLGURZfGO5qmQo3i6yFXblvgc4/ezR13/HbUqtrxWxWsAHZvEfnX33pLX3zlbc4tD7C2w2hYgSkiFTzpfmlrvJfwcvEOaTxUDWIjXTOiU2lhS6/fXngzD5h4wtv1qlXt9iYgPiNISeyajDJOgQAOguY0dcnxIwOe+skhrtv/GPff+cccP3WEcViBZg2rDU0d6HQsapX1wXl6vU7EhKEFopnWtVp5IS0ABxIfF0xDnOIZnopGl3nu9ccZDcZ8/r4//kSW4KXGviWR0wPVm67exclTK7zz7mHeeOcIh06ukUlOZlMPlQ+IjzRdF5Rer0ddVzRNg7FQ5p2oT6cKfkInhx1b+1yKPzQYNDQtycUEoiC4tG4VM1ZTGhfmRZf7ohcy/jYwAS+RYW3cnQaQPPpEZTZmSPnsfu+hbut7c3a9JmXNKiZSZ6S9LS13acEVgczkZBLtP5xVKh9wPuCDpwkWZ+HoyoAzr53nvcM51+xd4qWPTulVu7awoyx+sfMcZiKyGiCaScvUsgJittOqHTANPNBu7TUeGEizMNae0qNb1RGNO3tguqmAubqmCrOWDZ0+p4UGde62plIKm8UFt4HGQUXJKN/EarmNax79B3Tu/Cxcdw9SXnrnP9JlVZRT4Sh/98w3efKlv6WyQ5w0eHHEZl6BpOGpEmE9xMfsb1o7DSk2x4xKRBiPh/R6PSwZqytjymKBbrHA2umKh+67hz/+2j9H6thf+P6HZ/k3f/Ztjp4eY4oeoTZzgSggViAXvFW8iVhPq5fYlirmnaFtUrC4GKu19QUL3qF1RagrtGkwPjpVIMJgMERsRpl3UDw2i4K4VT0isw3XXbuTL33+QW7c2/utyargtzBYAXz+kVt47/3P8M1vfZfhZICP2TlFsQmPieQFabOkpF/mIVQVXgRbduJC2NKs0y49iTFh5pc7VcTMFkQhECRmMkZykAK1EY8IMpr2LlTOIj7HmE288sJxdux8nX/4T+7i4fv/lKdfGXFucIBOBsPxCuNRRdkvMC6+jiY4JqRAZaaZVWo6DBYjhiAZiENNheAIdDAUuKbizPAj3jz4ffo9uOfGf0ilJ7X8BTKsduxcmG3fzqyqfnT8Nn78wgE+Onmewx+e4Nzqeazt0eksUFWBwXDCyrCiKDp0ikWssbi6oXaOzFgWyoxNnYob9u3mQi09gKOrqt/83jvUHtR4gvgY43ysZQQvaMo4IZ0Xs/GC1JAudpm7oC8IUhcOaTc6QEt0kcSIahUw0jIBNtrQlUVGr5vTzWd0xsZB7TwupSJxw9RmcllU8DBtMX5mLBgVVdp6gcRedxPIjZJlgcbXNClYnx+s08kyJk3G2vExJ4+POPrhhNv3Gw4eU928AFs/pYsxpA2AV2TKwkvZpon9dfiQoK8EVfu2fwja4DVjCMbb2h6qFlZvaenxe882CFMli5b7rZqQcYEQ6ystUt4OGwyu8WSZQW2PlYlwXjbRv/ozXHnn5+nc+Shy7e2f+P0tjo8m7/O9Z/+Gn774PU4Pj5P3SRThaMoaF/AqfgCJFhtt7Uw0i0E41Xe0XWvUk+c5LhFnCjroOKNTbOaWm27iC5/5Q/bYWwXgqTcP6Te++UPe+/AUdejS7UXxYQJ4o6iV2AScWTSLCiLaZpvtMRTZkGlF8n7KcufgQE3ki4wM76Kkkq8rxIW02mSx9mEFI3HpH45GdDoGaxVLxa4dizz84O38wRf2bTi+9eSMFp0dv9Hg9VsZrK7eIfLqgUqffebnvPveCcrO5igsawTnSX04M66O1ZCK7hNUBJNlsXnPZFHxWEyimraNuDae8CBx8gVDtEw3qHh80hSEHEweteUoUanwISAmXtZWc7rdLqNRzXe+9Sw2C/xH//wz3H/HKk8995esrZ+gKAx1WMao0O/2GI7XyfPYeIhmMQrPOw0Td8ExnrYyNiR2YRNvz4TFzTmj+hRPv/o451cmPHTX1xnrUe0meuzlhvPnNLuI8nTL2js2UD1+2vP6G2/zwstv89GR00wmE0rbp1zoYGyP2inqG/BKlIfNyNSQBdiyqcv+a3dd9L3Xh46z51ZxAdRqcl22CSKK1GSTMpP5cbGeqQsDVXv7RSnpGxiBH79vSn4h9leFECiKjH6Z05lLERsH46pOyhYSoRgNtM6wMbOKZAKDkEnMKAxMg2UIAZGoXWiMkksMlpkGfBBkU5cQoKkNRgoqbzh11jIenOKdt49x0/5dnDqvumvLpwhYIW3OWqKFyMb6FTCjms+afZXZsWqZf2CmrL9WDaZtZdhAvJh775B0MWNmF7OzGAxSphfafq3Z8emUi4wnjpWJp7I5k4VddK68k52f+Yd0HvjKJeno82Oiy/rh6ht87/lv8sSL32Fs1ti8s8/qaIAhw6hgNMqhCQ2YGfoyRV3S/FBm9SID0bjTeVwd6NgSY/u4ScZV267n61/+p+zfczdnxkMdjCz/7f/wF/zgJy+wuLSb1bWa4BRrQCXgRFFj8FmGt0maNiS7ofn5Pu3GTp9L5jcIF8x5NK5xrkGbBrzDiG5g/+V5TuMCIUTBZADvxvRKyx03X8Njn7vnY8fzNx2o4Lc0WAHcdWMp/9X/7+91PPkxx05N6HT61M7ReEduMhCJiuUm7nqsxsKu+BrjommZ5tPCVMSjSbvHoJF+OhVuVVR97AAXh6TyanyuYKWTiBJdQDBZsubGsz4ZUmYl44nlpz95m23bF/n9P3iM1f0DXnjthzTNacpuoK6WkaLN8CJGb1pV6vReJnXCa/optIXqMhJNpCHYhiLv09RxwRw3Z3nr6BPUrHL3TSMGelIXPiHDuligmh9XpGzr7ET1zluu4P2DJzh4+DQffHCaYyeWUT8m0wxMjpDjXGRqlmWPpb5h/7W72L1j00Vf+8zp8yyvrMcM0vh4vCWKkVqyBPNe+Kz2htnFGX+m4nyChGcBaj4riKSN9nkirccVU73GC3uynA+RxFPGniY7xwyvfaCqHS4o1rZwTlJ+SLv1dislrTV8u4C3fc/ERZ5kHmpEMTisBNRClpdUjUadtmCp1eJcYLDaYPyElckRRiFw+JzqNds+IWCl42EkQePYFEAkLWwx6ATVpLUYEOwsI2KOFQhzkJ3Mbg+z+nA7ptlYqk9Fp+ZEU08xUUIk06hvg11ks9W+YELJis3xS1ey9Y7PsfuB30Nu//KnXjDfPP0m3/npv+aVAz+B3oAyDwyGq5R5B+9So6w0REfrlhyUNo4XQYsDLQwa+9Qm44aFcomOLOImHW665ha++ODXuW7P3WyW7fLhOa/f/s6PePrZt6jrHOccuSmxJo8sZhNoRAlZ+5YZxhus2ul8TQcSM8dCbLUxWyIREL3jJPXOaYgeVdUYXBO7Pa3QWmqpwsR5vFOKMqO3sIC4depqyLX79vLwZ+7kgVsvbUr5mxy/tcEK4B/84Zc5fPQMH37nKfJsMRIuyu50NxCX8gQHahKQVUWbGpJorYhFbZJrSt3Amqy3p5Xk4GLdysQekwhNCahDNCdgMFLGv43BZMJwZY1+EYOdC4ZebytnTq/yjb94ki2bCu578PfJsx4/f/lbDAbLNMaRSyDPSyIakwRA28aw1hxyVs1myv0INkGaDaoeH0ZULpDlHbrdgpXBSV545yeMXY7caRjrEe1eQprpFxnz5Ihjq6ovv3aM19/6gCNHTnF6eY2V86fAZmzfvJldu3Zx1VVXsXfnIrfs38LeSyyi771/iNFwkih0AaUBMlRNhNFUYNrrMzsUF7MrCaENNrN+qzaD2hiENi6iU7Xqudebz6x88JHIYw3d0pLPBSvnApXzeIVM7ByJI6TNRfRUiiPNrwTPRHAgYDMLSeoqqCJeMWKxYqKpqHd08hKykiaHyTBQAUYy8qLHR+fPsPbaO4yaEe+dVb1h+2UCVptRaiswKxiN/TszR2ChZau2u/MWOo/Hpg0+bbaRwu0UApwe3Gk2AkTSguqU8actqzAkur8maHYuM/NkrA9gmG2ivOIGrrjvcxT3fhG56sFPNZ/P6VCfef9HfPPpv+DV95+isst0C2iaSezXyiJDLgojhzmI2RK0m7K+hlixMpGc3tJeE519fTRmcWERxpb1wYT9e27iK499nftvfowdcqUcW1f97vde5NuPP8XKiqdbbmU88hRZhmicJc6Cs4rLBLVxE2O8IUMIhmRptBHWvtjGah4xUFVCUNxkjKkT+w/BpvcMPmbEYjLExtXTGM9ovM5ix/LQZ+7k848+8GkO829k/FYHq/1X5fIXj7+l73xwhnc/PIuKJSuLyFwhZh4ASGtCFvHvUDVRlNECNhaTYxCa8XraXo74p7ZKP4jR6GukAacOK4agMYOAHkrq/xIIUtPr5jRVQ9Uool1On1jhm3/+c5YWvsq+Gx5gef04bx08y7pbAe/AxhpCQlfizgkFHAEPwUVbiABCPqWOx0megSh1GCMFsV4UMrzkNKHm4KlnaF5ehdsGnK2e183FbqBLdhn77k87rpirkbx9IujTzz7Di6+8iM3hrjuv5s67bmXPnh1cmV9+p7+8ssqkbhDJQVxCOIq4cGKjusHHtAE3/jJdDM18Y2/MoNpgtHHMXqu94NudvzECRhM0Fxel9vXz3NLrdNg559/TNA2Nn/WXiQgmzOAiE5TCt3MzJEfrEPv/RPASkjuASbUjgxJlbwgGCYHFnmFST5i4ETbrsLSji/PK2toaK2sjAoFqWPHSgYNkJZwcqe7uXeK4SyRPxCwmTJuehTjHlVizmzocKECYM+ybQwfTYTTTYDQLMjrP6JsGsVQbTI7ALcw3VcxIwUpauS3AmRLZcg2b997K7nsehnsfhcWdl55Qc+OMP6/vnHyVv3nmzzh07jXoDig7OYPhMgbDYm+JauISGJZ48YS4saVEXT/dN0JxKKmGlBDUNmhpgDzromLYs/NKvvTY73HfLY+wQ66SU+Nan3zyLf76mz/g+Kk1rF1AfMbS4ibqYRVJWhl4K7jCUtvofZcHyJ3FYKhtjdhUD5yHrNvfhXj8pmc8HmcXPNYFgqvBN5jgo8gALQQLaixZUSBOqZsxBZ6iyLjl1uv46pe+wC1X/3aRKubHb3WwArj/nps5fXbC0f/pr2iaQGhcbP4lOtEKRJfLhMhaDbgQwElUPbIAsmEBa3eDF9bhJUS1bysGn3a9caGJC5nF4oMl1BMWt2ylHq1TBcFaqOvAYm8R38CHB9f5d//rT/hP/4+/x313fp3KrfL24QmjyZGp0jkIIcrKEyLVAm3tRDQFqraQLXNYvwiZAadQ12MUIe9sJiuEcTjHwePP4VZHPHTnV7nrus9RsIOxntGu/PIw51v2GDmyOtCHHryWXq/k2s2f3Jzcjm6nT3Cr2LxAQh5zj8Q488bhtTXdkwS9xh9qYnDROVr6NGild287ryIxcb4WlQrmFyFfTIv/0x22gGaIGsoMOsXGwNe4QNqpTINV7MVpxVljCmEjmIvRpH4trQa2xtfAJFguw5qZBh0YRusjJBM6RY5YoQkT6sYheaC31GNtuaLo9Tm3dp53Dx7n1v2Xt2knGMSDc4q1LZshQYDaNlkL6iNSMDW9bI8PcaGeBanUCpIytPSAaTbWwp8gsecqMNsQhpn6RYhXG15K1BR4ctbtVnbc9gU23/tFuOl2KDrMrcqXHCf1qD7z+nf51o//nON6CLtQUVc1g2pMv7+IOBiPx2RZgXqfiE7xu7YK6rGmbZgKjAnTAtYMEjVsWdjByskR+3beyB9+4T/gkTt+j11ynRxfW9MPDpziz/7sO6yu1nTKJcZjjy1Mguxret0eQScxezIGxCCpThU3y6TjM+tnnB+qHmMyNMlRtfMqqEcbj2sacvWY1AUe6/CR0i5YrLGxn1IEdQ3dbsa2rTt58J5bueuOi9eZf1vGb32w2rfHyOHjqj964oe8/vYZqroi7y+wNh7TXcypqxHa1GzubiKMBdc4TJHhQ4XWHqMZeZEjWY5DEvyRLpbp+pQWQKJSu1eDlUgRjfviOtYeJNJMM9Nl7Bw270W/GFWMVSaTERaDLbfz+utn+fN/+xz//F99ic8+9C8JZLz+3t9h3SqeMU493V6HIIb19fPkHaHTzRkMxnSzHpF8kRr8FMTM+j6CS6hEuyTqECFDEdTWHBu+wo9fX2Z5co4Hb/06m9n/Sz8vVy0t/G8KfluWttAvz1JPAhoKyAocCjlMbIVvApkvsT6VhFNGoiYt+CbVpyRlAUkrTUWY6gn6RL2WmG1Jgv3aHWq7cTFiphVDSbWKAGgD3byga6Ofz/wYDSvcyNGVgo6NtVEkjxunBmwueGGaycfFImDUTufbjFtoMNpWQ5IluQBZHrNL71GnGGPpGkOWaO65KVlfrVkstzEcO9ZG40sfcJthmxwmliLLUa1o4UmbbEGCxI2QDQVCql+10FN6GQFQTW6zUQOQJFvm24xDFDB4T1qAI9MzlxiWJUBwnkwyxo1Hc4sv+pyrc9bdAjuvuYdr7/o8+f1fRfZc/6nm16qe05P6AY+/+D/y3GtPcKo6CD3Bu7jpzPI+zkUYw+QR3BObqOjTmqKmksCEttaIDwTrCTYQUu+V8YJ1JWbS4aYd1/PQrV/h0Vv/kD1ygyxXqq+/foi/+ssnOPLRCk47eAx5nlGro/IjwqJllYqQRwcGca2XVCR7NDKJ17o1ZAmKTXF+JnJKtPowkppdNNasgvNo49BqQmkCQX1srwiWYCzBWowBa4UsWFxVs7XXgXrAFx5+jH/xH36dnb8lShWXGr/1wQpgoQP/h3/xJ/w//ut/z/tH13BNRqfTYTIZkWU5C50uzdiRSU6/12Xsx3EBCD5ehN7iJVKrQfDJNbjtfWx3jHELaKJAkraqyjGQxTp0RLG9AhJpyV4ipBBVMyIdYlJBp9zOq698RPfPnuKf/edf4IG7/5jxZMixUy/h5AzWjhgO1hAr9Bc61G7M6tqQXrcLLmPagxU/RdrZJuycPPW5SKqT+LSaZCiByo44N/mIVw8+RVUH7rr+y0z0uHZkrwyG53Sh/+kzoV/22HvFLixvoZUnzzfRKfqsTkYMBgOkiIHEaoHiCanelGw3Uz0rLTitEy2CmFTIN3Ihyx0wG7IpEZlCfiGEmBHNPaktoGdi6JbQLTeq8NYOWsfbaM0QhZVbunarm9jOrakkkQgbc7T5MZtjQGSyCskjK9b/VUJ0ytU4F7zmBG9xGutnlxwJERC1ce6mzxTbPQQkisWaNsPU1DEmsU8sZkoBJEwVHFo5JkGTS7ABH4XFREBDjjEWT8D7htB4fGiwKRur6hpbLjAIHU6vZ7DtOm6463Ms3fkw7L0J2Xn5QLU8WdGtnc2yomf13bWX+fGzf8Or7z3JoDlFtik2P5tWaJcZu06SXTsyxWEAwaqN56ttBDYmicam/krX4F0go0eXHj2/xGP3/D5/+Ng/xU8WObXu9OSphu9+/3leeu19Al2EHEEJBpAoneRF0iGOmwRRMz3HoDPUIKlVTDGBKSIwf6KF5DYK3iE+YH3MprSODECxGSpZfJEkB4b3lFYoSsNkbYV9V23lwXtuZt/e3+5ABb8jwWpb6tf5L/9vf6snv/Mky6M1Fvu7mayOESnIOiUDt0ZmNbHLkpYXqcgbEnRD7Pr2xPXpQnr0tKKlikryZ5rWtVrwRBMxObL6bGL3WYkBTlHUOByByaThqZ+9TG+T5Z/9yy/xpUf/U777o4ZDx57GdiuKzOPNBO8yNEBhupjQYdqEOO3qjz/iomQRmaX/EF10I/Tk40JHjyrAifPvs7p6juWVY9x705dZ1Xd04VPoCf4qx3XXbeWRR+7kJz9/gw9PnCZzWxCT0TE9jG2x+Xp6bmbqEvGfpPRDiVkLCuJt8hpKmVTKbNoxfxleCAOGEKJZXQsbooTgMJkma5By+thzjeqTL5z4eMGbja+faAYbCuEXBszLjXZhmj1lI+Hhws/faiV+0mgb4KNHXAqwISQTYIOmAnxtoz+X1RDJCJrqbTQ4UVxE8hBDzDa8knkofITQFMHhCeoI2kzf1xoIRpG8ZL3JmNg97Lr6Drbd8TnsrXfB3h3QuYiY5AWjLD1n9D196fj3eOqlH/D6ey+yWp8j71qsCGgdF2ug1SQ0YiKJR0Ek+VTRykbFHjjV2OfYSDPlPfnaI97QN326skBPt/Clz/4DHrjni2xLhqgvvLeif/PtH/HT519jeVDTLRdiQIyd8jErEkBao1OdriVpNQKmiOOsJa09x6mWOOuzSo8VxftA8AF1nhACViMylIuNQrjqAENmY01EvaMaT8iNZ8+eJf7o61/ggQdv/FTz5zc9fieCVTv+6Guf5eiJkzz57NtRKSGLltJ1Fa0m1BrG9RiTxeQ6SNyFqmuYtS7Z6USQdjM5xd3jj1YZA+I8u3ApUKJpnWIihBL343gTg6QxgXE1Ztu2HYxGy3znb37GpqVF/vhPH+GR+/9DjHW8f+RJTLHO4kKX1cE6Vgp6ve0MBxOyPAYjkjnerChj2vaYmAXOr3lTeRiihp9VKCYMmxO8ceinnF8/zejOISN9Vw3b6PwSSBf/W8Y1m0VeO+L1gw+Pce78AMmUSsFXDucFVU+ZzzLaSLC2qFqyue5tCTH7iA228dLPEo08Mg1n73mxRb4dFzKsorCrAzR6Vc2JGzoH46qKsJdJKhC0NdD2xBjavOqSzcmX+TyQ5qbMPvuFsc0Yg7WygdV46ZHqRz5MWdkaUpbX2nnAXDDU2c7ex6zdx4Yo2n6jVroxpBRMvBB8RpOy/yZUyR+LqcC000DlPVUo8PkWxr0dbNn3ENse+SO46X5kabdofVol+2QllhWO8bPXv8dPX/w7Tiwfga6yaWmBifNM6jG5UUwItFmVtC0OCNOevohrxs2PyAYkxWdK04wpTE63XCSMA3ZcsHfHPm6++h6++ugfs5Dt5fhkoqsr8K3vPMXffv8pap/R27yTUMU3iJdufP0LT9O8ctWFo918aJrf7fo0rZvRbupikFLnCc6nQGyTJU/AaQxgYixZliXtUZDM4+oB9913F1//o89y5Y7f/qwKfseC1Wfu3CLf/tG7euzESQ4cOouxW8izDnXdkNkCTxOhoPR40TCNNOqmstOYdiJhpj410KbdkULejlgPmX2GeD23jlRpxzsNV3E3FZqomD4aN5TlFhoHf/ONZwje8h/9i8f42pf6/P2PGg4e/SGuGlKaSNkOVYi72yzS5+OXmG8YNqmQn642TZ+w9dYRhwq4AI13ZFbp9DPceJWPll9B3nQsrx3l1n2fY00P6ia57jcySXfvMmxZMGizymRcI8UmMi2wFKhNFgW4CMWIpB1DXGjaYVLfjpVYdTKiURhHiNDLhqL8xbOai9HdQbESMOLpdTpYO3u8C1BXLi0m+UXo9GYus9p4aGeP/eTMClpVAmavP/cUSYvfPLPx0i+lqAfvFZvmlGkDZhI1jbheJHgIAfGTaM4JOIkQc2T1xWys8Ens1ltUDQ6hIsMbA+IwviGzUIQuRgvcxFP5nDrvU/V3sXT9Z9h5/d3kt9wLe66KNTpAik8OVG8Nn9V/+53/jvdPvcqptYNIL2DKjGHtqBqiRFhQonP1NOIzy8419lOm2+Yls1odymA9TRPIg4loh7dsKrdw3/6H+b3P/QlX5ncIwPvnVP/8rx/n8e/+HC8LOCyOPPVqxvVFhWTzkepPJtUEmc/+tT3rG37GH8L82TVKZAtrhAvxgdB4JMTWHSMZRgqCOjRZrRjiDkO9xzeOxX7Gjj07+cyDN3PjFb8bgQp+x4IVwIP338jDr9zK8RNPsjYYkeWbqBzURjES6PYKQh0LkEEFI6nG5CGxEpCkGxgFIy8cLZW83c3EhaGFpTxMYREJEid+opqrRBmdLMvJJGdtMGSx32VpaTdnzx7lB3//Cp1OwT/6J3fwxYf/GYuvG1595wcRPS8sdVVT5hmOcZpoqWlZ236epDkXItY+U3Sf+50mfi8TdRQqX2MKUGk4svoa59ZOsD46x237P8dED2lH9v3aJ+vOQuT7zx3S8+fX+Oj4gNX1msF4Arag7PUZN03Mig1TrysxaVvQ9lDFsxNrOO2a1DKoJGMmFwQX7mE/HrDmpGyMklkoc2GxX7JjrtfMe6gah5+iynGx8+iUNBGDVcrw5t7jwobZyw1Nu/72YRcuJyFZ07c+Vd5f2tYebZ2CE/BlosgzSfJIW2g1wVOxqTm2hnhJcHnaD4maGLCcjQ313uBTxuJNwAGIUhiDd4Fh46kmDZUrMQt72HTN3ey49g6yz3wJdl+FbN77qefeOT2tL733c775/X/Hq+8/RZOtQukJhWPSVEycQ02BtZHtN63xqBIbmdLhaAOWiSSRKcwcC4MYA03t6XU3YQfC4PyE6zZfzxfu+30euef3uLJ/lwB8cNrrt7/9U77/xHOsj5Si20eC0jjBGhsJDsS+Jy86XVFUW/jv48Hq4qdvThSYlB0GTcEnpIxKp2hje76DRqajzWITvK8b1IPRhsJavvqVx3joM7d+2sP/WzF+54LVrkWRZ944qqdOnuWpZw/TNEMyCmoHFBnO6QbvGUkzREzsM1EfkcAZZAbzmRW0OHebikcYJUKG0xmfIJF2h6rT5Mch5FkH7z15EWWJZDSh39vCaFDzV3/+BISKr/7RLTxw53/McB1OnHoVF1bwYYzg0NAQjJstqmb2GUUs3reZVfwibXAVVdRAZgKSWTQYfAi40GCN4mSVkU5448j3GNSnGe07x3H/tG4zN1D+mmHBrz64T46vqR78cMLrbx3ildff4fiJM1BVmGDxks2wfiuoNUkV26Z6RAzOkuxMYg1PYxO42ulCcGEWc6EM04U1J1EoLJRW6PfKDc9tHIzH1XSjHl/n44FiCqd9LPP6dEOn/889/2PBLs497/3la1ZJ6ijCQRJJb0rUBlSJTLh2HvtYH/GWaV3XBsgCyaYnBqngNfYxhpaA4TFeaY+WkTwGKhTdvJ1iy+0sXH0fm2/6Auy7Bbk2BilfLau9hBDtyJ9RNfEcn6yO8XfP/xueffVJDp86QG9b3MBMQsCNG8RCUcSlzPtJEoGVtI9LYUFl6nWHzBTW5+tAsbfMYL2hqx3KrMf27Tt59I4v8ZXP/mN2lDfLuZVKz63B97//PP/uLx9n7DI2b93FueUBZdFDxBJCjUdwqW3BxziIl/adLhzt+ZvVzNvb5z9fOy2MSvT38w4TwpTYEl8mCRugZCa1RTQB72o6WcbSQsm9d+/jy196gP07f0FR5N/w+J0LVgAP3X6l/PV3X9ZDh87w4dFhrCuopeh2GY5W6BgDIWBt7JcyAiE68kXZmdbvfm4NCTKbEDJbJ2KfjMRwME/K0ESDjzp2yfvGxF1Q1TSYoJRFQSZQNRVFZshtj3rs+N7jL7K0tMRjX7iDh+8WXnpjkYOHn0ObkwQzQvPZLkmNIET9vJgEtJ/SzP2M+mttM6cPSnANQkFRllEjsZkQxBFMxcif5q3DT3L23ClWbj7HXTd86VPrCv4yx95N8Uo816jee/d+nnzqaQ58cJTDJ0cgHVBDMPmUiak2IzI2I/U3GHCiWDOP8W9cDuYDx4U6gBcSIOJ9HmMgy5ROsfHycA2Mq4ZAq7HORdaeVsKLi77PLzIuVCuYf81Pum3DJ9KUFaUeIkKsb2iIth6+FfTz8QB6yWJrQIgyPeLnlC6IaINPDFWCwwQlS71XQTKGdFjXHF3ayfYb72P7bV+GfQ8g+2/b8GUuFagA1AgVIz44/QZPvvwEL731NKvVWbKljImOGLsKD9i8i+KoJxVKQ05GZMVaEIPO6UxqiyabNCcgbjoSpCwSMJqzyS7RrMBVW/fwtYf+AY/e/nvsKG4SgG2bS/lv/pef6zf/7kdUjSEv+qytDeh3e+AE75oocUmE+1wIM/q5NUks5MLMavqtP3YcNqxJ6VwaonpLTPGVmDvF2mMIAcnA+3idSBC8c4j3LG4q2L2zz5/8k69y3w3936lABb+jwQrg0Ufu4O23D7P6+HMM6gr1JXVdY02BSGQgaQgYa1MvCHjv8CGgmhOMIDZK3IS53ZdqbFVsaeztpGqnkeisACpTqCbEPhsfm/OMNdjMEESoNaCSUSXVgyxfYDTy/Jv/+QesnBvxx//hI3zugSUySj489jQDd5RCBDLHZDKit9DBqWN9fUi3140BK7GMYvNlW9OKn1cUco0mlV41kkuMYCRHJEcJOKkxnTFnqnf42ZvLHDv7Abdd93mO6+u6V+74tU/ibbnI8kR169IDnF+7m58/d5DDx1Y4fXaZUe0YVGMmTUBDCVlOCILNcwSTekkMJrcEEdQHMiEtxhEWlNiLQKurJmnTEtE2Jbi4g40eQYHxaEB/1zYWN3U3fM6mCbhWaqlTpmwlvl4TfGSTJeLLpWC/eep8+3f7cyb5xIaaFOhUXLfNBttkqyxLnHOXPrhZ6gWL+DWtnJK08F9CDtrmaFWLhgxMFpmVGnsIxUDT1FRVRafTQZuoPmIVTDBoHTBBqfMOVX8XO258kK37PwPX3Q37bkaWPn1T+rKe1WPuKG+8+yzPvPpDDp98i8YOyJcCdRjg1YA1GM2TK7FSmHy61ksKWF4l1YziUY2GokpQlwxGIyEqJEg0M5bSdLCuz+bNu/jDz/4jHr7zy+yQGwTgxEnVv/jGD/mLb/w9E3KyTp9GlSwzmNBgybAWRhpwxOyzRV9mliyXG7N+z3YuBI2SclGM2GOU2Euajr0gibEZX8EI1G5EXnZoJgEjQrcoWR+fp1NkPPjAjXzlM7t+5wIV/A4Hq52LmbxzaE1X1yZ86/FnwCyRZ0s0IU0O4iQ2baFaA9ZYMmsinqs22jpLhDGi5P6MNiGq0+Jr/J1peWh+x9uKH4QEJxkBF2rUGJQCk7rGURtZVd6jLmPiDT/8wRsURYev/YM7+OKj/5yfP1/w+oEnWFn9iHJR6BdbGQ/XwTqWlhYIITCpxmRZJ8Hx7ZbRTNlN0DLaWmjMENSgZET6SKDX61DXI4IdMw6nefvozzm1fIrlW1c4oS/rZq6m+2umuG+dqw0tO9UPDsPrbxzg5dff5MCh02jjKHtbQDrUIRaXrY2SN957JlVULrcSzzHExd5ai02q6W2NJ8/zDedwnmBhjKHIhE4h5PZC9QqP84omokfSIU67c/g4jPPx7Gpei/BS1PYLb7s4wSIF10/DCFRJkkkxuzJAVIrPmAl8R9KEkGF9nK8Ez7geot5hM6HIMnq9LuvrY4wtsFlJyDo0zuCMIc+6NAvbufaL/xj23QO7bkV2X/MLzaMVPasHh+/y/Sf/hmdf+TGOVYpFRx2G1G5CUZaEtrEsWbAQDIYZ9BtB4hgopiqThhisCXR7XcbDAZOqol/06BX9aPcx8uQiXLV0DV979J9w7y2PsF2iseORU6rf+fvn+PHTrzL2llqEpg3y6qNOpY+NuCFR9ANRBWcDahPammZL97jMaZsGqvit4nfVlClDq5DcBqp2PcsLi2vGWEqsCK4as2v7Ip99+E6+8qX7+T/9Iifkt2j8zgYrgJv3bZLv/viAfnDwKG9/cIbJBGzRQxGMZmknLTFTClHV3GRZhNc0pH6TdpK3mDa0UWmenaPp5unkmAtmsxHweIJOyNWiWHJTIm1/l9ZxUhuL04ITJwb8/ePP4sKYr/+j+3n4wX+K2A6vv/sE4/pU3LE5j9cxRg3D8ZCiSE697fYbklgTqVk11tsiBh9dbCTYlFVFAG0wnBBU6HVKOos9qlHFsfXXmLy9zOmVN9m/7QFO+Wd0yVxB55cgiPuLjq2Rg87ZRvWO2/fy1rsHOXz8LB8dO8vh42cpTQc3cVRVDbaDsSViM0SjPJH3VVJXaEWOZ4u6ucAS/MKAZQhkubDQL6eOzu2oqobaxUxZjE0bGI2bnNQk7DUBTHPsvzjmA1ObNcXbPxbIphp9sz6u+aB34b+PayHOjYR9RRhQaS3NY9FIZwE3vYcNijhHlgFGkTza7AR11BOPd1DYLk0oWa+7rIcOVbmFpav3c90d98KNd8OWa5Erb/lU82Y1nNVCBM+YI8MD/NlP/l+8/N6rnFo7wcSs012wuKxhMmlogovKGFjQVKsNNtHwLUZtqg1JotinzEbClAZuEAaDAf2ySyEdQqUEL3TYRHexz67+Nfzhw3/Knfs/y9Y090+cV/3mt57hW4//mPODBi3L1GsZ4udIm2FN578JEv3OmCsbqNL2TbaqNEyb+TeeP5kSQ2ZhrYVtSTXCVsu0lRZrtRxFFfUu9gqqZTIeU0jNrTffxFe//CCfuf0X97z7bRm/08EK4I7br+VP/+T3+f/8d3/OwcNn2bpwFeMmTlabRGA1mKifrHH3Y4wh2lMn2m9LdZ5OrLRgTOtT7ZhK59LeE8VTYdbnFF/TaYsne0yrzi15WtcMZadHZvucOn2Ob33rSZxv+P0/uo/PPfSfsGnTZl5788ecXj6IZJvoliX1eBV1St7PqRsfs6YQ3U6n8IEkqwZpUkAt4+6TDE3Nw4pSZiWeCBMORhMsQrnoWXOHeP3QcY4efY9zawe559YvM9D3dUE+nfTN/57hdFlFwZpZHWP7nCjuiUr1hZeP8tTTL3F6ecD5dcdgPEaNkNkCMYbaNVSVp9+zs0AeAs4FrLXTTGue7t32Mc0ChcdmwkKvpMw3fsbJZBLtUBJFPSDT7J12lx0xwNlG5xL1pAvrZxe7X6fPv3hm9elqYbM6k5lq0MXA1XafTjddIX6v3BoaX+PrBgjYPCO3BQ2WRoShdhlIH9fbRe/KG7nq5vtYvOEO2HsNsvXTt0NUelYDE06Hkxz46HWef+NJXnrnedbcgLJfknWUoVsnhIay26OUkqoaI+KT4gYxWwo2VWxiI5kmeF7bFT2NVsVcgkWdoUOHotOFiUVry/6r7+D3H/3H3Lnjs3QT4ej9E41+82+f4/EnnubMWk1vaRsT12Ak9qAZ1dSPptQEalVqDTizEeZtz2l7RqbrSLtmpIe1WqAyDVatwIFM758PVG2mNZ1HEsWWizzHNxVNs87+/Xv53Gfv4fZbr/60p+a3cvzOB6u92ws5dk711dffZLD+PJNmDfVFKhJr9LuC5JMUew1EIwYvaWccG0yjYnaY78GYW0daOvH8ldjWPEg/FdJ7FsmVOKDJhyqzkT5rs4zK1WAsVTUhL0pCyPj+915ifeD4p//RF3ng1j+mn23mmRe/x/nxh/hmGZiw0M8IoZ4GRjEG1CNkafEEIzq1FwgkgU6Ji7DgEPGgSlmUBG8Yj8YEaej0BNOp8NWAc/WYZ98/y+GzH3DT1Q9zYPKU7ilvYvGXKIZ74cjk8oZ6e0qR0yPVu266knffP87Bj87w1oEjfHRymdFwjDclWdYlN1lkfCaIDCK5JoQYsKyd9WpdGDBCCKhRMqP0ex2yjUpLDMcVzoepgHJ8XqJJTxOsFoa+fLBqx0XFdZkF0HkK9oXZ1acaEoOTiQ0+hAC2DaopQQ+tn1OS5AllhMppBHE5YWKpQs6YkqHpYXddS++K69ly0730998Oe65DFj89Db0dNef44NSrPPn693nh/Zc5NVnFlZ7uolDX6zST6G5gsTR1DNhWC1RdOr4hIRxRSFinMGwrnpmUH1JmEpNIgw0ZfbsJqTKaobC9t4fb7riLB+96lNt2PDgNVIdOq3778af4m8efZFhZtu68ipXBCLEFXh2qAR8UHwQXlCaA8+CMzmXPc3BvmAtK6RjEI++nO2IlbbKnKE7cEKOpRpXOnUyf3W5kZhsm0Qz1AecG7NzR5fOfu4vPPXo7u5bMr+z6/XWM3/lgBXDFNpEX31nW9cGQv3viBTTbjtco8mqzKPfaarO1EF7bkmNSD4ShZfyFaQq/YQlRZhMt9eZo651Agt4S7KhSAOBVgQrRBiTD2igUKmKonMegiC1xrubM2TWee+YgdaX8i//4Me688ass9Lfy4lvf58CHP8WJYWFzyWA8iiIcrceJCPiQEonY9yXYpCQtqInePdG/1iEaaBpH4yIZpSiidph3jsY1hBDIioZROMd7p17iyMmPOHj0fe675Quc0jd0Ezvpyic3b/4qxs45G4zjq6r7r97NW+8d5vCxZZbXRgwmEyaNYTgEyTvkeR6Dk8yC0jy5YQYHhik8GIOa0O3mbL3A7qSq4vGJKFTsoYlO0yFZfISpIsqnDVYXHdNANcusLnbAP1XQkpnArypxTqTs36hOFz+IvcGqyjg0BGMRShw5NSXa3Uqx9So27biSXff+/9n7z3bJruvOE/xtc84Jf21aJIA08CA8vZdIOZaqqls11T090y/na8x3mGfe9Zsx3TOl6ZK6q0qiJIoqUaJoQQMQNuETSKTPa8Mes8282PuciLiZAEmJFrjreYCb9964EXFM7LXXWn/zGTh1Dk6dQ3R+tiS143f9ulgTACN/1V+89gpf/af/lWfe+A6vXT/PRM2wrTalq5gOx6SJImu3UTKYe4YqD5RWEcQS73+CZJFDBNfpRqYj+GU5UQsVx9rLCRKZYWYOVSjWsqM8+cBn+P3P/RvOdh5tjuWlN8f+P3/1H/nm955jPwfdHjCzYFCkWiItOBsI4pWTVF5QCIVVHkSoSOVCwqovrFhYR2BR/XPhe+ejAwRNklUIFvdONUimaUUv/U5RFBMGgxaf+OTD/O7vPsW9d/7mWn/8rPGBSFYATz2wLr76j6/4S9d3eO3tnJnRQYk4DqellGHsKsA6CzL2+4WMxM6aVBtvn4W2YB3zkZZb+oGo/+c9Ho2z7biQzDA+ByzeBc2+VKUkMkVgSFONqXJm0xmtdpfZTPGtf3yBlVTwpS89zNl7n0KlFqGHXN4RlOXN0M6p7+IaqygX3odXOBH7V8KCtGHGJVwwPvCObjtllk8oZpOgIp+0CZ5KayglUVmL4XCI8PuozPPGtW9w+fqzPHTm4zz14Je4XP3YD/Qd9H+KI/EvM05Gf61rI+9v7FsuXr7BS6++zisXriMnGaVLYwvQIBVNMrLW3jLnqX2wQji0EnTarVtesywrnJtvFGqdN+cdyoV2jY873VuqpYWq6KdB6BsE4HvkOSllc//+1IS18Ps6GQNRYzGqofi44DsHTqFsipEJZdrDr2wiN0/TP/0wKw88BWcegs46ovXz8fLWxZqY+Lf9tcnbfPet/52//8Hf8txrz2JTUG1NZTOqokJpT9ZuI72jnOVYOyNNWnTbHZxzFEWBkIHCEBb9sEFAmNDqBpRQIVHVrTLvETKAqpQXrPY22bs85MzRU/z+5/4bHr/3M9yVPtAczytvjf1//to/8I1vPcPUpgw2jjGcWSaTgk6ng8IADmtV4DF6KISi0MG6Q/kgOlynUuEPgGDc/MIerLQ88zZf6IYIFHKOXhVEa5PwYFH/fOG1nIVW0uLxx87yx//qd7n/wZM/z6X6jY0PTLICePLxe/i3O1/kf/p/fx0xk+TexA/+nFALsV0Tqy21cKmlD0nLu5DAnBd1E/k9LXVE7JEHnkZ0F7Ue1FwPzHqHt6G6QXgqW7DS7zHLh3hj2Ng8hqkqhqOKtcEaX//6MwzHI/67/+FLnL3jM3Q+3uH5147w3Pm/J3EgVIERZSA2ChMFM2vdQBESFsxtRUTY5YWbWTCbTtFakXQ1xnlsRCh5EryVFOMcpEemjop9Sm8Zz67z9EtbnH/tOZ588Pe4//QnGfmrvi9O/Fp3bMf781XgpSu5P/36ZZ556Rp7Y8v+/ojprMDZUG16J7EIVIQ5h53povaeQwpPpgTt5FbQQmXi/VRXJC4KbdUVGiYsFtAkrDDhCjtnFaSGqWcr9YzxYAm/uHDV1YNwkSNFrYnoAwBC0GgUvld4BPgEaW3QtBRRtDXOMo3wVJ4AT5cp9I7hexv0T9zN6j2PwOkHYfMu6B1FtH/+qnrqrvvC7/PsW9/im89+jWcv/ICh26PsWpxUeKuRQtNO2uBypLVYawBBmqZ4bxlNxggPWusoojuna8h4zhuVemw8h43wGjiN8gnCJUxvljx41+P83qf/DU/e+1mOLKi4vHB+7P+//+vf8NIb71L6jKQ1YJwHs9DuoEOVFzgRPMlKaykqR+FEEPiNKjK6nh0v7DZux5kDbqm0QiUV2pvKg5S1Pvw8KYGoe5rNPVZvXaXwaHKOrrX57Mc/wr/61Jlf6+fzFxkfqGR1cjVglP+v/7ev+b/75rNs37hOr7eK0l2sFVReYK0nSZJYmRi8dSghULFKsnHLYp0L/Avhwk6unkUs3nS+Frydi+MiPEpZHGXg+cQFwQtBbi2lzQPvoZiFKkuljKcG5QVZ1qYwHpmt8c2n32I4Ffy7//aL/M6jfyiuVq/4FXmKZ1/5O4bmXVA38ekULxyVmSE8KJGA11gh8S765JAiXYI1JUBAGIqwI3Q+2HQH/yWHEzl4iTc5wRLSkVsThvJKMrbbjGcTbvzwOq9efY6P3PtpfjL8K7/Rv4MOK2haSPQvdbb1fvHwyVaotqbev/mO4Uc/foEXXnmD4cSgdA/jFaOiwicJCI1QEqmCnp3DhmrDlMjccGylv/Tc7868/8u/fR7jAtdFoXGmxAtIlaQqp1RVTrczwDqBDU3nufCrFBGdNgcjO1+3subVlZCBqyVqS44a9WbB+rC5mOWzSGAtcfKnCOMmhsJKfC5ZUYJUaAoFZeUQNoWky0QqcpHQ7vdRR0/TffiTJMfO0D5+B6wcgbSPSH++Smror3pDQc6Yn9z4Lj968bs8++r3uLRzAdE2WB3EgiVBqxDnkSZYcgjCZ1I0QBYCl1lASYlSCuc9mjCPc6UHI1AqIcsSpsU2OlVIlWKMxFmNli0S0aNNj0fufYzPPfFFHjvzSVbEvI35g+d2/P/zT/+CV968TkWGUB2sCXYx1ntsVeClZ1aWFFVAKBpnsUIhlaAdux3ONoD5uImJHZ6wuISEG3lzdZXfVNrWBDsYBErKuD0B4VxcbzxpljHaH4IMYsuFsRhjUVIj/ZQTG5b/8d99li997rGf55L9xscHKlnV8cdf+Sw3d3bJJ3tUlWeWT0FkZO0e1lXLVVLsaeOjjIkI1ggegcYFKoO30T9JBv5UXBxqGyQRnzBKBIKv5q3BOPj1sb53eApTAAlSKJTSocQPwtYY73FeosSAl89fZzr6Ov/pGy/5E8kDYuK3/MrKBt965s8ZWsV4cgnVkfRX+kymY2bjKUkmg2uoD1YXniD2KrWKiVVExXiiMoSnkZ8hJLSAMFK1RV9MahZECdqTtBNeffeHXHj3Ne4++RBPPPwZHrrncTbFCRQ9Cr/ts1+jFUlt8X5j4v0nL57jtbevc+HSDd65sks+GZGmEmcrvPVY6VFKkGrQSDJR8sj999LR87e/7b2/tJ2zOx4ilIp0PBeqcEAmAnSGdAsGijiEWHCcjePFupoDliqqxdagD8xznLNIFwfsUuIIr522WniXU5Uls5kJ4IPbhPdbnr0L+FYf0xpgnMAgmQrFTCm87CLa64jNUxw9dTcr5+6BMw/CyinE6j9f5HjsL/sb1bu8c+1tXnrzJzxz/ge8efUVXFLQ32gzq6ZBv9IHqkUkWMzRrHX1JwS1KrxrCtA4X3MO4zxaJiRJgtAabyVlWZJ12pRVji0tWrVIRZvEdTnWP8mptTP8waf/DQ8ff2yJS/hfvv6q/7//T/8LxnUwoo1xOtAQRKhunA86fJWzFLaicAZTv/NILsYanLMN6nYxAho4vFyt5djoXPr5jAqIbuI+fG6bmmk+Vy/zksFghdJUVFWJTiRCKCqTk6mKL33+ST725D3c8wGYUy3GBzJZfeK+nvjbH1/zs/GI7z/9IpIeUgpmswlJlhIsrQ0IG3lJc0vr0PMWc0SWswGaKgVCBt+bytdyOuH1FsmINThH1DtCYo858mqEEFRVhXAeKRK0kKias0NAa7XSNq1Mkc/2Of/aOzhR8qdf/76/OYWPnP4ym8eP8O0f/GdevwjVdI/RdARpQru7QlGWeBksQry0WFfihQ/Gk05hbYJzCY6EQCp2eFEiRIWPlZWw7dgisgQF+qDoUdMZp7MRzmucNVy8+iLD/Ru89sYz3HP6fu468hB3rD7+K7vW7xeLzqeXJt6/eP4a5197h/Pn38ITNBZNWZF4ybGNY9x77gyn7zjC6eNdjq7M/1YA5SxnNBoBLbwPbTMjVADReILVeAK5k0ErT/gmGc0r8fBlbvHgl6uiuNnxaW1pEediItiUG+8w3jMcDUk1pLKu+m/PsxJiU/jtp/2uUOA1peySpD2KtEPnyJ0cPfEA8o774fhZWDsK/TXE4Odv8+35G95jsVgKxlyYvMbTz36L7//oO1zbuYxoG/qrbWbesjfaI2nJ+PkK7WsnA9VAuMCDsk0fNIoIeT0HF4igyiC8xAuLcRZXixjiKa0hkwml13RUm55egTJlNVnncw9+lt///L9mwJEmUV0Zev+1r/+Av/i7bzOawf54H50NwsvXcyfnMc5SGENRlhSVwfi5U7VoPru+QZQi/HwzWztY17eBsfNZY7z+Ps6xpAjeUzJW1KLWvXRRDdPHrolIcJXBVgHla6oJa2sdnvrII/zhH32ZJx//9bbnfxnxgUxWAH/w1HHxp1972d+8vs3bF/fwImiYOUu0tbZh3iBcBBfUOx0Z5HpkEK713uOsCUNo7wJM9n26LouDceHm7HVfo3fiQL60BllGRWWdkEgVSn+lyacF+JQk7ZF1Mt6+tMP/58++xvWdj/I//Pdf5kTrKX7/c6usPXuUVy58nwk3GOU32Z/sMljvUVQWqQOc11oBPqClPDLMz4hck4YRqgI3q97l+ZDQpDBNOwssIkhvk7YzSAmgAjdhZ3SBrZ13ePvd51jv38lHH/5DXtz5pr9r7SySBIvHFIKN1q8GkOH9jgeLRTWQ+FMxcb275/2lx+7nueee56WXztNdafPxjz7FR598kLuOCbG97/3GQqICWBdCvHB97LUUGFtilQtIOpXgkZTYqM2mcNYipQubEdz8nIp6durCIl3vpOvFqv4qocgDxFm6QFmXHpAOa8EYhzElrTQLaEcZRVvfK1QHffQ0eEWn16K3tkLn5N2weSdsnIaVk4j+Pw/dOfM3vaOiYsIeu7x++TxvXHiVnzz/NOPpkHE+xGclpSixpkRoR6/foajyCGAKjrxhJqzwKsxbfaPIIhBOI31QX4knCleUqFSClJS2pLIlAoPQCShF5RRZ2saNFaWBx888zO9/6is8cvZjDKJhIsD5SxP/5//lH/nWd55jd1ghZQcnFM6rIBAQK6qiqijKkmlZUVmD8XUim/urLV7Dg+Hnu9rm+/lnjWgAGtqBiVRo0tAGliYAR3yELseZnNYp+SyAfdppRlXtI33OQ/fdx//hT77MJz+AiQo+wMkK4IuffZAyr/if/5e/5MKlLbLOGtNyFg316rFkjOgYio+y+iJ0z70Ku6VgQGdxNojG3m59qCus2oa8+Xms5Ou/kVLinaesLM6WuBTaqaSlgzJCEA+VVEIgRAp6jf3pmO//4ALj4d/w7/7t59ncuJc/evL/wpk7H+LvvvNnzLxnc22NmdnBuhlahSG8lBpjwDWW5bV6eRVpKg6JC95EpAGc0SDl4jC/TrSEmYIXhtIUCDclUS1UFiDCw2JI7rb4xrPvcP7KWc7e9Rh3HX2YYyv3sZb96giJ4n04W3euhkR0Zav0X/zYg+AtK70+J46Fnx9MVHWs9bscXV/n+s5NnCsxsgIlQMqg9B+5PghP6iVS1K40NccnJCshAicnVFdzHcGmOncagUZ4iRYegUGKkAoloRPQa7WR3lDNZuTOUcxKtkvvN9LbvPfece7++O+TGkOyugKrq6GC0v8ylf3cb/spO1zL3+Wdrdd4/dJLnH/rRS5fe5eiKIMavLCkrYQkCR2KypaYqUHpNOYi2XyWGnfcOONruGFxsyQayxeHMyH5C10jIzVe1lrjCmESpGlzrHuMJ84+xRef/F0ePvEkyQLl4idvDP2f/8U3efrHL2Ntihc9pmNHp79C6SqElAjnsMaSFwXTIqesohGlirxGH5wRLLXvGuEaRzhNLc1Wq0yEUUOonqgTXpxbKiHRUpGoFIUO1dSSBEGNfoxKgd7TSjJghtSe+8+c4ktfeJzHHr3zX3JZf6PjA52sTvSEeHfH+2tXb/K//Zf/yo3dLTq9NcqowB68qmKSkip8SCLqRtZoManw2lNZG1F9bs5vgNsnrQXX3kYcYBHxI8PibpzDGdfstKQM86us1SFRmoKKsipRaUqSrHDtRs7NKy+S71v+7R9/ho89eLfY9xf9H3yxw8tvf5cX3/4Bo1lOkhh8ldeiS0inqJwl+PV4vCtjG9Q3MwKBRLoszAZ8rDprfXHhcYHJAogIHxboRKOkw5QWIyvSJEW1FDemr3P5tdd54Y0fcsfRh3j0ns/y4JlPcNmd9y2xzob49Qtpntz8+ewRTnWE+IvvXfTXdnOu7hjyfIj0HUSW4Www+hOqTkEBTSrjjBBJbHkRqglTRTPz5Z14nbSki/MbZ7GmDAN7b6msobQleTFFYsmoyNpt+u2U2yYqQOhfLNgl99t+zA5vTV7itXef5/k3fsxrb7/IjeFlrCrQqUL3UnT92fGWoiqorEEpRTvtUlVVgJl7GRvLNZDCQ1SaCfu70AprOGHhLJEkCdYWVM6iEoUSispYispACW1anDv+AJ974gt85tEvcFTdQbIwn/raN9/y//N/+AteuXAV41NmM0hVysb6GpN8BkJivcVYQ16VzMqC0lRYH1XbFwjaixuN0Jm5lXJQV1Aiqq2HZFXPocJ4ISQqTaplcPmMnR5X0wuoK/OgUJFojTUFVbHLXaf6fOX3P8eXv/gxTnZufx98EOIDe2CL8col4//0z/6Kr/7ttyl9wqz0oYoQCiGCCGbYGcfOuPQLyUjgXHDeLY2hsgYRpf4bra8DZzHYrEeF7Pg7IRaGsbGV2OyqECRKk2VtWiohJSgtpC0NCipToISjozUpDp+Puf++E/zel57k458+Sysbs8cFfvzqP/L9Z/+KpL3HKL9GXhbB10o4SlNiqUhSRVXlkX8io6BvgnAKfAI4rCjxwjbv3dXLRF0ZJhpvQsUZQOFBwsiUYfecddpYFxwKpZUktFjvnuCeOx7l9ImPcHLtfja6d3Fn7/Hfqvvv/HXvX3zjOt979jWuDwuMTEjb3SCt5WVAmdYhBYK5PqFiTmVwtopggogG83M1ddBUuUd7Ad7gbYH0JUoJlA5CpUp7+u2E9ZU2dxwZ8LGHznDP0fYv7VwWfstP2GGrvMLO7AbPv/oMb777Cm+9+zqjfESaamQisd5gXIWRJZULc1lgviFkPr/By1oyOrQCWSDGRodbvFqosOqNnyPVAUjhvUWpBOfAGo9O26xlmzxy4qN88Ykv8/A9T6Bdj1UVNkdvXTL+6Z+8wreffo53r28znBqEbIHRCKOQJDjvKbVhZnLyPCcvCkprYvs8vuf4uV6m6c5nky52VZpJYj2P8jU0vT5OFxB/SpEqHYWYJc7E9YPgWh4qtGjTgsYVlkQ4hJtx/GibP/jyR/lv/s0XuPfO1m/V5+nnjQ90ZVXHA6e0+OFru35rd4evf+NplF6NSLcE4aOOXEww4ELLjFqyJ0BIoVbtFngXuTneL7UvQkQ1A+INHX9XtwNcPVSPN2YgqgLG4SkwynBk9QimLCJnIiQ2JTX4hFlR0FYrnD9/nZtbf8+VrS2+/IePc3bwUXHRn/dn7ryPf/jWf8DmCVW5jXQOn5QYV4U+vKsIw3AI0OHQumr2Y8LjKAHTYJCCrmB0J0aSzwxJkqBVijEhiUsEOk1oy4zcVpSmRApLK0swLufqaIfd197l1Xd+xF3HHuLsycd5ae9v/dGVcxz5FWgP/iLiwWNCnN/y/rU33mI8HjGpCtJURHct0C4N11NIwphBIGRo+cUmYLAUcYGcrgKCJ/6+Vvsv6LVTWjqoxyeqRZZ2GfRa9Potskyzstpnfa3HxiAhk3Cy/cvbTe/4C/7d4lXevP4Sz7/xA968/ArXdy8zMxMcnrSXYp1nmldIEpJOinMlUktknaBcsG4JQImgAO9i1yxUKkGnszmKiACs9TmtmIszA8xMkJHNVAvtU8zMk/qUOzZP88Cpj/CvP/UnnBjczcqCCPNLF3L/N994mm/80w8onGY4LVCqTSvpYIUI78OBNQG0MctzJpMJeVWCFNFqKAAijIv6otxq5AlEv6z5kEHGzakgLDXOBd6jlAEWnyhNouJS7CIfk1B8Wa/ifDO0RJV36MRiywlrPcnnP/cE//5Pfp/TJz64FVUdH/gDXIx/ev66/3/8v/4TP3zmTRwDnE9BJmitsbYMaumpns+vIHh+EJJMUcUbuSgCR0dKHB7joseVDG0AHZtBc7JmLUR4MOZWFosC7olu0WmldFsp7VSSeNcY6GkZBtI6ERgzJk1znnryNH/0R5/iU/eeEnt+2++Z13n6x1/nhde/z6y6TqW2mZibGDkjySSVdaFV5TTBAl4EqZ04E0m0iW3AcB4cErwi6DwFrs9BgmOzi/SycUilhnV4F9hmsXpNSWknq/TbJzi+ei9n73ySe+5+go3sDBu/ZpLxT4sd6/33nrnEP37nh2ztTugMVinyUCn1ex0qa/A6w4mAHJUyaL0pLUikCt9LidaKVCe02imtVotWq0WmExINg66mpaGVJbRaKa1UkWaKVgpaw8Y/183xp4T3W95QYVBcnl7iwqVXuXjzLS5tvc6l7Te4Pr7ErBqStMPc0+IDUMfpUJ1bhRMOqwq8DARp4QTCycgVqmWf4mIu5lWIIzwfQCI1RVGg0gRUaDujCARhaymnJS3VQs4SZJlxpHucMyfu52OPfZpPP/4Fjqn7mvNzfc/75166yD9+58e88vpFJrlHkCBVAghK4yKgAozzlJVhZ38PG+1kKhcICp7wOfVyXgk2ycnP/x1i3kGpK+f6cQIwRdlc+0wnYX7pamK5Q4kg6+VsMJUFjbOBgK5kSVXskSUFX/zsE/yf/vt/zSce+dW6fP+64kNxkHVcG3v/w2fe5k//f/+Vl1+5TF4mtDurjCZD0J5+v01ZFXFXXMNNBUTipXVgvCMvC2yUrnGxs17PpISsZxXBYbh5jhh+6ftlyLGMszDroZUm9LOEQZrQ1iJWYXG+lCQ4b7GuQLqcbua4/+wxvvSFT/DJT93P0bYQW/4t/+Jb3+EnL3+D67vnGZaXmJptnC4RSYqxFuMUQurQKvQeT4VwIbEIQtsDImKLuSeWcYu6DPPjqX9S25EED3WHkA4lbMz7hlSHVleVC4Tvsda9kzuO3c+xI2dYa5/kcw/+Lik9JDoKa2v68tfH2zoYVyfen3/jXYYTg047zKYFQgg6mSIvClSrBULNk1SSkGqF1hotJJ1uEtyIZUg+EcRGEjwF2ZC/2l3yzF/1OSOGoy12Z1u88M5LvLv1LhevXGB7eJVZNaQSM3RLkHYUs2KKE665H0EFV2GvQsIJAncxWQXVFBmdihcX9qDAErY1FocTFrwk1Smz2QwrIckSHJbK2ji7kqQyo+07+LFmPTnG5x7/Er/76a9wx+pZeguzqUtXrP+H7z7Dt55+jsvXdrE+xaPRUiOcD4lISLyS5MKxP5kyGk8xpQXrIzw9zNJqnlTYgMq4GZvPpBeTVVAq8Y02oJQ0BG/hAo1Ea00rDRWVRDTGmhKLdbO4MLfDRsCrsBk2Oc6NWV3xPPHYWf7VH3yaT37sIdY/wHOqxfhQHOTB+POvve3/4599nRdfvkjWWaF0nrycoVsqDMldADss6q7N3eQFpnLkVUlRlRgXvXIWjPrmVgDznvYywOI2hMH6b4HKh0WrqwSDNKGXpqRaoVSClVA5T2kMrVaLfifFjPex0xH33nmCxx67hz/840/SW6s4nvXF65Pv+O8/81e8deUZRuVVtvcvIVJHSYklGtTJ4MQlhEBLgapN7Wqlhfo2qavMqC/nmtZpfFQ9m/BZeDgGJywiwBub8+GdRIiERKRIqaMmnUcqyFjhWP8Bjq+d4+5T93DXyXMczU6R0UfRWVqMft2xU4ULbUxINhupEDcn3h/p/noXjx2/6yWe1Z+iZD/xV/0eO1zde5vXLr7Ei28+z9vXXqNQ++RujHOgRYKWQUKsVrOvTNEkGC8NRtior2mDd5hvNVVUSFaxsqoRfS60ueZk9FBZBU6fZDYt6fV6eCnIiwJDkBRTQqNFSjWx9NQqj9z9Ub7w5O/x4KknGSTH2ezM743vPH3Ff/M7P+Kl195md1xivUa64Cyc6QS8xVhLIX1IVLZgezpiOJ7QcW2UE02lV9/3xHbhYmJa/CjX0m5K6IAadL5R/w8YvvCzbq8dIOpSNXZFNTEYHErbgKaskli1SvAGLUq0HPPkk3fzx1/5NF/5wq/e1fvXGR+qg63j+o73f/cP5/mP/9vXeP3CVdr9VSyacTFD6SQOOnUjflpH3frzXlBWFbOyoKjKYB8vIiRdEHebtw8nQAk/r8Rus655FRBHyloyIeloTbedkbZb6CRBZglFWeKcI1Oa1HmoSlLraSWGM/ds8Md/8gUee+IMnn1m9jIXrz7P8+e/ybs3XuHa7tsYkYMykIXpVGmDdFCidExW8+Tr4vtsdsI1Fh8X2jiiTlRB+cI7HcAnMVE5YRtiNEikCqr0WiZoHRa/PJ+Ar0h0j8RukjCglfTodzY4tnYndx2/hzuPnGW9d5yVZIMOg1+b+vtvc0z9Tb+1c5ErWxd58crLvH71VW4OrzCz+5S+oFAjymSMkSXaK1KRopzGFx5nBMIHFK0nVEZGGqw0oY0nQjWlXBbchiPKr/FeqsMtbHJETbCPrWMvkCRIqcmLAu8F7XYHZ6GYlWSyzcnN0zx631N8/okvcffaQxxZkEy69Lb3z73+Ft/54bO8eP4NLAk665HPLBhPt92jmgbtS4tlXOZsFWP2yhkjV+IstF2LxIVuSbjvw3PXK0GdxBYTVRhh+0B9Ucm8rReRvolSJHH9GPQ6y63/A8nKugJjDNgELRJMWYHNWV/VHD3S4n/8P/8Bn/rEQxwbJB+q+/9DdbCLcWPX+7/826f50z/7KlduTmj3j1K5hLy0KBVmTw1yqUbzSBlki4TAOEtVWvKqDLInUc1bKBkEcG97auuKy813a+EFlh6l1IIEi/NhzpMFS/G0laATgjW7NVSznARNP2ujvaKqRuhsytEjXT73+Y/z2c8+yeaRDNhne/Imr7/9A5596Ztsjy8ynF7DqAKRCoywmNjuUAucFqBh0dfcNI9d4JHNExXx6AK6Mp47IZqE5kVQf0f68GGsP9hInBVomZEmGbNpRRCXEaQiJVUtMtmhrfu0RY8nHv4EG92THF87w0bvBC3Waf8aFeB/k2Pmr/kL7jpvbr/NO5dfY2/7CttXLjApdtkx+8zMDOlsaP16qGSF6zlmfhpKfOuQxqE8obKRCuFElCKSWAEmIvqsCJJlwtXuucubvToxLaLj6vBzEUW0TqlKi7eCdtoN4rN7OavdDR6651G+9PmvcHz9To607sK7NpuqKwBee834f/jW9/je8y+wn5fMZjbwrsjwVuAtjXB1aUvysmB/NmE3nzA1hkoHI8/USpQTzcy5BkiFTt6Cu/TCeZ7PnGt8rKJRuReORGlarZR2ltFKkyaRhQTnlr4vyxyFIksCBWA22iNLKp585B4++Yn7+MoffZqjq+HNjWc7vtd+/wr6gxIfioN8r3j72sT/xde+w3/66re5dHWKam0iVQsnypCsliCzLFmjIyOk3ZiGh+GcC0z8OHs6yGgXzYK+QBgW8+9rOLMzgZMiZYLzAhshh2miSFLIUkm/ndLONFgHFhQJigRPhdYFzs7IUnji8Qf5yh9+nnPnjnA8E2Lob/hXr36PVy78gOdf/R439t+mYoZLK7z2qEQ2PcvwoXRLiSpUVnNts5C0Fuw2fKgcw7FEX62FhOUwOB+QhlopEp0hhMZZjS3jh1e5YDLpop2eC7BdRUYm2qSqRz87wlr/Dtb7J1nvHWdt5SRrK0fotdfY6GyiydAkS/pvH9SY+C1vgZycws+YjPcY726ze/kSb29d5Hz+LpdnV9nPb2KKfdqUGDsjVxahBKlXaBdMCZ0UFKoI1b3wKFkrGVmwUXzV1zNMFcE3OlA8ogmo8FXgIsXPQGPt3iSrOONshKBD6z38rSSflWRJG+kSRJnQT9a4+9hZPvrwJ/nIA09wduMBuouzqS3vn/3xazzzk5e4cOk6V/f3QSd4r7AGEtFCqxbGOCb5DKkFe+MR+6Mhs7IIM+eafCzmTgzz9z1H+3lo7GUCum8ZHCW9DAaXYg60FiJww3qdAKSpuWP1nGpJuT/Oy4PKusWWY4SZcu7uo/zJv/4d/o9/8ttF9/hFxof2wOt47dq+/4u/+RF/8dc/4N2rhnZ7LaiPC9NIMCkR51e1fFKsoKTUeKC0hqIqKYqCyno8aj7jgoUevT/wvVtGCUalbWlKpNB4lWFlShF3qBKDouLIaodEVmTSo6VAKI1DI1Ua4ORVQSeVSFFhqyFnTq3xr77yeT7+1IMgJ5zqb4pXdr7nX33nR7x19Xkub7/MzeHblGIPlUW47MJ7UiwmrTlnLISMs6gg5xTMCIsA0RZRRqcBoIS/USqcH2ds8JsKSP5IEajtTAI8WKkwvA8+VAolU6oqWJk7G2w/Et2l2xmwurpOr73Onev30MvW2BgcYWPlKCudDbpihZQOmhTnBW35z9+Ner/j308l45cdI3vJS1lhmTLyu+xOt7mxd4PL169wdeca71y7QDUd43fGjKsxN9oVM10hXYlyBWtK4rxhloJPNMqrILfhFVomqDjwt67CeBvmsTF5gQzVgpfh9vUS6XUwN/QBJegwAYAhQsvMRxBF0/p2oR0cABgquhjXPKJYzZSKtuhyYu0unrrvk3zqsS9w9sh9t3iovfb21P/gxy/y9LMvcPHyDSovMSLMd5VMEU5RlFBUBiskaMX13W32p2MmsynKSVoiIfEKZcJ9X2mDFW5pzrxk41FXVjWAYoHcLZE4G9roQgi01iSJIssyWlkwA/U+eIe5hU0fBDK+dxJnE7x1uGpMO6m45+51vvCZJ/jyF5/i3rt/eXy63/T40B74Yrxy1fg//0//xFf/6ntMZmBV0kCvpZRoGeZYwolGqFIIj0p0sCvAU5aG8TQnLyqc1EuVlYhl/m2TVR2xqpI+kN+89xifYqTCyCQ+T4V0BlsMGXQSVgdtep0WQiU4H1KZd4JUa7RwtBNBqgxVvk8rcXziY4/y5S99mtNnj3I0k2LP3/Q3yzd47vw/8OOXvsH1nTewyQwjCqy0LE+t6sUqWBwA8wTkg05bPafyfoYQIbkIocCrqFigIkxekqYpQngqU+BchZYgZPAx0jXoAhBSU5smehlsIMLCF7hMxlmM80GpW4pQUZU9MtGl31ph0F3nyMpx1leOs9k7SicbsDHYJFEZnbRHp9UlVSk6aC4EqSM02Xu0Fb3f8uFc/GrgwlO/4ysqZm7EpBhSlEN29i4znm1x+eY7XLz2FlujG0yrKbNqxriYkIsKX5VkuQUFRS/BpgLpHNqUtH2YERWphEThrMfaAOlOVYKsQiKJ2kDBngNLaQ3GVGgd7kcZ0X3117oTYUWFleH6hWQ1J8cTZ14iJjjpNMLrUFG48H3mM7TNePzBj/Olz/4hZ489SGp7bCbz2dTOjvfPPHeBbz/9DG9duszeJKfygqTdwbrgclBVFlcJhEzwUrE7GbG9P2R/NqGwBpCkUpEahbKC1ITNUa4rrJhD6cP1FvP5lVv+ed3OrEGcwgWUpJSSVpbRafdotVOUCAnJeYtzocOAEM3nxEWJDOllmN/KgjN3bvAHX/4Yf/Tlxzn2HlJgH5b4UB/8Yly8av1f//Xf8x/+t6+zVwzwSR8hbMPqNSaQGrMsg1qxXVYE30OFs5KqlFTGszedNdDWGkvnoxCuc45aek/4+WOcmPfw66Tg0IHH7useuYtSSEEGSUtBq53S7XbJWh20jhWgKUhUEMUUeIQ1KOnotBLabcHv/95nePTRs9x9eoBjxKS6zPbuO7z+5vO8cvH7XNx/llLtY8qASlJKkaZpWLDKnKwVDPFQoUoSKriTOuewokLoMlamGmElIiKxRFQkECQLx10Btmk1BjNEuTDvWOa0uEaap6ZwL7ebvBP4UoINrSrpFZIgDqpEgvQJJ46epJW26XVXGXT79Pt9BoMBK/1VeukqK+IkLTmglXZIVBb/XsbWjIgETY3+ORJW7ne8w+BxUeWvwlLNz4M3VMZQ+Am75gbDcpv9/V32RvuMZyNGo132xttMZkP29repbE5uZsxMTmWCHxexgvU63Es6kmuNrNtVYfYk4mzSxeqhpmcAsdIJGpGiaVdHzlyt0BCRoxDkgp1zTTJqDE69x/tQHXsZuFLOOXrtHlq12N8b0856JDLFG4kxjqp0nByc5BN3f4JHzz3FPeceptdeZ1Xe0Zznq0Pvr16d8uNnX+aZZ17i5u4+Vmg8waMNpTGEmbJ3QZjaGMP+cMzW7g6j8TRAbQFEuB+VCMCRuv1n8EtV1cFQB5Ur/DyZCekxRRGTVJ9Oq0ums5DoXIn3BlSFkOGzXFoX4ekpiAzpKrSb4u2Ic6eP83tf+gSf/8zjnLvj55MH+yDGh/4ELMbzP3nTf+eHr/K//9cXePfmlDRpkWVtRsMpSdal1+szHo9Q2uMpETKAMQL8NMU7jXWSYT4jNxVVWTY26vWeaK7AvZysFqMZ7B5U5L6lbRCgsWma0Ol06Ha7tLMEafNAIPRBeSIMxgmwdGVJteXM2SN84fNP8eRT93BHKzzh5eItf33/df7xmT/j9UvPsr1zjU4/IWnDtBjiqGj3W/PEEfvuxpZ470l1QpIpZnYUWppOIZxCOYWIfJGwa4xtwQa6bGOryEbkYW05F5JPXeFFbmWUvBERPu0bXy4n6hlAGG5j47mLbScZW5bT0RSlEhKVoWSAZmuVkqYpqehzvHeaTjKg0+7R6XRoZ22yrE0n65DqjFbWRQlNIpPQbhIBgixi+9cG1lCsCCuMMUGt3VZYWzGejiMCMqcoZuG/MmeSz5iZEbvmJjM3paymVLbEOUPlS4pqijEVrU4WVUgC9y/cQRIholCuCVslwVziB+pCScQKuEbjhaTVoFKlwrvQ1g3zx/iwyB2cF0jhb5wP2huOeYtc+tAcLk2F9wKVJOH5nUNrjTeh5ZfKDpP9nMS3ueP4GU4eO825Y/fylSe/QpdVOtmBlt/lwr/97hZ//w/f5eqNPbZ3xwiZkGZtQDbVdW4rnA96nnmes7+/z2g0Ii9N/NzUB1VzKRc4lQSe4+1iDghZtqlf5I4JGZymW62UbntAmmQhucXkLaSjKCYoHdDFAWCRIEgojcCVU1pin3tOH+F3Pv8xvvS7n+bMiZ9iBf0hicOTcCDeuVL4//jX3+Rr3/gBly+NWBkcpzIJZeXRmca5CpmEjyfEmZZSja6XR1BYmBQls/GEoiiapBKIhTVUN9pRL0Lj6w/AkmK7X/j3smmbiyx78GRZRq/Xo9dp0U6JUNkkfFCcQPhgCieFw5YTBgNNuwP33nOSL//eJ3nw/tNAiWXMpLjJ25de4IXXv82bV3/MqHoXkwwp/IhpZcjSFOclWoRknkqB8AZniwhBDotno5rt4tIZq6UamFG3iFydtOJxK6sJM40gOVOfhxpOb4ltv3omAguVbBTa8B5v4nl2xOcL70FFtKKIztHWzCHGUkqmVRG0+FSCQMXRe01n0GidIoVGCxXEh6mleOZakTUfxzkTr1OFZW7O57wJrc1InKYWNnYeLdJokGkRwiKVAFUndo9xoSILagpEcm54PUstpjo/X3V7bnGxXbzfwumpQQUOV5N6a/1CP096taakjAAa72sHbUKlIjw6CedyVlimpUGnWVCJ8Qa8IUEiKkdGm5YfcP8dT/DJx3+Hcycf4Wj/JOtqOUld27P+ldcv8swzL3P+tXfYGxdYq7BCI2RAk5bGYIzBIVBZSlFVTMYzhsMhw+GQPM8ROiFNU0zl5jfK4ufOLwMrmrN1m+QVNicLwAs/51St9jpkWUK71UJKGe6v6GFVgzPC3G+OMq5b3dgpZ0/2+crvf4ovfO5j3H38w936W4zDE3GbOH956L/2jaf5q69+jxvXDf3eKWYVTPMRnX4bVL3IhMU43IQOKSIkXbUoKkM+LZjmE6rShv40EUEXb1J7UJ65DuFu+VH4m3miU1GrzNow54EAZ2+lmpVui26nRa/XQ8sEW1psZZASskSSJYJiNiRJHWnqGPQVn/jkE3z2Mx9nba3LyVawyb3iz/t3bzzH0y9/neff+DZTt0NvvYUTjqKoMJVFS0kqFN5VENs+zqXM23e1n249w6hbRkHhw9dKCMI1i730ASk2nw1EgElEjtnYHmzafwuKAo7aULNeSETzXkRU2XeVi6CQ6OAcnZOlEHjtER2PU6EqCPbjBLV9oRCElpUQas5Fs/U1EmGxVKqplesNSt0W8yLA9sPswoQNRFzkAvhSo/IU4RJk5LF5TKxkAr9NJXHBizNDZ31QBI/oMq01TjhkvTmok9YiyrNZmJelwJx0OGljteUb8EBw9I3XJghJoUjCufOEylkokJ5ZPiRtJSCzoHoiNSZurFKhyEczjq0c5cG7H+KRc0/y8J0f5c7BPfQW+FJ1vPj6jn/xxdd54fybXLq6xXhmUToDmeKEorJxnilCMnUIxnnO/nDM3t4eeZ5TuysEbzk171QcVJj5GZNVnXBYSFRKSbKsRaY1/V4HpQSJDoAha22zYVI+QaApyxIBaAHWFBib0+lmbKxo/v2//R0+9+nHufvYYaJajMOT8R7x5tbI//VXf8xf/uX32N4RpO11DB4jbMAUCEct7iohzGioouhlGmYrxjMrZ0ynod1jo2SMqP1wuA28XdS+UbeLyPZ3bmGBEzhnm+eWOFqZotfu0Ov1aLdaDcIrVH9Q5hNWV7rgDd7NUNqBrzhz5i4+95kn+NRT50iSgvVsRdz01/xefpUL11/mjcs/4eruq9zce4PK74OYhXaGF8FjiIQkaZHnMVGIIOHkhMFhQLjQvGp6SYFgjU9ioqoXgVA5NMr0C+TSenPQEFO9b0wyIUxXfF151K2ZmvMVockB3zJ/HhkXOSUETjnGboJXtkmeQoimkpBSNcjE8IxzTlltA9IodSwsZgH2HJJVkiQxCZr4dU4HwClarh1alj4oOzgXzp2IpU1tix7uiPpkhpavF/MKvH4PdbKak9XFfLbEcuIDh5NxJlsrlIi6+otVFgIhEpTXcR6pwnySJMxsTI7UsTJVCcbAZFyS+Dabg5PceeQsD519jCfufYK7V86yehswy1uXnH/5pVc4//oFLl68xu5oipAZutVlPC3wUmEiwMbXrciqZFZW3NzaZTSeMp1OAciyNlLKWLkuJKcaeUj9s+X56MGoZ3h1JeTiaydShdlxp0/WCtJaeNtUwrXTr3carEaQgfVkSiOFYTLZRquChx46y0efuI9/84ef5NTmYaI6GIcn5H3izcu5/+pff4+v/d0zbO9WyKzPtKzwEVQQqpvYzxcGGRcU60QkD4eFLc9zxtMpRRGY6XIBLXhrDcVtK6sQ82QFC0PdxXmYtw3XKUkSer0eq4MVOu3wgcU62lnKcG+bVpbQ6aaUeY7SgnY7w5sRn/7YWZ544gHuv/9ejnfnLPkL1Qv+nesv8syL/8DW/pvsjC+BnpFmYIWhrOpqJG18sbxwWBEriSUycfQz8iIO9WvVCxc14V1jMVHPGOYGfHFRYaFKxYfkFzDYgFtYdGqwRlyclrbOy/qMTjqEBhvdfo13gQS70Gass61YmHnMd+dhdrQ8b5RLCcQtvbfwk7m+osYVvkHYhQZnTBZyuTIPQiK10oKKiVPgvFlqi86VEupjDQtzMzEVi+fV4SnDe5Jz2PnclSCS41HI2FlQTsb2qoxtUk1RVFS5I9UtWrpPSw64c/Me7jv9CB9/9HMc797J5m0AKjtbhX/mxUu8dfEGb114h539MdYJjFdYJ6i8ROkUS6AYltZQFDNGkzG7O9vs7Q+xTjZJqe5AeCfmvKmFewFYAp6/X4iFT6uP1btSgnaW0W636XQ6ZImGOKt0zoRrJgPK1FmJNZJEdsB6lPc4MwE35PRd63zlK1/kK3/wCJsfEq2/nzcOT8pPiTcuT/3f/cMz/OM3f8LFKxMKl2K8Rkgdqgppm0VFC42XAmNKhBZIMW/V5WXBdDolr0pMVauSy6WENedvvH9lVS9Y86HuPHFB3NHbsFtvx1lWv9uj3c7QSuGcYdDtYKqKosgZdHu0223wFiENptxhY6PNRx48zUc/+hE+cd+p5j4Z+S1f2AmvX3yBVy78mKt7r7NXvsW+uUzJFl4ZoBVqQy9xURLXx3ZRiBrqHKon5SHYIIQWYcWyBlv9VS4kq7piCANqsXA+7RJ1bfE56gqskdGKu+nF8wYumimGtqMToJBLraH67z3zZATEVtR8TjRXOpA1ZAxYroxg3r6rYRGCJLyejXjH0GeDSB7VOioguPo+mFcFeBE1G28fgSO3vFgvcuYkBunzSOptcKfYuvKQIlb0wdJDSItwATigCKovdqbAtOjIAXdsnOXeUx/h7s37OXvyQR499tH3XHOeeeGKf/7F17lwcYvhyDCeTrEOpG7hVYJ1ksp7itJQudBOzYuCyWTC3nCf8WifvKji+wy0EqWCCKyJM6P6+2a+eNsqalnBZf7TuTRUzaFqtVO67TCjqikdNZgioCQDaT5QNzTeSWzlwFQIW9BrCc6eXufTn3iEL3z2Ke4/fYj6e684PDE/Q1wbGv+fv/ptvvo3T7M/VszKBCHTYKXtq+ZxWqRhoEqF8/HDkWikUBhjmE6nTPPQFqznLvNZS4gAMf7pyWpxgXXeNgCBMI9QzXDcmGBf0W1nrK2tsNIf0GqnmLIKM64keFJZawOaL5V0+hrhZihRsLmS8fA9d/HUow/x6APLM4Udd8lf2XuNFy78Ey++8x12i3dI24798XAOfvAe51lYjBcX9AClDjOq0JAyBPkee9tkBXWi8lH9oK66vOOAasitNiZucTZzEGkp5kk+laqZly0KGTfK2HI5edWK3A0XJ3SKm2QSXnv++KVr1VzZulUosb5uM8Xdu6iPpVY+8A2gYxE5Wd9E1jGHpEflkUXwzmLVFd6QbKgTAoewJbVFjEfjhcajw4wR5i1oaZGidvEN87eEFG1X2Ozdwd3H7uWRez7Oo+c+zt3JA++51rz42p7/8QvneffKTW7c3KPIPSH1SbxQCKExTlJaS2VAqITJLGc0GrG3v8/+/j7j8RiEI01TKhvOXZglqwaMVF+rRYHpnzlZCRfvv/B4pQWtVoter0Ov0402Q8HZWcTr42UktNftbB/cE2xVokVFN3Xcc/YEf/A7n+CLn7uf9d5hRfV+cXhyfsa4Oi79N775In/51e9y8coYa7PAmNHhxnc2LJzhQ2yoWzv1LGBRDHM4HDGaTshnwdgtsNoXh7Xz75cU2eNuTallnseS3osXeJFEtJuNg/wKJcIHLFWa48eP0m61aLfbaKni8DcANHQqaHU1zpakQEd6MhybvTYP3Xs3D91/Nw8+MheQHfrLfswuu+U13rz0Khcuvcyl6+fZG1+nqKakLUGSCQo7w7g8CtuGXbGKcxZnPFpoJDLsjHUSuTDzec48cc1dln1DMA3nuDn+hQQ0P3dz7kydqBD+4LIdfyzmwqSAF/PENW+dsXxtRN2Gne/A52235pkPJK1bP34eiXdzma9lNGj8d7OXWUT7LbQho5FfDeqwdWs0ctnSVhI8oiACYsK9qkQAjyRoytKExV4rShNmazpNQ7UiE4pZSa89wBmHKzxZ0qLb6XH6jnt54NTjnD5+H2dP3s+q3KT/Hny0V9+46Z8//yYvvXGJa7szKqvxMgFTBA1CqQPZ3TgKC8YFlZTxOGdnd4/t7W1G00lTqd5uE3DrNZgfc53AasBEDahp5MKaDWG8/1xoB3S7Xdrt0LFI0+he50zzXKnSTCYTBBlCpVRVVGPBk+dDum2JNXvcd+Yo/+qPfocvffYRNg4T1U+NwxP0c8SrV7b8sy+8w3/+L9/h5nbJaFQhVRukojQVeEnWSnAuzhhi+AiRrdcmaxzTfMZkMqEwVWwLWpTQqEQ3O/g65h++OcptKW5JVhkgkD4AHAK/gyZhKaXotVsMBgO63S6ttI1KokipCo/x3pEJQVsptC1QtmStl7GxlnHu3AnOnjvJIw/fvXT/XPPXfc4251//Nte33+Ly9Qvs7F9lnG8xq/awaoZKLSr1FCZosgXAgsdHyxDjA2qt5kzVIITF86nquU0N0GgywELCOnBnL7UVm1Pll85lqC6iooBfaPVhD1i8LGghivl7nV8OFy/J8pvwLC+ci8lqqc3oZSzl5tXf0jVfSlZy+bW8jNj9ML/z3kZdxvqPHKUpEDJuTqSiqiqw82qtNCIKDIfHJ4kOHmRFRT4taCddZuOKXrZKNxlwbPMu7rnrfk6cOMXZk/dz/+ajDN5HEf/5Fy77i1eu8frbl7m6s8+kVFSkFFZgjGG116GYTigKixcSpVuU1rG3P2Z/OGXr5g7ToqDIq6bSbUA3dVdiAV16u1g8n4vJynuLWNgk1htEKQVaBR+qtbWV4FGW6sixtAt8SoGrSqRMUbKFNYKyDE7aaWLxfoI3+zz+6Bl+78sf55NPPcSJlQ+Xevo/Nw5P0s8Z12e5/873Xuab33ziTe3JAABEPElEQVSBH/3wbQqT0OqsBCkaOyNJEhDLlc98Fx4qrCQJFh95njObzZjNcmZlHgbUiW6InnU0bTC5vJtv4kCysj6JyLRIRPS2QXdJCWVZkqUp3W6bfr/PSq9Pu9elk3VIkiwOzz2J8rQSAsrRzhC2QIgK5Us21lc4fddJ7rv/HGfPnubE6vyNhbnWFtt7V3jr3Zd4/eLzXN1+jandxukphZ8wtRNEKpFpQmEtpQktMJwi9cEcr1asrrlINXl1nsxlrLSW+UTUZpG3AbAsouWaanepehEo2QIfZZ5YThTBCib++wBX03kfeUnvAZBZhIsvvu7ioioc0rtG9DjMpg7MxuLz1ND05eePx177tBMAK0LOVfLlAqJQ1S2yKA8kVcbUQNruYIqc2XiEJlSzqcgYtAYok9LPNjh78kHuPn4v5+78CHffcS+DzgYr76GZeGOr8G9dvMylKzd5+8oWWztjdoZTLBqVJJhYdQZZs9git1Bay2Rasrs3Ymd7j/3RjDwvMTbMggIpu26bxmt70C/uYNez/jzBnP/IfFMQKlob9RFDhZllGb1Ol1YrZTAYLFESsPX96JoZNcjgniyC7mJZTEiVYWVF8tijd/HJj9/Hpz/5CEc6+nAN/hnj8ET9M+Pr33vN//Vf/5jnX3yHSe7RWQuvLGVZIlUW5wn14hT+poFQS9GAJIoqZzbJGU9HlHmFsRahA4BjEUgRWhy3aXPArZWVV3ihaNBbUaapflxjQUJQFOh0OqysrLC2ukGv3SNTLRJBaGeKCqkrEukRMsAlulmKdJZEKNb6PU4c2+Ts3ae499xJjh/ghsz8Jb+fX+P67ju8c+08V7Yu8Mal8wzLXSpV4FPPzOWUvkIlQYdRzMCZ0HoJPCwXFRsiSnCpNVprqUWSZkS63S5dLEpgxVMVn2NhfuU1WrYiOOTWyitcx4W24G3AHI324y0xB2LMEYoLEdGQknCtmmtfdxXr+dxCslp63eb3izMZi5eLIsShErFlRVVZtFRkSQvnPK4yeKWZetBJBlW4xi3RYrqXk9qMu0+e4xOPfYYTa3dy+uT9HFm5gyPZXbddR6Y73t/cnXBla4tL17d459pNbm7vMy4dTujmPrfWU1VVmHklGePRFJTCGs/u/pDrN7a5ub1Lnpc4L8jSTqjGfbTxiRubgAD0PzVZzdueC3PG5nNmkYjgxB2rpTRN6fU6rPQHtNvt5vHOm1DZNc8/R7o65/BGkmqNq0ry8S7Hj/Z59NHT/Hf//vc4frTN0f5hovp54vBk/Qvi6Re2/F/+zbd4+kcvMZxaVKIpDcFmhDA3mA+551WRtRataxFciyktk9mY8XDCrMixEYYs5YE2hniPNiDLO3/8AWZ+/bvYe9daNwN8a4NCQqfTYTAYMGj3OLq6TjvLSDPwlFhKlA46gBJBO20jHUjn8VWOcAUrvYTTdx7nzlPrPPzo3Zw6tnbLvbVnrvjcjnjj4ou8efk8b994hb3iGhO7w8zvM61GTCcTNvpHcVVoAQot8dLgnMESqAFmiUclm5lNDcBw3JqI3i8OwrzlAe23xXM53zm/T7LCHVggF5NU/eDlZBV+F0EUsm5ziuVE2iS4+X0xb4fWzyUWIP9hxuII8OnaZt0Yh5YanCBVKalqM5vllLMSlSrIBGVhyEeGtc4x7rvrIxxbuYtTa6c5d9dDnD1xHye6txJ4F+PtN276ty/e5I13bnDlxohx4alEAM6olsYJgzFlFNCVSBJcKZjmJaX37O7tc+PGFrt7w0D5cHGm5IkgJtEcj/A1nUMi5fL1XLqGdU6P2ob13y9uCAG8C8RypVQEUfTo9tpkWRY+s5VZevzBysxZSJMEZ3JMMUNRsrHa4lMff4Qv/+7HeerhX40I8gctDk/avzB+8uaO//o3fsg3vvUMV6/to7MByBaLkOjFnXgdQvqlZGSMCS3BvGQ4mmIXFqpFqaZb5hcABz6cjeYYQD2DiT39uoVWw3qBZiaktSZRmtVOj/XVPhubfdqdFKVDVRdsuHW0dPAkArJUkSYWQQk2B5+zvtnl7OlTPHDf/Tx09sgt99huueVlUlKwy+uXX+DpF77JhauvYlVJ2pLc3LpOWeZYa5CJj6rfBi89Sgsqe4D0W8soCUEtbrt0dn5Kwmqk4oI5xhKfpr5ui8nKmLkaydIVuF1bb+l1AmjkvcinC1OUUMUt3AP1z5fbgf42yYoAO49tKZhXhI0CSOlppW1cBa4C4RT5tESrlKObx5hMZtx1x93cceRuTh07wwN3P8rJtTN01ID15PazqJ2J98PxiK2tLV584TzjccnuXsl4Bta38CrFC4mTHi8tQofNSFVZsBpnFZP9nN39CbujMbvDUVCgqCq01ugkwftw7qtIxtVCBvFmT+CW1UghcetmI5yX+DWWQiry9Jq/A6QAW5Wkmabb6TNYCfqQWuv55u42t9Niogq0aUeZ76P8lLN3H+Wzn3yEz33qcR6574Pvr/bLisMT9x4x9Tu+8zN6Fr18bej/7hvP8e3vvca1GzMmswKkWlJjhnnS0nJxR2cbKLBzjrwy7O5PyUtDnudNK0JK2SSrWyqupcU5SD6FKiokKikUoOOiRlRST5BaNzp6NTpKOIevSrqdlJXVHmurPVa6HbrtlG4rI8sybFmgE4VSAuPLgDZMoNVOgjqDcXhjaSWS40fWePDcXZw7c5LTJ3tL57P0N/3MTxjnQ8blmJu7W1zeeZNXr/yQ3dlVxpM98nJGYXJm5RjjLVKC1KFaXVy4Ayii5hHZ5SrmPSS0FxNQOI0yEmENsLxzDo8RTbK63eywlvt578F+RDgenFkdfJ5bBm1RqUQs6MoxT8pLGxjnEW4RPVm/RlQI8QpbQabb2FKQyIy13mb4Otjg3KmHuGP1Pu4+fg/HN46QCEkqEtZad9z2JN7YM35rOOWtdy5x+dpNLl65hvMpZeXCefIhocxVHxyz2QyVpEiRUFaC8bBid3/K3u6YybTg2vY2ViwYnRLmgc4bTFRvcT74oCkVkJvWmjm1QGmWCb6xs1Gf37r955YrKiUkUgnareDq2+uFtl+dqLxZBlI019nPjRRDNaspizHdtuWes0f4zMce4nOffIRzJ7uH6+2/IA5P3i8orsy8/69//yp/8dV/4t3LWzii0rSsHXPnbSNBDT8PCSLsEMPMxVhPYSXjyZTRaERRVCxC2K2/lT+EWKglIogifHgE+Ch7I1STrIRQTXJygJYSVD2wtySppCpyhLd0O23WB13WVgYcWVul32tjjCFrKZJEhxYdlpow5S1okZColFQ6tKhIlOHoaoczdx/n1IlNPvLg6fe8767bS35oLnBt702uXLnE9e0r3Ni5xtbedSazIUaU5NUEJ4IahpNzlNucE3VwtV9umy2dv6XNRLgmAV5/azJpZpBuua07vwy1TckC9+k9whPQfrWm3dLvFgAAcxX6+bEsVgLe+2bRDd9HgWPvg76iD0aVwsto06JpyQ6d1oCO7nPq+N08dN8jHFk7waC3yp1HznFCnP2p68LWbu7feOcyV67v8c6Vm1y5voNXCYXxVFYiVYJWEYziDM5UDYjDo5lOCyaTimnu2B/OuLk1ZG84oqx8A72vjy/MDmMLXHq0lLGFaFGyJmkfvCa3OYQF+azF9p/wc8KwVpLjx9boZClZ1o5tX99sUJRScb42fw4W+HTSO0w5RVLwyMOn+b0vf5wnH7+XO9cOoen/0jg8gb/AuLKV+ytXJ/yHP/8Gz/zkdWZVUJyuvEckKWVlkVphvaDTSqmqAmctvSxDCjBlDlIjkjbGBg+g0XDMeDymKKJenkrmvJLI0RJKBrWBmIDm8IIFoc6F3b5YKDvqxdILj/CigXMrLZAIrK3ABYmm1ZUBq4MORzeP0G0ndDptdBI4JtaVBBt0SSvNEM4jhUdpSIRDUJEoj1Zw8vgmR46uc9edJzh6dJMj/VstEPJ8x3tZMa3G7Iyvc237Xa5sXWRncp23r7/J3vQ6+8UuXhdUYsa0mOB8idaaVKXNLr5JTtF1WChJWZYNyGVRgkeglmY7c0jzcuvV1thxWSe6+HsXVB/wy4ttfR1qQERY+FSjkFHPmGQE1TT6ic7CwqmpF0aIf+NEFJcNbdlgRQKll3iVoFzQ7ctki43uUU5s3sHRwQmOrJzkyOA4JzbuYGNwhEF7jfX2+8+gAN65VvrxJOf8y2+yvT8KYIlZmCc5L7AE9Xep55shKTVCBtRmVVmKylAZ2B2OuHlzn73hiMmspCgNNnYCal+ppepwgR5QK8bUd/hiy9N7hxQ2PINQzZyrVrWQUlJWcWasQ5Vsq5I0TVldG7C20mOlnaAJJHLvBM4FonVNYXAuEKCJiESJwhQG7wW9zLPWmvGRB+7k4594gicef4Aj64eJ6hcRhyfxFxw7e8ZfeHfGX/7tt/jxs89zfXsPr1Pa/XVmlcU6EKpul5V4Z2gphbMG4S2tTo/KBKsHZ6GqKmazICkzmRZBrTnqrwmdRD8pi4kD4eAXtIxGu6US+2mggwWUlHMOH+G7qZYkStJpt1hb6XJ0c4OV1T5ZFvyygjW9IJWhTaekRKmwmONKEA4lfeCnCEsrVayt9zlx7DgnThxjY3P9PXegI3PTW1lgxYyLWxe4uX+ZazsX2dq/ytbwOlu715nkI4wrMKZsNALrCsl6E7ylvKHd7USibzQflDXKMgI27O0/FrWHVN1qXfzNfEgPS6K80PxbuHBOtU4jsXlu81IDBITwqFSxSIR2sf0Y1M4V3ji8JYgHO4FyAfgSfp/S7R+h3e7R76yy2l1lc+UoJ9fv4tSRO9noH6OXDUhos/oe86fFuLyd+929KVeubfPuu9e5uT3CoxiOZowmOVIltFotUJKyDDp9aZo26LzQvpPklWEyLZkVJddu3GQ0LZlOc8rKhCQXCeJSSpyxC9JGdcKyEUizMF+qz/4CsAXCJkngcF4EgrWM502GZOiJ0H1vSVNNv9+nP+jSbrfIlCTIUEc/sjg3rOW8nABvoruAqbCuQsfrKAUM2o4vffxevvzFj/HQIz99A3AYP3scnsxfUjz/Vu6/+/QzfOOb3+XCxevotI8XYdBsnWz04pJEkSYKWxZYW9FqZ1TWRT5P3Gkbz2QyYX9/wmQywdiwY0VqvBdYF31iY/VwC1GriYNzjBgH2ma10KtsklZdOYR2jpLBXG7Q69Drtej1u6z0e6yurtLrtEiVDL5NvjaadAgsOpGkGspyRpZKlBY4W4J1dDotjh0/wpHNNY4dH9DrJgwGA4735nOuLbfnnS9RUuKj027lZ0ynY/aHe+zsbbM/2+bCjfPsFzvs7+8yHO8HxXthkMqAdBibY3yF8yVe2DBwlxbvHd6DVq2wgC60h2qASz07gXo+RuNtViP4hFBLVcFBqLmzHhkh9jXwpa7kFJ6ymjWJ0/vQVhRCoWSKllmYNYkWraRPJ+vS66zQ76zQ7/Tp6gGnj5xhtb3O+uo6qyubdLIOmhRJQlf89AH/pe2h398fcf3aFteub7O1M2I0Lpnljsp4jBVYr4CoMiHAxrZz3YIOIamMZTrNubm9y7UbN9ndH2I95FXgRQmpQGnqxqcQoT26mKyCULRruGO3mxcuAUwWZpDh+yi5FDcVEoFzhlRLVlcGbGxs0O92wvzW2DkU3pexvegCOMYLQOMqGTYeOBAVphjimXLPPaf4+JMP8jsfe4T77lk5XFt/wXF4Qn+J8c6O99/57rN86zvPcv61dxhPPO3uOkK2sT44mWqtSTMFIhj0EdW16/ZVrW1mjCOflRSVYX9vRFlWFFWwqtBJC6VilRWRagdFOEP8bMlKUIt9+rhY1zv7OGOTAu8sxuaAo9VK2Vhd48jRTVYHK6wOeigRyM9JqoLiBBVKeJQCgQnwYR9kqZQEEduRTlSkXU2nn7Gxts7GxgYbqyusrq2wOuhzIpViy1R+U9+e9X81v+xNNmZk9xiO9tnd32J/f5fd0Raj8S6zcsTu3g2qakZhc6wtcMLgfdglG1cForKrcCYoxYdNQ3RFdlUAmEeFBCccwnucCDOiMCuSWMIsKXyt32psB8ZFudaoqxdTJQKiUTlJojRJkqFkipSaRLdIkw5p0uXUyTO0kx6D7jor3Q0GvXUG3dWQrOhzVNweDPFecXU49nujIbu7uwxHE65f3abILePxlOmkoCjBegmkCJlSGhAyzEGtFxRVSWUNSupgbmgM4/GYrd09dnZ2GO6PmcxyZkVJaSxJ2gpQdCFRUuNlbBvaUL2GNuDCPfkes8PbhScortctP0Ww3FlUQdFK0Gu3WV3pM+j1aWcJSsxbitarmHzzUIELE661FeASNBneOlxZIMSMTsdw6s4VPvv5J/jdzz3J0UPV9F9KHJ7UX3JsTbx/+dXr/O3ffZvnnnuT0dih0j4ejQFsdNbVmUZqgXMlMlq817DkudJ1sE4fDseMpyXj8YSycEiRBNsRLwKpeAFbu9jPn0eN4b19BVYrAhzkn0gfWmZKKbw1UUA3KGOkSUKrFazhN9dW6XbabK6ts7Lap5Um8XgCeEHJ4D3kvEEpQZZqlArKBZX3iKwNMrQWEyVpt1JWB10213r0ey1OHlmj09K0EoUSlo1B61Z4vN3xQvjG6NFQUJkcY3Om0xHTcsx4vM9kOmIyGzOZ7DOdTZiaIROxz9ROKIuC0hSYymFsSVVVlKYgUTogDr3AeAPWYbxFuCjea2yUbgr1gaoBHNHCQ/hQAadpRpqmpGmLNE3JkpRMdOiLdXrpgMFglZXBGv3+Cv3+gH5vjVbWRcuMRGSkdFj5GSql28XVG5Xf3h+yM9pnd2+fnf099kZDZrMZ5bQMYBupwCtctOcwLmj1ZWmbWWEpjUFGl+zCVEynObMiZ3trl/F4zM5OeM6yqECGFrVUAYJuvQBR2+wojF+YSTm7pODR3LUNxeD9wCuSyqkIKhJ4Z7DWIKSllWiyNGF10KPf7bA+6JPq0I63lQm1rkooLFgBkuDrFdQswBsBVoIRKAG+mrKyqvnok2f59Gce5p77j3K8kx2uqb+kODyxv6L4yfmR/853n+M733uOd69s4USLpNUDnZDbYNooEo3zJamM9gs1Yin+O3CjNNYLysIxHs8Y7o8Zj3NM5VEqaezDlz7kB834GsDU7ZOVt2H+tWjBXfNL6jmWjEgvWduhR56Lt440CWTK9ZUBa2trDPpdut0O3V5Gr93CuwqdyCj7Y6jKHO8trTRFpR32xiVKJ6SJJpGCREMqIU09qYTVfou1fov1lT6DXotet0W/m3HkSP/nup+ndts38jwiVI0VM27mV8iZUpZ1gjJUVUVlylg1DGOVFaDMNTKtsfqICgmhMtZNe1aJ0NbtdnpRW65Fq9Wik7Vot7tkWUZbdljTx0hp0Xkffb2fN7ZvWL+7N2I0mXFzd8hwMmVvOGJcFBRlqHhMfP+dVooznrKyWOswTkZjxSQmsGAjX1aW0jjyPGdnb5etrS32xyO2t/Ziy000FeScpC3wsU3qqTdhsbISwTm3tmi5JcTBJBVmWItoSYcEEZyqvbehzYyj09L0Bz163YzNtdVwX0kViO3O4m1QVfdKkTvifCu6OxuLd8HXTDrIp1NaGo4fXeFTn3iYL37+Me47feuG6TB+sXF4gn+FcfGK9//07Wd5+kcv8O6VbYYzi0rblEhKJ/CRzJtKH+ZFqoa7x8GxDMKvWoUPY1V6JpMpw/0pk8kMU4UPeOXssgZek7iWldzdbZJVQBpXzQLbaBouzF6WhWXjwizrKszh4i41UZI0Tel0WwwGPY5urLO6tkKqA+ou04p2p0W7nSFlAJNUVUWv223mBsJbpAh6donyKOmxJidRkGjCc7QyBoMea6sD+u0WvSyh28oY9LsMfs4E9n6xa3e89551HaqZPb/lrbVLicr7ZVmsGjQgxNzfbFX+8omhV/cKPxqO2d8fsbc/Ybg/YTIuyCuDR5GXjsoEDTvnIzw7+jQZU4YnEdFAtFY+Ly2VcQFIEYE/w/GI7e1tbu5sM5lMqIxFJ+2AoIuoVSklIpLQpdTR1Tq+hBBzwEN87HsBgA4KAdeAFLfw80DRiO1V6Ui1DPPVfof+oE0nS2llCc4avLEI44LKvgjISucFJQ6vA8oP60LV5YJWZqY87dRz1x2bPPn4PXz0ow9x+sShB9WvIg5P8q8hvvvD6/6v/+6b/OjZ88ycBtmmFBqdtZBCNwCJWucsfNjnqDXvwo5dqWAHX5YVw/0p+7tDxtNp2CE3O1kHiDlPZWEheK9kpeWc2b8s7xOSVsPmd+4Aki4kyFRneFvFiszgXUg27XZGt9NifX2V9fV1jh3ZpNttU4vVJklCS0twBcq7WLlJEiWieKxvEFxSBX5YDXyQPngZtRNJS0AnU3RabbJ2i06rRbfbpT/ocvTE4AN3z+9eHfvJZMZoNGJcFmyVOVNnKfOKvCixlcMagfdB4NY6iTGhjSmFxjmoqph0AWPBeBfg2l5gnQ/Jqghz0q2tbXZ2d9na2mF/PKIsS2wtYCgUNvqpKaWRUhCckx3W1nD2OaVCqYDOm/tPSZx5j2QlakDKXClESM/cLTnaxziHFpBmml6vw+pan36/S9ZSaCmDyrwPFAVva57anPdWeQdKhjausbjKoIShnUIn8zx43538zhee4tNP/nyzwcP4l8Xhyf41xU9e2fbPPv8qf//tH3Hx8h66tUJuINFtpFe0W13KKqixt9ttVCKDtcMCOq1GlEkZeD3FtGAyy7ly9XrjpBqqK9kg+rz3qEQHTk6txLCgiKGEQPgA3V10kF386qOGHRDaZwvHJXHRJXdRPChwU7wPUkZSQqvVot/rsLo6YHV1ldW1Ffr9Pt2WIPUTMm0b51UbFyetg1UFxCF7dIOVUqJFDVowtBKJko5EClAytHxSTZpqklTRaWWkmaLTaZG1ErIkIcsyjvR/sxUGrm7t+bI07A3HobrJy2AfX1lM5agqQ+E9PtPMnMOVDuNdJHsH2pZzBKdaQgFjbViM6wrRekVuMpyXlNZQlQFosbO7x9bWDnujIdvbu1jnFjYzNHNVKXUwjww/ZC4vNf968CQvAX68nKMm6xlVQ8AVzWYpJByBTjVSqgZYlGiFdiWDXpf19VV6q9FzSng8Ac1pjIltWRVAMDYgE2tyr7E2iNRaQ6eVoKWjnO1x+s5NPv/ZJ/jspx7njkPu1K88Dk/4rzGu7Hr/7adf4J+++xMuXLzJZGYCxL1KSJMsGhAGwm5o7TnSVhY/bCFZzVGDEm8JqMGqYm84Zn93l8lsFgb8Uc7JmLlUT83LAqhiK0viImfnvZPVfHYQeUALFVr9m2VVBtcoBXgfFzkCRFhKyLKMfj/qsLU1Z+9Yo9fWwWur1YJYQamoGF4rX8McNamUCOhDrTGmIFHhZ8EMk0hYBqU8UoDWkixKRqnIH9Nak0rBaqdDEnXnlFJBE1EJ1jd/sXDk3e2hDxWqb5JF5R2FF1Q2zMnqFqOzgUxsvKcqLcZ5rAmuwcYRVRYclTHoNMH6Bft6H659VVmMcZRF1SQWSSDGlmVJmefklWBSKHaHM27evMmN7S3290fMZoHjZ6yPAsw+OCFjmwqn5jL52wgBL8ZB7cWDyUqLIJe0aM+yqB5S/1urBKkEVWkwtiJNMvq9lDs2V2hnKmj6ZQFoYeNM1eJJ0xZlVVHmJc7RtCeFjeaLHhItsS4nn+0x6EmeePRePv3Jj3DmrmPcfaR9uG7+GuLwpP8GxI9fn/ivfe2bPP/Sm4zGFcK3caSRfhpUuFvtNk5IJrMxaZrGOUgtZBqqkERGK21S8qJkPByxN9xntD8kL4sI1pjbfHvvo46gaDTPlBINr2WuerH8tUkU9QG8B1Cj+bVnTnIVbi6PY+e7c6loEkO/16GTpYGs2e+yujJgfWPAxuoKvW4LY3MSrciS0B6UwiOlD2aCWgdOjJSoujVpQ3LUIrYVtUKIOBeMCTCJiU0JkM7ExKYa3UalFFrI5n3WAJj5f36Jl9Zwc2DeUo07dxtt1ytbE4KJycpjHVReND+bm0/Wl0BEcEesVISKbtUyVKDOQZnjrMXYkMiEkBHRF9x2kySjMiF5zWY5k8mEvd0hO/t7TKYlF6/sMMkrhsMh09kMa/18hikX1TnAiZgQ8Yh6EyNuLzd1i8/XAdNKYnIVJM18FFgSjq07C+G8EOeDiixLWF/fZGO1y+ZAo5WPGoIe4yyV9QF5KyTW1C3HuWZhAMo4qCyZTMkn+6ysaE6fXuOec5t8/KMP8MQ9h22/X2ccnvzfkHj7hvfPPvMK//BPP+TKlT2mhSNNW4gkZTrLsULTanfxcbGqxWqdN6Ftp4JlvRSKygmkShAepvmM/f199vYCLNlEo7jSzG29hVAN4lBKGfpF75OsFsMLF+WamH89qJnnlyH0AbKuSGSdOG1TRVjrkLoV+GMCklTR7WSsra1wbGOV/qDD0fUVOt2MQbdFu5OSSIGQwZtJahFg5HHWJ31Ai2klyHRIZi6qtis3J1JrHZ2SpUMq1ySxRjdQEpKVPJCk5PxxkpCo6jXbM68GQsIK58FU4dwbT6ya/EISA6JpX51snbOxjepxMqjjG2spTBUWYB+UOqz1COPQ0b7F+aAhj0wwXmKsoDSwN54ynszY2xuxs7vP7u4+e7tDhsMh4zxnPCtxIlqvCNEc37zttyxVNb8ZwsIvpV6+H5pks6xpeBvF3qgAUrd6VdiMeJYrLBFBD0LQbQcvttXVASsrK/S7LXy1F+gfURHJOBug8lIhYsVWa2fWor81sTtBIgpLpi0PPXwnn//8ozz4wFGO9Q5BFL/uOLwAv2Hxk5f3/Hd/8AI/evZlbtzYot1fwZIwyw1eZiRZK7R4YitNCI8iLJDChyQmRYLxEZGtA6JrOpuxs7MXOFrjMZUJO3qhFFqnAI3T6iLUPcSBysrN5W0Cnyi0ApvJxMIM7HbK4nOhVrdUNcggqY5xAeHVmEa6UHllKrTtjm+u0e222VhZYXVtwEq/x8qgx2AwoN2RaD1F6VDBKRn4TkIItFTxvwgU8WEh1jIi1UQ4GJ96UPMkpBBNhTW3dnExOYnm53ViU2r5+H1MSjYmq7qyCm08h/FzbzGMxOcE6aRGOcRivImKGy7SE4L0U1B3Ci0/ay3OCtqyizVQWcesMIwnBTv7E7b2xownOZeu3mQ6KxmNZowmBWVRYUxoEVtvaHWy4B1W88YOcO4WVccX27E1AKe+/rX24UErzEZb8ZZ7IiRCKXR8HRWFcGsF90CpsM7QSjNWVvoc3dhkdXWVVjsNyZEK3KzJlIHTpQAR0Y0itkQrnDPIyKdyzsQNCdxz8gQfe+xBHvrIXRw91mKzdzif+k2Iw4vwGxiXb3r/g5+8zPe+/wxvvXOZWe6RSQ8vWuSlJW21MQ4QDq0lWhDlH6IpoNJNElCx1WERYShfGvb2hkFrcJxTVGVYNMV8JxtiGTax+DUkqxr9dWsL0C98tg/OHGAhmbm5iV0jFaUk01kBKqgPhMG6bW5UBZiqQilBmig6WTDHW19fZXP9CP1ByvqqotXydLtdOp02nVYrEG6TOKOzJkDhkSgtYzKKHwbp8dqBCuohUs5N+oCFSso3yaqusARBiaRuE9Z5ulFn8B4bq4QAdgi7/5oQ6yxgQRgJrv69a9qVRO6P9S4mKhmljqCoSiazGWXhGe3mTGaG/dGQ7d0RO7tDtvfG7I/GjPOSyoCpQnUdJJIiUEUoEB5ri6UW3XK7c+7nNU9Wy35a6uCyIt4/WS1SK8LryXl7OJDxgmGpCq69mxtrDLodVldX6fc68ZraZgPnhAERNAnxEu+iqgUBDVlWOVoKtPRUZkY5m6ATOH78KHedWOd3PvEUn/vEscO18TcsDi/Ib3A8f2HPf/PbP+L5519ne6/AuBboFmUVlS1U0NeT3mFdicRHvT0aDyHrA3/JIUjTDmnSIs9LJrMpw/1JmGkNJxRFgRCKJFFzsdYmllXD68orNrniYyLCTDB3uiUsRI2ja1zwjTHzSkUchMlDls1V0xv+UkSb1S07UxN1qwCRl1rRSlskiaabpXTaGav9HqtrfVYHfVYHHQb9DllLsbHSJ82g107JMkWaSBItG0BGNctDMlRpIzXVJNtoQgkhidTHUM9O6vZhjX6rk3FdVYWdfmj91WKv9bHWbUGEamYoYdYVIOTOgXFQVo6idExmBeNJznCcsz8asT8cM84rrl7fYZYbxpMJ06KgMqECbnhKkcgt4xUMxzZH6bmqXEpOi9fBOddU4jQV9lyDDwK5dhFEMR8/3Uqf8LGFOY9wvuqEqLUk1QHs0u91GPT6nDpxnCQNbdumOnfRZ0pB4QwGj/cq6Ak6GWxb4oYhTRS4EmtmmGpKqix3nDrOJz/+JE89di/333FYSf0mxuFF+Q2PK0PvX339Gt/81g946eW3KZ3EWgUiQWgNIsB2S1uihSTNEiQRyOBlg+gL85OgfpGqoMfmvWcynbGzs8PO3i7FLMfH2UcjRXrL3GoBto5b2DXHeZRgKVGF54h/ubjoxzjYWpJS4GzV7NhZfDURdt3WWsRCJSaEwnkPPiLUKhersnAetBQBqt5WQel9tUe/22J1rcvKoEOvm9FqZQHGrhNWe0GGp5WGn2mt0XqeXLNExxmVv017cPm4awuQpnUbk5W1FlPZmHDD18JUGGvJjaeyhrKoKEtDWRqmk5zJZEY+q9jZG5MXhtE4ZzTJmeYF09yQFyVl5fEqoAHr+aGIbcnKWqyr4nHQzMSozRrjJqSujISXUQMxtBvnEPKa5zTnO3kxT37h3quvsLxl23Pw/lhsJ4PHY5sNTauV0u206Pe7HD2yGdQntGwg9wKHkglShDZoXpUYpbCi9vESCK9RXoEPxpSmKnDVlHbqOXlinXvuOcX9993Fvffcyd2bh4nqNzUOL8xvSbzy9sj/6JkXef6lN3jzrXeRSZdJ7lFph9KCQdHprjAa7tHLBBITGPgiSDQhA/nTWE8ry/ARlYcKqLPRZMjuzjb7wwl7e7NAIPVxtfVzXUIhAnIQGVpfTgRnXYtdWqTFLfMMGr3DGlgxj9j+YQ5FDz+99fZ0yOW/lSGp1SyeOmrPo2ZBFLGlFhU3JL6RjEqUjjysFK0lRzbWyBJNt9Wm3WnR6XRotzPa7aDl1+20SJKELE1IYmsxSRRpmpIkSXg5IVBCNAi9IiYkY1yAiZcl+awgz3PyPGc2mzGdTsnLip39nLyomEwmjMdTxrMg/WRNOMqiNPH8BCCCa6o+Fc/FMnS8Tgn1Wa3BLvPzNU8ntdtyuI4Si21mkT6274SUURdyTgj3Mjjv1lY13nuwQWGeaP+Bl4g4JzS2CqoQiUKqwMNzNggbCw9pmtIfdNnYWOPIxiq9fivo8eEwRUkSDRptFXiEqQq2JLmxmARkkmIriyktiUxQDmxZgKvoZAJJwR3HV/jspx/jkx97kPWVwyT1mx6HF+i3KC5em/orV7f4zvd/wiuvv83WzgyfdDFkzCqPRwcbbl+G5SoioZwLC4hKsoCGq7UDIzw72NOHRSCvDNvbI4ajGcO9IUVRBeFVmQAhUTWIPynwEpys0RwhEbjC3uJ+W891IFQatypnh+F6beEQWke3Fyz1B/+28ZZa9juCW1tOEJLT4u6+/rdSYeEsplOkcigh5+9Z+DC/khLvApox1XPys5SiMfSLo8OlZB1aaPP5XABU+Ga2GNp+htKAlC2skw3Hyi7McqSUKF3Dx5fJs/UMaRH2PY9Qad9qYsgt56yZzznRAGfsInovVlc+Jn4vl8+lMUGlvJYHC4aKCu9kGK0614AZEA5rCpwzJImi3Wpx/MhRsiyh3+3R7bXIsgSpQquv5qMpEZ47nDwVjzkgFJ2CwhpsUaKlItMJVT7DllNS7bnj6DpPPvYAjz96jhPH+qyvHiaq34Y4vEi/hXF9x/t/+t5zvPzqW7z+5iW2RwUq6ZCXjna7hzWh2tAChBaETWgcPjtDmqYNeksIgZIJQmlkaCAyrSryomA8GrG7s9+QQrGLMHfVING8mC+ozYzqANx48b/F6qmJCJX32KZ99l7RLKYHW4oHeWC3QSLCQruK+bxo8blTLakrEOdrdYdqYQ4TqlIpwvwuaN3V5Gyon+7W41dLMzoWfKzqn1tP9DtTcyqBqluQ4XF2wS+KeA2WzsPtTl5NRVhq0b1fuNgGpJEhWjxHtyADmScrrXXDXarncnVilB7qHCOwgEMrQafTYnV1wGClz7H1zSCdlWYI6bG2itSGaum61RWbs2Bt1KjUCueCOLF0FryhLCY4U3DqxAYP3H+WM6eO89gj93LqsOX3WxWHF+u3ON541/qnf/wc3//hT7hxc5dpaVG6h1B9rA9us0JahAgafkqHgXVQAVDRakHGxU2CD4lIZhKpBd45JuMZOzu77O7uM5vkoWU4nlInOkRApLGgfH2wqjoYSwucmM9GhJc47JyU/D5/f7vv5y/7fhYSROWM5Xbi4sLrbVhE57+LfDTcQqJcaG3aRdkhD0KFny8qPCwlbNUkrIPvwTnI0nZzXDUAoYbAA02yqtXGD+amW6vWA3Ebc845BSFUPBa/NHeaR00iu905rnllNtAAFgAVoVHrEKJWVXckqWDQ67K2vsra2gorvT5ppkkXxH+tnXPwpJQIrbBmDqNv8raQ8TU9wld4V2FNSaIcvZ7i2JFVHnvsfp567GHObOrDde+3MA4v2gcgnj2/43/0zPO8deFt3nr3JsM8RaV9Wq0stPhsSVUVgTicpo0tt4yq2iFRhZ27l+ASh/VB7FOrBCkleV6yH4mjN29uY6yjKj2liYuyDK1CpRS2KpYrqbioNgsM82TlCLMRFwEhYUbyUxQx6oSBW/q+jlvVuQ/8/QF0Yo12q0Op+ftdjAAOsAcqwwOTNemjKbplWRNvAXix4CR8W9CJm6vl1yTcZVJsnTDfS9Zo+fwdTGbz41rggzGHzkghmq/hl8vJKrRx5cKmRDa8KAjzJyVqKxoX2s4uGoviGPTDLHB1dcDm+iorKytkWQJRz1LFas41jr3xfUTn7KKoUEmcWdVq7UkQgK7KKYl3CJejtOPOU5s8/tgDPPDAXRw90ud4+zBR/bbG4YX7gMTWrvdvXrjIt77/DC++dYO9saXMC3SakGXtwNyPkj5ZljV/1yyWKiQbocFgMc6At0FpIgmPN2VFVRlm04LZrIj2E2PGoylFUeFdbMOpgDarXY7rhFUvknWycrdJKmHRq0nDt4u5IKp8j9v3tiMbFiqwumW00M5aTEx15bPY6vK+VucOba66rVarfi9WgqWL5ou3qd58RCwutuUWybVCelIZVPLn72m5jXqwDbic7GLireUjeK/KazlRLT7fLefNLydG4eJ94+dJOFRhYYanlcBag7ElzhQICVlL0e1mdNst7rzrBJ1OUMLXSjabBedcM88MmwIRW6VhJlXZeWuxETm2FZUrY5VlkM6QuIr7zpzi3vvv4tyZk5w7d4IT/flJ2i9u+JXsF+cVdhi/mji8YB+wePvK0L/y7k1eevVtXn7xVba295CiTZL2SXQHIROci5qD3uKER0gLMhgqOkCqtBGAtdZiI+8mSZJgGqhSyrJiMpmxP5qxvzdkNAp+SVVVUdma7CsCpBxi1RYTRGwhNrD6BVM97z3qFpO9ELJuD8ZFvt7ZH6xMrDe3/Hzx387Y21Y09YzIuFo5Yi4SHN/BEtx6uXKaJyvjbAMCuV1LTqmEgFRcWJSb9+BRfk4JuN3cTcj3rhxrXlT9fhdjKWnV86ilWKYKyMXzV8/XPM15UQvJfn6uBNaUAWWZStqZotfrsL6xwvrGgEGvS9ZKm3Z0OSvJ8zycl1g5mYg6nEsJyijkGyD/WmucCaaKQjqqqsC6gtXBgONH1tjst/joow/x4EN3cHRw6wWYuS3flpuHa99vWRxesA9onL829K+/9jZvvHaZCxeuc/PmCGMz0qyL9TJAz5UE5RHa4KXD+RLrINUdrJtrBColG2WLMH8ArVLSNEMIRVVaJpMZ4+GYWV7y1jsXMRHdZkwQHPWCIKMjA2qLuLt3gmbhDKAMMUd5HYiah1M3rOoFdCmEj8nKvWeyqtuA7yUj5Gp4t6uFbvUSMEIsVIkHn7vmIzX8qjj7WZwJqYhakz6oOQgXEHWKYErpnGnmY7erzN4rWc2BDgc/1iGZ3raSPbgxaM5p/fP4PuL5F/Hc1KofeI+3882BEp4k0ayudDlyZIONzVW6vSzYs0SqQFkGc8darDfoIIZZVGkqSESj31cTebGiORIlYDoZgjD0OhmeCq3h3nvO8cSjD/DY/Sc40r/NLuEwfqvj8IJ+wOOtyzP/2muXePnVd7jw9g22dyd4lYW2nBQ45RGJR6iwSFaVJZFdBBpJaMkpHeWIRBChrblEMiLWaqCG9KE5t7M7ZJIX7O3tsbOzw3A4Jo8KGVIH9JbxDikVSmuEUMGl1sXEgG4G53OYd5izJYnC2sATErcd8rsgt3MgWcF8sVcHKrmDX8NcaLlNB4vtxZ8C4KBukxE2BZ4mGTvm0Pzwc7cEMPHRiPJ9n/s2rzU/IAlyeSZWH0et+l6DNsLfiVuqt0S3F0SOI2TdOpQUJFLgvMGZCkHgSSXRnqXbbTPodzl9550kqaLdzmi1k4CQ9CW2MhhTRaRgqEilSPEeqjygBlGSmc9J2hmmrMinM7SUJErjqhJnDZmSVOWERDo21vvcffoE9997lnNn7+Lc8cOZ1Ac1Di/shyTeuGj8Cy+/yWtvXuSNC5cojKfy4KJTa+UqpFakuoV0aYCxe49xQeRTaUGaarRWcSYSeUhCNBp+gfgpkLrVyDxN8hnDnX22dnfY2dljPJ1gKhedZWX0RppDkZXSWKPwiPD8SuKto4q7dyl1M6+gbtcdaM85EVtEC3MemCekRbTirWoKNNyqg1FP0m5tzS0DKRaJtfNE4mLFc6BteDApCsftX30e7/uh9TJUS17OEy/ckribhy8ktZoXVVVRyUJFrUgfEqgSHq1CZSMVtBJNtxO8yDbWVtjcXGdlpR/7d+Ee8bWHWfSTqgV8vQd82JQ4U8tahlZxIUqssNjKIIUgVQpfBQh6IjwtLeh3M+44tsH9957m4YfvObSW/xDE4QX+EMXO1Pv9seXVNy/yymsXeOX1t9kd5SA0Do2QCYlKKadmrsOXhflC4LsEnlbwNaKxnVdRdkgQdO3wCV5G+LGSYAV5WTCdTpkWORcvXgqqDdOcWZHP9f2kRqsUpdtUVoAN/K1ATo1+VyoJLrFAo723qGohHM4XDUjjYBsNboXWH0xYQYbooGZdHcstv/p9LCYrXGiVHgQ+3H7GtYjDE1HDD25fvdUQ+oOxeEACIdOGa7WUhJeg9wtV1oJorBCCLGsH7pgJ/DJ8hVSCdkvTbmdsrK6wttrnyNEN1lf7dDodUq0iJ61CioAIDETnckn3sQZLCCTOybBxscTqNaAojTJYDN5avDVUxYxyNmOl2+LOk0dY6bZ4+P5zPPTAWe44Kg/XsA9JHF7oD2m8fn3qX3vzEq+9eYkLF65yc3uEd5pW1kHrBOtD26hWh5irKIiQvIRoEpYWoRqJdQVCpo1Aq5eCRGhkoqMauSDPw1B9fzQMXlu7Q0bjfWbTgtI6isIjZTpXAodAlrXBlygAHmQUePV4IZcqmIYEfRuVivdqAy5+XyerkDwWk0kdMRG818l14kCyur1CxO2ewQmCWvjtn3jh1Zfe9cKxCKwLSeHWinLBZTduNBrytvBIERyRp9MpSimyRNPuZPTaLQaDHutrq/QHbY4f2aTVzsiSgIr0NqicG2MoihkIM0d+1kLETQtSUJVhY+K9wFThmKSsEX8lXlQgbNCI9I5ECfrtjHNn7uDB++/h9KkT3HX0cCb1YYvDC/4hj9evzvzbb9/grQuXeffiNba295mUOUqnJEkKUlMZh/WgVUar1aK0htpkMMgL+mCR0ag4JEgRQAlhmz1XQJBSkmVZIwDrnGM2KxiN9hkOx0xmOVev7VBUhtmsYDabUZYG5+dIwlarTRCEFU1lBSKCN3zoKx1Q+F6qMG6TZRZ/LyG62kYh1wNov1t4Sweeq56lHaxibmc2eLvwqKXXmHcl48LeJCG39PuGQMzcBTf8wkZ4uY/Q96qB/fto0yIlJElGqiS9fptep83G5hqbm5us9nu0Oy3aWRpcqqOWV1WG6+OqkiRVjYOvjaRf7+fOyNb4oCpvfZO0DgJbjHHYKiiht1JJq5WxubHCmdN3cvedJ7jj2CZ3HzucSX1Y4/DCHwYAN/e8f+vN67z+1tucv3CB3dGY8XiGR6PTAHn3PjjYBkPHiJRTAoVtkhWAMTZA3NN0iWCrREAh2ipIPmVZ0Cqs7eOttVTWMZqVTKYFO1vb3Li5HQAaZRXQhc6zPxzHZFVDrSNar55POXPL8S0mDmfeH8Agl6wvAiRiUV3eC7WUeG5JVrEavP2caJmAfGtPUuAPoCFvl6xCco0Vk5s/h8UvuTU753DGNjOnALiwJEqSJAmtNKHVCp5gK/0BnW7KuTOnSBNBu92m3W6jlMTX5pA48sm0uWZ4T02UDujPEqkVc7kloncX0YQktJdrpKj3FutMPCeORDgG7YQ7Tx7h1InjnDh5jFN3bHJ87bCS+rDH4Q1wGLfEq1em/tW3LvLyK29w/cYu09xSVRJjgySTzlrNblhK0NLHSitwn7TWCJYXayklWgSdu24ra/hAc5RfUL9wQpJkHYROEM6TV4bJdMbu/oidnT329kfc3N7GGk9eOoqioCij1UZN2hVzH6lbUH4A7j0beADoWrX8dsCHhe9vp7MReKxqKTlS/x2LFdx7q3QEMuw8QR5MVjTP4RtCbtN2E1BUOV6KaPURfLeSRNFppWRJSruV0em0WF9ZZS3awa+s9FkbrNDpJng7xdh8WQ4qSkoJofDWNV5bNVG61kdESYqqbFp/oR0czmWoFmWT1Ly3KC3xvkJpwerqgGNrK5w7cYQzp45x3z0rh+vTYTRxeDMcxm3jZuH9zt6Mq9e2eevCZd66cJn94QzrFUVpESQIJZsddu2eK4gWEVF/TkZYsxa1WGvgbgWPKI2KwIk0TaNZZOADqUSjVIJAIWP1VVlPVVnywjDNS4bDMTs7e+zs7rG3t8dkMqOsKobDKdZ7vLVUjZhqPcOSJAuVyyL/KZBeRbBWuR0nKX6teVTxGQjtwvnjnKwTleLWpORuSWB11EWWtXNVjMYLbBGQEc9tbdlBdG6uW41JolCxcspaCb1Ot5E26vV6rAz6dDotVnp9Wq0UARhThspJWDJtqaoiKH0ojfBzVfiQj5LAlbJhE1JXVd4LZKKpjGkSk4iSSbVaergOFryNqhYtslbC6qDLuXNnuPfsHdy9elhFHcatcXhTHMb7xs1p6fPSsD+c8OaFy7x14VIQzZ1ZitKDbIFXOK/QOrT+QrUkGuizVEHpvJ5zZVlQcEC4BkmolCJJNUoJvDORv1UjCqPZYdQx1DptJIq8Fxhjmc1mTCYTJrnh2tYO47xivD9kfzxiMpkE36iywFSuEUYNDsoeiUTquq0l8ZVqyLGhvSjn8zcAqZvz4yOpuVGdF0QblgXyMtCAI4RARNV2IZbReEqAQFJVQdXCORMSUZO0fANoUEo17sap0rTaWbDUaCcc2RjQ66T0+30GgwGdTocsS2MSU6AAUVdFtnkPToRZnSmrcO08lNY2Eki1rQlSRjUJv1SxOgvWO6qGPA1SeLytKMscvCFRglamaLcSVgcdjp/Y4NyZ0zxy5sjhWnQY7xuHN8hh/MxxdTj1W3sj9nYnvHPxGm+/c439/ZzKSpzXeBeIxmmaNrydoABBI98khEd4i9CCTCeNbbxfsCfvddKFNmOwgZjbx4cqzLuoqhB/B6EVVnkJqkVhLEURAACz2YzxLI/mhgW723sUZcl0Oo2/z5nkM4oiJDPlU3CBuFuDAWxsudWYx1pcdTFJ1eWVbyorEVUd5v8GR1WUSLUwR4tJoz5GKUMlmdbGjgvzJa0la6sDsiyh2+sw6HbodDp02x063RZZoulo0Eo06Esf50q1MkcZrTbm0PUAsgiNTklVBKdm4TyVs8hmYxDafaWZc9jCawTuXVkFK4+k1W4g67gS7yqUsLQyTbulOXl8kztPneDs3Sc5tdE5XIMO42eKwxvlMP5ZcX3i/c7ulKvXd7n47hUuvXuN4f6EYAwbqiGlFFrPW4V1JEo3NugNGVXNhV/rJl2zeKs5aRVodvn1v4OBZPhPoDBopIjAjaSWSgp2E8Za8J7KGMqyDDOvomRWBMfeqrTs7eyHRbk0zIrg4pvneXD4NaEdZj3RLNEstLfE0nGFRC1RQiwkW087a6ETRZZlC/8ltNMMrSVoyLKUXrtDq9UizTRZltFphcdlaYpSoklkQS1jodVpAe9xMbmY+B7r5GQOQPqtm/+75lt573HGYpxtjqdu5ymlltp6tV1MnYyNLSG+XqKh22tz9Mg6d95xjCObaxzZ6HOke9jqO4yfLw5vmMP4F8f1iffXr+1x+fJ1dnb3eefyFayr5xhh8dM6JUmyMM9yIi50kf4aVSm01g0qcK4+UZNVFyqViF5u5mRCNO0skCiZxeQWE5iez9UAWkk6ByCoYHQIC3wsOdcBDAu9p3IV3nis94xGo4hcNE0icM4FNXkf3leQqlpWS6+5V4NBb0661ppEaXQSVO+lgjRVCAVazS03aiBFgJ7H1zRVkzTm/3mqKjj1hkqqhqjPlTxKaxveUy1q7GoNPuGCxfyCbUrD14qvu8jfanhUUS4L4dDCsTroc+zYEY4d3WRtbYXVQZc71g8T1GH88+Pw5jmMX2jsTL1/9+oNhuMJWzd32N7eZjQaU5YG48A7RZpmgETIAKIIatuq2eXPq5D4X402FCLMQWIVplStWShAzJF/7aTVtO/qqJGLUgYNQy9Fg06sq7P6dZMsmatzKIVSCVILlNAgfaONuLiYz1tiAolAHoCkez+3GKm/D3MpF3ho0azRMTcbXLTOWDQhrNtxNm4GFpOHdWBFTFSu9uoKoA0TKyhra53AgNZz8X3U7UJPUK7wPm4aqBNTrM5sFZ83vL7Wmm63zcpgQKedcufRdVYGXTY2NjixfqgwcRi/mDi8kQ7jlxbXh4Xf3Ruyu7vHzs4e27sjppMZRWEx1uNsmEFpnSJUElQMolW5h6VkVXcRhQhiuiF5xQQm58lLCYkzHi3lHOAhdSAviyAbleis0f+rF3q58HiVLFdyi8kTUaP55olq/rcSJSSpnmsENuCFmAzqxOO9iCi+ZTUN5z1FUVEZi3cOFtqf1vqFlt6iFQiN5l7lLJXwTVXlnItJC0oTxWIRy8kqAiPqpKmUx9hi/r6NxUbzRClBSYnWilYrpdPpsLrSZ3NzkyNHNlgbpBzvHVZQh/GLj8Ob6jB+ZXHx5thPxjnvXLzCbJozGs0YT/MI1Q6Lshcar/QSGk/IZYBCqGA8yFipxKSllEJLhYytwwbg4eW8SpAeJULySmr9QlG3KjVSBRSel3OUYlCdlxF+T2O+eFCwVoigqJ6ky6TeQIoNGaNui1rjm6qnTmShjedIWz0qE1B5xoWfWWujjp7Hete0LgOMPs6Y4u9mpgitvbryQzaKEc5BWQQIetMGjCr4IiYr6/KmFRjoCCCloN1KQ4JqpaytrXDi+DGOHNnk1CHU/DB+BXF4kx3GryW2J97v7gSe1N7ePsPRhPF4zKywWBcW4MW5VY0EjIp9DcdLyCAc5IVHCYWM86Y5AjEkkDnxWCC8bxJbI3grabhgtXBv3ToMXwVyaYY2f94aBBLU5+cE5MX2nPeLSSkmKls/Vi1UYJ7KepwXCz8Lc6XaNdeYIPDrbK2XSFNBWTxSKypbBUsOZ8GBdS6oUDjw1i0kL7dQ+Qm8rxAELlwiQ/XU7mT0ux02NoJw7ZEjq2weAiQO41cc+qc/5DAO4xcfGwcWuys7hd/b22M4mnFze49pXkR+1CyAA2QEQkiBcCJ04YSMAqwShET4AM5IsmSOMpRzdJ7zAmcdqU5w1BVKnXAI1hoiyB15wodDIJEiJqf4VSEJCn4RNNE4eonQp8QG+PoiECHkDAJt2uNF+M/5en4EzgmsD+aRXng8Hh8cD+NsCTwVxjtA4KTEB5OswL9SQaHeGAMelFARLOLi8wHSU5ZlbK3WGwGHUi6AYGTKaq9Np9tmbWWVtbUVBis9jq+qw+R0GL/WOExWh/EbESfXs2Yx3J54n5eG0WjEaDRiPJoyHI4ZjifkeYlOdawGKryTOKEimlAgdEYV23jCKpQIQAopBEIKRPTICgjCMBPyQuAQSAE+yMCGN+LrJBISkfVBsFeq/397d7TTRgxEAfSO7d0sgTZUQULq//9cpRIVIZJsdu3pw4ydTdoPCHCPhFAeCDwEjeyduWNNB1aM7D1txkosK8+ypiCIPnqlQCgAIrQUFLX0eAAokvxkKIAWiGRAZytosOKmnveHYL/XZr7sfdpzKRUbRC6CFBKQFVkzSrYvKTOgGQEZd4MPK6sipoBhGPD4+IjtdovNt3us+wF9CthuWKDodrBY0c25PnXt3rMeDiPe9yPG44Tdn1dMpxnjONm6kdPsDQYTUE6IfWdFRzxpPHiGYbTrvHk+XTRPWIRQtJgn8bDVOisFP1FB/CQCj0JSD2YFgr9uXSB+MlOxAmKFpJ6MBBKiFaa6y6r4MkJPTFfpAC9I9cqwXSUK0He2ybeuTVHNtu/Qy1uZZ4gWBAFWfUCShJTurHsyij13ure1Hw8P9xhWHbZrFia6bfyA0of08qY6jhmH4wn7vaVUjMcJU56xnw7IUJyHdRfrQeScsHE9UNyFaFeGPpMURBFiRPRmDStW57b0+jwrSWiDyyriJyv1k5kP3mqBZnv2JIh2lZeLf7cGh+KFqa5OqXNerVj5Hq7j4eTDvee8w3btqcC6j4gBlg246nE39G3wOKWAn08D/+/pw+GHlj6NlzfVUgreD0fMJVvihH8tZ5QuVnRg0SLvB7ok9swrWjVCrPNZ3kyRwvJn/p0Ls7glD7hdFCt4saodfZqLNU4Ue20NF4IyF08sL+3nl39f9iWKLVOxW6HrOnRdhxAKvj+sEKJilTpsN9z/RJ8DP8j0Zexej1pULIEC6sOy+WIAF7CuwGvWNWj7rWpxAtC6Bi+KXTgnYgBomXx11fw4T60bryWwwx97ZVgDCSy1vXZCLovler1uQ82SIp5/8AqPPj9+yImu/Pr92u4NWwSTWCLE/9YM1/mvWngiYr0FxPJ96vdivRRtSeKy+KEonp+4x4mIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIjoi/kLhnJTsf6RAkcAAAAASUVORK5CYII="
-             style="width:88px;height:88px;object-fit:contain;
-                    border-radius:50%;display:block;margin:0 auto 6px;
-                    filter:drop-shadow(0 3px 12px {c['card_shadow']});">
+        {logo}
     </div>
     """, unsafe_allow_html=True)
     st.markdown(
@@ -210,12 +275,11 @@ with st.sidebar:
     if not DF_PLANTAS.empty and 'ID' in DF_PLANTAS.columns:
         st.markdown(f"<div style='font-size:0.75rem;color:{c['subtext']};font-weight:600;padding:8px 0 4px;'>📍 PLANTAS</div>",
                     unsafe_allow_html=True)
-        f_count = DF_FALLAS.groupby('Planta_ID').size().to_dict() \
-                  if not DF_FALLAS.empty else {}
+        contadores = contadores_fallas()
 
         for pid, pnombre in zip(DF_PLANTAS['ID'].astype(str),
                                 DF_PLANTAS['Nombre'].astype(str)):
-            n_fallas  = f_count.get(pid, 0)
+            n_fallas  = contadores.total(pid)
             is_active = str(st.session_state.planta_id_sel) == pid
             label     = f"{'▶ ' if is_active else '  '}🌱 {pnombre}"
             if n_fallas > 0:
@@ -239,14 +303,26 @@ with st.sidebar:
                      type="primary" if pagina_act == 'gestion' else "secondary"):
             st.session_state.pagina = 'gestion'
             st.rerun()
+        if st.button("⏱️ Rendimiento", width='stretch',
+                     type="primary" if pagina_act == 'rendimiento' else "secondary"):
+            st.session_state.pagina = 'rendimiento'
+            st.rerun()
         st.divider()
 
     # ── Sincronizar ───────────────────────────────────────────
     if st.button("🔄 Sincronizar datos", width='stretch'):
         with st.spinner("Actualizando..."):
             _cargar_datos(limpiar_cache=True)
-        st.toast("✅ Datos actualizados")
+        st.toast("🔄 Sincronizando — las tablas se actualizan a medida que llegan")
         st.rerun()
+    _carga = st.session_state.get('_carga')
+    if _carga is not None and _carga.hay_listos():
+        st.rerun()    # llegó una tabla mientras se dibujaba esta pasada
+    elif _carga is not None and _carga.pendientes():
+        _estado_carga()
+    elif _carga is not None and any(e['estado'] == 'fallida' for e in _carga.resumen().values()):
+        fallidas = [NOMBRES_TABLA[k] for k, e in _carga.resumen().items() if e['estado'] == 'fallida']
+        st.warning(f"No se pudo cargar: {', '.join(fallidas)}. Se muestran los últimos datos disponibles.")
 
     st.markdown(f"<div style='font-size:0.68rem;color:{c['subtext']};text-align:center;padding-top:4px;'>Cache: 5 min · Sheets: auto-refresh</div>",
                 unsafe_allow_html=True)
@@ -265,8 +341,13 @@ with st.sidebar:
     if st.button('🚪 Cerrar sesión', width='stretch'):
         for k in ['autenticado', 'usuario', 'datos_cargados']:
             st.session_state[k] = False if k != 'usuario' else {}
+        olvidar_acceso()
+        st.session_state.pop('_carga', None)
         st.rerun()
 
+    if modo_perfil():
+        panel_importes()
+
 
 # ══════════════════════════════════════════════════════════════
 # ROUTER PRINCIPAL
@@ -278,7 +359,7 @@ if pagina == 'global':
     if rol == 'lector':
         global_view.render_kpis(DF_PLANTAS, DF_FALLAS, DF_MED)
     else:
-        global_view.render(DF_PLANTAS, DF_FALLAS, DF_MED, DF_TEC)
+        global_view.render(DF_PLANTAS, DF_FALLAS, DF_MED, DF_TEC, DF_CONFIG)
 
 elif pagina == 'planta' and st.session_state.planta_id_sel:
     # Importamos la función render DIRECTAMENTE
@@ -311,6 +392,13 @@ elif pagina == 'gestion':
     else:
         st.error('🚫 Solo administradores pueden acceder a Gestión de Plantas.')
 
+elif pagina == 'rendimiento':
+    if puede('admin'):
+        from vistas.admin import rendimiento
+        rendimiento.render()
+    else:
+        st.error('🚫 Solo administradores pueden ver el rendimiento.')
+
 elif pagina == 'cambiar_pass':
     # Inline — función corta, no justifica archivo separado
     from ms_data.sheets import actualizar_password, _hash_password
@@ -321,8 +409,13 @@ elif pagina == 'cambiar_pass':
         nueva    = st.text_input("Nueva contraseña", type="password")
         confirma = st.text_input("Confirmar nueva contraseña", type="password")
         if st.form_submit_button("Guardar", type="primary"):
-            from ms_data.sheets import _verificar_password
-            if not _verificar_password(actual, usr.get('password_hash', '')):
+            try:
+                valida, sin_conexion = _autenticar(usr.get('email', ''), actual), False
+            except Exception:
+                valida, sin_conexion = None, True
+            if sin_conexion:
+                st.error("🌐 No se pudo consultar Google Sheets. Intenta nuevamente.")
+            elif not valida:
                 st.error("❌ Contraseña actual incorrecta.")
             elif len(nueva) < 6:
                 st.warning("La contraseña debe tener al menos 6 caracteres.")
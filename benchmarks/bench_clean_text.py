@@ -0,0 +1,71 @@
+"""
+benchmarks/bench_clean_text.py
+══════════════════════════════════════════════════════════════
+Micro-benchmark de ms_data.analysis.clean_text.
+
+Compara la versión anterior (dict de str.replace + latin-1) con la
+actual (str.translate + lru_cache) sobre un corpus típico de informe:
+etiquetas repetidas (CB, diagnósticos, causas) y notas únicas.
+
+    python benchmarks/bench_clean_text.py [--n 200000]
+══════════════════════════════════════════════════════════════
+"""
+import os
+import sys
+import random
+import argparse
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ms_data.analysis import clean_text, _clean_text_str
+
+
+def clean_text_legacy(t):
+    if not isinstance(t, str): t = str(t)
+    reemplazos = {'•':'-','—':'-','–':'-','"':'"','“':'"','”':'"','‘':'"','’':'"',
+                  '⚡':'','☀':'','🔴':'R','🟡':'A','🟢':'N','›':'>','≥':'>=','≤':'<=','±':'+/-'}
+    for k, v in reemplazos.items():
+        t = t.replace(k, v)
+    return t.encode('latin-1','replace').decode('latin-1')
+
+
+def corpus(n, seed=0):
+    rng = random.Random(seed)
+    repetidos = ([f"Inv-{i//10+1}>CB-{i}" for i in range(1, 121)] +
+                 ['NORMAL', 'ALERTA', 'CRÍTICO', 'OC (0A)', 'Crítico (-15% a -30%)',
+                  'Modulo defectuoso / conector MC4 danado o bypass activado',
+                  'Inspeccion + limpieza + revision conectores', '±5% — “ok”', '⚡ Restricción ≥ 80%'])
+    unicos = [f"Nota {i} — cambio fusible “{rng.randint(0, 9999)}” ±{rng.random():.2f}" for i in range(n // 10)]
+    return [rng.choice(repetidos) for _ in range(n - len(unicos))] + unicos + [3.14, 42, None]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--n', type=int, default=200_000)
+    ap.add_argument('--repeat', type=int, default=5)
+    args = ap.parse_args()
+
+    datos = corpus(args.n)
+    assert all(clean_text(t) == clean_text_legacy(t) for t in datos), "salida distinta a la versión anterior"
+
+    def _nuevo_frio():
+        _clean_text_str.cache_clear()
+        for t in datos: clean_text(t)
+
+    casos = {
+        'legacy (replace x17)':  lambda: [clean_text_legacy(t) for t in datos],
+        'translate + lru (frío)': _nuevo_frio,
+        'translate + lru (tibio)': lambda: [clean_text(t) for t in datos],
+    }
+    print(f"clean_text sobre {len(datos):,} textos (mejor de {args.repeat})")
+    base = None
+    for nombre, fn in casos.items():
+        t = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        base = base or t
+        print(f"  {nombre:<26} {t*1000:8.1f} ms   x{base/t:5.1f}")
+    print(f"  cache: {_clean_text_str.cache_info()}")
+
+
+if __name__ == '__main__':
+    main()
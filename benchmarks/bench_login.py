@@ -0,0 +1,83 @@
+"""
+benchmarks/bench_login.py
+══════════════════════════════════════════════════════════════
+Costo de un login contra una hoja Usuarios de N filas (backend
+ms_data.gspread_falso, cache en memoria ya caliente):
+
+- anterior: filtro str.lower() sobre el DataFrame + SHA-256 sin sal;
+- índice:   solo el lookup en indice_usuarios();
+- pbkdf2:   _autenticar completo con distintos costos de KDF.
+
+    python benchmarks/bench_login.py --usuarios 5000 --iteraciones 100000,600000
+══════════════════════════════════════════════════════════════
+"""
+import os
+import sys
+import time
+import hashlib
+import argparse
+import statistics
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import pandas as pd
+
+from ms_data import claves
+from ms_data.runtime import configurar_cache
+from ms_data.sheets import _autenticar, cargar_usuarios, indice_usuarios
+from ms_data.gspread_falso import ClienteFalso, hoja_desde_df, instalar
+
+PASSWORD = 'bench-123'
+
+
+def _login_anterior(email, password):
+    df = cargar_usuarios()
+    row = df[df['Email'].str.lower() == email.strip().lower()]
+    if row.empty:
+        return None
+    row = row.iloc[0]
+    return hashlib.sha256(password.strip().encode()).hexdigest() == str(row['Password_Hash']).strip()
+
+
+def _medir(fn, repeat):
+    t = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        t.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(t)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--usuarios', type=int, default=2000)
+    ap.add_argument('--iteraciones', default='10000,100000,600000')
+    ap.add_argument('--repeat', type=int, default=5)
+    args = ap.parse_args()
+
+    configurar_cache('memoria')
+    n = args.usuarios
+    emails = [f"usuario{i}@mundosolar.cl" for i in range(n)]
+    legado = hashlib.sha256(PASSWORD.encode()).hexdigest()
+    df = pd.DataFrame({'ID': [f"US-{i:05d}" for i in range(n)], 'Email': emails,
+                       'Nombre': 'Bench', 'Rol': 'tecnico', 'Password_Hash': legado, 'Activo': 'SI'})
+    cols = ['ID', 'Email', 'Nombre', 'Rol', 'Password_Hash', 'Activo']
+    instalar(ClienteFalso({'Usuarios': hoja_desde_df(df, cols)}))
+    objetivo = emails[-1]
+    cargar_usuarios(), indice_usuarios()   # cache caliente: se mide solo el login
+
+    print(f"Usuarios: {n:,} filas · mediana de {args.repeat} logins (ms)")
+    print(f"  {'anterior (DataFrame + sha256)':<34}{_medir(lambda: _login_anterior(objetivo, PASSWORD), args.repeat):>10.2f}")
+    print(f"  {'índice (solo lookup)':<34}{_medir(lambda: indice_usuarios().get(objetivo), args.repeat):>10.4f}")
+    for it in (int(x) for x in args.iteraciones.split(',')):
+        claves.configurar_kdf(it)
+        h = claves.hash_password(PASSWORD)
+        # Fila ya migrada a este costo: _autenticar = lookup + una derivación
+        indice_usuarios()[objetivo]['Password_Hash'] = h
+        ms = _medir(lambda: _autenticar(objetivo, PASSWORD), args.repeat)
+        print(f"  {f'pbkdf2_sha256 {it:,} it.':<34}{ms:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
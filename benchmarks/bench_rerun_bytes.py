@@ -0,0 +1,65 @@
+"""
+benchmarks/bench_rerun_bytes.py
+══════════════════════════════════════════════════════════════
+Bytes de elementos que app.py envía al navegador en cada rerun.
+
+Ejecuta la página de login con streamlit.testing (AppTest) dos veces:
+static serving apagado (logo como data URI base64, igual que el
+app.py anterior) y encendido (URL app/static/logo.png?v=...). Suma el
+tamaño serializado de cada elemento del árbol, que es lo que viaja
+por el websocket en cada rerun de cada sesión.
+
+    python benchmarks/bench_rerun_bytes.py [--reruns 3]
+══════════════════════════════════════════════════════════════
+"""
+import os
+import sys
+import argparse
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from streamlit import config
+from streamlit.testing.v1 import AppTest
+
+
+def _bytes_arbol(nodo) -> int:
+    total = 0
+    proto = getattr(nodo, 'proto', None)
+    if proto is not None and hasattr(proto, 'SerializeToString'):
+        total += len(proto.SerializeToString())
+    for hijo in getattr(nodo, 'children', {}).values():
+        total += _bytes_arbol(hijo)
+    return total
+
+
+def medir(static: bool, reruns: int) -> list:
+    config.set_option('server.enableStaticServing', static)
+    at = AppTest.from_file(os.path.join(RAIZ, 'app.py'), default_timeout=60)
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    tamanos = [_bytes_arbol(at._tree)]
+    for _ in range(reruns - 1):
+        at.run()
+        tamanos.append(_bytes_arbol(at._tree))
+    return tamanos
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--reruns', type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"app.py: {os.path.getsize(os.path.join(RAIZ, 'app.py')) / 1024:,.1f} KB en disco")
+    print(f"{'modo':<28}{'bytes/rerun':>14}")
+    res = {}
+    for nombre, static in (('data URI (sin static)', False), ('static/ versionado', True)):
+        res[nombre] = medir(static, args.reruns)
+        print(f"{nombre:<28}{max(res[nombre]):>14,}")
+    antes, despues = (max(v) for v in res.values())
+    print(f"ahorro por rerun: {antes - despues:,} bytes ({antes / max(despues, 1):.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,244 @@
+"""
+benchmarks/carga_apptest.py
+══════════════════════════════════════════════════════════════
+Prueba de carga multi-sesión de app.py sin Google Sheets real.
+
+Instala ms_data.gspread_falso con los datos de benchmarks/sintetico.py
+(latencia y 429 configurables) y lanza N sesiones de
+streamlit.testing (AppTest) en hilos. Cada sesión recorre el camino
+típico — login, vista global, abrir una planta, pasar por sus
+pestañas, volver — y se mide la latencia de cada rerun y la memoria
+del proceso (RSS y, con --tracemalloc, el pico de asignaciones).
+El login mide hasta las tablas críticas; 'datos_completos', hasta que
+la carga progresiva aplicó todas las hojas. 'criticas_backend' es lo
+que tardaron Plantas y Usuarios desde el arranque de la carga: si pasa
+de --max-rtt-criticas idas y vueltas al backend, la sesión cuenta como
+error (las críticas quedaron detrás de las demás tablas).
+
+    python benchmarks/carga_apptest.py --sesiones 8 --latencia-ms 150
+    python benchmarks/carga_apptest.py --escala m --prob-429 0.05 --limite-min 300
+    python benchmarks/carga_apptest.py --hoja-lenta Mediciones=3000 --fallos-hoja Fallas=2
+══════════════════════════════════════════════════════════════
+"""
+import os
+import ast
+import sys
+import time
+import argparse
+import resource
+import statistics
+import threading
+import tracemalloc
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+from ms_data import cuota
+from ms_data.sheets import _hash_password
+from ms_data.gspread_falso import ClienteFalso, Perfil, hoja_desde_df, instalar
+from sintetico import ESCALAS, escala
+
+# AppTest compila app.py en cada run; ast.parse no es seguro entre hilos en
+# CPython < 3.11.9 / 3.12.1 ("AST constructor recursion depth mismatch", gh-106905)
+_ast_parse, _ast_lock = ast.parse, threading.Lock()
+
+
+def _parse_serializado(*args, **kwargs):
+    with _ast_lock:
+        return _ast_parse(*args, **kwargs)
+
+
+ast.parse = _parse_serializado
+
+PASSWORD = 'carga-123'
+SECCIONES = ['campana', 'fusibles', 'diagnostico', 'resumen']
+
+COLUMNAS = {
+    'Plantas':        ['ID', 'Nombre', 'Ubicacion', 'Potencia_MW', 'Tecnologia',
+                       'Direccion', 'Estado', 'Fecha_Registro', 'Observaciones'],
+    'Plantas_Config': ['Planta_ID', 'Planta_Nombre', 'Modulo', 'Pmax_W', 'Isc_STC_A',
+                       'Impp_STC_A', 'Panels_por_String', 'Umbral_Alerta_pct',
+                       'Umbral_Critico_pct', 'Capacidad', 'Actualizado', 'Num_Inversores'],
+    'Tecnicos':       ['ID', 'Nombre', 'Rut', 'Email', 'Telefono', 'Especialidad',
+                       'Fecha_Registro', 'Activo'],
+    'Asignaciones':   ['ID', 'Planta_ID', 'Planta_Nombre', 'Tecnico_ID',
+                       'Tecnico_Nombre', 'Fecha_Asignacion', 'Rol'],
+    'Fallas':         ['ID', 'Fecha', 'Planta_ID', 'Planta_Nombre', 'Tecnico_ID',
+                       'Inversor', 'Caja', 'String', 'Polaridad', 'Amperios',
+                       'Irradiancia_Wm2', 'Nota'],
+    'Mediciones':     ['ID', 'Fecha', 'Planta_ID', 'Planta_Nombre', 'Tecnico_ID',
+                       'Equipo', 'String_ID', 'Amperios', 'Irradiancia_Wm2', 'Restriccion_MW'],
+    'Usuarios':       ['ID', 'Email', 'Nombre', 'Rol', 'Password_Hash', 'Activo', 'Plantas'],
+}
+
+
+def cliente_sintetico(nombre_escala: str, sesiones: int, perfil: Perfil) -> tuple:
+    """(ClienteFalso con las hojas de la escala y un admin por sesión, ID de la primera planta)."""
+    d = escala(nombre_escala)
+    usuarios = pd.DataFrame({
+        'ID':    [f"US-{i:03d}" for i in range(sesiones)],
+        'Email': [f"carga{i}@mundosolar.cl" for i in range(sesiones)],
+        'Nombre': [f"Carga {i}" for i in range(sesiones)],
+        'Rol': 'admin', 'Password_Hash': _hash_password(PASSWORD), 'Activo': 'SI',
+    })
+    dfs = {
+        'Plantas':        d['df_plantas'],
+        'Plantas_Config': d['df_config'].assign(Capacidad='3 MW'),
+        'Tecnicos':       pd.DataFrame({'ID': ['TEC-001'], 'Nombre': ['Técnico Carga'], 'Activo': ['SI']}),
+        'Asignaciones':   pd.DataFrame(),
+        'Fallas':         d['df_fallas'],
+        'Mediciones':     d['df_mediciones'].rename(columns={'String ID': 'String_ID'}),
+        'Usuarios':       usuarios,
+    }
+    hojas = {n: hoja_desde_df(df, COLUMNAS[n]) for n, df in dfs.items()}
+    return ClienteFalso(hojas, perfil), d['df_plantas']['ID'].iloc[0]
+
+
+def _rss_mb() -> float:
+    try:
+        with open('/proc/self/status') as f:
+            for linea in f:
+                if linea.startswith('VmRSS:'):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Sesion(threading.Thread):
+    """Un usuario: recorre las páginas y anota (paso, ms) por rerun."""
+
+    def __init__(self, i: int, planta_id: str, timeout: float, max_criticas_ms: float = None):
+        super().__init__(name=f"sesion-{i}", daemon=True)
+        self.i, self.pid, self.timeout = i, planta_id, timeout
+        self.max_criticas_ms = max_criticas_ms
+        self.tiempos, self.errores = [], []
+
+    def _paso(self, nombre, accion):
+        t0 = time.perf_counter()
+        accion()
+        self.tiempos.append((nombre, (time.perf_counter() - t0) * 1000))
+        if self.at.exception:
+            self.errores.append((nombre, self.at.exception[0].message))
+
+    def _medir_criticas(self):
+        carga = self.at.session_state['_carga'] if '_carga' in self.at.session_state else None
+        if carga is None:
+            return
+        ms = max((e['listo_ms'] or 0) for k, e in carga.resumen().items() if k in carga.prioritarias)
+        self.tiempos.append(('criticas_backend', ms))
+        if self.max_criticas_ms and ms > self.max_criticas_ms:
+            self.errores.append(('criticas_backend', f"{ms:.0f} ms > {self.max_criticas_ms:.0f} ms"))
+
+    def _esperar_datos(self, t0):
+        """Reruns (como el fragmento de estado) hasta que no queden tablas en carga."""
+        limite = time.monotonic() + self.timeout
+        while time.monotonic() < limite:
+            carga = self.at.session_state['_carga'] if '_carga' in self.at.session_state else None
+            if carga is None or not (carga.pendientes() or carga.hay_listos()):
+                break
+            time.sleep(0.2)
+            self.at.run()
+        self.tiempos.append(('datos_completos', (time.perf_counter() - t0) * 1000))
+
+    def run(self):
+        try:
+            self.at = at = AppTest.from_file(os.path.join(RAIZ, 'app.py'), default_timeout=self.timeout)
+            self._paso('login_pantalla', at.run)
+            at.text_input(key='login_email').set_value(f"carga{self.i}@mundosolar.cl")
+            at.text_input(key='login_pass').set_value(PASSWORD)
+            boton = next(b for b in at.button if b.label.startswith('Ingresar'))
+            t_login = time.perf_counter()
+            self._paso('login+criticas', boton.click().run)
+            self._medir_criticas()
+            self._esperar_datos(t_login)
+            self._paso('global_rerun', at.run)
+            self._paso('abrir_planta', at.button(key=f"sb_planta_{self.pid}").click().run)
+            for sec in SECCIONES:
+                self._paso(f"tab_{sec}", at.radio(key=f"seccion_planta_{self.pid}").set_value(sec).run)
+            volver = next(b for b in at.sidebar.button if 'Vista Global' in b.label)
+            self._paso('volver_global', volver.click().run)
+        except Exception as e:
+            self.errores.append(('excepcion', repr(e)))
+
+
+def _tabla(tiempos: list):
+    por_paso = {}
+    for paso, ms in tiempos:
+        por_paso.setdefault(paso, []).append(ms)
+    print(f"\n  {'paso':<22}{'n':>4}{'p50 ms':>10}{'p95 ms':>10}{'máx ms':>10}")
+    for paso, ms in por_paso.items():
+        ms = sorted(ms)
+        p95 = ms[min(len(ms) - 1, int(round(0.95 * (len(ms) - 1))))]
+        print(f"  {paso:<22}{len(ms):>4}{statistics.median(ms):>10.0f}{p95:>10.0f}{ms[-1]:>10.0f}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--sesiones', type=int, default=4)
+    ap.add_argument('--escala', default='s', choices=list(ESCALAS))
+    ap.add_argument('--latencia-ms', type=float, default=100.0)
+    ap.add_argument('--latencia-escritura-ms', type=float, default=None)
+    ap.add_argument('--prob-429', type=float, default=0.0)
+    ap.add_argument('--limite-min', type=int, default=None, help='429 del servidor sobre N llamadas/min')
+    ap.add_argument('--lecturas-min', type=int, default=None, help='ventana de lectura de ms_data.cuota (def. el configurado)')
+    ap.add_argument('--escalonado-s', type=float, default=0.5, help='separación entre arranques de sesión')
+    ap.add_argument('--hoja-lenta', action='append', default=[], metavar='HOJA=MS',
+                    help='latencia propia de una hoja (repetible)')
+    ap.add_argument('--fallos-hoja', action='append', default=[], metavar='HOJA=N',
+                    help='errores 500 de una hoja antes de responder (repetible)')
+    ap.add_argument('--max-rtt-criticas', type=float, default=3.0,
+                    help='idas y vueltas al backend admitidas para Plantas+Usuarios (0 = sin chequeo)')
+    ap.add_argument('--timeout', type=float, default=180.0)
+    ap.add_argument('--tracemalloc', action='store_true')
+    args = ap.parse_args()
+
+    perfil = Perfil(latencia_ms=args.latencia_ms, latencia_escritura_ms=args.latencia_escritura_ms,
+                    prob_429=args.prob_429, limite_min=args.limite_min,
+                    latencia_hoja_ms={h: float(v) for h, v in (x.split('=') for x in args.hoja_lenta)},
+                    fallos_hoja={h: int(v) for h, v in (x.split('=') for x in args.fallos_hoja)})
+    cliente, planta_id = cliente_sintetico(args.escala, args.sesiones, perfil)
+    instalar(cliente)
+    cuota.configurar_cuota(lecturas_min=args.lecturas_min)
+    cuota.reiniciar_conteo()
+
+    if args.tracemalloc:
+        tracemalloc.start()
+    rss0 = _rss_mb()
+    t0 = time.perf_counter()
+    # Margen: jitter del perfil + 150 ms de arranque de hilos y parseo
+    max_criticas = (args.max_rtt_criticas * args.latencia_ms * (1 + perfil.jitter) + 150
+                    if args.max_rtt_criticas and args.latencia_ms else None)
+    sesiones = [Sesion(i, planta_id, args.timeout, max_criticas) for i in range(args.sesiones)]
+    for s in sesiones:
+        s.start()
+        time.sleep(args.escalonado_s)
+    for s in sesiones:
+        s.join()
+    total = time.perf_counter() - t0
+
+    print(f"escala {args.escala} · {args.sesiones} sesiones · latencia {args.latencia_ms:.0f} ms · "
+          f"prob_429 {args.prob_429} · límite/min {args.limite_min} · cuota {cuota.LECTURAS_MIN} lect/min")
+    _tabla([t for s in sesiones for t in s.tiempos])
+
+    u = cuota.uso_cuota()
+    print(f"\n  duración total         {total:,.1f} s")
+    print(f"  RSS                    {rss0:,.0f} → {_rss_mb():,.0f} MB")
+    if args.tracemalloc:
+        _, pico = tracemalloc.get_traced_memory()
+        print(f"  pico tracemalloc       {pico / 2**20:,.0f} MB")
+    print(f"  llamadas al backend    {cliente.servidor.llamadas:,} ({cliente.servidor.errores_429} respondidas con 429)")
+    print(f"  reintentos 429         {u['reintentos_429']} ({u['agotadas']} agotadas) · espera por cuota {u['espera_s']:.1f} s")
+
+    errores = [(s.name, *e) for s in sesiones for e in s.errores]
+    for nombre, paso, msg in errores[:10]:
+        print(f"  ✗ {nombre} {paso}: {msg[:160]}")
+    sys.exit(1 if errores else 0)
+
+
+if __name__ == '__main__':
+    main()
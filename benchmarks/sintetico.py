@@ -0,0 +1,109 @@
+"""
+benchmarks/sintetico.py
+══════════════════════════════════════════════════════════════
+Generador de datos sintéticos con el mismo esquema que devuelven los
+cargar_* de ms_data/sheets.py (tipos ya convertidos): plantas, config,
+mediciones por campaña mensual (inversor > caja > string) y fallas de
+fusibles. Vectorizado con numpy para llegar a millones de filas.
+
+Escalas (strings por planta ≈ cajas × strings_por_caja):
+    xs  1 planta  · 1 008 strings · 1 campaña
+    s   1 planta  · 1 008 strings · 12 campañas (1 año)
+    m   10 plantas · 1 008 strings · 24 campañas (2 años)
+    l   50 plantas · 1 008 strings · 60 campañas (5 años, ~3 M lecturas)
+══════════════════════════════════════════════════════════════
+"""
+import numpy as np
+import pandas as pd
+
+ESCALAS = {
+    'xs': dict(plantas=1,  cajas=84, strings_por_caja=12, campanas=1),
+    's':  dict(plantas=1,  cajas=84, strings_por_caja=12, campanas=12),
+    'm':  dict(plantas=10, cajas=84, strings_por_caja=12, campanas=24),
+    'l':  dict(plantas=50, cajas=84, strings_por_caja=12, campanas=60),
+}
+
+CAJAS_POR_INVERSOR = 12
+FECHA_INICIO       = pd.Timestamp('2021-01-05')
+ISC_STC            = 9.07
+
+
+def generar(plantas=1, cajas=84, strings_por_caja=12, campanas=1,
+            fallas_por_planta_mes=10, seed=0) -> dict:
+    """dict con df_plantas, df_config, df_mediciones y df_fallas."""
+    rng = np.random.default_rng(seed)
+    pids    = [f"PL-{i:03d}" for i in range(1, plantas + 1)]
+    nombres = [f"Planta Sintética {i}" for i in range(1, plantas + 1)]
+
+    df_plantas = pd.DataFrame({
+        'ID': pids, 'Nombre': nombres, 'Ubicacion': 'Región Sintética',
+        'Potencia_MW': 3.0, 'Tecnologia': 'Mono PERC', 'Estado': 'Operativa',
+    })
+    df_config = pd.DataFrame({
+        'Planta_ID': pids, 'Planta_Nombre': nombres, 'Modulo': 'SIM-450',
+        'Pmax_W': 450.0, 'Isc_STC_A': ISC_STC, 'Impp_STC_A': 8.68,
+        'Panels_por_String': 30.0, 'Umbral_Alerta_pct': -5.0, 'Umbral_Critico_pct': -10.0,
+        'Capacidad': '3 MW', 'Capacidad_MW': 3.0, 'Num_Inversores': float(-(-cajas // CAJAS_POR_INVERSOR)),
+    })
+
+    # ── Mediciones: producto planta × campaña × caja × string ──
+    n_str = cajas * strings_por_caja
+    n = plantas * campanas * n_str
+    i_planta  = np.repeat(np.arange(plantas), campanas * n_str)
+    i_campana = np.tile(np.repeat(np.arange(campanas), n_str), plantas)
+    i_caja    = np.tile(np.repeat(np.arange(cajas), strings_por_caja), plantas * campanas)
+    i_string  = np.tile(np.arange(strings_por_caja), plantas * campanas * cajas)
+
+    fechas = FECHA_INICIO + pd.to_timedelta(30 * np.arange(campanas), unit='D')
+    irr = rng.uniform(650, 950, size=plantas * campanas)        # una irradiancia por campaña
+    irr_fila = irr[i_planta * campanas + i_campana]
+    # Degradación lenta (~0.5 %/año) + ruido + strings débiles y abiertos
+    base = ISC_STC * irr_fila / 1000 * (1 - 0.005 * i_campana / 12)
+    amp = base * rng.normal(1.0, 0.03, size=n)
+    debil = rng.random(n) < 0.06
+    amp[debil] *= rng.uniform(0.7, 0.93, size=debil.sum())
+    amp[rng.random(n) < 0.01] = 0.0
+
+    cajas_lbl   = np.array([f"Inv-{c // CAJAS_POR_INVERSOR + 1}>CB-{c + 1}" for c in range(cajas)], dtype=object)
+    strings_lbl = np.array([f"Str-{s + 1}" for s in range(strings_por_caja)], dtype=object)
+    df_med = pd.DataFrame({
+        'ID':              np.char.add('ME-', np.arange(n).astype(str)).astype(object),
+        'Fecha':           fechas.values[i_campana],
+        'Planta_ID':       np.array(pids, dtype=object)[i_planta],
+        'Planta_Nombre':   np.array(nombres, dtype=object)[i_planta],
+        'Tecnico_ID':      'TEC-001',
+        'Equipo':          cajas_lbl[i_caja],
+        'String ID':       strings_lbl[i_string],
+        'Amperios':        amp.round(2),
+        'Irradiancia_Wm2': irr_fila.round(0),
+        'Restriccion_MW':  0.0,
+    })
+
+    # ── Fallas de fusibles: repartidas en el período, con reincidencia ──
+    n_f = plantas * campanas * fallas_por_planta_mes
+    f_planta = rng.integers(0, plantas, size=n_f)
+    f_caja   = rng.integers(0, cajas, size=n_f)
+    # 30 % de las fallas repiten un string "problemático" para que haya recurrencia
+    f_string = np.where(rng.random(n_f) < 0.3, 0, rng.integers(0, strings_por_caja, size=n_f))
+    dias     = rng.integers(0, max(30 * campanas, 1), size=n_f)
+    df_fallas = pd.DataFrame({
+        'ID':              np.char.add('FA-', np.arange(n_f).astype(str)).astype(object),
+        'Fecha':           FECHA_INICIO + pd.to_timedelta(dias, unit='D'),
+        'Planta_ID':       np.array(pids, dtype=object)[f_planta],
+        'Planta_Nombre':   np.array(nombres, dtype=object)[f_planta],
+        'Tecnico_ID':      'TEC-001',
+        'Inversor':        [f"Inv-{c // CAJAS_POR_INVERSOR + 1}" for c in f_caja],
+        'Caja':            [f"CB-{c + 1}" for c in f_caja],
+        'String':          strings_lbl[f_string],
+        'Polaridad':       rng.choice(['Positivo (+)', 'Negativo (-)'], size=n_f),
+        'Amperios':        rng.choice([0.0, 2.5, 3.8, 6.2, 8.1], size=n_f),
+        'Irradiancia_Wm2': rng.choice([0.0, 720.0, 850.0], size=n_f),
+        'Nota':            rng.choice(['', 'Cambio de fusible', 'Revisar conector MC4 — “quemado”'], size=n_f),
+    }).sort_values('Fecha', kind='stable').reset_index(drop=True)
+
+    return {'df_plantas': df_plantas, 'df_config': df_config,
+            'df_mediciones': df_med, 'df_fallas': df_fallas}
+
+
+def escala(nombre: str, seed=0) -> dict:
+    return generar(**ESCALAS[nombre], seed=seed)
@@ -0,0 +1,170 @@
+"""
+benchmarks/suite.py
+══════════════════════════════════════════════════════════════
+Suite offline de rendimiento: datos de benchmarks/sintetico.py, sin
+credenciales de Google ni Streamlit corriendo (cache en modo 'ninguno'
+para medir el cómputo real, no el hit de cache).
+
+Casos por escala: analizar_mediciones, calcular_degradacion,
+calcular_reincidencia, _calcular_recurrencia_df, grilla del heatmap,
+filtro de período y todos los generadores PDF/Excel/CSV.
+
+    python benchmarks/suite.py                      # escalas xs,s,m
+    python benchmarks/suite.py --escalas xs,s,m,l --repeat 5
+    python benchmarks/suite.py --comparar benchmarks/resultados/base.json
+
+Escribe benchmarks/resultados/<fecha>_<commit>.json (o --salida) para
+comparar entre commits; --comparar marca regresiones sobre --umbral.
+══════════════════════════════════════════════════════════════
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import platform
+import datetime
+import subprocess
+import statistics
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+
+from ms_data.runtime import configurar_cache
+from ms_data.analysis import analizar_mediciones, calcular_degradacion, calcular_reincidencia
+from ms_data.exports import (
+    generar_pdf_fallas, generar_pdf_mediciones, generar_excel_fallas, generar_excel_mediciones,
+    generar_csv_fallas, generar_csv_fuera_rango, _calcular_recurrencia_df,
+)
+from components.filters import _ordenar_por_fecha, _rebanar_fechas
+from vistas.planta import _grilla_heatmap
+from sintetico import ESCALAS, escala
+
+DIR_RESULTADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resultados')
+
+
+def casos(d: dict) -> dict:
+    """{nombre: (callable, filas de entrada)} sobre un dataset sintético."""
+    med, fal = d['df_mediciones'], d['df_fallas']
+    cfg = d['df_config'].iloc[0].to_dict()
+    pid, nombre = cfg['Planta_ID'], cfg['Planta_Nombre']
+    ua, uc = int(cfg['Umbral_Alerta_pct']), int(cfg['Umbral_Critico_pct'])
+
+    m_p = med[med['Planta_ID'] == pid]
+    f_p = fal[fal['Planta_ID'] == pid]
+    ultima = m_p['Fecha'].max()
+    m_camp = m_p[m_p['Fecha'] == ultima]
+    an_camp = analizar_mediciones(m_camp, isc_nom=cfg['Isc_STC_A'], ua=ua, uc=uc)
+    med_ord = _ordenar_por_fecha(med, 'Fecha')
+    hasta = ultima.date()
+    desde = (ultima - pd.Timedelta(days=30)).date()
+    inv = int(cfg['Num_Inversores'])
+
+    return {
+        'analizar_mediciones[campaña]': (lambda: analizar_mediciones(m_camp, isc_nom=cfg['Isc_STC_A'], ua=ua, uc=uc), len(m_camp)),
+        'analizar_mediciones[todo]':    (lambda: analizar_mediciones(med, ua=ua, uc=uc), len(med)),
+        'calcular_degradacion':         (lambda: calcular_degradacion(m_p, f_p, isc_stc=cfg['Isc_STC_A'], capacidad_mw=3.0), len(m_p)),
+        'calcular_reincidencia':        (lambda: calcular_reincidencia(fal), len(fal)),
+        '_calcular_recurrencia_df':     (lambda: _calcular_recurrencia_df(fal), len(fal)),
+        'heatmap_grilla':               (lambda: _grilla_heatmap(an_camp, 'String ID'), len(an_camp)),
+        'filtro_periodo[ordenar]':      (lambda: _ordenar_por_fecha(med_ord, 'Fecha'), len(med)),
+        'filtro_periodo[rebanar]':      (lambda: _rebanar_fechas(med_ord, 'Fecha', desde, hasta), len(med)),
+        'generar_pdf_fallas':           (lambda: generar_pdf_fallas(nombre, f_p, df_med=m_camp, cfg=cfg, periodo_str='Bench'), len(f_p)),
+        'generar_pdf_mediciones':       (lambda: generar_pdf_mediciones(nombre, m_camp, cfg, None, 3.0, inv,
+                                                                        df_fallas=f_p, periodo_str='Bench'), len(m_camp)),
+        'generar_excel_fallas':         (lambda: generar_excel_fallas(nombre, f_p, periodo='Bench'), len(f_p)),
+        'generar_excel_mediciones':     (lambda: generar_excel_mediciones(nombre, an_camp, cfg, df_fallas=f_p, periodo_str='Bench'), len(an_camp)),
+        'generar_csv_fallas':           (lambda: generar_csv_fallas(f_p, cfg), len(f_p)),
+        'generar_csv_fuera_rango':      (lambda: generar_csv_fuera_rango(an_camp, cfg), len(an_camp)),
+    }
+
+
+def medir(fn, repeat: int) -> dict:
+    tiempos = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        tiempos.append((time.perf_counter() - t0) * 1000)
+    return {'min_ms': round(min(tiempos), 2), 'mediana_ms': round(statistics.median(tiempos), 2),
+            'media_ms': round(statistics.fmean(tiempos), 2)}
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or 'sin-git'
+    except Exception:
+        return 'sin-git'
+
+
+def comparar(actual: dict, base: dict, umbral: float) -> int:
+    """Imprime actual/base por caso (mediana); retorna cuántos superan el umbral."""
+    idx = {(r['escala'], r['caso']): r for r in base['resultados']}
+    print(f"\nComparación contra {base['meta'].get('commit')} ({base['meta'].get('fecha')}):")
+    regresiones = 0
+    for r in actual['resultados']:
+        b = idx.get((r['escala'], r['caso']))
+        if b is None or not b['mediana_ms']:
+            continue
+        ratio = r['mediana_ms'] / b['mediana_ms']
+        marca = '  ⚠ regresión' if ratio > umbral else ('  ✓ mejora' if ratio < 1 / umbral else '')
+        regresiones += ratio > umbral
+        print(f"  {r['escala']:<3} {r['caso']:<32} {b['mediana_ms']:>10.1f} → {r['mediana_ms']:>10.1f} ms  x{ratio:5.2f}{marca}")
+    return regresiones
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--escalas', default='xs,s,m', help=f"subconjunto de {','.join(ESCALAS)}")
+    ap.add_argument('--repeat', type=int, default=3)
+    ap.add_argument('--solo', default=None, help='regex sobre el nombre del caso')
+    ap.add_argument('--salida', default=None)
+    ap.add_argument('--comparar', default=None, help='JSON de una corrida anterior')
+    ap.add_argument('--umbral', type=float, default=1.2)
+    args = ap.parse_args()
+
+    configurar_cache('ninguno')
+    commit = _commit()
+    resultado = {
+        'meta': {'commit': commit, 'fecha': datetime.datetime.now().isoformat(timespec='seconds'),
+                 'python': platform.python_version(), 'pandas': pd.__version__, 'numpy': np.__version__,
+                 'plataforma': platform.platform(), 'repeat': args.repeat},
+        'resultados': [],
+    }
+
+    for nombre_esc in args.escalas.split(','):
+        t0 = time.perf_counter()
+        d = escala(nombre_esc)
+        print(f"\n── escala {nombre_esc}: {len(d['df_mediciones']):,} lecturas, {len(d['df_fallas']):,} fallas, "
+              f"{len(d['df_plantas'])} plantas (generado en {time.perf_counter() - t0:.1f} s) ──")
+        for caso, (fn, filas) in casos(d).items():
+            if args.solo and not re.search(args.solo, caso):
+                continue
+            # Calentamiento (imports perezosos, fuentes PDF, lru de clean_text); los
+            # casos de varios segundos se miden una sola vez para acotar la corrida
+            t_cal = medir(fn, 1)['min_ms']
+            rep = 1 if t_cal > 5000 else args.repeat
+            r = {'escala': nombre_esc, 'caso': caso, 'filas': filas, 'repeat': rep, **medir(fn, rep)}
+            resultado['resultados'].append(r)
+            print(f"  {caso:<32} {filas:>10,} filas  {r['mediana_ms']:>10.1f} ms (mín {r['min_ms']:.1f})")
+
+    salida = args.salida or os.path.join(
+        DIR_RESULTADOS, f"{datetime.datetime.now():%Y%m%d_%H%M%S}_{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, 'w', encoding='utf-8') as f:
+        json.dump(resultado, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados: {salida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            if comparar(resultado, json.load(f), args.umbral):
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -22,3 +22,11 @@ from components.filters import (
     date_range_filter,
     context_bar,
 )
+from components.descargas import (
+    descarga_diferida,
+    limpiar_descargas,
+)
+from components.assets import (
+    url_asset,
+    logo_html,
+)
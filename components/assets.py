@@ -0,0 +1,59 @@
+"""
+components/assets.py
+══════════════════════════════════════════════════════════════
+Imágenes de static/ servidas como archivos, no embebidas en el HTML.
+
+Con server.enableStaticServing (ver .streamlit/config.toml) el
+navegador pide app/static/<archivo>?v=<hash> una vez y después lo
+revalida con ETag/Last-Modified; cada rerun envía solo la URL (~60 B)
+en lugar del data URI base64 (~285 KB por logo). El hash del contenido
+en la URL fuerza la descarga nueva si el archivo cambia.
+
+Sin static serving (p.ej. `streamlit run` desde otro directorio sin
+el config.toml) se cae al data URI, construido una sola vez por proceso.
+══════════════════════════════════════════════════════════════
+"""
+import base64
+import hashlib
+import mimetypes
+import os
+
+import streamlit as st
+
+from ms_data.runtime import cache_resource
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+
+
+@cache_resource(show_spinner=False)
+def _asset(nombre: str) -> dict:
+    """Lee static/<nombre> una vez por proceso: hash corto y data URI de respaldo."""
+    with open(os.path.join(STATIC_DIR, nombre), 'rb') as f:
+        datos = f.read()
+    mime = mimetypes.guess_type(nombre)[0] or 'application/octet-stream'
+    return {
+        'hash':     hashlib.sha1(datos).hexdigest()[:10],
+        'data_uri': f"data:{mime};base64,{base64.b64encode(datos).decode('ascii')}",
+        'bytes':    len(datos),
+    }
+
+
+def static_serving() -> bool:
+    try:
+        return bool(st.get_option('server.enableStaticServing'))
+    except Exception:
+        return False
+
+
+def url_asset(nombre: str) -> str:
+    """URL para <img src=...>: ruta estática versionada o data URI si no hay static serving."""
+    a = _asset(nombre)
+    return f"app/static/{nombre}?v={a['hash']}" if static_serving() else a['data_uri']
+
+
+def logo_html(px: int, margen_inf: int, sombra: str) -> str:
+    """<img> circular del logo de la suite (login y sidebar)."""
+    return (f'<img src="{url_asset("logo.png")}" alt="Mundo Solar Suite" '
+            f'style="width:{px}px;height:{px}px;object-fit:contain;'
+            f'border-radius:50%;display:block;margin:0 auto {margen_inf}px;'
+            f'filter:drop-shadow({sombra});">')
@@ -0,0 +1,53 @@
+"""
+components/descargas.py
+══════════════════════════════════════════════════════════════
+Descargas diferidas: el archivo (PDF, Excel, ZIP...) se genera solo
+cuando el usuario lo pide, no en cada render de la página.
+
+Primer estado: botón "⚙️ Preparar ...". Al pulsarlo se ejecuta el
+generador y los bytes quedan memoizados en session_state por
+(clave, firma, versión de datos); desde ahí se muestra el
+st.download_button normal sin volver a generar en cada rerun.
+══════════════════════════════════════════════════════════════
+"""
+import streamlit as st
+
+from ms_data.analysis import _run_in_thread
+
+
+def descarga_diferida(clave, generar, label, file_name, mime, firma=None,
+                      texto_preparar=None, **kwargs):
+    """
+    Botón de descarga con generación a pedido.
+
+    clave   : identificador estable del artefacto (también prefijo de keys de widgets).
+    generar : callable sin argumentos que retorna los bytes.
+    firma   : todo lo que cambia el contenido además de la versión de datos
+              (período, filtros, opciones). Si cambia, se vuelve a "Preparar".
+    kwargs  : se pasan a st.button / st.download_button (p.ej. use_container_width).
+
+    Retorna True si se pulsó la descarga en este rerun.
+    """
+    memo = st.session_state.setdefault('_artefactos', {})
+    firma = (st.session_state.get('version_datos', 0), firma)
+    hit = memo.get(clave)
+
+    if hit is None or hit[0] != firma:
+        if not st.button(texto_preparar or f"⚙️ Preparar {label}", key=f"_art_btn_{clave}", **kwargs):
+            return False
+        try:
+            with st.spinner("Generando archivo..."):
+                datos = _run_in_thread(generar)
+        except Exception as e:
+            st.error(f"Error generando {file_name}: {e}")
+            return False
+        hit = memo[clave] = (firma, datos)
+
+    return st.download_button(label, hit[1], file_name, mime, key=f"_art_dl_{clave}", **kwargs)
+
+
+def limpiar_descargas(prefijo=''):
+    """Descarta artefactos memoizados (todos o los de claves con ese prefijo)."""
+    memo = st.session_state.get('_artefactos', {})
+    for k in [k for k in memo if k.startswith(prefijo)]:
+        del memo[k]
@@ -18,27 +18,64 @@ OPTS_ESTANDAR = ['Mes en curso', 'Último trimestre', 'Último semestre', 'Hist
 
 # ── Helpers internos ─────────────────────────────────────────
 def _ensure_datetime(df: pd.DataFrame, col: str) -> pd.DataFrame:
-    """Asegura que la columna de fecha sea datetime."""
+    """Asegura que la columna de fecha sea datetime (sin copiar si ya lo es)."""
     if df is None or df.empty or col not in df.columns:
         return df
+    if pd.api.types.is_datetime64_any_dtype(df[col]):
+        return df
     df = df.copy()
     df[col] = pd.to_datetime(df[col], errors='coerce')
     return df
 
+def _ordenar_por_fecha(df: pd.DataFrame, col: str) -> pd.DataFrame:
+    """
+    Retorna df ordenado por col (NaT al final). Si ya lo está (caso normal:
+    modelo de vista de planta) retorna el mismo objeto, sin copiar.
+    """
+    if df is None or df.empty or col not in df.columns:
+        return df
+    s = df[col]
+    n_validas = int(s.notna().sum())
+    if s.iloc[:n_validas].is_monotonic_increasing and s.iloc[n_validas:].isna().all():
+        return df
+    return df.sort_values(col, kind='stable', na_position='last')
+
+def _n_validas(vals) -> int:
+    """Filas con fecha en un arreglo datetime64 ordenado (NaT ordena al final)."""
+    return int(vals.searchsorted(vals.dtype.type('NaT')))
+
 def _get_date_limits(df1: pd.DataFrame, df2: pd.DataFrame, col: str) -> tuple[datetime.date, datetime.date]:
-    """Obtiene la fecha mínima y máxima histórica sumando ambos DFs."""
-    min_date, max_date = datetime.date(2020, 1, 1), datetime.date.today()
-    fechas = pd.Series(dtype='datetime64[ns]')
-    
-    if df1 is not None and not df1.empty and col in df1.columns:
-        fechas = pd.concat([fechas, df1[col]])
-    if df2 is not None and not df2.empty and col in df2.columns:
-        fechas = pd.concat([fechas, df2[col]])
-        
-    fechas = fechas.dropna()
-    if not fechas.empty:
-        min_date, max_date = fechas.min().date(), fechas.max().date()
-    return min_date, max_date
+    """Fecha mínima y máxima histórica de ambos DFs (ya ordenados: extremos en O(1))."""
+    extremos = []
+    for df in (df1, df2):
+        if df is None or df.empty or col not in df.columns:
+            continue
+        vals = df[col].to_numpy()
+        if vals.dtype.kind != 'M':  # p.ej. con zona horaria: sin atajo O(1)
+            extremos += [df[col].min(), df[col].max()]
+            continue
+        n = _n_validas(vals)
+        if n:
+            extremos += [vals[0], vals[n - 1]]
+    if not extremos:
+        return datetime.date(2020, 1, 1), datetime.date.today()
+    extremos = [pd.Timestamp(e) for e in extremos if pd.notna(e)]
+    if not extremos:
+        return datetime.date(2020, 1, 1), datetime.date.today()
+    return min(extremos).date(), max(extremos).date()
+
+def _rebanar_fechas(df: pd.DataFrame, col: str, desde: datetime.date, hasta: datetime.date) -> pd.DataFrame:
+    """Filas con desde <= fecha <= hasta vía searchsorted sobre df ordenado (slice posicional)."""
+    if df is None or df.empty or col not in df.columns:
+        return df
+    vals = df[col].to_numpy()
+    if vals.dtype.kind != 'M':
+        return df[(df[col].dt.date >= desde) & (df[col].dt.date <= hasta)]
+    n = _n_validas(vals)
+    lo = vals.dtype.type(pd.Timestamp(desde).to_datetime64())
+    hi = vals.dtype.type((pd.Timestamp(hasta) + pd.Timedelta(days=1)).to_datetime64())
+    i, j = vals[:n].searchsorted([lo, hi], side='left')
+    return df.iloc[i:j]
 
 def _meses_disponibles(df: pd.DataFrame, col_fecha: str = 'Fecha') -> list:
     """Retorna lista de períodos mensuales disponibles, orden descendente."""
@@ -83,9 +120,9 @@ def flexible_period_filter(
     """
     hoy = pd.Timestamp.now()
 
-    # Asegurar formato datetime
-    df_med = _ensure_datetime(df_med, col_fecha)
-    df_fallas = _ensure_datetime(df_fallas, col_fecha)
+    # Asegurar formato datetime y orden por fecha (no copia si ya vienen así)
+    df_med = _ordenar_por_fecha(_ensure_datetime(df_med, col_fecha), col_fecha)
+    df_fallas = _ordenar_por_fecha(_ensure_datetime(df_fallas, col_fecha), col_fecha)
 
     # Variables de estado
     k_modo = f'_fp_modo_{key}'
@@ -188,14 +225,9 @@ def flexible_period_filter(
                     st.session_state[k_hasta] = nuevo_hasta
                     st.rerun()
 
-    # 3. Aplicar filtro
-    def _filtrar(df):
-        if df is None or df.empty or col_fecha not in df.columns:
-            return df
-        return df[(df[col_fecha].dt.date >= desde) & (df[col_fecha].dt.date <= hasta)]
-
-    df_med_fil = _filtrar(df_med)
-    df_fallas_fil = _filtrar(df_fallas)
+    # 3. Aplicar filtro: búsqueda binaria sobre las fechas ordenadas
+    df_med_fil = _rebanar_fechas(df_med, col_fecha, desde, hasta)
+    df_fallas_fil = _rebanar_fechas(df_fallas, col_fecha, desde, hasta)
 
     # Mostrar resumen
     if df_med_fil is not None and not df_med_fil.empty:
@@ -0,0 +1,52 @@
+"""
+components/perfil_importes.py
+══════════════════════════════════════════════════════════════
+Panel de depuración del arranque (activar con MS_PERFIL_IMPORTES=1).
+
+Muestra qué librerías pesadas tiene cargadas el proceso y, a pedido,
+el desglose `-X importtime` de cada escenario (login, vista global,
+planta, exportes) medido en un intérprete limpio.
+══════════════════════════════════════════════════════════════
+"""
+import os
+
+import streamlit as st
+
+from ms_data.runtime import cache_resource
+
+
+def modo_perfil() -> bool:
+    return os.environ.get('MS_PERFIL_IMPORTES', '').lower() in ('1', 'true', 'si', 'sí')
+
+
+@cache_resource(show_spinner=False)
+def _perfil(escenario: str):
+    from ms_data.importes import perfil_escenario
+    return perfil_escenario(escenario)
+
+
+def panel_importes():
+    from ms_data.importes import ESCENARIOS, modulos_pesados, por_paquete
+
+    with st.expander("🐢 Perfil de imports", expanded=False):
+        cargados = modulos_pesados()
+        st.caption("Cargados en este proceso: " + " · ".join(
+            f"{'🟠' if v else '⚪'} {m}" for m, v in cargados.items()))
+
+        esc = st.selectbox("Escenario", list(ESCENARIOS), key='_perfil_imp_esc',
+                           help="Costo incremental sobre el login (el login se mide desde cero).")
+        if st.button("Medir", key='_perfil_imp_btn'):
+            _perfil.clear()
+            st.session_state['_perfil_imp_activo'] = True
+        if not st.session_state.get('_perfil_imp_activo'):
+            return
+        try:
+            df = _perfil(esc)
+        except Exception as e:
+            st.error(f"No se pudo medir: {e}")
+            return
+        st.metric("Tiempo de import", f"{df['Propio_ms'].sum():,.0f} ms", f"{len(df)} módulos", delta_color='off')
+        st.dataframe(por_paquete(df), hide_index=True, width='stretch')
+        with st.popover("Detalle por módulo"):
+            st.dataframe(df.sort_values('Acumulado_ms', ascending=False).head(60),
+                         hide_index=True, width='stretch')
@@ -1,23 +1,57 @@
 """
 ms_data/__init__.py
 Exporta todas las funciones de datos desde un único punto de entrada.
+
+Exportes (fpdf/openpyxl), lote de informes y gráficos (plotly) se
+importan al primer uso vía __getattr__: el login solo carga sheets.
 """
+import importlib
 from ms_data.sheets import (
-    get_gsheet_client, get_spreadsheet, get_worksheet,
+    get_gsheet_client, get_spreadsheet, get_worksheet, configurar_cliente,
     cargar_plantas, cargar_plantas_config, cargar_tecnicos,
     cargar_asignaciones, cargar_fallas, cargar_mediciones, cargar_usuarios,
-    guardar_usuario, actualizar_password, guardar_planta, guardar_planta_config,
+    guardar_usuario, actualizar_password, actualizar_plantas_usuario, guardar_planta, guardar_planta_config,
     guardar_tecnico, guardar_asignacion, guardar_falla, guardar_mediciones_bulk,
     borrar_fila_sheet, eliminar_por_id, generar_id,
-    _hash_password, _verificar_password, _autenticar,
+    _hash_password, _verificar_password, _autenticar, indice_usuarios,
     _rol_actual, puede, requiere_login, requiere_rol, invalidar_cache,
 )
 from ms_data.analysis import (
     analizar_mediciones, clasificar_falla_amp, clasificar_falla_isc,
-    desv_isc_pct, obtener_nombre_mes, clean_text,
+    desv_isc_pct, obtener_nombre_mes, clean_text, resumen_plantas,
     _run_in_thread, _to_float, _to_int, _get_analisis_cacheado,
 )
-from ms_data.exports import (
-    generar_pdf_fallas, generar_pdf_mediciones,
-    generar_excel_fallas, generar_excel_mediciones,
-)
\ No newline at end of file
+from ms_data.contadores import contadores_fallas, construir_contadores
+from ms_data.foto_strings import foto_strings, construir_foto
+from ms_data.particiones import particiones, construir_particiones
+from ms_data.carga import CargaProgresiva
+from ms_data.trazas import tramo, trazado
+from ms_data.cuota import configurar_cuota, uso_cuota
+from ms_data.claves import configurar_kdf
+from ms_data.permisos import acceso_actual, resolver_acceso, acotar
+
+# ── Exportes diferidos (PEP 562) ─────────────────────────────
+_DIFERIDOS = {
+    'generar_pdf_fallas':       'ms_data.exports',
+    'generar_pdf_mediciones':   'ms_data.exports',
+    'generar_excel_fallas':     'ms_data.exports',
+    'generar_excel_mediciones': 'ms_data.exports',
+    'generar_csv_fallas':       'ms_data.exports',
+    'generar_csv_fuera_rango':  'ms_data.exports',
+    'generar_lote_informes':    'ms_data.batch',
+    'configurar_presupuesto':   'ms_data.charts',
+    'ClienteFalso':             'ms_data.gspread_falso',
+}
+
+
+def __getattr__(nombre):
+    modulo = _DIFERIDOS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module 'ms_data' has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(modulo), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_DIFERIDOS))
@@ -5,11 +5,15 @@ Lógica de análisis de mediciones y clasificación de strings.
 Motor Central optimizado - Clean Code & Vectorización.
 ══════════════════════════════════════════════════════════════
 """
+import functools
 import threading as _threading
 import streamlit as st
 import pandas as pd
 import numpy as np
 
+from ms_data.runtime import cache_data
+from ms_data.trazas import trazado, heredar
+
 # ── PALETAS DE COLORES CENTRALIZADAS ─────────────────────────
 COLOR_FALLAS = {
     "Operativo (±5%)":       "#1E8449", # Verde
@@ -40,6 +44,7 @@ COLOR_DEGR = {
 def _run_in_thread(fn, *args, **kwargs):
     """Ejecuta fn en thread separado para aislar retornos None de Streamlit."""
     result, error = [None], [None]
+    fn = heredar(fn)
     def target():
         try: result[0] = fn(*args, **kwargs)
         except Exception as e: error[0] = e
@@ -57,13 +62,17 @@ def _to_int(val, default=0):
     try: return int(float(val))
     except (ValueError, TypeError): return default
 
+# Sustituciones para fuentes core de FPDF (latin-1); una sola pasada con str.translate
+_TABLA_LATIN1 = str.maketrans({'•':'-','—':'-','–':'-','“':'"','”':'"','‘':'"','’':'"',
+                               '⚡':'','☀':'','🔴':'R','🟡':'A','🟢':'N','›':'>','≥':'>=','≤':'<=','±':'+/-'})
+
+@functools.lru_cache(maxsize=8192)
+def _clean_text_str(t):
+    return t.translate(_TABLA_LATIN1).encode('latin-1','replace').decode('latin-1')
+
 def clean_text(t):
-    if not isinstance(t, str): t = str(t)
-    reemplazos = {'•':'-','—':'-','–':'-','"':'"','“':'"','”':'"','‘':'"','’':'"',
-                  '⚡':'','☀':'','🔴':'R','🟡':'A','🟢':'N','›':'>','≥':'>=','≤':'<=','±':'+/-'}
-    for k, v in reemplazos.items():
-        t = t.replace(k, v)
-    return t.encode('latin-1','replace').decode('latin-1')
+    """Texto seguro para FPDF (latin-1). Memoizado: etiquetas de CB, diagnósticos y causas se repiten."""
+    return _clean_text_str(t if isinstance(t, str) else str(t))
 
 def obtener_nombre_mes(m):
     meses = ["","Enero","Febrero","Marzo","Abril","Mayo","Junio",
@@ -136,7 +145,8 @@ def desv_isc_pct(amp, isc_stc, irradiancia):
     return round(((amp - isc_ref) / isc_ref) * 100, 2)
 
 # ── ANÁLISIS VECTORIZADO CORE ────────────────────────────────
-@st.cache_data(ttl=600, show_spinner=False)
+@cache_data(ttl=600, show_spinner=False)
+@trazado()
 def analizar_mediciones(df, isc_nom=None, irradiancia=698, ua=-5, uc=-10,
                         restriccion_mw=None, capacidad_mw=None):
     """
@@ -196,9 +206,56 @@ def analizar_mediciones(df, isc_nom=None, irradiancia=698, ua=-5, uc=-10,
     ]
     valores = ['OC (0A)', 'SOBRE-CORRIENTE', 'CRÍTICO', 'ALERTA', 'NORMAL', 'CRÍTICO', 'ALERTA']
     df['Diagnostico'] = np.select(condiciones, valores, default='NORMAL')
-    
+
     return df
 
+# ── RESUMEN GLOBAL POR PLANTA ────────────────────────────────
+@trazado()
+def resumen_plantas(df_plantas, df_med, df_fallas=None, df_med_ant=None) -> pd.DataFrame:
+    """
+    Salud, críticos, alertas y fallas de todas las plantas en una pasada.
+
+    df_med / df_fallas son el período seleccionado y df_med_ant el mes de
+    comparación. En vez de llamar analizar_mediciones una vez por planta y
+    período, ambos períodos se analizan juntos con el Equipo prefijado por
+    período y planta: el diagnóstico solo depende de estadísticas por caja,
+    así que el resultado es idéntico y las cajas homónimas no se mezclan.
+
+    Retorna un DataFrame indexado por ID de planta (str) con columnas
+    salud, crit, aler, fallas y salud_ant (NaN si no hay mes anterior).
+    """
+    ids = df_plantas['ID'].astype(str) if not df_plantas.empty else pd.Series(dtype=str)
+    res = pd.DataFrame(index=pd.Index(ids.unique(), name='Planta_ID'))
+
+    partes = [(p, d) for p, d in (('act', df_med), ('ant', df_med_ant)) if d is not None and not d.empty]
+    if partes:
+        m = pd.concat([d.assign(_periodo=p) for p, d in partes], ignore_index=True)
+        m['_pid'] = m['Planta_ID'].astype(str)
+        eq = m['Equipo']
+        m['Equipo'] = eq.where(eq.isna(), m['_periodo'] + '|' + m['_pid'] + '|' + eq.astype(str))
+        diag = analizar_mediciones(m)[['_periodo', '_pid', 'Diagnostico']]
+        conteo = (diag.assign(norm=diag['Diagnostico'] == 'NORMAL',
+                              crit=diag['Diagnostico'].isin(['CRÍTICO', 'OC (0A)']),
+                              aler=diag['Diagnostico'] == 'ALERTA')
+                      .groupby(['_periodo', '_pid'])[['norm', 'crit', 'aler']].agg(['sum', 'size']))
+        for p, _ in partes:
+            if p not in conteo.index.get_level_values(0): continue
+            c = conteo.xs(p, level='_periodo')
+            salud = c[('norm', 'sum')] / c[('norm', 'size')] * 100
+            if p == 'act':
+                res['salud'] = salud
+                res['crit']  = c[('crit', 'sum')]
+                res['aler']  = c[('aler', 'sum')]
+            else:
+                res['salud_ant'] = salud
+
+    if df_fallas is not None and not df_fallas.empty:
+        res['fallas'] = df_fallas.groupby(df_fallas['Planta_ID'].astype(str)).size()
+
+    res = res.reindex(columns=['salud', 'crit', 'aler', 'fallas', 'salud_ant'])
+    return res.fillna({'salud': 100.0, 'crit': 0, 'aler': 0, 'fallas': 0}).astype(
+        {'salud': float, 'crit': int, 'aler': int, 'fallas': int, 'salud_ant': float})
+
 # ── HISTORIAL Y DEGRADACIÓN ──────────────────────────────────
 def calcular_reincidencia(df_fallas: pd.DataFrame) -> pd.DataFrame:
     if df_fallas is None or df_fallas.empty: return pd.DataFrame()
@@ -0,0 +1,227 @@
+"""
+ms_data/batch.py
+══════════════════════════════════════════════════════════════
+Generación masiva de informes mensuales para todo el portafolio.
+
+Una sola carga de datos (los DataFrames ya cargados o una lectura
+de Sheets) se particiona por planta y cada planta se procesa en un
+pool de procesos. El resultado es un único ZIP con los PDF/XLSX de
+mediciones y fallas de cada planta, más un resumen de tiempos.
+══════════════════════════════════════════════════════════════
+"""
+import io
+import os
+import time
+import zipfile
+import multiprocessing
+import concurrent.futures
+
+import pandas as pd
+
+from ms_data.analysis import _to_float, _to_int, obtener_nombre_mes
+from ms_data.trazas import trazado
+
+
+# ── Helpers ──────────────────────────────────────────────────
+def _periodo_mensual(periodo) -> pd.Period:
+    """Acepta 'YYYY-MM', datetime o pd.Period y retorna el Period mensual."""
+    if isinstance(periodo, pd.Period):
+        return periodo.asfreq('M')
+    return pd.Period(periodo, freq='M')
+
+
+def _filtrar_mes(df: pd.DataFrame, per: pd.Period) -> pd.DataFrame:
+    if df is None or df.empty or 'Fecha' not in df.columns:
+        return pd.DataFrame()
+    fechas = pd.to_datetime(df['Fecha'], errors='coerce')
+    return df[fechas.dt.to_period('M') == per]
+
+
+def _nombre_archivo(texto: str) -> str:
+    """Nombre seguro para rutas dentro del ZIP."""
+    return ''.join(ch if ch.isalnum() or ch in '-_.' else '_' for ch in str(texto).strip())
+
+
+# ── Trabajo por planta (se ejecuta en el proceso hijo) ───────
+def _informes_planta(job: dict) -> dict:
+    """
+    Genera los 4 informes de una planta. Función top-level para que sea
+    picklable por ProcessPoolExecutor. Nunca lanza: los errores quedan
+    registrados en el resultado para no abortar el lote completo.
+    """
+    from ms_data.analysis import analizar_mediciones
+    from ms_data.exports import (generar_pdf_fallas, generar_pdf_mediciones,
+                                 generar_excel_fallas, generar_excel_mediciones,
+                                 generar_csv_fallas, generar_csv_fuera_rango, LIMITE_DETALLE_PDF)
+
+    t0 = time.perf_counter()
+    nombre, cfg = job['nombre'], job['cfg']
+    m_p, f_p = job['df_med'], job['df_fallas']
+    per_disp, per_file = job['periodo_str'], job['periodo_file']
+    archivos, tiempos, errores = {}, {}, []
+
+    def _medir(clave, fn, *args, **kwargs):
+        t = time.perf_counter()
+        try:
+            archivos[clave] = fn(*args, **kwargs)
+        except Exception as e:
+            errores.append(f"{clave}: {e}")
+        tiempos[clave] = round(time.perf_counter() - t, 3)
+
+    # Misma parametrización que vistas/planta/tab_informes.py
+    df_proc = pd.DataFrame()
+    if not m_p.empty:
+        rest_mw = float(pd.to_numeric(m_p['Restriccion_MW'], errors='coerce').max() or 0) \
+                  if 'Restriccion_MW' in m_p.columns else 0.0
+        cap_mw  = _to_float(cfg.get('Potencia_MW', job.get('potencia_mw', 0))) if cfg else _to_float(job.get('potencia_mw', 0))
+        n_inv   = _to_int(cfg.get('Num_Inversores', 1)) if cfg else 1
+        ua      = _to_int(cfg.get('Umbral_Alerta_pct', -5)) if cfg else -5
+        uc      = _to_int(cfg.get('Umbral_Critico_pct', -10)) if cfg else -10
+        df_proc = analizar_mediciones(m_p, ua=ua, uc=uc,
+                                      restriccion_mw=rest_mw if rest_mw > 0 else None,
+                                      capacidad_mw=cap_mw if rest_mw > 0 else None)
+        # Modo resumen: sobre el límite, el PDF trunca el detalle y se adjunta el CSV
+        max_det = None
+        if (df_proc['Diagnostico'] != 'NORMAL').sum() > LIMITE_DETALLE_PDF:
+            max_det = LIMITE_DETALLE_PDF
+            _medir(f"Auditoria_{per_file}.csv", generar_csv_fuera_rango, df_proc, cfg)
+        _medir(f"Auditoria_{per_file}.pdf", generar_pdf_mediciones, nombre, m_p, cfg,
+               rest_mw if rest_mw > 0 else None, cap_mw, n_inv,
+               df_fallas=f_p, periodo_str=per_disp, max_filas_detalle=max_det)
+        _medir(f"Auditoria_{per_file}.xlsx", generar_excel_mediciones, nombre, df_proc, cfg,
+               df_fallas=f_p, periodo_str=per_disp)
+
+    if not f_p.empty:
+        df_med_inf = pd.DataFrame()
+        if not m_p.empty and cfg:
+            df_med_inf = analizar_mediciones(
+                m_p,
+                isc_nom=_to_float(cfg.get('Isc_STC_A', 9.07)),
+                irradiancia=_to_float(cfg.get('Irradiancia', 698)),
+                ua=_to_int(cfg.get('Umbral_Alerta_pct', -5)),
+                uc=_to_int(cfg.get('Umbral_Critico_pct', -10)))
+        max_det = None
+        if len(f_p) > LIMITE_DETALLE_PDF:
+            max_det = LIMITE_DETALLE_PDF
+            _medir(f"Fallas_{per_file}.csv", generar_csv_fallas, f_p, cfg)
+        _medir(f"Fallas_{per_file}.pdf", generar_pdf_fallas, nombre, f_p,
+               df_med=df_med_inf, cfg=cfg, periodo_str=per_disp, max_filas_detalle=max_det)
+        _medir(f"Fallas_{per_file}.xlsx", generar_excel_fallas, nombre, f_p, periodo=per_disp)
+
+    return {
+        'planta_id':   job['planta_id'],
+        'nombre':      nombre,
+        'n_med':       len(m_p),
+        'n_fallas':    len(f_p),
+        'archivos':    archivos,
+        'tiempos':     tiempos,
+        'errores':     errores,
+        'total_s':     round(time.perf_counter() - t0, 3),
+    }
+
+
+# ── Orquestador ──────────────────────────────────────────────
+def preparar_trabajos(periodo, df_plantas, df_config, df_fallas, df_med) -> list:
+    """Particiona una única carga de datos en un trabajo por planta del período."""
+    per = _periodo_mensual(periodo)
+    per_disp = f"{obtener_nombre_mes(per.month)} {per.year}"
+    per_file = per.strftime('%Y%m')
+
+    m_mes = _filtrar_mes(df_med, per)
+    f_mes = _filtrar_mes(df_fallas, per)
+    m_grp = dict(tuple(m_mes.groupby(m_mes['Planta_ID'].astype(str)))) if not m_mes.empty else {}
+    f_grp = dict(tuple(f_mes.groupby(f_mes['Planta_ID'].astype(str)))) if not f_mes.empty else {}
+
+    cfgs = {}
+    if df_config is not None and not df_config.empty and 'Planta_ID' in df_config.columns:
+        cfgs = {str(r['Planta_ID']): r for r in df_config.to_dict('records')}
+
+    trabajos = []
+    for planta in df_plantas.to_dict('records'):
+        pid = str(planta.get('ID', ''))
+        m_p = m_grp.get(pid, pd.DataFrame())
+        f_p = f_grp.get(pid, pd.DataFrame())
+        if m_p.empty and f_p.empty:
+            continue
+        trabajos.append({
+            'planta_id':    pid,
+            'nombre':       str(planta.get('Nombre', pid)),
+            'potencia_mw':  planta.get('Potencia_MW', 0),
+            'cfg':          cfgs.get(pid, {}),
+            'df_med':       m_p,
+            'df_fallas':    f_p,
+            'periodo_str':  per_disp,
+            'periodo_file': per_file,
+        })
+    return trabajos
+
+
+@trazado()
+def generar_lote_informes(periodo, df_plantas=None, df_config=None, df_fallas=None,
+                          df_med=None, max_workers=None) -> dict:
+    """
+    Genera los informes del período para todas las plantas en paralelo.
+
+    Los DataFrames son opcionales: si no se entregan se leen UNA vez desde
+    Sheets y se reutilizan para todas las plantas. max_workers=1 ejecuta en
+    el mismo proceso (útil para depurar o en entornos sin fork/spawn).
+
+    Retorna {'zip': bytes, 'resumen': DataFrame, 'periodo': str, 'total_s': float}.
+    """
+    t0 = time.perf_counter()
+    if df_plantas is None:
+        from ms_data.sheets import (cargar_plantas, cargar_plantas_config,
+                                    cargar_fallas, cargar_mediciones)
+        df_plantas = cargar_plantas()
+        df_config  = cargar_plantas_config() if df_config is None else df_config
+        df_fallas  = cargar_fallas()         if df_fallas is None else df_fallas
+        df_med     = cargar_mediciones()     if df_med    is None else df_med
+
+    trabajos = preparar_trabajos(periodo, df_plantas, df_config, df_fallas, df_med)
+    if max_workers is None:
+        max_workers = min(len(trabajos), os.cpu_count() or 1)
+
+    resultados = []
+    if max_workers <= 1 or len(trabajos) <= 1:
+        resultados = [_informes_planta(j) for j in trabajos]
+    else:
+        # 'spawn' evita heredar los hilos del servidor Streamlit vía fork.
+        ctx = multiprocessing.get_context('spawn')
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx) as ex:
+            futuros = {ex.submit(_informes_planta, j): j for j in trabajos}
+            for fut in concurrent.futures.as_completed(futuros):
+                j = futuros[fut]
+                try:
+                    resultados.append(fut.result())
+                except Exception as e:
+                    resultados.append({'planta_id': j['planta_id'], 'nombre': j['nombre'],
+                                       'n_med': len(j['df_med']), 'n_fallas': len(j['df_fallas']),
+                                       'archivos': {}, 'tiempos': {}, 'errores': [str(e)],
+                                       'total_s': 0.0})
+
+    resultados.sort(key=lambda r: r['planta_id'])
+    filas = []
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for r in resultados:
+            carpeta = _nombre_archivo(f"{r['planta_id']}_{r['nombre']}")
+            for fname, data in r['archivos'].items():
+                zf.writestr(f"{carpeta}/{_nombre_archivo(r['nombre'])}_{fname}", data)
+            filas.append({
+                'Planta_ID': r['planta_id'], 'Planta': r['nombre'],
+                'Mediciones': r['n_med'], 'Fallas': r['n_fallas'],
+                'Archivos': len(r['archivos']),
+                **{f"t_{k.split('_')[0]}_{k.rsplit('.', 1)[-1]} (s)": v for k, v in r['tiempos'].items()},
+                'Total (s)': r['total_s'],
+                'Errores': '; '.join(r['errores']),
+            })
+        resumen = pd.DataFrame(filas)
+        zf.writestr('resumen_tiempos.csv', resumen.to_csv(index=False))
+
+    per = _periodo_mensual(periodo)
+    return {
+        'zip':     buf.getvalue(),
+        'resumen': resumen,
+        'periodo': per.strftime('%Y-%m'),
+        'total_s': round(time.perf_counter() - t0, 3),
+    }
@@ -0,0 +1,98 @@
+"""
+ms_data/carga.py
+══════════════════════════════════════════════════════════════
+Carga progresiva de las hojas: una por hilo, con estado por tabla.
+
+- Cada tabla se carga en su propio hilo. app.py espera solo las
+  críticas (Plantas, Usuarios) para dibujar la estructura; el resto
+  entra en reruns posteriores a medida que llega.
+- Las críticas (`prioritarias`) arrancan primero y sus llamadas a la
+  API tienen prioridad en la ventana de cuota (cuota.prioritaria), así
+  no quedan detrás de Mediciones o Fallas cuando la cuota aprieta.
+- Si una tabla falla, el hilo reintenta en segundo plano con espera
+  creciente (REINTENTOS_S) y la app conserva los datos que ya tenía.
+- El hilo no toca st.session_state: deja el DataFrame en la carga y
+  el script lo recoge (recoger()) en el próximo rerun.
+══════════════════════════════════════════════════════════════
+"""
+import time
+import threading
+from contextlib import nullcontext
+
+from ms_data.trazas import heredar, tramo
+from ms_data.cuota import prioritaria
+
+REINTENTOS_S = (2, 5, 15, 30)
+
+# Estados por tabla
+CARGANDO, LISTA, REINTENTANDO, FALLIDA = 'cargando', 'lista', 'reintentando', 'fallida'
+
+
+class CargaProgresiva:
+    """Lanza los loaders de `tareas` ({clave: fn}) y expone su avance."""
+
+    def __init__(self, tareas: dict, prioritarias=(), reintentos=REINTENTOS_S):
+        self._lock      = threading.Lock()
+        self._listos    = {}                                   # clave → DataFrame sin recoger
+        self._primera   = {k: threading.Event() for k in tareas}   # primer resultado (ok o error)
+        self._reintentos = tuple(reintentos)
+        self.prioritarias = frozenset(prioritarias)
+        # ms: duración del intento que resolvió; listo_ms: desde el arranque de la carga
+        self.estado = {k: {'estado': CARGANDO, 'intentos': 0, 'error': '', 'ms': None, 'listo_ms': None}
+                       for k in tareas}
+        self.inicio = time.monotonic()
+        orden = sorted(tareas, key=lambda k: k not in self.prioritarias)
+        for clave, fn in ((k, tareas[k]) for k in orden):
+            threading.Thread(target=heredar(self._trabajar), args=(clave, fn),
+                             name=f"carga-{clave}", daemon=True).start()
+
+    def _anotar(self, clave, **cambios):
+        with self._lock:
+            self.estado[clave].update(cambios)
+
+    def _trabajar(self, clave, fn):
+        for intento, espera in enumerate((0,) + self._reintentos):
+            if espera:
+                self._anotar(clave, estado=REINTENTANDO)
+                time.sleep(espera)
+            t0 = time.perf_counter()
+            try:
+                with tramo('carga.tabla', tabla=clave, intento=intento), \
+                        (prioritaria() if clave in self.prioritarias else nullcontext()):
+                    df = fn()
+            except Exception as e:
+                self._anotar(clave, intentos=intento + 1, error=str(e)[:200])
+                self._primera[clave].set()
+                continue
+            with self._lock:
+                self._listos[clave] = df
+                self.estado[clave].update(estado=LISTA, intentos=intento + 1, error='',
+                                          ms=round((time.perf_counter() - t0) * 1000),
+                                          listo_ms=round((time.monotonic() - self.inicio) * 1000))
+            self._primera[clave].set()
+            return
+        self._anotar(clave, estado=FALLIDA)
+
+    # ── Consumo desde el script ──────────────────────────────
+    def esperar(self, claves, timeout: float) -> bool:
+        """Bloquea hasta el primer resultado de cada clave; False si venció el plazo."""
+        limite = time.monotonic() + timeout
+        return all(self._primera[k].wait(max(0.0, limite - time.monotonic())) for k in claves)
+
+    def recoger(self) -> dict:
+        """DataFrames llegados desde la última llamada."""
+        with self._lock:
+            listos, self._listos = self._listos, {}
+        return listos
+
+    def hay_listos(self) -> bool:
+        with self._lock:
+            return bool(self._listos)
+
+    def pendientes(self) -> list:
+        with self._lock:
+            return [k for k, e in self.estado.items() if e['estado'] in (CARGANDO, REINTENTANDO)]
+
+    def resumen(self) -> dict:
+        with self._lock:
+            return {k: dict(e) for k, e in self.estado.items()}
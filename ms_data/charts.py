@@ -0,0 +1,189 @@
+"""
+ms_data/charts.py
+══════════════════════════════════════════════════════════════
+Reducción de datos para gráficos Plotly grandes.
+
+Bajo el presupuesto de puntos se construye el mismo gráfico px de
+siempre; sobre él, los datos se agregan en el servidor y al navegador
+(o a kaleido) solo viaja el resumen:
+- box plots   → cuartiles/bigotes precalculados + outliers acotados
+- histogramas → bins precalculados con np.histogram
+- barras      → top-N + una barra "Otros"
+- series      → LTTB (Largest-Triangle-Three-Buckets)
+
+Presupuestos configurables con configurar_presupuesto() o las variables
+de entorno MS_PRESUPUESTO_PUNTOS / MS_PRESUPUESTO_BARRAS.
+══════════════════════════════════════════════════════════════
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from ms_data.trazas import trazado
+
+PRESUPUESTO_PUNTOS = int(os.environ.get('MS_PRESUPUESTO_PUNTOS', 5000))
+PRESUPUESTO_BARRAS = int(os.environ.get('MS_PRESUPUESTO_BARRAS', 300))
+MAX_OUTLIERS_GRUPO = 30
+COLOR_OTROS        = '#B0B7C3'
+
+
+def configurar_presupuesto(puntos=None, barras=None):
+    """Ajusta los umbrales globales de reducción (None = sin cambio)."""
+    global PRESUPUESTO_PUNTOS, PRESUPUESTO_BARRAS
+    if puntos is not None: PRESUPUESTO_PUNTOS = int(puntos)
+    if barras is not None: PRESUPUESTO_BARRAS = int(barras)
+
+
+def supera_presupuesto(n, presupuesto=None) -> bool:
+    return n > (PRESUPUESTO_PUNTOS if presupuesto is None else presupuesto)
+
+
+# ══════════════════════════════════════════════════════════════
+# BOX PLOT
+# ══════════════════════════════════════════════════════════════
+def estadisticas_box(df, x, y, max_outliers=MAX_OUTLIERS_GRUPO):
+    """
+    Cuartiles y bigotes por grupo (criterio 1.5·IQR de Plotly) más los
+    outliers más extremos de cada grupo. Grupos en orden de aparición.
+    """
+    d = df[[x, y]].dropna()
+    g = d.groupby(x, sort=False)[y]
+    est = g.quantile([.25, .5, .75]).unstack()
+    est.columns = ['q1', 'median', 'q3']
+    iqr = est['q3'] - est['q1']
+    d = d.join((est['q1'] - 1.5 * iqr).rename('_li'), on=x).join((est['q3'] + 1.5 * iqr).rename('_ls'), on=x)
+    dentro = (d[y] >= d['_li']) & (d[y] <= d['_ls'])
+    est['lowerfence'] = d[dentro].groupby(x, sort=False)[y].min()
+    est['upperfence'] = d[dentro].groupby(x, sort=False)[y].max()
+
+    fuera = d[~dentro].join(est['median'], on=x)
+    fuera = (fuera.assign(_dist=(fuera[y] - fuera['median']).abs())
+                  .sort_values('_dist', ascending=False)
+                  .groupby(x, sort=False).head(max_outliers))
+    return est, fuera[[x, y]]
+
+
+@trazado('charts.box')
+def box(df, x, y, presupuesto=None, **px_kwargs):
+    """px.box bajo el presupuesto; sobre él, cajas con estadísticas precalculadas."""
+    if not supera_presupuesto(len(df), presupuesto):
+        return px.box(df, x=x, y=y, **px_kwargs)
+
+    est, outliers = estadisticas_box(df, x, y)
+    color_map = px_kwargs.get('color_discrete_map') or {}
+    fig = go.Figure()
+    if px_kwargs.get('color') == x:
+        # Una traza por grupo para conservar colores/leyenda por categoría
+        out_grp = dict(tuple(outliers.groupby(x, sort=False)))
+        for grp, r in est.iterrows():
+            fig.add_trace(go.Box(name=str(grp), x=[grp], q1=[r.q1], median=[r['median']], q3=[r.q3],
+                                 lowerfence=[r.lowerfence], upperfence=[r.upperfence],
+                                 marker_color=color_map.get(grp), boxpoints=False))
+            o = out_grp.get(grp)
+            if o is not None:
+                fig.add_trace(go.Scatter(name=str(grp), x=o[x], y=o[y], mode='markers',
+                                         marker=dict(color=color_map.get(grp), size=4), showlegend=False))
+    else:
+        fig.add_trace(go.Box(x=est.index.tolist(), q1=est.q1, median=est['median'], q3=est.q3,
+                             lowerfence=est.lowerfence, upperfence=est.upperfence, boxpoints=False, name=y))
+        fig.add_trace(go.Scatter(x=outliers[x], y=outliers[y], mode='markers', name='outliers',
+                                 marker=dict(size=4), showlegend=False))
+    fig.update_layout(title=px_kwargs.get('title'), xaxis_title=x, yaxis_title=y, showlegend=False)
+    return fig
+
+
+# ══════════════════════════════════════════════════════════════
+# HISTOGRAMA
+# ══════════════════════════════════════════════════════════════
+@trazado('charts.histograma')
+def histograma(df, x, nbins=20, marginal=None, presupuesto=None, **px_kwargs):
+    """px.histogram bajo el presupuesto; sobre él, bins precalculados (+ box marginal agregado)."""
+    if not supera_presupuesto(len(df), presupuesto):
+        return px.histogram(df, x=x, nbins=nbins, marginal=marginal, **px_kwargs)
+
+    vals = pd.to_numeric(df[x], errors='coerce').dropna().to_numpy()
+    conteos, bordes = np.histogram(vals, bins=nbins)
+    barras = go.Bar(x=(bordes[:-1] + bordes[1:]) / 2, y=conteos, width=np.diff(bordes),
+                    name=x, hovertemplate=f"{x}: %{{x:.2f}}<br>count: %{{y}}<extra></extra>")
+    if marginal != 'box' or len(vals) == 0:
+        fig = go.Figure(barras)
+    else:
+        from plotly.subplots import make_subplots
+        q1, med, q3 = np.percentile(vals, [25, 50, 75])
+        iqr = q3 - q1
+        dentro = vals[(vals >= q1 - 1.5 * iqr) & (vals <= q3 + 1.5 * iqr)]
+        fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.2, 0.8], vertical_spacing=0.02)
+        fig.add_trace(go.Box(y=['all'], q1=[q1], median=[med], q3=[q3], lowerfence=[dentro.min()],
+                             upperfence=[dentro.max()], orientation='h', boxpoints=False, name=x), row=1, col=1)
+        fig.add_trace(barras, row=2, col=1)
+        fig.update_yaxes(showticklabels=False, row=1, col=1)
+    fig.update_layout(title=px_kwargs.get('title'), bargap=0, showlegend=False)
+    return fig
+
+
+# ══════════════════════════════════════════════════════════════
+# BARRAS TOP-N
+# ══════════════════════════════════════════════════════════════
+@trazado('charts.barras_top_n')
+def barras_top_n(df, x, y, n=None, ascendente=True, etiqueta_otros='Otros', **px_kwargs):
+    """
+    px.bar con a lo sumo n barras: conserva las n filas con menor (ascendente)
+    o mayor y, en su orden original, y resume el resto (incluidas las filas
+    con y NaN) en una barra "Otros" cuya altura es la mediana del resto; la
+    etiqueta lo indica para no leerla como un total.
+    """
+    n = PRESUPUESTO_BARRAS if n is None else n
+    if len(df) <= n:
+        return px.bar(df, x=x, y=y, **px_kwargs)
+
+    orden = df[y].rank(method='first', ascending=ascendente, na_option='bottom')
+    top, resto = df[orden <= n - 1], df[orden > n - 1]
+    otros = {c: ('-' if df[c].dtype == object else np.nan) for c in df.columns}
+    otros[x] = f"{etiqueta_otros} ({len(resto)}, mediana)"
+    otros[y] = resto[y].median()
+    color = px_kwargs.get('color')
+    if color:
+        otros[color] = etiqueta_otros
+        px_kwargs['color_discrete_map'] = {**(px_kwargs.get('color_discrete_map') or {}), etiqueta_otros: COLOR_OTROS}
+    return px.bar(pd.concat([top, pd.DataFrame([otros])], ignore_index=True), x=x, y=y, **px_kwargs)
+
+
+# ══════════════════════════════════════════════════════════════
+# SERIES TEMPORALES (LTTB)
+# ══════════════════════════════════════════════════════════════
+def lttb(x, y, n):
+    """Índices de los n puntos que preservan la forma visual de (x, y) (Steinarsson, 2013)."""
+    x = np.asarray(x, dtype=float); y = np.asarray(y, dtype=float)
+    total = len(x)
+    if n >= total or n < 3:
+        return np.arange(total)
+    idx = np.empty(n, dtype=int)
+    idx[0], idx[-1] = 0, total - 1
+    paso, a = (total - 2) / (n - 2), 0
+    for i in range(n - 2):
+        ini, fin = int(i * paso) + 1, int((i + 1) * paso) + 1
+        sig_fin = min(int((i + 2) * paso) + 1, total)
+        if fin >= sig_fin:
+            px_, py_ = x[-1], y[-1]
+        else:
+            px_, py_ = x[fin:sig_fin].mean(), y[fin:sig_fin].mean()
+        area = np.abs((x[a] - px_) * (y[ini:fin] - y[a]) - (x[a] - x[ini:fin]) * (py_ - y[a]))
+        a = ini + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+
+@trazado('charts.linea')
+def linea(df, x, y, presupuesto=None, **px_kwargs):
+    """px.line; sobre el presupuesto la serie (ordenada por x) se reduce con LTTB."""
+    lim = PRESUPUESTO_PUNTOS if presupuesto is None else presupuesto
+    if len(df) > lim:
+        df = df.sort_values(x)
+        xs = df[x]
+        if not pd.api.types.is_numeric_dtype(xs):
+            xs = pd.to_datetime(xs, errors='coerce').astype('int64')
+        df = df.iloc[lttb(xs.to_numpy(), pd.to_numeric(df[y], errors='coerce').fillna(0).to_numpy(), lim)]
+    return px.line(df, x=x, y=y, **px_kwargs)
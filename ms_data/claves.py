@@ -0,0 +1,93 @@
+"""
+ms_data/claves.py
+══════════════════════════════════════════════════════════════
+Hash de contraseñas con PBKDF2-HMAC-SHA256 (hashlib, sin
+dependencias), sal aleatoria por usuario y costo ajustable.
+
+Formato guardado en Usuarios.Password_Hash:
+
+    pbkdf2_sha256$<iteraciones>$<sal b64>$<hash b64>
+
+Los hashes antiguos (SHA-256 hex sin sal) se siguen aceptando;
+verificar() indica cuándo conviene re-hashear (formato antiguo o
+menos iteraciones que las vigentes) y sheets._autenticar lo hace en
+el mismo login exitoso. Mientras tanto, verificar un hash antiguo
+cuesta lo mismo que uno vigente (corre también el señuelo), igual que
+un email inexistente.
+
+Costo: ITERACIONES (def. 600 000, recomendación OWASP para
+PBKDF2-SHA256); MS_KDF_ITERACIONES o configurar_kdf() lo cambian,
+p.ej. para benchmarks/bench_login.py.
+══════════════════════════════════════════════════════════════
+"""
+import os
+import hmac
+import base64
+import hashlib
+
+ALGORITMO    = 'pbkdf2_sha256'
+ITERACIONES  = int(os.environ.get('MS_KDF_ITERACIONES', 600_000))
+BYTES_SAL    = 16
+
+
+def configurar_kdf(iteraciones: int):
+    """Cambia el costo de los hashes nuevos (los existentes guardan el suyo)."""
+    global ITERACIONES
+    ITERACIONES = max(int(iteraciones), 1)
+
+
+def _b64(b: bytes) -> str:
+    return base64.b64encode(b).decode('ascii').rstrip('=')
+
+
+def _desde_b64(s: str) -> bytes:
+    return base64.b64decode(s + '=' * (-len(s) % 4))
+
+
+def _derivar(password: str, sal: bytes, iteraciones: int) -> bytes:
+    return hashlib.pbkdf2_hmac('sha256', password.strip().encode(), sal, iteraciones)
+
+
+def hash_password(password: str, iteraciones: int = None) -> str:
+    it = iteraciones or ITERACIONES
+    sal = os.urandom(BYTES_SAL)
+    return f"{ALGORITMO}${it}${_b64(sal)}${_b64(_derivar(password, sal, it))}"
+
+
+def es_legado(almacenado: str) -> bool:
+    """SHA-256 hex sin sal del esquema anterior."""
+    s = almacenado.strip()
+    return len(s) == 64 and all(ch in '0123456789abcdefABCDEF' for ch in s)
+
+
+def verificar(password: str, almacenado: str) -> tuple:
+    """
+    (ok, rehashear): compara en tiempo constante; rehashear solo si ok.
+    Todo camino cuesta al menos ITERACIONES de PBKDF2 — hashes legados,
+    malformados o con menos iteraciones pagan la diferencia con el
+    señuelo — para que el tiempo de respuesta no delate qué cuentas
+    existen o siguen sin migrar.
+    """
+    s = str(almacenado or '').strip()
+    if es_legado(s):
+        verificar_senuelo(password)
+        ok = hmac.compare_digest(hashlib.sha256(password.strip().encode()).hexdigest(), s.lower())
+        return ok, ok
+    try:
+        alg, it, sal, esperado = s.split('$')
+        it = int(it)
+    except ValueError:
+        verificar_senuelo(password)
+        return False, False
+    if alg != ALGORITMO or it < 1:
+        verificar_senuelo(password)
+        return False, False
+    ok = hmac.compare_digest(_derivar(password, _desde_b64(sal), it), _desde_b64(esperado))
+    if it < ITERACIONES:
+        verificar_senuelo(password, ITERACIONES - it)
+    return ok, ok and it < ITERACIONES
+
+
+def verificar_senuelo(password: str, iteraciones: int = None):
+    """Mismo costo que una verificación real, para emails inexistentes (sin oráculo de tiempo)."""
+    _derivar(password, b'\0' * BYTES_SAL, iteraciones or ITERACIONES)
@@ -0,0 +1,102 @@
+"""
+ms_data/cli.py
+══════════════════════════════════════════════════════════════
+Generación de informes sin Streamlit (cron, tareas programadas).
+
+    python -m ms_data.cli report --plant PL-003 --period 2026-09
+    python -m ms_data.cli report --plant all --out /srv/informes
+
+Sin --period se usa el mes anterior al actual (ejecución mensual).
+Credenciales: credentials.json en el cwd, --credentials RUTA, o la
+variable de entorno GOOGLE_CREDENTIALS_JSON con el JSON completo.
+══════════════════════════════════════════════════════════════
+"""
+import os
+import sys
+import argparse
+
+import pandas as pd
+
+
+def _mes_anterior() -> str:
+    return (pd.Timestamp.now().to_period('M') - 1).strftime('%Y-%m')
+
+
+def _cargar_datos():
+    from ms_data.sheets import (cargar_plantas, cargar_plantas_config,
+                                cargar_fallas, cargar_mediciones)
+    return cargar_plantas(), cargar_plantas_config(), cargar_fallas(), cargar_mediciones()
+
+
+def cmd_report(args) -> int:
+    from ms_data.runtime import DatosError, configurar_cache
+    from ms_data.batch import preparar_trabajos, generar_lote_informes, _informes_planta
+
+    configurar_cache('memoria')
+    if args.credentials:
+        os.environ['MS_CREDENTIALS_FILE'] = args.credentials
+
+    try:
+        df_plantas, df_config, df_fallas, df_med = _cargar_datos()
+    except DatosError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    if df_plantas.empty:
+        print("ERROR: no hay plantas registradas.", file=sys.stderr)
+        return 2
+
+    os.makedirs(args.out, exist_ok=True)
+    periodo = args.period or _mes_anterior()
+
+    if args.plant.lower() == 'all':
+        lote = generar_lote_informes(periodo, df_plantas, df_config, df_fallas, df_med,
+                                     max_workers=args.workers)
+        ruta = os.path.join(args.out, f"Informes_MundoSolar_{lote['periodo'].replace('-', '')}.zip")
+        with open(ruta, 'wb') as fh:
+            fh.write(lote['zip'])
+        if not lote['resumen'].empty:
+            print(lote['resumen'].to_string(index=False))
+        print(f"{ruta} ({lote['total_s']:.1f} s)")
+        errores = lote['resumen']['Errores'].astype(bool).any() if not lote['resumen'].empty else False
+        return 1 if errores else 0
+
+    df_sel = df_plantas[df_plantas['ID'].astype(str) == args.plant]
+    if df_sel.empty:
+        print(f"ERROR: planta '{args.plant}' no existe.", file=sys.stderr)
+        return 2
+
+    trabajos = preparar_trabajos(periodo, df_sel, df_config, df_fallas, df_med)
+    if not trabajos:
+        print(f"Sin mediciones ni fallas para {args.plant} en {periodo}.", file=sys.stderr)
+        return 3
+
+    r = _informes_planta(trabajos[0])
+    for fname, data in r['archivos'].items():
+        ruta = os.path.join(args.out, f"{r['nombre']}_{fname}".replace(' ', '_'))
+        with open(ruta, 'wb') as fh:
+            fh.write(data)
+        print(f"{ruta} ({r['tiempos'][fname]:.2f} s)")
+    for err in r['errores']:
+        print(f"ERROR: {err}", file=sys.stderr)
+    return 1 if r['errores'] else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m ms_data.cli',
+                                     description='Mundo Solar Suite — informes sin interfaz')
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p_rep = sub.add_parser('report', help='Genera PDF/XLSX de mediciones y fallas de un mes')
+    p_rep.add_argument('--plant', required=True, help="ID de planta (ej. PL-003) o 'all'")
+    p_rep.add_argument('--period', help='Mes YYYY-MM (por defecto, el mes anterior)')
+    p_rep.add_argument('--out', default='.', help='Directorio de salida')
+    p_rep.add_argument('--credentials', help='Ruta al JSON de la cuenta de servicio')
+    p_rep.add_argument('--workers', type=int, default=None, help="Procesos para --plant all")
+    p_rep.set_defaults(func=cmd_report)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+ms_data/contadores.py
+══════════════════════════════════════════════════════════════
+Contadores de fallas por planta mantenidos de forma incremental.
+
+Se construyen una vez desde df_fallas al cargar los datos y después
+la capa de datos los actualiza en cada alta (guardar_falla) o baja
+(eliminar_por_id sobre "Fallas"), sin volver a agrupar la tabla.
+La barra lateral y el badge "Fusibles (n)" los leen sin recorrerla:
+total y críticos en O(1), últimos 30 días con una búsqueda binaria.
+══════════════════════════════════════════════════════════════
+"""
+import bisect
+
+import pandas as pd
+
+from ms_data.analysis import clasificar_falla_amp, _to_float
+from ms_data.runtime import en_streamlit
+
+CLASES_CRITICAS = ('OC (0A)', 'Fatiga (<4A)')
+_KEY_SESION     = 'contadores_fallas'
+
+
+def _es_critica(amp) -> bool:
+    return clasificar_falla_amp(_to_float(amp, 0)) in CLASES_CRITICAS
+
+
+def _marca(fecha):
+    """Fecha → entero ns (None si no es válida)."""
+    ts = pd.to_datetime(fecha, errors='coerce')
+    return None if pd.isna(ts) else int(ts.value)
+
+
+class ContadoresFallas:
+    """Totales, críticos y fechas ordenadas de fallas por planta."""
+
+    def __init__(self):
+        self._total    = {}   # planta → n fallas
+        self._criticos = {}   # planta → n fallas críticas
+        self._fechas   = {}   # planta → lista ordenada de fechas (ns)
+        self._por_id   = {}   # ID falla → (planta, fecha_ns, crítica)
+
+    @classmethod
+    def desde_df(cls, df_fallas: pd.DataFrame) -> 'ContadoresFallas':
+        c = cls()
+        if df_fallas is None or df_fallas.empty or 'Planta_ID' not in df_fallas.columns:
+            return c
+        pids  = df_fallas['Planta_ID'].astype(str)
+        # Equivale a clasificar_falla_amp(a) in CLASES_CRITICAS (OC = 0 A, Fatiga < 4 A)
+        amp   = df_fallas['Amperios'] if 'Amperios' in df_fallas.columns else pd.Series(0, index=df_fallas.index)
+        crit  = pd.to_numeric(amp, errors='coerce').fillna(0) < 4.0
+        marca = (pd.to_datetime(df_fallas['Fecha'], errors='coerce') if 'Fecha' in df_fallas.columns
+                 else pd.Series(pd.NaT, index=df_fallas.index))
+        validas = marca.notna()
+        ns = pd.Series(marca.to_numpy().astype('datetime64[ns]').astype('int64'), index=df_fallas.index)
+        c._total    = pids.value_counts().to_dict()
+        c._criticos = pids[crit].value_counts().to_dict()
+        c._fechas   = {pid: sorted(g.tolist()) for pid, g in ns[validas].groupby(pids[validas])}
+        if 'ID' in df_fallas.columns:
+            c._por_id = {i: (p, f if v else None, k) for i, p, f, v, k in zip(
+                df_fallas['ID'].astype(str).tolist(), pids.tolist(), ns.tolist(), validas.tolist(), crit.tolist())}
+        return c
+
+    # ── Actualización incremental ────────────────────────────
+    def agregar(self, falla: dict):
+        pid, ns, crit = str(falla.get('Planta_ID', '')), _marca(falla.get('Fecha')), _es_critica(falla.get('Amperios', 0))
+        self._total[pid] = self._total.get(pid, 0) + 1
+        if crit:
+            self._criticos[pid] = self._criticos.get(pid, 0) + 1
+        if ns is not None:
+            bisect.insort(self._fechas.setdefault(pid, []), ns)
+        if falla.get('ID'):
+            self._por_id[str(falla['ID'])] = (pid, ns, crit)
+
+    def quitar(self, falla_id) -> bool:
+        reg = self._por_id.pop(str(falla_id).strip(), None)
+        if reg is None:
+            return False
+        pid, ns, crit = reg
+        self._total[pid] = max(0, self._total.get(pid, 0) - 1)
+        if crit:
+            self._criticos[pid] = max(0, self._criticos.get(pid, 0) - 1)
+        fechas = self._fechas.get(pid, [])
+        i = bisect.bisect_left(fechas, ns) if ns is not None else len(fechas)
+        if i < len(fechas) and fechas[i] == ns:
+            del fechas[i]
+        return True
+
+    # ── Lectura ──────────────────────────────────────────────
+    def total(self, planta_id) -> int:
+        return self._total.get(str(planta_id), 0)
+
+    def criticos(self, planta_id) -> int:
+        return self._criticos.get(str(planta_id), 0)
+
+    def recientes(self, planta_id, dias=30) -> int:
+        fechas = self._fechas.get(str(planta_id), [])
+        limite = (pd.Timestamp.now() - pd.Timedelta(days=dias)).value
+        return len(fechas) - bisect.bisect_left(fechas, limite)
+
+    def de(self, planta_id) -> dict:
+        return {'total': self.total(planta_id), 'ult_30d': self.recientes(planta_id),
+                'criticos': self.criticos(planta_id)}
+
+
+# ── Instancia de la sesión ───────────────────────────────────
+_global = None
+
+
+def construir_contadores(df_fallas: pd.DataFrame) -> ContadoresFallas:
+    """Reconstruye los contadores desde una carga completa de la hoja Fallas."""
+    return _guardar(ContadoresFallas.desde_df(df_fallas))
+
+
+def contadores_fallas() -> ContadoresFallas:
+    """Contadores activos (session_state dentro de la app, módulo en headless)."""
+    if en_streamlit():
+        import streamlit as st
+        c = st.session_state.get(_KEY_SESION)
+        if c is None:
+            c = construir_contadores(st.session_state.get('df_fallas'))
+        return c
+    global _global
+    if _global is None:
+        _global = ContadoresFallas()
+    return _global
+
+
+def _guardar(c):
+    global _global
+    if en_streamlit():
+        import streamlit as st
+        st.session_state[_KEY_SESION] = c
+    else:
+        _global = c
+    return c
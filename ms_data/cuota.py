@@ -0,0 +1,239 @@
+"""
+ms_data/cuota.py
+══════════════════════════════════════════════════════════════
+Contabilidad y ritmo de llamadas a la API de Google Sheets.
+
+Toda hoja que entrega sheets.get_worksheet viene envuelta en
+HojaContada: cada método que pega a la API (get_all_records,
+col_values, append_row, update_cell, delete_rows...) pasa por aquí y
+
+1. espera turno en la ventana de lectura o escritura (compartida por
+   todas las sesiones del proceso: la cuota es de la cuenta de
+   servicio, no del usuario de la app). La ventana es deslizante de
+   60 s: mientras el último minuto lleve menos llamadas que el límite
+   se llama sin esperar, así que una carga en frío bajo la cuota no se
+   frena; solo al acercarse al límite se espera a que salga la más
+   antigua;
+2. se cuenta por operación y hoja;
+3. si Google responde 429 / RESOURCE_EXHAUSTED, reintenta con backoff
+   exponencial con jitter completo.
+
+Las llamadas hechas dentro de `with prioritaria():` (la carga de las
+tablas críticas en app.py) pasan primero: mientras una espera lugar en
+la ventana, las demás no toman los que se liberan.
+
+Límites por defecto: 60 lecturas y 60 escrituras por minuto (cuota
+por usuario de Sheets API v4); ajustables con MS_SHEETS_LECTURAS_MIN /
+MS_SHEETS_ESCRITURAS_MIN o configurar_cuota(). `open` se cuenta pero no
+consume cuota de Sheets (es una búsqueda en Drive).
+══════════════════════════════════════════════════════════════
+"""
+import os
+import time
+import random
+import threading
+from collections import deque, defaultdict
+from contextlib import contextmanager
+
+import pandas as pd
+
+from ms_data.trazas import tramo
+
+LECTURAS_MIN   = int(os.environ.get('MS_SHEETS_LECTURAS_MIN', 60))
+ESCRITURAS_MIN = int(os.environ.get('MS_SHEETS_ESCRITURAS_MIN', 60))
+MAX_REINTENTOS = 5
+BACKOFF_BASE_S = 1.0
+BACKOFF_MAX_S  = 32.0
+ESPERA_MAX_S   = 90.0     # tope de espera por token antes de llamar igual
+
+OPS_LECTURA = frozenset({
+    'get_all_records', 'get_all_values', 'get_values', 'col_values', 'row_values',
+    'acell', 'cell', 'find', 'findall', 'batch_get', 'get',
+})
+OPS_SIN_CUOTA = frozenset({'open'})    # Drive, no Sheets API
+OPS_ESCRITURA = frozenset({
+    'append_row', 'append_rows', 'update_cell', 'update_cells', 'update', 'batch_update',
+    'delete_rows', 'insert_row', 'insert_rows', 'clear', 'batch_clear',
+})
+
+
+class VentanaCuota:
+    """Ventana deslizante de 60 s thread-safe: hasta `por_minuto` llamadas sin esperar."""
+
+    def __init__(self, por_minuto: int):
+        self._lock   = threading.Lock()
+        self._marcas = deque()
+        self._prioritarias = 0    # llamadas prioritarias esperando lugar
+        self.limite  = max(por_minuto, 1)
+
+    def configurar(self, por_minuto: int):
+        """Cambia el límite; las llamadas en curso y en espera se conservan."""
+        with self._lock:
+            self.limite = max(por_minuto, 1)
+
+    def _purgar(self, ahora):
+        while self._marcas and ahora - self._marcas[0] >= 60:
+            self._marcas.popleft()
+
+    def disponibles(self) -> int:
+        with self._lock:
+            self._purgar(time.monotonic())
+            return self.limite - len(self._marcas)
+
+    def adquirir(self, espera_max=ESPERA_MAX_S, prioritaria=False) -> float:
+        """
+        Bloquea hasta que haya lugar en el último minuto; devuelve los
+        segundos esperados. Una llamada no prioritaria además cede el
+        lugar mientras haya prioritarias esperando.
+        """
+        inicio, en_cola = time.monotonic(), False
+        while True:
+            with self._lock:
+                ahora = time.monotonic()
+                self._purgar(ahora)
+                hay_lugar = len(self._marcas) < self.limite
+                if (hay_lugar and (prioritaria or not self._prioritarias)) or ahora - inicio >= espera_max:
+                    self._marcas.append(ahora)
+                    if en_cola:
+                        self._prioritarias -= 1
+                    return ahora - inicio
+                if prioritaria and not en_cola:
+                    self._prioritarias += 1
+                    en_cola = True
+                falta = 60 - (ahora - self._marcas[0]) if not hay_lugar else 0.05
+            time.sleep(min(max(falta, 0.01), 1.0))
+
+
+_ventanas = {
+    'lectura':   VentanaCuota(LECTURAS_MIN),
+    'escritura': VentanaCuota(ESCRITURAS_MIN),
+}
+_lock        = threading.Lock()
+_hilo        = threading.local()
+_conteo      = defaultdict(lambda: [0, 0, 0.0])   # (op, hoja) → [llamadas, errores, ms]
+_ventana     = {'lectura': deque(), 'escritura': deque()}
+_stats       = {'reintentos_429': 0, 'espera_s': 0.0, 'agotadas': 0}
+
+
+def configurar_cuota(lecturas_min=None, escrituras_min=None):
+    """Cambia los límites en caliente (p.ej. para pruebas de carga)."""
+    global LECTURAS_MIN, ESCRITURAS_MIN
+    LECTURAS_MIN   = lecturas_min or LECTURAS_MIN
+    ESCRITURAS_MIN = escrituras_min or ESCRITURAS_MIN
+    _ventanas['lectura'].configurar(LECTURAS_MIN)
+    _ventanas['escritura'].configurar(ESCRITURAS_MIN)
+
+
+@contextmanager
+def prioritaria():
+    """Las llamadas del hilo dentro del bloque tienen prioridad en la ventana."""
+    previa = getattr(_hilo, 'prioritaria', False)
+    _hilo.prioritaria = True
+    try:
+        yield
+    finally:
+        _hilo.prioritaria = previa
+
+
+def _tipo(op: str) -> str:
+    return 'escritura' if op in OPS_ESCRITURA else 'lectura'
+
+
+def es_429(e: Exception) -> bool:
+    resp = getattr(e, 'response', None)
+    if getattr(resp, 'status_code', None) == 429:
+        return True
+    txt = str(e)
+    return '429' in txt or 'RESOURCE_EXHAUSTED' in txt or 'Quota exceeded' in txt
+
+
+def _backoff(intento: int) -> float:
+    """Full jitter: uniforme en [0, min(max, base·2^intento)]."""
+    return random.uniform(0, min(BACKOFF_MAX_S, BACKOFF_BASE_S * 2 ** intento))
+
+
+def llamar(op: str, hoja: str, fn, *args, **kwargs):
+    """Ejecuta una llamada a la API con ventana de cuota, conteo y reintento de 429."""
+    tipo = _tipo(op)
+    for intento in range(MAX_REINTENTOS + 1):
+        if op not in OPS_SIN_CUOTA:
+            espera = _ventanas[tipo].adquirir(prioritaria=getattr(_hilo, 'prioritaria', False))
+            with _lock:
+                _ventana[tipo].append(time.monotonic())
+                _stats['espera_s'] += espera
+        t0 = time.perf_counter()
+        try:
+            with tramo(f"sheets.api.{op}", hoja=hoja, intento=intento):
+                res = fn(*args, **kwargs)
+            _anotar(op, hoja, t0, error=False)
+            return res
+        except Exception as e:
+            _anotar(op, hoja, t0, error=True)
+            if not es_429(e) or intento == MAX_REINTENTOS:
+                if es_429(e):
+                    with _lock:
+                        _stats['agotadas'] += 1
+                raise
+            with _lock:
+                _stats['reintentos_429'] += 1
+            time.sleep(_backoff(intento))
+
+
+def _anotar(op, hoja, t0, error):
+    ms = (time.perf_counter() - t0) * 1000
+    with _lock:
+        c = _conteo[(op, hoja)]
+        c[0] += 1
+        c[1] += int(error)
+        c[2] += ms
+
+
+class HojaContada:
+    """Proxy de gspread.Worksheet: los métodos de API pasan por llamar()."""
+
+    def __init__(self, ws):
+        self._ws = ws
+
+    def __getattr__(self, nombre):
+        attr = getattr(self._ws, nombre)
+        if nombre in OPS_LECTURA or nombre in OPS_ESCRITURA:
+            titulo = getattr(self._ws, 'title', '?')
+            return lambda *a, **k: llamar(nombre, titulo, attr, *a, **k)
+        return attr
+
+
+# ── Lectura ──────────────────────────────────────────────────
+def uso_cuota() -> dict:
+    """Uso del último minuto frente a los límites y lugares libres en cada ventana."""
+    ahora = time.monotonic()
+    with _lock:
+        for q in _ventana.values():
+            while q and ahora - q[0] > 60:
+                q.popleft()
+        uso = {t: len(q) for t, q in _ventana.items()}
+        stats = dict(_stats)
+    return {
+        'lecturas_min': uso['lectura'],   'limite_lecturas': LECTURAS_MIN,
+        'escrituras_min': uso['escritura'], 'limite_escrituras': ESCRITURAS_MIN,
+        'libres_lectura': _ventanas['lectura'].disponibles(),
+        'libres_escritura': _ventanas['escritura'].disponibles(),
+        **stats,
+    }
+
+
+def conteo_llamadas() -> pd.DataFrame:
+    """Llamadas acumuladas por operación y hoja desde el arranque del proceso."""
+    with _lock:
+        filas = [{'Operacion': op, 'Hoja': hoja, 'Tipo': _tipo(op), 'Llamadas': n,
+                  'Errores': err, 'Media_ms': round(ms / n, 1) if n else 0.0}
+                 for (op, hoja), (n, err, ms) in _conteo.items()]
+    df = pd.DataFrame(filas, columns=['Operacion', 'Hoja', 'Tipo', 'Llamadas', 'Errores', 'Media_ms'])
+    return df.sort_values('Llamadas', ascending=False).reset_index(drop=True)
+
+
+def reiniciar_conteo():
+    with _lock:
+        _conteo.clear()
+        for q in _ventana.values():
+            q.clear()
+        _stats.update(reintentos_429=0, espera_s=0.0, agotadas=0)
@@ -18,6 +18,7 @@ from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
+from ms_data.trazas import trazado
 from ms_data.analysis import (
     clean_text, _to_float, _to_int, obtener_nombre_mes, 
     clasificar_falla_amp, clasificar_falla_isc, analizar_mediciones
@@ -41,16 +42,208 @@ class PDF(FPDF):
         self.set_text_color(150,150,150)
         self.cell(0,10,f'Pagina {self.page_no()} - Mundo Solar Suite',0,0,'C')
 
-def generar_pdf_fallas(planta_nombre, df_fallas, df_med=None, cfg=None, periodo_str="Historico"):
+# ══════════════════════════════════════════════════════════════
+# PREPARACIÓN DE TABLAS PDF
+# Cada tabla se resuelve en una sola pasada sobre columnas → listas
+# planas (filas de texto + color de fondo) que consume el loop FPDF.
+# ══════════════════════════════════════════════════════════════
+_ALT_PAR, _ALT_IMPAR = (247,249,252), (255,255,255)
+
+def _col_str(df, col, default=''):
+    """Columna como lista de str (equivale a str(r.get(col, default)) por fila)."""
+    if col not in df.columns: return [str(default)] * len(df)
+    return df[col].astype(str).tolist()
+
+def _col_num(df, col, default=0.0):
+    """Columna numérica como lista de float (equivale a _to_float por fila)."""
+    if col not in df.columns: return [default] * len(df)
+    return pd.to_numeric(df[col], errors='coerce').fillna(default).astype(float).tolist()
+
+def _col_fecha(df, col, fmt, default=''):
+    """Columna de fecha formateada; NaT → default."""
+    if col not in df.columns: return [default] * len(df)
+    return pd.to_datetime(df[col], errors='coerce').dt.strftime(fmt).fillna(default).tolist()
+
+def _tipo_fallas(df, isc_stc):
+    """Clasificación por fila: Isc corregida si hay irradiancia (>50 W/m²), si no por amperaje."""
+    def _tipo_row(r):
+        irr = _to_float(r.get('Irradiancia_Wm2', 0))
+        return clasificar_falla_isc(r['Amperios'], isc_stc, irr) if irr > 50 else clasificar_falla_amp(r['Amperios'])
+    return df.apply(_tipo_row, axis=1) if not df.empty else pd.Series(dtype=object)
+
+def _filas_pdf_fallas(df, color_tipo):
+    """Tabla 'Fusibles registrados' del informe de fallas."""
+    filas, fondos = [], []
+    cols = zip(_col_fecha(df, 'Fecha', '%d/%m/%Y'), _col_str(df, 'Inversor'), _col_str(df, 'Caja'),
+               _col_str(df, 'String'), _col_str(df, 'Polaridad'), _col_num(df, 'Amperios'),
+               _col_num(df, 'Irradiancia_Wm2'), _col_str(df, 'Tipo'), _col_str(df, 'Nota'))
+    for i, (fecha, inv, caja, strg, pol, amp, irr, tipo, nota) in enumerate(cols):
+        filas.append([fecha, inv, caja, strg, pol[:3], f"{amp:.1f}", str(int(irr)) if irr > 0 else '-',
+                      clean_text(tipo)[:18], clean_text(nota)[:25]])
+        fondos.append(color_tipo.get(tipo, _ALT_PAR if i%2==0 else _ALT_IMPAR))
+    return filas, fondos
+
+def _filas_pdf_desv_cb(df):
+    """Tabla 'Strings con desviacion respecto a su CB' del informe de fallas."""
+    sid_col = 'String ID' if 'String ID' in df.columns else 'String_ID'
+    filas, fondos = [], []
+    cols = zip(_col_str(df, 'Equipo'), _col_str(df, sid_col), _col_num(df, 'Amperios'),
+               _col_num(df, 'Promedio_Caja'), _col_num(df, 'Desv_CB_pct'), _col_str(df, 'Diagnostico'))
+    for i, (equipo, sid, amp, prom, desv, diag) in enumerate(cols):
+        if 'CRITICO' in diag or 'CORTE' in diag: fondos.append((250,219,216))
+        elif 'ALERTA' in diag:                    fondos.append((254,249,231))
+        else:                                     fondos.append(_ALT_PAR if i%2==0 else _ALT_IMPAR)
+        filas.append([equipo, sid, f"{amp:.2f}", f"{prom:.3f}",
+                      f"{desv:+.1f}%", clean_text(diag)[:20]])
+    return filas, fondos
+
+def _filas_pdf_recurrencia(df, color_r):
+    """Tabla de strings recurrentes (Ubicacion, N, Categoria, fechas, MTBF)."""
+    filas, fondos = [], []
+    cols = zip(_col_str(df, 'Ubicacion'), df['N_Fallas'].astype(int).tolist(), _col_str(df, 'Categoria'),
+               _col_fecha(df, 'Primera', '%d/%m/%y', '-'), _col_fecha(df, 'Ultima', '%d/%m/%y', '-'),
+               df['MTBF_dias'].tolist() if 'MTBF_dias' in df.columns else [None] * len(df))
+    for ubic, n, cat, prim, ult, mtbf in cols:
+        mtbf_s = f"{mtbf:.1f}" if mtbf is not None else '-'
+        filas.append([ubic[:28], str(n), clean_text(cat)[:18], prim, ult, mtbf_s])
+        fondos.append(color_r.get(cat, _ALT_PAR))
+    return filas, fondos
+
+def _filas_pdf_top_cb(df, total):
+    """Tabla 'Top Cajas (CB)'. La alternancia usa la etiqueta del índice (orden previo al sort)."""
+    filas, fondos = [], []
+    cols = zip(df.index.tolist(), _col_str(df, 'Inversor'), _col_str(df, 'Caja'),
+               df['N_Fallas'].astype(int).tolist(), df['Strings'].astype(int).tolist())
+    for i, inv, caja, n, n_str in cols:
+        pct = f"{round(n / total * 100, 1)}%" if total > 0 else "0%"
+        filas.append([inv, caja, str(n), str(n_str), pct])
+        fondos.append((250,219,216) if n > 3 else (_ALT_PAR if i%2==0 else _ALT_IMPAR))
+    return filas, fondos
+
+def _filas_pdf_resumen_cb(cb_sum, df_proc, desv_cb):
+    """Tabla 'Corriente media por CB' con conteo de alertas/críticos por caja en un solo groupby."""
+    diag = df_proc['Diagnostico']
+    marcas = pd.DataFrame({'Equipo': df_proc['Equipo'],
+                           'al': diag.eq('ALERTA'),
+                           'cr': diag.isin(['CRÍTICO','OC (0A)'])})
+    cnt = (marcas.groupby('Equipo')[['al','cr']].sum()
+                 .reindex(cb_sum['Equipo']).fillna(0).astype(int))
+    filas, fondos = [], []
+    cols = zip(_col_str(cb_sum, 'Equipo'), cb_sum['I_media'].tolist(), cb_sum['I_min'].tolist(),
+               cb_sum['I_max'].tolist(), cb_sum['Istd'].tolist(), desv_cb.tolist(),
+               cnt['al'].tolist(), cnt['cr'].tolist())
+    for i, (equipo, i_med, i_min, i_max, istd, desv_g, n_al, n_cr) in enumerate(cols):
+        bg_alt = _ALT_PAR if i%2==0 else _ALT_IMPAR
+        fondos.append((250,219,216) if n_cr>0 else (254,249,231) if n_al>0 else bg_alt)
+        filas.append([equipo, f"{i_med:.3f}", f"{i_min:.2f}", f"{i_max:.2f}", f"{istd:.3f}",
+                      f"{desv_g:+.2f}%", str(n_al), str(n_cr)])
+    return filas, fondos
+
+def _causa_accion(desv, uc):
+    """Causa probable y acción sugerida por desviación respecto a la CB (np.select)."""
+    conds = [desv <= uc, desv <= -7]
+    causas = np.select(conds, ["Modulo defectuoso / conector MC4 danado o bypass activado",
+                               "Modulo degradado / suciedad intensa o sombra parcial"],
+                       default="Suciedad leve / sombra o degradacion inicial").tolist()
+    acciones = np.select(conds, ["Inspeccion urgente + termografia + curva I-V",
+                                 "Inspeccion + limpieza + revision conectores"],
+                         default="Monitorear + limpieza preventiva").tolist()
+    return causas, acciones
+
+def _filas_pdf_fuera_rango(df_anom, uc):
+    """Tabla 'STRINGS FUERA DE RANGO' con causa/acción resueltas por np.select."""
+    desv = np.array(_col_num(df_anom, 'Desv_CB_pct'), dtype=float)
+    causas, acciones = _causa_accion(desv, uc)
+    filas, fondos = [], []
+    cols = zip(_col_str(df_anom, 'Equipo'), _col_str(df_anom, 'String ID'), _col_num(df_anom, 'Amperios'),
+               _col_num(df_anom, 'Promedio_Caja'), desv.tolist(), _col_str(df_anom, 'Diagnostico'),
+               causas, acciones)
+    for i, (equipo, sid, amp, prom, d, diag, causa, accion) in enumerate(cols, 1):
+        fondos.append((250,219,216) if ('CRITICO' in diag or 'CORTE' in diag) else (254,249,231))
+        vals = [str(i), equipo, sid, f"{amp:.2f}", f"{prom:.3f}", f"{d:+.1f}%",
+                diag, causa, accion]
+        filas.append([v[:35] for v in vals])
+    return filas, fondos
+
+# ══════════════════════════════════════════════════════════════
+# MOTOR DE TABLAS PDF
+# Paginación precalculada por página (sin get_y() ni chequeo de salto
+# por fila). Solo API pública de FPDF (cell, set_fill_color, set_xy):
+# funciona igual con fpdf 1.7 y con fpdf2, que se instala con el mismo
+# nombre de módulo pero cambia los internos. Cada tabla codifica sus celdas
+# a latin-1 (clean_text) una sola vez por texto distinto; los generadores
+# de filas entregan texto crudo salvo donde truncan.
+# ══════════════════════════════════════════════════════════════
+LIMITE_DETALLE_PDF = 1500   # filas de detalle sugeridas antes de pasar a modo resumen
+
+class _TablaPDF:
+    def __init__(self, pdf, hdrs, anchos, h_fila, y_max=265, h_hdr=7,
+                 font_hdr=8, font_fila=7.5, align='C', hdr_bg=(46,109,164), font_hdr_salto=None):
+        self.pdf, self.hdrs, self.anchos = pdf, hdrs, anchos
+        self.h_fila, self.y_max, self.h_hdr = h_fila, y_max, h_hdr
+        self.font_hdr, self.font_fila = font_hdr, font_fila
+        self.font_hdr_salto = font_hdr if font_hdr_salto is None else font_hdr_salto
+        self.align, self.hdr_bg = align, hdr_bg
+        self._txt = {}   # texto crudo → texto latin-1 de la celda
+
+    def encabezado(self, font_hdr=None):
+        pdf = self.pdf
+        pdf.set_font("Arial","B",font_hdr or self.font_hdr); pdf.set_fill_color(*self.hdr_bg); pdf.set_text_color(255,255,255)
+        for h, w in zip(self.hdrs, self.anchos): pdf.cell(w, self.h_hdr, h, 1, 0, 'C', True)
+        pdf.ln(); pdf.set_font("Arial","",self.font_fila); pdf.set_text_color(0,0,0)
+
+    def _cupo(self, y, restantes):
+        """Filas que caben desde y: misma regla que 'dibujar fila y saltar si y > y_max'."""
+        h, trigger, n = self.h_fila, self.pdf.page_break_trigger, 0
+        while n < restantes and y + h <= trigger:
+            y += h; n += 1
+            if y > self.y_max: break
+        return n
+
+    def dibujar(self, filas, fondos):
+        """
+        Dibuja las filas página a página. El cupo garantiza que ninguna
+        celda dispara el salto automático; el color de fondo solo se
+        cambia cuando difiere del de la fila anterior y cada texto distinto
+        se codifica una vez por tabla.
+        """
+        pdf, h, anchos, align, txt = self.pdf, self.h_fila, self.anchos, self.align, self._txt
+        i, n = 0, len(filas)
+        while i < n:
+            cupo = self._cupo(pdf.get_y(), n - i)
+            if cupo == 0:
+                pdf.add_page(); self.encabezado(self.font_hdr_salto); continue
+            x0, y, bg_actual = pdf.l_margin, pdf.get_y(), None
+            for j in range(i, i + cupo):
+                if fondos[j] != bg_actual:
+                    bg_actual = fondos[j]; pdf.set_fill_color(*bg_actual)
+                pdf.set_xy(x0, y)
+                for v, w in zip(filas[j], anchos):
+                    t = txt.get(v)
+                    if t is None:
+                        t = txt[v] = clean_text(v)
+                    pdf.cell(w, h, t, 1, 0, align, True)
+                y += h
+            pdf.set_xy(x0, y)
+            i += cupo
+            if i < n:
+                pdf.add_page(); self.encabezado(self.font_hdr_salto)
+
+def _nota_detalle_omitido(pdf, omitidas, total):
+    """Pie de tabla en modo resumen: indica cuántas filas quedaron en el anexo CSV."""
+    if omitidas <= 0: return
+    pdf.set_font("Arial","I",7.5); pdf.set_text_color(120,120,120)
+    pdf.cell(0, 6, clean_text(f"... {omitidas} de {total} filas omitidas en modo resumen — detalle completo en anexo CSV"), 0, 1, 'L')
+    pdf.set_text_color(0,0,0)
+
+@trazado()
+def generar_pdf_fallas(planta_nombre, df_fallas, df_med=None, cfg=None, periodo_str="Historico", max_filas_detalle=None):
     pdf = PDF()
     pdf.add_page()
 
     isc_stc = _to_float(cfg.get('Isc_STC_A', 9.07)) if cfg else 9.07
     df_fallas = df_fallas.copy()
-    def _tipo_row(r):
-        irr = _to_float(r.get('Irradiancia_Wm2', 0))
-        return clasificar_falla_isc(r['Amperios'], isc_stc, irr) if irr > 50 else clasificar_falla_amp(r['Amperios'])
-    df_fallas['Tipo'] = df_fallas.apply(_tipo_row, axis=1)
+    df_fallas['Tipo'] = _tipo_fallas(df_fallas, isc_stc)
 
     prom_med   = df_med['Amperios'].mean() if df_med is not None and not df_med.empty else None
     df_anom_med = pd.DataFrame()
@@ -103,35 +296,18 @@ def generar_pdf_fallas(planta_nombre, df_fallas, df_med=None, cfg=None, periodo_
     pdf.set_fill_color(192,57,43); pdf.set_text_color(255,255,255)
     pdf.cell(0, 7, clean_text(f"Fusibles registrados — {total} eventos"), 0, 1, 'L', True)
     pdf.ln(1)
-    pdf.set_fill_color(46,109,164)
-    hdrs = ["Fecha","Inv","Caja","String","Pol","A","Irr.","Tipo","Nota"]
-    ws_  = [20, 14, 12, 12, 22, 11, 14, 30, 45]
-    for h, w in zip(hdrs, ws_): pdf.cell(w, 7, h, 1, 0, 'C', True)
-    pdf.ln()
-    pdf.set_font("Arial","",7.5); pdf.set_text_color(0,0,0)
+    tabla = _TablaPDF(pdf, ["Fecha","Inv","Caja","String","Pol","A","Irr.","Tipo","Nota"],
+                      [20, 14, 12, 12, 22, 11, 14, 30, 45], 6.5, y_max=262, font_hdr=9,
+                      font_hdr_salto=7.5, align='L')
+    tabla.encabezado()
     color_tipo = {
         'OC (0A)': (250,219,216), 'Fallo grave (<-30%)': (235,180,180),
         'Critico (-15% a -30%)': (250,219,216), 'Alerta (-5% a -15%)': (254,249,231),
         'Alerta (4-6A)': (254,249,231), 'Critico (<4A)': (250,219,216),
     }
-    for i, (_, r) in enumerate(df_fallas.iterrows()):
-        tipo = str(r.get('Tipo',''))
-        bg = color_tipo.get(tipo, (247,249,252) if i%2==0 else (255,255,255))
-        pdf.set_fill_color(*bg)
-        fecha_str = r['Fecha'].strftime('%d/%m/%Y') if pd.notna(r.get('Fecha')) else ''
-        irr_val = _to_float(r.get('Irradiancia_Wm2',0))
-        irr_str = str(int(irr_val)) if irr_val > 0 else '-'
-        vals = [fecha_str, str(r.get('Inversor','')), str(r.get('Caja','')),
-                str(r.get('String','')), str(r.get('Polaridad',''))[:3],
-                f"{_to_float(r.get('Amperios',0)):.1f}", irr_str,
-                clean_text(tipo)[:18], clean_text(str(r.get('Nota','')))[:25]]
-        for v, w in zip(vals, ws_): pdf.cell(w, 6.5, clean_text(str(v)), 1, 0, 'L', True)
-        pdf.ln()
-        if pdf.get_y() > 262:
-            pdf.add_page()
-            pdf.set_font("Arial","B",7.5); pdf.set_fill_color(46,109,164); pdf.set_text_color(255,255,255)
-            for h, w in zip(hdrs, ws_): pdf.cell(w,7,h,1,0,'C',True)
-            pdf.ln(); pdf.set_font("Arial","",7.5); pdf.set_text_color(0,0,0)
+    df_det = df_fallas if max_filas_detalle is None else df_fallas.head(max_filas_detalle)
+    tabla.dibujar(*_filas_pdf_fallas(df_det, color_tipo))
+    _nota_detalle_omitido(pdf, total - len(df_det), total)
 
     if not df_anom_med.empty:
         pdf.ln(5)
@@ -139,30 +315,11 @@ def generar_pdf_fallas(planta_nombre, df_fallas, df_med=None, cfg=None, periodo_
         pdf.set_fill_color(231,118,26); pdf.set_text_color(255,255,255)
         pdf.cell(0, 7, clean_text(f"Strings con desviacion respecto a su CB — {len(df_anom_med)} detectados"), 0, 1, 'L', True)
         pdf.ln(1)
-        pdf.set_fill_color(46,109,164)
-        hdrs2 = ["Equipo (CB)","String","I medida (A)","Prom. CB (A)","Desv. %","Estado"]
-        ws2   = [40, 22, 28, 28, 22, 40]
-        for h, w in zip(hdrs2, ws2): pdf.cell(w, 7, h, 1, 0, 'C', True)
-        pdf.ln()
-        pdf.set_font("Arial","",7.5); pdf.set_text_color(0,0,0)
-        sid_col = 'String ID' if 'String ID' in df_anom_med.columns else 'String_ID'
-        for i, (_, r) in enumerate(df_anom_med.head(50).iterrows()):
-            desv = _to_float(r.get('Desv_CB_pct', 0))
-            diag = str(r.get('Diagnostico',''))
-            if 'CRITICO' in diag or 'CORTE' in diag: pdf.set_fill_color(250,219,216)
-            elif 'ALERTA' in diag:                    pdf.set_fill_color(254,249,231)
-            else: pdf.set_fill_color(247,249,252) if i%2==0 else pdf.set_fill_color(255,255,255)
-            vals2 = [str(r.get('Equipo','')), str(r.get(sid_col,'')),
-                     f"{_to_float(r.get('Amperios',0)):.2f}",
-                     f"{_to_float(r.get('Promedio_Caja',0)):.3f}",
-                     f"{desv:+.1f}%", clean_text(diag)[:20]]
-            for v, w in zip(vals2, ws2): pdf.cell(w, 6.5, clean_text(v), 1, 0, 'C', True)
-            pdf.ln()
-            if pdf.get_y() > 262:
-                pdf.add_page()
-                pdf.set_font("Arial","B",7.5); pdf.set_fill_color(46,109,164); pdf.set_text_color(255,255,255)
-                for h, w in zip(hdrs2, ws2): pdf.cell(w,7,h,1,0,'C',True)
-                pdf.ln(); pdf.set_font("Arial","",7.5); pdf.set_text_color(0,0,0)
+        tabla = _TablaPDF(pdf, ["Equipo (CB)","String","I medida (A)","Prom. CB (A)","Desv. %","Estado"],
+                          [40, 22, 28, 28, 22, 40], 6.5, y_max=262, font_hdr=9,
+                          font_hdr_salto=7.5)
+        tabla.encabezado()
+        tabla.dibujar(*_filas_pdf_desv_cb(df_anom_med.head(50)))
 
     conteo_pdf, recur_pdf, cb_pdf = _calcular_recurrencia_df(df_fallas)
     if not conteo_pdf.empty:
@@ -191,31 +348,12 @@ def generar_pdf_fallas(planta_nombre, df_fallas, df_med=None, cfg=None, periodo_
         pdf.ln(7)
 
         if not recur_pdf.empty:
-            pdf.set_font("Arial","B",8)
-            pdf.set_fill_color(46,109,164); pdf.set_text_color(255,255,255)
-            hdrs_r = ["Ubicacion","N Fallas","Categoria","Primera","Ultima","MTBF(d)"]
-            ws_r   = [55, 16, 28, 22, 22, 17]
-            for h,w in zip(hdrs_r, ws_r): pdf.cell(w,7,h,1,0,'C',True)
-            pdf.ln()
-            pdf.set_font("Arial","",7.5); pdf.set_text_color(0,0,0)
+            tabla = _TablaPDF(pdf, ["Ubicacion","N Fallas","Categoria","Primera","Ultima","MTBF(d)"],
+                              [55, 16, 28, 22, 22, 17], 6.5, font_hdr_salto=7.5)
+            tabla.encabezado()
             color_r = {'Sin recurrencia':(247,249,252),'Recurrente (2x)':(254,249,231),
                        'Critico (3-4x)':(250,219,216),'Cronico (5+)':(245,183,177)}
-            for _, row in recur_pdf.head(30).iterrows():
-                cat = str(row.get('Categoria',''))
-                bg  = color_r.get(cat,(247,249,252))
-                pdf.set_fill_color(*bg)
-                prim = row['Primera'].strftime('%d/%m/%y') if pd.notna(row.get('Primera')) else '-'
-                ult  = row['Ultima'].strftime('%d/%m/%y')  if pd.notna(row.get('Ultima'))  else '-'
-                mtbf = f"{row['MTBF_dias']:.1f}" if row.get('MTBF_dias') is not None else '-'
-                vals_r = [str(row['Ubicacion'])[:28], str(int(row['N_Fallas'])),
-                          clean_text(cat)[:18], prim, ult, mtbf]
-                for v,w in zip(vals_r, ws_r): pdf.cell(w,6.5,clean_text(v),1,0,'C',True)
-                pdf.ln()
-                if pdf.get_y() > 265:
-                    pdf.add_page()
-                    pdf.set_font("Arial","B",7.5); pdf.set_fill_color(46,109,164); pdf.set_text_color(255,255,255)
-                    for h,w in zip(hdrs_r, ws_r): pdf.cell(w,7,h,1,0,'C',True)
-                    pdf.ln(); pdf.set_font("Arial","",7.5); pdf.set_text_color(0,0,0)
+            tabla.dibujar(*_filas_pdf_recurrencia(recur_pdf.head(30), color_r))
 
         # ── NUEVA TABLA TOP CBs PARA EL PDF ──
         if not cb_pdf.empty:
@@ -224,25 +362,10 @@ def generar_pdf_fallas(planta_nombre, df_fallas, df_med=None, cfg=None, periodo_
             pdf.set_fill_color(192,57,43); pdf.set_text_color(255,255,255)
             pdf.cell(0, 7, clean_text("Top Cajas (CB) con mayor incidencia de fallas"), 0, 1, 'L', True)
             pdf.ln(1)
-            pdf.set_font("Arial","B",8)
-            pdf.set_fill_color(46,109,164); pdf.set_text_color(255,255,255)
-            hdrs_cb = ["Inversor", "Caja (CB)", "N Fallas", "Strings Afect.", "% del Total"]
-            ws_cb   = [40, 40, 30, 40, 35]
-            for h,w in zip(hdrs_cb, ws_cb): pdf.cell(w,7,h,1,0,'C',True)
-            pdf.ln()
-            pdf.set_font("Arial","",7.5); pdf.set_text_color(0,0,0)
-            for i, row in cb_pdf.head(20).iterrows():
-                bg = (250,219,216) if int(row['N_Fallas']) > 3 else ((247,249,252) if i%2==0 else (255,255,255))
-                pdf.set_fill_color(*bg)
-                pct = f"{round(int(row['N_Fallas']) / total * 100, 1)}%" if total > 0 else "0%"
-                vals_cb = [str(row.get('Inversor','')), str(row['Caja']), str(int(row['N_Fallas'])), str(int(row['Strings'])), pct]
-                for v,w in zip(vals_cb, ws_cb): pdf.cell(w,6.5,clean_text(v),1,0,'C',True)
-                pdf.ln()
-                if pdf.get_y() > 265:
-                    pdf.add_page()
-                    pdf.set_font("Arial","B",7.5); pdf.set_fill_color(46,109,164); pdf.set_text_color(255,255,255)
-                    for h,w in zip(hdrs_cb, ws_cb): pdf.cell(w,7,h,1,0,'C',True)
-                    pdf.ln(); pdf.set_font("Arial","",7.5); pdf.set_text_color(0,0,0)
+            tabla = _TablaPDF(pdf, ["Inversor", "Caja (CB)", "N Fallas", "Strings Afect.", "% del Total"],
+                              [40, 40, 30, 40, 35], 6.5, font_hdr_salto=7.5)
+            tabla.encabezado()
+            tabla.dibujar(*_filas_pdf_top_cb(cb_pdf.head(20), total))
 
     _out = pdf.output(dest='S')
     if isinstance(_out, bytes): return _out
@@ -283,7 +406,8 @@ def _narrativa_auto(df_proc, planta_nombre):
     )
     return texto
 
-def generar_pdf_mediciones(planta_nombre, df, cfg=None, restriccion_mw=None, capacidad_mw=0, num_inversores=1, df_fallas=None, periodo_str="Actual"):
+@trazado()
+def generar_pdf_mediciones(planta_nombre, df, cfg=None, restriccion_mw=None, capacidad_mw=0, num_inversores=1, df_fallas=None, periodo_str="Actual", max_filas_detalle=None):
     import tempfile, os
     pdf = PDF()
 
@@ -317,6 +441,7 @@ def generar_pdf_mediciones(planta_nombre, df, cfg=None, restriccion_mw=None, cap
     df_anom  = df_proc[df_proc['Diagnostico']!='NORMAL'].sort_values('Desv_CB_pct', ascending=True)
     cb_sum   = df_proc.groupby('Equipo')['Amperios'].agg(['mean','min','max','std']).reset_index()
     cb_sum.columns = ['Equipo','I_media','I_min','I_max','Istd']
+    desv_cb  = ((cb_sum['I_media'] - prom_g) / prom_g * 100) if prom_g > 0 else pd.Series(0.0, index=cb_sum.index)
 
     nota_restriccion = None
     if rest_activa:
@@ -448,11 +573,9 @@ def generar_pdf_mediciones(planta_nombre, df, cfg=None, restriccion_mw=None, cap
     pdf.set_text_color(0,0,0); pdf.ln(2)
     try:
         import plotly.graph_objects as go_pdf
-        colors_bar = []
-        for _, row in cb_sum.iterrows():
-            desv = ((row['I_media'] - prom_g) / prom_g * 100) if prom_g > 0 else 0
-            colors_bar.append('#C0392B' if desv <= uc else '#E67E22' if desv <= ua else '#1E8449')
-            
+        colors_bar = np.select([desv_cb <= uc, desv_cb <= ua], ['#C0392B', '#E67E22'],
+                               default='#1E8449').tolist()
+
         fig_bar = go_pdf.Figure(go_pdf.Bar(
             # AHORA MUESTRA EL EQUIPO COMPLETO, NO SE OCULTA "Inv-1>"
             x=cb_sum['Equipo'],
@@ -481,7 +604,7 @@ def generar_pdf_mediciones(planta_nombre, df, cfg=None, restriccion_mw=None, cap
     pdf.ln(3)
 
     try:
-        import plotly.express as px_pdf
+        from ms_data.charts import box
         paleta = ['#e6194b', '#3cb44b', '#ffe119', '#4363d8', '#f58231', 
                    '#911eb4', '#46f0f0', '#f032e6', '#bcf60c', '#fabebe', 
                    '#008080', '#e6beff', '#9a6324', '#fffac8', '#800000', 
@@ -490,8 +613,9 @@ def generar_pdf_mediciones(planta_nombre, df, cfg=None, restriccion_mw=None, cap
         equipos_unicos = df_proc['Equipo'].unique()
         mapa_colores = {eq: paleta[i] for i, eq in enumerate(equipos_unicos)}
 
-        fig_box = px_pdf.box(df_proc, x='Equipo', y='Amperios', color='Equipo', 
-                             color_discrete_map=mapa_colores, points='outliers')
+        # Sobre el presupuesto de puntos las cajas llegan precalculadas a kaleido
+        fig_box = box(df_proc, 'Equipo', 'Amperios', color='Equipo',
+                      color_discrete_map=mapa_colores, points='outliers')
         
         for trazo in fig_box.data:
             color_asignado = mapa_colores.get(trazo.name, '#1F5C8B')
@@ -520,24 +644,10 @@ def generar_pdf_mediciones(planta_nombre, df, cfg=None, restriccion_mw=None, cap
         pdf.cell(0, 8, f"[Boxplot no disponible: {e}]", 0, 1, 'C')
         pdf.set_text_color(0,0,0)
 
-    pdf.set_font("Arial","B",9); pdf.set_fill_color(46,109,164); pdf.set_text_color(255,255,255)
-    h_cols = ["Equipo (CB)","I media","I min","I max","Std Dev","Desv.Global%","Alertas","Criticos"]
-    w_cols = [38,20,18,18,18,25,18,18]
-    for h,w in zip(h_cols,w_cols): pdf.cell(w,8,h,1,0,'C',True)
-    pdf.ln(); pdf.set_text_color(0,0,0)
-
-    for i,(_, r) in enumerate(cb_sum.iterrows()):
-        desv_g = ((r['I_media']-prom_g)/prom_g*100) if prom_g>0 else 0
-        n_al = len(df_proc[(df_proc['Equipo']==r['Equipo']) & (df_proc['Diagnostico']=='ALERTA')])
-        n_cr = len(df_proc[(df_proc['Equipo']==r['Equipo']) & (df_proc['Diagnostico'].isin(['CRÍTICO','OC (0A)']))])
-        bg_alt = (247,249,252) if i%2==0 else (255,255,255)
-        bg_row = (250,219,216) if n_cr>0 else (254,249,231) if n_al>0 else bg_alt
-        pdf.set_fill_color(*bg_row)
-        pdf.set_font("Arial","",8)
-        vals = [str(r['Equipo']), f"{r['I_media']:.3f}", f"{r['I_min']:.2f}",
-                f"{r['I_max']:.2f}", f"{r['Istd']:.3f}", f"{desv_g:+.2f}%", str(n_al), str(n_cr)]
-        for v,w in zip(vals,w_cols): pdf.cell(w,7,clean_text(v),1,0,'C',True)
-        pdf.ln()
+    tabla = _TablaPDF(pdf, ["Equipo (CB)","I media","I min","I max","Std Dev","Desv.Global%","Alertas","Criticos"],
+                      [38,20,18,18,18,25,18,18], 7, h_hdr=8, font_hdr=9, font_fila=8)
+    tabla.encabezado()
+    tabla.dibujar(*_filas_pdf_resumen_cb(cb_sum, df_proc, desv_cb))
 
     pdf.add_page()
     pdf.set_font("Arial","B",12); pdf.set_fill_color(192,57,43); pdf.set_text_color(255,255,255)
@@ -549,46 +659,48 @@ def generar_pdf_mediciones(planta_nombre, df, cfg=None, restriccion_mw=None, cap
         pdf.cell(0,10,"No se detectaron desviaciones criticas en esta inspeccion.",1,1,'C',True)
         pdf.set_text_color(0,0,0)
     else:
-        def causa_pdf(d):
-            if d <= uc: return "Modulo defectuoso / conector MC4 danado o bypass activado"
-            if d <= -7: return "Modulo degradado / suciedad intensa o sombra parcial"
-            return "Suciedad leve / sombra o degradacion inicial"
-        def accion_pdf(d):
-            if d <= uc: return "Inspeccion urgente + termografia + curva I-V"
-            if d <= -7: return "Inspeccion + limpieza + revision conectores"
-            return "Monitorear + limpieza preventiva"
-
-        pdf.set_font("Arial","B",8); pdf.set_fill_color(46,109,164); pdf.set_text_color(255,255,255)
-        h2 = ["#","Caja","String","I (A)","Prom.CB","Desv%","Estado","Causa","Accion"]
-        w2 = [8, 30, 16, 14, 14, 14, 20, 42, 42]
-        for h,w in zip(h2,w2): pdf.cell(w,8,h,1,0,'C',True)
-        pdf.ln(); pdf.set_text_color(0,0,0)
-
-        for i,(_, r) in enumerate(df_anom.iterrows(), 1):
-            diag = str(r.get('Diagnostico',''))
-            desv = _to_float(r.get('Desv_CB_pct',0))
-            if 'CRITICO' in diag or 'CORTE' in diag: pdf.set_fill_color(250,219,216)
-            else:                                      pdf.set_fill_color(254,249,231)
-            pdf.set_font("Arial","",7)
-            vals = [str(i), str(r.get('Equipo','')),
-                    str(r.get('String ID','')),
-                    f"{_to_float(r.get('Amperios',0)):.2f}",
-                    f"{_to_float(r.get('Promedio_Caja',0)):.3f}",
-                    f"{desv:+.1f}%", clean_text(diag),
-                    clean_text(causa_pdf(desv)), clean_text(accion_pdf(desv))]
-            for v,w in zip(vals,w2): pdf.cell(w,7,v[:35],1,0,'C',True)
-            pdf.ln()
-            if pdf.get_y() > 265:
-                pdf.add_page()
-                pdf.set_font("Arial","B",8); pdf.set_fill_color(46,109,164); pdf.set_text_color(255,255,255)
-                for h,w in zip(h2,w2): pdf.cell(w,8,h,1,0,'C',True)
-                pdf.ln(); pdf.set_text_color(0,0,0)
+        tabla = _TablaPDF(pdf, ["#","Caja","String","I (A)","Prom.CB","Desv%","Estado","Causa","Accion"],
+                          [8, 30, 16, 14, 14, 14, 20, 42, 42], 7, h_hdr=8, font_fila=7)
+        tabla.encabezado()
+        df_det = df_anom if max_filas_detalle is None else df_anom.head(max_filas_detalle)
+        tabla.dibujar(*_filas_pdf_fuera_rango(df_det, uc))
+        _nota_detalle_omitido(pdf, len(df_anom) - len(df_det), len(df_anom))
 
     _out = pdf.output(dest='S')
     if isinstance(_out, bytes): return _out
     if isinstance(_out, bytearray): return bytes(_out)
     return _out.encode('latin-1')
 
+# ══════════════════════════════════════════════════════════════
+# ANEXOS CSV (detalle completo para el modo resumen de los PDF)
+# ══════════════════════════════════════════════════════════════
+def _csv_bytes(df):
+    return df.to_csv(index=False, sep=';', decimal=',').encode('utf-8-sig')
+
+@trazado()
+def generar_csv_fallas(df_fallas, cfg=None):
+    """Todas las fallas con su clasificación (complemento de generar_pdf_fallas)."""
+    isc_stc = _to_float(cfg.get('Isc_STC_A', 9.07)) if cfg else 9.07
+    df = df_fallas.copy()
+    df['Tipo'] = _tipo_fallas(df, isc_stc)
+    if 'Fecha' in df.columns:
+        df['Fecha'] = pd.to_datetime(df['Fecha'], errors='coerce').dt.strftime('%d/%m/%Y')
+    cols = [c for c in ['Fecha','Inversor','Caja','String','Polaridad','Amperios',
+                        'Irradiancia_Wm2','Tipo','Nota'] if c in df.columns]
+    return _csv_bytes(df[cols])
+
+@trazado()
+def generar_csv_fuera_rango(df_proc, cfg=None):
+    """Strings fuera de rango (salida de analizar_mediciones) con causa y acción sugerida."""
+    uc = _to_int(cfg.get('Umbral_Critico_pct', -10)) if cfg else -10
+    if 'String ID' not in df_proc.columns and 'String_ID' in df_proc.columns:
+        df_proc = df_proc.rename(columns={'String_ID':'String ID'})
+    df = df_proc[df_proc['Diagnostico']!='NORMAL'].sort_values('Desv_CB_pct', ascending=True)
+    cols = [c for c in ['Equipo','String ID','Amperios','Promedio_Caja','Desv_CB_pct','Diagnostico'] if c in df.columns]
+    df = df[cols].copy()
+    df['Causa'], df['Accion'] = _causa_accion(pd.to_numeric(df['Desv_CB_pct'], errors='coerce').fillna(0).to_numpy(), uc)
+    return _csv_bytes(df)
+
 # ══════════════════════════════════════════════════════════════
 # EXCEL ENGINE
 # ══════════════════════════════════════════════════════════════
@@ -642,6 +754,7 @@ def _calcular_recurrencia_df(df_fallas):
                  .reset_index().sort_values('N_Fallas', ascending=False))
     return conteo, recurrentes, cb_rank
 
+@trazado()
 def generar_excel_fallas(planta_nombre, df, periodo="Historico"):
     AZUL='1A3A5C'; AZUL_M='2E6DA4'; ROJO='C0392B'; ROJO_C='FADBD8'
     AMAR_C='FEF9E7'; GRIS='F7F9FC'; BLC='FFFFFF'
@@ -760,6 +873,7 @@ def generar_excel_fallas(planta_nombre, df, periodo="Historico"):
     out=io.BytesIO(); wb.save(out); out.seek(0)
     return out.getvalue()
 
+@trazado()
 def generar_excel_mediciones(planta_nombre, df_proc, cfg=None, df_fallas=None, periodo_str="Actual"):
     AZUL='1A3A5C'; AZUL_M='2E6DA4'; AZUL_C='D8E8F5'; AZUL_OSC='1F5C8B'
     VERDE='1E8449'; VERDE_C='D5F5E3'; ROJO='C0392B'; ROJO_C='FADBD8'
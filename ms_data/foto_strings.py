@@ -0,0 +1,190 @@
+"""
+ms_data/foto_strings.py
+══════════════════════════════════════════════════════════════
+Foto final materializada: última lectura de cada string por planta.
+
+Es el "estado actual" que usan el Context Bar, los KPIs y el heatmap.
+Se construye una vez al cargar Mediciones (un sort + drop_duplicates
+para todo el portafolio) y la capa de datos la mantiene al día:
+- guardar_mediciones_bulk → la lectura nueva reemplaza a la del string
+  si es igual o más reciente (O(1) por fila);
+- eliminar_por_id("Mediciones") → si la fila borrada era la vigente de
+  su string, la planta se marca para recalcular desde df_med en la
+  próxima lectura; si no, no cambia nada. Los IDs dados de baja se
+  recuerdan y se excluyen del recálculo, así un df_med sin recargar no
+  resucita la lectura borrada.
+══════════════════════════════════════════════════════════════
+"""
+import pandas as pd
+
+from ms_data.runtime import en_streamlit
+
+# Orden de columnas de guardar_mediciones_bulk (hoja "Mediciones")
+COLS_FILA  = ['ID', 'Fecha', 'Planta_ID', 'Planta_Nombre', 'Tecnico_ID',
+              'Equipo', 'String ID', 'Amperios', 'Irradiancia_Wm2', 'Restriccion_MW']
+_COLS_STRING = ['String', 'String_ID', 'String ID']
+_KEY_SESION  = 'foto_strings'
+
+
+def _col_string(columnas) -> str:
+    return next((c for c in _COLS_STRING if c in columnas), 'String ID')
+
+
+def _fecha_ns(v):
+    ts = pd.to_datetime(v, errors='coerce')
+    return None if pd.isna(ts) else ts
+
+
+def _ultimas(m: pd.DataFrame) -> tuple:
+    """Última lectura por (planta, equipo, string) con claves normalizadas → (df, col_eq, sid)."""
+    sid = _col_string(m.columns)
+    col_eq = 'Equipo' if 'Equipo' in m.columns else 'Inversor'
+    m = m.assign(**{col_eq: m[col_eq].astype(str).str.strip(), sid: m[sid].astype(str).str.strip()})
+    if 'Fecha' in m.columns:
+        m = m.sort_values('Fecha', kind='stable')
+    clave = pd.DataFrame({'p': m['Planta_ID'].astype(str), 'e': m[col_eq], 's': m[sid]})
+    return m[~clave.duplicated(keep='last').to_numpy()], col_eq, sid
+
+
+class FotoStrings:
+    """Última lectura por (planta, equipo, string), con versión por planta."""
+
+    def __init__(self):
+        self._por_planta = {}   # planta → {(equipo, string): registro}
+        self._df         = {}   # planta → DataFrame materializado (cache)
+        self._vigentes   = {}   # ID medición vigente → (planta, clave)
+        self._sucias     = set()
+        self._bajas      = set()   # IDs eliminados desde la última carga completa
+        self._version    = {}
+        self._columnas   = COLS_FILA
+
+    @classmethod
+    def desde_df(cls, df_med: pd.DataFrame) -> 'FotoStrings':
+        """Una sola pasada para todo el portafolio: sort + drop_duplicates + reparto por planta."""
+        f = cls()
+        if df_med is None or df_med.empty or 'Planta_ID' not in df_med.columns:
+            return f
+        f._columnas = list(df_med.columns)
+        m, col_eq, sid = _ultimas(df_med)
+        pids = m['Planta_ID'].astype(str).tolist()
+        for pid in df_med['Planta_ID'].astype(str).unique():
+            f._por_planta[pid] = {}
+            f._version[pid] = 1
+        for pid, r in zip(pids, m.to_dict('records')):
+            f._registrar(pid, (r[col_eq], r[sid]), r)
+        return f
+
+    def _cargar_planta(self, pid, df_med):
+        """Recalcula la foto de una sola planta (marcada por una baja) desde el histórico."""
+        for reg in self._por_planta.get(pid, {}).values():
+            self._vigentes.pop(str(reg.get('ID', '')), None)
+        self._por_planta[pid] = {}
+        if df_med is not None and not df_med.empty:
+            m = df_med[df_med['Planta_ID'].astype(str) == pid]
+            if self._bajas and 'ID' in m.columns:
+                m = m[~m['ID'].astype(str).str.strip().isin(self._bajas)]
+            if not m.empty:
+                m, col_eq, sid = _ultimas(m)
+                for r in m.to_dict('records'):
+                    self._registrar(pid, (r[col_eq], r[sid]), r)
+        self._sucias.discard(pid)
+        self._df.pop(pid, None)
+        self._version[pid] = self._version.get(pid, 0) + 1
+
+    def _registrar(self, pid, clave, registro):
+        previo = self._por_planta[pid].get(clave)
+        if previo is not None:
+            self._vigentes.pop(str(previo.get('ID', '')), None)
+        self._por_planta[pid][clave] = registro
+        if registro.get('ID'):
+            self._vigentes[str(registro['ID'])] = (pid, clave)
+
+    # ── Actualización incremental ────────────────────────────
+    def agregar_filas(self, filas: list):
+        """Filas en el formato de guardar_mediciones_bulk (lista de listas)."""
+        for fila in filas:
+            r = dict(zip(COLS_FILA, fila))
+            pid = str(r['Planta_ID']).strip()
+            r['Fecha'] = _fecha_ns(r['Fecha'])
+            r['Amperios'] = pd.to_numeric(r.get('Amperios'), errors='coerce')
+            clave = (str(r['Equipo']).strip(), str(r['String ID']).strip())
+            r['Equipo'], r['String ID'] = clave
+            sid = _col_string(self._columnas)
+            if sid != 'String ID':
+                r[sid] = r.pop('String ID')
+            foto = self._por_planta.setdefault(pid, {})
+            actual = foto.get(clave)
+            f_act = actual.get('Fecha') if actual is not None else None
+            if actual is None or f_act is None or pd.isna(f_act) or (r['Fecha'] is not None and r['Fecha'] >= f_act):
+                self._registrar(pid, clave, r)
+                self._df.pop(pid, None)
+                self._version[pid] = self._version.get(pid, 0) + 1
+
+    def quitar(self, medicion_id) -> bool:
+        """Baja de una medición; True si era la lectura vigente de su string."""
+        mid = str(medicion_id).strip()
+        self._bajas.add(mid)
+        reg = self._vigentes.pop(mid, None)
+        if reg is None:
+            return False
+        pid, clave = reg
+        self._por_planta.get(pid, {}).pop(clave, None)
+        self._sucias.add(pid)
+        self._df.pop(pid, None)
+        self._version[pid] = self._version.get(pid, 0) + 1
+        return True
+
+    # ── Lectura ──────────────────────────────────────────────
+    def version(self, planta_id) -> int:
+        return self._version.get(str(planta_id), 0)
+
+    def de(self, planta_id, df_med: pd.DataFrame = None) -> pd.DataFrame:
+        """
+        Foto de la planta ordenada por Fecha. Si una baja dejó la planta
+        marcada, se recalcula desde df_med sin las filas dadas de baja
+        (sirve tanto el histórico recargado como el anterior a la baja).
+        """
+        pid = str(planta_id)
+        if pid in self._sucias and df_med is not None:
+            self._cargar_planta(pid, df_med)
+        if pid not in self._df:
+            regs = list(self._por_planta.get(pid, {}).values())
+            df = pd.DataFrame(regs, columns=self._columnas) if regs else pd.DataFrame()
+            if not df.empty and 'Fecha' in df.columns:
+                df['Fecha'] = pd.to_datetime(df['Fecha'], errors='coerce')
+                df = df.sort_values('Fecha', kind='stable').reset_index(drop=True)
+            self._df[pid] = df
+        return self._df[pid]
+
+
+# ── Instancia de la sesión ───────────────────────────────────
+_global = None
+
+
+def construir_foto(df_med: pd.DataFrame) -> FotoStrings:
+    """Reconstruye la foto desde una carga completa de la hoja Mediciones."""
+    return _guardar(FotoStrings.desde_df(df_med))
+
+
+def foto_strings() -> FotoStrings:
+    """Foto activa (session_state dentro de la app, módulo en headless)."""
+    if en_streamlit():
+        import streamlit as st
+        f = st.session_state.get(_KEY_SESION)
+        if f is None:
+            f = construir_foto(st.session_state.get('df_mediciones'))
+        return f
+    global _global
+    if _global is None:
+        _global = FotoStrings()
+    return _global
+
+
+def _guardar(f):
+    global _global
+    if en_streamlit():
+        import streamlit as st
+        st.session_state[_KEY_SESION] = f
+    else:
+        _global = f
+    return f
@@ -0,0 +1,288 @@
+"""
+ms_data/gspread_falso.py
+══════════════════════════════════════════════════════════════
+Backend de Google Sheets en memoria para pruebas de carga y perfilado
+sin una planilla real.
+
+ClienteFalso imita lo que sheets.py usa de gspread: open() → libro,
+libro.worksheet() → hoja, y en la hoja get_all_records,
+get_all_values, col_values, row_values, append_row(s), update_cell,
+delete_rows y batch_update. Los valores se guardan como strings, igual
+que los entrega la API con formato; get_all_records numeriza como
+gspread.
+
+Cada llamada espera una latencia configurable y puede fallar con 429
+(al azar con prob_429, o por superar limite_min llamadas por minuto
+como hace Google), de modo que la ventana de cuota y los reintentos de
+ms_data/cuota.py se ejercitan igual que en producción. Por hoja se
+puede fijar otra latencia (latencia_hoja_ms) o un número de errores 500
+antes de responder (fallos_hoja), para ver la carga progresiva de
+app.py con una hoja lenta o caída.
+
+    from ms_data.gspread_falso import ClienteFalso, Perfil, instalar
+    cli = ClienteFalso({'Plantas': hoja_desde_df(df, cols)}, Perfil(latencia_ms=80))
+    instalar(cli)      # sheets.configurar_cliente(lambda: cli)
+══════════════════════════════════════════════════════════════
+"""
+import re
+import time
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+OPS_ESCRITURA = frozenset({'append_row', 'append_rows', 'update_cell', 'delete_rows', 'batch_update'})
+
+
+@dataclass
+class Perfil:
+    """Latencias (ms, media ± jitter relativo) y errores de cuota simulados."""
+    latencia_ms:           float = 0.0
+    latencia_escritura_ms: float = None    # None → igual que latencia_ms
+    jitter:                float = 0.25
+    prob_429:              float = 0.0
+    limite_min:            int   = None    # llamadas/min antes de responder 429
+    latencia_hoja_ms:      dict  = field(default_factory=dict)   # hoja → ms (reemplaza latencia_ms)
+    fallos_hoja:           dict  = field(default_factory=dict)   # hoja → n errores 500 antes de responder
+
+
+class ErrorCuotaFalso(Exception):
+    """429 con la misma forma que gspread.exceptions.APIError (cuota.es_429 lo reconoce)."""
+
+    class _Respuesta:
+        status_code = 429
+
+    def __init__(self, op):
+        super().__init__(f"APIError: [429]: Quota exceeded (RESOURCE_EXHAUSTED) en {op}")
+        self.response = self._Respuesta()
+
+
+class HojaNoEncontrada(Exception):
+    pass
+
+
+class ErrorServidorFalso(Exception):
+    """500 transitorio (no es de cuota: cuota.llamar no lo reintenta)."""
+
+
+class _Servidor:
+    """Estado compartido por el cliente: perfil, ventana de cuota y conteo."""
+
+    def __init__(self, perfil: Perfil):
+        self.perfil  = perfil
+        self._lock   = threading.Lock()
+        self._ultimo = deque()
+        self.llamadas = 0
+        self.errores_429 = 0
+
+    def atender(self, op: str, hoja: str = None):
+        p = self.perfil
+        base = p.latencia_escritura_ms if op in OPS_ESCRITURA and p.latencia_escritura_ms is not None else p.latencia_ms
+        base = p.latencia_hoja_ms.get(hoja, base)
+        ahora = time.monotonic()
+        with self._lock:
+            self.llamadas += 1
+            fallo = p.fallos_hoja.get(hoja, 0) > 0 and op not in ('open', 'worksheet')
+            if fallo:
+                p.fallos_hoja[hoja] -= 1
+            while self._ultimo and ahora - self._ultimo[0] > 60:
+                self._ultimo.popleft()
+            excedida = p.limite_min is not None and len(self._ultimo) >= p.limite_min
+            if not excedida:
+                self._ultimo.append(ahora)
+            rechazo = excedida or (p.prob_429 and random.random() < p.prob_429)
+            if rechazo:
+                self.errores_429 += 1
+        if base:
+            time.sleep(max(0.0, random.uniform(1 - p.jitter, 1 + p.jitter) * base) / 1000)
+        if rechazo:
+            raise ErrorCuotaFalso(op)
+        if fallo:
+            raise ErrorServidorFalso(f"APIError: [500]: Internal error en {op} ({hoja})")
+
+
+def _numerizar(v: str):
+    if not isinstance(v, str) or v == '':
+        return v
+    try:
+        return int(v)
+    except ValueError:
+        pass
+    try:
+        return float(v)
+    except ValueError:
+        return v
+
+
+def _a1(celda: str) -> tuple:
+    """'C12' → (12, 3)."""
+    m = re.fullmatch(r'([A-Za-z]+)(\d+)', celda.strip())
+    if not m:
+        raise ValueError(f"Rango no soportado: {celda}")
+    col = 0
+    for ch in m.group(1).upper():
+        col = col * 26 + ord(ch) - 64
+    return int(m.group(2)), col
+
+
+class HojaFalsa:
+    def __init__(self, titulo: str, filas: list, servidor: _Servidor):
+        self.title = titulo
+        self._filas = [[str(v) for v in f] for f in filas]
+        self._srv = servidor
+        self._lock = threading.Lock()
+
+    @property
+    def row_count(self) -> int:
+        return len(self._filas)
+
+    def _celda(self, fila: int, col: int, valor):
+        while len(self._filas) < fila:
+            self._filas.append([])
+        f = self._filas[fila - 1]
+        f.extend([''] * (col - len(f)))
+        f[col - 1] = '' if valor is None else str(valor)
+
+    # ── Lectura ──────────────────────────────────────────────
+    def get_all_values(self, *args, **kwargs) -> list:
+        self._srv.atender('get_all_values', self.title)
+        with self._lock:
+            ancho = max((len(f) for f in self._filas), default=0)
+            return [f + [''] * (ancho - len(f)) for f in self._filas]
+
+    def get_all_records(self, expected_headers=None, head=1, numericise_ignore=(), **kwargs) -> list:
+        self._srv.atender('get_all_records', self.title)
+        with self._lock:
+            filas = [list(f) for f in self._filas]
+        if len(filas) < head:
+            return []
+        ancho = max(len(f) for f in filas)
+        encabezado = filas[head - 1] + [''] * (ancho - len(filas[head - 1]))
+        if expected_headers:
+            faltan = set(expected_headers) - set(encabezado)
+            if faltan:
+                # Mismo contrato que gspread: sheets._safe_get_records cae a get_all_values
+                raise ValueError(f"headers esperados no encontrados en fila {head}: {sorted(faltan)}")
+        ignorar = 'all' in numericise_ignore
+        return [dict(zip(encabezado, (v if ignorar else _numerizar(v) for v in f + [''] * (ancho - len(f)))))
+                for f in filas[head:]]
+
+    def col_values(self, col: int, *args, **kwargs) -> list:
+        self._srv.atender('col_values', self.title)
+        with self._lock:
+            vals = [f[col - 1] if len(f) >= col else '' for f in self._filas]
+        while vals and vals[-1] == '':
+            vals.pop()
+        return vals
+
+    def row_values(self, fila: int, *args, **kwargs) -> list:
+        self._srv.atender('row_values', self.title)
+        with self._lock:
+            return list(self._filas[fila - 1]) if fila <= len(self._filas) else []
+
+    # ── Escritura ────────────────────────────────────────────
+    def append_row(self, values, value_input_option=None, **kwargs):
+        self._srv.atender('append_row', self.title)
+        with self._lock:
+            self._filas.append(['' if v is None else str(v) for v in values])
+
+    def append_rows(self, values, value_input_option=None, **kwargs):
+        self._srv.atender('append_rows', self.title)
+        with self._lock:
+            self._filas.extend(['' if v is None else str(v) for v in f] for f in values)
+
+    def update_cell(self, fila: int, col: int, valor):
+        self._srv.atender('update_cell', self.title)
+        with self._lock:
+            self._celda(fila, col, valor)
+
+    def delete_rows(self, inicio: int, fin: int = None):
+        self._srv.atender('delete_rows', self.title)
+        with self._lock:
+            del self._filas[inicio - 1:(fin or inicio)]
+
+    def batch_update(self, data: list, **kwargs):
+        """data = [{'range': 'B2' | 'B2:D3', 'values': [[...], ...]}, ...]"""
+        self._srv.atender('batch_update', self.title)
+        with self._lock:
+            for bloque in data:
+                fila0, col0 = _a1(bloque['range'].split('!')[-1].split(':')[0])
+                for i, fila in enumerate(bloque['values']):
+                    for j, v in enumerate(fila):
+                        self._celda(fila0 + i, col0 + j, v)
+
+
+class LibroFalso:
+    def __init__(self, titulo: str, hojas: dict, servidor: _Servidor):
+        self.title = titulo
+        self._hojas = {n: HojaFalsa(n, filas, servidor) for n, filas in hojas.items()}
+        self._srv = servidor
+
+    def worksheet(self, nombre: str) -> HojaFalsa:
+        self._srv.atender('worksheet', nombre)
+        if nombre not in self._hojas:
+            raise HojaNoEncontrada(nombre)
+        return self._hojas[nombre]
+
+    def worksheets(self) -> list:
+        return list(self._hojas.values())
+
+
+class ClienteFalso:
+    """Sustituto de gspread.Client: un único libro con las hojas dadas."""
+
+    def __init__(self, hojas: dict, perfil: Perfil = None):
+        self.servidor = _Servidor(perfil or Perfil())
+        self._hojas = hojas
+        self._libro = None
+
+    @property
+    def perfil(self) -> Perfil:
+        return self.servidor.perfil
+
+    def open(self, titulo: str) -> LibroFalso:
+        self.servidor.atender('open')
+        if self._libro is None:
+            self._libro = LibroFalso(titulo, self._hojas, self.servidor)
+        return self._libro
+
+
+def hoja_desde_df(df: pd.DataFrame, columnas: list, titulo: str = None) -> list:
+    """
+    Filas de hoja (strings) a partir de un DataFrame. Fechas como
+    YYYY-MM-DD; columnas ausentes quedan vacías. Con `titulo` se
+    antepone una fila de título, como las hojas con encabezado en fila 2.
+    """
+    cuerpo = pd.DataFrame(index=df.index)
+    for col in columnas:
+        s = df[col] if col in df.columns else pd.Series('', index=df.index)
+        if pd.api.types.is_datetime64_any_dtype(s):
+            s = s.dt.strftime('%Y-%m-%d')
+        cuerpo[col] = s.astype(object).where(s.notna(), '').astype(str)
+    filas = [list(columnas)] + cuerpo.values.tolist()
+    return ([[titulo] + [''] * (len(columnas) - 1)] if titulo else []) + filas
+
+
+# ── Instalación en ms_data.sheets ────────────────────────────
+_instalado = None
+
+
+def instalar(cliente: ClienteFalso):
+    """sheets.get_gsheet_client devuelve `cliente` hasta desinstalar()."""
+    global _instalado
+    from ms_data.sheets import configurar_cliente
+    _instalado = cliente
+    configurar_cliente(lambda: cliente)
+
+
+def desinstalar():
+    global _instalado
+    from ms_data.sheets import configurar_cliente
+    _instalado = None
+    configurar_cliente(None)
+
+
+def instalado():
+    return _instalado
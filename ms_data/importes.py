@@ -0,0 +1,99 @@
+"""
+ms_data/importes.py
+══════════════════════════════════════════════════════════════
+Perfil de arranque: qué cuesta importar cada dependencia.
+
+- perfil_importtime(): lanza un intérprete limpio con `-X importtime`
+  importando un conjunto de módulos (el de app.py para el login, el
+  de una vista...) y devuelve el desglose por módulo y por paquete.
+- modulos_pesados(): qué librerías pesadas están ya cargadas en ESTE
+  proceso (sirve para confirmar que el login no cargó plotly/fpdf).
+
+Se usa desde el panel de depuración (components/perfil_importes.py)
+con MS_PERFIL_IMPORTES=1, o por consola:
+
+    python -m ms_data.importes [login|global|planta|todo]
+══════════════════════════════════════════════════════════════
+"""
+import os
+import re
+import sys
+import subprocess
+
+import pandas as pd
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PESADOS = ('pandas', 'numpy', 'plotly', 'fpdf', 'openpyxl', 'gspread',
+           'google.oauth2', 'kaleido', 'PIL')
+
+# Imports de nivel módulo de cada punto de entrada
+ESCENARIOS = {
+    'login':  ('streamlit', 'pandas', 'components.theme', 'components.cards',
+               'components.assets', 'ms_data.sheets', 'ms_data.contadores',
+               'ms_data.foto_strings'),
+    'global': ('vistas.global_view',),
+    'planta': ('vistas.planta', 'vistas.planta.tab_mediciones', 'vistas.planta.tab_diagnostico',
+               'vistas.planta.tab_fusibles', 'vistas.planta.tab_informes'),
+    'todo':   ('ms_data', 'ms_data.exports', 'ms_data.batch', 'ms_data.charts', 'gspread',
+               'google.oauth2.service_account'),
+}
+
+_LINEA = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)')
+
+
+def modulos_pesados(pesados=PESADOS) -> dict:
+    """{librería: True/False} según esté en sys.modules de este proceso."""
+    return {m: m in sys.modules for m in pesados}
+
+
+def _parsear(stderr: str) -> pd.DataFrame:
+    filas = []
+    for linea in stderr.splitlines():
+        m = _LINEA.match(linea)
+        if m:
+            filas.append({'Modulo': m.group(4), 'Nivel': (len(m.group(3)) - 1) // 2,
+                          'Propio_ms': int(m.group(1)) / 1000, 'Acumulado_ms': int(m.group(2)) / 1000})
+    return pd.DataFrame(filas, columns=['Modulo', 'Nivel', 'Propio_ms', 'Acumulado_ms'])
+
+
+def perfil_importtime(modulos, previos=(), timeout=120) -> pd.DataFrame:
+    """
+    Importa `previos` y luego `modulos` en un proceso nuevo con -X importtime.
+    Solo se reportan los módulos que carga `modulos` (lo que ya trajo
+    `previos` no vuelve a aparecer), así 'global' con previos=login da el
+    costo incremental de abrir la vista.
+    """
+    marca = '__ms_perfil_marca__'
+    codigo = ''.join(f'import {m}\n' for m in previos) + f'import sys; sys.stderr.write("{marca}\\n")\n'
+    codigo += ''.join(f'import {m}\n' for m in modulos)
+    res = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo], cwd=RAIZ,
+                         capture_output=True, text=True, timeout=timeout)
+    stderr = res.stderr.split(marca, 1)[-1]
+    if res.returncode != 0:
+        raise RuntimeError(stderr.strip().splitlines()[-1] if stderr.strip() else f"código {res.returncode}")
+    return _parsear(stderr)
+
+
+def por_paquete(df: pd.DataFrame, top=15) -> pd.DataFrame:
+    """Tiempo propio sumado por paquete raíz (sin doble conteo de acumulados)."""
+    if df.empty:
+        return pd.DataFrame(columns=['Paquete', 'Modulos', 'Total_ms'])
+    paq = df['Modulo'].str.split('.').str[0]
+    res = (df.groupby(paq)['Propio_ms'].agg(['count', 'sum'])
+             .rename(columns={'count': 'Modulos', 'sum': 'Total_ms'})
+             .sort_values('Total_ms', ascending=False).head(top))
+    return res.rename_axis('Paquete').reset_index().round({'Total_ms': 1})
+
+
+def perfil_escenario(nombre: str) -> pd.DataFrame:
+    """Perfil incremental de un escenario sobre el login (el login, sobre nada)."""
+    previos = () if nombre == 'login' else ESCENARIOS['login']
+    return perfil_importtime(ESCENARIOS[nombre], previos=previos)
+
+
+if __name__ == '__main__':
+    for esc in (sys.argv[1:] or ['login', 'global', 'planta']):
+        df = perfil_escenario(esc)
+        print(f"\n── {esc}: {df['Propio_ms'].sum():,.0f} ms, {len(df)} módulos ──")
+        print(por_paquete(df).to_string(index=False))
@@ -0,0 +1,171 @@
+"""
+ms_data/particiones.py
+══════════════════════════════════════════════════════════════
+Mediciones y fallas particionadas por Planta_ID.
+
+Al cargar los datos se agrupa cada tabla una sola vez (groupby →
+posiciones de fila por planta); la página de una planta toma su
+partición en O(1) (la primera vez, un iloc sobre sus propias filas)
+sin recorrer el portafolio completo.
+
+La capa de datos actualiza solo la partición afectada:
+- guardar_falla / guardar_mediciones_bulk → agregar();
+- eliminar_por_id("Fallas" | "Mediciones") → quitar().
+Cada partición lleva su versión, que invalida el modelo de vista de
+esa planta (vistas/planta/modelo.py) y no el de las demás.
+
+Si la tabla de origen cambia (recarga completa o reemplazo en
+session_state), de() re-indexa contra el DataFrame nuevo.
+══════════════════════════════════════════════════════════════
+"""
+import pandas as pd
+
+from ms_data.runtime import en_streamlit
+
+TABLAS      = ('fallas', 'mediciones')
+# Valor para numéricos vacíos, por tabla: los mismos que aplican
+# cargar_fallas / cargar_mediciones, así una fila agregada queda igual
+# que tras una recarga.
+RELLENO_NUMERICO = {
+    'fallas':     {'Amperios': 0, 'Irradiancia_Wm2': 0},
+    'mediciones': {'Amperios': 0, 'Irradiancia_Wm2': 698, 'Restriccion_MW': 0},
+}
+_KEY_SESION = 'particiones'
+
+
+def _pid(v) -> str:
+    return str(v).strip()
+
+
+class Particiones:
+    """Posiciones de fila por planta + particiones materializadas bajo demanda."""
+
+    def __init__(self):
+        self._origen  = {}   # tabla → DataFrame completo indexado
+        self._pos     = {}   # tabla → {planta: posiciones (ndarray)}
+        self._df      = {}   # (tabla, planta) → DataFrame de la partición
+        self._version = {}   # planta → int
+        self._gen     = 0    # sube con cada re-indexado completo
+
+    @classmethod
+    def desde_df(cls, df_fallas: pd.DataFrame, df_med: pd.DataFrame) -> 'Particiones':
+        p = cls()
+        p.indexar('fallas', df_fallas)
+        p.indexar('mediciones', df_med)
+        return p
+
+    def indexar(self, tabla: str, df: pd.DataFrame):
+        """Agrupa `df` por Planta_ID (una pasada) y descarta las particiones previas."""
+        self._origen[tabla] = df
+        if df is None or df.empty or 'Planta_ID' not in df.columns:
+            self._pos[tabla] = {}
+        else:
+            grupos = df.groupby(df['Planta_ID'].astype(str).str.strip(), sort=False).indices
+            self._pos[tabla] = dict(grupos)
+        for clave in [k for k in self._df if k[0] == tabla]:
+            del self._df[clave]
+        self._gen += 1
+
+    # ── Lectura ──────────────────────────────────────────────
+    def de(self, tabla: str, planta_id, df_origen: pd.DataFrame = None) -> pd.DataFrame:
+        """
+        Partición de la planta. Con df_origen, si no es el DataFrame
+        indexado (otra carga), se re-indexa primero.
+        """
+        if df_origen is not None and df_origen is not self._origen.get(tabla):
+            self.indexar(tabla, df_origen)
+        clave = (tabla, _pid(planta_id))
+        if clave not in self._df:
+            origen = self._origen.get(tabla)
+            if origen is None or origen.empty:
+                self._df[clave] = pd.DataFrame() if origen is None else origen
+            else:
+                pos = self._pos.get(tabla, {}).get(clave[1])
+                self._df[clave] = origen.iloc[pos] if pos is not None else origen.iloc[:0]
+        return self._df[clave]
+
+    def plantas(self, tabla: str) -> list:
+        return list(self._pos.get(tabla, {}))
+
+    def version(self, planta_id) -> tuple:
+        return (self._gen, self._version.get(_pid(planta_id), 0))
+
+    # ── Actualización incremental ────────────────────────────
+    def _tocar(self, pid):
+        self._version[pid] = self._version.get(pid, 0) + 1
+
+    def agregar(self, tabla: str, registros: list):
+        """Registros (dicts con columnas de la hoja) → solo sus particiones."""
+        if not registros:
+            return
+        origen = self._origen.get(tabla)
+        nuevos = pd.DataFrame(registros)
+        if origen is not None and not origen.empty:
+            if 'String ID' in nuevos.columns and 'String ID' not in origen.columns and 'String_ID' in origen.columns:
+                nuevos = nuevos.rename(columns={'String ID': 'String_ID'})
+            nuevos = nuevos.reindex(columns=origen.columns)
+        if 'Fecha' in nuevos.columns:
+            nuevos['Fecha'] = pd.to_datetime(nuevos['Fecha'], errors='coerce')
+        for col, relleno in RELLENO_NUMERICO.get(tabla, {}).items():
+            if col in nuevos.columns:
+                nuevos[col] = pd.to_numeric(nuevos[col], errors='coerce').fillna(relleno)
+        nuevos['Planta_ID'] = nuevos['Planta_ID'].astype(str).str.strip()
+        for pid, filas in nuevos.groupby('Planta_ID', sort=False):
+            actual = self.de(tabla, pid)
+            self._df[(tabla, pid)] = pd.concat([actual, filas], ignore_index=True) if not actual.empty else filas
+            self._tocar(pid)
+
+    def _quitar_de(self, tabla, pid, rid) -> bool:
+        parte = self.de(tabla, pid)
+        if parte.empty or 'ID' not in parte.columns:
+            return False
+        mask = parte['ID'].astype(str).str.strip() == rid
+        if not mask.any():
+            return False
+        self._df[(tabla, pid)] = parte[~mask]
+        self._tocar(pid)
+        return True
+
+    def quitar(self, tabla: str, registro_id) -> bool:
+        """Baja por ID: primero en las particiones ya materializadas, luego en el origen."""
+        rid = str(registro_id).strip()
+        if any(self._quitar_de(tabla, pid, rid) for (t, pid) in list(self._df) if t == tabla):
+            return True
+        origen = self._origen.get(tabla)
+        if origen is None or origen.empty or 'ID' not in origen.columns:
+            return False
+        hit = origen.loc[origen['ID'].astype(str).str.strip() == rid, 'Planta_ID']
+        return any(self._quitar_de(tabla, _pid(pid), rid) for pid in hit.unique())
+
+
+# ── Instancia de la sesión ───────────────────────────────────
+_global = None
+
+
+def construir_particiones(df_fallas: pd.DataFrame, df_med: pd.DataFrame) -> Particiones:
+    """Particiona una carga completa de Fallas y Mediciones."""
+    return _guardar(Particiones.desde_df(df_fallas, df_med))
+
+
+def particiones() -> Particiones:
+    """Particiones activas (session_state dentro de la app, módulo en headless)."""
+    if en_streamlit():
+        import streamlit as st
+        p = st.session_state.get(_KEY_SESION)
+        if p is None:
+            p = construir_particiones(st.session_state.get('df_fallas'), st.session_state.get('df_mediciones'))
+        return p
+    global _global
+    if _global is None:
+        _global = Particiones()
+    return _global
+
+
+def _guardar(p):
+    global _global
+    if en_streamlit():
+        import streamlit as st
+        st.session_state[_KEY_SESION] = p
+    else:
+        _global = p
+    return p
@@ -0,0 +1,113 @@
+"""
+ms_data/permisos.py
+══════════════════════════════════════════════════════════════
+Modelo de permisos compilado.
+
+- Cada acción es un bit; cada rol, una máscara en una tabla
+  inmutable calculada al importar.
+- Al iniciar sesión se resuelve una sola vez el Acceso del usuario
+  (rol, máscara y plantas visibles) y se guarda en
+  st.session_state.acceso. puede() queda en un AND de bits.
+
+Alcance por planta: columna opcional `Plantas` de la hoja Usuarios
+(IDs separados por coma; vacío o '*' = todas, como antes de existir la
+columna, también para 'cliente'); 'admin' siempre ve todas. El alcance
+se asigna al crear el usuario o desde la lista de usuarios. El recorte se aplica
+a los DataFrames al cargarlos (acotar) — las vistas reciben ya solo
+las plantas permitidas y no filtran por su cuenta.
+══════════════════════════════════════════════════════════════
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import streamlit as st
+
+VER, INGRESAR, EDITAR, ELIMINAR, ADMIN_USUARIOS, ADMIN = (1 << i for i in range(6))
+
+BITS = MappingProxyType({
+    'ver': VER, 'ingresar': INGRESAR, 'editar': EDITAR, 'eliminar': ELIMINAR,
+    'admin_usuarios': ADMIN_USUARIOS, 'admin': ADMIN,
+})
+MASCARAS_ROL = MappingProxyType({
+    'admin':   VER | INGRESAR | EDITAR | ELIMINAR | ADMIN_USUARIOS | ADMIN,
+    'tecnico': VER | INGRESAR | EDITAR | ELIMINAR,
+    'lector':  VER,
+    'cliente': VER,
+})
+_KEY_SESION = 'acceso'
+
+
+@dataclass(frozen=True)
+class Acceso:
+    rol:     str = ''
+    mascara: int = 0
+    plantas: frozenset = None    # None → todas las plantas
+
+    def puede(self, accion: str) -> bool:
+        return bool(self.mascara & BITS.get(accion, 0))
+
+    def ve_planta(self, planta_id) -> bool:
+        return self.plantas is None or str(planta_id).strip() in self.plantas
+
+
+SIN_ACCESO = Acceso()
+
+
+def _plantas(valor, rol: str):
+    ids = frozenset(p.strip() for p in str(valor or '').split(',') if p.strip())
+    if rol == 'admin' or '*' in ids or not ids:
+        return None
+    return ids
+
+
+def resolver_acceso(usuario: dict) -> Acceso:
+    """Acceso efectivo del usuario devuelto por sheets._autenticar."""
+    if not usuario:
+        return SIN_ACCESO
+    rol = str(usuario.get('rol', '')).strip().lower()
+    return Acceso(rol, MASCARAS_ROL.get(rol, 0), _plantas(usuario.get('plantas', ''), rol))
+
+
+def fijar_acceso(usuario: dict) -> Acceso:
+    """Resuelve y guarda el acceso de la sesión (login)."""
+    acceso = resolver_acceso(usuario)
+    st.session_state[_KEY_SESION] = acceso
+    return acceso
+
+
+def acceso_actual() -> Acceso:
+    acceso = st.session_state.get(_KEY_SESION)
+    if acceso is None:
+        # Sesiones abiertas antes de existir el modelo: se resuelve una vez
+        usuario = st.session_state.get('usuario')
+        if not usuario:
+            return SIN_ACCESO
+        acceso = fijar_acceso(usuario)
+    return acceso
+
+
+def olvidar_acceso():
+    st.session_state.pop(_KEY_SESION, None)
+
+
+def _rol_actual() -> str:
+    return acceso_actual().rol
+
+
+def puede(accion: str) -> bool:
+    return acceso_actual().puede(accion)
+
+
+def requiere_rol(accion: str):
+    acceso = acceso_actual()
+    if not acceso.puede(accion):
+        st.error(f"🚫 Acceso denegado — tu rol ({acceso.rol}) no tiene permiso.")
+        st.stop()
+
+
+def acotar(df, acceso: Acceso = None, col: str = 'Planta_ID'):
+    """Filas de las plantas visibles para `acceso` (por defecto el de la sesión)."""
+    acceso = acceso or acceso_actual()
+    if acceso.plantas is None or df is None or df.empty or col not in df.columns:
+        return df
+    return df[df[col].astype(str).str.strip().isin(acceso.plantas)]
@@ -0,0 +1,158 @@
+"""
+ms_data/runtime.py
+══════════════════════════════════════════════════════════════
+Desacople de la capa de datos respecto del runtime de Streamlit.
+
+- cache_data / cache_resource: decoradores con backend inyectable.
+  Dentro de `streamlit run` delegan en st.cache_data/st.cache_resource;
+  fuera (CLI, cron, scripts) usan un cache en memoria con TTL.
+- abortar(): detiene el render con st.error + st.stop en la app y
+  lanza DatosError en modo headless.
+══════════════════════════════════════════════════════════════
+"""
+import time
+import pickle
+import hashlib
+import threading
+
+import pandas as pd
+
+
+class DatosError(RuntimeError):
+    """Error irrecuperable de la capa de datos fuera de Streamlit."""
+
+
+def en_streamlit() -> bool:
+    """True si el proceso corre bajo `streamlit run` (hay ScriptRunContext)."""
+    try:
+        from streamlit.runtime import exists
+        return exists()
+    except Exception:
+        return False
+
+
+def abortar(mensaje: str):
+    """Equivalente headless-safe de st.error(mensaje); st.stop()."""
+    if en_streamlit():
+        import streamlit as st
+        st.error(mensaje)
+        st.stop()
+    raise DatosError(mensaje)
+
+
+# ══════════════════════════════════════════════════════════════
+# BACKENDS DE CACHE
+# ══════════════════════════════════════════════════════════════
+def _hash_arg(v) -> str:
+    if isinstance(v, pd.DataFrame):
+        h = pd.util.hash_pandas_object(v, index=True).values.tobytes()
+        return 'df:' + hashlib.md5(h + repr(tuple(v.columns)).encode()).hexdigest()
+    if isinstance(v, pd.Series):
+        return 'sr:' + hashlib.md5(pd.util.hash_pandas_object(v, index=True).values.tobytes()).hexdigest()
+    return repr(v)
+
+
+def _clave(args, kwargs) -> str:
+    partes = [_hash_arg(a) for a in args] + [f"{k}={_hash_arg(v)}" for k, v in sorted(kwargs.items())]
+    return hashlib.md5('|'.join(partes).encode()).hexdigest()
+
+
+class CacheMemoria:
+    """
+    Cache en proceso con TTL. Replica la semántica de Streamlit:
+    'data' devuelve una copia nueva en cada hit (pickle), 'resource'
+    devuelve el mismo objeto.
+    """
+    def envolver(self, fn, tipo, ttl=None, **_):
+        store, lock = {}, threading.Lock()
+
+        def wrapper(*args, **kwargs):
+            clave = _clave(args, kwargs)
+            ahora = time.monotonic()
+            with lock:
+                hit = store.get(clave)
+            if hit is not None and (ttl is None or ahora - hit[0] < ttl):
+                return pickle.loads(hit[1]) if tipo == 'data' else hit[1]
+            valor = fn(*args, **kwargs)
+            with lock:
+                store[clave] = (ahora, pickle.dumps(valor) if tipo == 'data' else valor)
+            return valor
+
+        wrapper.clear = lambda: store.clear()
+        return wrapper
+
+
+class CacheStreamlit:
+    """Delega en los decoradores nativos de Streamlit."""
+    def envolver(self, fn, tipo, **kwargs):
+        import streamlit as st
+        deco = st.cache_data if tipo == 'data' else st.cache_resource
+        return deco(**kwargs)(fn)
+
+
+class SinCache:
+    """Sin memoización (útil para pruebas de carga o depuración)."""
+    def envolver(self, fn, tipo, **_):
+        def wrapper(*args, **kwargs):
+            return fn(*args, **kwargs)
+        wrapper.clear = lambda: None
+        return wrapper
+
+
+_backend = None
+
+
+def configurar_cache(backend):
+    """
+    Inyecta el backend de cache: 'streamlit', 'memoria', 'ninguno' o un objeto
+    con método envolver(fn, tipo, **kwargs). None vuelve a la auto-detección.
+    """
+    global _backend
+    if isinstance(backend, str):
+        tipos = {'streamlit': CacheStreamlit, 'memoria': CacheMemoria, 'ninguno': SinCache}
+        if backend not in tipos:
+            raise ValueError(f"Backend de cache desconocido: {backend}")
+        backend = tipos[backend]()
+    _backend = backend
+
+
+def _backend_activo():
+    if _backend is not None:
+        return _backend
+    return CacheStreamlit() if en_streamlit() else CacheMemoria()
+
+
+class _Cacheada:
+    """
+    Función cacheada con backend resuelto en la primera llamada, así el
+    decorador puede aplicarse al importar el módulo antes de saber si
+    estamos dentro de Streamlit o en la CLI.
+    """
+    def __init__(self, fn, tipo, kwargs):
+        self._fn, self._tipo, self._kwargs = fn, tipo, kwargs
+        self._impl, self._impl_backend = None, None
+        self.__name__, self.__doc__, self.__wrapped__ = fn.__name__, fn.__doc__, fn
+
+    def _resolver(self):
+        backend = _backend_activo()
+        if self._impl is None or type(backend) is not type(self._impl_backend):
+            self._impl = backend.envolver(self._fn, self._tipo, **self._kwargs)
+            self._impl_backend = backend
+        return self._impl
+
+    def __call__(self, *args, **kwargs):
+        return self._resolver()(*args, **kwargs)
+
+    def clear(self):
+        if self._impl is not None:
+            self._impl.clear()
+
+
+def cache_data(**kwargs):
+    """Reemplazo de @st.cache_data(...) con backend inyectable."""
+    return lambda fn: _Cacheada(fn, 'data', kwargs)
+
+
+def cache_resource(**kwargs):
+    """Reemplazo de @st.cache_resource(...) con backend inyectable."""
+    return lambda fn: _Cacheada(fn, 'resource', kwargs)
@@ -10,13 +10,20 @@ import time
 import datetime
 import random
 import string
-import hashlib
 import json
+import threading
 
 import streamlit as st
 import pandas as pd
-import gspread
-from google.oauth2.service_account import Credentials as GACredentials
+
+from ms_data.runtime import cache_data, cache_resource, abortar, en_streamlit, DatosError
+from ms_data.contadores import contadores_fallas
+from ms_data.foto_strings import foto_strings, COLS_FILA
+from ms_data.particiones import particiones, RELLENO_NUMERICO
+from ms_data.trazas import trazado
+from ms_data.cuota import HojaContada, llamar
+from ms_data import claves
+from ms_data.permisos import _rol_actual, puede, requiere_rol  # noqa: F401 (API histórica)
 
 # ── Constantes ───────────────────────────────────────────────
 SHEET_NAME  = "MundoSolar_Suite_DB"
@@ -33,6 +40,10 @@ HORAS_SOL   = 10
 # CONEXIÓN GOOGLE SHEETS (HÍBRIDA: LOCAL Y STREAMLIT CLOUD)
 # ══════════════════════════════════════════════════════════════
 def _crear_cliente_gspread():
+    # gspread / google-auth se importan aquí: la pantalla de login no los necesita
+    import gspread
+    from google.oauth2.service_account import Credentials as GACredentials
+
     scopes = [
         "https://www.googleapis.com/auth/spreadsheets",
         "https://www.googleapis.com/auth/drive",
@@ -41,7 +52,11 @@ def _crear_cliente_gspread():
     
     # 1. Intentar leer desde Streamlit Secrets (Entorno Nube)
     try:
-        if "google_credentials_json" in st.secrets:
+        if os.environ.get("GOOGLE_CREDENTIALS_JSON"):
+            # Modo headless (cron/CLI): JSON completo en variable de entorno
+            creds = GACredentials.from_service_account_info(
+                json.loads(os.environ["GOOGLE_CREDENTIALS_JSON"]), scopes=scopes)
+        elif "google_credentials_json" in st.secrets:
             # Convierte el string de secretos a diccionario
             creds_dict = json.loads(st.secrets["google_credentials_json"])
             creds = GACredentials.from_service_account_info(creds_dict, scopes=scopes)
@@ -50,19 +65,20 @@ def _crear_cliente_gspread():
             creds = GACredentials.from_service_account_info(
                 dict(st.secrets["gcp_service_account"]), scopes=scopes)
     except Exception as e:
-        print(f"Error leyendo secrets de Streamlit: {e}")
+        if en_streamlit():
+            print(f"Error leyendo secrets de Streamlit: {e}")
 
     # 2. Si no estamos en la nube, leer archivo local (Entorno PC)
+    ruta_creds = os.environ.get("MS_CREDENTIALS_FILE", "credentials.json")
     if creds is None:
-        if os.path.exists("credentials.json"):
+        if os.path.exists(ruta_creds):
             try:
-                creds = GACredentials.from_service_account_file("credentials.json", scopes=scopes)
+                creds = GACredentials.from_service_account_file(ruta_creds, scopes=scopes)
             except Exception as e:
                 print(f"Error leyendo credentials.json local: {e}")
                 
     if creds is None:
-        st.error("🚫 No se encontraron credenciales. Configura los secretos en Streamlit Cloud o coloca credentials.json en la raíz de tu proyecto local.")
-        st.stop()
+        abortar("🚫 No se encontraron credenciales. Configura los secretos en Streamlit Cloud o coloca credentials.json en la raíz de tu proyecto local.")
 
     # 3. Autorizar conexión
     ultimo_error = None
@@ -79,56 +95,114 @@ def _crear_cliente_gspread():
             if not es_red:
                 break
                 
-    st.error(f"🌐 No se pudo conectar a Google Sheets después de 4 intentos. "
-             f"Verifica tu conexión a internet.\n\nDetalle: {ultimo_error}")
-    st.stop()
+    abortar(f"🌐 No se pudo conectar a Google Sheets después de 4 intentos. "
+            f"Verifica tu conexión a internet.\n\nDetalle: {ultimo_error}")
 
 
-@st.cache_resource(ttl=2700)
+# Fábrica del cliente, inyectable como el backend de cache (runtime.configurar_cache)
+_fabrica_cliente = None
+
+
+def configurar_cliente(fabrica):
+    """
+    Inyecta la fábrica del cliente: un callable sin argumentos que devuelve
+    algo con la interfaz de gspread.Client (p.ej. ms_data.gspread_falso).
+    None vuelve a las credenciales de la cuenta de servicio.
+    """
+    global _fabrica_cliente
+    _fabrica_cliente = fabrica
+    _olvidar_conexion()
+    invalidar_cache()
+
+
+def _nuevo_cliente():
+    return (_fabrica_cliente or _crear_cliente_gspread)()
+
+
+@cache_resource(ttl=2700)
 def get_gsheet_client():
-    return _crear_cliente_gspread()
+    return _nuevo_cliente()
 
 
-def get_spreadsheet():
+# Handles del libro y de cada hoja: `open` y `worksheet` se piden una vez
+# por conexión, no en cada get_worksheet. Se olvidan junto con el cliente.
+TTL_CONEXION_S = 2700
+_conexion = {'libro': None, 'hojas': {}, 'desde': 0.0}
+_conexion_lock = threading.Lock()
+
+
+def _olvidar_conexion():
+    """Descarta cliente, libro y hojas (token vencido, cambio de backend)."""
+    get_gsheet_client.clear()
+    with _conexion_lock:
+        _conexion.update(libro=None, hojas={}, desde=0.0)
+
+
+def _vigente() -> bool:
+    return time.monotonic() - _conexion['desde'] < TTL_CONEXION_S
+
+
+def _abrir_libro():
     try:
-        return get_gsheet_client().open(SHEET_NAME)
+        return llamar('open', SHEET_NAME, get_gsheet_client().open, SHEET_NAME)
     except Exception:
         get_gsheet_client.clear()
-        return _crear_cliente_gspread().open(SHEET_NAME)
+        return llamar('open', SHEET_NAME, _nuevo_cliente().open, SHEET_NAME)
+
+
+def get_spreadsheet():
+    with _conexion_lock:
+        if _conexion['libro'] is None or not _vigente():
+            _conexion.update(libro=_abrir_libro(), hojas={}, desde=time.monotonic())
+        return _conexion['libro']
 
 
 def get_worksheet(nombre_hoja):
     for intento in range(2):
         try:
-            return get_spreadsheet().worksheet(nombre_hoja)
+            libro = get_spreadsheet()
+            with _conexion_lock:
+                hoja = _conexion['hojas'].get(nombre_hoja)
+            if hoja is not None:
+                return hoja
+            # Proxy contado: cada llamada a la API pasa por el limitador (ms_data/cuota.py)
+            hoja = HojaContada(llamar('worksheet', nombre_hoja, libro.worksheet, nombre_hoja))
+            with _conexion_lock:
+                if _conexion['libro'] is libro:
+                    _conexion['hojas'][nombre_hoja] = hoja
+            return hoja
+        except DatosError:
+            raise
         except Exception as e:
             err = str(e).lower()
             if intento == 0 and any(x in err for x in ['token', 'auth', '401', 'expired', 'invalid']):
-                get_gsheet_client.clear()
+                _olvidar_conexion()
                 continue
             if "resolve" in str(e).lower() or "getaddrinfo" in str(e).lower():
-                st.error("🌐 Error de red al acceder a Google Sheets.")
-            else:
-                st.error(f"Error al abrir hoja '{nombre_hoja}': {e}")
-            st.stop()
+                abortar("🌐 Error de red al acceder a Google Sheets.")
+            abortar(f"Error al abrir hoja '{nombre_hoja}': {e}")
 
 
 # ══════════════════════════════════════════════════════════════
 # LECTURA ROBUSTA
 # ══════════════════════════════════════════════════════════════
+@trazado()
 def _safe_get_records(ws, expected_headers):
     """
     Lee registros de un worksheet de forma robusta.
     Maneja hojas con fila de título en fila 1 y headers en fila 2,
-    o headers directamente en fila 1.
+    o headers directamente en fila 1. Si la API falla también en
+    get_all_values, el error se propaga: una tabla vacía quedaría en
+    cache como si la hoja no tuviera filas (y la carga progresiva de
+    app.py no podría reintentar ni conservar los datos previos).
     """
     try:
         return ws.get_all_records(expected_headers=expected_headers)
     except Exception:
         pass
 
+    rows = ws.get_all_values()
     try:
-        rows = ws.get_all_values()
         if not rows:
             return []
 
@@ -172,7 +246,8 @@ def _safe_get_records(ws, expected_headers):
 # ══════════════════════════════════════════════════════════════
 # CARGA DE DATOS CON CACHE
 # ══════════════════════════════════════════════════════════════
-@st.cache_data(ttl=600, show_spinner=False)
+@cache_data(ttl=600, show_spinner=False)
+@trazado()
 def cargar_plantas():
     ws = get_worksheet("Plantas")
     # Headers basados en la imagen real del Sheet: ID, Nombre, Ubicacion, Potencia_MW, Tecnologia...
@@ -197,7 +272,8 @@ def cargar_plantas():
     return df
 
 
-@st.cache_data(ttl=3600)
+@cache_data(ttl=3600)
+@trazado()
 def cargar_plantas_config():
     ws = get_worksheet("Plantas_Config")
     headers = ['Planta_ID', 'Planta_Nombre', 'Modulo', 'Pmax_W', 'Isc_STC_A',
@@ -223,7 +299,8 @@ def cargar_plantas_config():
     return df
 
 
-@st.cache_data(ttl=3600)
+@cache_data(ttl=3600)
+@trazado()
 def cargar_tecnicos():
     ws = get_worksheet("Tecnicos")
     headers = ['ID', 'Nombre', 'Rut', 'Email', 'Telefono', 'Especialidad',
@@ -234,7 +311,8 @@ def cargar_tecnicos():
     return pd.DataFrame(data)
 
 
-@st.cache_data(ttl=3600)
+@cache_data(ttl=3600)
+@trazado()
 def cargar_asignaciones():
     ws = get_worksheet("Asignaciones")
     headers = ['ID', 'Planta_ID', 'Planta_Nombre', 'Tecnico_ID',
@@ -245,7 +323,8 @@ def cargar_asignaciones():
     return pd.DataFrame(data)
 
 
-@st.cache_data(ttl=600, show_spinner=False)
+@cache_data(ttl=600, show_spinner=False)
+@trazado()
 def cargar_fallas():
     ws = get_worksheet("Fallas")
     headers = ['ID', 'Fecha', 'Planta_ID', 'Planta_Nombre', 'Tecnico_ID',
@@ -256,8 +335,9 @@ def cargar_fallas():
         return pd.DataFrame()
     df = pd.DataFrame(data)
 
-    df['Amperios']       = pd.to_numeric(df.get('Amperios', 0), errors='coerce').fillna(0)
-    df['Irradiancia_Wm2']= pd.to_numeric(df.get('Irradiancia_Wm2', 0), errors='coerce').fillna(0)
+    relleno = RELLENO_NUMERICO['fallas']
+    df['Amperios']       = pd.to_numeric(df.get('Amperios', 0), errors='coerce').fillna(relleno['Amperios'])
+    df['Irradiancia_Wm2']= pd.to_numeric(df.get('Irradiancia_Wm2', 0), errors='coerce').fillna(relleno['Irradiancia_Wm2'])
 
     if 'Fecha' in df.columns:
         df['Fecha'] = pd.to_datetime(df['Fecha'], errors='coerce')
@@ -276,7 +356,8 @@ def cargar_fallas():
     return df
 
 
-@st.cache_data(ttl=600, show_spinner=False)
+@cache_data(ttl=600, show_spinner=False)
+@trazado()
 def cargar_mediciones():
     ws = get_worksheet("Mediciones")
     headers = ['ID', 'Fecha', 'Planta_ID', 'Planta_Nombre', 'Tecnico_ID',
@@ -288,14 +369,12 @@ def cargar_mediciones():
 
     if 'Fecha' in df.columns:
         df['Fecha'] = pd.to_datetime(df['Fecha'], errors='coerce')
-    if 'Amperios' in df.columns:
-        df['Amperios'] = pd.to_numeric(df['Amperios'], errors='coerce').fillna(0)
-    if 'Irradiancia_Wm2' in df.columns:
-        df['Irradiancia_Wm2'] = pd.to_numeric(df['Irradiancia_Wm2'], errors='coerce').fillna(698)
-    if 'Restriccion_MW' in df.columns:
-        df['Restriccion_MW'] = pd.to_numeric(df['Restriccion_MW'], errors='coerce').fillna(0)
-    else:
-        df['Restriccion_MW'] = 0
+    relleno = RELLENO_NUMERICO['mediciones']
+    for col in ('Amperios', 'Irradiancia_Wm2', 'Restriccion_MW'):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(relleno[col])
+    if 'Restriccion_MW' not in df.columns:
+        df['Restriccion_MW'] = relleno['Restriccion_MW']
 
     if 'String_ID' in df.columns and 'String ID' not in df.columns:
         df.rename(columns={'String_ID': 'String ID'}, inplace=True)
@@ -311,7 +390,8 @@ def cargar_mediciones():
     return df
 
 
-@st.cache_data(ttl=300)
+@cache_data(ttl=300)
+@trazado()
 def cargar_usuarios():
     ws = get_worksheet("Usuarios")
     headers = ['ID', 'Email', 'Nombre', 'Rol', 'Password_Hash', 'Activo']
@@ -320,6 +400,10 @@ def cargar_usuarios():
         return pd.DataFrame()
     df = pd.DataFrame(data)
     df['Activo'] = df['Activo'].astype(str).str.upper().isin(['SI', 'TRUE', '1', 'ACTIVO'])
+    # Plantas (opcional, fuera de expected_headers): alcance por planta, ver
+    # ms_data/permisos.py. Las hojas sin la columna no caen a get_all_values.
+    plantas = df['Plantas'] if 'Plantas' in df.columns else pd.Series('', index=df.index)
+    df['Plantas'] = plantas.where(plantas.notna(), '').astype(str).str.strip()
     return df
 
 
@@ -332,73 +416,107 @@ def generar_id(prefijo):
     return f"{prefijo}{now}{sfx}"
 
 
-def guardar_usuario(data: dict):
+def _encabezados_usuarios(ws) -> list:
+    """
+    Encabezados de Usuarios (fila 1). Si falta la columna opcional
+    Plantas se agrega al final: así get_all_records la lee y los
+    valores no quedan en una celda sin encabezado.
+    """
+    headers = [str(h).strip() for h in ws.row_values(1)]
+    if 'Email' not in headers:
+        return []
+    if 'Plantas' not in headers:
+        ws.update_cell(1, len(headers) + 1, 'Plantas')
+        headers.append('Plantas')
+    return headers
+
+
+def guardar_usuario(data: dict) -> bool:
+    """Agrega el usuario ubicando cada valor bajo su encabezado; False si la hoja no tiene encabezados."""
     ws = get_worksheet("Usuarios")
-    ws.append_row([
-        data['ID'], data['Email'], data['Nombre'],
-        data['Rol'], data['Password_Hash'], 'SI'
-    ])
-    cargar_usuarios.clear()
+    headers = _encabezados_usuarios(ws)
+    if not headers:
+        return False
+    valores = {**data, 'Activo': 'SI', 'Plantas': data.get('Plantas', '')}
+    ws.append_row([valores.get(h, '') for h in headers])
+    _limpiar_usuarios()
+    return True
 
 
-def actualizar_password(email: str, nuevo_hash: str):
+def _actualizar_usuario(email: str, columna: str, valor) -> bool:
     ws = get_worksheet("Usuarios")
+    if columna == 'Plantas' and not _encabezados_usuarios(ws):
+        return False
     registros = ws.get_all_values()
     if len(registros) < 2:
         return False
     headers = [h.strip() for h in registros[0]]
     try:
         col_email = headers.index('Email') + 1
-        col_hash  = headers.index('Password_Hash') + 1
+        col_valor = headers.index(columna) + 1
     except ValueError:
         return False
     for i, fila in enumerate(registros[1:], start=2):
         if len(fila) >= col_email and fila[col_email - 1].strip().lower() == email.strip().lower():
-            ws.update_cell(i, col_hash, nuevo_hash)
-            cargar_usuarios.clear()
+            ws.update_cell(i, col_valor, valor)
+            _limpiar_usuarios()
             return True
     return False
 
 
+def actualizar_password(email: str, nuevo_hash: str):
+    return _actualizar_usuario(email, 'Password_Hash', nuevo_hash)
+
+
+def actualizar_plantas_usuario(email: str, plantas: str) -> bool:
+    """Cambia el alcance por planta (IDs separados por coma; vacío = todas)."""
+    return _actualizar_usuario(email, 'Plantas', plantas)
+
+
 def _hash_password(password: str) -> str:
-    return hashlib.sha256(password.strip().encode()).hexdigest()
+    return claves.hash_password(password)
 
 
 def _verificar_password(password: str, hash_stored: str) -> bool:
-    return _hash_password(password) == hash_stored.strip()
+    return claves.verificar(password, hash_stored)[0]
 
 
-def _autenticar(email: str, password: str) -> dict | None:
+@cache_resource(ttl=300)
+def indice_usuarios() -> dict:
+    """email normalizado → fila de Usuarios (dict); se limpia junto con cargar_usuarios."""
     df = cargar_usuarios()
-    if df.empty:
-        return None
-    row = df[df['Email'].str.lower() == email.strip().lower()]
-    if row.empty:
-        return None
-    row = row.iloc[0]
-    if not row.get('Activo', False):
-        return None
-    if not _verificar_password(password, str(row.get('Password_Hash', ''))):
-        return None
-    return {
-        'id': row['ID'], 'email': row['Email'],
-        'nombre': row['Nombre'], 'rol': row['Rol'].strip().lower()
-    }
+    if df.empty or 'Email' not in df.columns:
+        return {}
+    claves_email = df['Email'].astype(str).str.strip().str.lower()
+    # Emails repetidos: gana la primera fila, como el filtro anterior con iloc[0]
+    return {e: fila for e, fila in zip(claves_email[::-1], df.iloc[::-1].to_dict('records')) if e}
 
 
-def _rol_actual() -> str:
-    return st.session_state.get('usuario', {}).get('rol', '')
+def _limpiar_usuarios():
+    cargar_usuarios.clear()
+    indice_usuarios.clear()
 
 
-def puede(accion: str) -> bool:
-    rol = _rol_actual()
-    permisos = {
-        'admin':   ['ver', 'ingresar', 'editar', 'eliminar', 'admin_usuarios', 'admin'],
-        'tecnico': ['ver', 'ingresar', 'editar', 'eliminar'],
-        'lector':  ['ver'],
-        'cliente': ['ver'],
+def _autenticar(email: str, password: str) -> dict | None:
+    """Un lookup en el índice + una derivación PBKDF2; migra hashes antiguos al vuelo."""
+    row = indice_usuarios().get(email.strip().lower())
+    if row is None:
+        claves.verificar_senuelo(password)
+        return None
+    ok, rehashear = claves.verificar(password, str(row.get('Password_Hash', '')))
+    if not ok or not row.get('Activo', False):
+        return None
+    if rehashear:
+        try:
+            actualizar_password(str(row['Email']), claves.hash_password(password))
+        except Exception as e:
+            # El login no depende de poder migrar; se reintenta en el próximo
+            print(f"No se pudo migrar el hash de {row['Email']}: {e}")
+    return {
+        'id': row['ID'], 'email': row['Email'],
+        'nombre': row['Nombre'], 'rol': str(row['Rol']).strip().lower(),
+        'plantas': str(row.get('Plantas', '') or ''),
     }
-    return accion in permisos.get(rol, [])
 
 
 def requiere_login():
@@ -406,12 +524,6 @@ def requiere_login():
         st.stop()
 
 
-def requiere_rol(accion: str):
-    if not puede(accion):
-        st.error(f"🚫 Acceso denegado — tu rol ({_rol_actual()}) no tiene permiso.")
-        st.stop()
-
-
 def invalidar_cache():
     """Limpia todos los caches de datos."""
     cargar_plantas.clear()
@@ -420,7 +532,7 @@ def invalidar_cache():
     cargar_asignaciones.clear()
     cargar_fallas.clear()
     cargar_mediciones.clear()
-    cargar_usuarios.clear()
+    _limpiar_usuarios()
 
     try:
         from ms_data.analysis import analizar_mediciones
@@ -428,6 +540,8 @@ def invalidar_cache():
     except Exception:
         pass
 
+    if not en_streamlit():
+        return
     keys_to_del = [k for k in st.session_state if k.startswith('_an_')]
     for k in keys_to_del:
         del st.session_state[k]
@@ -496,12 +610,16 @@ def guardar_falla(data: dict):
         data.get('Nota', '')
     ], value_input_option='USER_ENTERED')
     invalidar_cache()
+    contadores_fallas().agregar(data)
+    particiones().agregar('fallas', [data])
 
 
 def guardar_mediciones_bulk(rows: list):
     ws = get_worksheet("Mediciones")
     ws.append_rows(rows)
     invalidar_cache()
+    foto_strings().agregar_filas(rows)
+    particiones().agregar('mediciones', [dict(zip(COLS_FILA, r)) for r in rows])
 
 
 def borrar_fila_sheet(hoja, idx_df):
@@ -517,6 +635,12 @@ def eliminar_por_id(hoja, col_id, valor_id):
         if str(val).strip() == str(valor_id).strip():
             ws.delete_rows(i + 1)
             invalidar_cache()
+            if hoja == "Fallas":
+                contadores_fallas().quitar(valor_id)
+                particiones().quitar('fallas', valor_id)
+            elif hoja == "Mediciones":
+                foto_strings().quitar(valor_id)
+                particiones().quitar('mediciones', valor_id)
             return True
     return False
 
@@ -0,0 +1,194 @@
+"""
+ms_data/trazas.py
+══════════════════════════════════════════════════════════════
+Instrumentación liviana del camino caliente de cada rerun.
+
+- tramo(nombre, **attrs): context manager que mide un bloque.
+- trazado(nombre=None): decorador equivalente para funciones.
+- heredar(fn): atribuye a la sesión actual los tramos que fn ejecute
+  en otro hilo.
+
+Cada tramo terminado alimenta:
+- histogramas por nombre de todo el proceso y de la sesión Streamlit
+  que lo ejecutó (buckets log en ms + últimas muestras para p50/p95);
+- un buffer circular de eventos exportable como Chrome trace JSON
+  (chrome://tracing o ui.perfetto.dev).
+
+Costo por tramo: dos perf_counter_ns y un append bajo lock. Se apaga
+con MS_TRAZAS=0 (los decoradores quedan como llamada directa).
+══════════════════════════════════════════════════════════════
+"""
+import os
+import json
+import time
+import bisect
+import functools
+import threading
+from collections import deque, OrderedDict
+from contextlib import contextmanager
+
+import pandas as pd
+
+ACTIVO       = os.environ.get('MS_TRAZAS', '1').lower() not in ('0', 'false', 'no')
+BUCKETS_MS   = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+MUESTRAS     = 512       # últimas duraciones por nombre (percentiles)
+MAX_EVENTOS  = 20000     # buffer del Chrome trace
+MAX_SESIONES = 64
+SIN_SESION   = '(proceso)'
+
+_lock    = threading.Lock()
+_T0_NS   = time.perf_counter_ns()
+_local   = threading.local()
+
+
+class Histograma:
+    """Conteo por bucket log + total/máx + últimas muestras."""
+    __slots__ = ('n', 'total_ms', 'max_ms', 'buckets', 'muestras')
+
+    def __init__(self):
+        self.n, self.total_ms, self.max_ms = 0, 0.0, 0.0
+        self.buckets  = [0] * (len(BUCKETS_MS) + 1)
+        self.muestras = deque(maxlen=MUESTRAS)
+
+    def agregar(self, ms: float):
+        self.n += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.muestras.append(ms)
+
+
+_proceso  = {}               # nombre → Histograma
+_sesiones = OrderedDict()    # session_id → {nombre → Histograma} (LRU)
+_eventos  = deque(maxlen=MAX_EVENTOS)
+
+
+def sesion_actual() -> str:
+    """session_id de Streamlit del hilo actual (los hilos de trabajo no tienen)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+        return ctx.session_id if ctx is not None else SIN_SESION
+    except Exception:
+        return SIN_SESION
+
+
+def _registrar(nombre, inicio_ns, dur_ns, sesion, attrs):
+    ms = dur_ns / 1e6
+    with _lock:
+        _proceso.setdefault(nombre, Histograma()).agregar(ms)
+        if sesion != SIN_SESION:
+            hs = _sesiones.pop(sesion, None) or {}
+            _sesiones[sesion] = hs
+            while len(_sesiones) > MAX_SESIONES:
+                _sesiones.popitem(last=False)
+            hs.setdefault(nombre, Histograma()).agregar(ms)
+        _eventos.append((nombre, inicio_ns, dur_ns, threading.get_ident(), sesion, attrs))
+
+
+@contextmanager
+def tramo(nombre: str, **attrs):
+    """Mide el bloque y lo registra bajo `nombre` (attrs van al Chrome trace)."""
+    if not ACTIVO:
+        yield
+        return
+    pila = getattr(_local, 'pila', None)
+    if pila is None:
+        pila = _local.pila = []
+    sesion = pila[-1] if pila else sesion_actual()
+    pila.append(sesion)
+    t0 = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        dur = time.perf_counter_ns() - t0
+        pila.pop()
+        _registrar(nombre, t0, dur, sesion, attrs)
+
+
+def heredar(fn):
+    """
+    Envuelve fn para ejecutarla en otro hilo atribuyendo sus tramos a la
+    sesión del hilo que la creó (_run_in_thread, pools de carga).
+    """
+    if not ACTIVO:
+        return fn
+    sesion = sesion_actual()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        previa = getattr(_local, 'pila', None)
+        _local.pila = [sesion]
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _local.pila = previa
+    return wrapper
+
+
+def trazado(nombre=None):
+    """Decorador: @trazado() usa módulo.función como nombre del tramo."""
+    def deco(fn):
+        if not ACTIVO:
+            return fn
+        etiqueta = nombre or f"{fn.__module__.split('.')[-1]}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with tramo(etiqueta):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+# ── Lectura ──────────────────────────────────────────────────
+def resumen(sesion=None) -> pd.DataFrame:
+    """
+    Tabla por tramo: n, total, media, p50, p95, máx (ms). sesion=None →
+    todo el proceso; un session_id → solo esa sesión.
+    """
+    with _lock:
+        hs = _proceso if sesion is None else _sesiones.get(sesion, {})
+        filas = [(k, h.n, h.total_ms, h.max_ms, list(h.muestras)) for k, h in hs.items()]
+    datos = []
+    for k, n, total, mx, muestras in filas:
+        s = pd.Series(muestras)
+        datos.append({'Tramo': k, 'N': n, 'Total_ms': total, 'Media_ms': total / n if n else 0,
+                      'p50_ms': s.quantile(0.5), 'p95_ms': s.quantile(0.95), 'Max_ms': mx})
+    cols = ['Tramo', 'N', 'Total_ms', 'Media_ms', 'p50_ms', 'p95_ms', 'Max_ms']
+    df = pd.DataFrame(datos, columns=cols)
+    return df.sort_values('Total_ms', ascending=False).round(1).reset_index(drop=True)
+
+
+def histograma(nombre: str, sesion=None) -> pd.DataFrame:
+    """Conteos por bucket (etiquetas '≤ 5 ms', ..., '> 10000 ms') de un tramo."""
+    with _lock:
+        hs = _proceso if sesion is None else _sesiones.get(sesion, {})
+        h = hs.get(nombre)
+        conteos = list(h.buckets) if h is not None else [0] * (len(BUCKETS_MS) + 1)
+    etiquetas = [f"≤ {b} ms" for b in BUCKETS_MS] + [f"> {BUCKETS_MS[-1]} ms"]
+    return pd.DataFrame({'Bucket': etiquetas, 'N': conteos})
+
+
+def chrome_trace(sesion=None) -> bytes:
+    """Eventos en formato Trace Event (ph='X') para chrome://tracing / Perfetto."""
+    with _lock:
+        evs = [e for e in _eventos if sesion is None or e[4] == sesion]
+    pid = os.getpid()
+    trace = [{'name': n, 'cat': n.split('.')[0], 'ph': 'X', 'pid': pid, 'tid': tid,
+              'ts': (t0 - _T0_NS) / 1000, 'dur': dur / 1000,
+              'args': {'sesion': s[:8], **{k: str(v) for k, v in attrs.items()}}}
+             for n, t0, dur, tid, s, attrs in evs]
+    return json.dumps({'traceEvents': trace, 'displayTimeUnit': 'ms'}).encode('utf-8')
+
+
+def sesiones() -> list:
+    with _lock:
+        return list(_sesiones)
+
+
+def reiniciar():
+    with _lock:
+        _proceso.clear()
+        _sesiones.clear()
+        _eventos.clear()
@@ -18,8 +18,10 @@ from ms_data.sheets import (
     eliminar_planta,          # ← nueva función (ver sheets.py)
     cargar_plantas,
 )
+from ms_data.trazas import trazado
 
 
+@trazado('vista.gestion_plantas')
 def render(df_plantas, df_config):
     c = get_colors()
 
@@ -0,0 +1,96 @@
+"""
+vistas/admin/rendimiento.py
+══════════════════════════════════════════════════════════════
+Página "Rendimiento" (solo admin): tiempos de los tramos medidos por
+ms_data.trazas — carga de Sheets, parseo, análisis, gráficos,
+exportes y render de cada vista — de esta sesión o de todo el
+proceso, con histograma por tramo y descarga del Chrome trace.
+Arriba, el uso en vivo de la cuota de Google Sheets (ms_data.cuota).
+══════════════════════════════════════════════════════════════
+"""
+import datetime
+
+import streamlit as st
+
+from components.theme import get_colors
+from ms_data import trazas, cuota
+
+
+def render():
+    c = get_colors()
+
+    st.markdown(
+        f"<h2 style='color:{c['text']}; margin-top:0;'>⏱️ Rendimiento</h2>",
+        unsafe_allow_html=True,
+    )
+    _render_cuota(c)
+    st.divider()
+
+    st.caption("Tiempos por tramo instrumentado (ms). La sesión propia incluye "
+               "los hilos de carga y de generación de informes lanzados desde ella.")
+    if not trazas.ACTIVO:
+        st.warning("Instrumentación desactivada (MS_TRAZAS=0).")
+        return
+
+    col_a, col_b, col_c = st.columns([2, 1, 1])
+    alcance = col_a.radio("Alcance", ["Esta sesión", "Todo el proceso"], horizontal=True,
+                          key='rend_alcance', label_visibility='collapsed')
+    sesion = trazas.sesion_actual() if alcance == "Esta sesión" else None
+    if col_c.button("🗑️ Reiniciar", width='stretch', help="Borra histogramas y eventos de todo el proceso"):
+        trazas.reiniciar()
+        st.rerun()
+
+    df = trazas.resumen(sesion)
+    if df.empty:
+        st.info("Aún no hay tramos registrados en este alcance.")
+        return
+
+    k1, k2, k3 = st.columns(3)
+    k1.metric("Tramos distintos", len(df))
+    k2.metric("Llamadas", f"{int(df['N'].sum()):,}")
+    k3.metric("Sesiones activas", len(trazas.sesiones()))
+
+    st.dataframe(df, hide_index=True, width='stretch', column_config={
+        'Total_ms': st.column_config.ProgressColumn('Total (ms)', format='%.0f', min_value=0,
+                                                    max_value=float(df['Total_ms'].max())),
+    })
+
+    tramo_sel = st.selectbox("Histograma de", df['Tramo'].tolist(), key='rend_tramo')
+    import plotly.express as px
+    fig = px.bar(trazas.histograma(tramo_sel, sesion), x='Bucket', y='N', text='N',
+                 color_discrete_sequence=[c['accent']])
+    fig.update_layout(height=260, plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                      font_color=c['text'], xaxis_title='', yaxis_title='Llamadas',
+                      margin=dict(t=20, b=20, l=20, r=20))
+    st.plotly_chart(fig, use_container_width=True)
+
+    sufijo = 'sesion' if sesion else 'proceso'
+    col_b.download_button(
+        "⬇️ Chrome trace", trazas.chrome_trace(sesion),
+        file_name=f"mundosolar_trace_{sufijo}_{datetime.datetime.now():%Y%m%d_%H%M%S}.json",
+        mime='application/json', width='stretch',
+        help="Abrir en chrome://tracing o ui.perfetto.dev",
+    )
+
+
+@st.fragment(run_every=5)
+def _render_cuota(c):
+    """Uso de la API de Sheets del último minuto (se refresca cada 5 s)."""
+    u = cuota.uso_cuota()
+    st.markdown(f"<h4 style='color:{c['text']};'>📡 Cuota Google Sheets</h4>", unsafe_allow_html=True)
+    k1, k2, k3, k4 = st.columns(4)
+    k1.metric("Lecturas / min", f"{u['lecturas_min']} / {u['limite_lecturas']}",
+              f"{u['libres_lectura']} libres", delta_color='off')
+    k2.metric("Escrituras / min", f"{u['escrituras_min']} / {u['limite_escrituras']}",
+              f"{u['libres_escritura']} libres", delta_color='off')
+    k3.metric("Reintentos 429", u['reintentos_429'],
+              f"{u['agotadas']} agotadas" if u['agotadas'] else None, delta_color='inverse')
+    k4.metric("Espera por cuota", f"{u['espera_s']:.1f} s")
+    st.progress(min(u['lecturas_min'] / max(u['limite_lecturas'], 1), 1.0), text="Lecturas último minuto")
+    st.progress(min(u['escrituras_min'] / max(u['limite_escrituras'], 1), 1.0), text="Escrituras último minuto")
+    with st.expander("Llamadas por operación y hoja"):
+        df = cuota.conteo_llamadas()
+        if df.empty:
+            st.caption("Sin llamadas a la API desde el arranque del proceso.")
+        else:
+            st.dataframe(df, hide_index=True, width='stretch')
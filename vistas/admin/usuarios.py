@@ -8,15 +8,20 @@ import pandas as pd
 from components.theme import get_colors
 from components.cards import role_badge
 from ms_data.sheets import (
-    guardar_usuario, actualizar_password, guardar_tecnico,
+    guardar_usuario, actualizar_password, actualizar_plantas_usuario, guardar_tecnico,
     guardar_asignacion, eliminar_por_id, generar_id,
     puede, _hash_password, _autenticar,
     cargar_usuarios, cargar_tecnicos, invalidar_cache,
 )
+from ms_data.trazas import trazado
 
 
+@trazado('vista.usuarios')
 def render(df_usuarios, df_tec, df_asig, df_plantas):
     c = get_colors()
+    ids_plantas = df_plantas['ID'].astype(str).tolist() if 'ID' in df_plantas.columns else []
+    nombres_pl  = df_plantas.set_index(df_plantas['ID'].astype(str))['Nombre'] if ids_plantas else pd.Series(dtype=object)
+    etiqueta_pl = lambda p: f"{p} · {nombres_pl.get(p, '')}"
 
     st.markdown("""
     <div class="suite-logo">
@@ -39,7 +44,11 @@ def render(df_usuarios, df_tec, df_asig, df_plantas):
     # ══════════════════════════════════════════════
     with tab_usr:
         # Recargar fresco desde sheets para reflejar cambios
-        df_usr = cargar_usuarios()
+        try:
+            df_usr = cargar_usuarios()
+        except Exception as e:
+            st.error(f"🌐 No se pudo leer la hoja Usuarios: {str(e)[:120]}. Se muestra la última carga.")
+            df_usr = df_usuarios if df_usuarios is not None else pd.DataFrame()
 
         if not df_usr.empty:
             n_admins  = len(df_usr[df_usr['Rol'].str.lower() == 'admin'])
@@ -62,13 +71,33 @@ def render(df_usuarios, df_tec, df_asig, df_plantas):
                 uact  = u.get('Activo', True)
 
                 rol_txt    = {'admin': '🔴 Admin', 'tecnico': '🟡 Técnico',
-                              'lector': '🟢 Lector'}.get(urol, '⚪ Desconocido')
+                              'lector': '🟢 Lector', 'cliente': '🔵 Cliente'}.get(urol, '⚪ Desconocido')
+                upl   = str(u.get('Plantas', '') or '').strip()
                 activo_txt = "✅ Activo" if uact not in [False, 'False', 'NO', '0'] else "❌ Inactivo"
 
-                cu1, cu2, cu3, cu4 = st.columns([3, 3, 2, 1])
+                cu1, cu2, cu3, cu5, cu4 = st.columns([3, 3, 2, 1, 1])
                 cu1.write(f"**{unom}**")
-                cu2.caption(umail)
+                cu2.caption(f"{umail} · 📍 {upl}" if upl else f"{umail} · 📍 todas")
                 cu3.write(f"{rol_txt}  {activo_txt}")
+                if urol != 'admin' and cu5.button("📍", key=f"alc_usr_{uid}", help=f"Plantas visibles de {unom}"):
+                    st.session_state[f'alcance_usr_{uid}'] = True
+
+                if st.session_state.get(f'alcance_usr_{uid}'):
+                    actuales = [p.strip() for p in upl.split(',') if p.strip() in ids_plantas]
+                    nuevas = st.multiselect("Plantas visibles", ids_plantas, default=actuales,
+                                            format_func=etiqueta_pl, key=f"alcance_sel_{uid}",
+                                            help="Vacío = todas.")
+                    ca1, ca2 = st.columns(2)
+                    if ca1.button("💾 Guardar alcance", key=f"alc_ok_{uid}", type="primary"):
+                        if actualizar_plantas_usuario(umail, ', '.join(nuevas)):
+                            st.toast(f"✅ Alcance de {unom} actualizado (rige desde su próximo ingreso)")
+                        else:
+                            st.toast("❌ No se pudo actualizar. Verifica los encabezados de la hoja Usuarios.")
+                        st.session_state.pop(f'alcance_usr_{uid}', None)
+                        st.rerun()
+                    if ca2.button("❌ Cancelar", key=f"alc_no_{uid}"):
+                        st.session_state.pop(f'alcance_usr_{uid}', None)
+                        st.rerun()
 
                 # No mostrar botón eliminar para el propio usuario logueado
                 yo = st.session_state.get('usuario', {}).get('id', '')
@@ -102,22 +131,27 @@ def render(df_usuarios, df_tec, df_asig, df_plantas):
             c1, c2 = st.columns(2)
             f_nombre = c1.text_input("Nombre completo")
             f_email  = c2.text_input("Email")
-            f_rol    = c1.selectbox("Rol", ["tecnico", "lector", "admin"])
+            f_rol    = c1.selectbox("Rol", ["tecnico", "lector", "cliente", "admin"])
             f_pass   = c2.text_input("Contraseña inicial", type="password",
                                      help="El usuario podrá cambiarla desde el sidebar")
+            f_plantas = st.multiselect(
+                "Plantas visibles", ids_plantas, format_func=etiqueta_pl,
+                help="Vacío = todas. El admin siempre ve todas.")
             if st.form_submit_button("💾 Crear usuario", type="primary"):
                 if not f_nombre.strip() or not f_email.strip() or not f_pass:
                     st.warning("Completa todos los campos.")
                 elif len(f_pass) < 6:
                     st.warning("La contraseña debe tener al menos 6 caracteres.")
-                else:
-                    guardar_usuario({
+                elif not guardar_usuario({
                         'ID':            generar_id('USR'),
                         'Email':         f_email.strip().lower(),
                         'Nombre':        f_nombre.strip(),
                         'Rol':           f_rol,
                         'Password_Hash': _hash_password(f_pass),
-                    })
+                        'Plantas':       ', '.join(f_plantas),
+                    }):
+                    st.error("❌ La hoja Usuarios no tiene encabezados en la fila 1 (falta 'Email').")
+                else:
                     cargar_usuarios.clear()
                     st.success(f"✅ Usuario **{f_nombre}** ({f_rol}) creado.")
                     st.rerun()
@@ -7,16 +7,16 @@ Optimizado con Vectorización Aislada (Evita mezcla de cajas homónimas).
 """
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 from datetime import timedelta
-from openpyxl.styles import Font, Alignment, PatternFill
-from openpyxl.utils import get_column_letter
 from components.filters import flexible_period_filter
 from components.cards import planta_card, kpi_row
+from components.descargas import descarga_diferida
 from components.theme import get_colors, theme_toggle_button
-from ms_data.analysis import analizar_mediciones, _to_float
+from ms_data.analysis import analizar_mediciones, resumen_plantas, _to_float
+from ms_data.trazas import trazado
 
-def render(df_plantas, df_fallas, df_med, df_tec):
+@trazado('vista.global')
+def render(df_plantas, df_fallas, df_med, df_tec, df_config=None):
     c = get_colors()
     hoy = pd.Timestamp.now()
 
@@ -76,60 +76,37 @@ def render(df_plantas, df_fallas, df_med, df_tec):
     st.markdown("<br>", unsafe_allow_html=True)
     st.markdown('<div class="section-hdr">📍 Estado Operativo por Planta</div>', unsafe_allow_html=True)
 
-    # ── OPTIMIZACIÓN CORREGIDA: Calcular salud aislando por planta ──
-    vg_fallas = f_fil.groupby('Planta_ID').size().to_dict() if f_fil is not None and not f_fil.empty else {}
-    
-    dict_salud = {}
-    if m_fil is not None and not m_fil.empty:
-        # El groupby evita la contaminación cruzada de Cajas (Ej: CB-1 de Planta A con CB-1 de Planta B)
-        for pid, df_p in m_fil.groupby('Planta_ID'):
-            df_an = analizar_mediciones(df_p)
-            total_str = len(df_an)
-            n_norm = len(df_an[df_an['Diagnostico'] == 'NORMAL'])
-            n_crit = len(df_an[df_an['Diagnostico'].isin(['CRÍTICO', 'OC (0A)'])])
-            n_aler = len(df_an[df_an['Diagnostico'] == 'ALERTA'])
-            salud_pct = (n_norm / total_str * 100) if total_str > 0 else 100.0
-            dict_salud[pid] = {'salud': salud_pct, 'crit': n_crit, 'aler': n_aler}
+    # ── Resumen de todas las plantas (período + mes anterior) en una pasada ──
+    m_ant = None
+    if not df_med.empty and 'Fecha' in df_med.columns:
+        ini_ant = (hoy - pd.DateOffset(months=1)).to_period('M').to_timestamp()
+        fechas = pd.to_datetime(df_med['Fecha'], errors='coerce')
+        m_ant = df_med[(fechas >= ini_ant) & (fechas < ini_ant + pd.DateOffset(months=1))]
+    resumen = resumen_plantas(df_plantas, m_fil, f_fil, m_ant)
 
     # ── Tarjetas por planta ──────────────────────────────────
     n_cols = min(3, len(df_plantas))
     cols = st.columns(n_cols)
 
-    for i, (_, planta) in enumerate(df_plantas.iterrows()):
-        pid        = str(planta['ID'])
-        nombre     = planta.get('Nombre', f'Planta {pid}')
-        ubicacion  = planta.get('Ubicacion', '')
-        tecnologia = planta.get('Tecnologia', '')
-        potencia   = _to_float(planta.get('Potencia_MW', 0))
-
-        stats = dict_salud.get(pid, {'salud': 100.0, 'crit': 0, 'aler': 0})
-        n_fallas = vg_fallas.get(pid, 0)
-
-        # Calculo rápido de salud del mes anterior (Delta)
-        salud_ant = None
-        if not df_med.empty:
-            mes_ant = (hoy - pd.DateOffset(months=1)).to_period('M')
-            m_ant = df_med[(df_med['Planta_ID'] == pid) & (df_med['Fecha'].dt.to_period('M') == mes_ant)]
-            if not m_ant.empty:
-                df_an_ant = analizar_mediciones(m_ant)
-                if not df_an_ant.empty:
-                    salud_ant = (len(df_an_ant[df_an_ant['Diagnostico'] == 'NORMAL']) / len(df_an_ant)) * 100
-
+    for i, planta in enumerate(df_plantas.to_dict('records')):
+        pid   = str(planta['ID'])
+        stats = resumen.loc[pid]
         with cols[i % n_cols]:
             planta_card(
                 planta_id       = pid,
-                nombre          = nombre,
-                ubicacion       = ubicacion,
-                tecnologia      = tecnologia,
-                potencia_mw     = potencia,
+                nombre          = planta.get('Nombre', f'Planta {pid}'),
+                ubicacion       = planta.get('Ubicacion', ''),
+                tecnologia      = planta.get('Tecnologia', ''),
+                potencia_mw     = _to_float(planta.get('Potencia_MW', 0)),
                 salud_pct       = stats['salud'],
-                salud_anterior_pct = salud_ant,
-                n_fallas        = n_fallas,
-                n_criticos      = stats['crit'],
-                n_alertas       = stats['aler'],
+                salud_anterior_pct = None if pd.isna(stats['salud_ant']) else stats['salud_ant'],
+                n_fallas        = int(stats['fallas']),
+                n_criticos      = int(stats['crit']),
+                n_alertas       = int(stats['aler']),
             )
 
     # ── Gráficos consolidados ────────────────────────────────
+    import plotly.express as px  # diferido: el login no carga plotly
     st.markdown('<div class="section-hdr">📊 Análisis Consolidado Global</div>', unsafe_allow_html=True)
     c_colors = get_colors()
     col1, col2 = st.columns(2)
@@ -193,15 +170,48 @@ def render(df_plantas, df_fallas, df_med, df_tec):
             df_show['Fecha'] = df_show['Fecha'].dt.strftime('%d/%m/%Y')
             st.dataframe(df_show.sort_values('Fecha', ascending=False).head(15), use_container_width=True, hide_index=True)
 
+    # ── Informes masivos ─────────────────────────────────────
+    _render_lote_informes(df_plantas, df_config, df_fallas, df_med)
+
+
+def _render_lote_informes(df_plantas, df_config, df_fallas, df_med):
+    """Genera en un solo ZIP los informes mensuales de todas las plantas."""
+    meses = set()
+    for df in (df_med, df_fallas):
+        if df is not None and not df.empty and 'Fecha' in df.columns:
+            meses.update(pd.to_datetime(df['Fecha'], errors='coerce').dt.to_period('M').dropna().astype(str))
+    if not meses:
+        return
+
+    st.markdown('<div class="section-hdr">📦 Informes Mensuales — Todas las Plantas</div>', unsafe_allow_html=True)
+    col_mes, col_btn = st.columns([2, 1])
+    with col_mes:
+        mes = st.selectbox("Mes a reportar", sorted(meses, reverse=True), key='lote_mes')
+    with col_btn:
+        st.markdown("<br>", unsafe_allow_html=True)
+        generar = st.button("⚙️ Generar ZIP", key='lote_btn', use_container_width=True)
+
+    if generar:
+        from ms_data.batch import generar_lote_informes
+        with st.spinner(f"Generando informes de {len(df_plantas)} plantas..."):
+            st.session_state['lote_informes'] = generar_lote_informes(
+                mes, df_plantas, df_config if df_config is not None else pd.DataFrame(), df_fallas, df_med)
+
+    lote = st.session_state.get('lote_informes')
+    if lote and lote['periodo'] == mes:
+        st.caption(f"Generado en {lote['total_s']:.1f} s")
+        st.dataframe(lote['resumen'], use_container_width=True, hide_index=True)
+        st.download_button("⬇️ Descargar ZIP", lote['zip'], f"Informes_MundoSolar_{mes.replace('-', '')}.zip",
+                           "application/zip", use_container_width=True, key='lote_dl')
+
 
 # ══════════════════════════════════════════════════════════════
 # VISTA LECTOR (Simplificada)
 # ══════════════════════════════════════════════════════════════
+@trazado('vista.kpis')
 def render_kpis(df_plantas, df_fallas, df_med):
-    from ms_data.exports import generar_excel_mediciones
     import io
-    from openpyxl import Workbook
-    from ms_data.analysis import _run_in_thread
+    import plotly.express as px
 
     c = get_colors()
     hoy = pd.Timestamp.now()
@@ -306,6 +316,9 @@ def render_kpis(df_plantas, df_fallas, df_med):
 
     st.divider()
     def _gen_excel():
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, Alignment, PatternFill
+        from openpyxl.utils import get_column_letter
         wb = Workbook(); ws = wb.active; ws.title = 'KPIs'
         ws.merge_cells('A1:F1')
         ws['A1'] = f'Reporte KPIs Mundo Solar — {lbl}'
@@ -321,5 +334,8 @@ def render_kpis(df_plantas, df_fallas, df_med):
         out = io.BytesIO(); wb.save(out); out.seek(0)
         return out.getvalue()
 
-    xls = _run_in_thread(_gen_excel)
-    st.download_button('📊 Descargar Excel KPIs', xls, f'KPIs_MundoSolar_{hoy.strftime("%Y%m")}.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', use_container_width=True)
\ No newline at end of file
+    # Se genera solo si el lector lo pide; memoizado por (período, versión de datos)
+    descarga_diferida('kpis_excel', _gen_excel, '📊 Descargar Excel KPIs',
+                      f'KPIs_MundoSolar_{hoy.strftime("%Y%m")}.xlsx',
+                      'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+                      firma=lbl, texto_preparar='⚙️ Preparar Excel KPIs', use_container_width=True)
\ No newline at end of file
@@ -4,16 +4,28 @@ vistas/planta/__init__.py
 Orquestador de la página de planta - Mundo Solar Suite v2.0
 - Deduplicación "Bala de Plata" en el Context Bar.
 - Entrega de DataFrames COMPLETOS a cada pestaña.
+- Modelo de vista por planta (modelo.py): tipado, orden y foto final se
+  calculan una vez por versión de datos y las pestañas lo rebanan.
+- Navegación perezosa por secciones: solo se ejecuta la sección activa.
+- Cada sección corre como st.fragment: un widget dentro de ella solo
+  re-ejecuta esa sección, no toda la página.
 ══════════════════════════════════════════════════════════════
 """
+import time
+
 import streamlit as st
 import pandas as pd
 
 from components.filters import context_bar, flexible_period_filter
 from components.cards import breadcrumb, kpi_row
 from components.theme import get_colors, theme_toggle_button
-from ms_data.analysis import analizar_mediciones, _to_float, _to_int
+from ms_data.analysis import _to_int
+from ms_data.sheets import puede
+from ms_data.contadores import contadores_fallas
+from ms_data.trazas import trazado, tramo
+from vistas.planta.modelo import obtener_modelo
 
+@trazado('vista.planta')
 def render(planta_id, df_plantas, df_fallas, df_med, df_config, df_tec, df_asig):
     from vistas.planta import (tab_fusibles, tab_mediciones,
                                tab_informes, tab_diagnostico, tab_gestion)
@@ -43,41 +55,12 @@ def render(planta_id, df_plantas, df_fallas, df_med, df_config, df_tec, df_asig)
         if not cfg_row.empty:
             cfg = cfg_row.iloc[0].to_dict()
 
-    # ── 3. DATOS FULL: Histórico completo de esta planta ─────
-    f_p_full = df_fallas[df_fallas['Planta_ID'] == planta_id].copy() if not df_fallas.empty else pd.DataFrame()
-    m_p_full = df_med[df_med['Planta_ID'] == planta_id].copy() if not df_med.empty else pd.DataFrame()
-
-    # ── 4. DETECCIÓN DE COLUMNAS ─────────────────────────────
-    posibles_nombres = ['String', 'String_ID', 'String ID']
-    sid_col = next((col for col in posibles_nombres if col in m_p_full.columns), 'String')
-
-    # ── 5. KPIs CONTEXT BAR (DEDUPLICACIÓN BALA DE PLATA) ────
-    ua = _to_int(cfg.get('Umbral_Alerta_pct', -5))
-    uc = _to_int(cfg.get('Umbral_Critico_pct', -10))
-
-    if not m_p_full.empty:
-        m_p_ana = m_p_full.copy()
-        m_p_ana['Fecha'] = pd.to_datetime(m_p_ana['Fecha'])
-        
-        # 1. Limpiamos espacios invisibles para que el deduplicado no falle
-        col_eq = 'Equipo' if 'Equipo' in m_p_ana.columns else 'Inversor'
-        m_p_ana[col_eq] = m_p_ana[col_eq].astype(str).str.strip()
-        m_p_ana[sid_col] = m_p_ana[sid_col].astype(str).str.strip()
+    # ── 3. MODELO DE VISTA: datos tipados + foto final, una vez por versión ──
+    vm = obtener_modelo(planta_id, df_fallas, df_med, cfg)
+    f_p_full, m_p_full, sid_col = vm.fallas, vm.med, vm.sid_col
+    salud_pct, n_crit, n_aler, n_strings = vm.salud_pct, vm.n_crit, vm.n_aler, vm.n_strings
 
-        # 2. Ordenamos por fecha y nos quedamos SOLO con el último registro de cada string
-        m_p_recent = m_p_ana.sort_values('Fecha').drop_duplicates(subset=[col_eq, sid_col], keep='last')
-        
-        # 3. Analizamos esa "foto final"
-        df_an = analizar_mediciones(m_p_recent, ua=ua, uc=uc)
-        
-        n_strings = len(df_an)
-        salud_pct = len(df_an[df_an['Diagnostico'] == 'NORMAL']) / n_strings * 100 if n_strings > 0 else 100
-        n_crit    = len(df_an[df_an['Diagnostico'].isin(['CRÍTICO', 'OC (0A)'])])
-        n_aler    = len(df_an[df_an['Diagnostico'] == 'ALERTA'])
-    else:
-        salud_pct, n_crit, n_aler, n_strings = 100, 0, 0, 0
-
-    # ── 6. Header y Barra de Contexto ────────────────────────
+    # ── 4. Header y Barra de Contexto ────────────────────────
     col_bc, col_tog = st.columns([5, 1])
     with col_bc:
         breadcrumb([('Vista Global', 'global'), (nombre, None)])
@@ -94,41 +77,63 @@ def render(planta_id, df_plantas, df_fallas, df_med, df_config, df_tec, df_asig)
         on_back       = _volver_global,
     )
 
-    # ── 7. Renderizado de Tabs ───────────────────────────────
+    # ── 5. Renderizado de Tabs ───────────────────────────────
     badge_camp = (f' 🔴{n_crit}' if n_crit > 0 else f' 🟡{n_aler}' if n_aler > 0 else ' ✅')
     
-    f_recientes = 0
-    if not f_p_full.empty:
-        f_p_full['Fecha_tmp'] = pd.to_datetime(f_p_full['Fecha'], errors='coerce')
-        f_recientes = len(f_p_full[f_p_full['Fecha_tmp'] >= (pd.Timestamp.now() - pd.Timedelta(days=30))])
+    f_recientes = contadores_fallas().recientes(planta_id)
     badge_fus = f' ({f_recientes})' if f_recientes > 0 else ''
 
-    tab_res, tab_camp, tab_fus, tab_inf, tab_diag, tab_gest = st.tabs([
-        '📊 Resumen',
-        f'⚡ Campaña{badge_camp}',
-        f'🔴 Fusibles{badge_fus}',
-        '📋 Informes',
-        '🔍 Diagnóstico',
-        '🗂️ Gestión de Datos',
-    ])
-
-    with tab_res:
-        _render_resumen(planta_id, nombre, m_p_full, f_p_full, cfg, c, sid_col)
-
-    with tab_camp:
-        tab_mediciones.render(planta_id, nombre, m_p_full, cfg, planta, df_tec=df_tec)
-
-    with tab_fus:
-        tab_fusibles.render(planta_id, nombre, f_p_full, cfg, df_tec, df_asig, m_p_full)
-
-    with tab_inf:
-        tab_informes.render(planta_id, nombre, f_p_full, m_p_full, cfg)
-
-    with tab_diag:
-        tab_diagnostico.render(planta_id, nombre, m_p_full, cfg, planta)
-
-    with tab_gest:
-        tab_gestion.render(planta_id, nombre, f_p_full, m_p_full)
+    # Navegación perezosa: solo se ejecuta la sección activa (st.tabs corre las seis)
+    secciones = {
+        'resumen':     ('📊 Resumen',
+                        lambda: _fragmento_tab('Resumen', planta_id, _render_resumen,
+                                               planta_id, nombre, m_p_full, f_p_full, cfg, c, sid_col, vm)),
+        'campana':     (f'⚡ Campaña{badge_camp}',
+                        lambda: _fragmento_tab('Campaña', planta_id, tab_mediciones.render,
+                                               planta_id, nombre, m_p_full, cfg, planta, df_tec=df_tec, modelo=vm)),
+        'fusibles':    (f'🔴 Fusibles{badge_fus}',
+                        lambda: _fragmento_tab('Fusibles', planta_id, tab_fusibles.render,
+                                               planta_id, nombre, f_p_full, cfg, df_tec, df_asig, m_p_full)),
+        'informes':    ('📋 Informes',
+                        lambda: _fragmento_tab('Informes', planta_id, tab_informes.render,
+                                               planta_id, nombre, f_p_full, m_p_full, cfg, modelo=vm)),
+        'diagnostico': ('🔍 Diagnóstico',
+                        lambda: _fragmento_tab('Diagnóstico', planta_id, tab_diagnostico.render,
+                                               planta_id, nombre, m_p_full, cfg, planta, modelo=vm)),
+        'gestion':     ('🗂️ Gestión de Datos',
+                        lambda: _fragmento_tab('Gestión', planta_id, tab_gestion.render,
+                                               planta_id, nombre, f_p_full, m_p_full)),
+    }
+    # La última sección abierta se guarda fuera del widget para sobrevivir a la
+    # navegación (Streamlit descarta el estado de widgets que no se dibujan).
+    key_sec = f"_seccion_planta_{planta_id}"
+    opciones = list(secciones)
+    seccion = st.radio(
+        "Sección", opciones, key=f"seccion_planta_{planta_id}",
+        index=opciones.index(st.session_state.get(key_sec, 'resumen')),
+        format_func=lambda k: secciones[k][0],
+        horizontal=True, label_visibility='collapsed',
+    )
+    st.session_state[key_sec] = seccion
+    st.divider()
+    secciones[seccion][1]()
+
+
+@st.fragment
+def _fragmento_tab(nombre_tab, planta_id, render_fn, *args, **kwargs):
+    """
+    Ejecuta una pestaña como fragmento aislado. Al interactuar con un widget
+    de la pestaña Streamlit re-ejecuta solo este fragmento (con los mismos
+    DataFrames de la última corrida completa). Registra el tiempo de render
+    en session_state['_tiempos_fragmentos'] y lo muestra a los admin.
+    """
+    t0 = time.perf_counter()
+    with tramo(f"vista.planta.{nombre_tab}", planta=planta_id):
+        render_fn(*args, **kwargs)
+    ms = (time.perf_counter() - t0) * 1000
+    st.session_state.setdefault('_tiempos_fragmentos', {})[f"{planta_id}/{nombre_tab}"] = round(ms, 1)
+    if puede('admin'):
+        st.caption(f"⏱️ {nombre_tab}: {ms:.0f} ms")
 
 
 def _volver_global():
@@ -137,7 +142,7 @@ def _volver_global():
     st.rerun()
 
 
-def _render_resumen(planta_id, nombre, m_p_full, f_p_full, cfg, c, sid_col):
+def _render_resumen(planta_id, nombre, m_p_full, f_p_full, cfg, c, sid_col, vm):
     """Tab Resumen — KPIs + heatmap + tendencia con Popover Filter."""
     from ms_data.analysis import _to_int
     import plotly.graph_objects as go
@@ -161,9 +166,7 @@ def _render_resumen(planta_id, nombre, m_p_full, f_p_full, cfg, c, sid_col):
         st.info("Sin campañas de medición registradas para el rango de fechas seleccionado.")
         return
 
-    m_p_ana = m_p.copy()
-    m_p_ana['Fecha'] = pd.to_datetime(m_p_ana['Fecha'])
-    df_an = analizar_mediciones(m_p_ana, ua=ua, uc=uc)
+    df_an = vm.analizar(m_p, ua=ua, uc=uc)
 
     n_strings = len(df_an)
     n_crit    = len(df_an[df_an['Diagnostico'].isin(['CRÍTICO', 'OC (0A)'])])
@@ -233,55 +236,59 @@ def _render_resumen(planta_id, nombre, m_p_full, f_p_full, cfg, c, sid_col):
         st.plotly_chart(fig, use_container_width=True, key=f"dona_salud_{planta_id}")
 
     st.markdown('<div class="section-hdr">📈 Tendencia de Salud en el Rango</div>', unsafe_allow_html=True)
-    _render_tendencia_local(m_p_ana, ua, uc, c, planta_id)
+    _render_tendencia_local(m_p, ua, uc, c, planta_id, vm)
 
 
-def _render_heatmap_robust(df_an, c, sid_col, planta_id):
-    import plotly.graph_objects as go
+def _grilla_heatmap(df_an, sid_col):
+    """
+    Grilla caja × string de la última lectura: (cajas, strings, z, text, hover)
+    listas para go.Heatmap, o None si no hay celdas. Sin Streamlit, para
+    poder medirla en benchmarks/.
+    """
     import re
-    
-    if df_an.empty: return
 
     color_num = {'NORMAL': 3, 'ALERTA': 2, 'CRÍTICO': 1, 'OC (0A)': 0}
-    
+
     def extraer_numero(texto):
         numeros = re.findall(r'\d+', str(texto))
         return int(numeros[-1]) if numeros else 0
 
     col_caja = 'Caja' if 'Caja' in df_an.columns else 'Equipo'
-    cajas_unicas = df_an[col_caja].dropna().unique().tolist()
-    cajas = sorted(cajas_unicas, key=extraer_numero)
-    
-    strings_unicos = df_an[sid_col].dropna().unique().tolist()
-    strings = sorted(strings_unicos, key=extraer_numero)
-
-    z, text, hover = [], [], []
-    for caja in cajas:
-        row_z, row_t, row_h = [], [], []
-        for s in strings:
-            mask = (df_an[col_caja] == caja) & (df_an[sid_col] == s)
-            sub = df_an[mask]
-            
-            if sub.empty:
-                row_z.append(None) 
-                row_t.append('')
-                row_h.append('')
-            else:
-                r = sub.iloc[-1]
-                row_z.append(color_num.get(r['Diagnostico'], 3))
-                row_t.append(f"{r['Amperios']:.1f}")
-                
-                fecha_str = r['Fecha'].strftime('%d/%m/%Y') if pd.notna(r.get('Fecha')) else 'N/A'
-                hover_info = (f"<b>Caja:</b> {caja}<br>"
-                              f"<b>String:</b> {s}<br>"
-                              f"<b>Corriente:</b> {r['Amperios']:.2f} A<br>"
-                              f"<b>Diagnóstico:</b> {r['Diagnostico']}<br>"
-                              f"<b>Fecha:</b> {fecha_str}")
-                row_h.append(hover_info)
-                
-        z.append(row_z)
-        text.append(row_t)
-        hover.append(row_h)
+    cajas = sorted(df_an[col_caja].dropna().unique().tolist(), key=extraer_numero)
+    strings = sorted(df_an[sid_col].dropna().unique().tolist(), key=extraer_numero)
+
+    # Última lectura por (caja, string) y grillas z/text/hover con un solo unstack
+    ult = df_an.dropna(subset=[col_caja, sid_col]).drop_duplicates([col_caja, sid_col], keep='last')
+    if ult.empty: return None
+    amp = pd.to_numeric(ult['Amperios'], errors='coerce')
+    fecha = (pd.to_datetime(ult['Fecha'], errors='coerce').dt.strftime('%d/%m/%Y').fillna('N/A')
+             if 'Fecha' in ult.columns else pd.Series('N/A', index=ult.index))
+    celdas = pd.DataFrame({
+        'z':     ult['Diagnostico'].map(color_num).fillna(3).astype(int).astype(object),
+        'text':  amp.map('{:.1f}'.format),
+        'hover': ("<b>Caja:</b> " + ult[col_caja].astype(str) +
+                  "<br><b>String:</b> " + ult[sid_col].astype(str) +
+                  "<br><b>Corriente:</b> " + amp.map('{:.2f}'.format) +
+                  " A<br><b>Diagnóstico:</b> " + ult['Diagnostico'].astype(str) +
+                  "<br><b>Fecha:</b> " + fecha),
+    })
+    celdas.index = pd.MultiIndex.from_arrays([ult[col_caja], ult[sid_col]])
+    grilla = celdas.unstack(sid_col)
+
+    def _grilla(campo, vacio):
+        g = grilla[campo].reindex(index=cajas, columns=strings)
+        return g.astype(object).where(g.notna(), vacio).values.tolist()
+
+    return cajas, strings, _grilla('z', None), _grilla('text', ''), _grilla('hover', '')
+
+
+def _render_heatmap_robust(df_an, c, sid_col, planta_id):
+    import plotly.graph_objects as go
+
+    if df_an.empty: return
+    grilla = _grilla_heatmap(df_an, sid_col)
+    if grilla is None: return
+    cajas, strings, z, text, hover = grilla
 
     fig = go.Figure(go.Heatmap(
         z=z, text=text, customdata=hover,
@@ -312,22 +319,12 @@ def _render_heatmap_robust(df_an, c, sid_col, planta_id):
     st.plotly_chart(fig, use_container_width=True, key=f"hm_robust_{planta_id}")
 
 
-def _render_tendencia_local(m_p, ua, uc, c, planta_id):
-    import plotly.express as px
+def _render_tendencia_local(m_p, ua, uc, c, planta_id, vm):
+    from ms_data.charts import linea
     if m_p.empty: return
 
-    m_tmp = m_p.copy()
-    m_tmp['Dia'] = m_tmp['Fecha'].dt.date
-    tend = []
-    for d in sorted(m_tmp['Dia'].unique()):
-        sub = m_tmp[m_tmp['Dia'] == d]
-        an = analizar_mediciones(sub, ua=ua, uc=uc)
-        if not an.empty:
-            s = len(an[an['Diagnostico'] == 'NORMAL']) / len(an) * 100
-            tend.append({'Fecha': d, 'Salud %': round(s, 1)})
-
-    if tend:
-        df_tend = pd.DataFrame(tend)
-        fig = px.line(df_tend, x='Fecha', y='Salud %', markers=True, color_discrete_sequence=[c['ok']])
+    df_tend = vm.tendencia_salud(m_p, ua=ua, uc=uc)
+    if not df_tend.empty:
+        fig = linea(df_tend, 'Fecha', 'Salud %', markers=True, color_discrete_sequence=[c['ok']])
         fig.update_layout(height=250, yaxis=dict(range=[0, 105]), xaxis_title='')
         st.plotly_chart(fig, use_container_width=True, key=f"tendencia_{planta_id}")
\ No newline at end of file
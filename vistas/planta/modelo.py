@@ -0,0 +1,147 @@
+"""
+vistas/planta/modelo.py
+══════════════════════════════════════════════════════════════
+Modelo de vista por planta — se construye UNA vez por versión de datos.
+
+- Mediciones y fallas de la planta (su partición de ms_data.particiones,
+  sin recorrer el portafolio) con tipos listos (Fecha datetime64,
+  Amperios numérico) y ordenadas por Fecha.
+- Foto final: última lectura de cada string (tabla materializada de
+  ms_data.foto_strings) + su análisis (KPIs del Context Bar y badges).
+- Índice de períodos: fechas ordenadas para rebanar por rango y meses
+  disponibles.
+- analizar(): analizar_mediciones memoizado por subconjunto y
+  parámetros, compartido por todas las pestañas.
+
+Las pestañas rebanan estos DataFrames en vez de copiarlos y re-parsear
+fechas en cada rerun. Se invalida cuando cambia la versión de datos
+(app._cargar_datos), el objeto DataFrame de origen, la partición o la
+foto de la planta (altas/bajas de mediciones y fallas).
+══════════════════════════════════════════════════════════════
+"""
+import hashlib
+from collections import OrderedDict
+
+import streamlit as st
+import pandas as pd
+
+from ms_data.analysis import analizar_mediciones, _to_int
+from ms_data.foto_strings import foto_strings
+from ms_data.particiones import particiones
+
+_COLS_STRING = ['String', 'String_ID', 'String ID']
+MAX_MEMO = 32    # resultados de analizar() por modelo (LRU)
+
+
+def _preparar(df: pd.DataFrame) -> pd.DataFrame:
+    """Partición de la planta con Fecha datetime64 y orden cronológico estable."""
+    if df is None or df.empty or 'Planta_ID' not in df.columns:
+        return pd.DataFrame()
+    if 'Fecha' in df.columns:
+        if not pd.api.types.is_datetime64_any_dtype(df['Fecha']):
+            df = df.assign(Fecha=pd.to_datetime(df['Fecha'], errors='coerce'))
+        if not df['Fecha'].is_monotonic_increasing:
+            df = df.sort_values('Fecha', kind='stable')
+    if 'Amperios' in df.columns and not pd.api.types.is_numeric_dtype(df['Amperios']):
+        df = df.assign(Amperios=pd.to_numeric(df['Amperios'], errors='coerce').fillna(0))
+    return df
+
+
+class ModeloPlanta:
+    """Datos de una planta preparados para todas las pestañas."""
+
+    def __init__(self, planta_id, df_fallas, df_med, cfg):
+        self.planta_id = planta_id
+        self.cfg = cfg
+        self.ua = _to_int(cfg.get('Umbral_Alerta_pct', -5))
+        self.uc = _to_int(cfg.get('Umbral_Critico_pct', -10))
+        self._memo = OrderedDict()
+
+        parts = particiones()
+        self.med    = _preparar(parts.de('mediciones', planta_id, df_med))
+        self.fallas = _preparar(parts.de('fallas', planta_id, df_fallas))
+        self.sid_col = next((c for c in _COLS_STRING if c in self.med.columns), 'String')
+        self.col_eq  = 'Equipo' if 'Equipo' in self.med.columns else 'Inversor'
+
+        # ── Índice de períodos ──
+        self.fechas_med    = self.med['Fecha'].to_numpy() if 'Fecha' in self.med.columns else None
+        self.fechas_fallas = self.fallas['Fecha'].to_numpy() if 'Fecha' in self.fallas.columns else None
+        fechas = pd.concat([self.med.get('Fecha', pd.Series(dtype='datetime64[ns]')),
+                            self.fallas.get('Fecha', pd.Series(dtype='datetime64[ns]'))]).dropna()
+        self.meses = sorted(fechas.dt.to_period('M').unique(), reverse=True) if not fechas.empty else []
+
+        # ── Foto final: última lectura de cada string (materializada en ms_data.foto_strings) ──
+        self.ultimo = foto_strings().de(planta_id, df_med)
+        self.an_ultimo = (analizar_mediciones(self.ultimo, ua=self.ua, uc=self.uc)
+                          if not self.ultimo.empty else pd.DataFrame())
+
+        diag = self.an_ultimo['Diagnostico'] if not self.an_ultimo.empty else pd.Series(dtype=object)
+        self.n_strings = len(diag)
+        self.n_crit    = int(diag.isin(['CRÍTICO', 'OC (0A)']).sum())
+        self.n_aler    = int((diag == 'ALERTA').sum())
+        self.salud_pct = (diag == 'NORMAL').sum() / self.n_strings * 100 if self.n_strings > 0 else 100
+
+    def _memoizado(self, tipo: str, df: pd.DataFrame, kwargs: dict, calcular):
+        """
+        LRU de MAX_MEMO resultados. La clave es un digest de las filas en su
+        orden (índice y valores), las columnas y los parámetros: no depende
+        de que el llamador pase una rebanada sin modificar de self.med.
+        """
+        digest = hashlib.md5(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()).hexdigest()
+        clave = (tipo, len(df), digest, tuple(df.columns),
+                 tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+        hit = self._memo.get(clave)
+        if hit is None:
+            hit = self._memo[clave] = calcular()
+            while len(self._memo) > MAX_MEMO:
+                self._memo.popitem(last=False)
+        else:
+            self._memo.move_to_end(clave)
+        return hit
+
+    def analizar(self, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+        """
+        analizar_mediciones memoizado (ver _memoizado). Devuelve una copia
+        superficial para que las pestañas puedan agregar columnas sin
+        contaminar el memo.
+        """
+        if df is None or df.empty:
+            return analizar_mediciones(df, **kwargs) if df is not None else pd.DataFrame()
+        return self._memoizado('analizar', df, kwargs,
+                               lambda: analizar_mediciones(df, **kwargs)).copy(deep=False)
+
+    def tendencia_salud(self, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+        """
+        % de strings NORMAL por día, memoizado como una sola entrada: con
+        más días que MAX_MEMO, memoizar cada día por separado no acertaría
+        nunca en el LRU.
+        """
+        if df is None or df.empty:
+            return pd.DataFrame(columns=['Fecha', 'Salud %'])
+
+        def calcular():
+            tend = []
+            for d, sub in df.groupby(df['Fecha'].dt.date):
+                an = analizar_mediciones(sub, **kwargs)
+                if not an.empty:
+                    s = (an['Diagnostico'] == 'NORMAL').sum() / len(an) * 100
+                    tend.append({'Fecha': d, 'Salud %': round(s, 1)})
+            return pd.DataFrame(tend, columns=['Fecha', 'Salud %'])
+        return self._memoizado('tendencia', df, kwargs, calcular).copy(deep=False)
+
+
+def obtener_modelo(planta_id, df_fallas, df_med, cfg) -> ModeloPlanta:
+    """Modelo de la planta desde session_state; se reconstruye al cambiar los datos."""
+    parts = particiones()
+    parts.de('mediciones', planta_id, df_med)    # re-indexa si cambió el origen
+    parts.de('fallas', planta_id, df_fallas)
+    firma = (st.session_state.get('version_datos', 0), id(df_fallas), id(df_med),
+             parts.version(planta_id), foto_strings().version(planta_id),
+             repr(sorted(cfg.items())))
+    key = f"_vm_planta_{planta_id}"
+    hit = st.session_state.get(key)
+    if hit is not None and hit[0] == firma:
+        return hit[1]
+    modelo = ModeloPlanta(planta_id, df_fallas, df_med, cfg)
+    st.session_state[key] = (firma, modelo)
+    return modelo
@@ -6,15 +6,16 @@ Versión: VIBRANT PASTEL (Filtro Popover Independiente)
 ══════════════════════════════════════════════════════════════
 """
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 import re
 
 from components.filters import flexible_period_filter
+from ms_data.charts import box
 from ms_data.analysis import (
     analizar_mediciones, calcular_reincidencia,
     _to_float, _to_int, COLOR_FALLAS
 )
+from ms_data.particiones import particiones
 
 PALETA_MS = [
     '#85C1E9', '#F1948A', '#82E0AA', '#F8C471', '#C39BD3', '#76D7C4', '#F7DC6F',
@@ -46,7 +47,7 @@ def _timeline_string(grupo_data: dict):
             unsafe_allow_html=True,
         )
 
-def render(planta_id, nombre, m_p, cfg, planta):
+def render(planta_id, nombre, m_p, cfg, planta, modelo=None):
     st.subheader(f"🔍 Diagnóstico Técnico — {nombre}")
 
     # ── FILTRO INDEPENDIENTE ──
@@ -68,14 +69,15 @@ def render(planta_id, nombre, m_p, cfg, planta):
 
     # ── SECCIÓN 1: DISPERSIÓN ──
     st.markdown('<div style="color:#2C3E50; font-size:1.3rem; font-weight:bold; border-bottom:3px solid #AED6F1; padding-bottom:5px; margin-bottom:20px;">📊 Análisis de Dispersión</div>', unsafe_allow_html=True)
-    df_diag = analizar_mediciones(m_p, isc_nom=impp_stc)
+    analizar = modelo.analizar if modelo is not None else analizar_mediciones
+    df_diag = analizar(m_p, isc_nom=impp_stc)
     
     col_box, col_top = st.columns([3, 2])
     with col_box:
         df_diag['Equipo_str'] = df_diag['Equipo'].astype(str).str.strip()
         df_diag['sort_key'] = df_diag['Equipo_str'].apply(extraer_numeros)
         df_diag = df_diag.sort_values(['sort_key', sid_col])
-        fig_box = px.box(df_diag, x='Equipo_str', y='Amperios', title="Dispersión por Caja (A)")
+        fig_box = box(df_diag, 'Equipo_str', 'Amperios', title="Dispersión por Caja (A)")
         fig_box.update_layout(template="plotly_white", font=dict(color="black"), colorway=['#85C1E9'])
         st.plotly_chart(fig_box, use_container_width=True)
 
@@ -92,9 +94,12 @@ def render(planta_id, nombre, m_p, cfg, planta):
 
     # ── SECCIÓN 2: DISTRIBUCIÓN CON FILTRO DINÁMICO ──
     st.divider()
-    # Cargamos fallas desde session_state solo si es necesario, idealmente vendría como argumento, pero mantenemos tu lógica
-    f_p = st.session_state.get('df_fallas', pd.DataFrame())
-    f_p_planta = f_p[f_p['Planta_ID'] == str(planta_id)].copy() if not f_p.empty else pd.DataFrame()
+    # Fallas de la planta: su partición (modelo de vista o ms_data.particiones), sin
+    # recorrer el df_fallas de todo el portafolio
+    if modelo is not None:
+        f_p_planta = modelo.fallas.copy()
+    else:
+        f_p_planta = particiones().de('fallas', planta_id, st.session_state.get('df_fallas')).copy()
 
     col_tit, col_filtro = st.columns([3, 2])
     with col_tit:
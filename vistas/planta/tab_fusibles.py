@@ -11,6 +11,7 @@ import numpy as np
 from components.theme import get_colors
 from components.filters import flexible_period_filter
 from ms_data.sheets import guardar_falla, eliminar_por_id, puede, invalidar_cache, generar_id
+from ms_data.charts import barras_top_n
 from ms_data.analysis import clasificar_falla_amp, clasificar_falla_isc, desv_isc_pct, _to_float, _to_int
 
 COLOR_FALLAS = {
@@ -159,9 +160,10 @@ def render(planta_id, nombre, f_p, cfg, df_tec, df_asig, m_p=pd.DataFrame()):
                     f_p_bar = pd.concat([f_p_bar[[c for c in cols_bar if c in f_p_bar.columns]], m_anom[[c for c in cols_bar if c in m_anom.columns]]], ignore_index=True)
 
             f_p_bar_sorted = f_p_bar.sort_values('Fecha_str', na_position='last')
-            fig_h = px.bar(
+            # Sobre PRESUPUESTO_BARRAS se dibujan las más severas (menor A) + "Otros"
+            fig_h = barras_top_n(
                 f_p_bar_sorted,
-                x='Ubicacion', y='Amp_display',
+                'Ubicacion', 'Amp_display',
                 color='Tipo',
                 color_discrete_map=COLOR_FALLAS,
                 title=f"Fusibles y anomalías registradas ({len(f_p_bar_sorted)})",
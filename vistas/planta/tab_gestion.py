@@ -3,13 +3,14 @@ vistas/planta/tab_gestion.py
 ══════════════════════════════════════════════════════════════
 Tab de Gestión de Datos — Mediciones y Fallas.
 Permite ver, filtrar y borrar registros.
-Regla: todos los roles pueden borrar EXCEPTO 'cliente'.
+Regla: borra quien tenga el permiso 'eliminar' (admin y técnico).
 ══════════════════════════════════════════════════════════════
 """
 import streamlit as st
 import pandas as pd
 
 from components.theme import get_colors
+from ms_data.permisos import acotar
 from ms_data.sheets import (
     _rol_actual, puede,
     eliminar_por_id,
@@ -19,12 +20,21 @@ from ms_data.sheets import (
 
 # ── Helpers ──────────────────────────────────────────────────
 def _puede_borrar() -> bool:
-    rol = _rol_actual()
-    return rol not in ('cliente', 'lector', '')
+    return puede('eliminar')
 
 def _confirmar_borrado(key: str, label: str = "¿Confirmar eliminación?") -> bool:
     return st.checkbox(label, key=key, value=False)
 
+def _recargar(key: str, cargar):
+    """
+    Relee la hoja tras un borrado. Si la API falla se conserva la tabla
+    actual: contadores, foto y particiones ya se ajustaron con quitar().
+    """
+    try:
+        st.session_state[key] = acotar(cargar())
+    except Exception as e:
+        st.toast(f"⚠️ No se pudo releer la hoja ({str(e)[:80]}). Se actualizará al sincronizar.")
+
 # ══════════════════════════════════════════════════════════════
 # RENDER PRINCIPAL
 # ══════════════════════════════════════════════════════════════
@@ -151,7 +161,7 @@ def _render_mediciones(planta_id, nombre, df_med, puede_del, c):
         with st.spinner("Eliminando..."):
             ok = eliminar_por_id("Mediciones", 1, id_borrar)
         if ok:
-            st.session_state.df_mediciones = cargar_mediciones()
+            _recargar('df_mediciones', cargar_mediciones)
             invalidar_cache()
             st.success(f"✅ Medición **{id_borrar}** eliminada.")
             st.rerun()
@@ -248,7 +258,7 @@ def _render_fallas(planta_id, nombre, df_fallas, puede_del, c):
         with st.spinner("Eliminando..."):
             ok = eliminar_por_id("Fallas", 1, id_borrar2)
         if ok:
-            st.session_state.df_fallas = cargar_fallas()
+            _recargar('df_fallas', cargar_fallas)
             invalidar_cache()
             st.success(f"✅ Falla **{id_borrar2}** eliminada.")
             st.rerun()
@@ -11,7 +11,8 @@ from components.filters import flexible_period_filter
 from ms_data.analysis import analizar_mediciones, _to_float, _to_int
 from ms_data.exports import generar_pdf_fallas, generar_pdf_mediciones
 from ms_data.exports import generar_excel_fallas, generar_excel_mediciones
-from ms_data.analysis import _run_in_thread
+from ms_data.exports import generar_csv_fallas, generar_csv_fuera_rango, LIMITE_DETALLE_PDF
+from components.descargas import descarga_diferida
 
 def _obtener_fechas_campana(df, label_filtro):
     """
@@ -21,10 +22,11 @@ def _obtener_fechas_campana(df, label_filtro):
     if df.empty or 'Fecha' not in df.columns:
         return label_filtro, label_filtro.replace(" ", "_").replace("/", "")
     
-    df_tmp = df.copy()
-    df_tmp['Fecha'] = pd.to_datetime(df_tmp['Fecha'], errors='coerce')
-    min_d = df_tmp['Fecha'].min()
-    max_d = df_tmp['Fecha'].max()
+    fechas = df['Fecha']
+    if not pd.api.types.is_datetime64_any_dtype(fechas):
+        fechas = pd.to_datetime(fechas, errors='coerce')
+    min_d = fechas.min()
+    max_d = fechas.max()
     
     if pd.isnull(min_d) or pd.isnull(max_d):
         return label_filtro, label_filtro.replace(" ", "_").replace("/", "")
@@ -35,8 +37,9 @@ def _obtener_fechas_campana(df, label_filtro):
     return f"{min_d.strftime('%d/%m/%Y')} al {max_d.strftime('%d/%m/%Y')}", f"{min_d.strftime('%Y%m%d')}_{max_d.strftime('%Y%m%d')}"
 
 
-def render(planta_id, nombre, f_p, m_p, cfg):
+def render(planta_id, nombre, f_p, m_p, cfg, modelo=None):
     c = get_colors()
+    analizar = modelo.analizar if modelo is not None else analizar_mediciones
 
     st.subheader(f"Generación de Informes — {nombre}")
 
@@ -69,7 +72,7 @@ def render(planta_id, nombre, f_p, m_p, cfg):
 
             df_med_inf = pd.DataFrame()
             if not m_p_filt.empty and cfg:
-                df_med_inf = analizar_mediciones(
+                df_med_inf = analizar(
                     m_p_filt,
                     isc_nom=_to_float(cfg.get('Isc_STC_A', 9.07)),
                     irradiancia=_to_float(cfg.get('Irradiancia', 698)),
@@ -77,32 +80,38 @@ def render(planta_id, nombre, f_p, m_p, cfg):
                     uc=_to_int(cfg.get('Umbral_Critico_pct', -10))
                 )
 
+            # Informes muy grandes: el PDF lleva solo las primeras filas y el detalle va a CSV
+            max_det = None
+            if len(df_inf) > LIMITE_DETALLE_PDF and st.checkbox(
+                    f"Modo resumen (PDF con {LIMITE_DETALLE_PDF} filas, detalle completo en CSV)",
+                    value=True, key=f"resumen_fal_{planta_id}"):
+                max_det = LIMITE_DETALLE_PDF
+                st.download_button("🗒️ Descargar detalle CSV", generar_csv_fallas(df_inf, cfg),
+                                   f"Fallas_{nombre}_{per_file}.csv", "text/csv", use_container_width=True)
+
             # Botones de descarga
             col_pdf, col_xls = st.columns(2)
             
-            try:
-                with st.spinner("Generando PDF..."):
-                    _pdf_bytes = _run_in_thread(generar_pdf_fallas, nombre, df_inf, df_med=df_med_inf, cfg=cfg, periodo_str=per_disp)
-                with col_pdf:
-                    st.download_button("📄 Descargar PDF", _pdf_bytes, f"Fallas_{nombre}_{per_file}.pdf", "application/pdf", use_container_width=True)
-            except Exception as e:
-                col_pdf.error(f"Error generando PDF: {e}")
-                
-            try:
-                with st.spinner("Generando Excel..."):
-                    _xls_bytes = _run_in_thread(generar_excel_fallas, nombre, df_inf, periodo=per_disp)
-                with col_xls:
-                    st.download_button("📊 Descargar Excel", _xls_bytes, f"Fallas_{nombre}_{per_file}.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
-            except Exception as e:
-                col_xls.error(f"Error generando Excel: {e}")
+            firma = (label_filtro, per_disp, max_det)
+            with col_pdf:
+                descarga_diferida(f"inf_fal_pdf_{planta_id}",
+                                  lambda: generar_pdf_fallas(nombre, df_inf, df_med=df_med_inf, cfg=cfg, periodo_str=per_disp,
+                                                             max_filas_detalle=max_det),
+                                  "📄 Descargar PDF", f"Fallas_{nombre}_{per_file}.pdf", "application/pdf",
+                                  firma=firma, use_container_width=True, texto_preparar="⚙️ Preparar PDF")
+            with col_xls:
+                descarga_diferida(f"inf_fal_xls_{planta_id}",
+                                  lambda: generar_excel_fallas(nombre, df_inf, periodo=per_disp),
+                                  "📊 Descargar Excel", f"Fallas_{nombre}_{per_file}.xlsx",
+                                  "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                                  firma=firma, use_container_width=True, texto_preparar="⚙️ Preparar Excel")
 
     # ── 3. INFORME DE MEDICIONES ──
     else:  
         if m_p_filt.empty:
             st.info(f"No hay datos de mediciones registrados en **{label_filtro}** para generar el informe.")
         else:
-            m_p_filt['Fecha'] = pd.to_datetime(m_p_filt['Fecha'], errors='coerce')
-            m_inf = m_p_filt.copy()
+            m_inf = m_p_filt
             
             per_disp, per_file = _obtener_fechas_campana(m_inf, label_filtro)
             st.info(f"📋 {len(m_inf)} strings medidos · Campaña: **{per_disp}**")
@@ -120,7 +129,7 @@ def render(planta_id, nombre, f_p, m_p, cfg):
             uc  = int(cfg.get('Umbral_Critico_pct',-10)) if cfg else -10
             
             try:
-                df_proc_inf = analizar_mediciones(m_inf, ua=ua, uc=uc,
+                df_proc_inf = analizar(m_inf, ua=ua, uc=uc,
                     restriccion_mw=rest_inf_mw if rest_inf_mw > 0 else None,
                     capacidad_mw=cap_inf_mw if rest_inf_mw > 0 else None)
 
@@ -134,24 +143,30 @@ def render(planta_id, nombre, f_p, m_p, cfg):
                     with km_b: st.metric("Salud", f"{salud_inf:.1f}%")
                     with km_c: st.metric("Críticos/Corte", n_crit_inf)
 
+                    max_det = None
+                    n_anom_inf = n_total_inf - len(df_proc_inf[df_proc_inf['Diagnostico']=='NORMAL'])
+                    if n_anom_inf > LIMITE_DETALLE_PDF and st.checkbox(
+                            f"Modo resumen (PDF con {LIMITE_DETALLE_PDF} strings fuera de rango, detalle completo en CSV)",
+                            value=True, key=f"resumen_med_{planta_id}"):
+                        max_det = LIMITE_DETALLE_PDF
+                        st.download_button("🗒️ Descargar detalle CSV", generar_csv_fuera_rango(df_proc_inf, cfg),
+                                           f"Auditoria_{nombre}_{per_file}.csv", "text/csv", use_container_width=True)
+
                     col_pdf2, col_xls2 = st.columns(2)
-                    try:
-                        with st.spinner("Generando PDF..."):
-                            _pdf_med = _run_in_thread(generar_pdf_mediciones, nombre, m_inf, cfg,
-                                rest_inf_mw if rest_inf_mw > 0 else None, cap_inf_mw, inv_inf,
-                                df_fallas=f_p_filt, periodo_str=per_disp)
-                        with col_pdf2:
-                            st.download_button("📄 Descargar PDF", _pdf_med, f"Auditoria_{nombre}_{per_file}.pdf", "application/pdf", use_container_width=True)
-                    except Exception as e:
-                        col_pdf2.error(f"Error generando PDF: {e}")
-                        
-                    try:
-                        with st.spinner("Generando Excel..."):
-                            _xls_med = _run_in_thread(generar_excel_mediciones, nombre, df_proc_inf, cfg, df_fallas=f_p_filt, periodo_str=per_disp)
-                        with col_xls2:
-                            st.download_button("📊 Descargar Excel", _xls_med, f"Auditoria_{nombre}_{per_file}.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
-                    except Exception as e:
-                        col_xls2.error(f"Error generando Excel: {e}")
+                    firma = (label_filtro, per_disp, max_det)
+                    with col_pdf2:
+                        descarga_diferida(f"inf_med_pdf_{planta_id}",
+                                          lambda: generar_pdf_mediciones(nombre, m_inf, cfg,
+                                              rest_inf_mw if rest_inf_mw > 0 else None, cap_inf_mw, inv_inf,
+                                              df_fallas=f_p_filt, periodo_str=per_disp, max_filas_detalle=max_det),
+                                          "📄 Descargar PDF", f"Auditoria_{nombre}_{per_file}.pdf", "application/pdf",
+                                          firma=firma, use_container_width=True, texto_preparar="⚙️ Preparar PDF")
+                    with col_xls2:
+                        descarga_diferida(f"inf_med_xls_{planta_id}",
+                                          lambda: generar_excel_mediciones(nombre, df_proc_inf, cfg, df_fallas=f_p_filt, periodo_str=per_disp),
+                                          "📊 Descargar Excel", f"Auditoria_{nombre}_{per_file}.xlsx",
+                                          "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                                          firma=firma, use_container_width=True, texto_preparar="⚙️ Preparar Excel")
                         
             except Exception as e:
                 st.error(f"Error al procesar mediciones para exportar: {e}")
\ No newline at end of file
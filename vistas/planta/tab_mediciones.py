@@ -12,10 +12,12 @@ from components.theme import get_colors
 from components.filters import flexible_period_filter
 from ms_data.sheets import guardar_mediciones_bulk, puede, invalidar_cache, generar_id
 from ms_data.analysis import (analizar_mediciones, _to_float, _to_int)
+from ms_data.charts import histograma
 
-def render(planta_id, nombre, m_p, cfg, planta, df_tec=None):
+def render(planta_id, nombre, m_p, cfg, planta, df_tec=None, modelo=None):
     c = get_colors()
     if df_tec is None: df_tec = pd.DataFrame()
+    analizar = modelo.analizar if modelo is not None else analizar_mediciones
 
     st.subheader(f"Mediciones de Strings — {nombre}")
 
@@ -114,7 +116,7 @@ def render(planta_id, nombre, m_p, cfg, planta, df_tec=None):
         st.divider()
         st.markdown(f'<div class="section-hdr">📋 Resumen de Campaña ({filtro["label"]})</div>', unsafe_allow_html=True)
 
-        m_hist = m_p.copy()
+        m_hist = m_p
         _nd   = m_hist['Fecha'].dt.date.nunique()
         if not m_hist.empty and _nd > 0:
             st.info(f"📋 {len(m_hist)} strings · {_nd} día{'s' if _nd > 1 else ''} · {m_hist['Fecha'].dt.date.min().strftime('%d/%m/%Y')} — {m_hist['Fecha'].dt.date.max().strftime('%d/%m/%Y')}")
@@ -124,7 +126,7 @@ def render(planta_id, nombre, m_p, cfg, planta, df_tec=None):
         rest_h = m_hist['Restriccion_MW'].max() if 'Restriccion_MW' in m_hist.columns else 0
         cap_hist = _to_float(planta.get('Potencia_MW', 0)) if planta is not None else 0.0
 
-        df_an = analizar_mediciones(m_hist, ua=ua, uc=uc, restriccion_mw=rest_h if rest_h > 0 else None, capacidad_mw=cap_hist if rest_h > 0 else None)
+        df_an = analizar(m_hist, ua=ua, uc=uc, restriccion_mw=rest_h if rest_h > 0 else None, capacidad_mw=cap_hist if rest_h > 0 else None)
 
         n_total = len(df_an)
         n_norm  = len(df_an[df_an['Diagnostico'] == 'NORMAL'])
@@ -144,7 +146,7 @@ def render(planta_id, nombre, m_p, cfg, planta, df_tec=None):
         elif n_aler > 0: st.markdown(f'<div class="banner-warn">⚠️ {n_aler} strings en ALERTA — revisa Tab Diagnóstico</div>', unsafe_allow_html=True)
         else: st.markdown('<div class="banner-ok">✅ Todos los strings en rango normal</div>', unsafe_allow_html=True)
 
-        fig_hist = px.histogram(df_an, x='Amperios', nbins=20, title="Distribución de corrientes", marginal="box")
+        fig_hist = histograma(df_an, 'Amperios', nbins=20, title="Distribución de corrientes", marginal="box")
         fig_hist.update_layout(height=340, plot_bgcolor='white', paper_bgcolor='white')
         st.plotly_chart(fig_hist, use_container_width=True)
 